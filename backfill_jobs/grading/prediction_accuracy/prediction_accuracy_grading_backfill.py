@@ -7,7 +7,9 @@ For each prediction, computes absolute error, signed error (bias), and
 recommendation correctness.
 
 Features:
-- Day-by-day processing (game dates only)
+- Chunked range grading: each chunk of game dates is graded from one load of
+  predictions / actuals / injuries (PredictionAccuracyProcessor.process_date_range)
+- Day-by-day processing (game dates only) with --per-date
 - Checkpoint support for resumable backfills
 - Pre-flight validation for predictions existence
 - Idempotent writes (safe to re-run)
@@ -23,8 +25,15 @@ Usage:
     # Process date range
     python prediction_accuracy_grading_backfill.py --start-date 2021-11-06 --end-date 2022-01-07
 
+    # Grade one date at a time (previous behavior)
+    python prediction_accuracy_grading_backfill.py --start-date 2021-11-06 --end-date 2022-01-07 --per-date
+
     # Retry specific failed dates
     python prediction_accuracy_grading_backfill.py --dates 2022-01-01,2022-01-02
+
+Environment:
+    GRADING_BACKFILL_MODE: 'range' (default) or 'per_date' (same as --per-date).
+        GRADING_ENGINE=scalar also grades per date.
 """
 
 import os
@@ -38,6 +47,7 @@ import time
 # Add parent directories to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
 
+from data_processors.grading.prediction_accuracy.grading_engine import vectorized_grading_enabled
 from data_processors.grading.prediction_accuracy.prediction_accuracy_processor import PredictionAccuracyProcessor
 from shared.backfill import BackfillCheckpoint, get_game_dates_for_range
 from google.cloud import bigquery
@@ -48,6 +58,15 @@ logger = logging.getLogger(__name__)
 
 PROJECT_ID = 'nba-props-platform'
 
+# Game dates graded per process_date_range call (one load of each source)
+DEFAULT_CHUNK_DATES = 30
+
+
+def range_grading_enabled() -> bool:
+    """Return False when GRADING_BACKFILL_MODE=per_date or GRADING_ENGINE=scalar."""
+    mode = os.environ.get('GRADING_BACKFILL_MODE', 'range').lower()
+    return mode != 'per_date' and vectorized_grading_enabled()
+
 
 class PredictionAccuracyBackfill:
     """
@@ -60,9 +79,11 @@ class PredictionAccuracyBackfill:
     Writes to: nba_predictions.prediction_accuracy
     """
 
-    def __init__(self):
+    def __init__(self, per_date: bool = False, chunk_dates: int = DEFAULT_CHUNK_DATES):
         self.processor = PredictionAccuracyProcessor(PROJECT_ID)
         self.bq_client = bigquery.Client(project=PROJECT_ID)
+        self.per_date = per_date or not range_grading_enabled()
+        self.chunk_dates = max(1, chunk_dates)
 
     def validate_date_range(self, start_date: date, end_date: date) -> bool:
         """Validate date range."""
@@ -135,6 +156,25 @@ class PredictionAccuracyBackfill:
         # Run the grading
         return self.processor.process_date(game_date)
 
+    def run_grading_for_chunk(self, game_dates: List[date]) -> Dict[date, Dict]:
+        """
+        Grade a chunk of game dates with one process_date_range call.
+
+        Returns:
+            Dict mapping each game date to its process_date-shaped result
+            (dates the range found no predictions for are 'no_predictions')
+        """
+        result = self.processor.process_date_range(game_dates[0], game_dates[-1])
+        by_date = {r['date']: r for r in result['dates']}
+        return {
+            game_date: by_date.get(game_date.isoformat()) or {
+                'status': 'no_predictions',
+                'date': game_date.isoformat(),
+                'predictions_found': 0
+            }
+            for game_date in game_dates
+        }
+
     def run_backfill(
         self,
         start_date: date,
@@ -190,14 +230,7 @@ class PredictionAccuracyBackfill:
 
         logger.info(f"Processing {remaining_dates} game dates (of {total_dates} total)")
 
-        for current_date in dates_to_process:
-            day_number = actual_start_idx + processed_days + 1
-            logger.info(f"Grading date {day_number}/{total_dates}: {current_date}")
-
-            start_time = time.time()
-            result = self.run_grading_for_date(current_date, dry_run=dry_run)
-            elapsed = time.time() - start_time
-
+        for current_date, result, elapsed in self._grade_dates(dates_to_process, actual_start_idx, total_dates, dry_run):
             if result['status'] == 'success':
                 successful_days += 1
                 graded = result.get('graded', 0)
@@ -247,6 +280,29 @@ class PredictionAccuracyBackfill:
             logger.info(f"  Failed dates: {failed_days[:10]}")
         logger.info("=" * 80)
 
+    def _grade_dates(self, game_dates: List[date], start_idx: int, total_dates: int, dry_run: bool):
+        """Yield (game_date, result, elapsed seconds), grading chunks unless per-date."""
+        if self.per_date or dry_run:
+            for i, current_date in enumerate(game_dates):
+                logger.info(f"Grading date {start_idx + i + 1}/{total_dates}: {current_date}")
+                start_time = time.time()
+                result = self.run_grading_for_date(current_date, dry_run=dry_run)
+                yield current_date, result, time.time() - start_time
+            return
+
+        for i in range(0, len(game_dates), self.chunk_dates):
+            chunk = game_dates[i:i + self.chunk_dates]
+            logger.info(
+                f"Grading dates {start_idx + i + 1}-{start_idx + i + len(chunk)}/{total_dates}: "
+                f"{chunk[0]} to {chunk[-1]}"
+            )
+            start_time = time.time()
+            results = self.run_grading_for_chunk(chunk)
+            elapsed = time.time() - start_time
+            for j, current_date in enumerate(chunk):
+                logger.info(f"Date {start_idx + i + j + 1}/{total_dates}: {current_date} (chunk time)")
+                yield current_date, results[current_date], elapsed
+
     def _get_dates_with_predictions(self, start_date: date, end_date: date) -> List[date]:
         """Get list of dates that have predictions."""
         query = f"""
@@ -292,9 +348,13 @@ def main():
                         help='Show checkpoint status and exit')
     parser.add_argument('--skip-preflight', action='store_true',
                         help='Skip predictions pre-flight check')
+    parser.add_argument('--per-date', action='store_true',
+                        help='Grade one date at a time instead of in chunks')
+    parser.add_argument('--chunk-dates', type=int, default=DEFAULT_CHUNK_DATES,
+                        help=f'Game dates graded per single-pass load (default: {DEFAULT_CHUNK_DATES})')
 
     args = parser.parse_args()
-    backfiller = PredictionAccuracyBackfill()
+    backfiller = PredictionAccuracyBackfill(per_date=args.per_date, chunk_dates=args.chunk_dates)
 
     # Handle specific dates
     if args.dates:
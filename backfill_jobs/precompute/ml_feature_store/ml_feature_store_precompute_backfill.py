@@ -395,8 +395,17 @@ Output: nba_predictions.ml_feature_store_v2 (25 features per player per game)
     parser.add_argument('--skip-preflight', action='store_true', help='Skip Phase 3 pre-flight check (not recommended)')
     parser.add_argument('--include-bootstrap', action='store_true',
                         help='Process bootstrap period dates (first 14 days of season) with real features instead of skipping')
+    parser.add_argument('--columnar', action='store_true',
+                        help='Build features as a player x feature matrix (MLFS_BUILD_MODE=columnar)')
+    parser.add_argument('--snapshot-cache-dir',
+                        help='Reuse batch extraction results across reruns from this directory '
+                             '(MLFS_SNAPSHOT_CACHE_DIR)')
 
     args = parser.parse_args()
+    if args.columnar:
+        os.environ['MLFS_BUILD_MODE'] = 'columnar'
+    if args.snapshot_cache_dir:
+        os.environ['MLFS_SNAPSHOT_CACHE_DIR'] = args.snapshot_cache_dir
     backfiller = MLFeatureStoreBackfill()
 
     if args.dates:
@@ -455,6 +464,8 @@ Output: nba_predictions.ml_feature_store_v2 (25 features per player per game)
     logger.info(f"  Date range: {start_date} to {end_date}")
     logger.info(f"  Dry run: {args.dry_run}")
     logger.info(f"  Include bootstrap: {args.include_bootstrap}")
+    logger.info(f"  Build mode: {os.environ.get('MLFS_BUILD_MODE', 'row')}")
+    logger.info(f"  Snapshot cache: {os.environ.get('MLFS_SNAPSHOT_CACHE_DIR') or 'disabled'}")
     logger.info(f"  Checkpoint: {checkpoint.checkpoint_path}")
     logger.info(f"  Execution order: 5/5 (FINAL - runs last)")
 
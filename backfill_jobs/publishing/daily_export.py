@@ -74,6 +74,7 @@ from data_processors.publishing.daily_signals_exporter import DailySignalsExport
 from data_processors.publishing.subset_performance_exporter import SubsetPerformanceExporter
 from data_processors.publishing.all_subsets_picks_exporter import AllSubsetsPicksExporter
 from data_processors.publishing.subset_materializer import SubsetMaterializer
+from data_processors.publishing.subset_prediction_frame import DatePredictionFrame, single_scan_enabled
 # Season subset picks (Session 158)
 from data_processors.publishing.season_subset_picks_exporter import SeasonSubsetPicksExporter
 # Calendar widget (Sprint 3)
@@ -182,7 +183,8 @@ def export_date(
 
     # === FAST EXPORTS FIRST ===
     # Run quick single-query exports before the slow tonight-players exporter
-    # (which processes 200+ individual player files and can take 8+ minutes).
+    # (which uploads 200+ individual player files; batch queries keep this to
+    # a few minutes, but the per-player fallback can take 8+ minutes).
     # This ensures subset-picks, daily-signals, and other critical exports
     # complete even if the function approaches its timeout.
 
@@ -282,9 +284,19 @@ def export_date(
             logger.info(f"  Model Discovery: {discovered.family_count} families — {sorted(discovered.family_to_id.keys())}")
         except Exception as e:
             logger.warning(f"  Model discovery failed (materializers will self-discover): {e}")
+            _bq = None
             discovered = None
             active_system_ids = None
 
+        # One predictions scan shared by both materializers (instead of
+        # 1-2 queries per model plus a cross-model query)
+        prediction_frame = None
+        if _bq is not None and single_scan_enabled():
+            try:
+                prediction_frame = DatePredictionFrame.query(_bq, target_date)
+            except Exception as e:
+                logger.warning(f"  Prediction frame scan failed (materializers will query per model): {e}")
+
         try:
             # Step 1: Materialize subsets to BigQuery (creates queryable entity)
             materializer = SubsetMaterializer()
@@ -292,6 +304,7 @@ def export_date(
                 target_date,
                 trigger_source='export',
                 active_system_ids=active_system_ids,
+                prediction_frame=prediction_frame,
             )
             mat_version_id = mat_result.get('version_id')
             logger.info(
@@ -312,6 +325,7 @@ def export_date(
                 version_id=mat_version_id or f"v_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
                 trigger_source='export',
                 discovered_models=discovered,
+                prediction_frame=prediction_frame,
             )
             logger.info(
                 f"  Cross-Model Subsets: {xm_result.get('total_picks', 0)} picks "
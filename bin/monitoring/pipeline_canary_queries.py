@@ -14,21 +14,28 @@ Tier design (Session 509):
     CRITICAL (15-min): prediction freshness, grading, pick generation, model health, MLB predictions
     ROUTINE  (60-min): data quality, historical consistency, feature store, fleet info, duplicate audits
 
+Checks run concurrently (shared/utils/canary_runner.py). Checks declaring the
+same scan share one materialized read; per-check latency and bytes billed are
+logged as [CANARY_TIMING]. Set CANARY_RUNNER_MODE=serial to run them one at a time.
+
 Sends alerts to #canary-alerts when validation fails.
 """
 
 import argparse
+import dataclasses
+import functools
 import json
 import logging
 import os
 import sys
 from datetime import date, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 # Add shared to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from google.cloud import bigquery
+from shared.utils.canary_runner import CanaryRunner, ScanSpec, render_source
 from shared.utils.slack_alerts import send_slack_alert
 
 logging.basicConfig(
@@ -49,13 +56,36 @@ class CanaryCheck:
         phase: str,
         query: str,
         thresholds: Dict[str, Dict[str, float]],
-        description: str
+        description: str,
+        scan: Optional[ScanSpec] = None
     ):
         self.name = name
         self.phase = phase
         self.query = query
         self.thresholds = thresholds
         self.description = description
+        # Checks with the same scan share one materialized read; query uses {source}
+        self.scan = scan
+
+    def render_query(self, source: Optional[str] = None) -> str:
+        """The check SQL, reading the shared scan (or an inline subquery) for {source}."""
+        if self.scan is None:
+            return self.query
+        return render_source(self.query, source or self.scan.inline_source())
+
+
+# Shared scans (see shared/utils/canary_runner.py): checks declaring the same
+# table + date window read one materialized result instead of the source table
+YESTERDAY_PLAYER_GAME_SUMMARY = ScanSpec(
+    table="nba-props-platform.nba_analytics.player_game_summary",
+    start="DATE_SUB(CURRENT_DATE(), INTERVAL 1 DAY)",
+    end="DATE_SUB(CURRENT_DATE(), INTERVAL 1 DAY)",
+)
+TODAY_PREDICTIONS = ScanSpec(
+    table="nba-props-platform.nba_predictions.player_prop_predictions",
+    start="CURRENT_DATE()",
+    end="CURRENT_DATE()",
+)
 
 
 # Define canary queries for each phase
@@ -112,10 +142,7 @@ CANARY_CHECKS = [
             COUNTIF(points IS NULL AND is_dnp = FALSE) as null_points,
             AVG(CASE WHEN is_dnp = FALSE THEN minutes_played END) as avg_minutes,
             AVG(CASE WHEN is_dnp = FALSE THEN points END) as avg_points
-        FROM
-            `nba-props-platform.nba_analytics.player_game_summary`
-        WHERE
-            game_date = DATE_SUB(CURRENT_DATE(), INTERVAL 1 DAY)
+        FROM {source}
         """,
         thresholds={
             'records': {'min': 20},  # At least 20 player records (1 playoff game = 20+)
@@ -124,7 +151,8 @@ CANARY_CHECKS = [
             'avg_minutes': {'min': 15},  # Average minutes should be reasonable
             'avg_points': {'min': 6}  # Lowered from 8 — playoff defense reduces scoring
         },
-        description="Validates analytics processing and player stats"
+        description="Validates analytics processing and player stats",
+        scan=dataclasses.replace(YESTERDAY_PLAYER_GAME_SUMMARY, columns=('minutes_played', 'points', 'is_dnp'))
     ),
 
     CanaryCheck(
@@ -177,8 +205,7 @@ CANARY_CHECKS = [
             SELECT
                 COUNT(DISTINCT game_id) as actual_games,
                 COUNT(*) as player_records
-            FROM `nba-props-platform.nba_analytics.player_game_summary`
-            WHERE game_date = DATE_SUB(CURRENT_DATE(), INTERVAL 1 DAY)
+            FROM {source}
         )
         SELECT
             s.expected_games,
@@ -194,7 +221,8 @@ CANARY_CHECKS = [
         thresholds={
             'gap_detected': {'max': 0}  # FAIL if games scheduled but no analytics data
         },
-        description="Detects complete analytics gaps (games scheduled but no data produced)"
+        description="Detects complete analytics gaps (games scheduled but no data produced)",
+        scan=dataclasses.replace(YESTERDAY_PLAYER_GAME_SUMMARY, columns=('game_id',))
     ),
 
     CanaryCheck(
@@ -207,11 +235,9 @@ CANARY_CHECKS = [
             COUNTIF(predicted_points IS NULL) as null_predictions,
             COUNTIF(current_points_line IS NOT NULL) as predictions_with_lines,
             AVG(confidence_score) as avg_confidence
-        FROM
-            `nba-props-platform.nba_predictions.player_prop_predictions`
+        FROM {source}
         WHERE
-            game_date = CURRENT_DATE()
-            AND is_active = TRUE
+            is_active = TRUE
         """,
         thresholds={
             'predictions': {'min': 50},  # At least 50 active predictions
@@ -220,7 +246,9 @@ CANARY_CHECKS = [
             'predictions_with_lines': {'min': 20},  # At least 20 predictions have lines
             'avg_confidence': {'min': 0.4}  # Average confidence should be reasonable
         },
-        description="Validates prediction generation"
+        description="Validates prediction generation",
+        scan=dataclasses.replace(TODAY_PREDICTIONS, columns=(
+            'player_lookup', 'predicted_points', 'current_points_line', 'confidence_score', 'is_active'))
     ),
 
     # Session 159: Prediction gap alerting
@@ -240,9 +268,8 @@ CANARY_CHECKS = [
         predictions_today AS (
             SELECT COUNT(*) as prediction_count,
                    COUNT(DISTINCT game_id) as games_with_predictions
-            FROM `nba-props-platform.nba_predictions.player_prop_predictions`
-            WHERE game_date = CURRENT_DATE()
-              AND is_active = TRUE
+            FROM {source}
+            WHERE is_active = TRUE
         )
         SELECT
             g.games_today,
@@ -258,7 +285,8 @@ CANARY_CHECKS = [
         thresholds={
             'prediction_gap': {'max': 0},  # FAIL if games exist but zero predictions
         },
-        description="Detects days with scheduled games but no predictions generated"
+        description="Detects days with scheduled games but no predictions generated",
+        scan=dataclasses.replace(TODAY_PREDICTIONS, columns=('game_id', 'is_active'))
     ),
 
     # Session 210: Cross-model prediction coverage parity
@@ -395,8 +423,7 @@ CANARY_CHECKS = [
         ),
         actual AS (
             SELECT COUNT(DISTINCT game_id) as actual_games
-            FROM `nba-props-platform.nba_analytics.player_game_summary`
-            WHERE game_date = DATE_SUB(CURRENT_DATE(), INTERVAL 1 DAY)
+            FROM {source}
         )
         SELECT
             s.expected_games,
@@ -412,7 +439,8 @@ CANARY_CHECKS = [
         thresholds={
             'partial_gap_detected': {'max': 0},  # FAIL if ANY final game missing from analytics
         },
-        description="Detects partial analytics gaps (some games processed but not all final games)"
+        description="Detects partial analytics gaps (some games processed but not all final games)",
+        scan=dataclasses.replace(YESTERDAY_PLAYER_GAME_SUMMARY, columns=('game_id',))
     ),
 
     CanaryCheck(
@@ -500,13 +528,18 @@ CANARY_CHECKS = [
 ]
 
 
-def run_canary_query(client: bigquery.Client, check: CanaryCheck) -> Tuple[bool, Dict, Optional[str]]:
+def run_canary_query(
+    client: bigquery.Client,
+    check: CanaryCheck,
+    source: Optional[str] = None
+) -> Tuple[bool, Dict, Optional[str]]:
     """
     Run a canary query and validate thresholds.
 
     Args:
         client: BigQuery client
         check: CanaryCheck to run
+        source: Shared scan result table for check.scan (inline subquery if None)
 
     Returns:
         Tuple of (passed, metrics, error_message)
@@ -514,7 +547,7 @@ def run_canary_query(client: bigquery.Client, check: CanaryCheck) -> Tuple[bool,
     try:
         logger.info(f"Running canary: {check.name}")
 
-        query_job = client.query(check.query)
+        query_job = client.query(check.render_query(source))
         results = list(query_job.result())
 
         if not results:
@@ -1884,7 +1917,32 @@ def main():
     PLAYOFF_SKIP_PHASES = {'phase1_scrapers', 'phase2_raw_processing',
                            'phase5_predictions', 'phase5_shadow_coverage', 'phase6_publishing'}
 
-    results = []
+    # 2026-10-16: checks run concurrently on a CanaryRunner. Checks that
+    # declare the same scan share one materialized read; per-check latency and
+    # bytes billed are logged as [CANARY_TIMING]. CANARY_RUNNER_MODE=serial
+    # restores one-at-a-time execution.
+    runner = CanaryRunner(client, name=f"pipeline_canary_{CANARY_TIER}")
+    planned: List[Tuple[CanaryCheck, Optional[Callable[[Dict], str]]]] = []
+    skipped: Dict[str, Tuple[bool, Dict, Optional[str]]] = {}
+
+    def _schedule(
+        check: CanaryCheck,
+        fn: Optional[Callable] = None,
+        detail: Optional[Callable[[Dict], str]] = None
+    ) -> None:
+        """Queue a check. fn defaults to the check's threshold query; detail adds metrics to the log line."""
+        runner.add(
+            check.name,
+            fn or functools.partial(run_canary_query, check=check),
+            scan=check.scan,
+            on_error=lambda e: (False, {}, str(e)),
+        )
+        planned.append((check, detail))
+
+    def _skip(check: CanaryCheck, reason: str) -> None:
+        skipped[check.name] = (True, {'skipped': True, 'reason': reason}, None)
+        planned.append((check, None))
+
     for check in CANARY_CHECKS:
         if not _should_run(check.phase):
             logger.info(f"{check.name}: ⏭️  SKIPPED (tier={CANARY_TIER})")
@@ -1892,241 +1950,292 @@ def main():
 
         if is_break and check.phase in BREAK_DAY_SKIP_PHASES:
             logger.info(f"{check.name}: ⏭️  SKIPPED (break day — no recent regular-season games)")
-            results.append((check, True, {'skipped': True, 'reason': 'break_day'}, None))
+            _skip(check, 'break_day')
             continue
 
         if is_playoff and check.phase in PLAYOFF_SKIP_PHASES:
             logger.info(f"{check.name}: ⏭️  SKIPPED (playoff mode — predictions halted)")
-            results.append((check, True, {'skipped': True, 'reason': 'playoff_mode'}, None))
+            _skip(check, 'playoff_mode')
             continue
 
-        passed, metrics, error = run_canary_query(client, check)
-
-        status = "✅ PASS" if passed else "❌ FAIL"
-        logger.info(f"{check.name}: {status}")
-
-        if not passed:
-            logger.warning(f"  Error: {error}")
-
-        results.append((check, passed, metrics, error))
+        _schedule(check)
 
     # Session 242: Check Cloud Scheduler job health
     if _should_run("scheduler_health"):
-        scheduler_check = CanaryCheck(
-            name="Scheduler Health",
-            phase="scheduler_health",
-            query="",  # Not a BQ query — uses Cloud Scheduler API
-            thresholds={'failing_jobs': {'max': 3}},
-            description="Detects Cloud Scheduler job failures (regression from Session 219 baseline of 0)"
+        _schedule(
+            CanaryCheck(
+                name="Scheduler Health",
+                phase="scheduler_health",
+                query="",  # Not a BQ query — uses Cloud Scheduler API
+                thresholds={'failing_jobs': {'max': 3}},
+                description="Detects Cloud Scheduler job failures (regression from Session 219 baseline of 0)"
+            ),
+            lambda _client: check_scheduler_health()
         )
-        sched_passed, sched_metrics, sched_error = check_scheduler_health()
-        sched_status = "✅ PASS" if sched_passed else "❌ FAIL"
-        logger.info(f"Scheduler Health: {sched_status}")
-        if not sched_passed:
-            logger.warning(f"  Error: {sched_error}")
-        results.append((scheduler_check, sched_passed, sched_metrics, sched_error))
 
     # Session 474: Check best-bets pick drought (zero picks on game days)
     if not is_nba_offseason:
         if _should_run("bb_pick_drought"):
-            drought_check = CanaryCheck(
-                name="Best Bets Pick Drought",
-                phase="bb_pick_drought",
-                query="",
-                thresholds={},
-                description="Alerts when 0 best-bet picks published for 2+ consecutive game days"
+            _schedule(
+                CanaryCheck(
+                    name="Best Bets Pick Drought",
+                    phase="bb_pick_drought",
+                    query="",
+                    thresholds={},
+                    description="Alerts when 0 best-bet picks published for 2+ consecutive game days"
+                ),
+                check_pick_drought
             )
-            drought_passed, drought_metrics, drought_error = check_pick_drought(client)
-            drought_status = "✅ PASS" if drought_passed else "❌ FAIL"
-            logger.info(f"Best Bets Pick Drought: {drought_status}")
-            if not drought_passed:
-                logger.warning(f"  Error: {drought_error}")
-            results.append((drought_check, drought_passed, drought_metrics, drought_error))
 
         if _should_run("bb_filter_audit") and not is_nba_offseason:
-            filter_check = CanaryCheck(
-                name="BB Filter Audit",
-                phase="bb_filter_audit",
-                query="",
-                thresholds={},
-                description="Alerts when candidates enter BB pipeline but 0 pass filters for 2+ game days"
+            _schedule(
+                CanaryCheck(
+                    name="BB Filter Audit",
+                    phase="bb_filter_audit",
+                    query="",
+                    thresholds={},
+                    description="Alerts when candidates enter BB pipeline but 0 pass filters for 2+ game days"
+                ),
+                check_filter_audit_jammed
             )
-            filter_passed, filter_metrics, filter_error = check_filter_audit_jammed(client)
-            filter_status = "✅ PASS" if filter_passed else "❌ FAIL"
-            logger.info(f"BB Filter Audit: {filter_status}")
-            if not filter_passed:
-                logger.warning(f"  Error: {filter_error}")
-            results.append((filter_check, filter_passed, filter_metrics, filter_error))
 
         # MLB multi-day pick drought (added 2026-05-17). MLB has no off-season
         # gate analogous to is_nba_offseason — the schedule lookup below
         # returns 0 rows on true off-days, which the check handles gracefully.
         if _should_run("mlb_bb_pick_drought"):
-            mlb_drought_check = CanaryCheck(
-                name="MLB Best Bets Pick Drought",
-                phase="mlb_bb_pick_drought",
-                query="",
-                thresholds={},
-                description="Alerts when 0 MLB best-bet picks published for 2+ consecutive game days despite ≥5 predictions"
+            _schedule(
+                CanaryCheck(
+                    name="MLB Best Bets Pick Drought",
+                    phase="mlb_bb_pick_drought",
+                    query="",
+                    thresholds={},
+                    description="Alerts when 0 MLB best-bet picks published for 2+ consecutive game days despite ≥5 predictions"
+                ),
+                check_mlb_pick_drought
             )
-            mlb_drought_passed, mlb_drought_metrics, mlb_drought_error = check_mlb_pick_drought(client)
-            mlb_drought_status = "✅ PASS" if mlb_drought_passed else "❌ FAIL"
-            logger.info(f"MLB Best Bets Pick Drought: {mlb_drought_status}")
-            if not mlb_drought_passed:
-                logger.warning(f"  Error: {mlb_drought_error}")
-            results.append((mlb_drought_check, mlb_drought_passed, mlb_drought_metrics, mlb_drought_error))
 
     # Session 302: Check live-grading content quality (hybrid GCS+BQ)
     if not is_nba_offseason and _should_run("live_grading_content"):
-        grading_check = CanaryCheck(
-            name="Live-Grading Content Quality",
-            phase="live_grading_content",
-            query="",  # Not a BQ query — uses GCS + BQ hybrid
-            thresholds={},
-            description="Detects stale live-grading content (all pending, zero actuals) despite file updates (Session 302)"
+        _schedule(
+            CanaryCheck(
+                name="Live-Grading Content Quality",
+                phase="live_grading_content",
+                query="",  # Not a BQ query — uses GCS + BQ hybrid
+                thresholds={},
+                description="Detects stale live-grading content (all pending, zero actuals) despite file updates (Session 302)"
+            ),
+            check_live_grading_content
         )
-        grading_passed, grading_metrics, grading_error = check_live_grading_content(client)
-        grading_status = "✅ PASS" if grading_passed else "❌ FAIL"
-        if grading_metrics.get('skipped'):
-            logger.info(f"Live-Grading Content: ⏭️  SKIPPED ({grading_metrics.get('reason')})")
-        else:
-            logger.info(f"Live-Grading Content: {grading_status}")
-            if not grading_passed:
-                logger.warning(f"  Error: {grading_error}")
-        results.append((grading_check, grading_passed, grading_metrics, grading_error))
     elif is_nba_offseason:
         logger.info("NBA offseason/playoffs — skipping live-grading content check")
 
-    # Session 210: Auto-heal shadow model gaps (Session 299: skip on break days)
-    if not is_nba_offseason:
-        for check, passed, metrics, error in results:
-            if check.phase == "phase5_shadow_coverage" and not passed:
-                yesterday = (date.today() - timedelta(days=1)).isoformat()
-                logger.info(f"Shadow model gap detected — auto-triggering BACKFILL for {yesterday}")
-
-                backfill_ok = auto_backfill_shadow_models(yesterday)
-
-                heal_msg = (
-                    f"Auto-heal {'triggered' if backfill_ok else 'FAILED'}: "
-                    f"BACKFILL for {yesterday} "
-                    f"(missing_models={metrics.get('missing_models', '?')}, "
-                    f"critical_models={metrics.get('critical_models', '?')})"
-                )
-                logger.info(heal_msg)
-
-                send_slack_alert(
-                    message=f"{'🔧' if backfill_ok else '🚨'} *Shadow Model Auto-Heal*\n{heal_msg}",
-                    channel="#nba-alerts",
-                    alert_type="SHADOW_MODEL_AUTO_HEAL"
-                )
-    else:
-        logger.info("NBA offseason/playoffs — skipping shadow model auto-heal")
-
     # Session 477: Registry integrity checks — fire regardless of break day
     # (registry state is always relevant, not just on game days)
     if _should_run("registry_blocked_enabled"):
-        registry_check = CanaryCheck(
-            name="Registry Blocked Models",
-            phase="registry_blocked_enabled",
-            query="",
-            thresholds={},
-            description="Detects enabled models with status=blocked — invisible to BB pipeline (Session 477)"
+        _schedule(
+            CanaryCheck(
+                name="Registry Blocked Models",
+                phase="registry_blocked_enabled",
+                query="",
+                thresholds={},
+                description="Detects enabled models with status=blocked — invisible to BB pipeline (Session 477)"
+            ),
+            check_registry_blocked_enabled
         )
-        registry_passed, registry_metrics, registry_error = check_registry_blocked_enabled(client)
-        registry_status = "✅ PASS" if registry_passed else "❌ FAIL"
-        logger.info(f"Registry Blocked Models: {registry_status}")
-        if not registry_passed:
-            logger.warning(f"  Error: {registry_error}")
-        results.append((registry_check, registry_passed, registry_metrics, registry_error))
 
     if _should_run("model_recovery_gap"):
-        recovery_check = CanaryCheck(
-            name="Model Recovery Gap",
-            phase="model_recovery_gap",
-            query="",
-            thresholds={},
-            description="Detects HEALTHY models still blocked in registry — safe to unblock (Session 477)"
+        _schedule(
+            CanaryCheck(
+                name="Model Recovery Gap",
+                phase="model_recovery_gap",
+                query="",
+                thresholds={},
+                description="Detects HEALTHY models still blocked in registry — safe to unblock (Session 477)"
+            ),
+            check_model_recovery_gap
         )
-        recovery_passed, recovery_metrics, recovery_error = check_model_recovery_gap(client)
-        recovery_status = "✅ PASS" if recovery_passed else "❌ FAIL"
-        logger.info(f"Model Recovery Gap: {recovery_status}")
-        if not recovery_passed:
-            logger.warning(f"  Error: {recovery_error}")
-        results.append((recovery_check, recovery_passed, recovery_metrics, recovery_error))
 
     if not is_nba_offseason and _should_run("bb_candidates_today"):
-        bb_pipeline_check = CanaryCheck(
-            name="BB Pipeline Today",
-            phase="bb_candidates_today",
-            query="",
-            thresholds={},
-            description="Detects Phase 4 complete but BB pipeline stalled with 0 candidates (Session 477)"
+        _schedule(
+            CanaryCheck(
+                name="BB Pipeline Today",
+                phase="bb_candidates_today",
+                query="",
+                thresholds={},
+                description="Detects Phase 4 complete but BB pipeline stalled with 0 candidates (Session 477)"
+            ),
+            check_bb_candidates_today
         )
-        bb_pipeline_passed, bb_pipeline_metrics, bb_pipeline_error = check_bb_candidates_today(client)
-        bb_pipeline_status = "✅ PASS" if bb_pipeline_passed else "❌ FAIL"
-        logger.info(f"BB Pipeline Today: {bb_pipeline_status}")
-        if not bb_pipeline_passed:
-            logger.warning(f"  Error: {bb_pipeline_error}")
-        results.append((bb_pipeline_check, bb_pipeline_passed, bb_pipeline_metrics, bb_pipeline_error))
 
     # Session 478: Grading freshness — runs every 30 min, catches any grading outage
     # regardless of cause. Highest-ROI canary added this session.
     # Suppressed during NBA offseason/playoffs since predictions are halted then.
     if not is_nba_offseason and _should_run("grading_freshness"):
-        grading_freshness_check = CanaryCheck(
-            name="Grading Freshness",
-            phase="grading_freshness",
-            query="",
-            thresholds={},
-            description="Session 478: Alerts when prediction_accuracy has 0 graded records for 2+ recent game days — catches any grading outage within one canary cycle"
+        _schedule(
+            CanaryCheck(
+                name="Grading Freshness",
+                phase="grading_freshness",
+                query="",
+                thresholds={},
+                description="Session 478: Alerts when prediction_accuracy has 0 graded records for 2+ recent game days — catches any grading outage within one canary cycle"
+            ),
+            check_grading_freshness
         )
-        gf_passed, gf_metrics, gf_error = check_grading_freshness(client)
-        gf_status = "✅ PASS" if gf_passed else "❌ FAIL"
-        if gf_metrics.get('skipped'):
-            logger.info(f"Grading Freshness: ⏭️  SKIPPED ({gf_metrics.get('reason')})")
-        else:
-            logger.info(f"Grading Freshness: {gf_status}")
-            if not gf_passed:
-                logger.warning(f"  Error: {gf_error}")
-        results.append((grading_freshness_check, gf_passed, gf_metrics, gf_error))
 
     # Session 477 Error 004: Edge collapse alert (game-day only — needs today's predictions)
     if not is_nba_offseason and _should_run("edge_collapse_alert"):
-        edge_collapse_check = CanaryCheck(
-            name="Edge Collapse Alert",
-            phase="edge_collapse_alert",
-            query="",
-            thresholds={},
-            description="Alerts when enabled CatBoost avg_abs_diff<1.2 or LGBM<1.4 — picks indistinguishable from noise (Session 477)"
+        _schedule(
+            CanaryCheck(
+                name="Edge Collapse Alert",
+                phase="edge_collapse_alert",
+                query="",
+                thresholds={},
+                description="Alerts when enabled CatBoost avg_abs_diff<1.2 or LGBM<1.4 — picks indistinguishable from noise (Session 477)"
+            ),
+            check_edge_collapse_alert
         )
-        edge_passed, edge_metrics, edge_error = check_edge_collapse_alert(client)
-        edge_status = "✅ PASS" if edge_passed else "❌ FAIL"
-        if edge_metrics.get('skipped'):
-            logger.info(f"Edge Collapse Alert: ⏭️  SKIPPED ({edge_metrics.get('reason')})")
-        else:
-            logger.info(f"Edge Collapse Alert: {edge_status}")
-            if not edge_passed:
-                logger.warning(f"  Error: {edge_error}")
-        results.append((edge_collapse_check, edge_passed, edge_metrics, edge_error))
 
     # Session 477 Error 005: New model with no predictions (game-day only)
     if not is_nba_offseason and _should_run("new_model_no_predictions"):
-        new_model_check = CanaryCheck(
-            name="New Model No Predictions",
-            phase="new_model_no_predictions",
-            query="",
-            thresholds={},
-            description="Alerts when model registered <48h ago has 0 predictions — worker cache not refreshed (Session 477)"
+        _schedule(
+            CanaryCheck(
+                name="New Model No Predictions",
+                phase="new_model_no_predictions",
+                query="",
+                thresholds={},
+                description="Alerts when model registered <48h ago has 0 predictions — worker cache not refreshed (Session 477)"
+            ),
+            check_new_model_no_predictions
+        )
+
+    # Session 493: Check all.json published picks for duplicate (player_lookup, game_date) pairs
+    if _should_run("all_json_duplicate_picks"):
+        _schedule(
+            CanaryCheck(
+                name="all.json Duplicate Picks",
+                phase="all_json_duplicate_picks",
+                query="",  # Not a BQ query — uses GCS
+                thresholds={},
+                description="Alerts when all.json contains duplicate picks for the same (player_lookup, game_date) — zero tolerance (Session 493)"
+            ),
+            lambda _client: check_all_json_duplicate_picks(),
+            detail=lambda m: f"duplicate_pairs={m.get('duplicate_pair_count', '?')}"
+        )
+
+    # T1-6: Published-JSON vs BQ store reconciliation — catches when the published
+    # signal-best-bets JSON diverges from the signal_best_bets_picks BQ source of truth
+    if not is_nba_offseason and _should_run("published_vs_store_consistency"):
+        _schedule(
+            CanaryCheck(
+                name="Published vs Store Consistency",
+                phase="published_vs_store_consistency",
+                query="",  # Not a BQ query — hybrid GCS + BQ
+                thresholds={},
+                description="Alerts when v1/signal-best-bets/{today}.json pick count diverges from active picks in signal_best_bets_picks — zero tolerance (T1-6)"
+            ),
+            check_published_vs_store_consistency,
+            detail=lambda m: f"json={m.get('json_pick_count', '?')}, store={m.get('store_pick_count', '?')}"
         )
-        nm_passed, nm_metrics, nm_error = check_new_model_no_predictions(client)
-        nm_status = "✅ PASS" if nm_passed else "❌ FAIL"
-        if nm_metrics.get('skipped'):
-            logger.info(f"New Model No Predictions: ⏭️  SKIPPED ({nm_metrics.get('reason')})")
+    elif is_nba_offseason:
+        logger.info("NBA offseason/playoffs — skipping published vs store consistency check")
+
+    # 2026-07-03 (P1.2): Closing-line capture — yesterday's games must have a
+    # [0,45]-min pre-tip snapshot (the T-30 sweep output). Not backfillable.
+    if _should_run("closing_line_capture") and not is_nba_offseason:
+        _schedule(
+            CanaryCheck(
+                name="Closing-Line Capture",
+                phase="closing_line_capture",
+                query="",  # custom check function
+                thresholds={},
+                description="Alerts when yesterday's games lack a true closing snapshot (minutes_before_tipoff in [0,45]) — the T-30 sweep is broken and CLV data is being lost"
+            ),
+            check_closing_line_capture,
+            detail=lambda m: (
+                f"{m.get('games_with_close', '?')}/{m.get('games_final', '?')} games, "
+                f"{m.get('coverage_pct', '?')}%"
+            )
+        )
+
+    # Session 487: Fleet diversity check — all enabled models same family kills combo signals
+    if _should_run("fleet_diversity"):
+        _schedule(
+            CanaryCheck(
+                name="Fleet Diversity",
+                phase="fleet_diversity",
+                query="",
+                thresholds={},
+                description="Alerts when all enabled models are the same ML family (e.g. all LGBM) — kills combo_3way and book_disagreement signals (Session 487)"
+            ),
+            check_fleet_diversity,
+            detail=lambda m: f"families={m.get('distinct_families', '?')}, non_lgbm={m.get('non_lgbm_count', '?')}"
+        )
+
+    # Session 493: Check prediction_accuracy for duplicate (player, game_date, system_id) groups
+    if _should_run("pa_duplicate_groups"):
+        _schedule(
+            CanaryCheck(
+                name="prediction_accuracy Duplicate Groups",
+                phase="pa_duplicate_groups",
+                query=f"""
+                    SELECT COUNT(*) AS duplicate_group_count
+                    FROM (
+                      SELECT player_lookup, game_date, system_id
+                      FROM `{PROJECT_ID}.nba_predictions.prediction_accuracy`
+                      WHERE game_date >= DATE_SUB(CURRENT_DATE(), INTERVAL 7 DAY)
+                        AND recommendation IN ('OVER', 'UNDER')
+                      GROUP BY player_lookup, game_date, system_id
+                      HAVING COUNT(*) > 1
+                    )
+                """,
+                thresholds={"duplicate_group_count": {"max": 50}},
+                description="Alerts when prediction_accuracy has >50 duplicate (player,date,model) groups in last 7 days — indicates grading processor dedup regression (Session 493)"
+            ),
+            detail=lambda m: f"count={m.get('duplicate_group_count', '?')}"
+        )
+
+    outcomes = runner.run()
+
+    results = []
+    for check, detail in planned:
+        if check.name in skipped:
+            results.append((check, *skipped[check.name]))
+            continue
+
+        passed, metrics, error = outcomes[check.name]
+        if metrics.get('skipped'):
+            logger.info(f"{check.name}: ⏭️  SKIPPED ({metrics.get('reason')})")
         else:
-            logger.info(f"New Model No Predictions: {nm_status}")
-            if not nm_passed:
-                logger.warning(f"  Error: {nm_error}")
-        results.append((new_model_check, nm_passed, nm_metrics, nm_error))
+            status = "✅ PASS" if passed else "❌ FAIL"
+            logger.info(f"{check.name}: {status}" + (f" ({detail(metrics)})" if detail else ""))
+            if not passed:
+                logger.warning(f"  Error: {error}")
+        results.append((check, passed, metrics, error))
+
+    # Session 210: Auto-heal shadow model gaps (Session 299: skip on break days)
+    if not is_nba_offseason:
+        for check, passed, metrics, error in results:
+            if check.phase == "phase5_shadow_coverage" and not passed:
+                yesterday = (date.today() - timedelta(days=1)).isoformat()
+                logger.info(f"Shadow model gap detected — auto-triggering BACKFILL for {yesterday}")
+
+                backfill_ok = auto_backfill_shadow_models(yesterday)
+
+                heal_msg = (
+                    f"Auto-heal {'triggered' if backfill_ok else 'FAILED'}: "
+                    f"BACKFILL for {yesterday} "
+                    f"(missing_models={metrics.get('missing_models', '?')}, "
+                    f"critical_models={metrics.get('critical_models', '?')})"
+                )
+                logger.info(heal_msg)
+
+                send_slack_alert(
+                    message=f"{'🔧' if backfill_ok else '🚨'} *Shadow Model Auto-Heal*\n{heal_msg}",
+                    channel="#nba-alerts",
+                    alert_type="SHADOW_MODEL_AUTO_HEAL"
+                )
+    else:
+        logger.info("NBA offseason/playoffs — skipping shadow model auto-heal")
 
     # Session 302: Auto-heal Phase 3 partial game coverage gaps
     if not is_nba_offseason:
@@ -2155,118 +2264,6 @@ def main():
     else:
         logger.info("NBA offseason/playoffs — skipping Phase 3 partial coverage auto-heal")
 
-    # Session 493: Check all.json published picks for duplicate (player_lookup, game_date) pairs
-    if _should_run("all_json_duplicate_picks"):
-        all_json_dup_check = CanaryCheck(
-            name="all.json Duplicate Picks",
-            phase="all_json_duplicate_picks",
-            query="",  # Not a BQ query — uses GCS
-            thresholds={},
-            description="Alerts when all.json contains duplicate picks for the same (player_lookup, game_date) — zero tolerance (Session 493)"
-        )
-        all_json_passed, all_json_metrics, all_json_error = check_all_json_duplicate_picks()
-        all_json_status = "✅ PASS" if all_json_passed else "❌ FAIL"
-        if all_json_metrics.get('skipped'):
-            logger.info(f"all.json Duplicate Picks: ⏭️  SKIPPED ({all_json_metrics.get('reason')})")
-        else:
-            logger.info(f"all.json Duplicate Picks: {all_json_status} (duplicate_pairs={all_json_metrics.get('duplicate_pair_count', '?')})")
-            if not all_json_passed:
-                logger.warning(f"  Error: {all_json_error}")
-        results.append((all_json_dup_check, all_json_passed, all_json_metrics, all_json_error))
-
-    # T1-6: Published-JSON vs BQ store reconciliation — catches when the published
-    # signal-best-bets JSON diverges from the signal_best_bets_picks BQ source of truth
-    if not is_nba_offseason and _should_run("published_vs_store_consistency"):
-        published_vs_store_check = CanaryCheck(
-            name="Published vs Store Consistency",
-            phase="published_vs_store_consistency",
-            query="",  # Not a BQ query — hybrid GCS + BQ
-            thresholds={},
-            description="Alerts when v1/signal-best-bets/{today}.json pick count diverges from active picks in signal_best_bets_picks — zero tolerance (T1-6)"
-        )
-        pvs_passed, pvs_metrics, pvs_error = check_published_vs_store_consistency(client)
-        pvs_status = "✅ PASS" if pvs_passed else "❌ FAIL"
-        if pvs_metrics.get('skipped'):
-            logger.info(f"Published vs Store Consistency: ⏭️  SKIPPED ({pvs_metrics.get('reason')})")
-        else:
-            logger.info(
-                f"Published vs Store Consistency: {pvs_status} "
-                f"(json={pvs_metrics.get('json_pick_count', '?')}, "
-                f"store={pvs_metrics.get('store_pick_count', '?')})"
-            )
-            if not pvs_passed:
-                logger.warning(f"  Error: {pvs_error}")
-        results.append((published_vs_store_check, pvs_passed, pvs_metrics, pvs_error))
-    elif is_nba_offseason:
-        logger.info("NBA offseason/playoffs — skipping published vs store consistency check")
-
-    # 2026-07-03 (P1.2): Closing-line capture — yesterday's games must have a
-    # [0,45]-min pre-tip snapshot (the T-30 sweep output). Not backfillable.
-    if _should_run("closing_line_capture") and not is_nba_offseason:
-        closing_capture_check = CanaryCheck(
-            name="Closing-Line Capture",
-            phase="closing_line_capture",
-            query="",  # custom check function
-            thresholds={},
-            description="Alerts when yesterday's games lack a true closing snapshot (minutes_before_tipoff in [0,45]) — the T-30 sweep is broken and CLV data is being lost"
-        )
-        clc_passed, clc_metrics, clc_error = check_closing_line_capture(client)
-        clc_status = "✅ PASS" if clc_passed else "❌ FAIL"
-        if clc_metrics.get('skipped'):
-            logger.info(f"Closing-Line Capture: ⏭️  SKIPPED ({clc_metrics.get('reason')})")
-        else:
-            logger.info(
-                f"Closing-Line Capture: {clc_status} "
-                f"({clc_metrics.get('games_with_close', '?')}/"
-                f"{clc_metrics.get('games_final', '?')} games, "
-                f"{clc_metrics.get('coverage_pct', '?')}%)"
-            )
-            if not clc_passed:
-                logger.warning(f"  Error: {clc_error}")
-        results.append((closing_capture_check, clc_passed, clc_metrics, clc_error))
-
-    # Session 487: Fleet diversity check — all enabled models same family kills combo signals
-    if _should_run("fleet_diversity"):
-        fleet_diversity_check = CanaryCheck(
-            name="Fleet Diversity",
-            phase="fleet_diversity",
-            query="",
-            thresholds={},
-            description="Alerts when all enabled models are the same ML family (e.g. all LGBM) — kills combo_3way and book_disagreement signals (Session 487)"
-        )
-        fleet_passed, fleet_metrics, fleet_error = check_fleet_diversity(client)
-        fleet_status = "✅ PASS" if fleet_passed else "❌ FAIL"
-        logger.info(f"Fleet Diversity: {fleet_status} (families={fleet_metrics.get('distinct_families', '?')}, non_lgbm={fleet_metrics.get('non_lgbm_count', '?')})")
-        if not fleet_passed:
-            logger.warning(f"  Error: {fleet_error}")
-        results.append((fleet_diversity_check, fleet_passed, fleet_metrics, fleet_error))
-
-    # Session 493: Check prediction_accuracy for duplicate (player, game_date, system_id) groups
-    if _should_run("pa_duplicate_groups"):
-        pa_dup_check = CanaryCheck(
-            name="prediction_accuracy Duplicate Groups",
-            phase="pa_duplicate_groups",
-            query=f"""
-                SELECT COUNT(*) AS duplicate_group_count
-                FROM (
-                  SELECT player_lookup, game_date, system_id
-                  FROM `{PROJECT_ID}.nba_predictions.prediction_accuracy`
-                  WHERE game_date >= DATE_SUB(CURRENT_DATE(), INTERVAL 7 DAY)
-                    AND recommendation IN ('OVER', 'UNDER')
-                  GROUP BY player_lookup, game_date, system_id
-                  HAVING COUNT(*) > 1
-                )
-            """,
-            thresholds={"duplicate_group_count": {"max": 50}},
-            description="Alerts when prediction_accuracy has >50 duplicate (player,date,model) groups in last 7 days — indicates grading processor dedup regression (Session 493)"
-        )
-        pa_dup_passed, pa_dup_metrics, pa_dup_error = run_canary_query(client, pa_dup_check)
-        pa_dup_status = "✅ PASS" if pa_dup_passed else "❌ FAIL"
-        logger.info(f"prediction_accuracy Duplicates: {pa_dup_status} (count={pa_dup_metrics.get('duplicate_group_count', '?')})")
-        if not pa_dup_passed:
-            logger.warning(f"  Error: {pa_dup_error}")
-        results.append((pa_dup_check, pa_dup_passed, pa_dup_metrics, pa_dup_error))
-
     # Check if any failures
     failures = [r for r in results if not r[1]]
 
@@ -21,8 +21,10 @@ import sys
 # Add predictions/worker to path using relative path from this file
 _current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, os.path.join(_current_dir, '..', '..', '..', 'predictions', 'worker'))
+sys.path.insert(0, os.path.join(_current_dir, '..', '..', '..'))
 
 from batch_staging_writer import BatchConsolidator
+from predictions.shared.staging_buffer import get_staging_store
 from google.cloud import bigquery
 
 
@@ -70,7 +72,8 @@ def main():
 
     # Create BigQuery client and consolidator
     client = bigquery.Client(project=args.project)
-    consolidator = BatchConsolidator(client, args.project)
+    # Also loads buffered staging objects when STAGING_BUFFER_URI is set
+    consolidator = BatchConsolidator(client, args.project, staging_store=get_staging_store())
 
     # Run consolidation
     print("Running consolidation...")
@@ -4,12 +4,16 @@ Calculator Modules for Player Game Summary
 Extracted calculators for specific computation tasks:
 - QualityScorer: Source coverage quality scoring
 - ChangeDetector: Meaningful change detection
+- ColumnTransforms: Vectorized per-record derivations
 """
 
 from .quality_scorer import QualityScorer
 from .change_detector import ChangeDetectorWrapper
+from .column_transforms import ColumnTransforms, DNP_REASON_KEYWORDS
 
 __all__ = [
     'QualityScorer',
     'ChangeDetectorWrapper',
+    'ColumnTransforms',
+    'DNP_REASON_KEYWORDS',
 ]
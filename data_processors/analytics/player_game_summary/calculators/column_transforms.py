@@ -0,0 +1,230 @@
+"""
+Column Transforms for Player Game Summary
+
+Whole-frame (pandas/NumPy) versions of the per-row derivations in
+player_game_summary_processor.py::_process_single_player_game().
+
+Every transform returns values identical to the row path for "regular" rows
+and a boolean mask of the rows it could not handle exactly (odd minutes
+strings, non-string game_ids, ...). The processor sends those rows through
+the original row path, so its logging and failure tracking still apply.
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Checked in order; first match wins (see _categorize_dnp_reason)
+DNP_REASON_KEYWORDS: Dict[str, List[str]] = {
+    'injury': [
+        'injury', 'injured', 'illness', 'sprain', 'strain',
+        'sore', 'pain', 'surgery', 'concussion', 'knee',
+        'ankle', 'back', 'hamstring', 'shoulder', 'hip',
+        'foot', 'calf', 'quad', 'groin', 'wrist', 'elbow'
+    ],
+    'rest': [
+        'rest', 'load management', 'recovery', 'maintenance',
+        'scheduled rest', 'precautionary'
+    ],
+    'personal': [
+        'personal', 'family', 'birth', 'funeral', 'bereavement'
+    ],
+    'coach_decision': [
+        'coach', 'decision', 'not with team', 'suspension',
+        'team decision', 'disciplinary'
+    ],
+}
+
+_MM_SS = r'^([0-9]+)\s*:\s*([0-9]+)$'
+_PLAIN_NUMBER = r'^[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)$'
+
+
+def _column(df: pd.DataFrame, name: str) -> pd.Series:
+    """df[name], or all-None when absent (mirrors row.get(name))."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series([None] * len(df), index=df.index, dtype=object)
+
+
+def _truthy(series: pd.Series) -> np.ndarray:
+    """Python truthiness per element (NaN is truthy, '' and None are not)."""
+    return series.to_numpy(dtype=object).astype(bool)
+
+
+def _where(mask: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Object array of Python floats where mask, None elsewhere."""
+    out = np.full(len(values), None, dtype=object)
+    out[mask] = values[mask].tolist()
+    return out
+
+
+class ColumnTransforms:
+    """Vectorized derivations for player-game records."""
+
+    @staticmethod
+    def parse_minutes(minutes: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Column version of _parse_minutes_to_decimal().
+
+        Returns:
+            (minutes_decimal, regular): float array (NaN = None) and mask of rows
+            parsed exactly. Rows the row parser would warn about are irregular.
+        """
+        n = len(minutes)
+        values = np.full(n, np.nan)
+        if pd.api.types.is_numeric_dtype(minutes) and not pd.api.types.is_bool_dtype(minutes):
+            values[:] = minutes.to_numpy(dtype=float, na_value=np.nan)
+            return values, np.ones(n, dtype=bool)
+
+        isna = minutes.isna().to_numpy()
+        clean = minutes.astype(str).str.strip()
+        null_like = isna | clean.isin(['', '-']).to_numpy() | (clean.str.lower() == 'null').to_numpy()
+
+        parts = clean.str.extract(_MM_SS)
+        mins = pd.to_numeric(parts[0]).to_numpy(dtype=float, na_value=np.nan)
+        secs = pd.to_numeric(parts[1]).to_numpy(dtype=float, na_value=np.nan)
+        mm_ss = ~null_like & ~np.isnan(mins) & (secs < 60) & (mins <= 60)
+        values[mm_ss] = [round(m + s / 60, 2) for m, s in zip(mins[mm_ss].tolist(), secs[mm_ss].tolist())]
+
+        plain = ~null_like & clean.str.match(_PLAIN_NUMBER).to_numpy(dtype=bool)
+        values[plain] = clean[plain].astype(float).to_numpy()
+
+        return values, null_like | mm_ss | plain
+
+    @staticmethod
+    def parse_plus_minus(plus_minus: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Column version of _parse_plus_minus() (before int truncation).
+
+        Returns:
+            (values, regular): float array (NaN = None) and mask of rows parsed exactly.
+        """
+        isna = plus_minus.isna().to_numpy()
+        if pd.api.types.is_numeric_dtype(plus_minus) and not pd.api.types.is_bool_dtype(plus_minus):
+            values = plus_minus.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            clean = plus_minus.astype(str).str.strip()
+            parseable = ~isna & clean.str.match(_PLAIN_NUMBER).to_numpy(dtype=bool)
+            values = np.full(len(plus_minus), np.nan)
+            values[parseable] = clean[parseable].astype(float).to_numpy()
+        return values, isna | np.isfinite(values)
+
+    @staticmethod
+    def categorize_dnp_reasons(reasons: pd.Series) -> np.ndarray:
+        """Column version of _categorize_dnp_reason(); object array of categories/None."""
+        lower = reasons.astype(str).str.lower()
+        conditions = [~_truthy(reasons)]
+        choices: List[Optional[str]] = [None]
+        for category, words in DNP_REASON_KEYWORDS.items():
+            pattern = '|'.join(re.escape(word) for word in words)
+            conditions.append(lower.str.contains(pattern, regex=True).to_numpy(dtype=bool))
+            choices.append(category)
+        return np.select(conditions, choices, default='other')
+
+    @staticmethod
+    def derive_team_abbrs(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Column version of _derive_team_abbr() plus the opponent derivation.
+
+        Returns:
+            (team_abbr, opponent_team_abbr, regular): object arrays and a mask of
+            rows with a string game_id (others take the row path).
+        """
+        game_id = _column(df, 'game_id')
+        regular = game_id.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+
+        parts = game_id.where(regular, '').str.split('_')
+        has_teams = (parts.str.len() >= 3).to_numpy()
+        away = parts.str[1].to_numpy(dtype=object)
+        home = parts.str[2].to_numpy(dtype=object)
+
+        is_home = _column(df, 'is_home').tolist()
+        home_true = np.array([v is True for v in is_home], dtype=bool)
+        home_false = np.array([v is False for v in is_home], dtype=bool)
+
+        team = _column(df, 'team_abbr')
+        source_home = _column(df, 'source_home_team')
+        source_away = _column(df, 'source_away_team')
+        home_known = _truthy(source_home) & (source_home.to_numpy(dtype=object) == home)
+        away_known = _truthy(source_away) & (source_away.to_numpy(dtype=object) == away)
+
+        team_abbr = np.select(
+            [
+                team.notna().to_numpy() & _truthy(team),
+                has_teams & home_true,
+                has_teams & home_false,
+                has_teams & home_known,
+                has_teams & away_known,
+                home_true & source_home.notna().to_numpy(),
+                home_false & source_away.notna().to_numpy(),
+            ],
+            [
+                team.to_numpy(dtype=object), home, away, home, away,
+                source_home.to_numpy(dtype=object), source_away.to_numpy(dtype=object),
+            ],
+            default=None,
+        )
+
+        opponent = _column(df, 'opponent_team_abbr').to_numpy(dtype=object)
+        derive = ~opponent.astype(bool) & team_abbr.astype(bool) & has_teams
+        opponent_team_abbr = np.where(
+            derive & (team_abbr == home), away,
+            np.where(derive & (team_abbr == away), home, opponent),
+        )
+        return team_abbr, opponent_team_abbr, regular
+
+    @staticmethod
+    def efficiency(df: pd.DataFrame, minutes: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        ts_pct, efg_pct and per-game usage_rate, as in the row path.
+
+        Returns:
+            Dict of object arrays ('ts_pct', 'efg_pct', 'usage_rate': float, or
+            None where the row path leaves None; a computed value may be NaN),
+            the float 'player_poss'/'team_poss' components and the
+            'has_team_stats'/'usage_over_100' masks.
+        """
+        def num(name: str) -> np.ndarray:
+            return pd.to_numeric(_column(df, name)).to_numpy(dtype=float, na_value=np.nan)
+
+        fga, fgm, fg3m = num('field_goals_attempted'), num('field_goals_made'), num('three_pointers_made')
+        fta, tov, pts = num('free_throws_attempted'), num('turnovers'), num('points')
+        team_fga, team_fta, team_tov = num('team_fg_attempts'), num('team_ft_attempts'), num('team_turnovers')
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shooting = fga > 0
+            efg = (fgm + 0.5 * np.nan_to_num(fg3m)) / fga
+            total_shots = fga + 0.44 * fta
+            ts_ok = shooting & ~np.isnan(fta) & (total_shots > 0)
+            ts = pts / (2 * total_shots)
+
+            has_team_stats = ~np.isnan(team_fga) & ~np.isnan(team_fta) & ~np.isnan(team_tov)
+            player_poss = fga + 0.44 * np.nan_to_num(fta) + tov
+            team_poss = team_fga + 0.44 * team_fta + team_tov
+            usage_ok = (has_team_stats & ~np.isnan(fga) & ~np.isnan(tov)
+                        & (minutes > 0) & (team_poss > 0))
+            usage = 100.0 * player_poss * 48.0 / (minutes * team_poss)
+
+        over_100 = usage_ok & (usage > 100.0)
+        return {
+            'ts_pct': _where(ts_ok, ts),
+            'efg_pct': _where(shooting, efg),
+            'usage_rate': _where(usage_ok & ~over_100, usage),
+            'usage_over_100': over_100,
+            'player_poss': player_poss,
+            'team_poss': team_poss,
+            'has_team_stats': has_team_stats,
+        }
+
+    @staticmethod
+    def nullable_ints(series: pd.Series) -> List[Optional[int]]:
+        """[int(v) if pd.notna(v) else None] for a whole column."""
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            values = series.to_numpy(dtype=float, na_value=np.nan)
+            return [None if v != v else int(v) for v in values.tolist()]
+        return [None if pd.isna(v) else int(v) for v in series.tolist()]
@@ -29,6 +29,7 @@ import json
 import logging
 import os
 import time
+import numpy as np
 import pandas as pd
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
@@ -48,7 +49,7 @@ from shared.validation.processing_gate import ProcessingGate, GateStatus, Proces
 
 # Extracted modules for maintainability
 from .sources import ShotZoneAnalyzer, PropCalculator, PlayerRegistryHandler
-from .calculators import QualityScorer, ChangeDetectorWrapper
+from .calculators import QualityScorer, ChangeDetectorWrapper, ColumnTransforms, DNP_REASON_KEYWORDS
 
 logger = logging.getLogger(__name__)
 
@@ -686,34 +687,10 @@ class PlayerGameSummaryProcessor(
 
         reason_lower = str(reason_text).lower()
 
-        # Injury patterns
-        if any(word in reason_lower for word in [
-            'injury', 'injured', 'illness', 'sprain', 'strain',
-            'sore', 'pain', 'surgery', 'concussion', 'knee',
-            'ankle', 'back', 'hamstring', 'shoulder', 'hip',
-            'foot', 'calf', 'quad', 'groin', 'wrist', 'elbow'
-        ]):
-            return 'injury'
-
-        # Rest patterns
-        if any(word in reason_lower for word in [
-            'rest', 'load management', 'recovery', 'maintenance',
-            'scheduled rest', 'precautionary'
-        ]):
-            return 'rest'
-
-        # Personal patterns
-        if any(word in reason_lower for word in [
-            'personal', 'family', 'birth', 'funeral', 'bereavement'
-        ]):
-            return 'personal'
-
-        # Coach decision patterns
-        if any(word in reason_lower for word in [
-            'coach', 'decision', 'not with team', 'suspension',
-            'team decision', 'disciplinary'
-        ]):
-            return 'coach_decision'
+        # Injury, rest, personal, then coach-decision patterns
+        for category, words in DNP_REASON_KEYWORDS.items():
+            if any(word in reason_lower for word in words):
+                return category
 
         return 'other'
 
@@ -1413,9 +1390,12 @@ class PlayerGameSummaryProcessor(
         # =====================================================================
         # Process records - PARALLEL OR SERIAL based on environment variable
         # =====================================================================
+        ENABLE_VECTORIZED = os.environ.get('PGS_VECTORIZED', 'true').lower() == 'true'
         ENABLE_PARALLELIZATION = os.environ.get('ENABLE_PLAYER_PARALLELIZATION', 'true').lower() == 'true'
 
-        if ENABLE_PARALLELIZATION:
+        if ENABLE_VECTORIZED:
+            records = self._process_player_games_vectorized(uid_map)
+        elif ENABLE_PARALLELIZATION:
             records = self._process_player_games_parallel(uid_map)
         else:
             records = self._process_player_games_serial(uid_map)
@@ -1899,6 +1879,207 @@ class PlayerGameSummaryProcessor(
     # Parallelization Methods
     # =========================================================================
 
+    def _process_player_games_vectorized(self, uid_map: dict) -> List[Dict]:
+        """
+        Process all player-game records with column-oriented transforms.
+
+        Minutes/plus-minus parsing, efficiency + usage_rate, team/opponent
+        derivation, DNP categorization and the shot zone join run once over the
+        whole frame (ColumnTransforms, ShotZoneAnalyzer.get_shot_zone_frame);
+        records are then assembled from the derived columns. Rows the column
+        transforms can't reproduce exactly (unresolved players, odd minutes
+        strings, non-string game_ids, ...) go through _process_single_player_game(),
+        so output is identical to the row path. Records keep raw_data order.
+        """
+        df = self.raw_data.reset_index(drop=True)
+        total_records = len(df)
+        logger.info(f"Processing {total_records} player-game records (vectorized mode)")
+        loop_start = time.time()
+
+        try:
+            uids = np.array([uid_map.get(p) for p in df['player_lookup'].tolist()], dtype=object)
+            minutes, minutes_ok = ColumnTransforms.parse_minutes(df['minutes'])
+            plus_minus, plus_minus_ok = ColumnTransforms.parse_plus_minus(df['plus_minus'])
+            team_abbr, opponent_abbr, game_id_ok = ColumnTransforms.derive_team_abbrs(df)
+            regular = pd.notna(uids) & minutes_ok & plus_minus_ok & game_id_ok
+
+            eff = ColumnTransforms.efficiency(df, minutes)
+            for i in np.flatnonzero(regular & eff['usage_over_100']):
+                usage = 100.0 * eff['player_poss'][i] * 48.0 / (minutes[i] * eff['team_poss'][i])
+                logger.warning(
+                    f"Impossible usage_rate {usage:.1f}% for {df.at[i, 'player_lookup']} in {df.at[i, 'game_id']} - "
+                    f"likely incomplete team stats (team_poss={eff['team_poss'][i]:.1f}, "
+                    f"player_poss={eff['player_poss'][i]:.1f})"
+                )
+
+            status = df['player_status']
+            active = (status == 'active').to_numpy()
+            dnp_reason = df['dnp_reason'] if 'dnp_reason' in df.columns else pd.Series([None] * total_records, dtype=object)
+            dnp_category = ColumnTransforms.categorize_dnp_reasons(dnp_reason)
+            is_dnp = status.isin(['dnp', 'inactive']).to_numpy() | ((minutes == 0) & active)
+
+            zone_rows = np.flatnonzero(regular)
+            zones = self.shot_zone_analyzer.get_shot_zone_frame(
+                df['game_id'].iloc[zone_rows], df['player_lookup'].iloc[zone_rows]
+            )
+            zone_fields = list(zones.columns)
+            shot_zones = [None] * total_records
+            for i, values in zip(zone_rows, zones.to_numpy(dtype=object).tolist()):
+                shot_zones[i] = values
+        except Exception as e:
+            logger.warning(f"Vectorized transform failed ({e}); falling back to row-by-row processing")
+            return self._process_player_games_parallel(uid_map)
+
+        ints = {col: ColumnTransforms.nullable_ints(df[col]) for col in (
+            'points', 'assists', 'offensive_rebounds', 'defensive_rebounds', 'steals', 'blocks',
+            'turnovers', 'personal_fouls', 'field_goals_attempted', 'field_goals_made',
+            'three_pointers_attempted', 'three_pointers_made', 'free_throws_attempted',
+            'free_throws_made', 'season_year',
+        )}
+        columns = {col: df[col].tolist() for col in (
+            'player_lookup', 'player_full_name', 'game_id', 'game_date', 'player_status',
+            'points', 'points_line', 'primary_source',
+        )}
+        points_line_source = df['points_line_source'].tolist() if 'points_line_source' in df.columns else [None] * total_records
+        dnp_reasons = dnp_reason.tolist()
+        has_plus_minus = df['plus_minus'].notna().tolist()
+        minutes_list = [None if m != m else m for m in minutes.tolist()]
+        plus_minus_list = [None if v != v else int(v) for v in plus_minus.tolist()]
+        ts_list, efg_list, usage_list = (eff[k].tolist() for k in ('ts_pct', 'efg_pct', 'usage_rate'))
+        has_team_stats = eff['has_team_stats'].tolist()
+
+        # Identical for every record in the batch
+        source_tracking = self.build_source_tracking_fields()
+        processing_context = self._determine_processing_context()
+        has_shot_zones = self.shot_zone_analyzer.shot_zones_available
+        quality_cache: Dict[tuple, Dict] = {}
+
+        def quality_columns(primary_source, has_pm: bool) -> Dict:
+            key = (primary_source, has_pm)
+            if key not in quality_cache:
+                quality_cache[key] = QualityScorer.calculate_quality(
+                    primary_source=primary_source,
+                    has_plus_minus=has_pm,
+                    has_shot_zones=has_shot_zones
+                )
+            # Fresh lists per record (issues/sources)
+            return {k: list(v) if isinstance(v, list) else v for k, v in quality_cache[key].items()}
+
+        records = []
+        for i in range(total_records):
+            if not regular[i]:
+                record = self._process_single_player_game(i, df.iloc[i], uid_map)
+                if record is not None:
+                    records.append(record)
+                continue
+
+            try:
+                minutes_decimal = minutes_list[i]
+                status_i = columns['player_status'][i]
+                game_date = columns['game_date'][i]
+                points = columns['points'][i]
+                points_line = columns['points_line'][i]
+                primary_source = columns['primary_source'][i]
+                shot_zone_data = dict(zip(zone_fields, shot_zones[i]))
+                usage_rate, ts_pct, efg_pct = usage_list[i], ts_list[i], efg_list[i]
+                three_att_pbp = shot_zone_data['three_attempts_pbp']
+                three_makes_pbp = shot_zone_data['three_makes_pbp']
+
+                record = {
+                    # Core identifiers
+                    'player_lookup': columns['player_lookup'][i],
+                    'universal_player_id': uids[i],
+                    'player_full_name': columns['player_full_name'][i],
+                    'game_id': columns['game_id'][i],
+                    'game_date': game_date.isoformat() if pd.notna(game_date) else None,
+                    'team_abbr': team_abbr[i],
+                    'opponent_team_abbr': opponent_abbr[i],
+                    'season_year': ints['season_year'][i],
+
+                    # Basic stats
+                    'points': ints['points'][i],
+                    'minutes_played': round(minutes_decimal, 1) if minutes_decimal is not None else None,
+                    'assists': ints['assists'][i],
+                    'offensive_rebounds': ints['offensive_rebounds'][i],
+                    'defensive_rebounds': ints['defensive_rebounds'][i],
+                    'steals': ints['steals'][i],
+                    'blocks': ints['blocks'][i],
+                    'turnovers': ints['turnovers'][i],
+                    'personal_fouls': ints['personal_fouls'][i],
+                    'plus_minus': plus_minus_list[i],
+
+                    # Shooting (PBP three_pt preferred, box score fallback)
+                    'fg_attempts': ints['field_goals_attempted'][i],
+                    'fg_makes': ints['field_goals_made'][i],
+                    'three_pt_attempts': three_att_pbp if three_att_pbp is not None else ints['three_pointers_attempted'][i],
+                    'three_pt_makes': three_makes_pbp if three_makes_pbp is not None else ints['three_pointers_made'][i],
+                    'ft_attempts': ints['free_throws_attempted'][i],
+                    'ft_makes': ints['free_throws_made'][i],
+
+                    # Shot zones + shot creation
+                    **shot_zone_data,
+
+                    # Efficiency
+                    'usage_rate': round(usage_rate, 1) if usage_rate else None,
+                    'ts_pct': round(ts_pct, 3) if ts_pct else None,
+                    'efg_pct': round(efg_pct, 3) if efg_pct else None,
+                    'starter_flag': bool(minutes_decimal and minutes_decimal > 20) if minutes_decimal else False,
+                    'win_flag': False,
+
+                    # Prop betting
+                    **PropCalculator.get_prop_fields(
+                        points=points if pd.notna(points) else None,
+                        points_line=points_line if pd.notna(points_line) else None,
+                        points_line_source=points_line_source[i]
+                    ),
+
+                    # Availability
+                    'is_active': bool(active[i]),
+                    'player_status': status_i,
+
+                    # DNP tracking
+                    'is_dnp': bool(is_dnp[i]),
+                    'dnp_reason': dnp_reasons[i] if not active[i] else None,
+                    'dnp_reason_category': dnp_category[i] if not active[i] else None,
+
+                    **source_tracking,
+
+                    **quality_columns(primary_source, has_plus_minus[i]),
+                    **QualityScorer.get_additional_quality_fields(
+                        primary_source=primary_source,
+                        shot_zones_estimated=False
+                    ),
+
+                    'processing_context': processing_context,
+                    'data_quality_flag': (
+                        'complete' if (usage_rate is not None and has_team_stats[i])
+                        else ('partial_no_team_stats' if not has_team_stats[i] else 'partial')
+                    ),
+                    'team_stats_available_at_processing': has_team_stats[i],
+                    'has_complete_shot_zones': (
+                        shot_zone_data['paint_attempts'] is not None and
+                        shot_zone_data['mid_range_attempts'] is not None and
+                        three_att_pbp is not None
+                    ),
+
+                    'processed_at': datetime.now(timezone.utc).isoformat()
+                }
+                record['data_hash'] = self._calculate_data_hash(record)
+                records.append(record)
+            except Exception as e:
+                # Let the row path reproduce (and record) the failure
+                logger.debug(f"Vectorized record {i} failed ({e}); using row path")
+                record = self._process_single_player_game(i, df.iloc[i], uid_map)
+                if record is not None:
+                    records.append(record)
+
+        total_time = time.time() - loop_start
+        logger.info(
+            f"Completed {len(records)} records in {total_time:.1f}s "
+            f"({int((~regular).sum())} via row path)"
+        )
+        return records
+
     def _process_player_games_parallel(self, uid_map: dict) -> List[Dict]:
         """Process all player-game records using ThreadPoolExecutor."""
         # Determine worker count with environment variable support
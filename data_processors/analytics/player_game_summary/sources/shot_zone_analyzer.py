@@ -30,6 +30,15 @@ class ShotZoneAnalyzer:
     - Three-point: event_subtype contains '3pt' OR shot_distance >= 23.75
     """
 
+    # Keys (and order) of get_shot_zone_data() / columns of get_shot_zone_frame()
+    SHOT_ZONE_FIELDS = (
+        'paint_attempts', 'paint_makes', 'mid_range_attempts', 'mid_range_makes',
+        'three_attempts_pbp', 'three_makes_pbp',
+        'assisted_fg_makes', 'unassisted_fg_makes',
+        'and1_count',
+        'paint_blocks', 'mid_range_blocks', 'three_pt_blocks',
+    )
+
     def __init__(self, bq_client: bigquery.Client, project_id: str):
         """
         Initialize shot zone analyzer.
@@ -479,6 +488,50 @@ class ShotZoneAnalyzer:
             'three_pt_blocks': zones.get('three_pt_blocks'),
         }
 
+    def get_shot_zone_frame(self, game_ids: pd.Series, player_lookups: pd.Series) -> pd.DataFrame:
+        """
+        Join shot zone data onto a batch of player-games.
+
+        Column-oriented counterpart of get_shot_zone_data(): one row per
+        (game_id, player_lookup) pair, in input order, with SHOT_ZONE_FIELDS
+        columns holding the same values (None for missing). Logs the same
+        incomplete-zone warnings.
+
+        Args:
+            game_ids: Game IDs
+            player_lookups: Player lookup strings (aligned with game_ids)
+
+        Returns:
+            Object-dtype DataFrame with a RangeIndex
+        """
+        fields = list(self.SHOT_ZONE_FIELDS)
+        keys = pd.MultiIndex.from_arrays([game_ids.to_numpy(), player_lookups.to_numpy()])
+        if self.shot_zone_data:
+            zones = pd.DataFrame(
+                [[zone.get(f) for f in fields] for zone in self.shot_zone_data.values()],
+                index=pd.MultiIndex.from_tuples(list(self.shot_zone_data.keys())),
+                columns=fields,
+                dtype=object,
+            ).reindex(keys)
+            frame = zones.where(zones.notna(), None).reset_index(drop=True)
+        else:
+            frame = pd.DataFrame([[None] * len(fields)] * len(keys), columns=fields, dtype=object)
+
+        # Same completeness check as get_shot_zone_data()
+        zone_cols = ['paint_attempts', 'mid_range_attempts', 'three_attempts_pbp']
+        present = frame[zone_cols].notna()
+        non_negative = frame[zone_cols].apply(lambda col: pd.to_numeric(col) >= 0)
+        partial = (present & non_negative).any(axis=1) & ~present.all(axis=1)
+        for i in partial[partial].index:
+            missing_zones = [name for name, col in zip(('paint', 'mid_range', 'three_pt'), zone_cols)
+                             if frame.at[i, col] is None]
+            logger.warning(
+                f"⚠️ Incomplete shot zone data for {game_ids.iloc[i]}/{player_lookups.iloc[i]}: "
+                f"missing {missing_zones} zones (source: {self.shot_zones_source}). "
+                f"This can corrupt rate calculations!"
+            )
+        return frame
+
     def persist_pending_bdb_games(self) -> int:
         """
         Persist games that need BDB re-run to BigQuery.
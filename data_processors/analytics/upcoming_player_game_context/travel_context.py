@@ -8,11 +8,13 @@ Contains functions for calculating travel-related context metrics.
 """
 
 import logging
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from typing import Dict, Optional
 
 from google.api_core.exceptions import GoogleAPIError, NotFound, ServiceUnavailable, DeadlineExceeded
 
+from data_processors.analytics.utils.travel_engine import travel_engine_enabled
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,8 +24,14 @@ class TravelContextCalculator:
 
     Uses NBATravel utility to get distance and timezone data for teams.
     Caches results to avoid repeated lookups for the same team/date.
+
+    The schedule is loaded once per lookback range for all teams (see
+    preload); backfills can preload a whole season up front.
     """
 
+    # Schedule days loaded before the target date (covers long road trips)
+    SCHEDULE_LOOKBACK_DAYS = 30
+
     def __init__(self, project_id: str):
         """
         Initialize the calculator.
@@ -42,6 +50,13 @@ class TravelContextCalculator:
             self._travel_utils = NBATravel(self.project_id)
         return self._travel_utils
 
+    def preload(self, start_date: date, end_date: date) -> None:
+        """Load completed games for all teams from start_date - lookback to end_date."""
+        self._get_travel_utils().load_schedule_travel(
+            datetime.combine(start_date - timedelta(days=self.SCHEDULE_LOOKBACK_DAYS), datetime.min.time()),
+            datetime.combine(end_date, datetime.min.time()),
+        )
+
     def calculate_travel_context(
         self,
         team_abbr: str,
@@ -78,20 +93,33 @@ class TravelContextCalculator:
             # Get travel utilities
             travel_utils = self._get_travel_utils()
 
+            # One schedule load covers every team for this date
+            if travel_engine_enabled():
+                engine = travel_utils.schedule_engine
+                window_start = target_date - timedelta(days=self.SCHEDULE_LOOKBACK_DAYS)
+                if engine is None or not engine.covers(window_start, target_date):
+                    self.preload(target_date, target_date)
+
             # Get 14-day travel metrics
+            current_date = datetime.combine(target_date, datetime.min.time())
             travel_14d = travel_utils.get_travel_last_n_days(
                 team_abbr=team_abbr,
-                current_date=datetime.combine(target_date, datetime.min.time()),
+                current_date=current_date,
                 days=14
             )
 
             if travel_14d:
+                # Rows written before 2026-10-17 read keys get_travel_last_n_days never
+                # returned and stored 0 for the 14-day and road-game fields
+                road_trip_length = travel_utils.get_road_trip_length(
+                    team_abbr, current_date, days=self.SCHEDULE_LOOKBACK_DAYS
+                )
                 metrics = {
                     'travel_miles': None,  # Single game travel TBD
                     'time_zone_changes': None,  # Single game TZ TBD
-                    'consecutive_road_games': travel_14d.get('consecutive_away_games', 0),
-                    'miles_traveled_last_14_days': travel_14d.get('miles_traveled', 0),
-                    'time_zones_crossed_last_14_days': travel_14d.get('time_zones_crossed', 0),
+                    'consecutive_road_games': road_trip_length,
+                    'miles_traveled_last_14_days': travel_14d.get('miles_traveled_last_14_days', 0),
+                    'time_zones_crossed_last_14_days': travel_14d.get('time_zones_crossed_last_14_days', 0),
                 }
             else:
                 metrics = default_metrics
@@ -9,7 +9,9 @@ Extracted from upcoming_team_game_context_processor.py for maintainability.
 import logging
 import pandas as pd
 from datetime import date, timedelta
-from typing import Dict
+from typing import Dict, Optional
+
+from data_processors.analytics.utils.travel_engine import ScheduleTravelEngine, travel_engine_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,10 @@ class FatigueCalculator:
     - Days rest
     - Back-to-back games
     - Games in rolling windows (7, 14 days)
+
+    Completed games are indexed once by a ScheduleTravelEngine, so each game's
+    metrics are binary searches instead of a schedule scan
+    (TRAVEL_ENGINE=query keeps the scan).
     """
 
     def __init__(self, schedule_data: pd.DataFrame):
@@ -32,6 +38,15 @@ class FatigueCalculator:
             schedule_data: DataFrame with team schedule
         """
         self.schedule_data = schedule_data
+        self._engine: Optional[ScheduleTravelEngine] = None
+
+    @property
+    def engine(self) -> ScheduleTravelEngine:
+        """Season pass over completed games in schedule_data (built on first use)."""
+        if self._engine is None:
+            completed = self.schedule_data[self.schedule_data['game_status'] == 3]
+            self._engine = ScheduleTravelEngine(completed)
+        return self._engine
 
     def calculate_basic_context(
         self,
@@ -81,6 +96,9 @@ class FatigueCalculator:
 
         game_date = game['game_date']
 
+        if travel_engine_enabled():
+            return self._fatigue_from_engine(game_date, team_abbr)
+
         # Get team's games before this one
         team_games = self.schedule_data[
             (
@@ -124,3 +142,31 @@ class FatigueCalculator:
             'days_since_last_game': int((game_date - last_game_date).days),
             'game_number_in_season': int(len(team_games) + 1)
         }
+
+    def _fatigue_from_engine(self, game_date, team_abbr: str) -> Dict:
+        """calculate_fatigue_context() via the schedule engine."""
+        last_game = self.engine.last_game_before(team_abbr, game_date)
+        if last_game is None:
+            # First game of season
+            return {
+                'team_days_rest': None,
+                'team_back_to_back': False,
+                'games_in_last_7_days': 0,
+                'games_in_last_14_days': 0,
+                'is_back_to_back': False,
+                'days_since_last_game': None,
+                'game_number_in_season': 1
+            }
+
+        days_since = (pd.Timestamp(game_date).date() - last_game['game_date']).days
+        is_b2b = days_since == 1
+
+        return {
+            'team_days_rest': int(days_since - 1),
+            'team_back_to_back': bool(is_b2b),
+            'games_in_last_7_days': self.engine.games_between(team_abbr, game_date - timedelta(days=7), game_date),
+            'games_in_last_14_days': self.engine.games_between(team_abbr, game_date - timedelta(days=14), game_date),
+            'is_back_to_back': bool(is_b2b),
+            'days_since_last_game': int(days_since),
+            'game_number_in_season': last_game['games_played'] + 1
+        }
@@ -8,7 +8,9 @@ Extracted from upcoming_team_game_context_processor.py for maintainability.
 
 import logging
 import pandas as pd
-from typing import Dict
+from typing import Dict, Optional
+
+from data_processors.analytics.utils.travel_engine import ScheduleTravelEngine, travel_engine_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,9 @@ class TravelCalculator:
 
     Calculates:
     - Travel miles between games
+
+    Previous game locations come from a ScheduleTravelEngine built once over
+    schedule_data (TRAVEL_ENGINE=query scans the schedule per game instead).
     """
 
     def __init__(self, schedule_data: pd.DataFrame, travel_distances: dict):
@@ -31,6 +36,14 @@ class TravelCalculator:
         """
         self.schedule_data = schedule_data
         self.travel_distances = travel_distances
+        self._engine: Optional[ScheduleTravelEngine] = None
+
+    @property
+    def engine(self) -> ScheduleTravelEngine:
+        """Season pass over schedule_data (built on first use)."""
+        if self._engine is None:
+            self._engine = ScheduleTravelEngine(self.schedule_data)
+        return self._engine
 
     def calculate_travel_context(
         self,
@@ -58,6 +71,28 @@ class TravelCalculator:
         # For away games, need last opponent location
         game_date = game['game_date']
 
+        if travel_engine_enabled():
+            last_game = self.engine.last_game_before(team_abbr, game_date)
+            if last_game is None:
+                return {'travel_miles': 0}
+            # Home team of the last game = where the team was
+            last_location = last_game['location']
+        else:
+            last_location = self._last_location_scan(team_abbr, game_date)
+            if last_location is None:
+                return {'travel_miles': 0}
+
+        # Current game location (opponent's arena for away game)
+        current_location = game['home_team_abbr']
+
+        # Lookup travel distance
+        travel_key = f"{last_location}_{current_location}"
+        travel_miles = self.travel_distances.get(travel_key, 0)
+
+        return {'travel_miles': int(travel_miles)}
+
+    def _last_location_scan(self, team_abbr: str, game_date) -> Optional[str]:
+        """Previous game location by filtering the schedule (TRAVEL_ENGINE=query)."""
         team_games = self.schedule_data[
             (
                 (self.schedule_data['home_team_abbr'] == team_abbr) |
@@ -67,20 +102,10 @@ class TravelCalculator:
         ].sort_values('game_date')
 
         if len(team_games) == 0:
-            return {'travel_miles': 0}
+            return None
 
         # Last game location
         last_game = team_games.iloc[-1]
         if last_game['home_team_abbr'] == team_abbr:
-            last_location = team_abbr  # Was at home
-        else:
-            last_location = last_game['home_team_abbr']  # Was at opponent's arena
-
-        # Current game location (opponent's arena for away game)
-        current_location = game['home_team_abbr']
-
-        # Lookup travel distance
-        travel_key = f"{last_location}_{current_location}"
-        travel_miles = self.travel_distances.get(travel_key, 0)
-
-        return {'travel_miles': int(travel_miles)}
+            return team_abbr  # Was at home
+        return last_game['home_team_abbr']  # Was at opponent's arena
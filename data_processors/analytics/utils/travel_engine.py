@@ -0,0 +1,351 @@
+"""
+File: data_processors/analytics/utils/travel_engine.py
+
+NBA Travel Engine
+Static team-to-team travel matrix plus a season pass over the schedule
+
+Two parts:
+
+1. Bundled distance / time zone matrix, indexed by team (TEAM_INDEX).
+   Built from the same arena coordinates and rules as
+   scripts/generate_travel_distances.py (the source of the
+   nba_enriched.travel_distances table), so matrix_travel() returns the
+   table's values without a BigQuery round trip.
+
+2. ScheduleTravelEngine: one pass over a loaded schedule computes, for every
+   team-game, the travel leg from the previous game, days of rest,
+   back-to-backs, road-trip length and rolling miles / time zones. Lookups
+   for any team and date are then array reads:
+
+       engine = ScheduleTravelEngine(schedule_df, start_date=start, end_date=end)
+       engine.travel_last_n_days('LAL', date(2025, 1, 15), days=14)
+       engine.last_game_before('LAL', date(2025, 1, 15))
+       engine.context('LAL', date(2025, 1, 15))
+
+Set TRAVEL_ENGINE=query to keep the per-pair / per-team BigQuery lookups.
+"""
+
+import math
+import os
+from datetime import date, timedelta
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Standard-time UTC offsets (same table as scripts/generate_travel_distances.py)
+TIMEZONE_OFFSETS = {
+    'America/New_York': -5,
+    'America/Chicago': -6,
+    'America/Denver': -7,
+    'America/Los_Angeles': -8,
+    'America/Phoenix': -7,  # Arizona doesn't observe DST
+    'America/Toronto': -5,
+}
+
+# Arena (latitude, longitude, timezone) per team (scripts/team_locations.json)
+TEAM_ARENAS = {
+    'ATL': (33.7573, -84.3963, 'America/New_York'),
+    'BOS': (42.3662, -71.0621, 'America/New_York'),
+    'BKN': (40.6826, -73.9754, 'America/New_York'),
+    'CHA': (35.2251, -80.8392, 'America/New_York'),
+    'CHI': (41.8807, -87.6742, 'America/Chicago'),
+    'CLE': (41.4965, -81.6882, 'America/New_York'),
+    'DAL': (32.7906, -96.8103, 'America/Chicago'),
+    'DEN': (39.7487, -105.0077, 'America/Denver'),
+    'DET': (42.3411, -83.0553, 'America/New_York'),
+    'GSW': (37.7679, -122.3873, 'America/Los_Angeles'),
+    'HOU': (29.6807, -95.3615, 'America/Chicago'),
+    'IND': (39.7640, -86.1555, 'America/New_York'),
+    'LAC': (34.0430, -118.2673, 'America/Los_Angeles'),
+    'LAL': (34.0430, -118.2673, 'America/Los_Angeles'),
+    'MEM': (35.1382, -90.0505, 'America/Chicago'),
+    'MIA': (25.7814, -80.1870, 'America/New_York'),
+    'MIL': (43.0435, -87.9167, 'America/Chicago'),
+    'MIN': (44.9795, -93.2760, 'America/Chicago'),
+    'NOP': (29.9490, -90.0821, 'America/Chicago'),
+    'NYK': (40.7505, -73.9934, 'America/New_York'),
+    'OKC': (35.4634, -97.5151, 'America/Chicago'),
+    'ORL': (28.5392, -81.3839, 'America/New_York'),
+    'PHI': (39.9012, -75.1720, 'America/New_York'),
+    'PHX': (33.4457, -112.0712, 'America/Phoenix'),
+    'POR': (45.5316, -122.6668, 'America/Los_Angeles'),
+    'SAC': (38.5816, -121.4999, 'America/Los_Angeles'),
+    'SAS': (29.4270, -98.4375, 'America/Chicago'),
+    'TOR': (43.6434, -79.3791, 'America/Toronto'),
+    'UTA': (40.7683, -111.9011, 'America/Denver'),
+    'WAS': (38.8981, -77.0209, 'America/New_York'),
+}
+
+TEAMS = tuple(TEAM_ARENAS)
+TEAM_INDEX = {team: i for i, team in enumerate(TEAMS)}
+
+EARTH_RADIUS_MILES = 3959
+
+
+def travel_engine_enabled() -> bool:
+    """Return False when TRAVEL_ENGINE=query (per-pair / per-team BigQuery lookups)."""
+    return os.environ.get('TRAVEL_ENGINE', 'matrix').lower() != 'query'
+
+
+def _haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> int:
+    """Great circle distance in miles, rounded (generate_travel_distances.haversine_distance)."""
+    if lat1 == lat2 and lon1 == lon2:
+        return 0
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return round(2 * math.asin(math.sqrt(a)) * EARTH_RADIUS_MILES)
+
+
+def _build_matrices() -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    n = len(TEAMS)
+    distance = np.zeros((n, n), dtype=np.int64)
+    zones = np.zeros((n, n), dtype=np.int64)
+    jet_lag = np.zeros((n, n), dtype=np.float64)
+    direction = np.full((n, n), 'neutral', dtype=object)
+
+    for i, from_team in enumerate(TEAMS):
+        from_lat, from_lon, from_tz = TEAM_ARENAS[from_team]
+        for j, to_team in enumerate(TEAMS):
+            if i == j:
+                continue
+            to_lat, to_lon, to_tz = TEAM_ARENAS[to_team]
+            distance[i, j] = _haversine_miles(from_lat, from_lon, to_lat, to_lon)
+
+            from_offset = TIMEZONE_OFFSETS.get(from_tz, 0)
+            to_offset = TIMEZONE_OFFSETS.get(to_tz, 0)
+            crossed = abs(from_offset - to_offset)
+            if crossed:
+                zones[i, j] = crossed
+                # Same labels and weights as the travel_distances table
+                if from_offset > to_offset:
+                    direction[i, j], jet_lag[i, j] = 'east', round(crossed * 1.5, 1)
+                else:
+                    direction[i, j], jet_lag[i, j] = 'west', round(crossed * 1.0, 1)
+
+    for matrix in (distance, zones, jet_lag, direction):
+        matrix.setflags(write=False)
+    return distance, zones, jet_lag, direction
+
+
+DISTANCE_MILES, TIME_ZONES_CROSSED, JET_LAG_FACTOR, TRAVEL_DIRECTION = _build_matrices()
+
+
+def matrix_travel(from_team: str, to_team: str) -> Optional[Dict]:
+    """
+    Travel between two NBA arenas from the bundled matrix.
+
+    Same shape as NBATravel.get_travel_distance for a table hit; None when
+    either team is not in the matrix (e.g. international venues).
+    """
+    i = TEAM_INDEX.get(from_team)
+    j = TEAM_INDEX.get(to_team)
+    if i is None or j is None:
+        return None
+    return {
+        'distance_miles': int(DISTANCE_MILES[i, j]),
+        'time_zones_crossed': int(TIME_ZONES_CROSSED[i, j]),
+        'travel_direction': TRAVEL_DIRECTION[i, j],
+        'jet_lag_factor': float(JET_LAG_FACTOR[i, j]),
+        'query_status': 'success',
+    }
+
+
+def _day(value) -> int:
+    """Days since epoch for a date, datetime, Timestamp or ISO string."""
+    return int(np.datetime64(pd.Timestamp(value).date(), 'D').astype(np.int64))
+
+
+def _date(day: int) -> date:
+    return date(1970, 1, 1) + timedelta(days=int(day))
+
+
+class ScheduleTravelEngine:
+    """
+    Per team-game travel and rest metrics from one schedule load.
+
+    Every game contributes one row per team (home and away). Rows are sorted
+    by (team, date) so each team's season is a contiguous slice, and all
+    lookups are binary searches into that slice.
+    """
+
+    WINDOWS = (7, 14)
+
+    def __init__(
+        self,
+        schedule: pd.DataFrame,
+        home_col: str = 'home_team_abbr',
+        away_col: str = 'away_team_abbr',
+        date_col: str = 'game_date',
+        start_date=None,
+        end_date=None,
+        windows: Tuple[int, ...] = WINDOWS,
+    ):
+        self.windows = tuple(windows)
+
+        if schedule is None or schedule.empty:
+            home = away = np.array([], dtype=object)
+            days = np.array([], dtype=np.int64)
+        else:
+            home = schedule[home_col].to_numpy(dtype=object)
+            away = schedule[away_col].to_numpy(dtype=object)
+            days = (pd.to_datetime(schedule[date_col]).to_numpy()
+                    .astype('datetime64[D]').astype(np.int64))
+
+        # One row per team per game; the game is played at the home arena
+        team = np.concatenate([home, away])
+        location = np.concatenate([home, home])
+        is_home = np.concatenate([np.ones(len(home), dtype=bool), np.zeros(len(away), dtype=bool)])
+        day = np.concatenate([days, days])
+
+        valid = np.fromiter((isinstance(t, str) for t in team), dtype=bool, count=len(team))
+        team, location, is_home, day = team[valid], location[valid], is_home[valid], day[valid]
+
+        self.team_names = sorted(set(team.tolist()))
+        self._team_code = {name: code for code, name in enumerate(self.team_names)}
+        code = np.fromiter((self._team_code[t] for t in team), dtype=np.int64, count=len(team))
+
+        order = np.lexsort((day, code))  # stable: schedule order breaks same-day ties
+        self.code = code[order]
+        self.day = day[order]
+        self.location = location[order]
+        self.is_home = is_home[order]
+        self.size = len(self.day)
+        self._keys = (self.code << 32) + self.day
+
+        self._compute_legs()
+        self._compute_streaks()
+        self._compute_windows()
+
+        self.start_day = _day(start_date) if start_date is not None else (
+            int(self.day.min()) if self.size else 0)
+        self.end_day = _day(end_date) if end_date is not None else (
+            int(self.day.max()) if self.size else -1)
+
+        self._index = {(self.team_names[c], d): i for i, (c, d) in
+                       enumerate(zip(self.code.tolist(), self.day.tolist()))}
+
+    # ------------------------------------------------------------------
+    # Season pass
+    # ------------------------------------------------------------------
+
+    def _compute_legs(self) -> None:
+        n = self.size
+        idx = np.arange(n)
+        self.first_game = np.ones(n, dtype=bool)
+        self.first_game[1:] = self.code[1:] != self.code[:-1]
+
+        loc_idx = np.fromiter((TEAM_INDEX.get(loc, -1) for loc in self.location), dtype=np.int64, count=n)
+        prev_idx = np.where(self.first_game, -1, np.roll(loc_idx, 1))
+        known = (prev_idx >= 0) & (loc_idx >= 0)
+        i, j = np.where(known, prev_idx, 0), np.where(known, loc_idx, 0)
+
+        self.leg_miles = np.where(known, DISTANCE_MILES[i, j], 0)
+        self.leg_zones = np.where(known, TIME_ZONES_CROSSED[i, j], 0)
+        self.leg_jet_lag = np.where(known, JET_LAG_FACTOR[i, j], 0.0)
+        self.days_since_prev = np.where(self.first_game, -1, self.day - np.roll(self.day, 1))
+        self.game_number = idx - np.maximum.accumulate(np.where(self.first_game, idx, 0)) + 1
+
+        self._cum_miles = np.cumsum(self.leg_miles)
+        self._cum_zones = np.cumsum(self.leg_zones)
+        self._cum_jet_lag = np.cumsum(self.leg_jet_lag)
+
+    def _compute_streaks(self) -> None:
+        # Consecutive away games ending at each game (0 for a home game)
+        idx = np.arange(self.size)
+        group_start = np.maximum.accumulate(np.where(self.first_game, idx, 0))
+        last_home = np.maximum.accumulate(np.where(self.is_home, idx, group_start - 1))
+        self.road_trip_length = idx - last_home
+
+    def _compute_windows(self) -> None:
+        # Games in [day - w, day]; legs counted from the second game in the window
+        self.window_miles = {}
+        self.window_zones = {}
+        self.window_games = {}
+        idx = np.arange(self.size)
+        for w in self.windows:
+            lo = np.searchsorted(self._keys, self._keys - w, side='left')
+            self.window_games[w] = idx - lo + 1
+            self.window_miles[w] = self._cum_miles - self._cum_miles[lo]
+            self.window_zones[w] = self._cum_zones - self._cum_zones[lo]
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def covers(self, start, end) -> bool:
+        """True if [start, end] lies inside the loaded schedule range."""
+        return self.start_day <= _day(start) and _day(end) <= self.end_day
+
+    def _range(self, team: str, start_day: int, end_day: int) -> Tuple[int, int]:
+        """Row range [lo, hi) of the team's games with start_day <= day <= end_day."""
+        code = self._team_code.get(team)
+        if code is None or end_day < start_day:
+            return 0, 0
+        base = code << 32
+        lo = int(np.searchsorted(self._keys, base + start_day, side='left'))
+        hi = int(np.searchsorted(self._keys, base + end_day, side='right'))
+        return lo, hi
+
+    def travel_last_n_days(self, team_abbr: str, current_date, days: int = 14) -> Dict:
+        """
+        Same result as NBATravel.get_travel_last_n_days for games in the
+        loaded schedule: travel between consecutive games in
+        [current_date - days, current_date].
+        """
+        end = _day(current_date)
+        lo, hi = self._range(team_abbr, end - days, end)
+        legs = slice(lo + 1, hi)
+        return {
+            f'miles_traveled_last_{days}_days': int(self.leg_miles[legs].sum()),
+            f'time_zones_crossed_last_{days}_days': int(self.leg_zones[legs].sum()),
+            f'jet_lag_factor_last_{days}_days': round(sum(self.leg_jet_lag[legs].tolist()), 2),
+            f'games_played_last_{days}_days': hi - lo,
+        }
+
+    def games_between(self, team_abbr: str, after, before) -> int:
+        """Number of the team's games with after < date < before."""
+        lo, hi = self._range(team_abbr, _day(after) + 1, _day(before) - 1)
+        return hi - lo
+
+    def last_game_before(self, team_abbr: str, game_date) -> Optional[Dict]:
+        """The team's most recent game strictly before game_date, or None."""
+        code = self._team_code.get(team_abbr)
+        if code is None:
+            return None
+        lo, hi = self._range(team_abbr, -(1 << 31), _day(game_date) - 1)
+        if hi == lo:
+            return None
+        i = hi - 1
+        return {
+            'game_date': _date(self.day[i]),
+            'location': self.location[i],
+            'is_home': bool(self.is_home[i]),
+            'games_played': int(self.game_number[i]),
+            'road_trip_length': int(self.road_trip_length[i]),
+        }
+
+    def context(self, team_abbr: str, game_date) -> Optional[Dict]:
+        """Precomputed travel and rest context for a team's game on game_date."""
+        i = self._index.get((team_abbr, _day(game_date)))
+        if i is None:
+            return None
+        days_since = int(self.days_since_prev[i])
+        context = {
+            'game_date': _date(self.day[i]),
+            'location': self.location[i],
+            'is_home': bool(self.is_home[i]),
+            'travel_miles': int(self.leg_miles[i]),
+            'time_zones_crossed': int(self.leg_zones[i]),
+            'jet_lag_factor': float(self.leg_jet_lag[i]),
+            'days_since_last_game': None if days_since < 0 else days_since,
+            'is_back_to_back': days_since == 1,
+            'road_trip_length': int(self.road_trip_length[i]),
+            'game_number_in_season': int(self.game_number[i]),
+        }
+        for w in self.windows:
+            context[f'miles_traveled_last_{w}_days'] = int(self.window_miles[w][i])
+            context[f'time_zones_crossed_last_{w}_days'] = int(self.window_zones[w][i])
+            context[f'games_played_last_{w}_days'] = int(self.window_games[w][i])
+        return context
@@ -12,6 +12,12 @@ from typing import Optional, Dict, List, Tuple
 import pandas as pd
 from datetime import datetime, timedelta
 
+from data_processors.analytics.utils.travel_engine import (
+    ScheduleTravelEngine,
+    matrix_travel,
+    travel_engine_enabled,
+)
+
 logger = logging.getLogger(__name__)
 
 class NBATravel:
@@ -23,6 +29,14 @@ class NBATravel:
         self._distance_cache = {}
         self._team_locations_cache = None
 
+        # Season pass over the schedule (see load_schedule_travel)
+        self._schedule_engine: Optional[ScheduleTravelEngine] = None
+
+    @property
+    def schedule_engine(self) -> Optional[ScheduleTravelEngine]:
+        """Engine from the last load_schedule_travel call, if any."""
+        return self._schedule_engine
+
     def get_travel_distance(self, from_team: str, to_team: str) -> Optional[Dict]:
         """
         Get travel information between two NBA teams
@@ -48,6 +62,13 @@ class NBATravel:
         if cache_key in self._distance_cache:
             return self._distance_cache[cache_key]
 
+        # NBA arena pairs come from the bundled matrix; other venues query the table
+        if travel_engine_enabled():
+            travel_info = matrix_travel(from_team, to_team)
+            if travel_info is not None:
+                self._distance_cache[cache_key] = travel_info
+                return travel_info
+
         query = f"""
         SELECT
             distance_miles,
@@ -163,12 +184,60 @@ class NBATravel:
             'number_of_trips': len(team_schedule)
         }
 
+    def load_schedule_travel(self, start_date, end_date) -> Optional[ScheduleTravelEngine]:
+        """
+        Load completed games for every team in [start_date, end_date] with one
+        query and build a ScheduleTravelEngine over them.
+
+        While loaded, get_travel_last_n_days answers windows inside the range
+        from the engine instead of querying the schedule per team and date.
+
+        Returns:
+            The engine, or None if the schedule query failed
+        """
+        query = f"""
+        SELECT
+            game_date,
+            home_team_tricode,
+            away_team_tricode
+        FROM `{self.project_id}.nba_raw.v_nbac_schedule_latest`
+        WHERE game_date BETWEEN @start_date AND @end_date
+          AND game_status = 3  -- Completed games only
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("start_date", "DATE", start_date.strftime('%Y-%m-%d')),
+                bigquery.ScalarQueryParameter("end_date", "DATE", end_date.strftime('%Y-%m-%d'))
+            ]
+        )
+
+        try:
+            df = self.client.query(query, job_config=job_config).to_dataframe()
+        except Exception as e:
+            logger.warning(f"Error loading schedule travel for {start_date} to {end_date}: {e}")
+            return None
+
+        self._schedule_engine = ScheduleTravelEngine(
+            df,
+            home_col='home_team_tricode',
+            away_col='away_team_tricode',
+            start_date=start_date,
+            end_date=end_date,
+        )
+        logger.info(
+            f"Loaded schedule travel for {start_date} to {end_date}: "
+            f"{len(df)} games, {len(self._schedule_engine.team_names)} teams"
+        )
+        return self._schedule_engine
+
     def get_travel_last_n_days(self, team_abbr: str, current_date: datetime, days: int = 14) -> Dict:
         """
         Calculate travel metrics for last N days (for fatigue analysis)
 
         Queries the schedule to get actual game locations and calculates
-        cumulative travel distance and timezone changes.
+        cumulative travel distance and timezone changes. Windows inside a
+        range loaded with load_schedule_travel are answered without a query.
 
         Args:
             team_abbr: Team abbreviation
@@ -180,6 +249,10 @@ class NBATravel:
         """
         start_date = current_date - timedelta(days=days)
 
+        engine = self._schedule_engine
+        if engine is not None and travel_engine_enabled() and engine.covers(start_date, current_date):
+            return engine.travel_last_n_days(team_abbr, current_date, days)
+
         # Query schedule for team's recent games
         query = f"""
         WITH team_games AS (
@@ -252,6 +325,67 @@ class NBATravel:
 
         return result
 
+    def get_road_trip_length(self, team_abbr: str, current_date: datetime, days: int = 30) -> int:
+        """
+        Consecutive road games the team played before current_date
+
+        Counts the team's completed games in [current_date - days, current_date)
+        back from the most recent one until a home game (0 if the last game
+        was at home). Windows inside a range loaded with load_schedule_travel
+        are answered without a query.
+
+        Args:
+            team_abbr: Team abbreviation
+            current_date: Current date (its own game is not counted)
+            days: Number of days to look back
+
+        Returns:
+            Road-trip length at the team's previous game
+        """
+        start_date = current_date - timedelta(days=days)
+
+        engine = self._schedule_engine
+        if engine is not None and travel_engine_enabled() and engine.covers(start_date, current_date):
+            last_game = engine.last_game_before(team_abbr, current_date)
+            return last_game['road_trip_length'] if last_game else 0
+
+        query = f"""
+        SELECT
+            game_date,
+            CASE
+                WHEN home_team_tricode = @team_abbr THEN 'HOME'
+                ELSE 'AWAY'
+            END AS home_away
+        FROM `{self.project_id}.nba_raw.v_nbac_schedule_latest`
+        WHERE (home_team_tricode = @team_abbr OR away_team_tricode = @team_abbr)
+          AND game_date BETWEEN @start_date AND @end_date
+          AND game_status = 3  -- Completed games only
+        ORDER BY game_date
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("team_abbr", "STRING", team_abbr),
+                bigquery.ScalarQueryParameter("start_date", "DATE", start_date.strftime('%Y-%m-%d')),
+                bigquery.ScalarQueryParameter(
+                    "end_date", "DATE", (current_date - timedelta(days=1)).strftime('%Y-%m-%d')
+                )
+            ]
+        )
+
+        try:
+            df = self.client.query(query, job_config=job_config).to_dataframe()
+        except Exception as e:
+            logger.warning(f"Error calculating road trip for {team_abbr} before {current_date}: {e}")
+            return 0
+
+        road_games = 0
+        for home_away in reversed(df['home_away'].tolist() if not df.empty else []):
+            if home_away != 'AWAY':
+                break
+            road_games += 1
+        return road_games
+
     def estimate_international_distance(self, from_team: str, international_city: str) -> int:
         """
         Rough estimate for international games (NBA Global Games, etc.)
@@ -0,0 +1,422 @@
+"""
+Grading Engine (Phase 5B)
+
+Whole-frame version of PredictionAccuracyProcessor.grade_prediction().
+
+Predictions are joined to actuals on (game_date, player_lookup) once, and
+errors, margins, OVER/UNDER correctness, confidence deciles and DNP voiding
+are computed as array operations. Records come out identical to the
+per-record path after _sanitize_record() (graded_at aside, which is one
+timestamp per batch). Rounding goes through Python's round() on Python
+floats, not np.round, which disagrees on ties like 2.675.
+
+Missing values follow the BigQuery frame: NULL NUMERIC/STRING/BOOL columns
+arrive as None and NULL FLOAT64 as NaN, and both are treated as None (a pick
+without a line is not graded, a missing predicted_points has no within_N).
+
+The same pass produces the process_date summary stats. Subset grading and
+SystemDailyPerformanceProcessor still aggregate the written
+prediction_accuracy rows themselves.
+
+Set GRADING_ENGINE=scalar to grade one record at a time (A/B checks).
+"""
+
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+VOID_CONFIRMED_STATUSES = ('OUT', 'DOUBTFUL')
+VOID_LATE_SCRATCH_STATUSES = ('QUESTIONABLE', 'PROBABLE')
+UNGRADEABLE_RECOMMENDATIONS = ('PASS', 'HOLD', 'NO_LINE')
+
+# Columns kept on GradedFrame.frame for rollups (stored, rounded values)
+ROLLUP_COLUMNS = [
+    'game_date', 'system_id', 'recommendation', 'confidence_score',
+    'absolute_error', 'signed_error', 'prediction_correct',
+    'within_3_points', 'within_5_points', 'is_voided', 'void_reason',
+]
+
+
+def vectorized_grading_enabled() -> bool:
+    """Whether process_date should use grade_frame() (default) or grade_prediction()."""
+    return os.environ.get('GRADING_ENGINE', 'vectorized').lower() != 'scalar'
+
+
+def _column(df: pd.DataFrame, name: str, default: Any = None) -> pd.Series:
+    """df[name], or all-default when absent (mirrors dict.get(name, default))."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series([default] * len(df), index=df.index, dtype=object)
+
+
+def _floats(series: pd.Series) -> np.ndarray:
+    """Float64 values; None/NA become NaN."""
+    try:
+        return series.astype(float).to_numpy()
+    except (TypeError, ValueError):
+        return pd.to_numeric(series, errors='coerce').astype(float).to_numpy()
+
+
+def _present(series: pd.Series) -> np.ndarray:
+    """Not None/NA/NaN."""
+    return series.notna().to_numpy()
+
+
+def _isin(values: np.ndarray, options: tuple) -> np.ndarray:
+    """Elementwise membership for object arrays that may hold None."""
+    return pd.Series(values, dtype=object).isin(options).to_numpy()
+
+
+def _objects(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Object array holding values.tolist() where mask, None elsewhere."""
+    out = np.full(len(mask), None, dtype=object)
+    if mask.any():
+        out[mask] = values[mask].tolist()
+    return out
+
+
+def _rounded(values: np.ndarray, decimals: int) -> np.ndarray:
+    """round(float(v), decimals) per finite value (Python rounding), None otherwise."""
+    mask = np.isfinite(values)
+    out = np.full(len(values), None, dtype=object)
+    if mask.any():
+        out[mask] = [round(v, decimals) for v in values[mask].tolist()]
+    return out
+
+
+def _cached_map(series: pd.Series, fn: Callable[[Any], Any]) -> List[Any]:
+    """fn(v) per element, evaluated once per distinct value."""
+    cache: Dict[Any, Any] = {}
+    out = []
+    for value in series.tolist():
+        try:
+            result = cache[value]
+        except KeyError:
+            result = cache[value] = fn(value)
+        except TypeError:  # unhashable
+            result = fn(value)
+        out.append(result)
+    return out
+
+
+def _strings(series: pd.Series, safe_string: Callable[[Any], Optional[str]]) -> List[Optional[str]]:
+    """safe_string per element; NaN/NA (None after a frame round-trip) stay None."""
+    return _cached_map(series.astype(object).where(series.notna(), None), safe_string)
+
+
+def _iso_date(value: Any) -> str:
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+
+@dataclass
+class GradedFrame:
+    """Output of grade_frame()."""
+    records: List[Dict] = field(default_factory=list)
+    frame: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(columns=ROLLUP_COLUMNS))
+    predictions_found: int = 0
+    missing_actuals: int = 0
+    null_actuals: int = 0
+
+
+def normalize_actuals(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Column version of the per-row cleanup in get_actuals_for_date().
+
+    actual_points -> int or None, team columns -> value or None,
+    minutes_played -> _safe_float(), is_dnp -> bool (missing = False).
+    """
+    out = pd.DataFrame(index=df.index)
+    if 'game_date' in df.columns:
+        out['game_date'] = _cached_map(df['game_date'], _iso_date)
+    out['player_lookup'] = df['player_lookup'].to_numpy(dtype=object)
+
+    points = _column(df, 'actual_points')
+    out['actual_points'] = pd.Series(
+        [int(v) if ok else None for v, ok in zip(points.tolist(), _present(points).tolist())],
+        index=df.index, dtype=object,
+    )
+    for name in ('team_abbr', 'opponent_team_abbr'):
+        values = _column(df, name)
+        out[name] = _objects(values.to_numpy(dtype=object), _present(values))
+    minutes = _floats(_column(df, 'minutes_played'))
+    out['minutes_played'] = _objects(minutes, np.isfinite(minutes))
+    is_dnp = _column(df, 'is_dnp')
+    out['is_dnp'] = np.where(_present(is_dnp), is_dnp.to_numpy(dtype=object), False).astype(bool)
+    return out
+
+
+def _void_columns(
+    dnp: np.ndarray,
+    captured: np.ndarray,
+    captured_status: np.ndarray,
+    captured_flag: np.ndarray,
+    retro_status: np.ndarray,
+    retro_found: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Vectorized detect_dnp_voiding() over DNP rows (non-DNP rows keep the defaults)."""
+    n = len(dnp)
+    reason = np.full(n, None, dtype=object)
+    pre_flag = np.zeros(n, dtype=bool)
+    pre_status = np.full(n, None, dtype=object)
+    confirmed = np.zeros(n, dtype=bool)
+
+    # Captured at prediction time (v3.4)
+    cap = dnp & captured
+    flagged = cap & captured_flag
+    cap_out = flagged & _isin(captured_status, VOID_CONFIRMED_STATUSES)
+    cap_late = flagged & _isin(captured_status, VOID_LATE_SCRATCH_STATUSES)
+    pre_status[cap] = captured_status[cap]
+    pre_flag[flagged] = True
+    reason[cap] = 'dnp_unknown'
+    reason[cap_out] = 'dnp_injury_confirmed'
+    reason[cap_late] = 'dnp_late_scratch'
+    confirmed[cap_out | cap_late] = True
+
+    # Retroactive injury report lookup
+    retro = dnp & ~captured
+    found = retro & retro_found
+    retro_out = found & _isin(retro_status, VOID_CONFIRMED_STATUSES)
+    retro_late = found & _isin(retro_status, VOID_LATE_SCRATCH_STATUSES)
+    pre_status[found] = retro_status[found]
+    reason[retro] = 'dnp_unknown'
+    reason[retro_out] = 'dnp_injury_confirmed'
+    reason[retro_late] = 'dnp_late_scratch'
+    pre_flag[retro_out | retro_late] = True
+    confirmed[retro_out | retro_late] = True
+
+    return {
+        'is_voided': dnp.copy(),
+        'void_reason': reason,
+        'pre_game_injury_flag': pre_flag,
+        'pre_game_injury_status': pre_status,
+        'injury_confirmed_postgame': confirmed,
+    }
+
+
+def grade_frame(
+    processor,
+    predictions: pd.DataFrame,
+    actuals: pd.DataFrame,
+    injury_lookup: Callable[[str, str], Optional[Dict]],
+    graded_at: Optional[str] = None,
+) -> GradedFrame:
+    """
+    Grade every prediction in one pass.
+
+    Args:
+        processor: PredictionAccuracyProcessor (string sanitizer)
+        predictions: Rows as returned by the predictions query (any game dates)
+        actuals: normalize_actuals() output (with game_date for multi-date input)
+        injury_lookup: (player_lookup, game_date_iso) -> injury info or None,
+            called only for DNP rows without captured injury status
+        graded_at: ISO timestamp for every record (default: now)
+
+    Returns:
+        GradedFrame with records in prediction order (rows without actuals
+        dropped, as in process_date) and the rollup frame.
+    """
+    graded_at = graded_at or datetime.now(timezone.utc).isoformat()
+    result = GradedFrame(predictions_found=len(predictions))
+    if predictions.empty:
+        return result
+
+    preds = predictions.reset_index(drop=True)
+    date_iso = pd.Series(_cached_map(preds['game_date'], _iso_date), index=preds.index)
+
+    # Join: last actuals row per key wins, like the dict build. Actuals for a
+    # single date (process_date) carry no game_date and join on player only.
+    if 'game_date' in actuals.columns:
+        acts = actuals.drop_duplicates(['game_date', 'player_lookup'], keep='last')
+        keys = pd.MultiIndex.from_arrays([acts['game_date'], acts['player_lookup']])
+        position = keys.get_indexer(pd.MultiIndex.from_arrays([date_iso, preds['player_lookup']]))
+    else:
+        acts = actuals.drop_duplicates('player_lookup', keep='last')
+        position = pd.Index(acts['player_lookup']).get_indexer(preds['player_lookup'])
+    has_actual = position >= 0
+    result.missing_actuals = int((~has_actual).sum())
+    if not has_actual.any():
+        return result
+
+    preds = preds[has_actual].reset_index(drop=True)
+    date_iso = date_iso[has_actual].reset_index(drop=True)
+    act = acts.iloc[position[has_actual]].reset_index(drop=True)
+    n = len(preds)
+
+    actual_ok = pd.notna(act['actual_points']).to_numpy()
+    actual = _floats(act['actual_points'])
+    result.null_actuals = int((~actual_ok).sum())
+    minutes = _floats(act['minutes_played'])
+    is_dnp = act['is_dnp'].to_numpy(dtype=bool)
+
+    predicted = _floats(preds['predicted_points'])
+    predicted_ok = _present(preds['predicted_points'])
+    line = _floats(_column(preds, 'line_value'))
+    line_ok = _present(_column(preds, 'line_value'))
+    recommendation = _column(preds, 'recommendation').to_numpy(dtype=object)
+    confidence = _floats(_column(preds, 'confidence_score'))
+
+    # --- DNP voiding (v4) ---
+    dnp = is_dnp | (actual_ok & (actual == 0) & (~np.isfinite(minutes) | (minutes == 0))) | ~actual_ok
+
+    status_col = _column(preds, 'injury_status_at_prediction')
+    flag_col = _column(preds, 'injury_flag_at_prediction')
+    captured = _present(status_col) | _present(flag_col)
+    captured_status = np.array(
+        _cached_map(status_col, lambda s: s.upper() if isinstance(s, str) and s else None),
+        dtype=object,
+    )
+    captured_flag = np.where(_present(flag_col), flag_col.to_numpy(dtype=object), False).astype(bool)
+
+    retro_status = np.full(n, None, dtype=object)
+    retro_found = np.zeros(n, dtype=bool)
+    retro_rows = np.flatnonzero(dnp & ~captured)
+    if len(retro_rows):
+        lookups = preds['player_lookup'].to_numpy(dtype=object)
+        infos: Dict[tuple, Optional[Dict]] = {}
+        for i in retro_rows:
+            key = (lookups[i], date_iso.iat[i])
+            if key not in infos:
+                infos[key] = injury_lookup(*key)
+            info = infos[key]
+            if info:
+                retro_found[i] = True
+                retro_status[i] = (info.get('injury_status') or '').upper()
+
+    void = _void_columns(dnp, captured, captured_status, captured_flag, retro_status, retro_found)
+
+    # --- Errors and margins ---
+    both = predicted_ok & actual_ok
+    signed_error = predicted - actual
+    absolute_error = np.abs(signed_error)
+    within_3 = _objects(absolute_error <= 3.0, both)
+    within_5 = _objects(absolute_error <= 5.0, both)
+    predicted_margin = np.where(predicted_ok & line_ok, predicted - line, np.nan)
+    actual_margin = np.where(line_ok & actual_ok, actual - line, np.nan)
+
+    # --- OVER/UNDER correctness ---
+    rec_ok = pd.notna(recommendation) & ~_isin(recommendation, UNGRADEABLE_RECOMMENDATIONS)
+    evaluable = ~void['is_voided'] & actual_ok & rec_ok
+    decided = evaluable & line_ok & (actual != line)
+    went_over = actual > line
+    prediction_correct = _objects(went_over == (recommendation == 'OVER'), decided)
+
+    # --- Confidence (0-100 -> 0-1) and deciles ---
+    normalized = np.where(confidence > 1, confidence / 100.0, confidence)
+    confidence_ok = ~np.isnan(normalized)
+    decile = _objects(
+        np.minimum(10, np.trunc(np.where(confidence_ok, normalized, 0) * 10).astype(np.int64) + 1),
+        confidence_ok,
+    )
+
+    similarity = _floats(_column(preds, 'similarity_sample_size'))
+    similarity_ok = ~np.isnan(similarity)
+    quality = _floats(_column(preds, 'feature_quality_score'))
+    quality_tier = np.full(n, None, dtype=object)
+    quality_ok = ~np.isnan(quality)
+    quality_tier[quality_ok] = np.where(
+        quality[quality_ok] >= 80, 'HIGH', np.where(quality[quality_ok] >= 70, 'MEDIUM', 'LOW')
+    )
+
+    has_prop_line = _column(preds, 'has_prop_line', True)
+    is_actionable = _column(preds, 'is_actionable', True)
+    safe_string = processor._safe_string
+
+    columns = {
+        'player_lookup': _strings(preds['player_lookup'], safe_string),
+        'game_id': _strings(preds['game_id'], safe_string),
+        'game_date': date_iso.tolist(),
+        'system_id': _strings(preds['system_id'], safe_string),
+        'team_abbr': _strings(act['team_abbr'], safe_string),
+        'opponent_team_abbr': _strings(act['opponent_team_abbr'], safe_string),
+        'predicted_points': _rounded(predicted, 2),
+        'confidence_score': _rounded(normalized, 4),
+        'confidence_decile': decile,
+        'recommendation': _strings(pd.Series(recommendation), safe_string),
+        'line_value': _rounded(line, 2),
+        'referee_adjustment': [None] * n,
+        'pace_adjustment': _rounded(_floats(_column(preds, 'pace_adjustment')), 4),
+        'similarity_sample_size': _objects(
+            np.trunc(np.where(similarity_ok, similarity, 0)).astype(np.int64), similarity_ok
+        ),
+        'actual_points': act['actual_points'].tolist(),
+        'minutes_played': _objects(minutes, np.isfinite(minutes)),
+        'absolute_error': _rounded(absolute_error, 2),
+        'signed_error': _rounded(signed_error, 2),
+        'prediction_correct': prediction_correct,
+        'predicted_margin': _rounded(predicted_margin, 2),
+        'actual_margin': _rounded(actual_margin, 2),
+        'within_3_points': within_3,
+        'within_5_points': within_5,
+        'has_prop_line': np.where(_present(has_prop_line), has_prop_line.to_numpy(dtype=object), True).astype(bool),
+        'line_source': _strings(_column(preds, 'line_source', 'ACTUAL_PROP'), safe_string),
+        'estimated_line_value': _rounded(_floats(_column(preds, 'estimated_line_value')), 1),
+        'line_bookmaker': _strings(_column(preds, 'sportsbook'), safe_string),
+        'line_source_api': _strings(_column(preds, 'line_source_api'), safe_string),
+        'is_actionable': np.where(_present(is_actionable), is_actionable.to_numpy(dtype=object), True).astype(bool),
+        'filter_reason': _strings(_column(preds, 'filter_reason'), safe_string),
+        'feature_quality_score': _rounded(quality, 2),
+        'data_quality_tier': quality_tier,
+        'is_voided': void['is_voided'],
+        'void_reason': void['void_reason'],
+        'pre_game_injury_flag': void['pre_game_injury_flag'],
+        'pre_game_injury_status': void['pre_game_injury_status'],
+        'injury_confirmed_postgame': void['injury_confirmed_postgame'],
+        'model_version': _strings(_column(preds, 'model_version'), safe_string),
+    }
+
+    names = list(columns)
+    values = [c.tolist() if isinstance(c, np.ndarray) else c for c in columns.values()]
+    records = [dict(zip(names, row)) for row in zip(*values)]
+    for record in records:
+        record['graded_at'] = graded_at
+
+    frame = pd.DataFrame({name: columns[name] for name in ROLLUP_COLUMNS})
+
+    result.records = records
+    result.frame = frame
+    return result
+
+
+def _non_null(series: pd.Series) -> List[float]:
+    return [float(v) for v in series.tolist() if v is not None and v == v]
+
+
+def _mean(values: List[float]) -> Optional[float]:
+    return sum(values) / len(values) if values else None
+
+
+def summarize_graded(frame: pd.DataFrame) -> Dict[str, Any]:
+    """process_date() summary statistics over graded rows."""
+    if frame.empty:
+        return {
+            'mae': None, 'bias': None, 'accuracy': None,
+            'voided_count': 0, 'voided_injury': 0, 'voided_scratch': 0,
+            'voided_unknown': 0, 'net_accuracy': None,
+        }
+
+    correct = (frame['prediction_correct'] == True).to_numpy()  # noqa: E712 (None-safe)
+    incorrect = (frame['prediction_correct'] == False).to_numpy()  # noqa: E712
+    voided = frame['is_voided'].fillna(False).to_numpy(dtype=bool)
+    reason = frame['void_reason']
+
+    decided = correct.sum() + incorrect.sum()
+    net_correct = (correct & ~voided).sum()
+    net_decided = net_correct + (incorrect & ~voided).sum()
+
+    return {
+        'mae': _mean(_non_null(frame['absolute_error'])),
+        'bias': _mean(_non_null(frame['signed_error'])),
+        'accuracy': correct.sum() / decided if decided > 0 else None,
+        'voided_count': int(voided.sum()),
+        'voided_injury': int((reason == 'dnp_injury_confirmed').sum()),
+        'voided_scratch': int((reason == 'dnp_late_scratch').sum()),
+        'voided_unknown': int((reason == 'dnp_unknown').sum()),
+        'net_accuracy': net_correct / net_decided if net_decided > 0 else None,
+    }
@@ -27,8 +27,9 @@ import logging
 import math
 import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 from google.cloud import bigquery
@@ -42,6 +43,14 @@ from predictions.shared.distributed_lock import DistributedLock, LockAcquisition
 # Standardized error handling utility
 from shared.utils.error_context import ErrorContext, log_operation_error
 
+from data_processors.grading.prediction_accuracy.grading_engine import (
+    ROLLUP_COLUMNS,
+    grade_frame,
+    normalize_actuals,
+    summarize_graded,
+    vectorized_grading_enabled,
+)
+
 logger = logging.getLogger(__name__)
 
 from shared.config.gcp_config import get_project_id
@@ -305,24 +314,23 @@ class PredictionAccuracyProcessor:
         except (TypeError, ValueError):
             return None
 
-    def load_injury_status_for_date(self, game_date: date) -> Dict[str, Dict]:
-        """
-        Load injury status for all players on a game date.
-
-        Returns dict mapping player_lookup -> {
-            'injury_status': 'OUT', 'DOUBTFUL', 'QUESTIONABLE', etc.
-            'reason': injury reason text
-        }
+    def _date_filter(self, start_date: date, end_date: Optional[date] = None) -> str:
+        """SQL predicate body for one game date or an inclusive range."""
+        if end_date is None or end_date == start_date:
+            return f"= '{start_date}'"
+        return f"BETWEEN '{start_date}' AND '{end_date}'"
 
-        Uses the latest report for each player on the game date.
-        """
+    def _query_injury_frame(self, start_date: date, end_date: Optional[date] = None) -> pd.DataFrame:
+        """Latest injury report row per (player, game) for a date or range."""
         query = f"""
         SELECT
+            game_date,
             player_lookup,
             injury_status,
             reason
         FROM (
             SELECT
+                game_date,
                 player_lookup,
                 UPPER(injury_status) as injury_status,
                 reason,
@@ -331,24 +339,38 @@ class PredictionAccuracyProcessor:
                     ORDER BY report_date DESC, report_hour DESC
                 ) as rn
             FROM `{self.injury_table}`
-            WHERE game_date = '{game_date}'
+            WHERE game_date {self._date_filter(start_date, end_date)}
         )
         WHERE rn = 1
         """
+        return self.bq_client.query(query).to_dataframe()
+
+    @staticmethod
+    def _injury_infos(result: pd.DataFrame) -> List[Dict]:
+        return [
+            {'injury_status': status, 'reason': reason}
+            for status, reason in zip(result['injury_status'].tolist(), result['reason'].tolist())
+        ]
+
+    def load_injury_status_for_date(self, game_date: date) -> Dict[str, Dict]:
+        """
+        Load injury status for all players on a game date.
+
+        Returns dict mapping player_lookup -> {
+            'injury_status': 'OUT', 'DOUBTFUL', 'QUESTIONABLE', etc.
+            'reason': injury reason text
+        }
 
+        Uses the latest report for each player on the game date.
+        """
         try:
             with ErrorContext(
                 "load_injury_status",
                 game_date=str(game_date),
                 table=self.injury_table
             ):
-                result = self.bq_client.query(query).to_dataframe()
-                injury_map = {}
-                for _, row in result.iterrows():
-                    injury_map[row['player_lookup']] = {
-                        'injury_status': row['injury_status'],
-                        'reason': row['reason']
-                    }
+                result = self._query_injury_frame(game_date)
+                injury_map = dict(zip(result['player_lookup'].tolist(), self._injury_infos(result)))
                 logger.info(f"  Loaded {len(injury_map)} injury reports for {game_date}")
                 return injury_map
         except (gcp_exceptions.BadRequest, gcp_exceptions.NotFound,
@@ -360,6 +382,33 @@ class PredictionAccuracyProcessor:
             # Error already logged by ErrorContext with structured fields
             return {}
 
+    def load_injury_status_for_range(
+        self, start_date: date, end_date: date
+    ) -> Dict[Tuple[str, str], Dict]:
+        """
+        load_injury_status_for_date() for a date range in one query.
+
+        Returns dict mapping (game_date ISO, player_lookup) -> injury info.
+        """
+        try:
+            with ErrorContext(
+                "load_injury_status_range",
+                start_date=str(start_date),
+                end_date=str(end_date),
+                table=self.injury_table
+            ):
+                result = self._query_injury_frame(start_date, end_date)
+                keys = zip(
+                    [d.isoformat() if hasattr(d, 'isoformat') else str(d) for d in result['game_date'].tolist()],
+                    result['player_lookup'].tolist(),
+                )
+                injury_map = dict(zip(keys, self._injury_infos(result)))
+                logger.info(f"  Loaded {len(injury_map)} injury reports for {start_date} to {end_date}")
+                return injury_map
+        except Exception as e:
+            # Error already logged by ErrorContext with structured fields
+            return {}
+
     def get_injury_status(self, player_lookup: str, game_date: date) -> Optional[Dict]:
         """
         Get injury status for a player on a game date.
@@ -503,6 +552,17 @@ class PredictionAccuracyProcessor:
         Uses ROW_NUMBER to keep only the latest prediction per business key
         (player_lookup, game_id, system_id, line_value).
         """
+        return self.get_predictions_frame(game_date).to_dict('records')
+
+    def get_predictions_frame(
+        self, start_date: date, end_date: Optional[date] = None
+    ) -> pd.DataFrame:
+        """
+        Predictions to grade for one game date (or an inclusive range) as a DataFrame.
+
+        Same filters and deduplication as get_predictions_for_date(); the
+        business key includes game_id, so a range is the union of its dates.
+        """
         query = f"""
         WITH predictions_raw AS (
             SELECT
@@ -533,7 +593,7 @@ class PredictionAccuracyProcessor:
                 invalidation_reason,
                 created_at
             FROM `{self.predictions_table}` p
-            WHERE p.game_date = '{game_date}'
+            WHERE p.game_date {self._date_filter(start_date, end_date)}
                 -- v3.10: Only grade active predictions (exclude deactivated duplicates)
                 -- v5.3: Also grade is_active=FALSE predictions that sourced a BB pick
                 -- (race condition: decay_detection blocks model AFTER BB pipeline runs that morning,
@@ -544,7 +604,7 @@ class PredictionAccuracyProcessor:
                   OR EXISTS (
                     SELECT 1
                     FROM `{self.project_id}.nba_predictions.signal_best_bets_picks` bb
-                    WHERE bb.game_date = '{game_date}'
+                    WHERE bb.game_date = p.game_date
                       AND bb.player_lookup = p.player_lookup
                       AND bb.system_id = p.system_id
                       AND bb.line_value = p.current_points_line
@@ -582,11 +642,10 @@ class PredictionAccuracyProcessor:
         try:
             with ErrorContext(
                 "load_predictions_for_grading",
-                game_date=str(game_date),
+                game_date=str(start_date) if end_date is None else f"{start_date}..{end_date}",
                 table=self.predictions_table
             ):
-                result = self.bq_client.query(query).to_dataframe()
-                return result.to_dict('records')
+                return self.bq_client.query(query).to_dataframe()
         except gcp_exceptions.BadRequest as e:
             # BadRequest = permanent SQL error (wrong syntax, unsupported pattern, bad schema).
             # Re-raise so Pub/Sub treats this as failure and retries, and Cloud Logging
@@ -598,19 +657,18 @@ class PredictionAccuracyProcessor:
                 gcp_exceptions.DeadlineExceeded, GoogleCloudError) as e:
             # Transient errors — return [] to allow Pub/Sub retry with backoff
             # Error already logged by ErrorContext with structured fields
-            return []
+            return pd.DataFrame()
         except Exception as e:
             # Error already logged by ErrorContext with structured fields
-            return []
+            return pd.DataFrame()
 
-    def get_actuals_for_date(self, game_date: date) -> Dict[str, Dict]:
-        """
-        Load actual game data for all players on a game date.
+    ACTUAL_FIELDS = ('actual_points', 'team_abbr', 'opponent_team_abbr', 'minutes_played', 'is_dnp')
 
-        Returns dict mapping player_lookup -> {actual_points, team_abbr, opponent_team_abbr, minutes_played, is_dnp}
-        """
+    def _query_actuals_frame(self, start_date: date, end_date: Optional[date] = None) -> pd.DataFrame:
+        """Actual results for a date or range, cleaned by normalize_actuals()."""
         query = f"""
         SELECT
+            game_date,
             player_lookup,
             points as actual_points,
             team_abbr,
@@ -618,27 +676,28 @@ class PredictionAccuracyProcessor:
             minutes_played,
             is_dnp
         FROM `{self.actuals_table}`
-        WHERE game_date = '{game_date}'
+        WHERE game_date {self._date_filter(start_date, end_date)}
         """
+        return normalize_actuals(self.bq_client.query(query).to_dataframe())
 
+    def get_actuals_for_date(self, game_date: date) -> Dict[str, Dict]:
+        """
+        Load actual game data for all players on a game date.
+
+        Returns dict mapping player_lookup -> {actual_points, team_abbr, opponent_team_abbr, minutes_played, is_dnp}
+        """
         try:
             with ErrorContext(
                 "load_actuals_for_grading",
                 game_date=str(game_date),
                 table=self.actuals_table
             ):
-                result = self.bq_client.query(query).to_dataframe()
+                actuals = self._query_actuals_frame(game_date)
                 # Return dict of dicts with all player context
-                # Note: Use pd.notna() to handle both None and pandas NAType
+                columns = [actuals[name].tolist() for name in self.ACTUAL_FIELDS]
                 return {
-                    row['player_lookup']: {
-                        'actual_points': int(row['actual_points']) if pd.notna(row['actual_points']) else None,
-                        'team_abbr': row['team_abbr'] if pd.notna(row['team_abbr']) else None,
-                        'opponent_team_abbr': row['opponent_team_abbr'] if pd.notna(row['opponent_team_abbr']) else None,
-                        'minutes_played': self._safe_float(row['minutes_played']),
-                        'is_dnp': bool(row['is_dnp']) if pd.notna(row['is_dnp']) else False
-                    }
-                    for _, row in result.iterrows()
+                    player_lookup: dict(zip(self.ACTUAL_FIELDS, values))
+                    for player_lookup, *values in zip(actuals['player_lookup'].tolist(), *columns)
                 }
         except (gcp_exceptions.BadRequest, gcp_exceptions.NotFound,
                 gcp_exceptions.ServiceUnavailable, gcp_exceptions.DeadlineExceeded,
@@ -649,6 +708,20 @@ class PredictionAccuracyProcessor:
             # Error already logged by ErrorContext with structured fields
             return {}
 
+    def get_actuals_frame(self, start_date: date, end_date: date) -> pd.DataFrame:
+        """get_actuals_for_date() for a date range, as a frame keyed by (game_date, player_lookup)."""
+        try:
+            with ErrorContext(
+                "load_actuals_for_grading_range",
+                start_date=str(start_date),
+                end_date=str(end_date),
+                table=self.actuals_table
+            ):
+                return self._query_actuals_frame(start_date, end_date)
+        except Exception as e:
+            # Error already logged by ErrorContext with structured fields
+            return pd.DataFrame(columns=['game_date', 'player_lookup', *self.ACTUAL_FIELDS])
+
     def compute_prediction_correct(
         self,
         recommendation: str,
@@ -1207,14 +1280,42 @@ class PredictionAccuracyProcessor:
                 'graded': 0
             }
 
-        # Grade each prediction
+        if vectorized_grading_enabled():
+            graded = grade_frame(
+                self,
+                pd.DataFrame.from_records(predictions),
+                normalize_actuals(pd.DataFrame.from_records(
+                    [{'player_lookup': lookup, **data} for lookup, data in actuals.items()]
+                )),
+                lambda player_lookup, _: self.get_injury_status(player_lookup, game_date),
+            )
+            graded_results = graded.records
+            graded_frame = graded.frame
+            missing_actuals = graded.missing_actuals
+        else:
+            graded_results, missing_actuals = self._grade_records(predictions, actuals, game_date)
+            graded_frame = pd.DataFrame.from_records(graded_results, columns=ROLLUP_COLUMNS)
+
+        # Write to BigQuery (with distributed lock - SESSION 94 FIX)
+        written = self.write_graded_results(graded_results, game_date)
+
+        # Check for duplicates after grading (SESSION 94 FIX)
+        duplicate_count = self._check_for_duplicates(game_date) if written > 0 else 0
+
+        return self._date_summary(
+            game_date, len(predictions), len(actuals), missing_actuals,
+            written, duplicate_count, summarize_graded(graded_frame),
+        )
+
+    def _grade_records(
+        self, predictions: List[Dict], actuals: Dict[str, Dict], game_date: date
+    ) -> Tuple[List[Dict], int]:
+        """Grade predictions one record at a time (GRADING_ENGINE=scalar)."""
         graded_results = []
         missing_actuals = 0
-        null_actuals = 0
 
         for pred in predictions:
-            player_lookup = pred['player_lookup']
-            actual_data = actuals.get(player_lookup)
+            actual_data = actuals.get(pred['player_lookup'])
 
             if actual_data is None:
                 missing_actuals += 1
@@ -1223,76 +1324,134 @@ class PredictionAccuracyProcessor:
             # Session 212: Grade ALL predictions, even DNP (actual_points = None)
             # DNP predictions will be marked as is_voided=True by detect_dnp_voiding
             # This gives us complete audit trail like sportsbooks (void the bet, track it)
-            if actual_data.get('actual_points') is None:
-                null_actuals += 1
-                # Continue grading - will be voided, but we want the record
-
-            graded = self.grade_prediction(pred, actual_data, game_date)
-            graded_results.append(graded)
-
-        # Write to BigQuery (with distributed lock - SESSION 94 FIX)
-        written = self.write_graded_results(graded_results, game_date)
+            graded_results.append(self.grade_prediction(pred, actual_data, game_date))
 
-        # Check for duplicates after grading (SESSION 94 FIX)
-        duplicate_count = self._check_for_duplicates(game_date) if written > 0 else 0
-
-        # Compute summary statistics
-        if graded_results:
-            # Overall stats (including voided)
-            errors = [r['absolute_error'] for r in graded_results if r['absolute_error'] is not None]
-            mae = sum(errors) / len(errors) if errors else None
-
-            signed_errors = [r['signed_error'] for r in graded_results if r['signed_error'] is not None]
-            bias = sum(signed_errors) / len(signed_errors) if signed_errors else None
+        return graded_results, missing_actuals
 
-            correct_count = sum(1 for r in graded_results if r['prediction_correct'] is True)
-            incorrect_count = sum(1 for r in graded_results if r['prediction_correct'] is False)
-            accuracy = correct_count / (correct_count + incorrect_count) if (correct_count + incorrect_count) > 0 else None
-
-            # Voiding stats (v4)
-            voided_count = sum(1 for r in graded_results if r.get('is_voided', False))
-            voided_injury = sum(1 for r in graded_results if r.get('void_reason') == 'dnp_injury_confirmed')
-            voided_scratch = sum(1 for r in graded_results if r.get('void_reason') == 'dnp_late_scratch')
-            voided_unknown = sum(1 for r in graded_results if r.get('void_reason') == 'dnp_unknown')
-
-            # Net accuracy (excluding voided) - this is the "real" accuracy like sportsbooks
-            non_voided = [r for r in graded_results if not r.get('is_voided', False)]
-            net_correct = sum(1 for r in non_voided if r['prediction_correct'] is True)
-            net_incorrect = sum(1 for r in non_voided if r['prediction_correct'] is False)
-            net_accuracy = net_correct / (net_correct + net_incorrect) if (net_correct + net_incorrect) > 0 else None
-
-            if voided_count > 0:
-                logger.info(f"  Voided {voided_count} predictions (injury: {voided_injury}, scratch: {voided_scratch}, unknown: {voided_unknown})")
-        else:
-            mae = None
-            bias = None
-            accuracy = None
-            voided_count = 0
-            voided_injury = 0
-            voided_scratch = 0
-            voided_unknown = 0
-            net_accuracy = None
+    def _date_summary(
+        self,
+        game_date: date,
+        predictions_found: int,
+        actuals_found: int,
+        missing_actuals: int,
+        written: int,
+        duplicate_count: int,
+        stats: Dict,
+    ) -> Dict:
+        """process_date() result dict from summarize_graded() stats."""
+        if stats['voided_count'] > 0:
+            logger.info(
+                f"  Voided {stats['voided_count']} predictions (injury: {stats['voided_injury']}, "
+                f"scratch: {stats['voided_scratch']}, unknown: {stats['voided_unknown']})"
+            )
+        mae, bias = stats['mae'], stats['bias']
+        accuracy, net_accuracy = stats['accuracy'], stats['net_accuracy']
 
         return {
             'status': 'success' if written > 0 else 'failed',
             'date': game_date.isoformat(),
-            'predictions_found': len(predictions),
-            'actuals_found': len(actuals),
+            'predictions_found': predictions_found,
+            'actuals_found': actuals_found,
             'missing_actuals': missing_actuals,
             'graded': written,
             'mae': round(mae, 2) if mae is not None else None,
             'bias': round(bias, 2) if bias is not None else None,
             'recommendation_accuracy': round(accuracy * 100, 1) if accuracy is not None else None,
             # Voiding stats (v4)
-            'voided_count': voided_count,
-            'voided_injury': voided_injury,
-            'voided_scratch': voided_scratch,
-            'voided_unknown': voided_unknown,
+            'voided_count': stats['voided_count'],
+            'voided_injury': stats['voided_injury'],
+            'voided_scratch': stats['voided_scratch'],
+            'voided_unknown': stats['voided_unknown'],
             'net_accuracy': round(net_accuracy * 100, 1) if net_accuracy is not None else None,
             # SESSION 94 FIX: Return duplicate count for alerting
             'duplicate_count': duplicate_count
         }
 
+    def process_date_range(
+        self,
+        start_date: date,
+        end_date: date,
+        write: bool = True,
+        max_workers: int = 4,
+    ) -> Dict:
+        """
+        Grade every date in a range from one load of each source.
+
+        Predictions, actuals and injury reports are read with one query each
+        and graded in a single grade_frame() pass (the grading backfill calls
+        this per chunk of game dates). Writes stay per date, each under its own
+        grading lock, so dates are written concurrently.
+
+        Args:
+            start_date: First game date (inclusive)
+            end_date: Last game date (inclusive)
+            write: If False, grade and summarize without writing
+            max_workers: Concurrent per-date writes
+
+        Returns:
+            Dict with status, the range, total graded and per-date results
+            under 'dates' (process_date shape)
+        """
+        logger.info(f"Grading predictions for {start_date} to {end_date} (single pass)")
+
+        predictions = self.get_predictions_frame(start_date, end_date)
+        if predictions.empty:
+            return {'status': 'no_predictions', 'dates': []}
+        actuals = self.get_actuals_frame(start_date, end_date)
+        injuries = self.load_injury_status_for_range(start_date, end_date)
+
+        graded = grade_frame(
+            self, predictions, actuals,
+            lambda player_lookup, game_date_iso: injuries.get((game_date_iso, player_lookup)),
+        )
+
+        record_dates = [r['game_date'] for r in graded.records]
+        prediction_dates = pd.Series(
+            [d.isoformat() if hasattr(d, 'isoformat') else str(d) for d in predictions['game_date'].tolist()]
+        )
+        predictions_per_date = prediction_dates.value_counts().to_dict()
+        actuals_per_date = actuals['game_date'].value_counts().to_dict()
+        rows_per_date: Dict[str, List[int]] = {}
+        for i, game_date_iso in enumerate(record_dates):
+            rows_per_date.setdefault(game_date_iso, []).append(i)
+
+        def grade_one(game_date_iso: str) -> Dict:
+            game_date = date.fromisoformat(game_date_iso)
+            rows = rows_per_date.get(game_date_iso, [])
+            predictions_found = int(predictions_per_date.get(game_date_iso, 0))
+            actuals_found = int(actuals_per_date.get(game_date_iso, 0))
+            if not actuals_found:
+                return {
+                    'status': 'no_actuals',
+                    'date': game_date_iso,
+                    'predictions_found': predictions_found,
+                    'graded': 0
+                }
+            records = [graded.records[i] for i in rows]
+            written = self.write_graded_results(records, game_date) if write else len(records)
+            duplicate_count = self._check_for_duplicates(game_date) if write and written > 0 else 0
+            return self._date_summary(
+                game_date, predictions_found, actuals_found, predictions_found - len(rows),
+                written, duplicate_count, summarize_graded(graded.frame.iloc[rows]),
+            )
+
+        dates = sorted(predictions_per_date)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = list(executor.map(grade_one, dates))
+
+        graded_count = sum(r['graded'] for r in results)
+        logger.info(
+            f"Graded {graded_count} predictions across {len(dates)} dates "
+            f"({graded.missing_actuals} without actuals)"
+        )
+        return {
+            'status': 'success' if graded_count > 0 else 'failed',
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'graded': graded_count,
+            'dates': results,
+        }
+
     def check_predictions_exist(self, game_date: date) -> Dict:
         """Check if predictions exist for a date."""
         query = f"""
@@ -0,0 +1,411 @@
+# File: data_processors/precompute/ml_feature_store/columnar_builder.py
+"""
+Columnar Feature Builder - Whole-Day Feature Matrix
+
+Builds every player's feature vector for a date as ONE player x feature
+NumPy matrix (plus a parallel source matrix) instead of one Python list per
+player. Columns are filled one at a time from the batch-extracted lookups,
+so the Phase 4 → Phase 3 → default fallback, NULL handling and derived
+features run as array operations over the whole slate.
+
+The row path (MLFeatureStoreProcessor._extract_all_features) stays the
+reference implementation. FeatureMatrix.row_features()/row_sources() return
+exactly what the row path returns for the same inputs - the equivalence test
+in tests/processors/precompute/ml_feature_store/test_columnar_builder.py
+enforces that.
+
+Rows whose raw values can't be converted (e.g. a string in a numeric field)
+are flagged in FeatureMatrix.irregular_rows and must go through the row path.
+
+Requires FeatureExtractor.batch_extract_all_data() to have run for the date.
+"""
+
+import logging
+import math
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Total features produced by _extract_all_features (0-63, incl. V17/V18)
+MATRIX_FEATURE_COUNT = 64
+
+# Features written as None (not NaN) when their source is 'missing'.
+# Everything else that is unavailable is written as float('nan').
+NONE_WHEN_MISSING = frozenset({18, 19, 20, 25, 26, 27, 38})
+
+
+@dataclass
+class FeatureMatrix:
+    """Player x feature values and sources for one game date."""
+
+    player_lookups: List[str]
+    values: np.ndarray          # float64, shape (n_players, MATRIX_FEATURE_COUNT)
+    sources: np.ndarray         # object, same shape, raw source labels
+    days_rest: List[Any] = field(default_factory=list)
+    irregular_rows: Set[int] = field(default_factory=set)
+
+    def __len__(self) -> int:
+        return len(self.player_lookups)
+
+    @property
+    def null_mask(self) -> np.ndarray:
+        """True where the row path writes None (not NaN)."""
+        mask = np.zeros(self.values.shape, dtype=bool)
+        for idx in NONE_WHEN_MISSING:
+            mask[:, idx] = self.sources[:, idx] == 'missing'
+        return mask
+
+    def row_features(self, row: int) -> list:
+        """Feature list for one player, identical to the row path output."""
+        features = self.values[row].tolist()
+        for idx in NONE_WHEN_MISSING:
+            if self.sources[row, idx] == 'missing':
+                features[idx] = None
+        return features
+
+    def row_sources(self, row: int) -> Dict[int, str]:
+        """Feature source dict for one player (index order, like the row path)."""
+        return {idx: source for idx, source in enumerate(self.sources[row].tolist())}
+
+
+def _is_valid_value(val) -> bool:
+    """Mirror of MLFeatureStoreProcessor._is_valid_value (None/NaN → invalid)."""
+    if val is None:
+        return False
+    if isinstance(val, float) and math.isnan(val):
+        return False
+    return True
+
+
+class ColumnarFeatureBuilder:
+    """Fill the day's feature matrix column by column from batch lookups."""
+
+    def __init__(self, feature_extractor, feature_calculator):
+        self.feature_extractor = feature_extractor
+        self.feature_calculator = feature_calculator
+
+    # ========================================================================
+    # PUBLIC API
+    # ========================================================================
+
+    def build(self, player_rows: List[Dict], game_date: date) -> FeatureMatrix:
+        """
+        Build the feature matrix for all players.
+
+        Args:
+            player_rows: Player dicts (player_lookup, opponent_team_abbr, ...)
+            game_date: Date the batch cache was populated for
+
+        Returns:
+            FeatureMatrix with one row per entry in player_rows (same order)
+        """
+        n = len(player_rows)
+        self._irregular: Set[int] = set()
+        self._values = np.full((n, MATRIX_FEATURE_COUNT), np.nan, dtype=np.float64)
+        self._sources = np.empty((n, MATRIX_FEATURE_COUNT), dtype=object)
+
+        lookups = [row['player_lookup'] for row in player_rows]
+        opponents = [row.get('opponent_team_abbr') for row in player_rows]
+
+        # Per-player source dicts (O(1) dict merges from the batch cache)
+        extractor = self.feature_extractor
+        self._phase4 = []
+        self._phase3 = []
+        for i, (pl, opp) in enumerate(zip(lookups, opponents)):
+            try:
+                self._phase4.append(
+                    extractor.extract_phase4_data(pl, game_date, opponent_team_abbr=opp))
+                self._phase3.append(extractor.extract_phase3_data(pl, game_date))
+            except Exception as e:
+                logger.warning(f"Columnar build: extraction failed for {pl}: {e}")
+                self._irregular.add(i)
+                del self._phase4[i:]
+                self._phase4.append({})
+                self._phase3.append({})
+
+        self._fill_base_columns()
+        self._fill_v8_columns(lookups, opponents)
+        self._fill_v11_v12_columns(lookups)
+        self._fill_v16_v18_columns(lookups)
+
+        matrix = FeatureMatrix(
+            player_lookups=lookups,
+            values=self._values,
+            sources=self._sources,
+            days_rest=[d.get('days_rest') for d in self._phase3],
+            irregular_rows=self._irregular,
+        )
+        if self._irregular:
+            logger.warning(
+                f"Columnar build: {len(self._irregular)} irregular rows will use the row path: "
+                f"{', '.join(lookups[i] for i in sorted(self._irregular)[:10])}"
+            )
+        return matrix
+
+    # ========================================================================
+    # COLUMN HELPERS
+    # ========================================================================
+
+    def _to_floats(self, raw: List[Any], present: np.ndarray,
+                   transform: Optional[Callable[[Any], float]] = None) -> np.ndarray:
+        """Convert present raw values to float64 (NaN elsewhere), flagging failures."""
+        out = np.full(len(raw), np.nan, dtype=np.float64)
+        for i in np.flatnonzero(present):
+            try:
+                out[i] = transform(raw[i]) if transform else float(raw[i])
+            except (TypeError, ValueError, ArithmeticError):
+                self._irregular.add(int(i))
+        return out
+
+    def _gather(self, dicts: List[Dict], field_name: str):
+        """Return (values, valid) for one field across all players."""
+        raw = [d.get(field_name) for d in dicts]
+        valid = np.fromiter(
+            (field_name in d and _is_valid_value(v) for d, v in zip(dicts, raw)),
+            dtype=bool, count=len(dicts)
+        )
+        return self._to_floats(raw, valid), valid
+
+    def _fallback_column(self, index: int, field_name: str, default: float) -> None:
+        """Phase 4 → Phase 3 → default (mirrors _get_feature_with_fallback)."""
+        v4, ok4 = self._gather(self._phase4, field_name)
+        v3, ok3 = self._gather(self._phase3, field_name)
+        self._values[:, index] = np.where(ok4, v4, np.where(ok3, v3, float(default)))
+        self._sources[:, index] = np.where(ok4, 'phase4', np.where(ok3, 'phase3', 'default'))
+
+    def _nullable_column(self, index: int, field_name: str) -> None:
+        """Phase 4 → Phase 3 → missing, stored as a rate (mirrors _get_feature_nullable)."""
+        v4, ok4 = self._gather(self._phase4, field_name)
+        v3, ok3 = self._gather(self._phase3, field_name)
+        self._values[:, index] = np.where(ok4, v4, np.where(ok3, v3, np.nan)) / 100.0
+        self._sources[:, index] = np.where(ok4, 'phase4', np.where(ok3, 'phase3', 'missing'))
+
+    def _phase4_only_column(self, index: int, field_name: str, default: float) -> None:
+        """Phase 4 → default (mirrors _get_feature_phase4_only)."""
+        v4, ok4 = self._gather(self._phase4, field_name)
+        self._values[:, index] = np.where(ok4, v4, float(default))
+        self._sources[:, index] = np.where(ok4, 'phase4', 'default')
+        n_default = int((~ok4).sum())
+        if n_default:
+            logger.warning(
+                f"Feature {index} ({field_name}) missing from Phase 4 for {n_default} players, "
+                f"using default={default}"
+            )
+
+    def _calculated_column(self, index: int, fn: Callable[[int], float]) -> None:
+        """Derived feature computed per player by FeatureCalculator."""
+        for i in range(self._values.shape[0]):
+            try:
+                self._values[i, index] = fn(i)
+            except Exception:
+                self._irregular.add(i)
+        self._sources[:, index] = 'calculated'
+
+    def _optional_column(self, index: int, raw: List[Any], present_source: str,
+                         transform: Optional[Callable[[Any], float]] = None) -> np.ndarray:
+        """value if not None else NaN/missing; returns the presence mask."""
+        present = np.fromiter((v is not None for v in raw), dtype=bool, count=len(raw))
+        self._values[:, index] = self._to_floats(raw, present, transform)
+        self._sources[:, index] = np.where(present, present_source, 'missing')
+        return present
+
+    def _flag_column(self, index: int, truthy: List[Any]) -> None:
+        """float(value or 0) for Phase 3 game-context flags."""
+        raw = list(truthy)
+        self._values[:, index] = self._to_floats(raw, np.ones(len(raw), dtype=bool))
+        self._sources[:, index] = 'phase3'
+
+    # ========================================================================
+    # FEATURE GROUPS (indices match _extract_all_features)
+    # ========================================================================
+
+    def _fill_base_columns(self) -> None:
+        """Features 0-24: recent performance, composites, context, zones, team."""
+        p3, p4, calc = self._phase3, self._phase4, self.feature_calculator
+
+        self._fallback_column(0, 'points_avg_last_5', 10.0)
+        self._fallback_column(1, 'points_avg_last_10', 10.0)
+        self._fallback_column(2, 'points_avg_season', 10.0)
+        self._fallback_column(3, 'points_std_last_10', 5.0)
+        self._fallback_column(4, 'games_in_last_7_days', 3.0)
+
+        self._phase4_only_column(5, 'fatigue_score', 50.0)
+        self._phase4_only_column(6, 'shot_zone_mismatch_score', 0.0)
+        self._phase4_only_column(7, 'pace_score', 0.0)
+        self._phase4_only_column(8, 'usage_spike_score', 0.0)
+
+        self._calculated_column(9, lambda i: calc.calculate_rest_advantage(p3[i]))
+        self._calculated_column(10, lambda i: calc.calculate_injury_risk(p3[i]))
+        self._calculated_column(11, lambda i: calc.calculate_recent_trend(p3[i]))
+        self._calculated_column(12, lambda i: calc.calculate_minutes_change(p4[i], p3[i]))
+
+        self._fallback_column(13, 'opponent_def_rating', 112.0)
+        self._fallback_column(14, 'opponent_pace', 100.0)
+
+        self._flag_column(15, [d.get('home_game') or 0 for d in p3])
+        self._flag_column(16, [d.get('back_to_back') or 0 for d in p3])
+        self._values[:, 17] = [
+            1.0 if (d.get('season_phase') or '').lower() == 'playoffs' else 0.0 for d in p3
+        ]
+        self._sources[:, 17] = 'phase3'
+
+        self._nullable_column(18, 'paint_rate_last_10')
+        self._nullable_column(19, 'mid_range_rate_last_10')
+        self._nullable_column(20, 'three_pt_rate_last_10')
+
+        self._calculated_column(21, lambda i: calc.calculate_pct_free_throw(p3[i]))
+
+        self._fallback_column(22, 'team_pace_last_10', 100.0)
+        self._fallback_column(23, 'team_off_rating_last_10', 112.0)
+        self._calculated_column(24, lambda i: calc.calculate_team_win_pct(p3[i]))
+
+    def _fill_v8_columns(self, lookups: List[str], opponents: List[Optional[str]]) -> None:
+        """Features 25-36: Vegas, opponent history, minutes/PPM, DNP, trajectory."""
+        p3, p4, calc = self._phase3, self._phase4, self.feature_calculator
+        extractor = self.feature_extractor
+        n = len(lookups)
+
+        # Features 25-28: Vegas lines (None, not season avg, when unavailable)
+        vegas = [extractor.get_vegas_lines(pl) if pl else {} for pl in lookups]
+        has_line = self._optional_column(25, [v.get('vegas_points_line') for v in vegas], 'vegas')
+        self._optional_column(26, [v.get('vegas_opening_line') for v in vegas], 'vegas')
+        self._optional_column(27, [v.get('vegas_line_move') for v in vegas], 'vegas')
+        self._values[:, 28] = has_line.astype(np.float64)
+        self._sources[:, 28] = 'calculated'
+
+        # Features 29-30: Opponent history, season average fallback.
+        # `or` semantics: a 0.0 season average falls through to the next source.
+        opp_data = [
+            extractor.get_opponent_history(pl, opp) if pl and opp else {}
+            for pl, opp in zip(lookups, opponents)
+        ]
+        season4, ok4 = self._gather(p4, 'points_avg_season')
+        season3, ok3 = self._gather(p3, 'points_avg_season')
+        use4 = ok4 & (season4 != 0)
+        use3 = ok3 & (season3 != 0)
+        season_fallback = np.where(use4, season4, np.where(use3, season3, 10.0))
+
+        avg_vs_opp, has_avg = self._gather(opp_data, 'avg_points_vs_opponent')
+        self._values[:, 29] = np.where(has_avg, avg_vs_opp, season_fallback)
+        self._sources[:, 29] = np.where(has_avg, 'opponent_history', 'calculated')
+
+        games_vs_opp, has_games = self._gather(opp_data, 'games_vs_opponent')
+        self._values[:, 30] = np.where(has_games, games_vs_opp, 0.0)
+        has_opp_data = np.fromiter((bool(d) for d in opp_data), dtype=bool, count=n)
+        self._sources[:, 30] = np.where(has_opp_data, 'opponent_history', 'calculated')
+
+        # Features 31-32: Minutes/PPM lookup → Phase 4 cache → default
+        minutes_ppm = [extractor.get_minutes_ppm(pl) if pl else {} for pl in lookups]
+        for index, field_name, default in ((31, 'minutes_avg_last_10', 28.0),
+                                           (32, 'ppm_avg_last_10', 0.4)):
+            raw = [d.get(field_name) for d in minutes_ppm]
+            ok_mp = np.fromiter((_is_valid_value(v) for v in raw), dtype=bool, count=n)
+            v_mp = self._to_floats(raw, ok_mp)
+            raw4 = [d.get(field_name) for d in p4]
+            ok_p4 = np.fromiter((_is_valid_value(v) for v in raw4), dtype=bool, count=n)
+            v_p4 = self._to_floats(raw4, ok_p4)
+            self._values[:, index] = np.where(ok_mp, v_mp, np.where(ok_p4, v_p4, default))
+            self._sources[:, index] = np.where(
+                ok_mp, 'minutes_ppm', np.where(ok_p4, 'phase4', 'default')
+            )
+
+        # Features 33-36: DNP rate and player trajectory
+        self._calculated_column(33, lambda i: calc.calculate_dnp_rate(p3[i]))
+        self._calculated_column(34, lambda i: calc.calculate_pts_slope_10g(p3[i]))
+        self._calculated_column(35, lambda i: calc.calculate_pts_vs_season_zscore(p4[i], p3[i]))
+        self._calculated_column(36, lambda i: calc.calculate_breakout_flag(p4[i], p3[i]))
+
+    def _fill_v11_v12_columns(self, lookups: List[str]) -> None:
+        """Features 37-53: injury context, game environment, V12 features."""
+        extractor = self.feature_extractor
+        n = len(lookups)
+
+        # Feature 37: star teammates out (0.0 is a valid default)
+        star_out = [extractor.get_star_teammates_out(pl) if pl else None for pl in lookups]
+        present = self._optional_column(37, star_out, 'phase3')
+        self._values[~present, 37] = 0.0
+        self._sources[~present, 37] = 'default'
+
+        # Feature 38: game total line (None when unavailable)
+        game_total = [extractor.get_game_total(pl) if pl else None for pl in lookups]
+        has_total = self._optional_column(38, game_total, 'phase3')
+
+        # Features 39-41: UPCG context
+        self._optional_column(
+            39, [extractor.get_days_rest_float(pl) if pl else None for pl in lookups], 'phase3')
+        self._optional_column(
+            40, [extractor.get_minutes_load_last_7d(pl) if pl else None for pl in lookups], 'phase3')
+        spread = [extractor.get_game_spread(pl) if pl else None for pl in lookups]
+        has_spread = self._optional_column(41, spread, 'phase3', transform=lambda v: abs(float(v)))
+
+        # Feature 42: implied team total = (total ∓ spread) / 2 by home/away
+        both = has_total & has_spread
+        total_vals = self._values[:, 38]
+        spread_vals = self._to_floats(spread, both)
+        is_home = np.fromiter((bool(d.get('home_game')) for d in self._phase3), dtype=bool, count=n)
+        implied = np.where(is_home, (total_vals - spread_vals) / 2.0, (total_vals + spread_vals) / 2.0)
+        self._values[:, 42] = np.where(both, implied, np.nan)
+        self._sources[:, 42] = np.where(both, 'phase3', 'missing')
+
+        # Features 43-46, 48-49: rolling stats
+        rolling = [extractor.get_player_rolling_stats(pl) if pl else {} for pl in lookups]
+        for index, field_name in ((43, 'points_avg_last_3'), (44, 'scoring_trend_slope'),
+                                  (45, 'deviation_from_avg_last3'),
+                                  (46, 'consecutive_games_below_avg')):
+            self._optional_column(index, [r.get(field_name) for r in rolling], 'calculated')
+
+        # Feature 47: teammate usage available
+        self._optional_column(
+            47, [extractor.get_teammate_usage_available(pl) if pl else None for pl in lookups],
+            'calculated')
+
+        for index, field_name in ((48, 'usage_rate_last_5'), (49, 'games_since_structural_change')):
+            self._optional_column(index, [r.get(field_name) for r in rolling], 'calculated')
+
+        # Feature 50: multi-book line std ('bettingpros' fallback tagged separately)
+        line_std = [extractor.get_multi_book_line_std(pl) if pl else None for pl in lookups]
+        present = self._optional_column(50, line_std, 'vegas')
+        for i in np.flatnonzero(present):
+            if extractor.get_multi_book_line_std_source(lookups[i]) == 'bettingpros':
+                self._sources[i, 50] = 'bettingpros'
+
+        # Features 51-52: prop streaks
+        streaks = [extractor.get_prop_streaks(pl) if pl else {} for pl in lookups]
+        self._optional_column(51, [s.get('prop_over_streak') for s in streaks], 'phase3')
+        self._optional_column(52, [s.get('prop_under_streak') for s in streaks], 'phase3')
+
+        # Feature 53: line vs season avg (feature 2 is never None)
+        has_line = self._sources[:, 25] != 'missing'
+        self._values[:, 53] = np.where(has_line, self._values[:, 25] - self._values[:, 2], np.nan)
+        self._sources[:, 53] = np.where(has_line, 'calculated', 'missing')
+
+    def _fill_v16_v18_columns(self, lookups: List[str]) -> None:
+        """Features 54-63: prop line delta/history, opportunity risk, line movement."""
+        extractor = self.feature_extractor
+
+        self._optional_column(
+            54, [extractor.get_prop_line_delta(pl) if pl else None for pl in lookups], 'vegas')
+
+        v16 = [extractor.get_v16_line_history(pl) if pl else {} for pl in lookups]
+        self._optional_column(55, [d.get('over_rate_last_10') for d in v16], 'calculated')
+        self._optional_column(56, [d.get('margin_vs_line_avg_last_5') for d in v16], 'calculated')
+
+        v17 = [extractor.get_v17_opportunity_risk(pl) if pl else {} for pl in lookups]
+        self._optional_column(57, [d.get('blowout_minutes_risk') for d in v17], 'calculated')
+        self._optional_column(58, [d.get('minutes_volatility_last_10') for d in v17], 'calculated')
+
+        # Feature 59: team pace - opponent pace (both always populated)
+        self._values[:, 59] = self._values[:, 22] - self._values[:, 14]
+        self._sources[:, 59] = 'calculated'
+
+        v18 = [extractor.get_v18_line_movement(pl) if pl else {} for pl in lookups]
+        self._optional_column(60, [d.get('line_movement_direction') for d in v18], 'vegas')
+        self._optional_column(61, [d.get('vig_skew') for d in v18], 'vegas')
+        self._optional_column(
+            62, [extractor.get_v18_self_creation(pl) if pl else None for pl in lookups],
+            'calculated')
+        self._optional_column(63, [d.get('late_line_movement_count') for d in v18], 'vegas')
@@ -8,11 +8,12 @@ Extracts raw data from:
 - Phase 3 (fallback): player_game_summary, upcoming_player_game_context,
                       team_offense_game_summary, team_defense_game_summary
 
-Version: 1.8 (Session 143: Per-query timing, date-bounded CTEs, query timeouts)
+Version: 1.9 (Persistent per-date snapshot cache for batch extractions)
 """
 
 import logging
 import statistics
+import threading
 from datetime import date, timedelta
 from typing import Dict, List, Optional, Any
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -20,23 +21,33 @@ from google.cloud import bigquery
 import pandas as pd
 import time
 
+from .snapshot_cache import ExtractionSnapshotCache
+
 logger = logging.getLogger(__name__)
 
 
 class FeatureExtractor:
     """Extract features from Phase 3/4 BigQuery tables."""
 
-    def __init__(self, bq_client: bigquery.Client, project_id: str) -> None:
+    def __init__(self, bq_client: bigquery.Client, project_id: str,
+                 snapshot_cache: Optional[ExtractionSnapshotCache] = None) -> None:
         """
         Initialize feature extractor.
 
         Args:
             bq_client: BigQuery client instance
             project_id: GCP project ID
+            snapshot_cache: Optional persistent cache for batch extraction results
         """
         self.bq_client: bigquery.Client = bq_client
         self.project_id: str = project_id
 
+        # Persistent snapshot cache (see snapshot_cache.py). The active extraction
+        # is tracked per thread because extractions run in a ThreadPoolExecutor.
+        self._snapshot_cache: Optional[ExtractionSnapshotCache] = snapshot_cache
+        self._snapshot_source_hashes: Dict[str, Optional[str]] = {}
+        self._snapshot_scope = threading.local()
+
         # Batch extraction cache (populated by batch_extract_* methods)
         self._batch_cache_date: Optional[date] = None
         self._daily_cache_lookup: Dict[str, Dict] = {}
@@ -105,6 +116,13 @@ class FeatureExtractor:
         Raises:
             GoogleAPIError: Re-raises after logging if query fails
         """
+        extraction = getattr(self._snapshot_scope, 'extraction', None)
+        if self._snapshot_cache is not None and extraction is not None:
+            return self._snapshot_query(query, query_name, timeout, extraction)
+        return self._run_query(query, query_name, timeout)
+
+    def _run_query(self, query: str, query_name: str, timeout: int) -> pd.DataFrame:
+        """Execute a query against BigQuery (see _safe_query)."""
         from google.api_core.exceptions import GoogleAPIError
         try:
             job = self.bq_client.query(query)
@@ -118,6 +136,29 @@ class FeatureExtractor:
             logger.debug(f"Timed out query:\n{query[:500]}...")
             raise
 
+    def _snapshot_query(self, query: str, query_name: str, timeout: int,
+                        extraction: str) -> pd.DataFrame:
+        """
+        Serve a batch extraction query from the snapshot cache, or run and store it.
+
+        Falls through to BigQuery (uncached) when the date is not cacheable or
+        the upstream source hashes are unknown.
+        """
+        game_date = self._snapshot_scope.game_date
+        source_key = self._snapshot_cache.source_key(extraction, self._snapshot_source_hashes)
+        if source_key is None or not self._snapshot_cache.cacheable_date(game_date):
+            return self._run_query(query, query_name, timeout)
+
+        cached = self._snapshot_cache.get(game_date, extraction, source_key, query)
+        if cached is not None:
+            self._snapshot_scope.statuses.append('hit')
+            return cached
+
+        result = self._run_query(query, query_name, timeout)
+        self._snapshot_cache.put(game_date, extraction, source_key, query, result)
+        self._snapshot_scope.statuses.append('miss')
+        return result
+
     # ========================================================================
     # PLAYER LIST
     # ========================================================================
@@ -281,7 +322,8 @@ class FeatureExtractor:
     # ========================================================================
 
     def batch_extract_all_data(self, game_date: date, players_with_games: List[Dict[str, Any]],
-                               backfill_mode: bool = False) -> None:
+                               backfill_mode: bool = False,
+                               source_hashes: Optional[Dict[str, Optional[str]]] = None) -> None:
         """
         Batch extract all Phase 3/4 data for a game date.
 
@@ -297,6 +339,8 @@ class FeatureExtractor:
             game_date: Date to extract data for
             players_with_games: List of player dicts (from get_players_with_games)
             backfill_mode: If True, use raw betting tables for Vegas lines instead of Phase 3
+            source_hashes: Upstream Phase 4 data_hash per source ('daily_cache', 'composite',
+                'shot_zones', 'team_defense'); keys the snapshot cache when enabled
         """
         if self._batch_cache_date == game_date:
             logger.debug(f"Batch cache already populated for {game_date}")
@@ -316,15 +360,27 @@ class FeatureExtractor:
 
         # Per-query timing tracker (Session 143)
         query_timings = {}
+        self._snapshot_source_hashes = dict(source_hashes or {})
 
         def timed_task(name, fn):
-            """Wrapper that times each extraction task."""
+            """Wrapper that times each extraction task (and its snapshot cache use)."""
             def wrapper():
                 t0 = time.time()
-                fn()
+                scope = self._snapshot_scope
+                scope.extraction, scope.game_date, scope.statuses = name, game_date, []
+                try:
+                    fn()
+                finally:
+                    statuses = scope.statuses
+                    scope.extraction = None
                 elapsed = time.time() - t0
                 query_timings[name] = elapsed
-                logger.info(f"[QUERY_TIMING] {name}: {elapsed:.1f}s")
+                if statuses:
+                    hit = all(status == 'hit' for status in statuses)
+                    self._snapshot_cache.record(name, hit, elapsed)
+                    logger.info(f"[QUERY_TIMING] {name}: {elapsed:.1f}s (snapshot {'hit' if hit else 'miss'})")
+                else:
+                    logger.info(f"[QUERY_TIMING] {name}: {elapsed:.1f}s")
             return wrapper
 
         # Run ALL 11 batch extractions in PARALLEL using ThreadPoolExecutor
@@ -423,6 +479,12 @@ class FeatureExtractor:
             slowest_name, slowest_time = sorted_timings[0]
             if slowest_time > 30:
                 logger.warning(f"[SLOW_QUERY] {slowest_name} took {slowest_time:.1f}s (>{30}s threshold)")
+        if self._snapshot_cache is not None:
+            summary = self._snapshot_cache.summary()
+            logger.info(
+                f"[SNAPSHOT_CACHE] {game_date}: {summary['snapshot_hits']} hits, "
+                f"{summary['snapshot_misses']} misses (cumulative) in {self._snapshot_cache.root}"
+            )
 
         logger.info(
             f"Batch extraction complete in {elapsed:.1f}s: "
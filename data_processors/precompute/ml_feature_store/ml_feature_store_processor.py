@@ -32,6 +32,7 @@ import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, date, timezone, timedelta
 from typing import Dict, List, Optional
+import numpy as np
 import pandas as pd
 from google.cloud import bigquery
 
@@ -53,6 +54,8 @@ from .feature_calculator import FeatureCalculator
 from .quality_scorer import QualityScorer
 from .batch_writer import BatchWriter
 from .breakout_risk_calculator import BreakoutRiskCalculator
+from .columnar_builder import ColumnarFeatureBuilder
+from .snapshot_cache import get_snapshot_cache
 
 # Bootstrap period support (Week 5 - Early Season Handling)
 from shared.config.nba_season_dates import is_early_season, get_season_year_from_date
@@ -313,6 +316,53 @@ def validate_feature_ranges(features: list, player_lookup: str = None) -> tuple:
     return is_valid, warnings, critical_errors
 
 
+def validate_feature_matrix_ranges(values: np.ndarray, null_mask: np.ndarray,
+                                   player_lookups: list = None) -> tuple:
+    """
+    Columnar version of validate_feature_ranges for a whole day's feature matrix.
+
+    Range checks run as one comparison per feature column; messages are only
+    built for out-of-range cells, in the same order as the per-record check.
+
+    Args:
+        values: (n_players, n_features) float matrix (NULLs may be NaN)
+        null_mask: Same shape, True where the feature value is None
+        player_lookups: Player identifiers (row order) for logging
+
+    Returns:
+        (is_valid, warnings, critical_errors)
+        - is_valid: bool array, True for rows with no critical errors
+        - warnings: list of per-row warning lists
+        - critical_errors: list of per-row critical error lists
+    """
+    n_rows, n_features = values.shape
+    warnings = [[] for _ in range(n_rows)]
+    critical_errors = [[] for _ in range(n_rows)]
+
+    for idx in sorted(ML_FEATURE_RANGES):
+        if idx >= n_features:
+            continue
+
+        min_val, max_val, is_critical, feature_name = ML_FEATURE_RANGES[idx]
+        column = values[:, idx]
+        with np.errstate(invalid='ignore'):
+            out_of_range = ((column < min_val) | (column > max_val)) & ~null_mask[:, idx]
+
+        for row in np.flatnonzero(out_of_range):
+            value = float(column[row])
+            player_lookup = player_lookups[row] if player_lookups is not None else None
+            msg = f"{feature_name}[{idx}]={value:.2f} outside [{min_val}, {max_val}]"
+            if is_critical:
+                critical_errors[row].append(msg)
+                logger.error(f"CRITICAL_VALIDATION [{player_lookup}]: {msg}")
+            else:
+                warnings[row].append(msg)
+                logger.debug(f"VALIDATION_WARNING [{player_lookup}]: {msg}")
+
+    is_valid = np.array([not errors for errors in critical_errors], dtype=bool)
+    return is_valid, warnings, critical_errors
+
+
 # ============================================================================
 # FEATURE VARIANCE THRESHOLDS (Session 49 - Pre-write variance validation)
 # ============================================================================
@@ -368,9 +418,6 @@ def validate_batch_variance(records: list, min_records: int = 50) -> dict:
     Returns:
         Dict with is_valid, warnings, critical_errors, stats
     """
-    import numpy as np
-    from collections import defaultdict
-
     if len(records) < min_records:
         return {
             'is_valid': True,
@@ -380,41 +427,71 @@ def validate_batch_variance(records: list, min_records: int = 50) -> dict:
             'reason': f'Skipped: only {len(records)} records (need {min_records})'
         }
 
+    # Extract feature matrix (None = not present, excluded from the stats)
+    feature_lists = [record.get('features', []) for record in records]
+    n_features = max((len(features) for features in feature_lists), default=0)
+    values = np.full((len(records), n_features), np.nan, dtype=np.float64)
+    present = np.zeros((len(records), n_features), dtype=bool)
+    for row, features in enumerate(feature_lists):
+        for idx, value in enumerate(features):
+            if value is not None:
+                values[row, idx] = value
+                present[row, idx] = True
+
+    return validate_batch_variance_matrix(values, present, min_records=min_records)
+
+
+def validate_batch_variance_matrix(values: np.ndarray, present: np.ndarray,
+                                   min_records: int = 50) -> dict:
+    """
+    Columnar core of validate_batch_variance.
+
+    Args:
+        values: (n_records, n_features) float matrix
+        present: Same shape, False where the feature value is None
+        min_records: Minimum records required for variance check
+
+    Returns:
+        Dict with is_valid, warnings, critical_errors, stats
+    """
+    n_records, n_features = values.shape
+    if n_records < min_records:
+        return {
+            'is_valid': True,
+            'warnings': [],
+            'critical_errors': [],
+            'stats': {},
+            'reason': f'Skipped: only {n_records} records (need {min_records})'
+        }
+
     warnings = []
     critical_errors = []
     stats = {}
 
-    # Extract feature arrays
-    feature_values = defaultdict(list)
-    for record in records:
-        features = record.get('features', [])
-        for idx, value in enumerate(features):
-            if value is not None:
-                feature_values[idx].append(value)
-
     # Check variance for monitored features
     for idx, (min_variance, min_distinct, feature_name) in FEATURE_VARIANCE_THRESHOLDS.items():
-        values = feature_values.get(idx, [])
+        if idx >= n_features:
+            continue
 
-        if len(values) < min_records // 2:
+        arr = values[present[:, idx], idx]
+        if len(arr) < min_records // 2:
             continue  # Not enough data for this feature
 
-        arr = np.array(values)
         variance = float(np.std(arr))
-        distinct_values = len(set(round(v, 4) for v in values))
+        distinct_values = len(set(round(v, 4) for v in arr.tolist()))
         mean = float(np.mean(arr))
 
         stats[feature_name] = {
             'stddev': variance,
             'distinct_values': distinct_values,
             'mean': mean,
-            'count': len(values)
+            'count': len(arr)
         }
 
         # Check for zero/near-zero variance (constant value)
         if variance < 0.0001 and distinct_values == 1:
             msg = (f"ZERO_VARIANCE: {feature_name}[{idx}] = {mean:.4f} "
-                   f"(all {len(values)} values identical)")
+                   f"(all {len(arr)} values identical)")
             critical_errors.append(msg)
             logger.error(f"CRITICAL_VARIANCE: {msg}")
 
@@ -497,11 +574,15 @@ class MLFeatureStoreProcessor(
         self.completeness_checker = CompletenessChecker(self.bq_client, self.project_id)
 
         # Helper classes
-        self.feature_extractor = FeatureExtractor(self.bq_client, self.project_id)
+        # MLFS_SNAPSHOT_CACHE_DIR: reuse batch extraction results across retries/reruns
+        self.feature_extractor = FeatureExtractor(
+            self.bq_client, self.project_id, snapshot_cache=get_snapshot_cache()
+        )
         self.feature_calculator = FeatureCalculator()
         self.quality_scorer = QualityScorer()
         self.batch_writer = BatchWriter(self.bq_client, self.project_id)
         self.breakout_risk_calculator = BreakoutRiskCalculator()
+        self.columnar_builder = ColumnarFeatureBuilder(self.feature_extractor, self.feature_calculator)
 
         # Data storage
         self.players_with_games = None
@@ -866,7 +947,13 @@ class MLFeatureStoreProcessor(
         # v3.6 (Session 62): Pass backfill_mode to enable raw betting table joins for Vegas lines
         step_start = time.time()
         self.feature_extractor.batch_extract_all_data(
-            analysis_date, self.players_with_games, backfill_mode=self.is_backfill_mode
+            analysis_date, self.players_with_games, backfill_mode=self.is_backfill_mode,
+            source_hashes={
+                'daily_cache': getattr(self, 'source_daily_cache_hash', None),
+                'composite': getattr(self, 'source_composite_hash', None),
+                'shot_zones': getattr(self, 'source_shot_zones_hash', None),
+                'team_defense': getattr(self, 'source_team_defense_hash', None),
+            }
         )
         self._timing['batch_extract_all_data'] = time.time() - step_start
 
@@ -1415,9 +1502,16 @@ class MLFeatureStoreProcessor(
         # PARALLELIZATION: Replace serial loop with parallel/serial dispatcher
         # ============================================================
         ENABLE_PARALLELIZATION = os.environ.get('ENABLE_PLAYER_PARALLELIZATION', 'true').lower() == 'true'
+        # Columnar mode: build the whole day as one player x feature matrix
+        ENABLE_COLUMNAR = os.environ.get('MLFS_BUILD_MODE', 'row').lower() == 'columnar'
 
         step_start = time.time()
-        if ENABLE_PARALLELIZATION:
+        if ENABLE_COLUMNAR:
+            successful, failed = self._process_players_columnar(
+                self.players_with_games, completeness_results, upstream_completeness,
+                is_bootstrap, is_season_boundary, analysis_date
+            )
+        elif ENABLE_PARALLELIZATION:
             successful, failed = self._process_players_parallel(
                 self.players_with_games, completeness_results, upstream_completeness,
                 is_bootstrap, is_season_boundary, analysis_date
@@ -1597,25 +1691,6 @@ class MLFeatureStoreProcessor(
         game_date = self.opts['analysis_date']
         opponent_team_abbr = player_row.get('opponent_team_abbr')
 
-        # ============================================================
-        # HISTORICAL COMPLETENESS TRACKING (Data Cascade Architecture)
-        # Build completeness metadata BEFORE feature extraction
-        # ============================================================
-        hist_completeness_data = self.feature_extractor.get_historical_completeness_data(player_lookup)
-        historical_completeness = assess_historical_completeness(
-            games_found=hist_completeness_data['games_found'],
-            games_available=hist_completeness_data['games_available'],
-            contributing_dates=hist_completeness_data['contributing_game_dates'],
-            window_size=WINDOW_SIZE
-        )
-
-        # Log if incomplete (and not bootstrap)
-        if historical_completeness.is_data_gap:
-            logger.warning(
-                f"{player_lookup}: Historical data gap - {historical_completeness.games_found}/{historical_completeness.games_expected} games"
-            )
-        # ============================================================
-
         # Extract Phase 4 data (preferred) - pass opponent from player_row
         phase4_data = self.feature_extractor.extract_phase4_data(
             player_lookup, game_date, opponent_team_abbr=opponent_team_abbr
@@ -1646,6 +1721,51 @@ class MLFeatureStoreProcessor(
             quality_score=quality_score,
         )
 
+        return self._build_feature_record(
+            player_row, completeness, upstream_status, circuit_breaker_status,
+            is_bootstrap, is_season_boundary,
+            features=features,
+            feature_sources=feature_sources,
+            quality_score=quality_score,
+            data_source=data_source,
+            quality_fields=quality_fields,
+            days_rest=phase3_data.get('days_rest'),
+        )
+
+    def _build_feature_record(self, player_row: Dict, completeness: Dict, upstream_status: Dict,
+                              circuit_breaker_status: Dict, is_bootstrap: bool, is_season_boundary: bool,
+                              features: list, feature_sources: Dict, quality_score: float,
+                              data_source: str, quality_fields: Dict, days_rest) -> Dict:
+        """
+        Assemble the output record from a computed feature vector.
+
+        Shared by the row path (_generate_player_features) and the columnar
+        path (_process_players_columnar) so both write identical records.
+
+        Returns:
+            Dict with complete record ready for BigQuery
+        """
+        player_lookup = player_row['player_lookup']
+        game_date = self.opts['analysis_date']
+
+        # ============================================================
+        # HISTORICAL COMPLETENESS TRACKING (Data Cascade Architecture)
+        # ============================================================
+        hist_completeness_data = self.feature_extractor.get_historical_completeness_data(player_lookup)
+        historical_completeness = assess_historical_completeness(
+            games_found=hist_completeness_data['games_found'],
+            games_available=hist_completeness_data['games_available'],
+            contributing_dates=hist_completeness_data['contributing_game_dates'],
+            window_size=WINDOW_SIZE
+        )
+
+        # Log if incomplete (and not bootstrap)
+        if historical_completeness.is_data_gap:
+            logger.warning(
+                f"{player_lookup}: Historical data gap - {historical_completeness.games_found}/{historical_completeness.games_expected} games"
+            )
+        # ============================================================
+
         # Build output record with v4.0 source tracking
         record = {
             'player_lookup': player_lookup,
@@ -1663,7 +1783,7 @@ class MLFeatureStoreProcessor(
             # Context
             'opponent_team_abbr': player_row.get('opponent_team_abbr'),
             'is_home': player_row.get('is_home'),
-            'days_rest': phase3_data.get('days_rest'),
+            'days_rest': days_rest,
 
             # Quality (quality_tier uses feature store visibility tiers)
             'quality_tier': get_feature_quality_tier(quality_score),
@@ -2616,104 +2736,162 @@ class MLFeatureStoreProcessor(
 
         return successful, failed
 
-    def _process_single_player(
+    def _check_player_gates(
         self,
         player_row: Dict,
         completeness_results: dict,
         upstream_completeness: dict,
         is_bootstrap: bool,
-        is_season_boundary: bool,
         analysis_date: date
     ) -> tuple:
-        """Process one player (thread-safe). Returns (success: bool, data: dict)."""
-        try:
-            player_lookup = player_row.get('player_lookup', 'unknown')
+        """
+        Run the per-player skip checks (circuit breaker, completeness, upstream).
 
-            # Get completeness for this player
-            completeness = completeness_results.get(player_lookup, {
-                'expected_count': 0, 'actual_count': 0, 'completeness_pct': 0.0,
-                'missing_count': 0, 'is_complete': False, 'is_production_ready': False
-            })
+        Returns:
+            (failure, completeness, upstream_status, circuit_breaker_status)
+            failure is None when the player should be processed, otherwise the
+            failed-entity dict to record.
+        """
+        player_lookup = player_row.get('player_lookup', 'unknown')
 
-            # Check circuit breaker
-            circuit_breaker_status = self._check_circuit_breaker(player_lookup, analysis_date)
+        # Get completeness for this player
+        completeness = completeness_results.get(player_lookup, {
+            'expected_count': 0, 'actual_count': 0, 'completeness_pct': 0.0,
+            'missing_count': 0, 'is_complete': False, 'is_production_ready': False
+        })
 
-            if circuit_breaker_status['active']:
-                logger.warning(
-                    f"{player_lookup}: Circuit breaker active until "
-                    f"{circuit_breaker_status['until']} - skipping"
-                )
-                return (False, {
-                    'entity_id': player_lookup,
-                    'entity_type': 'player',
-                    'reason': f"Circuit breaker active until {circuit_breaker_status['until']}",
-                    'category': 'CIRCUIT_BREAKER_ACTIVE'
-                })
+        # Check circuit breaker
+        circuit_breaker_status = self._check_circuit_breaker(player_lookup, analysis_date)
 
-            # BACKFILL MODE FIX: Skip completeness checks in backfill mode
-            # Session 170: Also skip in same-day mode (skip_dependency_check=True or strict_mode=False)
-            # Session 6 (2026-01-10): Also skip for same-day/future games (games haven't been played)
-            is_same_day_or_future = analysis_date >= date.today()
-            skip_completeness_checks = (
-                self.is_backfill_mode or
-                is_bootstrap or
-                self.opts.get('skip_dependency_check', False) or
-                not self.opts.get('strict_mode', True) or
-                is_same_day_or_future  # Games haven't been played yet
+        if circuit_breaker_status['active']:
+            logger.warning(
+                f"{player_lookup}: Circuit breaker active until "
+                f"{circuit_breaker_status['until']} - skipping"
             )
+            return ({
+                'entity_id': player_lookup,
+                'entity_type': 'player',
+                'reason': f"Circuit breaker active until {circuit_breaker_status['until']}",
+                'category': 'CIRCUIT_BREAKER_ACTIVE'
+            }, completeness, None, circuit_breaker_status)
 
-            # Check production readiness (skip if incomplete, unless in bootstrap/backfill/same-day mode)
-            if not completeness['is_production_ready'] and not skip_completeness_checks:
-                logger.warning(
-                    f"{player_lookup}: Completeness {completeness['completeness_pct']:.1f}% "
-                    f"({completeness['actual_count']}/{completeness['expected_count']} games) - skipping"
-                )
+        # BACKFILL MODE FIX: Skip completeness checks in backfill mode
+        # Session 170: Also skip in same-day mode (skip_dependency_check=True or strict_mode=False)
+        # Session 6 (2026-01-10): Also skip for same-day/future games (games haven't been played)
+        is_same_day_or_future = analysis_date >= date.today()
+        skip_completeness_checks = (
+            self.is_backfill_mode or
+            is_bootstrap or
+            self.opts.get('skip_dependency_check', False) or
+            not self.opts.get('strict_mode', True) or
+            is_same_day_or_future  # Games haven't been played yet
+        )
 
-                # Track reprocessing attempt
-                self._increment_reprocess_count(
-                    player_lookup, analysis_date,
-                    completeness['completeness_pct'],
-                    'incomplete_own_data'
-                )
+        # Check production readiness (skip if incomplete, unless in bootstrap/backfill/same-day mode)
+        if not completeness['is_production_ready'] and not skip_completeness_checks:
+            logger.warning(
+                f"{player_lookup}: Completeness {completeness['completeness_pct']:.1f}% "
+                f"({completeness['actual_count']}/{completeness['expected_count']} games) - skipping"
+            )
 
-                return (False, {
-                    'entity_id': player_lookup,
-                    'entity_type': 'player',
-                    'reason': f"Incomplete own data: {completeness['completeness_pct']:.1f}%",
-                    'category': 'INCOMPLETE_DATA_SKIPPED'
-                })
+            # Track reprocessing attempt
+            self._increment_reprocess_count(
+                player_lookup, analysis_date,
+                completeness['completeness_pct'],
+                'incomplete_own_data'
+            )
+
+            return ({
+                'entity_id': player_lookup,
+                'entity_type': 'player',
+                'reason': f"Incomplete own data: {completeness['completeness_pct']:.1f}%",
+                'category': 'INCOMPLETE_DATA_SKIPPED'
+            }, completeness, None, circuit_breaker_status)
+
+        # Check upstream completeness (CASCADE PATTERN)
+        upstream_status = upstream_completeness.get(player_lookup, {
+            'player_daily_cache_ready': False,
+            'player_composite_factors_ready': False,
+            'player_shot_zone_ready': False,
+            'team_defense_zone_ready': False,
+            'all_upstreams_ready': False
+        })
+
+        if not upstream_status['all_upstreams_ready'] and not skip_completeness_checks:
+            logger.warning(
+                f"{player_lookup}: Upstream not ready "
+                f"(daily_cache={upstream_status['player_daily_cache_ready']}, "
+                f"composite={upstream_status['player_composite_factors_ready']}, "
+                f"shot_zone={upstream_status['player_shot_zone_ready']}, "
+                f"team_defense={upstream_status['team_defense_zone_ready']}) - skipping"
+            )
+
+            # Track reprocessing attempt
+            self._increment_reprocess_count(
+                player_lookup, analysis_date,
+                completeness['completeness_pct'],
+                'incomplete_upstream_dependencies'
+            )
+
+            return ({
+                'entity_id': player_lookup,
+                'entity_type': 'player',
+                'reason': f"Upstream Phase 4 dependencies not ready",
+                'category': 'UPSTREAM_INCOMPLETE'
+            }, completeness, upstream_status, circuit_breaker_status)
+
+        return None, completeness, upstream_status, circuit_breaker_status
+
+    @staticmethod
+    def _apply_range_validation(record: Dict, player_lookup: str, warnings: list,
+                                critical_errors: list) -> tuple:
+        """
+        PRE-WRITE VALIDATION (Session 48 - Feature Quality)
 
-            # Check upstream completeness (CASCADE PATTERN)
-            upstream_status = upstream_completeness.get(player_lookup, {
-                'player_daily_cache_ready': False,
-                'player_composite_factors_ready': False,
-                'player_shot_zone_ready': False,
-                'team_defense_zone_ready': False,
-                'all_upstreams_ready': False
+        Attach range warnings to the record, or block the write on critical
+        range violations (catches bugs like fatigue_score=0 immediately).
+
+        Returns:
+            (success: bool, data: dict)
+        """
+        # Add validation issues to data_quality_issues for tracking
+        if warnings:
+            record['data_quality_issues'] = record.get('data_quality_issues', []) + [
+                f"range_warning:{w}" for w in warnings[:3]  # Limit to 3 to avoid bloat
+            ]
+
+        if critical_errors:
+            # BLOCK write for critical validation failures
+            logger.error(
+                f"BLOCKING_WRITE [{player_lookup}]: Critical validation failed: {critical_errors}"
+            )
+            return (False, {
+                'entity_id': player_lookup,
+                'entity_type': 'player',
+                'reason': f"Critical feature validation failed: {critical_errors}",
+                'category': 'FEATURE_VALIDATION_ERROR'
             })
 
-            if not upstream_status['all_upstreams_ready'] and not skip_completeness_checks:
-                logger.warning(
-                    f"{player_lookup}: Upstream not ready "
-                    f"(daily_cache={upstream_status['player_daily_cache_ready']}, "
-                    f"composite={upstream_status['player_composite_factors_ready']}, "
-                    f"shot_zone={upstream_status['player_shot_zone_ready']}, "
-                    f"team_defense={upstream_status['team_defense_zone_ready']}) - skipping"
-                )
+        return (True, record)
 
-                # Track reprocessing attempt
-                self._increment_reprocess_count(
-                    player_lookup, analysis_date,
-                    completeness['completeness_pct'],
-                    'incomplete_upstream_dependencies'
-                )
+    def _process_single_player(
+        self,
+        player_row: Dict,
+        completeness_results: dict,
+        upstream_completeness: dict,
+        is_bootstrap: bool,
+        is_season_boundary: bool,
+        analysis_date: date
+    ) -> tuple:
+        """Process one player (thread-safe). Returns (success: bool, data: dict)."""
+        try:
+            player_lookup = player_row.get('player_lookup', 'unknown')
 
-                return (False, {
-                    'entity_id': player_lookup,
-                    'entity_type': 'player',
-                    'reason': f"Upstream Phase 4 dependencies not ready",
-                    'category': 'UPSTREAM_INCOMPLETE'
-                })
+            failure, completeness, upstream_status, circuit_breaker_status = self._check_player_gates(
+                player_row, completeness_results, upstream_completeness, is_bootstrap, analysis_date
+            )
+            if failure is not None:
+                return (False, failure)
 
             # Generate features for this player
             start_time = datetime.now()
@@ -2722,36 +2900,12 @@ class MLFeatureStoreProcessor(
 
             record['feature_generation_time_ms'] = int(generation_time_ms)
 
-            # ============================================================
-            # PRE-WRITE VALIDATION (Session 48 - Feature Quality)
             # Validate feature ranges BEFORE writing to BigQuery
-            # This catches bugs like fatigue_score=0 immediately
-            # ============================================================
             is_valid, warnings, critical_errors = validate_feature_ranges(
                 record.get('features', []),
                 player_lookup
             )
-
-            # Add validation issues to data_quality_issues for tracking
-            if warnings:
-                record['data_quality_issues'] = record.get('data_quality_issues', []) + [
-                    f"range_warning:{w}" for w in warnings[:3]  # Limit to 3 to avoid bloat
-                ]
-
-            if critical_errors:
-                # BLOCK write for critical validation failures
-                logger.error(
-                    f"BLOCKING_WRITE [{player_lookup}]: Critical validation failed: {critical_errors}"
-                )
-                return (False, {
-                    'entity_id': player_lookup,
-                    'entity_type': 'player',
-                    'reason': f"Critical feature validation failed: {critical_errors}",
-                    'category': 'FEATURE_VALIDATION_ERROR'
-                })
-            # ============================================================
-
-            return (True, record)
+            return self._apply_range_validation(record, player_lookup, warnings, critical_errors)
 
         except Exception as e:
             player_lookup = player_row.get('player_lookup', 'unknown')
@@ -2763,6 +2917,126 @@ class MLFeatureStoreProcessor(
                 'category': 'calculation_error'
             })
 
+    def _process_players_columnar(
+        self,
+        players_with_games: List[Dict],
+        completeness_results: dict,
+        upstream_completeness: dict,
+        is_bootstrap: bool,
+        is_season_boundary: bool,
+        analysis_date: date
+    ) -> tuple:
+        """
+        Build all players' features as one player x feature matrix (columnar mode).
+
+        Per-player gates still run on a thread pool (the circuit breaker check is
+        a BigQuery lookup), but feature extraction, range validation and quality
+        scoring run column-wise over the whole day. Records are identical to the
+        row path; irregular rows fall back to _process_single_player.
+        """
+        if self.feature_extractor._batch_cache_date != analysis_date:
+            logger.warning("Columnar build requires the batch cache - falling back to row mode")
+            return self._process_players_parallel(
+                players_with_games, completeness_results, upstream_completeness,
+                is_bootstrap, is_season_boundary, analysis_date
+            )
+
+        DEFAULT_WORKERS = 10
+        max_workers = int(os.environ.get(
+            'MLFS_WORKERS',
+            os.environ.get('PARALLELIZATION_WORKERS', DEFAULT_WORKERS)
+        ))
+        max_workers = max(1, min(max_workers, os.cpu_count() or 1))
+        logger.info(f"Processing {len(players_with_games)} players in columnar mode "
+                    f"(gates on {max_workers} workers)")
+
+        loop_start = time.time()
+        successful = []
+        failed = []
+
+        # 1. Per-player gates (I/O bound) - keep input order for the matrix
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            gate_results = list(executor.map(
+                lambda row: self._check_player_gates(
+                    row, completeness_results, upstream_completeness, is_bootstrap, analysis_date
+                ),
+                players_with_games
+            ))
+
+        eligible = []
+        for player_row, (failure, completeness, upstream_status, cb_status) in zip(players_with_games, gate_results):
+            if failure is not None:
+                failed.append(failure)
+            else:
+                eligible.append((player_row, completeness, upstream_status, cb_status))
+
+        if not eligible:
+            return successful, failed
+
+        # 2. Whole-day feature matrix
+        build_start = time.time()
+        matrix = self.columnar_builder.build([e[0] for e in eligible], analysis_date)
+
+        # 3. Column-wise range validation and quality scoring
+        #    (scored sources truncated to FEATURE_COUNT, same as the row path)
+        is_valid, range_warnings, range_errors = validate_feature_matrix_ranges(
+            matrix.values, matrix.null_mask, matrix.player_lookups
+        )
+        scored_sources = matrix.sources[:, :FEATURE_COUNT]
+        quality_scores = self.quality_scorer.calculate_quality_scores(scored_sources)
+        data_sources = self.quality_scorer.determine_primary_sources(scored_sources)
+        quality_fields = self.quality_scorer.build_quality_visibility_fields_batch(
+            scored_sources, FEATURE_NAMES, quality_scores
+        )
+        build_ms_per_player = (time.time() - build_start) * 1000 / len(eligible)
+
+        # 4. Records (irregular rows go through the row path)
+        for row, (player_row, completeness, upstream_status, cb_status) in enumerate(eligible):
+            player_lookup = player_row.get('player_lookup', 'unknown')
+            if row in matrix.irregular_rows:
+                success, data = self._process_single_player(
+                    player_row, completeness_results, upstream_completeness,
+                    is_bootstrap, is_season_boundary, analysis_date
+                )
+                (successful if success else failed).append(data)
+                continue
+
+            try:
+                record_start = time.time()
+                record = self._build_feature_record(
+                    player_row, completeness, upstream_status, cb_status,
+                    is_bootstrap, is_season_boundary,
+                    features=matrix.row_features(row),
+                    feature_sources=matrix.row_sources(row),
+                    quality_score=quality_scores[row],
+                    data_source=data_sources[row],
+                    quality_fields=quality_fields[row],
+                    days_rest=matrix.days_rest[row],
+                )
+                record['feature_generation_time_ms'] = int(
+                    build_ms_per_player + (time.time() - record_start) * 1000
+                )
+                success, data = self._apply_range_validation(
+                    record, player_lookup, range_warnings[row], range_errors[row]
+                )
+                (successful if success else failed).append(data)
+            except Exception as e:
+                logger.error(f"Failed to process {player_lookup}: {e}")
+                failed.append({
+                    'entity_id': player_lookup,
+                    'entity_type': 'player',
+                    'reason': str(e),
+                    'category': 'calculation_error'
+                })
+
+        total_time = time.time() - loop_start
+        logger.info(
+            f"Completed {len(successful)} players in {total_time:.1f}s (columnar) "
+            f"| {len(failed)} failed"
+        )
+
+        return successful, failed
+
     def _process_players_serial(
         self,
         players_with_games: List[Dict],
@@ -32,6 +32,8 @@ import logging
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -441,6 +443,96 @@ class QualityScorer:
             if critical_quality else False
         )
 
+        # ================================================================
+        # Training readiness / optional counts
+        # ================================================================
+        training_quality_count = sum(
+            1 for idx in range(num_features)
+            if per_feature_quality.get(idx, 0) >= TRAINING_QUALITY_THRESHOLD
+        )
+
+        # Optional feature count (non-critical features present)
+        optional_indices = set(range(num_features)) - set(CRITICAL_FEATURES)
+        optional_count = sum(
+            1 for idx in optional_indices if not is_default.get(idx, True)
+        )
+
+        # ================================================================
+        # JSON detail fields
+        # ================================================================
+        fallback_reasons = {}
+        for idx in range(num_features):
+            if is_default.get(idx, False):
+                reason = DEFAULT_FALLBACK_REASONS.get(idx, 'data_unavailable')
+                fallback_reasons[str(idx)] = reason
+
+        default_indices = [idx for idx in range(num_features) if is_default.get(idx, False)]
+
+        return self._assemble_quality_fields(
+            num_features=num_features,
+            quality_score=quality_score,
+            category_quality=category_quality,
+            category_defaults=category_defaults,
+            canonical_counts=canonical_counts,
+            default_count=default_count,
+            required_default_count=required_default_count,
+            has_composite=has_composite,
+            has_opponent_defense=has_opponent_defense,
+            has_vegas=has_vegas,
+            critical_high_quality=critical_high_quality,
+            critical_all_training=critical_all_training,
+            training_quality_count=training_quality_count,
+            optional_count=optional_count,
+            per_feature_quality=[per_feature_quality.get(idx, 0.0) for idx in range(num_features)],
+            per_feature_source=[per_feature_source.get(idx, 'default') for idx in range(num_features)],
+            default_indices=default_indices,
+            fallback_reasons=fallback_reasons,
+            upstream_tables_json=self._upstream_tables_json(num_features),
+            feature_names=feature_names,
+            primary_data_source=self.determine_primary_source(feature_sources),
+            computed_at=datetime.now(timezone.utc).isoformat(),
+        )
+
+    @staticmethod
+    def _upstream_tables_json(num_features: int) -> str:
+        """JSON map of feature index → upstream table (same for every record)."""
+        upstream_tables = {
+            str(idx): FEATURE_UPSTREAM_TABLES.get(idx, 'unknown')
+            for idx in range(num_features)
+        }
+        return json.dumps(upstream_tables)
+
+    def _assemble_quality_fields(
+        self,
+        num_features: int,
+        quality_score: float,
+        category_quality: Dict[str, float],
+        category_defaults: Dict[str, int],
+        canonical_counts: Dict[str, int],
+        default_count: int,
+        required_default_count: int,
+        has_composite: bool,
+        has_opponent_defense: bool,
+        has_vegas: bool,
+        critical_high_quality: int,
+        critical_all_training: bool,
+        training_quality_count: int,
+        optional_count: int,
+        per_feature_quality: List[float],
+        per_feature_source: List[str],
+        default_indices: List[int],
+        fallback_reasons: Dict[str, str],
+        upstream_tables_json: str,
+        feature_names: list,
+        primary_data_source: str,
+        computed_at: str,
+    ) -> Dict:
+        """
+        Build the quality visibility fields dict from pre-computed aggregates.
+
+        Shared by the per-record and batch (columnar) paths so both emit the
+        same fields in the same order.
+        """
         # ================================================================
         # Tier and alert calculations
         # ================================================================
@@ -478,11 +570,6 @@ class QualityScorer:
         # ================================================================
         # Training readiness
         # ================================================================
-        training_quality_count = sum(
-            1 for idx in range(num_features)
-            if per_feature_quality.get(idx, 0) >= TRAINING_QUALITY_THRESHOLD
-        )
-
         is_training_ready = (
             quality_tier in ('gold', 'silver')
             and matchup_pct >= 70
@@ -501,33 +588,12 @@ class QualityScorer:
             and required_default_count == 0
         )
 
-        # Optional feature count (non-critical features present)
-        optional_indices = set(range(num_features)) - set(CRITICAL_FEATURES)
-        optional_count = sum(
-            1 for idx in optional_indices if not is_default.get(idx, True)
-        )
-
-        # ================================================================
-        # JSON detail fields
-        # ================================================================
-        fallback_reasons = {}
-        for idx in range(num_features):
-            if is_default.get(idx, False):
-                reason = DEFAULT_FALLBACK_REASONS.get(idx, 'data_unavailable')
-                fallback_reasons[str(idx)] = reason
-
-        upstream_tables = {
-            str(idx): FEATURE_UPSTREAM_TABLES.get(idx, 'unknown')
-            for idx in range(num_features)
-        }
-
         # ================================================================
         # Build the complete fields dict
         # ================================================================
         fields = {}
 
         # --- Session 142: Default feature indices for per-feature audit trail ---
-        default_indices = [idx for idx in range(num_features) if is_default.get(idx, False)]
         fields['default_feature_indices'] = default_indices
 
         # --- Section 1: Aggregate Quality (9 new fields) ---
@@ -566,11 +632,11 @@ class QualityScorer:
 
         # --- Section 3: Per-Feature Quality (37 fields) ---
         for idx in range(num_features):
-            fields[f'feature_{idx}_quality'] = per_feature_quality.get(idx, 0.0)
+            fields[f'feature_{idx}_quality'] = per_feature_quality[idx]
 
         # --- Section 4: Per-Feature Source (37 fields) ---
         for idx in range(num_features):
-            fields[f'feature_{idx}_source'] = per_feature_source.get(idx, 'default')
+            fields[f'feature_{idx}_source'] = per_feature_source[idx]
 
         # --- Section 5: Per-Feature Details JSON (6 fields) ---
         fields['feature_fallback_reasons_json'] = (
@@ -579,7 +645,7 @@ class QualityScorer:
         fields['feature_sample_sizes_json'] = '{}'
         fields['feature_expected_values_json'] = '{}'
         fields['feature_value_ranges_valid_json'] = '{}'
-        fields['feature_upstream_tables_json'] = json.dumps(upstream_tables)
+        fields['feature_upstream_tables_json'] = upstream_tables_json
         fields['feature_last_updated_json'] = '{}'
 
         # --- Section 6: Model Compatibility (4 fields) ---
@@ -594,12 +660,12 @@ class QualityScorer:
         fields['missing_processors'] = None
         fields['feature_store_age_hours'] = 0.0
         fields['upstream_data_freshness_hours'] = None
-        fields['quality_computed_at'] = datetime.now(timezone.utc).isoformat()
+        fields['quality_computed_at'] = computed_at
         fields['quality_schema_version'] = QUALITY_SCHEMA_VERSION
 
         # --- Section 8: Legacy (3 fields) ---
         # feature_sources handled separately by processor (dict -> JSON rename)
-        fields['primary_data_source'] = self.determine_primary_source(feature_sources)
+        fields['primary_data_source'] = primary_data_source
         fields['matchup_data_status'] = (
             'MATCHUP_UNAVAILABLE' if matchup_pct < 50 else 'COMPLETE'
         )
@@ -609,6 +675,187 @@ class QualityScorer:
 
         return fields
 
+    # ========================================================================
+    # BATCH SCORING (columnar build mode)
+    # ========================================================================
+    # Same results as calculate_quality_score / determine_primary_source /
+    # build_quality_visibility_fields, computed over a player x feature source
+    # matrix in a few array passes instead of once per record.
+
+    @staticmethod
+    def _source_arrays(source_matrix: np.ndarray) -> tuple:
+        """Map a source matrix to (weights, canonical sources, is_default) arrays."""
+        sources = np.asarray(source_matrix, dtype=object)
+        flat = sources.ravel().astype(str)
+        uniq, inverse = np.unique(flat, return_inverse=True)
+        inverse = inverse.ravel()
+        weights = np.array(
+            [float(SOURCE_WEIGHTS.get(s, 40)) for s in uniq], dtype=np.float64
+        )[inverse].reshape(sources.shape)
+        canonical = np.array(
+            [SOURCE_TYPE_CANONICAL.get(s, 'default') for s in uniq], dtype=object
+        )[inverse].reshape(sources.shape)
+        is_default = np.isin(flat, ['default', 'fallback', 'missing']).reshape(sources.shape)
+        return weights, canonical, is_default
+
+    @staticmethod
+    def _index_mask(indices, num_features: int) -> np.ndarray:
+        mask = np.zeros(num_features, dtype=bool)
+        mask[[idx for idx in indices if idx < num_features]] = True
+        return mask
+
+    def calculate_quality_scores(self, source_matrix: np.ndarray) -> List[float]:
+        """
+        Batch version of calculate_quality_score.
+
+        Args:
+            source_matrix: (n_records, n_features) array of raw source labels
+
+        Returns:
+            List of quality scores, one per record
+        """
+        n_records = source_matrix.shape[0]
+        num_features = min(source_matrix.shape[1], FEATURE_COUNT)
+        if num_features == 0:
+            return [0.0] * n_records
+
+        weights, _, is_default = self._source_arrays(source_matrix[:, :num_features])
+        optional = self._index_mask(OPTIONAL_FEATURES, num_features)
+
+        counted_mask = ~(is_default & optional)
+        counted = counted_mask.sum(axis=1)
+        total_weight = np.where(counted_mask, weights, 0.0).sum(axis=1)
+        scores = np.divide(
+            total_weight, counted, out=np.zeros(n_records, dtype=np.float64), where=counted > 0
+        )
+
+        # Session 157: same default penalty cap as the per-record path
+        required_defaults = (is_default & ~optional).sum(axis=1)
+        scores = np.where(required_defaults >= 5, np.minimum(scores, 49.0),
+                          np.where(required_defaults >= 1, np.minimum(scores, 69.0), scores))
+
+        return [round(float(score), 2) for score in scores]
+
+    def determine_primary_sources(self, source_matrix: np.ndarray) -> List[str]:
+        """Batch version of determine_primary_source."""
+        total = source_matrix.shape[1]
+        if total == 0:
+            return ['unknown'] * source_matrix.shape[0]
+
+        phase4_pct = (source_matrix == 'phase4').sum(axis=1) / total
+        phase3_pct = (source_matrix == 'phase3').sum(axis=1) / total
+        primary = np.where(phase4_pct >= 0.90, 'phase4',
+                           np.where(phase4_pct >= 0.50, 'phase4_partial',
+                                    np.where(phase3_pct >= 0.50, 'phase3', 'mixed')))
+        return primary.tolist()
+
+    def build_quality_visibility_fields_batch(
+        self,
+        source_matrix: np.ndarray,
+        feature_names: list,
+        quality_scores: List[float],
+    ) -> List[Dict]:
+        """
+        Batch version of build_quality_visibility_fields.
+
+        Args:
+            source_matrix: (n_records, n_features) array of raw source labels
+            feature_names: List of feature names
+            quality_scores: Pre-computed scores (from calculate_quality_scores)
+
+        Returns:
+            List of quality visibility field dicts, one per record
+        """
+        n_records = source_matrix.shape[0]
+        num_features = min(source_matrix.shape[1], len(feature_names), FEATURE_COUNT)
+        scored = source_matrix[:, :num_features]
+
+        quality, canonical, is_default = self._source_arrays(scored)
+        optional = self._index_mask(OPTIONAL_FEATURES, num_features)
+        critical = self._index_mask(CRITICAL_FEATURES, num_features)
+
+        canonical_counts = {
+            name: (canonical == name).sum(axis=1)
+            for name in ('phase4', 'phase3', 'calculated')
+        }
+        default_count = is_default.sum(axis=1)
+        required_default_count = (is_default & ~optional).sum(axis=1)
+
+        category_sums = {}
+        category_sizes = {}
+        category_defaults = {}
+        for cat_name, cat_indices in FEATURE_CATEGORIES.items():
+            cat_mask = self._index_mask(cat_indices, num_features)
+            category_sums[cat_name] = quality[:, cat_mask].sum(axis=1)
+            category_sizes[cat_name] = int(cat_mask.sum())
+            category_defaults[cat_name] = is_default[:, cat_mask].sum(axis=1)
+
+        composite = self._index_mask(COMPOSITE_FACTOR_FEATURES, num_features)
+        opponent = self._index_mask(OPPONENT_DEFENSE_FEATURES, num_features)
+        has_composite = ~is_default[:, composite].any(axis=1)
+        has_opponent_defense = ~is_default[:, opponent].any(axis=1)
+        if num_features > 28:
+            has_vegas = ~is_default[:, 28]
+        else:
+            has_vegas = np.zeros(n_records, dtype=bool)
+
+        high_quality = quality >= TRAINING_QUALITY_THRESHOLD
+        critical_high_quality = high_quality[:, critical].sum(axis=1)
+        n_critical = int(critical.sum())
+        critical_all_training = (
+            critical_high_quality == n_critical if n_critical else np.zeros(n_records, dtype=bool)
+        )
+        training_quality_count = high_quality.sum(axis=1)
+        optional_count = (~is_default[:, ~critical]).sum(axis=1)
+
+        primary_sources = self.determine_primary_sources(source_matrix)
+        upstream_tables_json = self._upstream_tables_json(num_features)
+        computed_at = datetime.now(timezone.utc).isoformat()
+
+        results = []
+        for row in range(n_records):
+            default_indices = np.flatnonzero(is_default[row]).tolist()
+            results.append(self._assemble_quality_fields(
+                num_features=num_features,
+                quality_score=quality_scores[row],
+                category_quality={
+                    cat_name: (
+                        round(float(category_sums[cat_name][row]) / category_sizes[cat_name], 1)
+                        if category_sizes[cat_name] else 0.0
+                    )
+                    for cat_name in FEATURE_CATEGORIES
+                },
+                category_defaults={
+                    cat_name: int(category_defaults[cat_name][row])
+                    for cat_name in FEATURE_CATEGORIES
+                },
+                canonical_counts={
+                    name: int(counts[row]) for name, counts in canonical_counts.items()
+                },
+                default_count=int(default_count[row]),
+                required_default_count=int(required_default_count[row]),
+                has_composite=bool(has_composite[row]),
+                has_opponent_defense=bool(has_opponent_defense[row]),
+                has_vegas=bool(has_vegas[row]),
+                critical_high_quality=int(critical_high_quality[row]),
+                critical_all_training=bool(critical_all_training[row]),
+                training_quality_count=int(training_quality_count[row]),
+                optional_count=int(optional_count[row]),
+                per_feature_quality=quality[row].tolist(),
+                per_feature_source=canonical[row].tolist(),
+                default_indices=default_indices,
+                fallback_reasons={
+                    str(idx): DEFAULT_FALLBACK_REASONS.get(idx, 'data_unavailable')
+                    for idx in default_indices
+                },
+                upstream_tables_json=upstream_tables_json,
+                feature_names=feature_names,
+                primary_data_source=primary_sources[row],
+                computed_at=computed_at,
+            ))
+
+        return results
+
     def _summarize_sources(self, feature_sources: Dict[int, str]) -> str:
         """Generate human-readable summary of sources."""
         phase4 = sum(1 for s in feature_sources.values() if s == 'phase4')
@@ -0,0 +1,142 @@
+# File: data_processors/precompute/ml_feature_store/snapshot_cache.py
+"""
+Extraction Snapshot Cache - Persistent Per-Date Query Results
+
+FeatureExtractor.batch_extract_all_data() runs ~19 BigQuery extractions per
+game date. Retries, reruns and backfill passes re-run all of them, even when
+only one feature changed.
+
+This cache stores the DataFrame returned by each extraction query as one
+Arrow IPC (Feather v2) file, keyed by:
+
+    (game_date, extraction name, upstream source hash, query text)
+
+- Upstream source hash: the Phase 4 data_hash values from
+  MLFeatureStoreProcessor._extract_source_hashes(). Extractions that read a
+  Phase 4 table are keyed by that table's hash; the others are keyed by the
+  combined hash of all four (Phase 4 is rebuilt whenever Phase 3 changes).
+- Query text: editing an extraction's SQL changes its key, so re-running a
+  season after changing one feature only re-queries that extraction.
+
+Layout: {root}/{game_date}/{extraction}/{key}.arrow
+
+Safety rules:
+- Only dates before today are cached (betting lines still move on game day).
+- Nothing is cached unless all four source hashes are known.
+- Cached frames are returned as copies; Arrow round-trips BigQuery dtypes
+  (dbdate, Int64, timestamps) exactly.
+
+Enable with MLFS_SNAPSHOT_CACHE_DIR=/path (or backfill --snapshot-cache-dir).
+
+Version: 1.0
+Created: 2026-10-16
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_CACHE_DIR_ENV = 'MLFS_SNAPSHOT_CACHE_DIR'
+
+# Extraction -> Phase 4 source it reads (key of the source-hash dict)
+EXTRACTION_SOURCES = {
+    'daily_cache': 'daily_cache',
+    'composite_factors': 'composite',
+    'shot_zone': 'shot_zones',
+    'team_defense': 'team_defense',
+}
+REQUIRED_SOURCES = ('daily_cache', 'composite', 'shot_zones', 'team_defense')
+
+
+def get_snapshot_cache() -> Optional['ExtractionSnapshotCache']:
+    """Build the cache from MLFS_SNAPSHOT_CACHE_DIR, or None if unset."""
+    root = os.environ.get(SNAPSHOT_CACHE_DIR_ENV, '')
+    return ExtractionSnapshotCache(root) if root else None
+
+
+class ExtractionSnapshotCache:
+    """Arrow snapshot store for FeatureExtractor query results."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self._lock = threading.Lock()
+        # extraction -> {'hits', 'misses', 'hit_seconds', 'miss_seconds'}
+        self._stats: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {'hits': 0, 'misses': 0, 'hit_seconds': 0.0, 'miss_seconds': 0.0}
+        )
+
+    @staticmethod
+    def source_key(extraction: str, source_hashes: Dict[str, Optional[str]]) -> Optional[str]:
+        """Upstream hash for an extraction, or None if it cannot be keyed safely."""
+        if any(not source_hashes.get(source) for source in REQUIRED_SOURCES):
+            return None
+        source = EXTRACTION_SOURCES.get(extraction)
+        if source is not None:
+            return source_hashes[source]
+        return '|'.join(source_hashes[s] for s in REQUIRED_SOURCES)
+
+    @staticmethod
+    def cacheable_date(game_date: date) -> bool:
+        return game_date < date.today()
+
+    def _path(self, game_date: date, extraction: str, source_key: str, query: str) -> str:
+        digest = hashlib.sha256(f"{source_key}\n{query}".encode('utf-8')).hexdigest()[:24]
+        return os.path.join(self.root, str(game_date), extraction, f"{digest}.arrow")
+
+    def get(self, game_date: date, extraction: str, source_key: str, query: str) -> Optional[pd.DataFrame]:
+        """Return the cached frame, or None on a miss (or unreadable entry)."""
+        path = self._path(game_date, extraction, source_key, query)
+        if not os.path.exists(path):
+            return None
+        try:
+            return feather.read_table(path).to_pandas()
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"[SNAPSHOT_CACHE] Unreadable snapshot {path}, re-querying: {e}")
+            return None
+
+    def put(self, game_date: date, extraction: str, source_key: str, query: str,
+            df: pd.DataFrame) -> bool:
+        """Store a query result. Returns False (and logs) if it cannot be stored."""
+        path = self._path(game_date, extraction, source_key, query)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            feather.write_feather(pa.Table.from_pandas(df, preserve_index=False), tmp_path)
+            os.replace(tmp_path, path)  # concurrent readers never see a partial file
+            return True
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"[SNAPSHOT_CACHE] Could not store {extraction} for {game_date}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+
+    def record(self, extraction: str, hit: bool, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats[extraction]
+            if hit:
+                stats['hits'] += 1
+                stats['hit_seconds'] += seconds
+            else:
+                stats['misses'] += 1
+                stats['miss_seconds'] += seconds
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {name: dict(values) for name, values in self._stats.items()}
+
+    def summary(self) -> Dict[str, int]:
+        stats = self.stats()
+        return {
+            'snapshot_hits': int(sum(s['hits'] for s in stats.values())),
+            'snapshot_misses': int(sum(s['misses'] for s in stats.values())),
+        }
@@ -22,11 +22,15 @@ from google.cloud import bigquery
 import hashlib
 
 from data_processors.precompute.base import PrecomputeProcessorBase
+from shared.utils.fetch_graph import FetchGraph, StaticFetchCache
 
 logger = logging.getLogger(__name__)
 
 FEATURE_VERSION = "v2_35features"
 
+# Concurrent BigQuery lookups per date (see _fetch_inputs)
+FETCH_WORKERS = 8
+
 
 class MlbPitcherFeaturesProcessor(PrecomputeProcessorBase):
     """Computes pitcher ML features for strikeout prediction."""
@@ -36,6 +40,8 @@ class MlbPitcherFeaturesProcessor(PrecomputeProcessorBase):
         self.processor_name = "mlb_pitcher_features"
         self.target_table = "mlb_precompute.pitcher_ml_features"
         self.feature_version = FEATURE_VERSION
+        # Reference lookups (ballpark factors, handedness) reused across dates
+        self._static_fetches = StaticFetchCache()
 
     def get_dependencies(self) -> dict:
         """Define upstream data dependencies for this processor."""
@@ -74,50 +80,23 @@ class MlbPitcherFeaturesProcessor(PrecomputeProcessorBase):
             logger.info(f"No games scheduled for {game_date}")
             return {"status": "no_games", "processed": 0}
 
-        # 2. Get lineup data (which batters face each pitcher)
-        lineups = self._get_lineups(game_date)
-
-        # 3. Get pitcher analytics (rolling K averages)
-        pitcher_stats = self._get_pitcher_analytics(game_date)
-
-        # 4. Get batter analytics (rolling K rates)
-        batter_stats = self._get_batter_analytics(game_date)
-
-        # 5. Get betting lines
-        betting_lines = self._get_betting_lines(game_date)
-
-        # 6. Get pitcher splits (home/away, day/night)
-        pitcher_splits = self._get_pitcher_splits(game_date)
-
-        # 7. Get game lines (totals, moneylines)
-        game_lines = self._get_game_lines(game_date)
-
-        # 8. Get ballpark factors
-        ballpark_factors = self._get_ballpark_factors()
-
-        # 9. Get pitcher vs team history
-        pitcher_vs_team = self._get_pitcher_vs_team(game_date)
-
-        # 10. Get lineup K analysis (V1 features)
-        lineup_analysis = self._get_lineup_analysis(game_date)
-
-        # 11. Get umpire data (V1 features)
-        umpire_data = self._get_umpire_data(game_date)
-
-        # 12. Get innings projections (V1 features)
-        innings_projections = self._get_innings_projections(game_date)
-
-        # 13. Get pitcher arsenal data (V2 features)
-        arsenal_data = self._get_arsenal_data(game_date)
-
-        # 14. Get batter K profiles (V2 features)
-        batter_profiles = self._get_batter_profiles(game_date)
-
-        # 15. Get batter splits for platoon (V1/V2 features)
-        batter_splits = self._get_batter_splits(game_date)
-
-        # 16. Get pitcher handedness
-        pitcher_hands = self._get_pitcher_handedness()
+        # 2-16. Fetch every lookup; independent queries run concurrently
+        fetched = self._fetch_inputs(game_date)
+        lineups = fetched['lineups']
+        pitcher_stats = fetched['pitcher_stats']
+        batter_stats = fetched['batter_stats']
+        betting_lines = fetched['betting_lines']
+        pitcher_splits = fetched['pitcher_splits']
+        game_lines = fetched['game_lines']
+        ballpark_factors = fetched['ballpark_factors']
+        pitcher_vs_team = fetched['pitcher_vs_team']
+        lineup_analysis = fetched['lineup_analysis']
+        umpire_data = fetched['umpire_data']
+        innings_projections = fetched['innings_projections']
+        arsenal_data = fetched['arsenal_data']
+        batter_profiles = fetched['batter_profiles']
+        batter_splits = fetched['batter_splits']
+        pitcher_hands = fetched['pitcher_hands']
 
         # 17. Compute features for each pitcher
         features_list = []
@@ -159,6 +138,38 @@ class MlbPitcherFeaturesProcessor(PrecomputeProcessorBase):
 
         return {"status": "no_features", "processed": 0}
 
+    def _fetch_inputs(self, game_date: date) -> Dict[str, Any]:
+        """
+        Run the per-date lookups as a fetch graph.
+
+        None of these queries depend on each other, so they all run
+        concurrently. Ballpark factors and pitcher handedness are not
+        date-scoped and are cached for the life of the processor, so a
+        backfill queries them once.
+        """
+        graph = FetchGraph(self.processor_name, max_workers=FETCH_WORKERS,
+                           static_cache=self._static_fetches)
+        date_scoped = (
+            ('lineups', self._get_lineups),                           # batting order by game_pk
+            ('pitcher_stats', self._get_pitcher_analytics),           # rolling K averages
+            ('batter_stats', self._get_batter_analytics),             # rolling K rates
+            ('betting_lines', self._get_betting_lines),
+            ('pitcher_splits', self._get_pitcher_splits),             # home/away, day/night
+            ('game_lines', self._get_game_lines),                     # totals, moneylines
+            ('pitcher_vs_team', self._get_pitcher_vs_team),
+            ('lineup_analysis', self._get_lineup_analysis),           # V1 features
+            ('umpire_data', self._get_umpire_data),                   # V1 features
+            ('innings_projections', self._get_innings_projections),   # V1 features
+            ('arsenal_data', self._get_arsenal_data),                 # V2 features
+            ('batter_profiles', self._get_batter_profiles),           # V2 features
+            ('batter_splits', self._get_batter_splits),               # platoon (V1/V2)
+        )
+        for name, fn in date_scoped:
+            graph.add(name, fn, inputs=('game_date',))
+        graph.add('ballpark_factors', self._get_ballpark_factors, static=True)
+        graph.add('pitcher_hands', self._get_pitcher_handedness, static=True)
+        return graph.run(game_date=game_date)
+
     def _get_schedule(self, game_date: date) -> List[Dict]:
         """Get scheduled games with probable pitchers."""
         query = f"""
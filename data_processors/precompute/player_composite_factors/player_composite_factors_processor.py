@@ -39,6 +39,7 @@ import logging
 import json
 import os
 import time
+from contextlib import nullcontext
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, date, timezone, timedelta
 from typing import Dict, List, Optional
@@ -61,7 +62,10 @@ from shared.config.nba_season_dates import is_early_season, get_season_year_from
 from shared.validation.config import BOOTSTRAP_DAYS
 
 # Factor calculators and worker
-from .worker import _process_single_player_worker
+from .worker import _process_single_player_worker, _process_single_player_shared_worker
+from data_processors.precompute.utils.shared_frames import (
+    EMPTY_SPAN, SharedFrameStore, shared_inputs_enabled
+)
 from .factors import ACTIVE_FACTORS, DEFERRED_FACTORS
 
 # Configure logging
@@ -1180,42 +1184,46 @@ class PlayerCompositeFactorsProcessor(
         # PRE-FETCH: Prepare all data BEFORE workers (no BQ in workers)
         # ============================================================
 
-        # Convert DataFrames to dicts for pickling
-        player_rows = {}
-        player_shots = {}
-        team_defenses = {}
+        # Publish source frames once into shared memory; fall back to per-player dicts
+        shared_store, shared_index = self._publish_shared_inputs() if shared_inputs_enabled() else (None, None)
 
-        for player_lookup in all_players:
-            # Get player row
-            player_row = self.player_context_df[
-                self.player_context_df['player_lookup'] == player_lookup
-            ]
-            if not player_row.empty:
-                player_rows[player_lookup] = player_row.iloc[0].to_dict()
-            else:
-                player_rows[player_lookup] = None
+        if shared_store is None:
+            # Convert DataFrames to dicts for pickling
+            player_rows = {}
+            player_shots = {}
+            team_defenses = {}
 
-            # Get player shot data
-            if self.player_shot_df is not None and not self.player_shot_df.empty:
-                match = self.player_shot_df[
-                    self.player_shot_df['player_lookup'] == player_lookup
+            for player_lookup in all_players:
+                # Get player row
+                player_row = self.player_context_df[
+                    self.player_context_df['player_lookup'] == player_lookup
                 ]
-                player_shots[player_lookup] = match.iloc[0].to_dict() if not match.empty else None
-            else:
-                player_shots[player_lookup] = None
-
-            # Get team defense data (by opponent)
-            if player_rows[player_lookup]:
-                opponent_abbr = player_rows[player_lookup].get('opponent_team_abbr')
-                if opponent_abbr and self.team_defense_df is not None and not self.team_defense_df.empty:
-                    match = self.team_defense_df[
-                        self.team_defense_df['team_abbr'] == opponent_abbr
+                if not player_row.empty:
+                    player_rows[player_lookup] = player_row.iloc[0].to_dict()
+                else:
+                    player_rows[player_lookup] = None
+
+                # Get player shot data
+                if self.player_shot_df is not None and not self.player_shot_df.empty:
+                    match = self.player_shot_df[
+                        self.player_shot_df['player_lookup'] == player_lookup
                     ]
-                    team_defenses[player_lookup] = match.iloc[0].to_dict() if not match.empty else None
+                    player_shots[player_lookup] = match.iloc[0].to_dict() if not match.empty else None
+                else:
+                    player_shots[player_lookup] = None
+
+                # Get team defense data (by opponent)
+                if player_rows[player_lookup]:
+                    opponent_abbr = player_rows[player_lookup].get('opponent_team_abbr')
+                    if opponent_abbr and self.team_defense_df is not None and not self.team_defense_df.empty:
+                        match = self.team_defense_df[
+                            self.team_defense_df['team_abbr'] == opponent_abbr
+                        ]
+                        team_defenses[player_lookup] = match.iloc[0].to_dict() if not match.empty else None
+                    else:
+                        team_defenses[player_lookup] = None
                 else:
                     team_defenses[player_lookup] = None
-            else:
-                team_defenses[player_lookup] = None
 
         # Prepare source hashes
         source_hashes = {
@@ -1232,12 +1240,20 @@ class PlayerCompositeFactorsProcessor(
         # WORKERS: Process players in parallel
         # ============================================================
 
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pool_kwargs = {'max_workers': max_workers}
+        if shared_store is not None:
+            pool_kwargs = shared_store.pool_kwargs(**pool_kwargs)
+
+        with shared_store or nullcontext(), ProcessPoolExecutor(**pool_kwargs) as executor:
             # Submit all player tasks
             futures = {}
             for player_lookup in all_players:
                 # Skip if no player row
-                if player_rows[player_lookup] is None:
+                if shared_store is not None:
+                    player_found = player_lookup in shared_index['player_context']
+                else:
+                    player_found = player_rows[player_lookup] is not None
+                if not player_found:
                     failed.append({
                         'entity_id': player_lookup,
                         'entity_type': 'player',
@@ -1277,12 +1293,18 @@ class PlayerCompositeFactorsProcessor(
                 })
 
                 # Submit to worker
-                future = executor.submit(
-                    _process_single_player_worker,
-                    player_lookup,
-                    player_rows[player_lookup],
-                    player_shots[player_lookup],
-                    team_defenses[player_lookup],
+                if shared_store is not None:
+                    worker_fn = _process_single_player_shared_worker
+                    player_args = (player_lookup, self._shared_spans_for(player_lookup, shared_index))
+                else:
+                    worker_fn = _process_single_player_worker
+                    player_args = (
+                        player_lookup,
+                        player_rows[player_lookup],
+                        player_shots[player_lookup],
+                        team_defenses[player_lookup],
+                    )
+                task_args = player_args + (
                     completeness,
                     upstream_status,
                     circuit_breaker_status,
@@ -1294,6 +1316,9 @@ class PlayerCompositeFactorsProcessor(
                     source_tracking,
                     self.HASH_FIELDS
                 )
+                if shared_store is not None:
+                    shared_store.record_task(task_args)
+                future = executor.submit(worker_fn, *task_args)
                 futures[future] = player_lookup
 
             # Collect results as they complete
@@ -1335,9 +1360,56 @@ class PlayerCompositeFactorsProcessor(
             f"(avg {total_time/len(successful) if successful else 0:.2f}s/player) "
             f"| {len(failed)} failed"
         )
+        if shared_store is not None:
+            shared_store.log_summary('Composite factors')
+            self.stats.update(shared_store.stats())
 
         return successful, failed
 
+    def _publish_shared_inputs(self) -> tuple:
+        """
+        Publish context, shot zone and team defense frames for ProcessPool workers.
+
+        Returns:
+            (SharedFrameStore, index) where index maps frame name -> span index,
+            plus 'player_opponent' (player -> opponent_team_abbr of first context row).
+            (None, None) if a frame cannot be published; workers then receive
+            per-player dicts as before.
+        """
+        store = SharedFrameStore()
+        shot_df = self.player_shot_df if self.player_shot_df is not None and not self.player_shot_df.empty else None
+        defense_df = self.team_defense_df if self.team_defense_df is not None and not self.team_defense_df.empty else None
+        try:
+            index = {
+                'player_context': store.publish('player_context', self.player_context_df, key='player_lookup'),
+                'player_shot': store.publish('player_shot', shot_df, key='player_lookup'),
+                'team_defense': store.publish('team_defense', defense_df, key='team_abbr'),
+            }
+        except Exception as e:
+            store.close()
+            logger.warning(f"Shared-memory inputs unavailable, falling back to per-player dicts: {e}")
+            return None, None
+
+        context = self.player_context_df
+        if context is not None and not context.empty:
+            index['player_opponent'] = (
+                context.drop_duplicates('player_lookup', keep='first')
+                .set_index('player_lookup')['opponent_team_abbr'].to_dict()
+            )
+        else:
+            index['player_opponent'] = {}
+        return store, index
+
+    @staticmethod
+    def _shared_spans_for(player_lookup: str, index: dict) -> Dict[str, tuple]:
+        """Row spans of one player's data in each published frame."""
+        opponent = index['player_opponent'].get(player_lookup)
+        return {
+            'player_context': index['player_context'].get(player_lookup, EMPTY_SPAN),
+            'player_shot': index['player_shot'].get(player_lookup, EMPTY_SPAN),
+            'team_defense': index['team_defense'].get(opponent, EMPTY_SPAN) if isinstance(opponent, str) and opponent else EMPTY_SPAN,
+        }
+
     def _process_single_player(
         self,
         player_lookup: str,
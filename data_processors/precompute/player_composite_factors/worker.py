@@ -17,6 +17,8 @@ from pathlib import Path
 from typing import Optional
 import pandas as pd
 
+from data_processors.precompute.utils.shared_frames import read_shared_slice
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -368,3 +370,32 @@ def _validate_feature_ranges(record: dict) -> list:
                 violations.append(f"WARNING:{feature} has invalid type: {type(value)}")
 
     return violations
+
+
+def _first_shared_row(name: str, span: tuple) -> Optional[dict]:
+    """First row of a published frame slice as a dict (None if no rows)."""
+    rows = read_shared_slice(name, span)
+    if rows is None or rows.empty:
+        return None
+    return rows.iloc[0].to_dict()
+
+
+def _process_single_player_shared_worker(
+    player_lookup: str,
+    spans: dict,
+    *args
+) -> tuple:
+    """Shared-memory entry point for ProcessPoolExecutor.
+
+    Reads this player's context, shot zone and opponent defense rows from the
+    frames published by PlayerCompositeFactorsProcessor and delegates to
+    _process_single_player_worker. ``args`` are the remaining positional
+    arguments of _process_single_player_worker.
+    """
+    return _process_single_player_worker(
+        player_lookup,
+        _first_shared_row('player_context', spans['player_context']),
+        _first_shared_row('player_shot', spans['player_shot']),
+        _first_shared_row('team_defense', spans['team_defense']),
+        *args
+    )
@@ -33,6 +33,7 @@ Date: October 30, 2025
 import logging
 import os
 import time
+from contextlib import nullcontext
 from datetime import datetime, date, timedelta, timezone
 from typing import Dict, List, Optional
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
@@ -58,7 +59,10 @@ from shared.config.nba_season_dates import is_early_season, get_season_year_from
 from shared.validation.config import BOOTSTRAP_DAYS
 
 # Module components (extracted for better organization)
-from .worker import _process_single_player_worker
+from .worker import _process_single_player_worker, _process_single_player_shared_worker
+from data_processors.precompute.utils.shared_frames import (
+    EMPTY_SPAN, SharedFrameStore, pick_key, shared_inputs_enabled
+)
 from .aggregators import StatsAggregator, TeamAggregator, ContextAggregator, ShotZoneAggregator
 from .builders import CacheBuilder, MultiWindowCompletenessChecker
 
@@ -1234,33 +1238,64 @@ class PlayerDailyCacheProcessor(
             'shot_zone': self.source_shot_zone_hash
         }
 
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all player tasks using module-level worker function
-            futures = {
-                executor.submit(
-                    _process_single_player_worker,  # Module-level function (picklable)
-                    player_lookup,
-                    self.upcoming_context_data,     # DataFrames are picklable
-                    self.player_game_data,
-                    self.team_offense_data,
-                    self.shot_zone_data,
-                    completeness_l5,
-                    completeness_l10,
-                    completeness_l7d,
-                    completeness_l14d,
-                    is_bootstrap,
-                    is_season_boundary,
-                    analysis_date,
-                    circuit_breaker_map.get(player_lookup, {'active': False, 'attempts': 0, 'until': None}),
-                    self.min_games_required,
-                    self.absolute_min_games,
-                    self.cache_version,
-                    source_tracking_fields,
-                    source_hashes,
-                    self.MAX_DAYS_WITHOUT_ACTIVE_GAME  # Session 128: Recency filter
-                ): player_lookup
-                for player_lookup in all_players
-            }
+        # Publish the source frames once into shared memory (workers slice by offset)
+        shared_store, shared_index = self._publish_shared_inputs() if shared_inputs_enabled() else (None, None)
+        pool_kwargs = {'max_workers': max_workers}
+        if shared_store is not None:
+            pool_kwargs = shared_store.pool_kwargs(**pool_kwargs)
+
+        with shared_store or nullcontext(), ProcessPoolExecutor(**pool_kwargs) as executor:
+            if shared_store is not None:
+                futures = {}
+                for player_lookup in all_players:
+                    # Per-player completeness slices: the worker only .get()s its own key
+                    task_args = (
+                        player_lookup,
+                        self._shared_spans_for(player_lookup, shared_index),
+                        pick_key(completeness_l5, player_lookup),
+                        pick_key(completeness_l10, player_lookup),
+                        pick_key(completeness_l7d, player_lookup),
+                        pick_key(completeness_l14d, player_lookup),
+                        is_bootstrap,
+                        is_season_boundary,
+                        analysis_date,
+                        circuit_breaker_map.get(player_lookup, {'active': False, 'attempts': 0, 'until': None}),
+                        self.min_games_required,
+                        self.absolute_min_games,
+                        self.cache_version,
+                        source_tracking_fields,
+                        source_hashes,
+                        self.MAX_DAYS_WITHOUT_ACTIVE_GAME
+                    )
+                    shared_store.record_task(task_args)
+                    futures[executor.submit(_process_single_player_shared_worker, *task_args)] = player_lookup
+            else:
+                # Submit all player tasks using module-level worker function
+                futures = {
+                    executor.submit(
+                        _process_single_player_worker,  # Module-level function (picklable)
+                        player_lookup,
+                        self.upcoming_context_data,     # DataFrames are picklable
+                        self.player_game_data,
+                        self.team_offense_data,
+                        self.shot_zone_data,
+                        completeness_l5,
+                        completeness_l10,
+                        completeness_l7d,
+                        completeness_l14d,
+                        is_bootstrap,
+                        is_season_boundary,
+                        analysis_date,
+                        circuit_breaker_map.get(player_lookup, {'active': False, 'attempts': 0, 'until': None}),
+                        self.min_games_required,
+                        self.absolute_min_games,
+                        self.cache_version,
+                        source_tracking_fields,
+                        source_hashes,
+                        self.MAX_DAYS_WITHOUT_ACTIVE_GAME  # Session 128: Recency filter
+                    ): player_lookup
+                    for player_lookup in all_players
+                }
 
             # Collect results as they complete
             for future in as_completed(futures):
@@ -1307,6 +1342,9 @@ class PlayerDailyCacheProcessor(
             f"(avg {total_time/len(successful) if successful else 0:.2f}s/player) "
             f"| {len(failed)} failed"
         )
+        if shared_store is not None:
+            shared_store.log_summary('Player cache')
+            self.stats.update(shared_store.stats())
 
         # Handle reprocess count increments in main thread (requires BQ client)
         # SKIP in backfill mode - saves ~2.5s per failure × 50 failures = 125s per date
@@ -1321,6 +1359,51 @@ class PlayerDailyCacheProcessor(
 
         return successful, failed
 
+    def _publish_shared_inputs(self) -> tuple:
+        """
+        Publish the four source frames into shared memory for ProcessPool workers.
+
+        Returns:
+            (SharedFrameStore, index) where index maps frame name -> span index,
+            plus 'player_team' (player -> team_abbr of first context row).
+            (None, None) if a frame cannot be published; workers then receive
+            pickled frames as before.
+        """
+        store = SharedFrameStore()
+        try:
+            index = {
+                'upcoming_context': store.publish('upcoming_context', self.upcoming_context_data, key='player_lookup'),
+                'player_game': store.publish('player_game', self.player_game_data, key='player_lookup'),
+                'team_offense': store.publish('team_offense', self.team_offense_data, key='team_abbr'),
+                'shot_zone': store.publish('shot_zone', self.shot_zone_data, key='player_lookup'),
+            }
+        except Exception as e:
+            store.close()
+            logger.warning(f"Shared-memory inputs unavailable, falling back to pickled frames: {e}")
+            return None, None
+
+        # Worker filters team_offense by the team on the player's first context row
+        context = self.upcoming_context_data
+        if context is not None and not context.empty:
+            index['player_team'] = (
+                context.drop_duplicates('player_lookup', keep='first')
+                .set_index('player_lookup')['team_abbr'].to_dict()
+            )
+        else:
+            index['player_team'] = {}
+        return store, index
+
+    @staticmethod
+    def _shared_spans_for(player_lookup: str, index: dict) -> Dict[str, tuple]:
+        """Row spans of one player's data in each published frame."""
+        team = index['player_team'].get(player_lookup)
+        return {
+            'upcoming_context': index['upcoming_context'].get(player_lookup, EMPTY_SPAN),
+            'player_game': index['player_game'].get(player_lookup, EMPTY_SPAN),
+            'team_offense': index['team_offense'].get(team, EMPTY_SPAN) if isinstance(team, str) else EMPTY_SPAN,
+            'shot_zone': index['shot_zone'].get(player_lookup, EMPTY_SPAN),
+        }
+
     def _process_single_player(
         self,
         player_lookup: str,
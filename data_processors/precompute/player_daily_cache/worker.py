@@ -12,9 +12,33 @@ from datetime import date
 from typing import Dict
 import pandas as pd
 
+from data_processors.precompute.utils.shared_frames import read_shared_slice
+
 logger = logging.getLogger(__name__)
 
 
+def _process_single_player_shared_worker(
+    player_lookup: str,
+    spans: Dict[str, tuple],
+    *args
+) -> tuple:
+    """Shared-memory entry point for ProcessPoolExecutor.
+
+    Reads only this player's rows from the frames published by
+    PlayerDailyCacheProcessor (see shared_frames.SharedFrameStore) and
+    delegates to _process_single_player_worker. ``args`` are the remaining
+    positional arguments of _process_single_player_worker.
+    """
+    return _process_single_player_worker(
+        player_lookup,
+        read_shared_slice('upcoming_context', spans['upcoming_context']),
+        read_shared_slice('player_game', spans['player_game']),
+        read_shared_slice('team_offense', spans['team_offense']),
+        read_shared_slice('shot_zone', spans['shot_zone']),
+        *args
+    )
+
+
 def _process_single_player_worker(
     player_lookup: str,
     upcoming_context_data: pd.DataFrame,
@@ -30,6 +30,7 @@ from typing import Dict, List, Optional
 from google.cloud import bigquery
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import time
+from contextlib import nullcontext
 
 from data_processors.precompute.base import PrecomputeProcessorBase
 
@@ -45,6 +46,9 @@ from shared.utils.completeness_checker import CompletenessChecker
 # Bootstrap period support (Week 5 - Early Season Handling)
 from shared.config.nba_season_dates import is_early_season, get_season_year_from_date
 from shared.validation.config import BOOTSTRAP_DAYS
+from data_processors.precompute.utils.shared_frames import (
+    EMPTY_SPAN, SharedFrameStore, read_shared_slice, shared_inputs_enabled
+)
 
 # Custom exceptions for dependency handling
 class DependencyError(Exception):
@@ -390,6 +394,46 @@ def _process_single_player_worker(
         }, False)
 
 
+def _process_single_player_shared_worker(
+    player_lookup: str,
+    player_games_span: tuple,
+    completeness: dict,
+    circuit_breaker_status: dict,
+    is_bootstrap: bool,
+    is_season_boundary: bool,
+    analysis_date: date,
+    sample_window: int,
+    trend_window: int,
+    min_games_required: int,
+    source_hash: Optional[str],
+    opts: dict,
+    hash_fields: List[str]
+) -> tuple:
+    """
+    Shared-memory entry point for ProcessPoolExecutor.
+
+    Reads this player's rows from the raw_data frame published by the
+    processor (see shared_frames.SharedFrameStore) instead of receiving
+    them pickled, then delegates to _process_single_player_worker.
+    """
+    player_games = read_shared_slice('raw_data', player_games_span)
+    return _process_single_player_worker(
+        player_lookup,
+        completeness,
+        circuit_breaker_status,
+        is_bootstrap,
+        is_season_boundary,
+        analysis_date,
+        player_games.to_dict('records'),
+        sample_window,
+        trend_window,
+        min_games_required,
+        source_hash,
+        opts,
+        hash_fields
+    )
+
+
 class PlayerShotZoneAnalysisProcessor(
     SmartIdempotencyMixin,
     SmartSkipMixin,
@@ -1128,12 +1172,26 @@ class PlayerShotZoneAnalysisProcessor(
         failed = []
         reprocess_increments = []  # Track BQ writes needed
 
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Publish raw_data once into shared memory (workers slice by offset)
+        shared_store, player_spans = None, None
+        if shared_inputs_enabled():
+            shared_store = SharedFrameStore()
+            try:
+                player_spans = shared_store.publish('raw_data', self.raw_data, key='player_lookup')
+            except Exception as e:
+                shared_store.close()
+                shared_store = None
+                logger.warning(f"Shared-memory inputs unavailable, falling back to pickled records: {e}")
+
+        pool_kwargs = {'max_workers': max_workers}
+        if shared_store is not None:
+            pool_kwargs = shared_store.pool_kwargs(**pool_kwargs)
+
+        with shared_store or nullcontext(), ProcessPoolExecutor(**pool_kwargs) as executor:
             # Submit all player tasks
-            futures = {
-                executor.submit(
-                    _process_single_player_worker,
-                    player_lookup,
+            futures = {}
+            for player_lookup in all_players:
+                gate_args = (
                     completeness_results.get(player_lookup, {
                         'expected_count': 0,
                         'actual_count': 0,
@@ -1146,16 +1204,26 @@ class PlayerShotZoneAnalysisProcessor(
                     is_bootstrap,
                     is_season_boundary,
                     analysis_date,
-                    self.raw_data[self.raw_data['player_lookup'] == player_lookup].to_dict('records'),
+                )
+                window_args = (
                     self.sample_window,
                     self.trend_window,
                     dynamic_min_games,  # Session 113+: Use dynamic threshold
                     self.source_hash,
                     self.opts,
                     self.HASH_FIELDS
-                ): player_lookup
-                for player_lookup in all_players
-            }
+                )
+                if shared_store is not None:
+                    task_args = (player_lookup, player_spans.get(player_lookup, EMPTY_SPAN)) + gate_args + window_args
+                    shared_store.record_task(task_args)
+                    future = executor.submit(_process_single_player_shared_worker, *task_args)
+                else:
+                    player_games = self.raw_data[self.raw_data['player_lookup'] == player_lookup].to_dict('records')
+                    future = executor.submit(
+                        _process_single_player_worker,
+                        player_lookup, *gate_args, player_games, *window_args
+                    )
+                futures[future] = player_lookup
 
             # Collect results
             for future in as_completed(futures):
@@ -1219,6 +1287,9 @@ class PlayerShotZoneAnalysisProcessor(
             f"(avg {total_time/len(successful) if successful else 0:.2f}s/player) "
             f"| {len(failed)} failed"
         )
+        if shared_store is not None:
+            shared_store.log_summary('Shot zone')
+            self.stats.update(shared_store.stats())
 
         return successful, failed
 
@@ -0,0 +1,211 @@
+"""
+Shared-Memory Input Frames for ProcessPool Workers
+
+Phase 4 processors fan out one ProcessPoolExecutor task per player. Passing
+the source DataFrames as task arguments pickles and copies every frame once
+per player (~500x per run), which dominates wall time and memory peaks.
+
+This module publishes each frame ONCE per run into a
+``multiprocessing.shared_memory`` segment as an Arrow IPC stream, together
+with a per-key offset index. Workers attach read-only in the pool
+initializer and slice their rows zero-copy; only the player's own rows are
+materialized back into pandas.
+
+Parent side:
+    with SharedFrameStore() as store:
+        spans = store.publish('player_game', df, key='player_lookup')
+        with ProcessPoolExecutor(**store.pool_kwargs(max_workers=32)) as ex:
+            args = (player_lookup, {'player_game': spans.get(player_lookup, EMPTY_SPAN)})
+            store.record_task(args)
+            ex.submit(worker_fn, *args)
+        store.log_summary('PlayerDailyCache')
+
+Worker side:
+    player_games = read_shared_slice('player_game', spans['player_game'])
+
+Set ENABLE_SHARED_INPUTS=false to fall back to pickled task arguments.
+
+Version: 1.0
+Created: 2026-10-16
+"""
+
+import logging
+import os
+import pickle
+from multiprocessing import shared_memory
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# (start_row, row_count) into a published frame
+Span = Tuple[int, int]
+EMPTY_SPAN: Span = (0, 0)
+
+# Worker-process registry: frame name -> (SharedMemory, pa.Table).
+# The SharedMemory handle must stay referenced while the table is in use.
+_ATTACHED: Dict[str, Tuple[Optional[shared_memory.SharedMemory], Optional[pa.Table]]] = {}
+
+
+def shared_inputs_enabled() -> bool:
+    """Return True unless ENABLE_SHARED_INPUTS is explicitly disabled."""
+    return os.environ.get('ENABLE_SHARED_INPUTS', 'true').lower() == 'true'
+
+
+def pick_key(mapping: Dict, key: Hashable) -> Dict:
+    """
+    Return ``{key: mapping[key]}`` (or ``{}``) so a per-player task ships one
+    entry instead of the whole run's lookup. Workers that ``.get(key, default)``
+    see identical results.
+    """
+    return {key: mapping[key]} if key in mapping else {}
+
+
+def build_span_index(df: pd.DataFrame, key: str) -> Dict[Hashable, Span]:
+    """
+    Build {key_value: (start, count)} for a frame already sorted by ``key``.
+
+    Rows sharing a key must be contiguous (see SharedFrameStore.publish).
+    """
+    if df is None or df.empty:
+        return {}
+
+    keys = df[key].to_numpy()
+    boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(keys)]))
+    return {keys[s]: (int(s), int(e - s)) for s, e in zip(starts, ends)}
+
+
+class SharedFrameStore:
+    """
+    Owns the shared-memory segments for one parallel run.
+
+    Frames are stable-sorted by their key column before publishing, so each
+    key's rows are contiguous and keep their original relative order.
+    Segments are unlinked on close(); use as a context manager.
+    """
+
+    def __init__(self):
+        self._segments: Dict[str, shared_memory.SharedMemory] = {}
+        self.handle: Dict[str, Optional[Tuple[str, int]]] = {}
+        self.bytes_published = 0
+        self.tasks_submitted = 0
+        self.task_bytes = 0
+
+    def publish(self, name: str, df: Optional[pd.DataFrame],
+                key: Optional[str] = None) -> Dict[Hashable, Span]:
+        """
+        Publish ``df`` under ``name`` and return its span index by ``key``.
+
+        A None frame is published as None (workers read None back).
+
+        Raises:
+            pa.ArrowException: If the frame cannot be converted to Arrow
+                (e.g., mixed-type object columns). Callers fall back to
+                pickled arguments.
+        """
+        if df is None:
+            self.handle[name] = None
+            return {}
+
+        if key is not None and not df.empty:
+            df = df.sort_values(key, kind='stable')
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        payload = sink.getvalue()
+
+        # SharedMemory rejects size=0; an empty stream still has a schema message
+        segment = shared_memory.SharedMemory(create=True, size=max(payload.size, 1))
+        segment.buf[:payload.size] = memoryview(payload).cast('B')
+        self._segments[name] = segment
+        self.handle[name] = (segment.name, payload.size)
+        self.bytes_published += payload.size
+
+        return build_span_index(df, key) if key is not None else {}
+
+    def pool_kwargs(self, **kwargs) -> Dict[str, Any]:
+        """ProcessPoolExecutor kwargs that attach every worker to this store."""
+        kwargs['initializer'] = attach_shared_frames
+        kwargs['initargs'] = (self.handle,)
+        return kwargs
+
+    def record_task(self, args: tuple) -> int:
+        """Account for the pickled size of one task's arguments."""
+        size = len(pickle.dumps(args, protocol=pickle.HIGHEST_PROTOCOL))
+        self.tasks_submitted += 1
+        self.task_bytes += size
+        return size
+
+    @property
+    def avg_task_bytes(self) -> float:
+        return self.task_bytes / self.tasks_submitted if self.tasks_submitted else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'shared_frames': len(self.handle),
+            'shared_bytes_published': self.bytes_published,
+            'shared_tasks_submitted': self.tasks_submitted,
+            'shared_avg_task_bytes': round(self.avg_task_bytes, 1),
+        }
+
+    def log_summary(self, label: str) -> None:
+        logger.info(
+            f"{label} shared inputs: published {len(self.handle)} frames "
+            f"({self.bytes_published / 1e6:.1f} MB) once | "
+            f"{self.tasks_submitted} tasks shipped avg {self.avg_task_bytes:.0f} bytes/task"
+        )
+
+    def close(self) -> None:
+        for segment in self._segments.values():
+            try:
+                segment.close()
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+        self._segments.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def attach_shared_frames(handle: Dict[str, Optional[Tuple[str, int]]]) -> None:
+    """
+    ProcessPoolExecutor initializer: attach to published frames read-only.
+
+    Runs once per worker process; the Arrow tables reference the shared
+    buffer directly (no copy).
+    """
+    _ATTACHED.clear()
+    for name, entry in handle.items():
+        if entry is None:
+            _ATTACHED[name] = (None, None)
+            continue
+        segment_name, size = entry
+        segment = shared_memory.SharedMemory(name=segment_name)
+        reader = pa.ipc.open_stream(pa.py_buffer(segment.buf[:size]))
+        _ATTACHED[name] = (segment, reader.read_all())
+
+
+def read_shared_slice(name: str, span: Span) -> Optional[pd.DataFrame]:
+    """
+    Return rows [start, start + count) of a published frame as a DataFrame.
+
+    An EMPTY_SPAN yields an empty frame with the published columns/dtypes,
+    matching what a boolean filter on the original frame would return.
+    """
+    _, table = _ATTACHED[name]
+    if table is None:
+        return None
+    start, count = span
+    return table.slice(start, count).to_pandas()
@@ -9,14 +9,19 @@ Circuit Breaker Protection:
 - Circuit auto-recovers after timeout period
 - Slack alerts are sent when circuit breaker opens or fails to recover
 
-Version: 1.2
-Updated: 2026-01-30 - Added Slack alerting for circuit breaker failures
+Uploads go through gcs_publisher.GCSPublisher (compact JSON, optional gzip,
+manifest-based skip of unchanged payloads, queue_upload()/flush_uploads()
+for concurrent writes).
+
+Version: 1.3
+Updated: 2026-10-16 - Routed uploads through GCSPublisher
 """
 
 import json
 import logging
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional, Tuple
 
@@ -38,6 +43,8 @@ from shared.utils.external_service_circuit_breaker import (
     CircuitState,
 )
 
+from .gcs_publisher import GCSPublisher
+
 logger = logging.getLogger(__name__)
 
 from shared.config.gcp_config import get_project_id, Buckets
@@ -219,6 +226,20 @@ class BaseExporter(ABC):
             logger.error(f"Query failed: {e}", exc_info=True)
             raise
 
+    @property
+    def publisher(self) -> GCSPublisher:
+        """Per-exporter upload layer (bounded pool, compact JSON, manifest dedup)."""
+        publisher = getattr(self, '_publisher', None)
+        if publisher is None:
+            publisher = GCSPublisher.from_env(
+                self._write_blob,
+                self.bucket_name,
+                name=type(self).__name__,
+                json_default=self._json_serializer,
+            )
+            self._publisher = publisher
+        return publisher
+
     def upload_to_gcs(
         self,
         json_data: Dict[str, Any],
@@ -228,6 +249,10 @@ class BaseExporter(ABC):
         """
         Upload JSON data to GCS with cache headers.
 
+        Serialized as compact JSON (optionally gzip content-encoded) and
+        skipped without a GCS round trip when the payload is unchanged since
+        the last upload of the same path (see gcs_publisher.GCSPublisher).
+
         Protected by circuit breaker to prevent cascading failures when
         GCS is unavailable. If circuit is open, raises CircuitBreakerError.
 
@@ -247,6 +272,41 @@ class BaseExporter(ABC):
             CircuitBreakerError: If GCS circuit breaker is open
             Exception: Any GCS upload error after retries
         """
+        return self.publisher.publish(json_data, f'{API_VERSION}/{path}', cache_control)
+
+    def queue_upload(
+        self,
+        json_data: Dict[str, Any],
+        path: str,
+        cache_control: str = 'public, max-age=300'
+    ) -> Future:
+        """
+        Queue an upload_to_gcs() on the publisher's worker pool.
+
+        Lets exporters that write many files keep computing while uploads
+        are in flight. Call flush_uploads() before returning.
+
+        Returns:
+            Future resolving to the full GCS path (or raising the upload error)
+        """
+        return self.publisher.submit(json_data, f'{API_VERSION}/{path}', cache_control)
+
+    def flush_uploads(self, raise_on_error: bool = True) -> List[str]:
+        """Wait for queued uploads, persist the manifest and log PUBLISH_STATS."""
+        return self.publisher.flush(raise_on_error=raise_on_error)
+
+    def publish_stats(self) -> Dict[str, Any]:
+        """Upload, byte and skip counters for this exporter."""
+        return self.publisher.stats.as_dict()
+
+    def _write_blob(
+        self,
+        full_path: str,
+        data: bytes,
+        cache_control: str,
+        content_encoding: Optional[str] = None
+    ) -> None:
+        """Write serialized bytes to GCS behind the circuit breaker."""
         # Get circuit breaker for GCS operations
         cb = get_service_circuit_breaker(GCS_CIRCUIT_BREAKER_SERVICE)
 
@@ -254,7 +314,7 @@ class BaseExporter(ABC):
         if not cb.is_available():
             status = cb.get_status()
             logger.error(
-                f"GCS circuit breaker OPEN - skipping upload to {path}. "
+                f"GCS circuit breaker OPEN - skipping upload to {full_path}. "
                 f"Timeout remaining: {status.get('timeout_remaining', 0):.1f}s"
             )
             raise CircuitBreakerError(
@@ -267,20 +327,11 @@ class BaseExporter(ABC):
         state_before = cb.state
 
         bucket = self.gcs_client.bucket(self.bucket_name)
-        full_path = f'{API_VERSION}/{path}'
         blob = bucket.blob(full_path)
 
-        # Serialize with proper handling of dates/decimals
-        json_str = json.dumps(
-            json_data,
-            indent=2,
-            default=self._json_serializer,
-            ensure_ascii=False
-        )
-
         # Upload with retry, protected by circuit breaker
         try:
-            self._upload_blob_with_retry(blob, json_str, cache_control)
+            self._upload_blob_with_retry(blob, data, cache_control, content_encoding)
             # Record success with circuit breaker
             cb._record_success()
         except (ServiceUnavailable, DeadlineExceeded, InternalServerError, Conflict) as e:
@@ -296,24 +347,28 @@ class BaseExporter(ABC):
             )
             raise
 
-        gcs_path = f'gs://{self.bucket_name}/{full_path}'
-        logger.info(f"Uploaded {len(json_str)} bytes to {gcs_path}")
-        return gcs_path
-
     @retry_with_jitter(
         max_attempts=3,
         base_delay=1.0,
         max_delay=10.0,
         exceptions=(ServiceUnavailable, DeadlineExceeded, InternalServerError, Conflict)
     )
-    def _upload_blob_with_retry(self, blob, json_str: str, cache_control: str) -> None:
+    def _upload_blob_with_retry(
+        self,
+        blob,
+        json_str,
+        cache_control: str,
+        content_encoding: Optional[str] = None
+    ) -> None:
         """Upload blob with retry on transient GCS errors.
 
-        Sets cache_control BEFORE upload so metadata is included in the single
-        upload request. This avoids 409 Conflict errors from a separate patch()
-        call racing with concurrent writers.
+        Sets cache_control (and content_encoding) BEFORE upload so metadata
+        is included in the single upload request. This avoids 409 Conflict
+        errors from a separate patch() call racing with concurrent writers.
         """
         blob.cache_control = cache_control
+        if content_encoding:
+            blob.content_encoding = content_encoding
         blob.upload_from_string(
             json_str,
             content_type='application/json'
@@ -498,6 +553,10 @@ class BaseExporter(ABC):
         Returns:
             Full GCS path where file was uploaded.
         """
+        # Unchanged payloads are skipped by upload_to_gcs; no need to GET the old blob
+        if self.publisher.is_unchanged(json_data, f'{API_VERSION}/{path}', cache_control):
+            return self.upload_to_gcs(json_data, path, cache_control)
+
         try:
             self._check_and_backup_if_degraded(json_data, path)
         except Exception as e:
@@ -26,6 +26,7 @@ from shared.config.cross_model_subsets import (
     build_system_id_sql_filter,
     discover_models,
 )
+from data_processors.publishing.subset_prediction_frame import DatePredictionFrame
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,7 @@ class CrossModelSubsetMaterializer:
         version_id: str,
         trigger_source: str = 'export',
         discovered_models: DiscoveredModels = None,
+        prediction_frame: DatePredictionFrame = None,
     ) -> Dict[str, Any]:
         """Compute cross-model subsets and write to current_subset_picks.
 
@@ -54,6 +56,8 @@ class CrossModelSubsetMaterializer:
             version_id: Version ID from SubsetMaterializer (same batch).
             trigger_source: What triggered this materialization.
             discovered_models: Pre-discovered models (avoids redundant BQ query).
+            prediction_frame: Scan shared with SubsetMaterializer (avoids
+                re-querying predictions).
 
         Returns:
             Dict with subset counts summary.
@@ -71,7 +75,10 @@ class CrossModelSubsetMaterializer:
             return {'total_picks': 0, 'subsets': {}}
 
         # 2. Query all models' predictions for this date
-        all_predictions = self._query_all_model_predictions(game_date, discovered)
+        if prediction_frame is not None:
+            all_predictions = prediction_frame.cross_model_predictions()
+        else:
+            all_predictions = self._query_all_model_predictions(game_date, discovered)
         if not all_predictions:
             logger.info(f"No cross-model predictions for {game_date}")
             return {'total_picks': 0, 'subsets': {}}
@@ -0,0 +1,473 @@
+"""
+GCS Publisher for Phase 6 Publishing
+
+Concurrent, content-addressed upload layer used by BaseExporter.
+
+Exporters that write hundreds of files (tonight players, player profiles)
+were bound by one synchronous GCS round trip per file. GCSPublisher:
+
+- Uploads on a bounded worker pool. Exporters can queue writes with
+  submit() and keep computing, then flush() once to await them all.
+- Serializes compact JSON (no indent) with optional gzip content-encoding.
+- Keeps a local manifest of content hashes per object path and skips
+  payloads that are unchanged since the last successful upload, without
+  issuing a GET. Volatile top-level keys (generated_at) are excluded from
+  the hash; manifest entries expire after a TTL so those keys are still
+  refreshed periodically.
+- Counts uploads, bytes and skips per exporter (PUBLISH_STATS log line).
+
+LocalStorageClient is a local-filesystem stand-in for storage.Client that
+implements the bucket/blob subset used by the exporters (tests, local runs).
+
+Configuration:
+    PUBLISH_MAX_WORKERS (default 16)
+    PUBLISH_COMPACT_JSON (default true)
+    PUBLISH_GZIP (default false)
+    PUBLISH_SKIP_UNCHANGED (default true)
+    PUBLISH_MANIFEST_PATH (default {tmpdir}/phase6_publish_manifest.json)
+    PUBLISH_MANIFEST_TTL_SECONDS (default 3600)
+"""
+
+import atexit
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MANIFEST_TTL_SECONDS = 3600
+DEFAULT_VOLATILE_KEYS = ('generated_at',)
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() in ('true', '1', 'yes')
+
+
+def serialize_json(
+    json_data: Dict[str, Any],
+    compact: bool = True,
+    default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """Serialize a payload to UTF-8 JSON bytes (compact or indent=2)."""
+    if compact:
+        text = json.dumps(json_data, separators=(',', ':'), default=default, ensure_ascii=False)
+    else:
+        text = json.dumps(json_data, indent=2, default=default, ensure_ascii=False)
+    return text.encode('utf-8')
+
+
+def content_hash(
+    json_data: Dict[str, Any],
+    cache_control: str,
+    content_encoding: Optional[str],
+    volatile_keys: Tuple[str, ...] = DEFAULT_VOLATILE_KEYS,
+    default: Optional[Callable[[Any], Any]] = None
+) -> str:
+    """Hash of the payload (minus volatile keys) and the object metadata."""
+    if volatile_keys and isinstance(json_data, dict):
+        json_data = {k: v for k, v in json_data.items() if k not in volatile_keys}
+    canonical = json.dumps(
+        json_data, sort_keys=True, separators=(',', ':'), default=default, ensure_ascii=False
+    )
+    digest = hashlib.sha256()
+    digest.update(canonical.encode('utf-8'))
+    digest.update(f'|{cache_control}|{content_encoding or ""}'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class PublishManifest:
+    """Local {object path: (content hash, uploaded_at)} manifest.
+
+    One instance per manifest file is shared by every exporter in the
+    process (see shared()), so exporters never overwrite each other's
+    entries when saving.
+    """
+
+    SAVE_INTERVAL_SECONDS = 10.0
+
+    _shared: Dict[str, 'PublishManifest'] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: float = DEFAULT_MANIFEST_TTL_SECONDS):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = time.time()
+        if path:
+            self._load()
+
+    @classmethod
+    def shared(cls, path: str, ttl_seconds: float = DEFAULT_MANIFEST_TTL_SECONDS) -> 'PublishManifest':
+        """Process-wide manifest for a path, saved again at interpreter exit."""
+        with cls._shared_lock:
+            manifest = cls._shared.get(path)
+            if manifest is None:
+                manifest = cls(path, ttl_seconds)
+                cls._shared[path] = manifest
+                atexit.register(manifest.save)
+            return manifest
+
+    @classmethod
+    def from_env(cls) -> 'PublishManifest':
+        path = os.environ.get(
+            'PUBLISH_MANIFEST_PATH',
+            os.path.join(tempfile.gettempdir(), 'phase6_publish_manifest.json')
+        )
+        ttl = float(os.environ.get('PUBLISH_MANIFEST_TTL_SECONDS', DEFAULT_MANIFEST_TTL_SECONDS))
+        return cls.shared(path, ttl)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r') as f:
+                raw = json.load(f)
+            self._entries = {k: (v[0], float(v[1])) for k, v in raw.items()}
+        except FileNotFoundError:
+            pass
+        except (ValueError, TypeError, IndexError, OSError) as e:
+            logger.warning(f"Ignoring unreadable publish manifest {self.path}: {e}")
+
+    def is_current(self, key: str, digest: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+        if not entry or entry[0] != digest:
+            return False
+        return (time.time() - entry[1]) < self.ttl_seconds
+
+    def record(self, key: str, digest: str) -> None:
+        with self._lock:
+            self._entries[key] = (digest, time.time())
+            self._dirty = True
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._dirty = True
+
+    def save_if_due(self) -> None:
+        """Save when dirty and SAVE_INTERVAL_SECONDS have passed since the last save."""
+        if self._dirty and time.time() - self._last_save >= self.SAVE_INTERVAL_SECONDS:
+            self.save()
+
+    def save(self) -> None:
+        """Persist the manifest atomically (no-op without a path or changes)."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = {k: list(v) for k, v in self._entries.items()}
+            self._dirty = False
+            self._last_save = time.time()
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save publish manifest {self.path}: {e}")
+
+
+@dataclass
+class PublishStats:
+    """Per-exporter upload counters."""
+    uploads: int = 0
+    skipped: int = 0
+    failures: int = 0
+    bytes_uploaded: int = 0
+    bytes_skipped: int = 0
+    upload_seconds: float = 0.0
+
+    @property
+    def skip_rate(self) -> float:
+        total = self.uploads + self.skipped
+        return self.skipped / total if total else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'uploads': self.uploads,
+            'skipped': self.skipped,
+            'failures': self.failures,
+            'bytes_uploaded': self.bytes_uploaded,
+            'bytes_skipped': self.bytes_skipped,
+            'skip_rate': round(self.skip_rate, 3),
+            'upload_seconds': round(self.upload_seconds, 2),
+        }
+
+
+# Writer signature: (object_path, data, cache_control, content_encoding) -> None
+BlobWriter = Callable[[str, bytes, str, Optional[str]], None]
+
+
+class GCSPublisher:
+    """
+    Bounded-concurrency, manifest-deduplicated JSON publisher.
+
+    The actual write is delegated to ``writer`` so the exporter keeps its
+    circuit breaker and retry policy; the publisher owns serialization,
+    dedup, concurrency and accounting.
+    """
+
+    def __init__(
+        self,
+        writer: BlobWriter,
+        bucket_name: str,
+        name: str = 'exporter',
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        compact: bool = True,
+        gzip_enabled: bool = False,
+        manifest: Optional[PublishManifest] = None,
+        volatile_keys: Tuple[str, ...] = DEFAULT_VOLATILE_KEYS,
+        json_default: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.writer = writer
+        self.bucket_name = bucket_name
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.compact = compact
+        self.gzip_enabled = gzip_enabled
+        self.manifest = manifest
+        self.volatile_keys = volatile_keys
+        self.json_default = json_default
+        self.stats = PublishStats()
+        self._stats_lock = threading.Lock()
+        self._pending: List[Future] = []
+        self._pending_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def from_env(cls, writer: BlobWriter, bucket_name: str, name: str,
+                 json_default: Optional[Callable[[Any], Any]] = None) -> 'GCSPublisher':
+        manifest = PublishManifest.from_env() if _env_flag('PUBLISH_SKIP_UNCHANGED', True) else None
+        return cls(
+            writer,
+            bucket_name,
+            name=name,
+            max_workers=int(os.environ.get('PUBLISH_MAX_WORKERS', DEFAULT_MAX_WORKERS)),
+            compact=_env_flag('PUBLISH_COMPACT_JSON', True),
+            gzip_enabled=_env_flag('PUBLISH_GZIP', False),
+            manifest=manifest,
+            json_default=json_default,
+        )
+
+    def publish(self, json_data: Dict[str, Any], object_path: str,
+                cache_control: str = 'public, max-age=300') -> str:
+        """Serialize and upload synchronously. Returns the gs:// path."""
+        gcs_path = self._publish(json_data, object_path, cache_control)
+        if self.manifest:
+            self.manifest.save_if_due()
+        return gcs_path
+
+    def is_unchanged(self, json_data: Dict[str, Any], object_path: str,
+                     cache_control: str = 'public, max-age=300') -> bool:
+        """True if publish() would skip this payload as unchanged."""
+        if not self.manifest:
+            return False
+        digest = content_hash(
+            json_data, cache_control, 'gzip' if self.gzip_enabled else None,
+            volatile_keys=self.volatile_keys, default=self.json_default
+        )
+        return self.manifest.is_current(f'{self.bucket_name}/{object_path}', digest)
+
+    def submit(self, json_data: Dict[str, Any], object_path: str,
+               cache_control: str = 'public, max-age=300') -> Future:
+        """Queue an upload on the worker pool. The future resolves to the gs:// path.
+
+        The payload is serialized when the worker runs; callers must not
+        mutate json_data after submitting it.
+        """
+        with self._pending_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f'publish-{self.name}'
+                )
+            future = self._executor.submit(self._publish, json_data, object_path, cache_control)
+            self._pending.append(future)
+        return future
+
+    def flush(self, raise_on_error: bool = True) -> List[str]:
+        """
+        Wait for every queued upload and persist the manifest.
+
+        Returns:
+            gs:// paths of the completed uploads, in submission order.
+
+        Raises:
+            The first upload error if raise_on_error (after all uploads finish).
+        """
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+
+        paths = []
+        first_error = None
+        for future in pending:
+            try:
+                paths.append(future.result())
+            except Exception as e:
+                if first_error is None:
+                    first_error = e
+
+        if self.manifest:
+            self.manifest.save()
+        self.log_stats()
+
+        if first_error is not None and raise_on_error:
+            raise first_error
+        return paths
+
+    def close(self) -> None:
+        """Flush (without raising) and shut down the worker pool."""
+        self.flush(raise_on_error=False)
+        with self._pending_lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=True)
+
+    def log_stats(self) -> None:
+        with self._stats_lock:
+            stats = self.stats.as_dict()
+        if stats['uploads'] or stats['skipped'] or stats['failures']:
+            logger.info(
+                f"PUBLISH_STATS: exporter={self.name} uploads={stats['uploads']} "
+                f"skipped={stats['skipped']} failures={stats['failures']} "
+                f"bytes={stats['bytes_uploaded']} skip_rate={stats['skip_rate']:.1%} "
+                f"upload_seconds={stats['upload_seconds']}",
+                extra={'publish_stats': dict(stats, exporter=self.name)}
+            )
+
+    def _publish(self, json_data: Dict[str, Any], object_path: str, cache_control: str) -> str:
+        gcs_path = f'gs://{self.bucket_name}/{object_path}'
+        content_encoding = 'gzip' if self.gzip_enabled else None
+        manifest_key = f'{self.bucket_name}/{object_path}'
+
+        data = serialize_json(json_data, compact=self.compact, default=self.json_default)
+
+        digest = None
+        if self.manifest:
+            digest = content_hash(
+                json_data, cache_control, content_encoding,
+                volatile_keys=self.volatile_keys, default=self.json_default
+            )
+            if self.manifest.is_current(manifest_key, digest):
+                with self._stats_lock:
+                    self.stats.skipped += 1
+                    self.stats.bytes_skipped += len(data)
+                logger.debug(f"Unchanged, skipped upload to {gcs_path}")
+                return gcs_path
+
+        if content_encoding == 'gzip':
+            data = gzip.compress(data, mtime=0)
+
+        start = time.time()
+        try:
+            self.writer(object_path, data, cache_control, content_encoding)
+        except Exception:
+            with self._stats_lock:
+                self.stats.failures += 1
+            if self.manifest:
+                self.manifest.forget(manifest_key)
+            raise
+
+        with self._stats_lock:
+            self.stats.uploads += 1
+            self.stats.bytes_uploaded += len(data)
+            self.stats.upload_seconds += time.time() - start
+        if digest:
+            self.manifest.record(manifest_key, digest)
+
+        logger.info(f"Uploaded {len(data)} bytes to {gcs_path}")
+        return gcs_path
+
+
+class LocalBlob:
+    """Filesystem-backed stand-in for storage.Blob (upload/download subset)."""
+
+    def __init__(self, bucket: 'LocalBucket', name: str):
+        self.bucket = bucket
+        self.name = name
+        self.cache_control: Optional[str] = None
+        self.content_encoding: Optional[str] = None
+        self.content_type: Optional[str] = None
+
+    @property
+    def _path(self) -> str:
+        return os.path.join(self.bucket.root, *self.name.split('/'))
+
+    def exists(self) -> bool:
+        return os.path.isfile(self._path)
+
+    def upload_from_string(self, data, content_type: str = 'application/octet-stream') -> None:
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        self.content_type = content_type
+        path = self._path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        with open(f"{path}.meta.json", 'w') as f:
+            json.dump({
+                'cache_control': self.cache_control,
+                'content_encoding': self.content_encoding,
+                'content_type': content_type,
+            }, f)
+
+    def reload(self) -> None:
+        try:
+            with open(f"{self._path}.meta.json", 'r') as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return
+        self.cache_control = meta.get('cache_control')
+        self.content_encoding = meta.get('content_encoding')
+        self.content_type = meta.get('content_type')
+
+    def download_as_bytes(self) -> bytes:
+        with open(self._path, 'rb') as f:
+            return f.read()
+
+    def download_as_text(self) -> str:
+        self.reload()
+        data = self.download_as_bytes()
+        if self.content_encoding == 'gzip':
+            data = gzip.decompress(data)  # GCS decompresses transparently
+        return data.decode('utf-8')
+
+
+class LocalBucket:
+    """Filesystem-backed stand-in for storage.Bucket."""
+
+    def __init__(self, root: str, name: str):
+        self.name = name
+        self.root = os.path.join(root, name)
+
+    def blob(self, name: str) -> LocalBlob:
+        return LocalBlob(self, name)
+
+
+class LocalStorageClient:
+    """Filesystem-backed stand-in for storage.Client (one directory per bucket)."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def bucket(self, name: str) -> LocalBucket:
+        return LocalBucket(self.root, name)
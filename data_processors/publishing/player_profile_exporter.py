@@ -830,11 +830,14 @@ class PlayerProfileExporter(BaseExporter):
         index_path = self.export_index()
         paths.append(index_path)
 
-        # Export each player
+        # Export each player; uploads run on the publisher while the next
+        # profile is generated
         for i, player in enumerate(eligible):
             player_lookup = player['player_lookup']
             logger.info(f"[{i+1}/{len(eligible)}] Exporting {player_lookup}")
-            path = self.export_player(player_lookup)
-            paths.append(path)
+            json_data = self.generate_player_json(player_lookup)
+            self.queue_upload(json_data, f'players/{player_lookup}.json', 'public, max-age=3600')
+
+        paths.extend(self.flush_uploads())
 
         return paths
@@ -13,6 +13,10 @@ Design: APPEND-ONLY
 
 Session 153: Created to materialize subsets at prediction time.
 Session 188: Multi-model support — queries all active models, writes system_id per row.
+
+Predictions for all models come from one DatePredictionFrame scan (shared
+with CrossModelSubsetMaterializer) and subset filters run as vectorized
+masks; the per-model query path remains as fallback.
 """
 
 import logging
@@ -29,6 +33,8 @@ from shared.config.gcp_config import get_project_id
 from shared.config.subset_public_names import get_public_name
 from shared.utils.quality_filter import should_include_prediction  # Session 209
 
+from data_processors.publishing.subset_prediction_frame import DatePredictionFrame, single_scan_enabled
+
 logger = logging.getLogger(__name__)
 
 # Champion model — used as fallback for daily signal
@@ -60,6 +66,7 @@ class SubsetMaterializer:
         trigger_source: str = 'unknown',
         batch_id: str = None,
         active_system_ids: List[str] = None,
+        prediction_frame: DatePredictionFrame = None,
     ) -> Dict[str, Any]:
         """
         Compute and write subset picks to BigQuery.
@@ -72,6 +79,8 @@ class SubsetMaterializer:
             trigger_source: What triggered this ('overnight', 'same_day', 'line_check', 'manual', 'export')
             batch_id: Optional prediction batch ID
             active_system_ids: Pre-discovered active system_ids (avoids redundant BQ query)
+            prediction_frame: Pre-scanned predictions for the date (shared with
+                CrossModelSubsetMaterializer). Scanned here when not provided.
 
         Returns:
             Dictionary with version_id, total_picks, subsets summary
@@ -100,8 +109,20 @@ class SubsetMaterializer:
         #    Definitions may reference old model names (e.g. *_train1102_0131)
         #    while predictions use newer names (e.g. *_train1102_0125).
         #    Fix: classify both into families, map definition → active system_id.
+        if prediction_frame is None and single_scan_enabled():
+            try:
+                prediction_frame = DatePredictionFrame.query(self.bq_client, game_date)
+            except Exception as e:
+                logger.warning(
+                    f"Prediction frame scan failed for {game_date}, falling back to "
+                    f"per-model queries: {e}",
+                    exc_info=True
+                )
         if active_system_ids is None:
-            active_system_ids = self._query_active_system_ids(game_date)
+            if prediction_frame is not None:
+                active_system_ids = prediction_frame.system_ids
+            else:
+                active_system_ids = self._query_active_system_ids(game_date)
         if active_system_ids:
             subsets = self._resolve_stale_system_ids(subsets, active_system_ids)
 
@@ -125,6 +146,14 @@ class SubsetMaterializer:
             regular_subsets = [s for s in model_subsets if 'all_predictions' not in s['subset_id']]
             unfiltered_subsets = [s for s in model_subsets if 'all_predictions' in s['subset_id']]
 
+            if prediction_frame is not None:
+                total_predictions_available += self._process_model_from_frame(
+                    prediction_frame, system_id, regular_subsets, unfiltered_subsets,
+                    daily_signal, signal_value, pct_over_value, game_date, version_id,
+                    computed_at, trigger_source, batch_id, rows, subsets_summary,
+                )
+                continue
+
             # Regular subsets: quality >= 85 filter (existing behavior, unchanged)
             if regular_subsets:
                 predictions = self._query_all_predictions(game_date, system_id)
@@ -176,6 +205,54 @@ class SubsetMaterializer:
             'status': 'success',
         }
 
+    def _process_model_from_frame(
+        self,
+        frame: DatePredictionFrame,
+        system_id: str,
+        regular_subsets: List[Dict[str, Any]],
+        unfiltered_subsets: List[Dict[str, Any]],
+        daily_signal: Optional[Dict[str, Any]],
+        signal_value: Optional[str],
+        pct_over_value: Optional[float],
+        game_date: str,
+        version_id: str,
+        computed_at: datetime,
+        trigger_source: str,
+        batch_id: Optional[str],
+        rows: List[Dict[str, Any]],
+        subsets_summary: Dict[str, Any],
+    ) -> int:
+        """Materialize one model's subsets from the shared frame.
+
+        Same predictions, order and filters as the per-model query path;
+        returns the model's contribution to total_predictions_available.
+        """
+        available = 0
+        for model_subsets, min_quality, label in (
+            (regular_subsets, MIN_FEATURE_QUALITY_SCORE, 'predictions'),
+            (unfiltered_subsets, 0, 'unfiltered predictions'),
+        ):
+            if not model_subsets:
+                continue
+            candidates = frame.model_indices(system_id, min_quality)
+            if not len(candidates):
+                logger.info(f"No {label} for {game_date} from {system_id}")
+                continue
+            if min_quality or not regular_subsets:
+                available += len(candidates)
+            for subset in model_subsets:
+                selected = frame.subset_indices(candidates, subset, daily_signal)
+                filtered = [
+                    dict(frame.rows[i], rank_in_subset=rank)
+                    for rank, i in enumerate(selected, 1)
+                ]
+                self._append_subset_rows(
+                    subset, filtered, len(candidates), signal_value, pct_over_value,
+                    game_date, system_id, version_id, computed_at, trigger_source,
+                    batch_id, rows, subsets_summary,
+                )
+        return available
+
     def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
         """Write rows to current_subset_picks using streaming insert (append-only)."""
         # Convert Decimal types to float for JSON serialization
@@ -483,9 +560,31 @@ class SubsetMaterializer:
         subsets_summary: Dict[str, Any],
     ) -> None:
         """Filter predictions for a subset and append materialized rows."""
-        subset_id = subset['subset_id']
         filtered = self._filter_picks_for_subset(predictions, subset, daily_signal)
+        self._append_subset_rows(
+            subset, filtered, len(predictions), signal_value, pct_over_value,
+            game_date, system_id, version_id, computed_at, trigger_source,
+            batch_id, rows, subsets_summary,
+        )
 
+    def _append_subset_rows(
+        self,
+        subset: Dict[str, Any],
+        filtered: List[Dict[str, Any]],
+        total_predictions_available: int,
+        signal_value: Optional[str],
+        pct_over_value: Optional[float],
+        game_date: str,
+        system_id: str,
+        version_id: str,
+        computed_at: datetime,
+        trigger_source: str,
+        batch_id: Optional[str],
+        rows: List[Dict[str, Any]],
+        subsets_summary: Dict[str, Any],
+    ) -> None:
+        """Append materialized rows for a subset's ranked picks."""
+        subset_id = subset['subset_id']
         public = get_public_name(subset_id)
 
         for pick in filtered:
@@ -526,7 +625,7 @@ class SubsetMaterializer:
                 # Version-level context
                 'daily_signal': signal_value,
                 'pct_over': pct_over_value,
-                'total_predictions_available': len(predictions),
+                'total_predictions_available': total_predictions_available,
             })
 
         subsets_summary[subset_id] = {
@@ -0,0 +1,268 @@
+"""
+Subset Prediction Frame for Phase 6 Publishing
+
+One scan of every active model's predictions for a game date, held as
+columns so subset filters can be evaluated as vectorized masks.
+
+SubsetMaterializer used to query predictions once per model (twice for
+models with "all_predictions" subsets), and CrossModelSubsetMaterializer
+repeated a similar scan — 40+ queries per materialization with 20+ shadow
+models, on every line_check trigger. DatePredictionFrame replaces those with
+a single query whose rows are a superset of both:
+
+- SubsetMaterializer's per-model rows are the mask
+      system_id = X AND line present AND team known AND current model_version
+      AND feature_quality_score >= min_quality
+  ordered by composite_score DESC (same as _query_all_predictions).
+- CrossModelSubsetMaterializer's rows are the known-model-family mask
+  (build_system_id_sql_filter evaluated in the same scan).
+
+Set SUBSET_SCAN_MODE=per_model to force the old per-model queries.
+"""
+
+import logging
+import math
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from google.cloud import bigquery
+
+from shared.config.cross_model_subsets import build_system_id_sql_filter
+
+logger = logging.getLogger(__name__)
+
+
+def single_scan_enabled() -> bool:
+    """Whether materializers should share one DatePredictionFrame scan."""
+    return os.environ.get('SUBSET_SCAN_MODE', 'single_scan').lower() != 'per_model'
+
+
+def _float_column(rows: List[Dict[str, Any]], key: str) -> np.ndarray:
+    """Float64 column; None becomes NaN (never passes a threshold mask)."""
+    return np.fromiter(
+        (math.nan if r.get(key) is None else float(r[key]) for r in rows),
+        dtype=np.float64,
+        count=len(rows),
+    )
+
+
+def _object_column(rows: List[Dict[str, Any]], key: str) -> np.ndarray:
+    column = np.empty(len(rows), dtype=object)
+    column[:] = [r.get(key) for r in rows]
+    return column
+
+
+def _bool_column(rows: List[Dict[str, Any]], key: str) -> np.ndarray:
+    return np.fromiter((bool(r.get(key)) for r in rows), dtype=bool, count=len(rows))
+
+
+class DatePredictionFrame:
+    """Columnar view over all active predictions for one game date."""
+
+    def __init__(self, game_date: str, rows: List[Dict[str, Any]]):
+        self.game_date = game_date
+        self.rows = rows
+        self.size = len(rows)
+
+        self.system_id = _object_column(rows, 'system_id')
+        self.recommendation = _object_column(rows, 'recommendation')
+        self.quality_alert_level = _object_column(rows, 'quality_alert_level')
+        self.edge = _float_column(rows, 'edge')
+        self.confidence_score = _float_column(rows, 'confidence_score')
+        self.composite_score = _float_column(rows, 'composite_score')
+        self.feature_quality_score = _float_column(rows, 'feature_quality_score')
+
+        # Row predicates of SubsetMaterializer._query_all_predictions
+        self.materializable = (
+            np.fromiter((r.get('current_points_line') is not None for r in rows), dtype=bool, count=self.size)
+            & np.fromiter((r.get('team') is not None for r in rows), dtype=bool, count=self.size)
+            & _bool_column(rows, 'is_current_version')
+        )
+        # Row predicate of CrossModelSubsetMaterializer._query_all_model_predictions
+        self.in_model_family = _bool_column(rows, 'in_model_family')
+
+    @classmethod
+    def query(cls, bq_client: bigquery.Client, game_date: str) -> 'DatePredictionFrame':
+        """Scan all active OVER/UNDER predictions for a date (one query)."""
+        query = f"""
+        WITH player_names AS (
+          SELECT player_lookup, player_name
+          FROM `nba_reference.nba_players_registry`
+          QUALIFY ROW_NUMBER() OVER (PARTITION BY player_lookup ORDER BY season DESC) = 1
+        ),
+        team_info AS (
+          SELECT player_lookup, team_abbr, opponent_team_abbr, game_date
+          FROM (
+            SELECT player_lookup, team_abbr, opponent_team_abbr, game_date,
+                   ROW_NUMBER() OVER (PARTITION BY player_lookup, game_date
+                                      ORDER BY source_priority) as rn
+            FROM (
+              SELECT player_lookup, team_abbr, opponent_team_abbr, game_date,
+                     1 as source_priority
+              FROM `nba_analytics.player_game_summary`
+              WHERE game_date = @game_date
+              UNION ALL
+              SELECT player_lookup, team_abbr, opponent_team_abbr, game_date,
+                     2 as source_priority
+              FROM `nba_analytics.upcoming_player_game_context`
+              WHERE game_date = @game_date
+            )
+          )
+          WHERE rn = 1
+        ),
+        -- Session 170 filter, per model: most common model_version with a line
+        current_versions AS (
+          SELECT system_id, model_version
+          FROM (
+            SELECT system_id, model_version, COUNT(*) as n
+            FROM `nba_predictions.player_prop_predictions`
+            WHERE game_date = @game_date
+              AND is_active = TRUE AND current_points_line IS NOT NULL
+            GROUP BY system_id, model_version
+          )
+          QUALIFY ROW_NUMBER() OVER (PARTITION BY system_id ORDER BY n DESC) = 1
+        )
+        SELECT
+          p.system_id,
+          p.prediction_id,
+          p.game_id,
+          p.player_lookup,
+          COALESCE(pn.player_name, p.player_lookup) as player_name,
+          ti.team_abbr as team,
+          ti.opponent_team_abbr as opponent,
+          p.predicted_points,
+          p.current_points_line,
+          p.recommendation,
+          p.confidence_score,
+          ABS(p.predicted_points - p.current_points_line) as edge,
+          (ABS(p.predicted_points - p.current_points_line) * 10) + (p.confidence_score * 0.5) as composite_score,
+          -- Quality provenance
+          COALESCE(f.feature_quality_score, 0) as feature_quality_score,
+          p.default_feature_count,
+          p.line_source,
+          p.prediction_run_mode,
+          p.prediction_made_before_game,
+          p.quality_alert_level,
+          -- Cross-model columns (same casts as the cross-model query)
+          CAST(p.current_points_line AS FLOAT64) AS line_value,
+          CAST(p.predicted_points - p.current_points_line AS FLOAT64) AS signed_edge,
+          -- Row predicates evaluated in memory
+          COALESCE(p.model_version = cv.model_version, FALSE) AS is_current_version,
+          {build_system_id_sql_filter('p')} AS in_model_family
+        FROM `nba_predictions.player_prop_predictions` p
+        LEFT JOIN player_names pn
+          ON p.player_lookup = pn.player_lookup
+        LEFT JOIN team_info ti
+          ON p.player_lookup = ti.player_lookup
+          AND p.game_date = ti.game_date
+        LEFT JOIN `nba_predictions.ml_feature_store_v2` f
+          ON p.player_lookup = f.player_lookup
+          AND p.game_date = f.game_date
+        LEFT JOIN current_versions cv
+          ON p.system_id = cv.system_id
+        WHERE p.game_date = @game_date
+          AND p.is_active = TRUE
+          AND p.recommendation IN ('OVER', 'UNDER')
+        ORDER BY p.system_id, composite_score DESC
+        """
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter('game_date', 'DATE', game_date),
+            ]
+        )
+        result = bq_client.query(query, job_config=job_config).result(timeout=90)
+        frame = cls(game_date, [dict(row) for row in result])
+        logger.info(
+            f"Prediction frame for {game_date}: {frame.size} rows across "
+            f"{len(frame.system_ids)} models (single scan)"
+        )
+        return frame
+
+    @property
+    def system_ids(self) -> List[str]:
+        """Distinct system_ids with active OVER/UNDER predictions."""
+        return sorted(set(self.system_id.tolist()))
+
+    def model_indices(self, system_id: str, min_quality: float) -> np.ndarray:
+        """Row indices of _query_all_predictions(system_id, min_quality), in its order."""
+        mask = (
+            (self.system_id == system_id)
+            & self.materializable
+            & (self.feature_quality_score >= min_quality)
+        )
+        indices = np.flatnonzero(mask)
+        # composite_score DESC, NULLs last; stable so scan order breaks ties
+        order = np.argsort(-self.composite_score[indices], kind='stable')
+        return indices[order]
+
+    def subset_indices(
+        self,
+        candidates: np.ndarray,
+        subset: Dict[str, Any],
+        daily_signal: Optional[Dict[str, Any]],
+    ) -> np.ndarray:
+        """
+        Vectorized SubsetMaterializer._filter_picks_for_subset over candidate rows.
+
+        Returns the qualifying row indices in rank order (top_n applied).
+        """
+        signal = daily_signal.get('daily_signal') if daily_signal else None
+        pct_over = daily_signal.get('pct_over') if daily_signal else None
+
+        # Subset-level gates (daily signal / pct_over) keep or drop every row
+        signal_condition = subset.get('signal_condition')
+        if signal_condition and signal_condition != 'ANY' and signal:
+            if signal_condition == 'GREEN_OR_YELLOW':
+                if signal not in ('GREEN', 'YELLOW'):
+                    return candidates[:0]
+            elif signal != signal_condition:
+                return candidates[:0]
+
+        if pct_over is not None:
+            pct_over_min = subset.get('pct_over_min')
+            pct_over_max = subset.get('pct_over_max')
+            if pct_over_min is not None and pct_over < float(pct_over_min):
+                return candidates[:0]
+            if pct_over_max is not None and pct_over > float(pct_over_max):
+                return candidates[:0]
+
+        mask = np.ones(len(candidates), dtype=bool)
+
+        if subset.get('min_edge'):
+            mask &= self.edge[candidates] >= float(subset['min_edge'])
+
+        if subset.get('min_confidence'):
+            mask &= self.confidence_score[candidates] >= float(subset['min_confidence'])
+
+        direction = subset.get('direction')
+        if direction and direction not in ('ANY', None):
+            mask &= self.recommendation[candidates] == direction
+
+        # Session 209: same rule as shared.utils.quality_filter.should_include_prediction
+        if subset.get('require_quality_ready'):
+            mask &= self.quality_alert_level[candidates] == 'green'
+
+        selected = candidates[mask]
+        if subset.get('top_n'):
+            selected = selected[:int(subset['top_n'])]
+        return selected
+
+    def cross_model_predictions(self) -> List[Dict[str, Any]]:
+        """Rows in the shape of CrossModelSubsetMaterializer._query_all_model_predictions."""
+        def as_float(value):
+            return None if value is None else float(value)
+
+        return [
+            {
+                'player_lookup': row['player_lookup'],
+                'game_id': row['game_id'],
+                'system_id': row['system_id'],
+                'predicted_points': as_float(row['predicted_points']),
+                'line_value': row['line_value'],
+                'recommendation': row['recommendation'],
+                'edge': row['signed_edge'],
+                'confidence_score': as_float(row['confidence_score']),
+            }
+            for row in (self.rows[i] for i in np.flatnonzero(self.in_model_family))
+        ]
@@ -7,6 +7,7 @@ Used for the "Tonight" tab in the player detail panel (~3-5 KB per player).
 
 import json
 import logging
+from concurrent.futures import Future
 from typing import Dict, List, Any, Optional
 from datetime import date, datetime
 
@@ -71,9 +72,6 @@ class TonightPlayerExporter(BaseExporter):
         # Get splits for tonight's factors
         splits = self._query_relevant_splits(player_lookup, context, target_date)
 
-        # Get current streak
-        streak = self._compute_streak(recent_form)
-
         # Get quick numbers
         quick_numbers = self._query_quick_numbers(player_lookup, target_date)
 
@@ -81,6 +79,70 @@ class TonightPlayerExporter(BaseExporter):
         opponent_abbr = context.get('opponent_team_abbr')
         defense_tier = self._query_defense_tier(opponent_abbr, target_date) if opponent_abbr else None
 
+        return self._assemble_player_json(
+            player_lookup, target_date, context, prediction, fatigue,
+            recent_form, splits, quick_numbers, defense_tier
+        )
+
+    def generate_json_from_batch(
+        self,
+        player_lookup: str,
+        target_date: str,
+        batch: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Generate tonight's detail JSON for a player from prefetched batch data.
+
+        Produces the same JSON as generate_json(), but reads every input from
+        the in-memory indexes built by _query_date_batch() instead of issuing
+        per-player queries.
+
+        Args:
+            player_lookup: Player identifier
+            target_date: Date string in YYYY-MM-DD format
+            batch: Indexes returned by _query_date_batch()
+
+        Returns:
+            Dictionary ready for JSON serialization
+        """
+        context = batch['game_context'].get(player_lookup)
+
+        if not context:
+            logger.warning(f"No game found for {player_lookup} on {target_date}")
+            return self._empty_response(player_lookup, target_date)
+
+        # Rows are shared with the batch indexes; copy the ones assembly mutates
+        context = dict(context)
+        opponent_abbr = context.get('opponent_team_abbr')
+
+        prediction = batch['prediction'].get(player_lookup)
+        fatigue = self._format_fatigue(batch['fatigue'].get(player_lookup))
+        recent_form = self._format_recent_form(batch['recent_form'].get(player_lookup, []))
+        splits = self._lookup_splits(batch['splits'], player_lookup, opponent_abbr)
+        quick_numbers = self._format_quick_numbers(batch['quick_numbers'].get(player_lookup))
+        defense_tier = batch['defense_tier'].get(opponent_abbr) if opponent_abbr else None
+
+        return self._assemble_player_json(
+            player_lookup, target_date, context, prediction, fatigue,
+            recent_form, splits, quick_numbers, defense_tier
+        )
+
+    def _assemble_player_json(
+        self,
+        player_lookup: str,
+        target_date: str,
+        context: Dict,
+        prediction: Optional[Dict],
+        fatigue: Dict[str, Any],
+        recent_form: List[Dict],
+        splits: Dict[str, Any],
+        quick_numbers: Dict[str, Any],
+        defense_tier: Optional[Dict]
+    ) -> Dict[str, Any]:
+        """Build the tonight JSON from already-queried player inputs."""
+        # Get current streak
+        streak = self._compute_streak(recent_form)
+
         # Compute days_rest fallback from recent_form if UPCG didn't have it
         if context.get('days_rest') is None and recent_form:
             last_game_str = recent_form[0].get('game_date')
@@ -238,9 +300,12 @@ class TonightPlayerExporter(BaseExporter):
             bigquery.ScalarQueryParameter('target_date', 'DATE', target_date)
         ]
         results = self.query_to_list(query, params)
+        return self._format_fatigue(results[0] if results else None)
 
-        if results:
-            r = results[0]
+    @staticmethod
+    def _format_fatigue(r: Optional[Dict]) -> Dict[str, Any]:
+        """Format a player_composite_factors row into the fatigue block."""
+        if r:
             score = r.get('fatigue_score')
             if score is not None:
                 if score >= 95:
@@ -305,7 +370,11 @@ class TonightPlayerExporter(BaseExporter):
             bigquery.ScalarQueryParameter('before_date', 'DATE', before_date)
         ]
         results = self.query_to_list(query, params)
+        return self._format_recent_form(results)
 
+    @staticmethod
+    def _format_recent_form(results: List[Dict]) -> List[Dict]:
+        """Format player_game_summary rows (newest first) into recent_form."""
         formatted = []
         for r in results:
             # Derive home_game from game_id (format: YYYYMMDD_AWAY_HOME)
@@ -405,9 +474,12 @@ class TonightPlayerExporter(BaseExporter):
             bigquery.ScalarQueryParameter('target_date', 'DATE', target_date)
         ]
         results = self.query_to_list(query, params)
+        return self._format_quick_numbers(results[0] if results else None)
 
-        if results:
-            r = results[0]
+    @staticmethod
+    def _format_quick_numbers(r: Optional[Dict]) -> Dict[str, Any]:
+        """Format a season/last-10/last-5 averages row into quick_numbers."""
+        if r:
             return {
                 'season_ppg': safe_float(r.get('season_ppg')),
                 'season_mpg': safe_float(r.get('season_mpg')),
@@ -566,9 +638,12 @@ class TonightPlayerExporter(BaseExporter):
         ]
 
         results = self.query_to_list(query, params)
+        return self._format_defense_tier(results[0] if results else None)
 
-        if results:
-            r = results[0]
+    @staticmethod
+    def _format_defense_tier(r: Optional[Dict]) -> Optional[Dict]:
+        """Format a ranked team defense row into the defense tier block."""
+        if r:
             return {
                 'rank': r.get('rank_ppg'),
                 'tier_label': r.get('tier_label'),
@@ -578,6 +653,385 @@ class TonightPlayerExporter(BaseExporter):
 
         return None
 
+    # ------------------------------------------------------------------
+    # Batch (whole-date) queries
+    #
+    # Each query below is the set-based equivalent of one per-player
+    # _query_* method: same tables, filters and rounding, but partitioned
+    # by player_lookup so one query covers every player on the date.
+    # ------------------------------------------------------------------
+
+    def _query_date_batch(self, target_date: str, player_lookups: List[str]) -> Dict[str, Any]:
+        """
+        Run the seven tonight queries once for all players on a date.
+
+        Args:
+            target_date: Date string in YYYY-MM-DD format
+            player_lookups: Players with games on the date
+
+        Returns:
+            Dict of in-memory indexes consumed by generate_json_from_batch():
+            game_context, prediction, fatigue, quick_numbers keyed by player;
+            recent_form keyed by player (list, newest first); splits keyed by
+            player with per-opponent splits nested; defense_tier keyed by team.
+        """
+        params = [
+            bigquery.ArrayQueryParameter('player_lookups', 'STRING', player_lookups),
+            bigquery.ScalarQueryParameter('target_date', 'DATE', target_date)
+        ]
+
+        splits = {}
+        for r in self._query_batch_relevant_splits(params):
+            r = dict(r)
+            by_opponent = r.pop('by_opponent', None) or []
+            r['by_opponent'] = {o['opponent']: o for o in by_opponent}
+            splits[r['player_lookup']] = r
+
+        defense_tier = {}
+        for r in self._query_batch_defense_tiers(target_date):
+            defense_tier[r['team_abbr']] = self._format_defense_tier(r)
+
+        return {
+            'game_context': self._index_first(self._query_batch_game_context(params)),
+            'prediction': self._index_first(self._query_batch_predictions(params)),
+            'fatigue': self._index_first(self._query_batch_fatigue(params)),
+            'recent_form': self._group_rows(self._query_batch_recent_form(params)),
+            'quick_numbers': self._index_first(self._query_batch_quick_numbers(params)),
+            'splits': splits,
+            'defense_tier': defense_tier,
+        }
+
+    @staticmethod
+    def _index_first(rows: List[Dict]) -> Dict[str, Dict]:
+        """Index rows by player_lookup, keeping the first row per player."""
+        index = {}
+        for r in rows:
+            index.setdefault(r['player_lookup'], r)
+        return index
+
+    @staticmethod
+    def _group_rows(rows: List[Dict]) -> Dict[str, List[Dict]]:
+        """Group rows by player_lookup, preserving query order within each player."""
+        groups = {}
+        for r in rows:
+            groups.setdefault(r['player_lookup'], []).append(r)
+        return groups
+
+    @staticmethod
+    def _lookup_splits(
+        splits_index: Dict[str, Dict],
+        player_lookup: str,
+        opponent_abbr: Optional[str]
+    ) -> Dict[str, Any]:
+        """Combine a player's base splits with their vs-opponent split."""
+        base = splits_index.get(player_lookup)
+        if base is None:
+            return {}
+
+        splits = {k: v for k, v in base.items() if k not in ('player_lookup', 'by_opponent')}
+        vs_opp = base['by_opponent'].get(opponent_abbr) if opponent_abbr else None
+        # Same values the per-player aggregate yields when no game matches
+        splits['vs_opponent_ppg'] = vs_opp.get('vs_opponent_ppg') if vs_opp else None
+        splits['vs_opponent_games'] = vs_opp.get('vs_opponent_games') if vs_opp else 0
+        splits['vs_opponent_vs_line_pct'] = vs_opp.get('vs_opponent_vs_line_pct') if vs_opp else None
+        return splits
+
+    def _query_batch_game_context(self, params: List) -> List[Dict]:
+        """Query tonight's game context for all players (see _query_game_context)."""
+        query = """
+        WITH context AS (
+            SELECT
+                gc.player_lookup,
+                gc.game_id,
+                gc.team_abbr,
+                gc.opponent_team_abbr,
+                gc.home_game,
+                gc.days_rest,
+                gc.back_to_back,
+                gc.opening_points_line,
+                gc.current_points_line,
+                gc.line_movement
+            FROM `nba-props-platform.nba_analytics.upcoming_player_game_context` gc
+            WHERE gc.player_lookup IN UNNEST(@player_lookups)
+              AND gc.game_date = @target_date
+        ),
+        player_name AS (
+            SELECT player_lookup, player_name
+            FROM `nba-props-platform.nba_reference.nba_players_registry`
+            WHERE player_lookup IN UNNEST(@player_lookups)
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY player_lookup ORDER BY season DESC) = 1
+        ),
+        injury AS (
+            SELECT
+                player_lookup,
+                injury_status,
+                reason as injury_reason
+            FROM `nba-props-platform.nba_raw.nbac_injury_report`
+            WHERE player_lookup IN UNNEST(@player_lookups)
+              AND report_date <= @target_date
+            QUALIFY ROW_NUMBER() OVER (
+                PARTITION BY player_lookup ORDER BY report_date DESC, report_hour DESC
+            ) = 1
+        )
+        SELECT
+            c.*,
+            COALESCE(pn.player_name, c.player_lookup) as player_full_name,
+            i.injury_status,
+            i.injury_reason
+        FROM context c
+        LEFT JOIN player_name pn ON c.player_lookup = pn.player_lookup
+        LEFT JOIN injury i ON c.player_lookup = i.player_lookup
+        """
+        return self.query_to_list(query, params)
+
+    def _query_batch_predictions(self, params: List) -> List[Dict]:
+        """Query latest active prediction for all players (see _query_prediction)."""
+        query = """
+        SELECT
+            player_lookup,
+            predicted_points,
+            confidence_score,
+            recommendation,
+            current_points_line,
+            line_margin,
+            pace_adjustment,
+            similar_games_count
+        FROM `nba-props-platform.nba_predictions.player_prop_predictions`
+        WHERE player_lookup IN UNNEST(@player_lookups)
+          AND game_date = @target_date
+          AND is_active = TRUE
+        QUALIFY ROW_NUMBER() OVER (PARTITION BY player_lookup ORDER BY created_at DESC) = 1
+        """
+        return self.query_to_list(query, params)
+
+    def _query_batch_fatigue(self, params: List) -> List[Dict]:
+        """Query fatigue rows for all players (see _query_fatigue)."""
+        query = """
+        SELECT
+            player_lookup,
+            fatigue_score,
+            fatigue_context_json
+        FROM `nba-props-platform.nba_precompute.player_composite_factors`
+        WHERE player_lookup IN UNNEST(@player_lookups)
+          AND game_date = @target_date
+        """
+        return self.query_to_list(query, params)
+
+    def _query_batch_recent_form(self, params: List) -> List[Dict]:
+        """Query last 10 games for all players, newest first (see _query_recent_form)."""
+        query = """
+        SELECT
+            player_lookup,
+            game_date,
+            game_id,
+            opponent_team_abbr,
+            team_abbr,
+            points,
+            minutes_played,
+            fg_makes,
+            fg_attempts,
+            three_pt_makes,
+            three_pt_attempts,
+            ft_makes,
+            ft_attempts,
+            over_under_result,
+            points_line,
+            is_dnp
+        FROM `nba-props-platform.nba_analytics.player_game_summary`
+        WHERE player_lookup IN UNNEST(@player_lookups)
+          AND game_date < @target_date
+        QUALIFY ROW_NUMBER() OVER (PARTITION BY player_lookup ORDER BY game_date DESC) <= 10
+        ORDER BY player_lookup, game_date DESC
+        """
+        return self.query_to_list(query, params)
+
+    def _query_batch_quick_numbers(self, params: List) -> List[Dict]:
+        """Query quick stat numbers for all players (see _query_quick_numbers).
+
+        Driven from the player list so every player gets a row, matching the
+        single-row aggregate the per-player query returns for players with
+        no games (games_played = 0, averages NULL).
+        """
+        query = """
+        WITH season AS (
+            SELECT
+                player_lookup,
+                ROUND(AVG(points), 1) as season_ppg,
+                ROUND(AVG(minutes_played), 1) as season_mpg,
+                COUNT(*) as games_played
+            FROM `nba-props-platform.nba_analytics.player_game_summary`
+            WHERE player_lookup IN UNNEST(@player_lookups)
+              AND season_year = CASE
+                WHEN EXTRACT(MONTH FROM @target_date) >= 10 THEN EXTRACT(YEAR FROM @target_date)
+                ELSE EXTRACT(YEAR FROM @target_date) - 1
+              END
+              AND game_date < @target_date
+            GROUP BY player_lookup
+        ),
+        recent AS (
+            SELECT
+                player_lookup,
+                points,
+                minutes_played,
+                ROW_NUMBER() OVER (PARTITION BY player_lookup ORDER BY game_date DESC) as rn
+            FROM `nba-props-platform.nba_analytics.player_game_summary`
+            WHERE player_lookup IN UNNEST(@player_lookups)
+              AND game_date < @target_date
+        ),
+        recent_avgs AS (
+            SELECT
+                player_lookup,
+                ROUND(AVG(points), 1) as last_10_ppg,
+                ROUND(AVG(minutes_played), 1) as last_10_mpg,
+                ROUND(AVG(IF(rn <= 5, points, NULL)), 1) as last_5_ppg,
+                ROUND(AVG(IF(rn <= 5, minutes_played, NULL)), 1) as last_5_mpg
+            FROM recent
+            WHERE rn <= 10
+            GROUP BY player_lookup
+        )
+        SELECT
+            player_lookup,
+            s.season_ppg,
+            s.season_mpg,
+            COALESCE(s.games_played, 0) as games_played,
+            r.last_10_ppg,
+            r.last_10_mpg,
+            r.last_5_ppg,
+            r.last_5_mpg
+        FROM UNNEST(@player_lookups) AS player_lookup
+        LEFT JOIN season s USING (player_lookup)
+        LEFT JOIN recent_avgs r USING (player_lookup)
+        """
+        return self.query_to_list(query, params)
+
+    def _query_batch_relevant_splits(self, params: List) -> List[Dict]:
+        """Query season splits for all players (see _query_relevant_splits).
+
+        The vs-opponent split depends on tonight's opponent, so it is returned
+        for every opponent the player has faced (by_opponent) and picked in
+        memory by _lookup_splits(). Driven from the player list so players
+        with no games get the same empty aggregate as the per-player query.
+        """
+        query = """
+        WITH games AS (
+            SELECT
+                g.player_lookup,
+                g.game_date,
+                g.points,
+                g.over_under_result,
+                g.opponent_team_abbr,
+                -- Derive home_game from game_id (format: YYYYMMDD_AWAY_HOME)
+                ENDS_WITH(g.game_id, CONCAT('_', g.team_abbr)) as home_game,
+                -- Calculate days_rest from previous game
+                DATE_DIFF(
+                    g.game_date,
+                    LAG(g.game_date) OVER (PARTITION BY g.player_lookup ORDER BY g.game_date),
+                    DAY
+                ) as days_rest
+            FROM `nba-props-platform.nba_analytics.player_game_summary` g
+            WHERE g.player_lookup IN UNNEST(@player_lookups)
+              AND g.game_date < @target_date
+              AND g.season_year = CASE
+                WHEN EXTRACT(MONTH FROM @target_date) >= 10 THEN EXTRACT(YEAR FROM @target_date)
+                ELSE EXTRACT(YEAR FROM @target_date) - 1
+              END
+        ),
+        base AS (
+            SELECT
+                player_lookup,
+                -- Home/Away split
+                ROUND(AVG(CASE WHEN home_game THEN points END), 1) as home_ppg,
+                COUNT(CASE WHEN home_game THEN 1 END) as home_games,
+                ROUND(SAFE_DIVIDE(COUNTIF(home_game AND over_under_result = 'OVER'), COUNTIF(home_game AND over_under_result IS NOT NULL)), 3) as home_vs_line_pct,
+                ROUND(AVG(CASE WHEN NOT home_game THEN points END), 1) as away_ppg,
+                COUNT(CASE WHEN NOT home_game THEN 1 END) as away_games,
+                ROUND(SAFE_DIVIDE(COUNTIF(NOT home_game AND over_under_result = 'OVER'), COUNTIF(NOT home_game AND over_under_result IS NOT NULL)), 3) as away_vs_line_pct,
+
+                -- B2B split (days_rest = 1)
+                ROUND(AVG(CASE WHEN days_rest = 1 THEN points END), 1) as b2b_ppg,
+                COUNT(CASE WHEN days_rest = 1 THEN 1 END) as b2b_games,
+                ROUND(SAFE_DIVIDE(COUNTIF(days_rest = 1 AND over_under_result = 'OVER'), COUNTIF(days_rest = 1 AND over_under_result IS NOT NULL)), 3) as b2b_vs_line_pct,
+                ROUND(AVG(CASE WHEN days_rest > 1 OR days_rest IS NULL THEN points END), 1) as non_b2b_ppg,
+
+                -- Rest split
+                ROUND(AVG(CASE WHEN days_rest >= 2 THEN points END), 1) as rested_ppg,
+                COUNT(CASE WHEN days_rest >= 2 THEN 1 END) as rested_games,
+                ROUND(SAFE_DIVIDE(COUNTIF(days_rest >= 2 AND over_under_result = 'OVER'), COUNTIF(days_rest >= 2 AND over_under_result IS NOT NULL)), 3) as rested_vs_line_pct
+            FROM UNNEST(@player_lookups) AS player_lookup
+            LEFT JOIN games USING (player_lookup)
+            GROUP BY player_lookup
+        ),
+        vs_opponent AS (
+            SELECT
+                player_lookup,
+                ARRAY_AGG(STRUCT(
+                    opponent,
+                    vs_opponent_ppg,
+                    vs_opponent_games,
+                    vs_opponent_vs_line_pct
+                )) as by_opponent
+            FROM (
+                SELECT
+                    player_lookup,
+                    opponent_team_abbr as opponent,
+                    ROUND(AVG(points), 1) as vs_opponent_ppg,
+                    COUNT(*) as vs_opponent_games,
+                    ROUND(SAFE_DIVIDE(COUNTIF(over_under_result = 'OVER'), COUNTIF(over_under_result IS NOT NULL)), 3) as vs_opponent_vs_line_pct
+                FROM games
+                WHERE opponent_team_abbr IS NOT NULL
+                GROUP BY player_lookup, opponent_team_abbr
+            )
+            GROUP BY player_lookup
+        )
+        SELECT
+            b.*,
+            o.by_opponent
+        FROM base b
+        LEFT JOIN vs_opponent o USING (player_lookup)
+        """
+        return self.query_to_list(query, params)
+
+    def _query_batch_defense_tiers(self, target_date: str) -> List[Dict]:
+        """Query defense tier rows for every team (see _query_defense_tier)."""
+        query = """
+        WITH latest_defense AS (
+            -- Get most recent defense data for each team
+            SELECT
+                team_abbr,
+                opponent_points_per_game,
+                defensive_rating_last_15,
+                analysis_date
+            FROM `nba-props-platform.nba_precompute.team_defense_zone_analysis`
+            WHERE analysis_date <= @target_date
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY team_abbr ORDER BY analysis_date DESC) = 1
+        ),
+        ranked_defense AS (
+            -- Rank teams by PPG allowed (lower = better defense)
+            SELECT
+                team_abbr,
+                opponent_points_per_game,
+                defensive_rating_last_15,
+                RANK() OVER (ORDER BY opponent_points_per_game ASC) as rank_ppg
+            FROM latest_defense
+        )
+        SELECT
+            team_abbr,
+            opponent_points_per_game,
+            defensive_rating_last_15,
+            rank_ppg,
+            CASE
+                WHEN rank_ppg <= 5 THEN 'elite'
+                WHEN rank_ppg <= 10 THEN 'good'
+                WHEN rank_ppg <= 20 THEN 'average'
+                ELSE 'weak'
+            END as tier_label
+        FROM ranked_defense
+        """
+        params = [
+            bigquery.ScalarQueryParameter('target_date', 'DATE', target_date)
+        ]
+        return self.query_to_list(query, params)
+
     def _format_opponent_defense(self, defense_tier: Optional[Dict]) -> Optional[Dict]:
         """Format opponent defense data for the response."""
         if not defense_tier:
@@ -957,25 +1411,50 @@ class TonightPlayerExporter(BaseExporter):
         logger.info(f"Exporting tonight detail for {player_lookup} on {target_date}")
 
         json_data = self.generate_json(player_lookup, target_date)
+        futures = self._queue_player_json(json_data, player_lookup, target_date, update_latest)
+        for future in futures[1:]:
+            future.result()
+        return futures[0].result()
 
+    def _queue_player_json(
+        self,
+        json_data: Dict[str, Any],
+        player_lookup: str,
+        target_date: str,
+        update_latest: bool
+    ) -> List[Future]:
+        """Queue a player's uploads; the date-keyed path's future comes first."""
         # Date-keyed path (long cache, preserved for historical browsing)
         date_path = f'tonight/player/{target_date}/{player_lookup}.json'
-        gcs_path = self.upload_to_gcs(json_data, date_path, 'public, max-age=86400')
+        futures = [self.queue_upload(json_data, date_path, 'public, max-age=86400')]
 
         # Latest path (short cache, backwards compat)
         if update_latest:
             latest_path = f'tonight/player/{player_lookup}.json'
-            self.upload_to_gcs(json_data, latest_path, 'public, max-age=300')
+            futures.append(self.queue_upload(json_data, latest_path, 'public, max-age=300'))
 
-        return gcs_path
+        return futures
 
-    def export_all_for_date(self, target_date: str, update_latest: bool = True) -> List[str]:
+    def export_all_for_date(
+        self,
+        target_date: str,
+        update_latest: bool = True,
+        batch: bool = True
+    ) -> List[str]:
         """
         Export tonight details for all players with games on the date.
 
+        In batch mode the seven tonight queries run once for the whole date
+        (~7 queries instead of ~7 per player) and each player's JSON is
+        assembled from the in-memory indexes; output is identical to
+        export(). If the batch queries fail, falls back to per-player queries.
+        Uploads are queued on the exporter's publisher while later players
+        are assembled.
+
         Args:
             target_date: Date string in YYYY-MM-DD format
             update_latest: If True, also write the latest (non-date-keyed) path
+            batch: If True, prefetch all players' data with set-based queries
 
         Returns:
             List of GCS paths
@@ -992,24 +1471,56 @@ class TonightPlayerExporter(BaseExporter):
             bigquery.ScalarQueryParameter('target_date', 'DATE', target_date)
         ]
         players = self.query_to_list(query, params)
+        player_lookups = [p['player_lookup'] for p in players]
 
-        paths = []
-        failures = []
-        for i, p in enumerate(players):
-            player_lookup = p['player_lookup']
+        batch_data = None
+        if batch and player_lookups:
             try:
-                logger.info(f"[{i+1}/{len(players)}] Exporting {player_lookup}")
-                path = self.export(player_lookup, target_date, update_latest=update_latest)
-                paths.append(path)
+                batch_data = self._query_date_batch(target_date, player_lookups)
+                logger.info(f"Prefetched tonight data for {len(player_lookups)} players in batch")
             except Exception as e:
-                logger.error(
-                    f"[{i+1}/{len(players)}] Failed to export {player_lookup}: {e}",
+                logger.warning(
+                    f"Batch prefetch failed for {target_date}, falling back to "
+                    f"per-player queries: {e}",
                     exc_info=True
                 )
-                failures.append({'player': player_lookup, 'error': str(e)})
+
+        total = len(player_lookups)
+        paths = []
+        failures = []
+
+        def record_failure(i: int, player_lookup: str, e: Exception) -> None:
+            logger.error(
+                f"[{i+1}/{total}] Failed to export {player_lookup}: {e}",
+                exc_info=True
+            )
+            failures.append({'player': player_lookup, 'error': str(e)})
+
+        queued = []
+        for i, player_lookup in enumerate(player_lookups):
+            try:
+                logger.info(f"[{i+1}/{total}] Exporting {player_lookup}")
+                if batch_data is None:
+                    json_data = self.generate_json(player_lookup, target_date)
+                else:
+                    json_data = self.generate_json_from_batch(player_lookup, target_date, batch_data)
+                futures = self._queue_player_json(json_data, player_lookup, target_date, update_latest)
+                queued.append((i, player_lookup, futures))
+            except Exception as e:
+                record_failure(i, player_lookup, e)
+
+        for i, player_lookup, futures in queued:
+            try:
+                for future in futures[1:]:
+                    future.result()
+                paths.append(futures[0].result())
+            except Exception as e:
+                record_failure(i, player_lookup, e)
+
+        # Errors were recorded per player above
+        self.flush_uploads(raise_on_error=False)
 
         # Log summary
-        total = len(players)
         success_count = len(paths)
         failure_count = len(failures)
         logger.info(
@@ -38,6 +38,7 @@ from google.cloud import bigquery, storage
 
 from data_processors.raw.processor_base import ProcessorBase
 from shared.clients.bigquery_pool import get_bigquery_client
+from shared.utils.gcs_bulk_reader import GCSBulkReader
 
 logger = logging.getLogger(__name__)
 
@@ -73,26 +74,25 @@ class BasketballRefRosterBatchProcessor(ProcessorBase):
         bucket_name = self.opts.get('bucket', 'nba-scraped-data')
         prefix = f'basketball-ref/season-rosters/{season}/'
 
-        # List all files in season directory
+        # Download all team files concurrently; results arrive in listing order
         bucket = self.gcs_client.bucket(bucket_name)
-        blobs = bucket.list_blobs(prefix=prefix)
+        reader = GCSBulkReader(bucket, name=self.processor_name)
 
         team_count = 0
-        for blob in blobs:
+        for item in reader.read_json(
+            prefix,
             # Skip non-JSON files and completion markers
-            if not blob.name.endswith('.json') or blob.name.endswith('_COMPLETE.json'):
-                continue
-
+            include=lambda name: name.endswith('.json') and not name.endswith('_COMPLETE.json'),
+        ):
             # Extract team abbreviation from filename
-            team_abbr = blob.name.split('/')[-1].replace('.json', '')
+            team_abbr = item.name.split('/')[-1].replace('.json', '')
 
-            # Download and parse roster data
             try:
-                content = blob.download_as_text()
-                team_roster = json.loads(content)
+                if item.error is not None:
+                    raise item.error
 
                 # Transform team roster to BigQuery rows
-                self._transform_team_roster(team_roster, team_abbr, season)
+                self._transform_team_roster(item.data, team_abbr, season)
                 team_count += 1
 
             except Exception as e:
@@ -19,7 +19,6 @@ Version: 1.0
 Created: 2026-01-14
 """
 
-import json
 import logging
 import os
 import uuid
@@ -35,6 +34,7 @@ from data_processors.raw.oddsapi.odds_game_lines_processor import OddsGameLinesP
 
 # Standardized error handling utility
 from shared.utils.error_context import ErrorContext, log_operation_error
+from shared.utils.gcs_bulk_reader import GCSBulkReader, GenerationLedger
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +62,7 @@ class OddsApiGameLinesBatchProcessor(ProcessorBase):
         self.bq_client = get_bigquery_client(self.project_id)
         self.table_name = 'nba_raw.odds_api_game_lines'
         self.files_processed = 0
+        self._reader: Optional[GCSBulkReader] = None
 
     def load_data(self) -> None:
         """Load all game-lines files for the date from GCS."""
@@ -78,46 +79,45 @@ class OddsApiGameLinesBatchProcessor(ProcessorBase):
         prefix = f'odds-api/game-lines/{game_date}/'
 
         bucket = self.gcs_client.bucket(bucket_name)
-        # NOTE: Iterate directly over list_blobs() to ensure all pages are consumed.
-        # Converting to list() immediately may only capture the first page of results.
-        blobs = bucket.list_blobs(prefix=prefix)
+        # Downloads run concurrently; files arrive here in listing order.
+        # Snapshots already merged by an earlier run are skipped when a
+        # generation ledger is configured (GCS_GENERATION_LEDGER_PATH).
+        self._reader = GCSBulkReader(bucket, ledger=GenerationLedger.from_env(),
+                                     name=self.processor_name)
 
         file_count = 0
         failed_files = []  # CRITICAL FIX (Jan 25, 2026): Track failures
 
-        for blob in blobs:
-            # Skip non-JSON files
-            if not blob.name.endswith('.json'):
-                continue
-
+        for item in self._reader.read_json(prefix):
             try:
                 # Use ErrorContext for structured error logging
                 with ErrorContext(
                     "process_game_lines_file",
                     game_date=game_date,
-                    file_path=blob.name,
+                    file_path=item.name,
                     bucket=bucket_name
                 ):
-                    content = blob.download_as_text()
-                    raw_data = json.loads(content)
+                    if item.error is not None:
+                        raise item.error
 
                     # Use the existing processor's transform logic
                     processor = OddsGameLinesProcessor()
                     processor.opts = {
-                        'file_path': blob.name,
+                        'file_path': item.name,
                         'bucket': bucket_name,
                         'project_id': self.project_id
                     }
-                    processor.raw_data = raw_data
+                    processor.raw_data = item.data
                     processor.transform_data()
 
                     if processor.transformed_data:
                         self.all_rows.extend(processor.transformed_data)
                         file_count += 1
+                    self._reader.mark_processed(item)
 
             except Exception as e:
                 # Error already logged by ErrorContext with structured fields
-                failed_files.append(blob.name)
+                failed_files.append(item.name)
 
         # CRITICAL FIX (Jan 25, 2026): Abort if too many files failed
         # This prevents partial/incomplete data from being saved
@@ -139,6 +139,7 @@ class OddsApiGameLinesBatchProcessor(ProcessorBase):
         self.raw_data = self.all_rows
         self.stats['files_loaded'] = file_count
         self.stats['rows_loaded'] = len(self.all_rows)
+        self.stats['files_skipped_unchanged'] = self._reader.stats.skipped
 
     def transform_data(self) -> None:
         """Transform data - already done during load_data()."""
@@ -149,6 +150,7 @@ class OddsApiGameLinesBatchProcessor(ProcessorBase):
         if not self.all_rows:
             logger.warning("No game-lines data to save")
             self.stats['rows_inserted'] = 0
+            self._commit_generations()
             return
 
         game_date = self.opts.get('game_date')
@@ -193,6 +195,7 @@ class OddsApiGameLinesBatchProcessor(ProcessorBase):
                 self._execute_merge(temp_table_id, table_id, game_date)
 
                 self.stats['rows_inserted'] = len(self.all_rows)
+                self._commit_generations()
 
         except Exception as e:
             # Error already logged by ErrorContext with structured fields
@@ -212,6 +215,11 @@ class OddsApiGameLinesBatchProcessor(ProcessorBase):
                     game_date=game_date
                 )
 
+    def _commit_generations(self) -> None:
+        """Record the loaded snapshots' generations once their rows are saved."""
+        if self._reader is not None:
+            self._reader.commit()
+
     def _execute_merge(self, temp_table_id: str, target_table_id: str, game_date: str = None):
         """Execute single MERGE operation for all game lines."""
         import re
@@ -312,6 +320,7 @@ class OddsApiPropsBatchProcessor(ProcessorBase):
         self.bq_client = get_bigquery_client(self.project_id)
         self.table_name = 'nba_raw.odds_api_player_points_props'
         self.files_processed = 0
+        self._reader: Optional[GCSBulkReader] = None
 
     def load_data(self) -> None:
         """Load all player-props files for the date from GCS."""
@@ -328,46 +337,45 @@ class OddsApiPropsBatchProcessor(ProcessorBase):
         prefix = f'odds-api/player-props/{game_date}/'
 
         bucket = self.gcs_client.bucket(bucket_name)
-        # NOTE: Iterate directly over list_blobs() to ensure all pages are consumed.
-        # Converting to list() immediately may only capture the first page of results.
-        blobs = bucket.list_blobs(prefix=prefix)
+        # Downloads run concurrently; files arrive here in listing order.
+        # Snapshots already merged by an earlier run are skipped when a
+        # generation ledger is configured (GCS_GENERATION_LEDGER_PATH).
+        self._reader = GCSBulkReader(bucket, ledger=GenerationLedger.from_env(),
+                                     name=self.processor_name)
 
         file_count = 0
         failed_files = []  # CRITICAL FIX (Jan 25, 2026): Track failures
 
-        for blob in blobs:
-            # Skip non-JSON files
-            if not blob.name.endswith('.json'):
-                continue
-
+        for item in self._reader.read_json(prefix):
             try:
                 # Use ErrorContext for structured error logging
                 with ErrorContext(
                     "process_player_props_file",
                     game_date=game_date,
-                    file_path=blob.name,
+                    file_path=item.name,
                     bucket=bucket_name
                 ):
-                    content = blob.download_as_text()
-                    raw_data = json.loads(content)
+                    if item.error is not None:
+                        raise item.error
 
                     # Use the existing processor's transform logic
                     processor = OddsApiPropsProcessor()
                     processor.opts = {
-                        'file_path': blob.name,
+                        'file_path': item.name,
                         'bucket': bucket_name,
                         'project_id': self.project_id
                     }
-                    processor.raw_data = raw_data
+                    processor.raw_data = item.data
                     processor.transform_data()
 
                     if processor.transformed_data:
                         self.all_rows.extend(processor.transformed_data)
                         file_count += 1
+                    self._reader.mark_processed(item)
 
             except Exception as e:
                 # Error already logged by ErrorContext with structured fields
-                failed_files.append(blob.name)
+                failed_files.append(item.name)
 
         # CRITICAL FIX (Jan 25, 2026): Abort if too many files failed
         # This prevents partial/incomplete data from being saved
@@ -389,6 +397,7 @@ class OddsApiPropsBatchProcessor(ProcessorBase):
         self.raw_data = self.all_rows
         self.stats['files_loaded'] = file_count
         self.stats['rows_loaded'] = len(self.all_rows)
+        self.stats['files_skipped_unchanged'] = self._reader.stats.skipped
 
     def transform_data(self) -> None:
         """Transform data - already done during load_data()."""
@@ -401,6 +410,7 @@ class OddsApiPropsBatchProcessor(ProcessorBase):
         if not self.all_rows:
             logger.warning("No player-props data to save")
             self.stats['rows_inserted'] = 0
+            self._commit_generations()
             return
 
         # Convert datetime objects to ISO format strings
@@ -447,6 +457,7 @@ class OddsApiPropsBatchProcessor(ProcessorBase):
 
                 self.stats['rows_inserted'] = len(self.all_rows)
                 self.stats['files_processed'] = self.files_processed
+                self._commit_generations()
 
                 # Update predictions that were waiting for lines
                 if len(self.all_rows) > 0:
@@ -457,6 +468,11 @@ class OddsApiPropsBatchProcessor(ProcessorBase):
             self.stats['rows_inserted'] = 0
             raise
 
+    def _commit_generations(self) -> None:
+        """Record the loaded snapshots' generations once their rows are saved."""
+        if self._reader is not None:
+            self._reader.commit()
+
     def _update_predictions_with_new_lines(self) -> None:
         """
         Update NO_PROP_LINE predictions with newly loaded betting lines.
@@ -28,6 +28,11 @@ Usage:
         --template feature_set_shootout \\
         --train-start 2025-12-01 --train-end 2026-02-15 --dry-run
 
+    # 4 experiments at a time, shared data cache, resumable after interruption
+    PYTHONPATH=. python ml/experiments/grid_search_weights.py \\
+        --template mega_sweep --train-start 2025-12-01 --train-end 2026-02-15 \\
+        --workers 4 --data-cache-dir /tmp/qr_cache --ledger /tmp/mega_sweep.jsonl
+
 Created: 2026-02-28 (Session 366)
 """
 
@@ -41,12 +46,15 @@ import re
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from ml.experiments.training_runner import ResultsLedger, cell_key, threads_per_worker
+
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -247,8 +255,13 @@ def generate_combinations(grid: Dict[str, List[str]]) -> List[Dict[str, str]]:
 def build_command(base_args: str, combo: Dict[str, str],
                   train_start: str, train_end: str,
                   eval_start: str, eval_end: str,
-                  combo_idx: int, output_dir: str) -> Tuple[List[str], str]:
-    """Build the quick_retrain.py command for one combination."""
+                  combo_idx: int, output_dir: str,
+                  runner_args: Optional[List[str]] = None) -> Tuple[List[str], str]:
+    """Build the quick_retrain.py command for one combination.
+
+    runner_args (thread cap, data cache dir) are appended last; they change
+    how an experiment runs, not what it computes.
+    """
     machine_output = os.path.join(output_dir, f"result_{combo_idx:03d}.json")
 
     cmd_parts = [
@@ -271,6 +284,9 @@ def build_command(base_args: str, combo: Dict[str, str],
     for param, value in combo.items():
         cmd_parts.extend([f'--{param}', value])
 
+    if runner_args:
+        cmd_parts.extend(runner_args)
+
     return cmd_parts, machine_output
 
 
@@ -430,6 +446,13 @@ def main():
     parser.add_argument('--dry-run', action='store_true',
                         help='Show planned experiments without running')
     parser.add_argument('--csv', default=None, help='Write results to CSV file')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Experiments to run concurrently (trainer threads are split across them)')
+    parser.add_argument('--ledger', default=None, metavar='FILE',
+                        help='JSONL ledger of finished experiments; re-running skips them')
+    parser.add_argument('--data-cache-dir', default=None, metavar='DIR',
+                        help='Shared quick_retrain.py dataset cache (experiments on the '
+                             'same window load BigQuery data once)')
     args = parser.parse_args()
 
     # Resolve template
@@ -510,7 +533,17 @@ def main():
     output_dir = tempfile.mkdtemp(prefix='grid_search_')
     print(f"Output dir: {output_dir}")
 
-    results = []
+    runner_args = []
+    if args.workers > 1:
+        runner_args.extend(['--thread-count', str(threads_per_worker(args.workers))])
+    if args.data_cache_dir:
+        runner_args.extend(['--data-cache-dir', args.data_cache_dir])
+
+    ledger = ResultsLedger(args.ledger) if args.ledger else None
+    done = ledger.completed() if ledger else {}
+
+    results: List[Optional[Dict]] = [None] * len(combos)
+    pending = []
     for i, combo in enumerate(combos):
         # For window sweeps, use per-window train dates
         if window_dates:
@@ -521,14 +554,34 @@ def main():
             train_start_i = args.train_start
             train_end_i = args.train_end
 
+        key = cell_key(
+            {'base_args': base_args, 'combo': combo},
+            {'train': [train_start_i, train_end_i], 'eval': [eval_start, eval_end]},
+        )
+        if key in done:
+            logger.info(f"[{i + 1}/{len(combos)}] Already in ledger, skipping")
+            results[i] = done[key]
+            continue
+
         cmd, machine_output = build_command(
             base_args, combo,
             train_start_i, train_end_i,
             eval_start, eval_end,
-            i, output_dir,
+            i, output_dir, runner_args,
         )
+        pending.append((i, key, cmd, machine_output))
+
+    def _run(item):
+        i, key, cmd, machine_output = item
         result = run_experiment(cmd, machine_output, i, len(combos))
-        results.append(result)
+        if ledger and result is not None:
+            ledger.record(key, result)
+        return i, result
+
+    # Each experiment is its own quick_retrain.py process; threads just wait on them
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        for i, result in pool.map(_run, pending):
+            results[i] = result
 
     # For window sweeps, override combo labels with window descriptions
     if window_dates:
@@ -37,6 +37,10 @@ Usage:
     # Dry run
     PYTHONPATH=. python ml/experiments/quick_retrain.py --name "TEST" --dry-run
 
+    # Re-runs on the same closed window: reuse loaded + augmented data, tune in parallel
+    PYTHONPATH=. python ml/experiments/quick_retrain.py --name "TUNE" --tune \
+        --data-cache-dir /tmp/qr_cache --tune-workers 4 --tune-ledger /tmp/tune.jsonl
+
 Session 58 - Monthly Retraining Infrastructure
 Session 163 - Model Governance Gates
 """
@@ -89,6 +93,7 @@ from shared.ml.feature_contract import (
     get_contract,
     validate_all_contracts,
 )
+from ml.experiments.training_runner import get_dataset_cache
 
 PROJECT_ID = "nba-props-platform"
 MODEL_OUTPUT_DIR = Path("models")
@@ -237,6 +242,10 @@ def parse_args():
                        help='Run walk-forward validation (per-week eval breakdown)')
     parser.add_argument('--tune', action='store_true',
                        help='Run hyperparameter grid search before final training')
+    parser.add_argument('--tune-workers', type=int, default=1, metavar='N',
+                       help='Train N --tune grid cells concurrently (threads split across workers)')
+    parser.add_argument('--tune-ledger', type=str, default=None, metavar='FILE',
+                       help='JSONL ledger of finished --tune cells; re-running resumes from it')
 
     # Alternative experiment modes (Session 179: decouple from Vegas dependency)
     parser.add_argument('--no-vegas', action='store_true',
@@ -385,6 +394,15 @@ def parse_args():
     parser.add_argument('--machine-output', type=str, default=None, metavar='FILE',
                        help='Write JSON summary to FILE for machine parsing (used by grid search)')
 
+    # Training runner (dataset cache + bounded threads for concurrent runs)
+    parser.add_argument('--data-cache-dir', type=str, default=None, metavar='DIR',
+                       help='Parquet cache for loaded + augmented train/eval data '
+                            '(default: $QUICK_RETRAIN_DATA_CACHE; unset = no cache)')
+    parser.add_argument('--refresh-data-cache', action='store_true',
+                       help='Reload from BigQuery and overwrite cached train/eval data')
+    parser.add_argument('--thread-count', type=int, default=None, metavar='N',
+                       help='Cap trainer threads (set by grid_search_weights.py --workers)')
+
     # Experiment features (Session 407: experiment feature infrastructure)
     parser.add_argument('--experiment-features', type=str, default=None, metavar='EXPERIMENT_ID',
                        help='Augment with experiment features from ml_feature_store_experiment table. '
@@ -2507,7 +2525,48 @@ def run_walkforward_eval(model, df_eval, X_eval, y_eval, lines):
     return week_results
 
 
-def run_hyperparam_search(X_train, y_train, X_val, y_val, lines_val, w_train=None):
+def _train_grid_cell(params, data, thread_count):
+    """Train and score one hyperparameter combo (runs in a training_runner worker)."""
+    X_train, y_train, X_val, y_val, lines_val, w_train = data
+    m = cb.CatBoostRegressor(
+        iterations=1000,
+        depth=params['depth'],
+        l2_leaf_reg=params['l2_leaf_reg'],
+        learning_rate=params['learning_rate'],
+        random_seed=42,
+        verbose=0,
+        early_stopping_rounds=50,
+        thread_count=thread_count,
+        allow_writing_files=False,
+    )
+    m.fit(X_train, y_train, eval_set=(X_val, y_val), sample_weight=w_train, verbose=0)
+
+    val_preds = m.predict(X_val)
+    mae = mean_absolute_error(y_val, val_preds)
+    hr_3, n_3 = compute_hit_rate(val_preds, y_val.values, lines_val, min_edge=3.0)
+    return {
+        'params': params,
+        'mae': float(mae),
+        'hr_edge3': float(hr_3) if hr_3 is not None else None,
+        'n_edge3': int(n_3),
+    }
+
+
+def _data_fingerprint(*frames):
+    """Short hash identifying the exact training/validation data (ledger keys)."""
+    digest = hashlib.sha256()
+    for frame in frames:
+        if frame is None:
+            digest.update(b'none')
+        elif isinstance(frame, (pd.DataFrame, pd.Series)):
+            digest.update(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+        else:
+            digest.update(np.ascontiguousarray(frame).tobytes())
+    return digest.hexdigest()[:16]
+
+
+def run_hyperparam_search(X_train, y_train, X_val, y_val, lines_val, w_train=None,
+                          workers=1, ledger_path=None):
     """
     Small grid search over depth × l2_leaf_reg × learning_rate.
 
@@ -2519,10 +2578,14 @@ def run_hyperparam_search(X_train, y_train, X_val, y_val, lines_val, w_train=Non
         X_val, y_val: Validation data
         lines_val: Vegas lines for val set (approximate, from features)
         w_train: Optional sample weights
+        workers: Grid cells trained concurrently (each with cpu_count/workers threads)
+        ledger_path: Optional JSONL ledger; an interrupted search resumes from it
 
     Returns:
         Dict of best hyperparameters.
     """
+    from ml.experiments.training_runner import ResultsLedger, run_cells
+
     grid = {
         'depth': [5, 6, 7],
         'l2_leaf_reg': [1.5, 3.0, 5.0],
@@ -2536,37 +2599,31 @@ def run_hyperparam_search(X_train, y_train, X_val, y_val, lines_val, w_train=Non
                 combos.append({'depth': d, 'l2_leaf_reg': l2, 'learning_rate': lr})
 
     print(f"\n{'=' * 70}")
-    print(f" HYPERPARAMETER SEARCH ({len(combos)} combinations)")
+    print(f" HYPERPARAMETER SEARCH ({len(combos)} combinations, {workers} worker(s))")
     print(f"{'=' * 70}")
     print(f"{'#':>3s} {'Depth':>5s} {'L2':>5s} {'LR':>6s} {'MAE':>7s} {'HR 3+':>7s} {'N 3+':>5s}")
     print("-" * 50)
 
-    results = []
-    for i, params in enumerate(combos, 1):
-        m = cb.CatBoostRegressor(
-            iterations=1000,
-            depth=params['depth'],
-            l2_leaf_reg=params['l2_leaf_reg'],
-            learning_rate=params['learning_rate'],
-            random_seed=42,
-            verbose=0,
-            early_stopping_rounds=50,
-        )
-        m.fit(X_train, y_train, eval_set=(X_val, y_val), sample_weight=w_train, verbose=0)
-
-        val_preds = m.predict(X_val)
-        mae = mean_absolute_error(y_val, val_preds)
-        hr_3, n_3 = compute_hit_rate(val_preds, y_val.values, lines_val, min_edge=3.0)
-
+    def _report(i, params, result, from_ledger):
+        hr_3 = result['hr_edge3']
         hr_3_s = f"{hr_3:.1f}%" if hr_3 is not None else "N/A"
-        print(f"  {i:2d}  {params['depth']:5d} {params['l2_leaf_reg']:5.1f} {params['learning_rate']:6.3f} {mae:7.4f} {hr_3_s:>7s} {n_3:5d}")
+        resumed = "  (ledger)" if from_ledger else ""
+        print(f"  {i + 1:2d}  {params['depth']:5d} {params['l2_leaf_reg']:5.1f} {params['learning_rate']:6.3f} "
+              f"{result['mae']:7.4f} {hr_3_s:>7s} {result['n_edge3']:5d}{resumed}")
+
+    cell_results = run_cells(
+        _train_grid_cell, combos,
+        shared=(X_train, y_train, X_val, y_val, lines_val, w_train),
+        workers=workers,
+        ledger=ResultsLedger(ledger_path) if ledger_path else None,
+        context={'data': _data_fingerprint(X_train, y_train, X_val, y_val, lines_val, w_train)},
+        on_result=_report,
+    )
 
-        results.append({
-            'params': params,
-            'mae': mae,
-            'hr_edge3': hr_3 if hr_3 is not None else 0,
-            'n_edge3': n_3,
-        })
+    results = [
+        {**r, 'hr_edge3': r['hr_edge3'] if r['hr_edge3'] is not None else 0}
+        for r in cell_results
+    ]
 
     # Sort by: edge 3+ HR descending, then MAE ascending
     results.sort(key=lambda r: (-r['hr_edge3'], r['mae']))
@@ -2774,6 +2831,120 @@ def auto_register_in_model_registry(
     return True
 
 
+# =============================================================================
+# Data Loading (cached: see ml/experiments/training_runner.py)
+# =============================================================================
+
+# Phase 3 joins per feature set, applied in order (each version extends the previous)
+FEATURE_SET_AUGMENTATIONS = {
+    'v11': ['v11'],
+    'v12': ['v11', 'v12'],
+    'v13': ['v11', 'v12', 'v13'],
+    'v14': ['v11', 'v12', 'v13', 'v14'],
+    'v19': ['v11', 'v12', 'v19'],
+    'v15': ['v11', 'v12', 'v15'],
+}
+
+AUGMENTATION_STEPS = {
+    'v11': ("V11 features (star_teammates_out, game_total_line)", augment_v11_features),
+    'v12': ("V12 features (15 new features)", augment_v12_features),
+    'v13': ("V13 features (6 FG% shooting efficiency features)", augment_v13_features),
+    'v14': ("V14 features (5 engineered FG% signals)", augment_v14_features),
+    'v19': ("V19 features (scoring skewness)", augment_v19_features),
+    'v15': ("V15 features (2 player profile features)", augment_v15_features),
+}
+
+
+def augment_feature_set(client, df, feature_set, label):
+    """
+    Join the Phase 3 columns a feature set needs but historical feature store
+    arrays don't contain (V11 star_teammates_out/game_total_line, V12+ ...).
+    """
+    for step in FEATURE_SET_AUGMENTATIONS.get(feature_set, []):
+        description, augment = AUGMENTATION_STEPS[step]
+        print(f"\nAugmenting {label} with {description}...")
+        df = augment(client, df)
+    return df
+
+
+def _cached_frame(cache, args, kind, window_end, build, **parts):
+    """Load ``kind`` from the dataset cache, or build it and store it if the window is closed."""
+    use_cache = cache is not None and cache.cacheable(window_end)
+    if use_cache and not args.refresh_data_cache:
+        hit = cache.load(kind, **parts)
+        if hit is not None:
+            df, meta = hit
+            print(f"  Loaded {kind} data from cache ({len(df):,} rows)")
+            return df, meta
+    df, meta = build()
+    if use_cache:
+        cache.save(kind, df, meta, **parts)
+    return df, meta
+
+
+def load_train_frame(client, args, dates, cache=None):
+    """
+    Training data with feature set + experiment augmentation applied.
+
+    Returns:
+        (df, experiment_feature_names)
+    """
+    def build():
+        df = load_train_data(
+            client, dates['train_start'], dates['train_end'],
+            min_ppg=args.min_ppg, max_ppg=args.max_ppg,
+            lines_only_train=args.lines_only_train,
+        )
+        df = augment_feature_set(client, df, args.feature_set, 'training data')
+        exp_feature_names = []
+        if args.experiment_features:
+            print(f"\nAugmenting training data with experiment features: {args.experiment_features}")
+            df, exp_feature_names = augment_experiment_features(client, df, args.experiment_features)
+        return df, {'experiment_feature_names': exp_feature_names}
+
+    df, meta = _cached_frame(
+        cache, args, 'train', dates['train_end'], build,
+        start=dates['train_start'], end=dates['train_end'],
+        feature_set=args.feature_set, min_quality_score=70,
+        min_ppg=args.min_ppg, max_ppg=args.max_ppg,
+        lines_only_train=args.lines_only_train,
+        experiment_features=args.experiment_features,
+    )
+    return df, meta.get('experiment_feature_names', [])
+
+
+def load_eval_frame(client, args, dates, cache=None):
+    """Evaluation data (production or raw lines) with the same augmentation as training."""
+    def build():
+        if args.use_production_lines:
+            print("  Using production lines (prediction_accuracy — multi-source cascade)")
+            df = load_eval_data_from_production(client, dates['eval_start'], dates['eval_end'])
+            # Session 483: fallback threshold raised from 0 to 100 — the df_eval < 100 gate
+            # in governance means 0 < N < 100 was silently failing downstream even when
+            # the fallback was never triggered (e.g., 39 rows from a thin catboost_v9 window).
+            if len(df) < 100:
+                print(f"  WARNING: Only {len(df)} production predictions in eval period (need >= 100).")
+                print(f"  Falling back to raw {args.line_source} lines...")
+                df = load_eval_data(client, dates['eval_start'], dates['eval_end'], args.line_source)
+        else:
+            print(f"  Using raw {args.line_source} lines")
+            df = load_eval_data(client, dates['eval_start'], dates['eval_end'], args.line_source)
+        df = augment_feature_set(client, df, args.feature_set, 'eval data')
+        if args.experiment_features:
+            print(f"\nAugmenting eval data with experiment features: {args.experiment_features}")
+            df, _ = augment_experiment_features(client, df, args.experiment_features)
+        return df, {}
+
+    df, _ = _cached_frame(
+        cache, args, 'eval', dates['eval_end'], build,
+        start=dates['eval_start'], end=dates['eval_end'],
+        feature_set=args.feature_set,
+        use_production_lines=args.use_production_lines, line_source=args.line_source,
+        experiment_features=args.experiment_features,
+    )
+    return df
+
+
 def main():
     args = parse_args()
 
@@ -3035,11 +3206,8 @@ def main():
         filter_desc.append("lines-only")
     filter_str = f" [{', '.join(filter_desc)}]" if filter_desc else ""
     print(f"\nLoading training data (with quality filter >= 70){filter_str}...")
-    df_train = load_train_data(
-        client, dates['train_start'], dates['train_end'],
-        min_ppg=args.min_ppg, max_ppg=args.max_ppg,
-        lines_only_train=args.lines_only_train,
-    )
+    data_cache = get_dataset_cache(args.data_cache_dir)
+    df_train, exp_feature_names = load_train_frame(client, args, dates, data_cache)
     print(f"  {len(df_train):,} samples")
 
     # --include-no-line: show line coverage stats for training data
@@ -3052,98 +3220,14 @@ def main():
         print(f"    NOTE: Training already includes ALL quality-ready players (lines not required).")
 
     print("Loading evaluation data...")
-    if args.use_production_lines:
-        print("  Using production lines (prediction_accuracy — multi-source cascade)")
-        df_eval = load_eval_data_from_production(client, dates['eval_start'], dates['eval_end'])
-        # Session 483: fallback threshold raised from 0 to 100 — the df_eval < 100 gate
-        # in governance means 0 < N < 100 was silently failing downstream even when
-        # the fallback was never triggered (e.g., 39 rows from a thin catboost_v9 window).
-        if len(df_eval) < 100:
-            print(f"  WARNING: Only {len(df_eval)} production predictions in eval period (need >= 100).")
-            print(f"  Falling back to raw {args.line_source} lines...")
-            df_eval = load_eval_data(client, dates['eval_start'], dates['eval_end'], args.line_source)
-    else:
-        print(f"  Using raw {args.line_source} lines")
-        df_eval = load_eval_data(client, dates['eval_start'], dates['eval_end'], args.line_source)
+    df_eval = load_eval_frame(client, args, dates, data_cache)
     print(f"  {len(df_eval):,} samples")
 
-    # V11: Augment feature arrays with star_teammates_out + game_total_line
-    # Historical data doesn't have these in the feature store arrays,
-    # so we JOIN from upstream_player_game_context at training time
-    if args.feature_set == 'v11':
-        print("\nAugmenting with V11 features (star_teammates_out, game_total_line)...")
-        df_train = augment_v11_features(client, df_train)
-        df_eval = augment_v11_features(client, df_eval)
-
-    # V12: First augment with V11 (V12 extends V11), then add 15 new V12 features
-    if args.feature_set == 'v12':
-        print("\nAugmenting with V11 features (star_teammates_out, game_total_line)...")
-        df_train = augment_v11_features(client, df_train)
-        df_eval = augment_v11_features(client, df_eval)
-        print("\nAugmenting with V12 features (15 new features)...")
-        df_train = augment_v12_features(client, df_train)
-        df_eval = augment_v12_features(client, df_eval)
-
-    # V13: V12 augmentation first, then add 6 FG% shooting efficiency features
-    if args.feature_set == 'v13':
-        print("\nAugmenting with V11 features (star_teammates_out, game_total_line)...")
-        df_train = augment_v11_features(client, df_train)
-        df_eval = augment_v11_features(client, df_eval)
-        print("\nAugmenting with V12 features (15 new features)...")
-        df_train = augment_v12_features(client, df_train)
-        df_eval = augment_v12_features(client, df_eval)
-        print("\nAugmenting with V13 features (6 FG% shooting efficiency features)...")
-        df_train = augment_v13_features(client, df_train)
-        df_eval = augment_v13_features(client, df_eval)
-
-    # V14: V13 augmentation first, then add 5 engineered FG% features
-    if args.feature_set == 'v14':
-        print("\nAugmenting with V11 features (star_teammates_out, game_total_line)...")
-        df_train = augment_v11_features(client, df_train)
-        df_eval = augment_v11_features(client, df_eval)
-        print("\nAugmenting with V12 features (15 new features)...")
-        df_train = augment_v12_features(client, df_train)
-        df_eval = augment_v12_features(client, df_eval)
-        print("\nAugmenting with V13 features (6 FG% shooting efficiency features)...")
-        df_train = augment_v13_features(client, df_train)
-        df_eval = augment_v13_features(client, df_eval)
-        print("\nAugmenting with V14 features (5 engineered FG% signals)...")
-        df_train = augment_v14_features(client, df_train)
-        df_eval = augment_v14_features(client, df_eval)
-
-    # V19: V12 augmentation first (V19 extends V12), then add 1 scoring skewness feature
-    if args.feature_set == 'v19':
-        print("\nAugmenting with V11 features (star_teammates_out, game_total_line)...")
-        df_train = augment_v11_features(client, df_train)
-        df_eval = augment_v11_features(client, df_eval)
-        print("\nAugmenting with V12 features (15 new features)...")
-        df_train = augment_v12_features(client, df_train)
-        df_eval = augment_v12_features(client, df_eval)
-        print("\nAugmenting with V19 features (scoring skewness)...")
-        df_train = augment_v19_features(client, df_train)
-        df_eval = augment_v19_features(client, df_eval)
-
-    # V15: V12 augmentation first (V15 extends V12, not V13/V14), then add 2 player profile features
-    if args.feature_set == 'v15':
-        print("\nAugmenting with V11 features (star_teammates_out, game_total_line)...")
-        df_train = augment_v11_features(client, df_train)
-        df_eval = augment_v11_features(client, df_eval)
-        print("\nAugmenting with V12 features (15 new features)...")
-        df_train = augment_v12_features(client, df_train)
-        df_eval = augment_v12_features(client, df_eval)
-        print("\nAugmenting with V15 features (2 player profile features)...")
-        df_train = augment_v15_features(client, df_train)
-        df_eval = augment_v15_features(client, df_eval)
-
-    # Experiment features (Session 407): augment with sandbox features
-    if args.experiment_features:
-        print(f"\nAugmenting with experiment features: {args.experiment_features}")
-        df_train, exp_feature_names = augment_experiment_features(client, df_train, args.experiment_features)
-        df_eval, _ = augment_experiment_features(client, df_eval, args.experiment_features)
-        if exp_feature_names:
-            selected_contract = extend_contract_with_experiment(selected_contract, exp_feature_names)
-            print(f"  Extended contract: {selected_contract.model_version} "
-                  f"({selected_contract.feature_count} features)")
+    # Experiment features (Session 407): sandbox columns were joined by the loaders
+    if exp_feature_names:
+        selected_contract = extend_contract_with_experiment(selected_contract, exp_feature_names)
+        print(f"  Extended contract: {selected_contract.model_version} "
+              f"({selected_contract.feature_count} features)")
 
     if len(df_train) < 1000 or len(df_eval) < 100:
         print("ERROR: Not enough data")
@@ -3867,7 +3951,10 @@ def main():
         # Use vegas_points_line feature as approximate lines for val-split hit rate
         lines_val = X_val['vegas_points_line'].values if 'vegas_points_line' in X_val.columns else None
         if lines_val is not None:
-            tuned_params = run_hyperparam_search(X_train, y_train, X_val, y_val, lines_val, w_train)
+            tuned_params = run_hyperparam_search(
+                X_train, y_train, X_val, y_val, lines_val, w_train,
+                workers=args.tune_workers, ledger_path=args.tune_ledger,
+            )
         else:
             print("\nWARNING: vegas_points_line not in features, skipping --tune")
 
@@ -3918,6 +4005,8 @@ def main():
     if args.min_data_in_leaf is not None:
         hp['min_data_in_leaf'] = args.min_data_in_leaf
         print(f"  Min data in leaf: {args.min_data_in_leaf}")
+    if args.thread_count is not None:
+        hp['thread_count'] = args.thread_count
     if args.bootstrap:
         hp['bootstrap_type'] = args.bootstrap
         print(f"  Bootstrap type: {args.bootstrap}")
@@ -3986,6 +4075,8 @@ def main():
         else:
             lgb_params['objective'] = 'regression'
             lgb_params['metric'] = 'mae'
+        if args.thread_count is not None:
+            lgb_params['num_threads'] = args.thread_count
 
         print(f"\nTraining LightGBM ({'classifier' if is_classifier else 'regression'})...")
         dtrain = lgb.Dataset(X_train, y_train, weight=w_train)
@@ -4055,6 +4146,8 @@ def main():
         else:
             xgb_params['objective'] = 'reg:absoluteerror'
             xgb_params['eval_metric'] = 'mae'
+        if args.thread_count is not None:
+            xgb_params['nthread'] = args.thread_count
 
         print(f"\nTraining XGBoost ({'classifier' if is_classifier else 'regression'})...")
         dtrain = xgb.DMatrix(X_train, label=y_train, weight=w_train, feature_names=list(active_feature_names))
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""Replay Engine — materialized season matrices + parallel cycle training.
+
+Used by season_replay_full.py. A season replay trains every model family once
+per N-day cycle; only the training window and eval window move. Instead of
+re-slicing DataFrames and rebuilding feature matrices row by row for every
+(cycle, family), the engine:
+
+1. Materializes each contract's feature matrix once per season (train and
+   eval splits, sorted by game_date) as .npy files, opened memory-mapped:
+
+       {root}/manifest.json
+       {root}/{split}_days.npy            game_date as days since epoch
+       {root}/{split}_y.npy               actual_points
+       {root}/{split}_tier.npy            feature_2_value (tier proxy)
+       {root}/{split}_{contract}_X.npy    contract feature matrix (NaN = missing)
+
+   A cycle's window is a contiguous row range found by binary search on the
+   sorted dates, so workers slice the shared mapping without copying it.
+
+2. Runs (cycle, family) training cells on a process pool via
+   training_runner.run_cells(), bounding CatBoost threads per worker.
+
+3. Optionally warm-starts: with an expanding window each family continues
+   boosting from its previous cycle's model (init_model) instead of training
+   from scratch. A family's cycles then form one chain, so families (not
+   cycles) run in parallel.
+
+Every cell trains with a fixed random_seed, so predictions are identical for
+any worker count.
+
+Created: 2026-10-16
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import catboost as cb
+import numpy as np
+import pandas as pd
+
+from shared.ml.feature_contract import FEATURE_STORE_NAMES, ModelFeatureContract
+from ml.experiments.training_runner import run_cells
+
+logger = logging.getLogger(__name__)
+
+MIN_TRAIN_ROWS = 500
+MIN_TIER_TRAIN_ROWS = 300
+VAL_FRAC = 0.15
+TIER_PROXY_COLUMN = 'feature_2_value'  # season avg points
+TIER_PROXY_DEFAULT = 15.0
+
+
+def sort_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """Deterministic row order (game_date, player_lookup) shared by frames and matrices."""
+    return df.sort_values(['game_date', 'player_lookup'], kind='mergesort').reset_index(drop=True)
+
+
+def feature_matrix(df: pd.DataFrame, contract: ModelFeatureContract) -> np.ndarray:
+    """Column-wise equivalent of season_walkforward.prepare_features() (float64, NULL -> NaN)."""
+    store_name_to_idx = {name: i for i, name in enumerate(FEATURE_STORE_NAMES)}
+    X = np.full((len(df), len(contract.feature_names)), np.nan, dtype=np.float64)
+    for j, name in enumerate(contract.feature_names):
+        idx = store_name_to_idx.get(name)
+        column = f'feature_{idx}_value'
+        if idx is not None and column in df.columns:
+            X[:, j] = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    return X
+
+
+def _tier_of(pts_avg: np.ndarray) -> np.ndarray:
+    return np.where(pts_avg >= 22, 'Star', np.where(pts_avg >= 12, 'Starter', 'Bench'))
+
+
+# =============================================================================
+# Season matrices
+# =============================================================================
+
+class SeasonMatrices:
+    """Memory-mapped per-season feature matrices, sliced by date index."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        with open(self.root / 'manifest.json') as f:
+            self.manifest = json.load(f)
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def build(cls, root: str, splits: Dict[str, pd.DataFrame],
+              contracts: Dict[str, ModelFeatureContract]) -> 'SeasonMatrices':
+        """Write matrices for every split x contract. Frames must already be date-sorted."""
+        path = Path(root)
+        path.mkdir(parents=True, exist_ok=True)
+        manifest = {'splits': {}, 'contracts': {}}
+        for split, df in splits.items():
+            days = df['game_date'].values.astype('datetime64[D]').astype(np.int64)
+            if len(days) and np.any(np.diff(days) < 0):
+                raise ValueError(f"{split} frame is not sorted by game_date")
+            np.save(path / f'{split}_days.npy', days)
+            np.save(path / f'{split}_y.npy', df['actual_points'].to_numpy(dtype=np.float64))
+            tier = (df[TIER_PROXY_COLUMN].astype(float).fillna(TIER_PROXY_DEFAULT).to_numpy()
+                    if TIER_PROXY_COLUMN in df.columns else np.full(len(df), TIER_PROXY_DEFAULT))
+            np.save(path / f'{split}_tier.npy', tier)
+            for version, contract in contracts.items():
+                np.save(path / f'{split}_{version}_X.npy', feature_matrix(df, contract))
+            manifest['splits'][split] = len(df)
+        for version, contract in contracts.items():
+            manifest['contracts'][version] = list(contract.feature_names)
+        with open(path / 'manifest.json', 'w') as f:
+            json.dump(manifest, f)
+        return cls(root)
+
+    def array(self, name: str) -> np.ndarray:
+        if name not in self._arrays:
+            self._arrays[name] = np.load(self.root / f'{name}.npy', mmap_mode='r')
+        return self._arrays[name]
+
+    def bounds(self, split: str, start: str, end: str) -> Tuple[int, int]:
+        """[lo, hi) row range of ``split`` with start <= game_date <= end."""
+        days = self.array(f'{split}_days')
+        lo_day, hi_day = (np.datetime64(d, 'D').astype(np.int64) for d in (start, end))
+        return int(np.searchsorted(days, lo_day, 'left')), int(np.searchsorted(days, hi_day, 'right'))
+
+    def X(self, split: str, contract_version: str, rows: Tuple[int, int]) -> np.ndarray:
+        return self.array(f'{split}_{contract_version}_X')[rows[0]:rows[1]]
+
+    def y(self, split: str, rows: Tuple[int, int]) -> np.ndarray:
+        return self.array(f'{split}_y')[rows[0]:rows[1]]
+
+    def tier(self, split: str, rows: Tuple[int, int]) -> np.ndarray:
+        return self.array(f'{split}_tier')[rows[0]:rows[1]]
+
+
+# =============================================================================
+# Training cells (run in pool workers)
+# =============================================================================
+
+@dataclass
+class CycleSpec:
+    cycle_num: int
+    train_rows: Tuple[int, int]
+    eval_rows: Tuple[int, int]
+
+
+@dataclass
+class ReplayPredictions:
+    """Per (cycle_num, model_key): eval-window predictions or a skip reason."""
+    preds: Dict[Tuple[int, str], np.ndarray] = field(default_factory=dict)
+    skips: Dict[Tuple[int, str], str] = field(default_factory=dict)
+
+
+_MATRICES: Optional[SeasonMatrices] = None
+
+
+def _matrices(root: str) -> SeasonMatrices:
+    global _MATRICES
+    if _MATRICES is None or str(_MATRICES.root) != root:
+        _MATRICES = SeasonMatrices(root)
+    return _MATRICES
+
+
+def _fit(X: np.ndarray, y: np.ndarray, params: Dict, thread_count: int,
+         init_model: Optional[cb.CatBoostRegressor] = None) -> cb.CatBoostRegressor:
+    """season_walkforward._train_val_split + CatBoost fit on a contiguous slice."""
+    split_idx = int(len(X) * (1 - VAL_FRAC))
+    model = cb.CatBoostRegressor(**params, thread_count=thread_count, allow_writing_files=False)
+    model.fit(
+        np.asarray(X[:split_idx]), np.asarray(y[:split_idx]),
+        eval_set=(np.asarray(X[split_idx:]), np.asarray(y[split_idx:])),
+        init_model=init_model, verbose=0,
+    )
+    return model
+
+
+def _predict_tiers(m: SeasonMatrices, version: str, spec: CycleSpec, params: Dict,
+                   thread_count: int) -> Optional[np.ndarray]:
+    """Per-tier models (Exp G); rows of a tier without a model use the first trained tier."""
+    train_tier = _tier_of(m.tier('train', spec.train_rows))
+    X_train = m.X('train', version, spec.train_rows)
+    y_train = m.y('train', spec.train_rows)
+    models = {}
+    for tier in ('Star', 'Starter', 'Bench'):
+        rows = np.flatnonzero(train_tier == tier)
+        models[tier] = (_fit(X_train[rows], y_train[rows], params, thread_count)
+                        if len(rows) >= MIN_TIER_TRAIN_ROWS else None)
+    fallback = next((model for model in models.values() if model is not None), None)
+    if fallback is None:
+        return None
+
+    X_eval = np.asarray(m.X('eval', version, spec.eval_rows))
+    eval_tier = _tier_of(m.tier('eval', spec.eval_rows))
+    preds = np.zeros(len(X_eval))
+    for tier, model in models.items():
+        rows = np.flatnonzero(eval_tier == tier)
+        if len(rows):
+            preds[rows] = (model or fallback).predict(X_eval[rows])
+    return preds
+
+
+def replay_cell(cell: Dict, matrix_root: str, thread_count: int) -> Dict:
+    """Train one family over its cycles; a warm-start cell chains them in order."""
+    m = _matrices(matrix_root)
+    version = cell['contract']
+    params = dict(cell['params'])
+    warm_params = {**params, 'iterations': cell['warm_start_iterations']}
+
+    preds: Dict[int, np.ndarray] = {}
+    skips: Dict[int, str] = {}
+    prev_model = None
+    for spec in (CycleSpec(*c) for c in cell['cycles']):
+        train_n = spec.train_rows[1] - spec.train_rows[0]
+        if cell['tier_models']:
+            p = _predict_tiers(m, version, spec, params, thread_count)
+            if p is None:
+                skips[spec.cycle_num] = "no tier models trained"
+            else:
+                preds[spec.cycle_num] = p
+            continue
+        if train_n < MIN_TRAIN_ROWS:
+            skips[spec.cycle_num] = f"< {MIN_TRAIN_ROWS} training records ({train_n})"
+            continue
+        X_train = m.X('train', version, spec.train_rows)
+        y_train = m.y('train', spec.train_rows)
+        if cell['warm_start'] and prev_model is not None:
+            model = _fit(X_train, y_train, warm_params, thread_count, init_model=prev_model)
+        else:
+            model = _fit(X_train, y_train, params, thread_count)
+        prev_model = model
+        preds[spec.cycle_num] = model.predict(np.asarray(m.X('eval', version, spec.eval_rows)))
+    return {'model_key': cell['model_key'], 'preds': preds, 'skips': skips}
+
+
+def train_replay_models(
+    matrices: SeasonMatrices,
+    cycles: List[Tuple[int, str, str, str, str]],
+    families: Dict[str, Dict],
+    base_params: Dict,
+    workers: int = 1,
+    warm_start: bool = False,
+    warm_start_iterations: int = 200,
+    tier_models: bool = False,
+) -> ReplayPredictions:
+    """
+    Train every (cycle, family) and predict its eval window.
+
+    Args:
+        matrices: Materialized season matrices.
+        cycles: (cycle_num, train_start, train_end, eval_start, eval_end) tuples.
+        families: model_key -> MODEL_FAMILIES entry (contract, quantile_alpha).
+        base_params: CatBoost params shared by all families (random_seed included).
+        workers: Concurrent training processes.
+        warm_start: Continue each family from its previous cycle's model.
+        warm_start_iterations: Boosting rounds added per warm-started cycle.
+        tier_models: Train per-tier models (Exp G) instead of one model per family.
+
+    Returns:
+        ReplayPredictions keyed by (cycle_num, model_key).
+    """
+    specs = []
+    for cycle_num, ts, te, es, ee in cycles:
+        eval_rows = matrices.bounds('eval', es, ee)
+        if eval_rows[1] > eval_rows[0]:  # empty eval windows (All-Star break) are skipped by the replay
+            specs.append((cycle_num, matrices.bounds('train', ts, te), eval_rows))
+
+    cells = []
+    for model_key, family in families.items():
+        params = dict(base_params)
+        if family['quantile_alpha'] is not None:
+            params['loss_function'] = f"Quantile:alpha={family['quantile_alpha']}"
+        cell = {
+            'model_key': model_key,
+            'contract': family['contract'].model_version,
+            'params': params,
+            'warm_start': warm_start,
+            'warm_start_iterations': warm_start_iterations,
+            'tier_models': tier_models,
+        }
+        if warm_start:
+            cells.append({**cell, 'cycles': specs})  # one chain per family
+        else:
+            cells.extend({**cell, 'cycles': [spec]} for spec in specs)
+
+    out = ReplayPredictions()
+    for result in run_cells(replay_cell, cells, shared=str(matrices.root), workers=workers):
+        for cycle_num, preds in result['preds'].items():
+            out.preds[(cycle_num, result['model_key'])] = preds
+        for cycle_num, reason in result['skips'].items():
+            out.skips[(cycle_num, result['model_key'])] = reason
+    return out
+
@@ -40,6 +40,11 @@ Usage:
         --adaptive --lookback-days 28 --rolling-train-days 56 \
         --save-json ./replay_adaptive_rolling.json
 
+    # Fast what-if: weekly cadence, 4 training processes, warm-started models
+    PYTHONPATH=. python ml/experiments/season_replay_full.py \
+        --season-start 2024-11-06 --season-end 2025-04-13 --cadence 7 \
+        --workers 4 --warm-start --data-cache-dir /tmp/qr_cache
+
 Session 280-281 - Full Season Replay + Adaptive Mode
 """
 
@@ -49,6 +54,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 import argparse
 import json
+import tempfile
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field, asdict
@@ -56,7 +62,6 @@ from datetime import date, timedelta
 from typing import Optional, List, Dict, Tuple
 from google.cloud import bigquery
 from sklearn.metrics import mean_absolute_error
-import catboost as cb
 
 from shared.ml.feature_contract import (
     V9_CONTRACT,
@@ -67,15 +72,15 @@ from shared.ml.training_data_loader import get_quality_where_clause
 
 # Reuse core functions from season_walkforward
 from ml.experiments.season_walkforward import (
-    prepare_features,
     compute_pnl,
     compute_hit_rate,
-    _train_val_split,
     DEFAULT_CATBOOST_PARAMS,
     STAKE,
     WIN_PAYOUT,
     BREAKEVEN_HR,
 )
+from ml.experiments.replay_engine import SeasonMatrices, sort_by_date, train_replay_models
+from ml.experiments.training_runner import get_dataset_cache
 
 PROJECT_ID = "nba-props-platform"
 
@@ -1040,7 +1045,14 @@ class FullSeasonReplay:
                  min_line: Optional[float] = None,
                  max_line: Optional[float] = None,
                  no_rel_edge_filter: bool = False,
-                 avoid_familiar: bool = False):
+                 avoid_familiar: bool = False,
+                 workers: int = 1,
+                 warm_start: bool = False,
+                 warm_start_iterations: int = 200,
+                 seed: int = DEFAULT_CATBOOST_PARAMS['random_seed'],
+                 data_cache_dir: Optional[str] = None):
+        if warm_start and (rolling_train_days is not None or tier_models):
+            raise ValueError("warm_start requires an expanding window without tier models")
         self.season_start = season_start
         self.season_end = season_end
         self.cadence_days = cadence_days
@@ -1064,6 +1076,12 @@ class FullSeasonReplay:
         self.max_line = max_line  # Exp I: max prop line
         self.no_rel_edge_filter = no_rel_edge_filter  # Exp J: disable rel_edge>=30% filter
         self.avoid_familiar = avoid_familiar  # Exp K: skip players with 6+ games vs opponent
+        # Replay engine: parallel training, warm-start chains, deterministic seed
+        self.workers = workers
+        self.warm_start = warm_start
+        self.warm_start_iterations = warm_start_iterations
+        self.seed = seed
+        self.data_cache = get_dataset_cache(data_cache_dir)
 
         if models:
             self.model_keys = [m for m in models if m in MODEL_FAMILIES]
@@ -1156,13 +1174,8 @@ class FullSeasonReplay:
           AND (l.line - FLOOR(l.line)) IN (0, 0.5)
         """
 
-        print(f"Loading training data ({self.season_start} to {self.season_end})...")
-        self.train_df = self.client.query(train_query).to_dataframe()
-        print(f"  -> {len(self.train_df):,} training records loaded")
-
-        print(f"Loading eval data ({self.season_start} to {self.season_end})...")
-        self.eval_df = self.client.query(eval_query).to_dataframe()
-        print(f"  -> {len(self.eval_df):,} eval records loaded (with DK lines)")
+        self.train_df = self._load_frame('train', train_query, "training records loaded")
+        self.eval_df = self._load_frame('eval', eval_query, "eval records loaded (with DK lines)")
 
         # Check V12 feature availability
         if 'feature_39_value' in self.eval_df.columns:
@@ -1170,8 +1183,26 @@ class FullSeasonReplay:
             print(f"  V12 features: {non_null_pct:.0f}% populated"
                   f" ({'OK' if non_null_pct > 50 else 'SPARSE'})")
 
+        # Date-sorted so every cycle window is a contiguous block (see replay_engine)
         self.train_df['game_date'] = pd.to_datetime(self.train_df['game_date'])
         self.eval_df['game_date'] = pd.to_datetime(self.eval_df['game_date'])
+        self.train_df = sort_by_date(self.train_df)
+        self.eval_df = sort_by_date(self.eval_df)
+
+    def _load_frame(self, split: str, query: str, label: str) -> pd.DataFrame:
+        """Run one bulk query, via the dataset cache when the season has ended."""
+        print(f"Loading {split} data ({self.season_start} to {self.season_end})...")
+        use_cache = self.data_cache is not None and self.data_cache.cacheable(self.season_end)
+        if use_cache:
+            hit = self.data_cache.load(f'replay_{split}', query=query)
+            if hit is not None:
+                print(f"  -> {len(hit[0]):,} {label} (cache)")
+                return hit[0]
+        df = self.client.query(query).to_dataframe()
+        print(f"  -> {len(df):,} {label}")
+        if use_cache:
+            self.data_cache.save(f'replay_{split}', df, query=query)
+        return df
 
     def generate_cycles(self) -> List[Tuple[int, str, str, str, str]]:
         """Generate (cycle_num, train_start, train_end, eval_start, eval_end)."""
@@ -1215,25 +1246,6 @@ class FullSeasonReplay:
         s, e = pd.Timestamp(start), pd.Timestamp(end)
         return df[(df['game_date'] >= s) & (df['game_date'] <= e)]
 
-    def _train_one_model(self, train_slice: pd.DataFrame, model_key: str):
-        """Train a single model. Returns (model, skip_reason)."""
-        family = MODEL_FAMILIES[model_key]
-        contract = family['contract']
-
-        if len(train_slice) < 500:
-            return None, f"< 500 training records ({len(train_slice)})"
-
-        X_train, y_train = prepare_features(train_slice, contract)
-        X_tr, X_val, y_tr, y_val = _train_val_split(X_train, y_train, val_frac=0.15)
-
-        params = DEFAULT_CATBOOST_PARAMS.copy()
-        if family['quantile_alpha'] is not None:
-            params['loss_function'] = f"Quantile:alpha={family['quantile_alpha']}"
-
-        model = cb.CatBoostRegressor(**params)
-        model.fit(X_tr, y_tr, eval_set=(X_val, y_val), verbose=0)
-        return model, None
-
     def _accumulate_subset(self, subset_name: str, cycle_num: int,
                            picks: int, wins: int, losses: int,
                            pushes: int, hr: Optional[float], pnl: float):
@@ -1550,38 +1562,32 @@ class FullSeasonReplay:
                 if hr_val < self.player_blacklist_hr:
                     self.player_blacklist.add(p)
 
-    def _train_tier_models(self, train_slice: pd.DataFrame, model_key: str):
-        """Train separate models for Star/Starter/Bench tiers. Returns dict of tier -> model."""
-        family = MODEL_FAMILIES[model_key]
-        contract = family['contract']
-        models = {}
-
-        # Use feature_2_value (season avg points) as tier proxy in training data
-        pts_avg = _safe_feature(train_slice, 'feature_2_value', 15.0)
-        tier_masks = {
-            'Star': pts_avg >= 22,
-            'Starter': (pts_avg >= 12) & (pts_avg < 22),
-            'Bench': pts_avg < 12,
-        }
-
-        for tier_name, mask in tier_masks.items():
-            tier_slice = train_slice[mask]
-            if len(tier_slice) < 300:
-                models[tier_name] = None
-                continue
-
-            X_train, y_train = prepare_features(tier_slice, contract)
-            X_tr, X_val, y_tr, y_val = _train_val_split(X_train, y_train, val_frac=0.15)
-
-            params = DEFAULT_CATBOOST_PARAMS.copy()
-            if family['quantile_alpha'] is not None:
-                params['loss_function'] = f"Quantile:alpha={family['quantile_alpha']}"
+    def _train_all_cycles(self, cycles):
+        """Train every (cycle, model) and predict its eval window before replaying.
 
-            model = cb.CatBoostRegressor(**params)
-            model.fit(X_tr, y_tr, eval_set=(X_val, y_val), verbose=0)
-            models[tier_name] = model
-
-        return models
+        Model training never depends on replay state (adaptive decisions,
+        blacklists and filters only act on predictions), so it runs up front on
+        the replay engine: one materialization of the season's feature
+        matrices, cells on a process pool, optional warm-start chains.
+        """
+        families = {k: MODEL_FAMILIES[k] for k in self.model_keys}
+        contracts = {f['contract'].model_version: f['contract'] for f in families.values()}
+        base_params = {**DEFAULT_CATBOOST_PARAMS, 'random_seed': self.seed}
+
+        mode = f"warm-start +{self.warm_start_iterations} iters" if self.warm_start else "from scratch"
+        print(f"\nTraining {len(cycles)} cycles x {len(families)} models "
+              f"({mode}, {self.workers} worker(s))...")
+        with tempfile.TemporaryDirectory(prefix='season_replay_') as root:
+            matrices = SeasonMatrices.build(
+                root, {'train': self.train_df, 'eval': self.eval_df}, contracts,
+            )
+            return train_replay_models(
+                matrices, cycles, families, base_params,
+                workers=self.workers,
+                warm_start=self.warm_start,
+                warm_start_iterations=self.warm_start_iterations,
+                tier_models=self.tier_models,
+            )
 
     def run(self):
         """Run the full season replay."""
@@ -1619,6 +1625,8 @@ class FullSeasonReplay:
               f" | Rolling train: {self.rolling_train_days or 'expanding'}")
         print(f"{'='*70}")
 
+        trained = self._train_all_cycles(cycles)
+
         for cycle_num, ts, te, es, ee in cycles:
             # Adaptive decision for this cycle
             adaptive_decision = None
@@ -1647,47 +1655,15 @@ class FullSeasonReplay:
 
             for model_key in self.model_keys:
                 family = MODEL_FAMILIES[model_key]
-                contract = family['contract']
-
-                # Train model (tier-specific or standard)
-                if self.tier_models:
-                    tier_trained = self._train_tier_models(train_slice, model_key)
-                    # Predict using tier-appropriate model
-                    X_eval, y_eval = prepare_features(eval_slice, contract)
-                    lines_raw = eval_slice['vegas_line'].astype(float).values
-                    pts_avg_eval = _safe_feature(eval_slice, 'feature_2_value', 15.0)
-
-                    preds = np.zeros(len(X_eval))
-                    any_model = False
-                    for i in range(len(X_eval)):
-                        if pts_avg_eval[i] >= 22:
-                            tier = 'Star'
-                        elif pts_avg_eval[i] >= 12:
-                            tier = 'Starter'
-                        else:
-                            tier = 'Bench'
-                        m = tier_trained.get(tier)
-                        if m is None:
-                            # Fallback to any available model
-                            m = next((v for v in tier_trained.values() if v is not None), None)
-                        if m is not None:
-                            preds[i] = m.predict(X_eval[i:i+1])[0]
-                            any_model = True
-                    if not any_model:
-                        print(f"  {family['name']:14s}: SKIP -- no tier models trained")
-                        continue
-                    actuals = y_eval.values
-                    lines = lines_raw
-                else:
-                    model, skip_reason = self._train_one_model(train_slice, model_key)
-                    if model is None:
-                        print(f"  {family['name']:14s}: SKIP -- {skip_reason}")
-                        continue
 
-                    X_eval, y_eval = prepare_features(eval_slice, contract)
-                    preds = model.predict(X_eval)
-                    actuals = y_eval.values
-                    lines = eval_slice['vegas_line'].astype(float).values
+                # Trained up front by the replay engine (same model, same eval rows)
+                skip_reason = trained.skips.get((cycle_num, model_key))
+                if skip_reason:
+                    print(f"  {family['name']:14s}: SKIP -- {skip_reason}")
+                    continue
+                preds = trained.preds[(cycle_num, model_key)]
+                actuals = eval_slice['actual_points'].astype(float).values
+                lines = eval_slice['vegas_line'].astype(float).values
 
                 # Apply experiment filters (B-F)
                 f_preds, f_actuals, f_lines, f_eval = self._apply_eval_filters(
@@ -2212,6 +2188,9 @@ class FullSeasonReplay:
                 'tier_direction_rules': self.tier_direction_rules,
                 'player_blacklist_hr': self.player_blacklist_hr,
                 'tier_models': self.tier_models,
+                'warm_start': self.warm_start,
+                'warm_start_iterations': self.warm_start_iterations if self.warm_start else None,
+                'seed': self.seed,
                 'filter_stats': self.filter_stats,
             },
             'model_cycles': [asdict(c) for c in self.model_cycle_results],
@@ -2347,6 +2326,19 @@ Examples:
                         help="Disable rel_edge>=30%% smart filter in dimension tracking (Exp J)")
     parser.add_argument("--avoid-familiar", action="store_true",
                         help="Skip players with 6+ games vs opponent (Exp K)")
+    # Replay engine
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Train cycles/models on N processes (default: 1)")
+    parser.add_argument("--warm-start", action="store_true",
+                        help="Continue boosting from the previous cycle's model "
+                             "(expanding window only)")
+    parser.add_argument("--warm-start-iterations", type=int, default=200,
+                        help="Boosting rounds added per warm-started cycle (default: 200)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_CATBOOST_PARAMS['random_seed'],
+                        help="CatBoost random seed (results are deterministic per seed)")
+    parser.add_argument("--data-cache-dir", default=None,
+                        help="Parquet cache for the bulk season load "
+                             "(default: $QUICK_RETRAIN_DATA_CACHE; finished seasons only)")
 
     return parser.parse_args()
 
@@ -2382,6 +2374,11 @@ def main():
         max_line=args.max_line,
         no_rel_edge_filter=args.no_rel_edge_filter,
         avoid_familiar=args.avoid_familiar,
+        workers=args.workers,
+        warm_start=args.warm_start,
+        warm_start_iterations=args.warm_start_iterations,
+        seed=args.seed,
+        data_cache_dir=args.data_cache_dir,
     )
 
     replay.run()
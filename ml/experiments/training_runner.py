@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Training Runner — dataset cache, parallel cell execution and resumable ledger.
+
+Shared infrastructure for quick_retrain.py and grid_search_weights.py:
+
+1. DatasetCache: local Parquet cache of loaded + augmented training/eval
+   frames, keyed by date range, feature set and quality filter. Re-running an
+   experiment (or every cell of a grid) on the same window skips the
+   BigQuery load and the augment_v1X_features() joins.
+
+       {root}/{kind}_{sha}/frame.parquet
+       {root}/{kind}_{sha}/key.json      (key parts + metadata)
+
+   Only windows that ended before today are cached (late grading and
+   backfills still land for today). Use --refresh-data-cache to rebuild.
+
+2. run_cells(): runs independent cells (hyperparameter grid combos,
+   model-family variants) on a process pool, bounding the threads each
+   worker's trainer uses so N workers share the CPU instead of
+   oversubscribing it. Large read-only inputs are shipped once per worker
+   through the pool initializer, not once per cell.
+
+3. ResultsLedger: append-only JSONL of finished cells. An interrupted sweep
+   re-run with the same ledger skips cells that already completed.
+
+Configuration:
+    QUICK_RETRAIN_DATA_CACHE=/path   default dataset cache dir (or --data-cache-dir)
+
+Created: 2026-10-16
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DATA_CACHE_DIR_ENV = 'QUICK_RETRAIN_DATA_CACHE'
+
+# Bump when loader/augmentation output changes shape so old entries are ignored
+DATASET_CACHE_VERSION = 1
+
+
+# =============================================================================
+# Dataset cache
+# =============================================================================
+
+def get_dataset_cache(root: Optional[str] = None) -> Optional['DatasetCache']:
+    """Build the dataset cache from ``root`` or QUICK_RETRAIN_DATA_CACHE (None if unset)."""
+    root = root or os.environ.get(DATA_CACHE_DIR_ENV, '')
+    return DatasetCache(root) if root else None
+
+
+class DatasetCache:
+    """Parquet store for loaded + augmented training frames."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    @staticmethod
+    def cacheable(window_end: str) -> bool:
+        """Only windows that ended before today are stable enough to cache."""
+        return datetime.strptime(window_end, '%Y-%m-%d').date() < date.today()
+
+    @staticmethod
+    def key(kind: str, **parts: Any) -> str:
+        payload = json.dumps(
+            {'kind': kind, 'version': DATASET_CACHE_VERSION, **parts},
+            sort_keys=True, default=str,
+        )
+        return f"{kind}_{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:20]}"
+
+    def load(self, kind: str, **parts: Any) -> Optional[Tuple[pd.DataFrame, Dict]]:
+        """Return (frame, metadata) or None on a miss / unreadable entry."""
+        entry = self.root / self.key(kind, **parts)
+        frame_path = entry / 'frame.parquet'
+        if not frame_path.exists():
+            return None
+        try:
+            df = pd.read_parquet(frame_path)
+            with open(entry / 'key.json') as f:
+                meta = json.load(f).get('meta', {})
+        except Exception as e:
+            logger.warning(f"Unreadable dataset cache entry {entry}, reloading: {e}")
+            return None
+        return df, meta
+
+    def save(self, kind: str, df: pd.DataFrame, meta: Optional[Dict] = None, **parts: Any) -> bool:
+        """Store a frame. Returns False (and logs) if it cannot be stored."""
+        entry = self.root / self.key(kind, **parts)
+        tmp_path = entry / f"frame.parquet.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            entry.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp_path, index=False)
+            with open(entry / 'key.json', 'w') as f:
+                json.dump({'kind': kind, 'parts': parts, 'meta': meta or {}}, f, default=str, indent=2)
+            os.replace(tmp_path, entry / 'frame.parquet')  # readers never see a partial file
+            return True
+        except Exception as e:
+            logger.warning(f"Could not cache {kind} frame in {entry}: {e}")
+            if tmp_path.exists():
+                tmp_path.unlink()
+            return False
+
+
+# =============================================================================
+# Results ledger
+# =============================================================================
+
+def cell_key(params: Dict, context: Optional[Dict] = None) -> str:
+    """Stable identifier for one cell (its params plus the data it ran on)."""
+    payload = json.dumps({'params': params, 'context': context or {}}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class ResultsLedger:
+    """Append-only JSONL of completed cells; safe to re-open after interruption."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def completed(self) -> Dict[str, Dict]:
+        """cell key -> recorded result (a truncated last line is ignored)."""
+        done: Dict[str, Dict] = {}
+        if not self.path.exists():
+            return done
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                done[entry['cell']] = entry['result']
+        return done
+
+    def record(self, key: str, result: Dict) -> None:
+        line = json.dumps({
+            'cell': key,
+            'result': result,
+            'recorded_at': datetime.now().isoformat(timespec='seconds'),
+        }, default=str)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a') as f:
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+
+# =============================================================================
+# Parallel cell execution
+# =============================================================================
+
+def threads_per_worker(workers: int) -> int:
+    """Trainer threads for each of ``workers`` concurrent cells."""
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+_WORKER_SHARED: Any = None
+
+
+def _init_worker(shared: Any) -> None:
+    global _WORKER_SHARED
+    _WORKER_SHARED = shared
+
+
+def _run_cell(fn: Callable, params: Dict, thread_count: int) -> Dict:
+    return fn(params, _WORKER_SHARED, thread_count)
+
+
+def run_cells(
+    fn: Callable[[Dict, Any, int], Dict],
+    cells: List[Dict],
+    shared: Any = None,
+    workers: int = 1,
+    ledger: Optional[ResultsLedger] = None,
+    context: Optional[Dict] = None,
+    on_result: Optional[Callable[[int, Dict, Dict, bool], None]] = None,
+) -> List[Dict]:
+    """
+    Run ``fn(params, shared, thread_count)`` for every cell.
+
+    Args:
+        fn: Module-level function (must be picklable) returning a JSON-able dict.
+        cells: Parameter dicts, one per cell.
+        shared: Read-only inputs every cell needs (sent once per worker).
+        workers: Concurrent processes; 1 runs in-process with the trainer's
+            default threading.
+        ledger: Optional ResultsLedger; completed cells are skipped and new
+            results are appended as they finish.
+        context: Extra identity for ledger keys (e.g., data fingerprint).
+        on_result: Callback(index, params, result, from_ledger) as cells finish.
+
+    Returns:
+        Results in ``cells`` order.
+    """
+    results: List[Optional[Dict]] = [None] * len(cells)
+    keys = [cell_key(params, context) for params in cells]
+    done = ledger.completed() if ledger else {}
+
+    pending = []
+    for i, key in enumerate(keys):
+        if key in done:
+            results[i] = done[key]
+            if on_result:
+                on_result(i, cells[i], done[key], True)
+        else:
+            pending.append(i)
+
+    if pending and len(pending) < len(cells):
+        logger.info(f"Resuming: {len(cells) - len(pending)}/{len(cells)} cells already in ledger")
+
+    def _finish(i: int, result: Dict) -> None:
+        results[i] = result
+        if ledger:
+            ledger.record(keys[i], result)
+        if on_result:
+            on_result(i, cells[i], result, False)
+
+    if workers <= 1:
+        for i in pending:
+            _finish(i, fn(cells[i], shared, -1))
+        return results
+
+    thread_count = threads_per_worker(workers)
+    with ProcessPoolExecutor(
+        max_workers=min(workers, max(1, len(pending))),
+        initializer=_init_worker, initargs=(shared,),
+    ) as pool:
+        futures = {pool.submit(_run_cell, fn, cells[i], thread_count): i for i in pending}
+        for future in as_completed(futures):
+            _finish(futures[future], future.result())
+
+    return results
@@ -1,8 +1,13 @@
 """Base classes for the Signal Discovery Framework."""
 
+import math
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+_REAL_TYPES = (int, float, np.integer, np.floating)
 
 
 @dataclass
@@ -14,6 +19,101 @@ class SignalResult:
     metadata: Dict = field(default_factory=dict)
 
 
+class SignalFrame:
+    """Column view over a list of prediction dicts for vectorized signals.
+
+    Columns are built once per frame (one Python pass per column, shared by
+    every signal) and follow the scalar evaluate() idioms exactly:
+
+        frame.num('line_value')    ->  prediction.get('line_value') or 0
+        frame.opt('trend_slope')   ->  prediction.get('trend_slope'), None -> NaN
+        frame.get('edge', 0)       ->  prediction.get('edge', 0)
+        frame.text('recommendation') == 'OVER'
+        frame.flag('is_home')      ->  bool(prediction.get('is_home'))
+
+    Values a predicate cannot classify exactly (NaN, non-numeric) are tracked
+    per signal; the engine re-checks those rows with the scalar evaluate().
+    """
+
+    def __init__(self, predictions: List[Dict]):
+        self.predictions = predictions
+        self.size = len(predictions)
+        self._columns: Dict[tuple, np.ndarray] = {}
+        self._unsure: Dict[tuple, np.ndarray] = {}
+        self._touched: List[tuple] = []
+
+    def _numeric(self, key: str, mode: str, default: float) -> np.ndarray:
+        cache_key = (mode, key, default)
+        if cache_key not in self._columns:
+            if mode == 'get':
+                raw = [prediction.get(key, default) for prediction in self.predictions]
+            elif mode == 'num':
+                raw = [prediction.get(key) or default for prediction in self.predictions]
+            else:
+                raw = [prediction.get(key) for prediction in self.predictions]
+            is_none = np.fromiter((v is None for v in raw), dtype=bool, count=self.size)
+            if all(isinstance(v, _REAL_TYPES) for v in raw if v is not None):
+                values = np.fromiter(
+                    (math.nan if v is None else v for v in raw), dtype=np.float64, count=self.size
+                )
+                unsure = np.isnan(values) & ~is_none
+            else:  # Decimal, str, ... -- leave those comparisons to evaluate()
+                real = np.fromiter((isinstance(v, _REAL_TYPES) for v in raw), dtype=bool, count=self.size)
+                values = np.fromiter(
+                    (v if isinstance(v, _REAL_TYPES) else math.nan for v in raw),
+                    dtype=np.float64, count=self.size,
+                )
+                unsure = (np.isnan(values) & real) | (~real & ~is_none)
+            if mode == 'get':
+                unsure |= is_none  # evaluate() would compare None and raise
+            self._columns[cache_key] = values
+            self._unsure[cache_key] = unsure
+        self._touched.append(cache_key)
+        return self._columns[cache_key]
+
+    def num(self, key: str, default: float = 0.0) -> np.ndarray:
+        """Float column for ``prediction.get(key) or default``."""
+        return self._numeric(key, 'num', default)
+
+    def opt(self, key: str) -> np.ndarray:
+        """Float column for ``prediction.get(key)``; None becomes NaN (never qualifies)."""
+        return self._numeric(key, 'opt', 0.0)
+
+    def get(self, key: str, default: float = 0.0) -> np.ndarray:
+        """Float column for ``prediction.get(key, default)`` (a stored None stays uncertain)."""
+        return self._numeric(key, 'get', default)
+
+    def text(self, key: str) -> np.ndarray:
+        """Object column of raw values, for equality tests against strings."""
+        cache_key = ('text', key)
+        if cache_key not in self._columns:
+            column = np.empty(self.size, dtype=object)
+            column[:] = [prediction.get(key) for prediction in self.predictions]
+            self._columns[cache_key] = column
+        return self._columns[cache_key]
+
+    def flag(self, key: str) -> np.ndarray:
+        """Bool column for ``bool(prediction.get(key))``."""
+        cache_key = ('flag', key)
+        if cache_key not in self._columns:
+            self._columns[cache_key] = np.fromiter(
+                (bool(prediction.get(key)) for prediction in self.predictions),
+                dtype=bool, count=self.size,
+            )
+        return self._columns[cache_key]
+
+    def begin(self) -> None:
+        """Start tracking the numeric columns one signal reads."""
+        self._touched = []
+
+    def unsure_rows(self) -> np.ndarray:
+        """Rows where a numeric column read since begin() held NaN/non-numeric data."""
+        unsure = np.zeros(self.size, dtype=bool)
+        for cache_key in self._touched:
+            unsure |= self._unsure[cache_key]
+        return unsure
+
+
 class BaseSignal(ABC):
     """Abstract base class for all signal evaluators.
 
@@ -28,6 +128,11 @@ class BaseSignal(ABC):
                     line_value, recommendation, edge, prediction_correct, etc.
         features: Dict of feature store values keyed by name (indices 0-53).
         supplemental: Dict of extra data (V12 prediction, 3PT stats, etc.).
+
+    Vectorized signals additionally implement vector_mask(): the column
+    predicates of evaluate() over a SignalFrame. The engine
+    (signal_engine.evaluate_signals) calls evaluate() only for rows the mask
+    selects, so confidence and metadata always come from evaluate() itself.
     """
 
     tag: str = ""
@@ -40,6 +145,13 @@ class BaseSignal(ABC):
         """Evaluate whether a prediction qualifies for this signal."""
         ...
 
+    def vector_mask(self, frame: SignalFrame) -> Optional[Any]:
+        """Boolean array: rows that may qualify. None = not vectorized (scalar only).
+
+        Must select every row evaluate() would qualify; extra rows are fine.
+        """
+        return None
+
     def _no_qualify(self) -> SignalResult:
         """Shortcut for a non-qualifying result."""
         return SignalResult(qualifies=False, confidence=0.0, source_tag=self.tag)
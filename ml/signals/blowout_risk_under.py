@@ -12,7 +12,7 @@ Created: Session 411
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class BlowoutRiskUnderSignal(BaseSignal):
@@ -50,3 +50,8 @@ class BlowoutRiskUnderSignal(BaseSignal):
                 'line_value': round(line, 1),
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'UNDER')
+                & (frame.num('line_value') >= self.MIN_LINE)
+                & (frame.num('blowout_risk') >= self.MIN_BLOWOUT_RISK))
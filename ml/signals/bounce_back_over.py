@@ -25,7 +25,7 @@ Updated: Session 427 — shooting quality confidence tiers
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class BounceBackOverSignal(BaseSignal):
@@ -93,3 +93,11 @@ class BounceBackOverSignal(BaseSignal):
                 'backtest_hr_moderate': 69.0,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        # Severe-miss / shooting tiers are decided by evaluate()
+        prev_ratio = frame.num('prev_game_ratio')
+        return ((frame.text('recommendation') == 'OVER')
+                & ~frame.flag('is_home')
+                & (prev_ratio > 0) & (prev_ratio < self.MAX_MISS_RATIO)
+                & (frame.num('prev_game_line') >= self.MIN_LINE))
@@ -11,7 +11,7 @@ Created: Session 411
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class CareerMatchupOverSignal(BaseSignal):
@@ -56,3 +56,10 @@ class CareerMatchupOverSignal(BaseSignal):
                 'margin_over_line': round(margin, 1),
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        line = frame.num('line_value')
+        return ((frame.text('recommendation') == 'OVER')
+                & (line > 0)
+                & (frame.num('games_vs_opp') >= self.MIN_GAMES_VS_OPP)
+                & (frame.num('avg_pts_vs_opp') > line))
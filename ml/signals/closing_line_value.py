@@ -18,7 +18,7 @@ signal uses historical CLV-direction agreement to boost same-direction picks.
 
 from typing import Dict, Optional
 
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class PositiveCLVOverSignal(BaseSignal):
@@ -62,6 +62,10 @@ class PositiveCLVOverSignal(BaseSignal):
             }
         )
 
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.opt('closing_line_value') >= self.MIN_LINE_DROP))
+
 
 class PositiveCLVUnderSignal(BaseSignal):
     """UNDER signal when closing line moved in our favor (line rose).
@@ -103,6 +107,10 @@ class PositiveCLVUnderSignal(BaseSignal):
             }
         )
 
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'UNDER')
+                & (frame.opt('closing_line_value') <= -self.MIN_LINE_RISE))
+
 
 class NegativeCLVFilter(BaseSignal):
     """Negative filter: line moved AGAINST our prediction direction.
@@ -156,3 +164,8 @@ class NegativeCLVFilter(BaseSignal):
             )
 
         return self._no_qualify()
+
+    def vector_mask(self, frame: SignalFrame):
+        clv = frame.opt('closing_line_value')
+        return (((frame.text('recommendation') == 'OVER') & (clv < -self.MIN_ADVERSE_MOVE))
+                | ((frame.text('recommendation') == 'UNDER') & (clv > self.MIN_ADVERSE_MOVE)))
@@ -11,7 +11,7 @@ Created: Session 410
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class ConsistentScorerOverSignal(BaseSignal):
@@ -54,3 +54,10 @@ class ConsistentScorerOverSignal(BaseSignal):
                 'line_value': round(line, 1),
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        line = frame.num('line_value')
+        std = frame.num('points_std_last_10')
+        return ((frame.text('recommendation') == 'OVER')
+                & (line >= self.MIN_LINE) & (std > 0)
+                & (std / line <= self.MAX_CV))
@@ -20,7 +20,7 @@ beyond the B2B component.
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class DenseScheduleGrindUnderSignal(BaseSignal):
@@ -71,3 +71,7 @@ class DenseScheduleGrindUnderSignal(BaseSignal):
                 'signal_mechanism': 'cumulative weekly schedule density suppresses scoring',
             },
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'UNDER')
+                & (frame.opt('games_in_last_7_days') >= self.MIN_GAMES_IN_7))
@@ -9,7 +9,7 @@ at 5,280 ft reduces oxygen availability, increasing pace and scoring.
 
 from typing import Dict, Optional
 
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class DenverVisitorOverSignal(BaseSignal):
@@ -51,3 +51,8 @@ class DenverVisitorOverSignal(BaseSignal):
                 'backtest_n': 118,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & ~frame.flag('is_home')
+                & (frame.text('opponent_team_abbr') == 'DEN'))
@@ -15,7 +15,7 @@ Created: Session 422c (shadow mode)
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class DowntrendUnderSignal(BaseSignal):
@@ -55,3 +55,9 @@ class DowntrendUnderSignal(BaseSignal):
                 'backtest_hr': 63.9,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        slope = frame.opt('trend_slope')
+        return ((frame.text('recommendation') == 'UNDER')
+                & (frame.num('line_value') >= self.MIN_LINE)
+                & (slope >= self.MIN_SLOPE) & (slope <= self.MAX_SLOPE))
@@ -14,7 +14,7 @@ Signal:
 
 from typing import Dict, Optional
 
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class DvpFavorableOverSignal(BaseSignal):
@@ -60,3 +60,7 @@ class DvpFavorableOverSignal(BaseSignal):
                 'opponent': prediction.get('opponent_team_abbr', ''),
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.opt('opponent_dvp_rank') <= self.MAX_DVP_RANK))
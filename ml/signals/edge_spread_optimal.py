@@ -14,7 +14,10 @@ See: docs/08-projects/current/signal-discovery-framework/COMPREHENSIVE-SIGNAL-AN
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+
+import numpy as np
+
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class EdgeSpreadOptimalSignal(BaseSignal):
@@ -70,3 +73,9 @@ class EdgeSpreadOptimalSignal(BaseSignal):
                 'sweet_spot': 0.75 <= confidence <= 0.85
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        confidence = frame.get('confidence_score', 0)
+        problem_tier = (confidence >= self.PROBLEM_TIER_MIN) & (confidence <= self.PROBLEM_TIER_MAX)
+        return ((np.abs(frame.get('edge', 0)) >= self.MIN_EDGE)
+                & (confidence >= self.MIN_CONFIDENCE) & ~problem_tier)
@@ -11,7 +11,7 @@ Uses pred['rest_days'] from supplemental_data.py DATE_DIFF computation.
 
 Created: Session 372
 """
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class ExtendedRestUnderSignal(BaseSignal):
@@ -43,3 +43,8 @@ class ExtendedRestUnderSignal(BaseSignal):
                 'backtest_hr': 61.8,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'UNDER')
+                & (frame.num('rest_days') >= self.MIN_REST_DAYS)
+                & (frame.num('line_value') >= self.MIN_LINE))
@@ -12,7 +12,7 @@ Fixed: Session 387 — was checking normalized 0-1 against raw 102, could never
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class FastPaceOverSignal(BaseSignal):
@@ -45,3 +45,7 @@ class FastPaceOverSignal(BaseSignal):
                 'backtest_hr': 81.5,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.num('opponent_pace') >= self.MIN_OPPONENT_PACE))
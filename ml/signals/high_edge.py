@@ -1,7 +1,10 @@
 """High Edge signal — picks where model edge >= 5.0 points."""
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+
+import numpy as np
+
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class HighEdgeSignal(BaseSignal):
@@ -23,3 +26,6 @@ class HighEdgeSignal(BaseSignal):
             source_tag=self.tag,
             metadata={'edge': edge},
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return np.abs(frame.num('edge')) >= self.MIN_EDGE
@@ -30,7 +30,7 @@ Detail: docs/09-handoff/2026-06-29-3-session-handoff.md (priority list, item 9)
 
 from typing import Dict, Optional
 
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class HighLineUnderSignal(BaseSignal):
@@ -67,3 +67,9 @@ class HighLineUnderSignal(BaseSignal):
                 'status': 'shadow',
             },
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        # line_value falls back to current_points_line; either may carry the line
+        return ((frame.text('recommendation') == 'UNDER')
+                & ((frame.num('line_value') >= self.MIN_LINE)
+                   | (frame.opt('current_points_line') >= self.MIN_LINE)))
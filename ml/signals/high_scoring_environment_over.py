@@ -10,7 +10,7 @@ Created: Session 373
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class HighScoringEnvironmentOverSignal(BaseSignal):
@@ -43,3 +43,7 @@ class HighScoringEnvironmentOverSignal(BaseSignal):
                 'backtest_hr': 70.2,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.num('implied_team_total') >= self.MIN_IMPLIED_TEAM_TOTAL))
@@ -10,7 +10,7 @@ Created: Session 371
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class HomeUnderSignal(BaseSignal):
@@ -43,3 +43,8 @@ class HomeUnderSignal(BaseSignal):
                 'backtest_hr': 63.9,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'UNDER')
+                & frame.flag('is_home')
+                & (frame.num('line_value') >= 15))
@@ -13,7 +13,7 @@ Created: Session 410
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class HotFormOverSignal(BaseSignal):
@@ -62,3 +62,11 @@ class HotFormOverSignal(BaseSignal):
                 'line_value': round(line, 1),
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        avg_5 = frame.num('points_avg_last_5')
+        avg_10 = frame.num('points_avg_last_10')
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.num('line_value') >= self.MIN_LINE)
+                & (avg_5 > 0) & (avg_10 > 0)
+                & (avg_5 / avg_10 >= self.MIN_FORM_RATIO))
@@ -39,7 +39,7 @@ Detail: docs/09-handoff/2026-06-29-3-session-handoff.md
 
 from typing import Dict, Optional
 
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class LineConvergingUnderSignal(BaseSignal):
@@ -78,3 +78,7 @@ class LineConvergingUnderSignal(BaseSignal):
                 'status': 'shadow',
             },
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'UNDER')
+                & (frame.opt('dk_line_move_direction') >= self.MIN_LINE_RISE))
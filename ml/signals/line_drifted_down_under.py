@@ -12,7 +12,7 @@ Created: Session 462 (BB pipeline simulator validated)
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class LineDriftedDownUnderSignal(BaseSignal):
@@ -55,3 +55,8 @@ class LineDriftedDownUnderSignal(BaseSignal):
                 'backtest_n': 336,
             },
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        movement = frame.opt('bp_line_movement')
+        return ((frame.text('recommendation') == 'UNDER')
+                & (movement < self.MAX_MOVEMENT) & (movement >= self.MIN_MOVEMENT))
@@ -12,7 +12,7 @@ Created: Session 374b
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class LineRisingOverSignal(BaseSignal):
@@ -49,3 +49,7 @@ class LineRisingOverSignal(BaseSignal):
                 'backtest_hr': 96.6,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.opt('prop_line_delta') >= self.MIN_LINE_RISE))
@@ -9,7 +9,7 @@ Created: Session 374
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class LowLineOverSignal(BaseSignal):
@@ -42,3 +42,7 @@ class LowLineOverSignal(BaseSignal):
                 'backtest_hr': 78.1,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        line = frame.num('line_value')
+        return (frame.text('recommendation') == 'OVER') & (line > 0) & (line < self.MAX_LINE)
@@ -20,7 +20,7 @@ Created: Session 413
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class MeanReversionUnderSignal(BaseSignal):
@@ -84,3 +84,12 @@ class MeanReversionUnderSignal(BaseSignal):
                 'above_line': round(above_line, 1),
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        line = frame.num('line_value')
+        avg_3 = frame.num('pts_avg_last3')
+        return ((frame.text('recommendation') == 'UNDER')
+                & (line >= self.MIN_LINE)
+                & (frame.opt('over_rate_last_10') < self.MAX_OVER_RATE)
+                & (frame.num('trend_slope') >= self.MIN_SLOPE)
+                & (avg_3 > 0) & (avg_3 - line >= self.MIN_ABOVE_LINE))
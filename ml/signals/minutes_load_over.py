@@ -10,7 +10,7 @@ Created: Session 411
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class MinutesLoadOverSignal(BaseSignal):
@@ -48,3 +48,8 @@ class MinutesLoadOverSignal(BaseSignal):
                 'line_value': round(line, 1),
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.num('line_value') >= self.MIN_LINE)
+                & (frame.num('minutes_load_7d') >= self.MIN_MINUTES_LOAD))
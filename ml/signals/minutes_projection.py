@@ -13,7 +13,7 @@ Created: Session 404.
 
 from typing import Dict, Optional
 
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 # Player must be projected at least this many minutes above season avg
 MINUTES_SURGE_THRESHOLD = 3.0
@@ -54,3 +54,7 @@ class MinutesSurgeOverSignal(BaseSignal):
             )
 
         return self._no_qualify()
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.opt('minutes_projection_delta') >= MINUTES_SURGE_THRESHOLD))
@@ -34,7 +34,7 @@ Promote to UNDER_SIGNAL_WEIGHTS after live 2026-27 confirms N>=30 BB-level picks
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class MultiBookConvergenceUnderSignal(BaseSignal):
@@ -99,3 +99,8 @@ class MultiBookConvergenceUnderSignal(BaseSignal):
                 ),
             },
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        # Net convergence (down vs up) is checked by evaluate()
+        return ((frame.text('recommendation') == 'UNDER')
+                & (frame.opt('books_converging_down') >= self.MIN_BOOKS_CONVERGING_DOWN))
@@ -11,7 +11,7 @@ Created: Session 410
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class OverTrendOverSignal(BaseSignal):
@@ -62,3 +62,7 @@ class OverTrendOverSignal(BaseSignal):
                 'line_value': round(line, 1),
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        # Window over-rate needs the prev_over_* list; evaluate() finishes the check
+        return (frame.text('recommendation') == 'OVER') & (frame.num('line_value') >= self.MIN_LINE)
@@ -4,11 +4,13 @@ Session 443: Each model runs the full BB filter/signal stack independently.
 Results feed into the merge layer (pipeline_merger.py).
 
 Architecture:
-    1. build_shared_context() — one-time BQ queries for model-independent data
+    1. build_shared_context() — concurrent BQ queries for model-independent data
        (~12 queries total: predictions for ALL models, 10 satellite queries,
-       model health, regime context, etc.)
+       model health, regime context, etc.), cached per date by freshness tier
+       so same-day rebuilds only re-read what changed (shared_context_store.py)
     2. run_single_model_pipeline() — pure Python per-model: signals + aggregator
-    3. run_all_model_pipelines() — orchestrator: build context, fan out per model
+    3. run_all_model_pipelines() — orchestrator: build context, evaluate signals
+       for all models in one vectorized pass (signal_engine), fan out per model
 
 Key optimization: ALL models' predictions are fetched in a single BQ scan
 (no ROW_NUMBER dedup), then partitioned by system_id in Python.
@@ -20,7 +22,7 @@ import logging
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from google.cloud import bigquery
 
@@ -32,6 +34,14 @@ from ml.signals.model_direction_affinity import compute_model_direction_affiniti
 from ml.signals.model_profile_loader import load_model_profiles
 from ml.signals.regime_context import get_regime_context, get_market_compression
 from ml.signals.registry import SignalRegistry, build_default_registry
+from ml.signals.signal_engine import evaluate_signals
+from ml.signals.shared_context_store import (
+    PredictionSnapshot,
+    changed_players,
+    get_shared_context_store,
+    incremental_context_enabled,
+    merge_prediction_delta,
+)
 from ml.signals.signal_health import get_signal_health_summary
 from ml.signals.supplemental_data import (
     _season_start_for,
@@ -42,6 +52,7 @@ from shared.config.cross_model_subsets import (
     build_system_id_sql_filter,
     classify_system_id,
 )
+from shared.utils.fetch_graph import FetchGraph
 
 logger = logging.getLogger(__name__)
 
@@ -130,6 +141,7 @@ def _query_all_model_predictions(
     bq_client: bigquery.Client,
     target_date: str,
     include_disabled: bool = False,
+    player_lookups: Optional[List[str]] = None,
 ) -> Tuple[Dict[str, List[Dict]], Dict[str, Dict]]:
     """Query predictions for ALL models in a single BQ scan.
 
@@ -144,6 +156,8 @@ def _query_all_model_predictions(
         bq_client: BigQuery client.
         target_date: YYYY-MM-DD date string.
         include_disabled: If True, skip disabled_models filter (for historical replay).
+        player_lookups: Optional player subset (incremental refresh of the
+            players whose predictions changed since the last build).
 
     Returns:
         Tuple of:
@@ -166,6 +180,8 @@ def _query_all_model_predictions(
         disabled_join = "LEFT JOIN disabled_models dm ON p.system_id = dm.model_id"
         disabled_where = "AND dm.model_id IS NULL"
 
+    player_where = "AND p.player_lookup IN UNNEST(@player_lookups)" if player_lookups is not None else ""
+
     # Build the same CTE structure as multi_model path but WITHOUT QUALIFY
     query = f"""
     -- Session 443: Per-model pipeline — fetch ALL models without dedup
@@ -212,6 +228,7 @@ def _query_all_model_predictions(
         AND p.recommendation IN ('OVER', 'UNDER')
         AND p.line_source IN ('ACTUAL_PROP', 'ODDS_API', 'BETTINGPROS')
         {disabled_where}
+        {player_where}
       -- NO QUALIFY ROW_NUMBER — keep ALL models' predictions
     ),
 
@@ -566,14 +583,18 @@ def _query_all_model_predictions(
     # @season_start param covers the main query + every satellite (BigQuery
     # ignores the unused param on satellites that don't reference it).
     season_start = _season_start_for(target_date)
-    job_config = bigquery.QueryJobConfig(
-        query_parameters=[
-            bigquery.ScalarQueryParameter('target_date', 'DATE', target_date),
-            bigquery.ScalarQueryParameter('season_start', 'DATE', season_start),
-        ]
-    )
-
-    rows = bq_client.query(query, job_config=job_config).result(timeout=120)
+    query_parameters = [
+        bigquery.ScalarQueryParameter('target_date', 'DATE', target_date),
+        bigquery.ScalarQueryParameter('season_start', 'DATE', season_start),
+    ]
+    job_config = bigquery.QueryJobConfig(query_parameters=query_parameters)
+    main_job_config = job_config
+    if player_lookups is not None:
+        main_job_config = bigquery.QueryJobConfig(query_parameters=query_parameters + [
+            bigquery.ArrayQueryParameter('player_lookups', 'STRING', sorted(player_lookups)),
+        ])
+
+    rows = bq_client.query(query, job_config=main_job_config).result(timeout=120)
 
     # --- Run satellite queries in parallel with row parsing ---
 
@@ -1450,113 +1471,245 @@ def _query_direction_health(
     return health
 
 
+def _query_prediction_fingerprints(
+    bq_client: bigquery.Client,
+    target_date: str,
+) -> Optional[Dict[str, str]]:
+    """Per-player fingerprint of the date's prediction rows.
+
+    One cheap scan of the date partition. Consolidation inserts (whatever
+    their created_at), MERGE updates and supersession (is_active = FALSE,
+    updated_at set) all change the row count, active count,
+    MAX(prediction_id) or MAX(updated_at) of the players they touch.
+
+    Returns:
+        {player_lookup: fingerprint}, or None if the probe failed.
+    """
+    query = f"""
+    SELECT
+      player_lookup,
+      TO_JSON_STRING(STRUCT(
+        COUNT(*) AS n,
+        COUNTIF(is_active) AS active,
+        MAX(prediction_id) AS max_prediction_id,
+        MAX(updated_at) AS max_updated_at
+      )) AS fingerprint
+    FROM `{PROJECT_ID}.nba_predictions.player_prop_predictions`
+    WHERE game_date = @target_date
+    GROUP BY player_lookup
+    """
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter('target_date', 'DATE', target_date),
+        ]
+    )
+    try:
+        rows = bq_client.query(query, job_config=job_config).result(timeout=30)
+        return {row['player_lookup']: row['fingerprint'] for row in rows}
+    except Exception as e:
+        logger.warning(f"Prediction fingerprint query failed (non-fatal): {e}")
+        return None
+
+
+def _fetch_predictions(
+    bq_client: bigquery.Client,
+    target_date: str,
+    include_disabled: bool,
+    base: Optional[PredictionSnapshot],
+    fingerprints: Optional[Dict[str, str]],
+) -> PredictionSnapshot:
+    """Cached, delta-merged or fully re-read predictions for the date."""
+    if base is not None and fingerprints is not None and base.fingerprints is not None:
+        changed = changed_players(base.fingerprints, fingerprints)
+        if not changed:
+            logger.info("[SHARED_CONTEXT] Predictions unchanged since last build, reusing cached rows")
+            return base.copy()
+        predictions_by_model, supplemental_map = _query_all_model_predictions(
+            bq_client, target_date, include_disabled=include_disabled,
+            player_lookups=changed,
+        )
+        logger.info(f"[SHARED_CONTEXT] Re-queried {len(changed)} changed players")
+        return merge_prediction_delta(
+            base.copy(), changed, predictions_by_model, supplemental_map, fingerprints,
+        )
+
+    predictions_by_model, supplemental_map = _query_all_model_predictions(
+        bq_client, target_date, include_disabled=include_disabled,
+    )
+    return PredictionSnapshot(predictions_by_model, supplemental_map, fingerprints=fingerprints)
+
+
+def _non_fatal(description: str, fn: Callable[[], Any]) -> Callable[[], Any]:
+    """Wrap a context fetch so a failure logs and yields None (not cached)."""
+    def fetch():
+        try:
+            return fn()
+        except Exception as e:
+            logger.warning(f"{description} failed (non-fatal): {e}")
+            return None
+    return fetch
+
+
+def _fetch_regime_context(bq_client: bigquery.Client, target_date: str) -> Optional[Dict[str, Any]]:
+    """Regime context with market compression (2 queries)."""
+    regime_context = None
+    try:
+        regime_context = get_regime_context(bq_client, target_date)
+        compression_ctx = get_market_compression(bq_client, target_date)
+        regime_context['market_compression'] = compression_ctx
+    except Exception as e:
+        logger.warning(f"Regime context query failed (non-fatal): {e}")
+    return regime_context
+
+
+def _context_fetches(bq_client: bigquery.Client, target_date: str) -> Dict[str, Callable[[], Any]]:
+    """Model-independent context fetches, keyed as in CONTEXT_TIERS."""
+    return {
+        'model_health_map': lambda: _query_all_model_health_map(bq_client, target_date),
+        'default_model_health': lambda: query_model_health(bq_client),
+        'signal_health': _non_fatal(
+            'Signal health query', lambda: get_signal_health_summary(bq_client, target_date)),
+        'combo_registry': lambda: load_combo_registry(bq_client=bq_client),
+        'player_blacklist': _non_fatal(
+            'Player blacklist computation', lambda: compute_player_blacklist(bq_client, target_date)),
+        'player_under_suppression': _non_fatal(
+            'Player UNDER suppression computation',
+            lambda: compute_player_under_suppression(bq_client, target_date)),
+        'model_direction_affinity': _non_fatal(
+            'Model-direction affinity',
+            lambda: compute_model_direction_affinities(bq_client, target_date, PROJECT_ID)),
+        'model_profiles': _non_fatal(
+            'Model profile loading', lambda: load_model_profiles(bq_client, target_date, PROJECT_ID)),
+        'regime_context': lambda: _fetch_regime_context(bq_client, target_date),
+        'games_vs_opponent': _non_fatal(
+            'Games vs opponent query', lambda: query_games_vs_opponent(bq_client, target_date)),
+        'filter_overrides': lambda: _query_filter_overrides(bq_client),
+        'direction_health': _non_fatal(
+            'Direction health query', lambda: _query_direction_health(bq_client, target_date)),
+    }
+
+
 def build_shared_context(
     bq_client: bigquery.Client,
     target_date: str,
     **kwargs,
 ) -> SharedContext:
-    """Build all model-independent context. ~12 BQ queries total.
+    """Build all model-independent context. Up to ~12 BQ queries, run concurrently.
 
-    This is the expensive step: one big prediction query (all models, no dedup),
+    The expensive parts are one big prediction query (all models, no dedup),
     10 satellite queries for supplemental data, plus model health, signal health,
     combo registry, player blacklist, model-direction affinity, regime context,
     games vs opponent, and filter overrides.
 
+    Context is cached per date in a process-level SharedContextStore by
+    freshness tier (see ml/signals/shared_context_store.py): only stale tiers
+    are re-queried, and predictions are refreshed from a fingerprint probe
+    that re-reads just the players whose prediction rows changed since the
+    last build.
+
     Args:
         bq_client: BigQuery client.
         target_date: YYYY-MM-DD date string.
         **kwargs: Optional overrides:
             - signal_registry: Pre-built SignalRegistry (skips build_default_registry).
             - combo_registry: Pre-loaded combo registry.
+            - include_disabled: Include disabled models (historical replay).
 
     Returns:
         SharedContext with all data needed for per-model pipeline runs.
     """
     ctx = SharedContext(target_date=target_date)
-
-    # 1. Batch-query ALL models' predictions + supplemental data (1 big query + 10 satellites)
     include_disabled = kwargs.get('include_disabled', False)
+    store = get_shared_context_store() if incremental_context_enabled() else None
     logger.info(f"Building shared context for {target_date}...")
-    predictions_by_model, supplemental_map = _query_all_model_predictions(
-        bq_client, target_date, include_disabled=include_disabled,
-    )
-    ctx.all_predictions = predictions_by_model
-    ctx.supplemental_map = supplemental_map
 
-    if not predictions_by_model:
+    cached = store.fresh_values(target_date, include_disabled) if store else {}
+    base = store.predictions(target_date, include_disabled) if store else None
+
+    fetches = _context_fetches(bq_client, target_date)
+    if kwargs.get('combo_registry'):
+        fetches.pop('combo_registry')
+
+    graph = FetchGraph('shared_context')
+    for name, fn in fetches.items():
+        if name not in cached:
+            graph.add(name, fn)
+    if store is not None:
+        graph.add(
+            'prediction_fingerprints',
+            lambda: _query_prediction_fingerprints(bq_client, target_date),
+        )
+        graph.add(
+            'predictions',
+            lambda prediction_fingerprints: _fetch_predictions(
+                bq_client, target_date, include_disabled, base, prediction_fingerprints
+            ),
+            inputs=('prediction_fingerprints',),
+        )
+    else:
+        graph.add(
+            'predictions',
+            lambda: _fetch_predictions(bq_client, target_date, include_disabled, None, None),
+        )
+    results = graph.run()
+
+    snapshot = results.pop('predictions')
+    results.pop('prediction_fingerprints', None)
+    if store is not None:
+        store.update(target_date, include_disabled, results)
+        if base is None or snapshot.fingerprints != base.fingerprints:
+            store.set_predictions(target_date, include_disabled, snapshot)
+    if cached:
+        logger.info(f"[SHARED_CONTEXT] Reused cached {sorted(cached)}")
+    values = {**cached, **results}
+
+    # 1. Predictions for ALL models + supplemental data (1 big query + 10 satellites)
+    ctx.all_predictions = snapshot.predictions_by_model
+    ctx.supplemental_map = snapshot.supplemental_map
+
+    if not ctx.all_predictions:
         logger.warning(f"No predictions found for any model on {target_date}")
         return ctx
 
-    # 2. Model health for ALL models (1 query)
-    ctx.model_health_map = _query_all_model_health_map(bq_client, target_date)
-    # Default model health (champion)
-    default_health = query_model_health(bq_client)
-    ctx.default_model_health_hr = default_health.get('hit_rate_7d_edge3')
+    # 2. Model health for ALL models + default model health (champion)
+    ctx.model_health_map = values.get('model_health_map') or {}
+    ctx.default_model_health_hr = (values.get('default_model_health') or {}).get('hit_rate_7d_edge3')
 
-    # 3. Signal health (1 query)
-    try:
-        ctx.signal_health = get_signal_health_summary(bq_client, target_date)
-    except Exception as e:
-        logger.warning(f"Signal health query failed (non-fatal): {e}")
+    # 3. Signal health
+    ctx.signal_health = values.get('signal_health') or {}
 
     # 4. Combo registry
-    ctx.combo_registry = kwargs.get('combo_registry') or load_combo_registry(bq_client=bq_client)
-
-    # 5. Player blacklist (1 query)
-    try:
-        ctx.player_blacklist, ctx.blacklist_stats = compute_player_blacklist(
-            bq_client, target_date
-        )
-    except Exception as e:
-        logger.warning(f"Player blacklist computation failed (non-fatal): {e}")
+    ctx.combo_registry = kwargs.get('combo_registry') or values.get('combo_registry')
 
-    # 5b. Player UNDER suppression (1 query, Session 451)
-    try:
-        ctx.player_under_suppression, _ = compute_player_under_suppression(
-            bq_client, target_date
-        )
-    except Exception as e:
-        logger.warning(f"Player UNDER suppression computation failed (non-fatal): {e}")
+    # 5. Player blacklist + UNDER suppression (Session 451)
+    if values.get('player_blacklist') is not None:
+        ctx.player_blacklist, ctx.blacklist_stats = values['player_blacklist']
+    if values.get('player_under_suppression') is not None:
+        ctx.player_under_suppression, _ = values['player_under_suppression']
 
-    # 6. Model-direction affinity (1 query)
-    try:
+    # 6. Model-direction affinity
+    if values.get('model_direction_affinity') is not None:
         _, ctx.model_direction_blocks, ctx.model_direction_affinity_stats = \
-            compute_model_direction_affinities(bq_client, target_date, PROJECT_ID)
-    except Exception as e:
-        logger.warning(f"Model-direction affinity failed (non-fatal): {e}")
+            values['model_direction_affinity']
 
-    # 7. Model profile store (1 query)
-    try:
-        ctx.model_profile_store = load_model_profiles(bq_client, target_date, PROJECT_ID)
-    except Exception as e:
-        logger.warning(f"Model profile loading failed (non-fatal): {e}")
+    # 7. Model profile store
+    ctx.model_profile_store = values.get('model_profiles')
 
-    # 8. Regime context (2 queries: yesterday HR + market compression)
-    try:
-        ctx.regime_context = get_regime_context(bq_client, target_date)
-        compression_ctx = get_market_compression(bq_client, target_date)
-        ctx.regime_context['market_compression'] = compression_ctx
-    except Exception as e:
-        logger.warning(f"Regime context query failed (non-fatal): {e}")
+    # 8. Regime context (yesterday HR + market compression)
+    ctx.regime_context = values.get('regime_context') or {}
 
-    # 9. Games vs opponent (1 query)
-    try:
-        ctx.games_vs_opponent = query_games_vs_opponent(bq_client, target_date)
-    except Exception as e:
-        logger.warning(f"Games vs opponent query failed (non-fatal): {e}")
+    # 9. Games vs opponent
+    ctx.games_vs_opponent = values.get('games_vs_opponent') or {}
 
-    # 10. Runtime filter overrides (1 query)
-    ctx.runtime_demoted_filters = _query_filter_overrides(bq_client)
+    # 10. Runtime filter overrides
+    ctx.runtime_demoted_filters = values.get('filter_overrides') or set()
 
-    # 11. Direction health (1 query)
-    try:
-        ctx.direction_health = _query_direction_health(bq_client, target_date)
-    except Exception as e:
-        logger.warning(f"Direction health query failed (non-fatal): {e}")
+    # 11. Direction health (observation-only)
+    ctx.direction_health = values.get('direction_health') or {}
 
     logger.info(
-        f"Shared context built: {len(predictions_by_model)} models, "
-        f"{sum(len(v) for v in predictions_by_model.values())} total predictions, "
+        f"Shared context built: {len(ctx.all_predictions)} models, "
+        f"{sum(len(v) for v in ctx.all_predictions.values())} total predictions, "
         f"{len(ctx.player_blacklist)} blacklisted, "
         f"{len(ctx.player_under_suppression)} UNDER-suppressed players"
     )
@@ -1568,10 +1721,84 @@ def build_shared_context(
 # Single-model pipeline runner
 # ---------------------------------------------------------------------------
 
+def _enrich_games_vs_opponent(predictions: List[Dict], shared_ctx: SharedContext) -> None:
+    """Set pred['games_vs_opponent'] from the shared (player, opponent) counts."""
+    for pred in predictions:
+        opp = pred.get('opponent_team_abbr', '')
+        pred['games_vs_opponent'] = shared_ctx.games_vs_opponent.get(
+            (pred['player_lookup'], opp), 0
+        )
+
+
+def _model_supplementals(
+    system_id: str,
+    predictions: List[Dict],
+    shared_ctx: SharedContext,
+) -> List[Dict]:
+    """Per-prediction supplemental dicts with this model's health injected."""
+    # Get per-model health (use model-specific if available, else default)
+    model_hr_7d = shared_ctx.model_health_map.get(
+        system_id, shared_ctx.default_model_health_hr
+    )
+    supplementals = []
+    for pred in predictions:
+        supplements_copy = dict(shared_ctx.supplemental_map.get(pred['player_lookup'], {}))
+        supplements_copy['model_health'] = {'hit_rate_7d_edge3': model_hr_7d}
+        supplementals.append(supplements_copy)
+    return supplementals
+
+
+def _signal_results_by_key(
+    predictions: List[Dict],
+    results: List[List],
+) -> Dict[str, List]:
+    """Key signal results by player::game (a repeated key keeps the last row)."""
+    return {
+        f"{pred['player_lookup']}::{pred['game_id']}": results_for_pred
+        for pred, results_for_pred in zip(predictions, results)
+    }
+
+
+def evaluate_all_model_signals(
+    shared_ctx: SharedContext,
+    signal_registry: SignalRegistry,
+    system_ids: Optional[List[str]] = None,
+) -> Dict[str, Dict[str, List]]:
+    """Evaluate the signal registry for every model's predictions in one pass.
+
+    All models' predictions are stacked into a single SignalFrame so each
+    vectorized signal runs once per date instead of once per model.
+
+    Returns:
+        Dict[system_id, signal_results_map] as run_single_model_pipeline builds it.
+    """
+    if system_ids is None:
+        system_ids = sorted(shared_ctx.all_predictions.keys())
+
+    stacked_predictions: List[Dict] = []
+    stacked_supplementals: List[Dict] = []
+    spans: List[Tuple[str, int, int]] = []
+    for system_id in system_ids:
+        predictions = shared_ctx.all_predictions.get(system_id, [])
+        _enrich_games_vs_opponent(predictions, shared_ctx)
+        start = len(stacked_predictions)
+        stacked_predictions.extend(predictions)
+        stacked_supplementals.extend(_model_supplementals(system_id, predictions, shared_ctx))
+        spans.append((system_id, start, len(stacked_predictions)))
+
+    results = evaluate_signals(signal_registry.all(), stacked_predictions, stacked_supplementals)
+
+    return {
+        system_id: _signal_results_by_key(stacked_predictions[start:end], results[start:end])
+        for system_id, start, end in spans
+    }
+
+
 def run_single_model_pipeline(
     system_id: str,
     shared_ctx: SharedContext,
     signal_registry: Optional[SignalRegistry] = None,
+    signal_results_map: Optional[Dict[str, List]] = None,
 ) -> PipelineResult:
     """Run signals + aggregator for one model. Pure Python -- no BQ queries.
 
@@ -1579,6 +1806,8 @@ def run_single_model_pipeline(
         system_id: Model system_id to run pipeline for.
         shared_ctx: SharedContext built by build_shared_context().
         signal_registry: Optional pre-built registry (reuse across models).
+        signal_results_map: Optional pre-computed signal results for this model
+            (from evaluate_all_model_signals). Evaluated here when omitted.
 
     Returns:
         PipelineResult with candidates, filter summary, and signal results.
@@ -1595,35 +1824,16 @@ def run_single_model_pipeline(
         )
 
     # Enrich predictions with games_vs_opponent
-    for pred in predictions:
-        opp = pred.get('opponent_team_abbr', '')
-        pred['games_vs_opponent'] = shared_ctx.games_vs_opponent.get(
-            (pred['player_lookup'], opp), 0
-        )
-
-    # Get per-model health (use model-specific if available, else default)
-    model_hr_7d = shared_ctx.model_health_map.get(
-        system_id, shared_ctx.default_model_health_hr
-    )
-
-    # Build signal registry if not provided
-    if signal_registry is None:
-        signal_registry = build_default_registry()
+    _enrich_games_vs_opponent(predictions, shared_ctx)
 
     # Evaluate signals for each prediction
-    signal_results_map: Dict[str, List] = {}
-    for pred in predictions:
-        key = f"{pred['player_lookup']}::{pred['game_id']}"
-        supplements = shared_ctx.supplemental_map.get(pred['player_lookup'], {})
-        # Inject model health into supplemental
-        supplements_copy = dict(supplements)
-        supplements_copy['model_health'] = {'hit_rate_7d_edge3': model_hr_7d}
-
-        results_for_pred = []
-        for signal in signal_registry.all():
-            result = signal.evaluate(pred, features=None, supplemental=supplements_copy)
-            results_for_pred.append(result)
-        signal_results_map[key] = results_for_pred
+    if signal_results_map is None:
+        # Build signal registry if not provided
+        if signal_registry is None:
+            signal_registry = build_default_registry()
+        supplementals = _model_supplementals(system_id, predictions, shared_ctx)
+        results = evaluate_signals(signal_registry.all(), predictions, supplementals)
+        signal_results_map = _signal_results_by_key(predictions, results)
 
     # Run aggregator in per_model mode
     aggregator = BestBetsAggregator(
@@ -1694,12 +1904,23 @@ def run_all_model_pipelines(
     # Build signal registry once (stateless — safe to share across models)
     signal_registry = build_default_registry()
 
+    # Evaluate signals for all models in one pass. On failure each model
+    # evaluates its own signals below, so one bad model stays isolated.
+    try:
+        signal_results_by_model = evaluate_all_model_signals(shared_ctx, signal_registry)
+    except Exception as e:
+        logger.warning(
+            f"Batched signal evaluation failed, evaluating per model: {e}", exc_info=True
+        )
+        signal_results_by_model = {}
+
     # Run each model through the pipeline
     results: Dict[str, PipelineResult] = {}
     for system_id in sorted(shared_ctx.all_predictions.keys()):
         try:
             result = run_single_model_pipeline(
-                system_id, shared_ctx, signal_registry=signal_registry
+                system_id, shared_ctx, signal_registry=signal_registry,
+                signal_results_map=signal_results_by_model.get(system_id),
             )
             results[system_id] = result
         except Exception as e:
@@ -14,7 +14,7 @@ Signal:
 
 from typing import Dict, Optional
 
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class PredictedPaceOverSignal(BaseSignal):
@@ -55,3 +55,7 @@ class PredictedPaceOverSignal(BaseSignal):
                 'opponent_pace': prediction.get('opponent_predicted_pace'),
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.opt('predicted_game_pace') >= self.MIN_PREDICTED_PACE))
@@ -26,7 +26,7 @@ MIN_SOURCES remains at 1 — ESPN needs shadow validation before raising to 2.
 
 from typing import Dict, Optional
 
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class ProjectionConsensusOverSignal(BaseSignal):
@@ -74,6 +74,11 @@ class ProjectionConsensusOverSignal(BaseSignal):
             }
         )
 
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.get('projection_sources_total', 0) >= 1)
+                & (frame.get('projection_sources_above_line', 0) >= self.MIN_SOURCES_ABOVE))
+
 
 class ProjectionConsensusUnderSignal(BaseSignal):
     """UNDER signal when 2+ external projections project below the line.
@@ -119,6 +124,11 @@ class ProjectionConsensusUnderSignal(BaseSignal):
             }
         )
 
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'UNDER')
+                & (frame.get('projection_sources_total', 0) >= 1)
+                & (frame.get('projection_sources_below_line', 0) >= self.MIN_SOURCES_BELOW))
+
 
 class ProjectionDisagreementFilter(BaseSignal):
     """Negative filter: model says OVER but 0 external projections agree.
@@ -164,3 +174,8 @@ class ProjectionDisagreementFilter(BaseSignal):
                 'espn_proj': prediction.get('espn_projected_points'),
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.get('projection_sources_total', 0) >= 2)
+                & (frame.get('projection_sources_above_line', 0) <= 0))
@@ -9,7 +9,7 @@ Also used with q4_scorer_under_block aggregator filter (34.0% HR on UNDER).
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class Q4ScorerOverSignal(BaseSignal):
@@ -47,3 +47,7 @@ class Q4ScorerOverSignal(BaseSignal):
                 'signal_mechanism': 'Late-game closer exceeds season averages'
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.num('q4_scoring_ratio') >= self.Q4_RATIO_THRESHOLD))
@@ -18,7 +18,7 @@ Created: Session 522
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class QuantileCeilingUnderSignal(BaseSignal):
@@ -70,3 +70,9 @@ class QuantileCeilingUnderSignal(BaseSignal):
                 'backtest_n': 10,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        line = frame.num('line_value')
+        return ((frame.text('recommendation') == 'UNDER')
+                & (line > 0)
+                & (frame.opt('quantile_p75') < line))
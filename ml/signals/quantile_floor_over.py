@@ -19,7 +19,7 @@ Created: Session 522
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class QuantileFloorOverSignal(BaseSignal):
@@ -70,3 +70,9 @@ class QuantileFloorOverSignal(BaseSignal):
                 'backtest_n': 1,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        line = frame.num('line_value')
+        return ((frame.text('recommendation') == 'OVER')
+                & (line > 0)
+                & (frame.opt('quantile_p25') > line))
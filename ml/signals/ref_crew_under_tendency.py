@@ -37,7 +37,7 @@ Detail: docs/09-handoff/2026-06-29-ref-crew-under-tendency.md
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class RefCrewUnderTendencySignal(BaseSignal):
@@ -94,3 +94,8 @@ class RefCrewUnderTendencySignal(BaseSignal):
                 'data_note': 'Covers data accumulates from 2026-27 — low coverage initially',
             },
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'UNDER')
+                & frame.flag('crew_under_data_available')
+                & (frame.opt('crew_avg_over_pct') < self.OVER_PCT_THRESHOLD))
@@ -13,7 +13,7 @@ Created: Session 371
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class ScoringColdStreakOverSignal(BaseSignal):
@@ -51,3 +51,8 @@ class ScoringColdStreakOverSignal(BaseSignal):
                 'backtest_hr': 65.1,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.num('prop_under_streak') >= self.MIN_UNDER_STREAK)
+                & (frame.num('points_avg_season') >= self.MIN_POINTS_AVG))
@@ -13,7 +13,7 @@ Created: Session 411
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class ScoringMomentumOverSignal(BaseSignal):
@@ -63,3 +63,11 @@ class ScoringMomentumOverSignal(BaseSignal):
                 'line_value': round(line, 1),
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        avg_3 = frame.num('pts_avg_last3')
+        avg_10 = frame.num('points_avg_last_10')
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.num('line_value') >= self.MIN_LINE)
+                & (frame.num('trend_slope') >= self.MIN_SLOPE)
+                & (avg_3 > 0) & (avg_10 > 0) & (avg_3 > avg_10))
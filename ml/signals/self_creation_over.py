@@ -15,7 +15,7 @@ Created: Session 380
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class SelfCreationOverSignal(BaseSignal):
@@ -55,3 +55,8 @@ class SelfCreationOverSignal(BaseSignal):
                 'status': 'CONDITIONAL',
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.num('line_value') >= self.MIN_LINE)
+                & (frame.num('self_creation_rate_last_10') >= self.MIN_SELF_CREATION_RATE))
@@ -0,0 +1,230 @@
+"""Process-level store for incremental SharedContext refreshes.
+
+build_shared_context() used to run ~12 BQ queries serially on every call,
+and the best-bets pipeline is rebuilt after every prediction batch and line
+update. Most of that context does not change within a game day.
+
+Context fetches are grouped into freshness tiers:
+
+    daily    model health, signal health, combo registry, blacklist, UNDER
+             suppression, direction affinity, model profiles, regime context,
+             games vs opponent, direction health -- all computed from graded
+             history before the target date
+    hourly   runtime filter overrides, and a full re-read of predictions +
+             satellite data (bounds staleness of injury / lineup / line data
+             for players whose predictions did not change)
+    per-run  prediction fingerprints: one probe query returns a
+             fingerprint per player for the date (row count, active count,
+             MAX(prediction_id), MAX(updated_at)). Players whose fingerprint
+             differs from the cached snapshot are re-queried and merged into
+             the cached predictions.
+
+Fingerprints are used instead of a created_at / updated_at watermark
+because consolidation inserts keep the worker's created_at and leave
+updated_at NULL: a batch staged before the last build but consolidated
+after it would never look newer than a watermark. Any inserted, updated or
+deactivated row changes its player's fingerprint, whenever it was staged.
+
+A same-day refresh with nothing new is one probe query; after a line update
+it is the probe plus the prediction query for the re-predicted players.
+
+Environment:
+    SHARED_CONTEXT_MODE: 'incremental' (default) or 'full' (no store)
+    SHARED_CONTEXT_DAILY_TTL_SECONDS: max age of daily values (default 43200)
+    SHARED_CONTEXT_HOURLY_TTL_SECONDS: max age of hourly values (default 3600)
+    SHARED_CONTEXT_MAX_DATES: target dates kept in the store (default 2)
+"""
+
+import copy
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DAILY = 'daily'
+HOURLY = 'hourly'
+
+# Context fetch name -> freshness tier
+CONTEXT_TIERS: Dict[str, str] = {
+    'model_health_map': DAILY,
+    'default_model_health': DAILY,
+    'signal_health': DAILY,
+    'combo_registry': DAILY,
+    'player_blacklist': DAILY,
+    'player_under_suppression': DAILY,
+    'model_direction_affinity': DAILY,
+    'model_profiles': DAILY,
+    'regime_context': DAILY,
+    'games_vs_opponent': DAILY,
+    'direction_health': DAILY,
+    'filter_overrides': HOURLY,
+}
+
+DEFAULT_TTL_SECONDS = {DAILY: 12 * 3600, HOURLY: 3600}
+DEFAULT_MAX_DATES = 2
+
+# Shared read-only objects handed out without copying
+_UNCOPIED = frozenset({'model_profiles'})
+
+
+def incremental_context_enabled() -> bool:
+    """Return False when SHARED_CONTEXT_MODE=full."""
+    return os.environ.get('SHARED_CONTEXT_MODE', 'incremental').lower() != 'full'
+
+
+def _tier_ttl(tier: str) -> float:
+    return float(os.environ.get(
+        f'SHARED_CONTEXT_{tier.upper()}_TTL_SECONDS', DEFAULT_TTL_SECONDS[tier]
+    ))
+
+
+@dataclass
+class PredictionSnapshot:
+    """Predictions + supplemental data as of a set of per-player prediction fingerprints."""
+    predictions_by_model: Dict[str, List[Dict]]
+    supplemental_map: Dict[str, Dict]
+    fingerprints: Optional[Dict[str, str]] = None
+    built_at: float = field(default_factory=time.time)
+
+    def copy(self) -> 'PredictionSnapshot':
+        return PredictionSnapshot(
+            predictions_by_model=copy.deepcopy(self.predictions_by_model),
+            supplemental_map=copy.deepcopy(self.supplemental_map),
+            fingerprints=dict(self.fingerprints) if self.fingerprints is not None else None,
+            built_at=self.built_at,
+        )
+
+
+def changed_players(old: Dict[str, str], new: Dict[str, str]) -> List[str]:
+    """Players added, removed, or with a different fingerprint."""
+    return sorted(
+        player for player in set(old) | set(new) if old.get(player) != new.get(player)
+    )
+
+
+def merge_prediction_delta(
+    base: PredictionSnapshot,
+    changed_players: Iterable[str],
+    predictions_by_model: Dict[str, List[Dict]],
+    supplemental_map: Dict[str, Dict],
+    fingerprints: Optional[Dict[str, str]],
+) -> PredictionSnapshot:
+    """Replace every changed player's rows (all models) with the re-queried rows.
+
+    Players whose predictions were all superseded or deactivated simply drop
+    out. Per-model lists keep the full query's player_lookup order.
+    """
+    changed = set(changed_players)
+    merged: Dict[str, List[Dict]] = {}
+    for system_id in set(base.predictions_by_model) | set(predictions_by_model):
+        rows = [
+            pred for pred in base.predictions_by_model.get(system_id, [])
+            if pred['player_lookup'] not in changed
+        ]
+        rows.extend(predictions_by_model.get(system_id, []))
+        if rows:
+            merged[system_id] = sorted(rows, key=lambda pred: pred['player_lookup'])
+
+    supplementals = {
+        player: supp for player, supp in base.supplemental_map.items() if player not in changed
+    }
+    supplementals.update(supplemental_map)
+
+    return PredictionSnapshot(
+        predictions_by_model=dict(sorted(merged.items())),
+        supplemental_map=supplementals,
+        fingerprints=fingerprints,
+        built_at=base.built_at,
+    )
+
+
+@dataclass
+class _Entry:
+    values: Dict[str, Tuple[Any, float]] = field(default_factory=dict)
+    predictions: Optional[PredictionSnapshot] = None
+
+
+class SharedContextStore:
+    """Thread-safe per-(date, include_disabled) cache of context tiers.
+
+    Values are copied on the way in and out, so pipelines that annotate
+    prediction dicts never touch the cached state.
+    """
+
+    def __init__(self, max_dates: Optional[int] = None):
+        self.max_dates = max_dates or int(os.environ.get('SHARED_CONTEXT_MAX_DATES', DEFAULT_MAX_DATES))
+        self._entries: Dict[Tuple[str, bool], _Entry] = {}
+        self._lock = threading.Lock()
+
+    def fresh_values(self, target_date: str, include_disabled: bool = False) -> Dict[str, Any]:
+        """Copies of the cached context values that are still within their tier TTL."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get((target_date, include_disabled))
+            if entry is None:
+                return {}
+            return {
+                name: value if name in _UNCOPIED else copy.deepcopy(value)
+                for name, (value, fetched_at) in entry.values.items()
+                if now - fetched_at <= _tier_ttl(CONTEXT_TIERS[name])
+            }
+
+    def update(self, target_date: str, include_disabled: bool, values: Dict[str, Any]) -> None:
+        """Store freshly fetched values. None marks a failed fetch and is not cached."""
+        now = time.time()
+        with self._lock:
+            entry = self._entry(target_date, include_disabled)
+            for name, value in values.items():
+                if name in CONTEXT_TIERS and value is not None:
+                    entry.values[name] = (
+                        value if name in _UNCOPIED else copy.deepcopy(value), now
+                    )
+
+    def predictions(self, target_date: str, include_disabled: bool = False) -> Optional[PredictionSnapshot]:
+        """The cached prediction snapshot, unless its last full read is older than the hourly TTL."""
+        with self._lock:
+            entry = self._entries.get((target_date, include_disabled))
+            snapshot = entry.predictions if entry else None
+            if snapshot is None or time.time() - snapshot.built_at > _tier_ttl(HOURLY):
+                return None
+            return snapshot
+
+    def set_predictions(self, target_date: str, include_disabled: bool, snapshot: PredictionSnapshot) -> None:
+        with self._lock:
+            self._entry(target_date, include_disabled).predictions = snapshot.copy()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _entry(self, target_date: str, include_disabled: bool) -> _Entry:
+        key = (target_date, include_disabled)
+        if key not in self._entries:
+            self._entries[key] = _Entry()
+            dates = sorted({d for d, _ in self._entries})
+            for stale_date in dates[:-self.max_dates]:
+                for stale_key in [k for k in self._entries if k[0] == stale_date]:
+                    del self._entries[stale_key]
+                logger.info(f"[SHARED_CONTEXT] Evicted cached context for {stale_date}")
+        return self._entries[key]
+
+
+_store: Optional[SharedContextStore] = None
+_store_lock = threading.Lock()
+
+
+def get_shared_context_store() -> SharedContextStore:
+    """Process-level store shared by every build_shared_context() call."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SharedContextStore()
+        return _store
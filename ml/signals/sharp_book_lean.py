@@ -16,7 +16,7 @@ the latest per-book lines from odds_api_player_points_props.
 
 from typing import Dict, Optional
 
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 SHARP_BOOKS = frozenset({'fanduel', 'draftkings'})
@@ -61,6 +61,10 @@ class SharpBookLeanOverSignal(BaseSignal):
             }
         )
 
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.opt('sharp_book_lean') >= self.MIN_LEAN))
+
 
 class SharpBookLeanUnderSignal(BaseSignal):
     """UNDER signal when soft books have higher line than sharp books.
@@ -101,3 +105,7 @@ class SharpBookLeanUnderSignal(BaseSignal):
                 'backtest_n': 202,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'UNDER')
+                & (frame.opt('sharp_book_lean') <= -self.MIN_LEAN))
@@ -18,7 +18,7 @@ Created: Session 382C
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class SharpLineDropUnderSignal(BaseSignal):
@@ -56,3 +56,7 @@ class SharpLineDropUnderSignal(BaseSignal):
                 'feb_hr': 58.3,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'UNDER')
+                & (frame.opt('dk_line_move_direction') <= self.MAX_LINE_MOVE))
@@ -17,7 +17,7 @@ Created: Session 380
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class SharpLineMoveOverSignal(BaseSignal):
@@ -54,3 +54,7 @@ class SharpLineMoveOverSignal(BaseSignal):
                 'feb_hr': 69.0,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.opt('dk_line_move_direction') >= self.MIN_LINE_MOVE))
@@ -17,7 +17,7 @@ Created: Session 404.
 
 from typing import Dict, Optional
 
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 # Thresholds for sharp money divergence
 SHARP_HANDLE_THRESHOLD = 65.0   # Handle % on one side
@@ -63,6 +63,11 @@ class SharpMoneyOverSignal(BaseSignal):
 
         return self._no_qualify()
 
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.opt('vsin_over_money_pct') >= SHARP_HANDLE_THRESHOLD)
+                & (frame.opt('vsin_over_ticket_pct') <= PUBLIC_TICKET_THRESHOLD))
+
 
 class SharpMoneyUnderSignal(BaseSignal):
     """Sharp money on UNDER: handle >= 65% UNDER while tickets <= 45% UNDER."""
@@ -102,6 +107,11 @@ class SharpMoneyUnderSignal(BaseSignal):
 
         return self._no_qualify()
 
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'UNDER')
+                & (frame.opt('vsin_under_money_pct') >= SHARP_HANDLE_THRESHOLD)
+                & (frame.opt('vsin_under_ticket_pct') <= PUBLIC_TICKET_THRESHOLD))
+
 
 class PublicFadeFilter(BaseSignal):
     """Negative filter: extreme public consensus on OVER (>=80% tickets).
@@ -142,3 +152,7 @@ class PublicFadeFilter(BaseSignal):
             )
 
         return self._no_qualify()
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.opt('vsin_over_ticket_pct') >= PUBLIC_FADE_THRESHOLD))
@@ -0,0 +1,90 @@
+"""Signal engine — evaluate a signal registry over many predictions at once.
+
+The per-model pipeline used to call signal.evaluate() for every
+(prediction, signal, model) triple. Most signals are a handful of column
+predicates, so the engine evaluates those as boolean arrays over a
+SignalFrame and only calls evaluate() for rows a mask selects:
+
+    signal with vector_mask()   -> evaluate() on mask rows (plus rows whose
+                                   columns held NaN / non-numeric values);
+                                   every other row gets the non-qualifying result
+    signal without vector_mask  -> evaluate() on every row (scalar fallback)
+
+Qualifying results, confidence and metadata therefore always come from the
+signal's own evaluate(); the mask only decides which rows are worth asking.
+Non-qualifying results from the mask path are one shared instance per signal
+and must be treated as read-only.
+
+Set SIGNAL_ENGINE=scalar to force evaluate() on every row (A/B checks).
+"""
+
+import logging
+import os
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
+
+logger = logging.getLogger(__name__)
+
+
+def vectorized_enabled() -> bool:
+    return os.environ.get('SIGNAL_ENGINE', 'vectorized').lower() != 'scalar'
+
+
+def evaluate_signals(
+    signals: Sequence[BaseSignal],
+    predictions: List[Dict],
+    supplementals: List[Dict],
+    vectorized: Optional[bool] = None,
+) -> List[List[SignalResult]]:
+    """Evaluate every signal for every prediction.
+
+    Args:
+        signals: Signals in registry order.
+        predictions: Prediction dicts.
+        supplementals: Supplemental dict per prediction (same length/order).
+        vectorized: Use vector masks where available (default: SIGNAL_ENGINE env).
+
+    Returns:
+        One list of SignalResults per prediction, in ``signals`` order --
+        the same lists the scalar evaluate() loop produces.
+    """
+    if vectorized is None:
+        vectorized = vectorized_enabled()
+
+    n = len(predictions)
+    columns: List[List[SignalResult]] = []
+    frame = SignalFrame(predictions) if vectorized else None
+    vectorized_count = 0
+
+    for signal in signals:
+        mask = None
+        if frame is not None:
+            frame.begin()
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mask = signal.vector_mask(frame)
+
+        if mask is None:
+            columns.append([
+                signal.evaluate(pred, features=None, supplemental=supp)
+                for pred, supp in zip(predictions, supplementals)
+            ])
+            continue
+
+        vectorized_count += 1
+        rows = np.flatnonzero(np.asarray(mask, dtype=bool) | frame.unsure_rows())
+        no_qualify = signal._no_qualify()
+        column = [no_qualify] * n
+        for i in rows.tolist():
+            column[i] = signal.evaluate(predictions[i], features=None, supplemental=supplementals[i])
+        columns.append(column)
+
+    if frame is not None:
+        logger.debug(
+            f"Signal engine: {n} predictions x {len(signals)} signals "
+            f"({vectorized_count} vectorized)"
+        )
+
+    return [list(row) for row in zip(*columns)] if columns else [[] for _ in range(n)]
@@ -11,7 +11,7 @@ Created: Session 463 (P0 simulator experiments)
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class SlowPaceUnderSignal(BaseSignal):
@@ -51,3 +51,7 @@ class SlowPaceUnderSignal(BaseSignal):
                 'backtest_n': 777,
             },
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'UNDER')
+                & (frame.opt('opponent_pace') <= self.MAX_OPPONENT_PACE))
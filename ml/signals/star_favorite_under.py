@@ -14,7 +14,7 @@ Created: Session 422c (shadow mode — N=88 borderline for production)
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class StarFavoriteUnderSignal(BaseSignal):
@@ -54,3 +54,8 @@ class StarFavoriteUnderSignal(BaseSignal):
                 'backtest_hr': 73.0,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'UNDER')
+                & (frame.num('line_value') >= self.MIN_LINE)
+                & (frame.num('spread_magnitude') >= self.MIN_SPREAD))
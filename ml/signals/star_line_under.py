@@ -21,7 +21,7 @@ Created: Session 463 (P1 simulator experiments)
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class StarLineUnderSignal(BaseSignal):
@@ -74,3 +74,9 @@ class StarLineUnderSignal(BaseSignal):
                 'backtest_n': 1018,
             },
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        # line_value falls back to current_points_line; either may carry the line
+        return ((frame.text('recommendation') == 'UNDER')
+                & ((frame.num('line_value') >= self.MIN_LINE)
+                   | (frame.opt('current_points_line') >= self.MIN_LINE)))
@@ -17,7 +17,7 @@ Created: Session 423 (shadow mode)
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class StarterAwayOvertrendUnderSignal(BaseSignal):
@@ -59,3 +59,10 @@ class StarterAwayOvertrendUnderSignal(BaseSignal):
                 'backtest_hr': 68.1,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        line = frame.num('line_value')
+        return ((frame.text('recommendation') == 'UNDER')
+                & ~frame.flag('is_home')
+                & (line >= self.MIN_LINE) & (line <= self.MAX_LINE)
+                & (frame.opt('over_rate_last_10') > self.MIN_OVER_RATE))
@@ -11,7 +11,7 @@ Distinct from bench_under (line < 12) and star_under filter (season_avg >= 25).
 
 Created: Session 372
 """
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class StarterUnderSignal(BaseSignal):
@@ -45,3 +45,9 @@ class StarterUnderSignal(BaseSignal):
                 'backtest_hr_feb': 54.8,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        season_avg = frame.num('points_avg_season')
+        return ((frame.text('recommendation') == 'UNDER')
+                & (season_avg >= self.MIN_SEASON_AVG) & (season_avg <= self.MAX_SEASON_AVG)
+                & (frame.num('line_value') >= self.MIN_LINE))
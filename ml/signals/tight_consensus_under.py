@@ -24,7 +24,7 @@ Promote to UNDER_SIGNAL_WEIGHTS after live 2026-27 confirms N>=30 BB-level picks
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class TightConsensusUnderSignal(BaseSignal):
@@ -78,3 +78,7 @@ class TightConsensusUnderSignal(BaseSignal):
                 ),
             },
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'UNDER')
+                & (frame.opt('book_count_current') >= self.MIN_BOOKS))
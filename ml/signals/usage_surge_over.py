@@ -10,7 +10,7 @@ Created: Session 411
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class UsageSurgeOverSignal(BaseSignal):
@@ -48,3 +48,8 @@ class UsageSurgeOverSignal(BaseSignal):
                 'line_value': round(line, 1),
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        return ((frame.text('recommendation') == 'OVER')
+                & (frame.num('line_value') >= self.MIN_LINE)
+                & (frame.num('usage_rate_l5') >= self.MIN_USAGE))
@@ -8,7 +8,7 @@ Created: Session 374
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class VolatileScoringOverSignal(BaseSignal):
@@ -52,3 +52,10 @@ class VolatileScoringOverSignal(BaseSignal):
                 'backtest_hr': 81.5,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        line = frame.num('line_value')
+        std = frame.num('points_std_last_10')
+        return ((frame.text('recommendation') == 'OVER')
+                & (line >= self.MIN_LINE) & (std > 0)
+                & (std / line >= self.MIN_CV))
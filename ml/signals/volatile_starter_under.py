@@ -16,7 +16,10 @@ Created: Session 422c (shadow mode)
 """
 
 from typing import Dict, Optional
-from ml.signals.base_signal import BaseSignal, SignalResult
+
+import numpy as np
+
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
 
 
 class VolatileStarterUnderSignal(BaseSignal):
@@ -59,3 +62,10 @@ class VolatileStarterUnderSignal(BaseSignal):
                 'backtest_hr': 65.5,
             }
         )
+
+    def vector_mask(self, frame: SignalFrame):
+        line = frame.num('line_value')
+        return ((frame.text('recommendation') == 'UNDER')
+                & (line >= self.MIN_LINE) & (line <= self.MAX_LINE)
+                & (frame.num('points_std_last_10') >= self.MIN_STD)
+                & (np.abs(frame.num('edge')) >= self.MIN_EDGE))
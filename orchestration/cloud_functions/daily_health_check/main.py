@@ -12,9 +12,15 @@ This function performs comprehensive health checks:
 
 Results are sent to Slack and logged to Cloud Logging.
 
-Version: 1.4 - Added GCS export freshness monitoring
+Checks run concurrently on a CanaryRunner (shared/utils/canary_runner.py).
+The prediction checks for today share one scan of player_prop_predictions.
+Per-check latency and bytes billed are logged as [CANARY_TIMING] and returned
+in the response as check_stats. Set CANARY_RUNNER_MODE=serial to run them one
+at a time.
+
+Version: 1.5 - Concurrent checks with shared scans
 Created: 2026-01-19
-Updated: 2026-02-25
+Updated: 2026-10-16
 """
 
 import functions_framework
@@ -28,6 +34,7 @@ from google.cloud import firestore, bigquery
 from google.api_core.exceptions import GoogleAPIError
 from google.cloud import storage as cloud_storage
 from shared.clients.bigquery_pool import get_bigquery_client
+from shared.utils.canary_runner import CanaryRunner, MeteredClient, ScanSpec, render_source
 from shared.utils.slack_retry import send_slack_webhook_with_retry
 
 # Configure logging
@@ -74,7 +81,18 @@ SERVICES = [
 
 # Initialize clients
 db = firestore.Client()
-bq = get_bigquery_client(project_id=PROJECT_ID)
+# Metered so the CanaryRunner can attribute each check's jobs and bytes billed
+bq = MeteredClient(get_bigquery_client(project_id=PROJECT_ID))
+
+
+def _predictions_scan(game_date: str) -> ScanSpec:
+    """The player_prop_predictions read shared by the per-date prediction checks."""
+    return ScanSpec(
+        table=f"{PROJECT_ID}.nba_predictions.player_prop_predictions",
+        start=f"'{game_date}'",
+        end=f"'{game_date}'",
+        columns=('system_id', 'is_active'),
+    )
 
 
 class HealthCheckResult:
@@ -245,14 +263,16 @@ def check_grading_freshness() -> Dict:
         return {'recent_graded': -1, 'status': 'error', 'message': str(e)}
 
 
-def check_predictions(game_date: str) -> Tuple[str, str]:
-    """Check if predictions exist for a date."""
+def check_predictions(game_date: str, source: Optional[str] = None) -> Tuple[str, str]:
+    """Check if predictions exist for a date.
+
+    source: shared scan of the date's predictions (see _predictions_scan)
+    """
     try:
-        query = f"""
+        query = render_source("""
             SELECT COUNT(*) as count
-            FROM `{PROJECT_ID}.nba_predictions.player_prop_predictions`
-            WHERE game_date = '{game_date}'
-        """
+            FROM {source}
+        """, source or _predictions_scan(game_date).inline_source())
 
         query_job = bq.query(query)
         results = list(query_job.result())
@@ -880,7 +900,7 @@ def send_slack_notification(results: HealthCheckResult):
         logger.warning("SLACK_WEBHOOK_URL not configured, skipping daily summary")
 
 
-def check_enabled_models_producing(game_date: str) -> Tuple[str, str]:
+def check_enabled_models_producing(game_date: str, source: Optional[str] = None) -> Tuple[str, str]:
     """Session 474: Detect enabled registry models that are NOT producing predictions.
 
     The inverse of check_model_registry_consistency (which catches unregistered models
@@ -888,6 +908,9 @@ def check_enabled_models_producing(game_date: str) -> Tuple[str, str]:
     registry but silently absent from actual predictions — indicating stale model cache
     in the prediction worker.
 
+    Args:
+        source: shared scan of the date's predictions (see _predictions_scan)
+
     Returns:
         Tuple of (status, message)
     """
@@ -903,7 +926,7 @@ def check_enabled_models_producing(game_date: str) -> Tuple[str, str]:
         if not games_result or games_result[0].game_count == 0:
             return ('pass', f'No games scheduled for {game_date} — skipping model coverage check')
 
-        query = f"""
+        query = render_source(f"""
         WITH enabled_models AS (
           SELECT model_id
           FROM `{PROJECT_ID}.nba_predictions.model_registry`
@@ -911,15 +934,14 @@ def check_enabled_models_producing(game_date: str) -> Tuple[str, str]:
         ),
         predicting_models AS (
           SELECT DISTINCT system_id
-          FROM `{PROJECT_ID}.nba_predictions.player_prop_predictions`
-          WHERE game_date = '{game_date}'
-            AND is_active = TRUE
+          FROM {{source}}
+          WHERE is_active = TRUE
         )
         SELECT e.model_id
         FROM enabled_models e
         LEFT JOIN predicting_models p ON e.model_id = p.system_id
         WHERE p.system_id IS NULL
-        """
+        """, source or _predictions_scan(game_date).inline_source())
         results = list(bq.query(query).result())
         silent = [row.model_id for row in results]
 
@@ -938,22 +960,24 @@ def check_enabled_models_producing(game_date: str) -> Tuple[str, str]:
         return ('warn', f'Check failed: {e}')
 
 
-def check_model_registry_consistency(game_date: str) -> Tuple[str, str]:
+def check_model_registry_consistency(game_date: str, source: Optional[str] = None) -> Tuple[str, str]:
     """Session 391: Detect prediction system_ids that aren't in model_registry.
 
     Hardcoded models in worker.py bypass registry controls. This check compares
     today's prediction output against the registry to catch unregistered models
     producing predictions (e.g., catboost_v12/v9 legacy models).
 
+    Args:
+        source: shared scan of the date's predictions (see _predictions_scan)
+
     Returns:
         Tuple of (status, message)
     """
     try:
-        query = f"""
+        query = render_source(f"""
         WITH prediction_models AS (
           SELECT DISTINCT system_id
-          FROM `{PROJECT_ID}.nba_predictions.player_prop_predictions`
-          WHERE game_date = '{game_date}'
+          FROM {{source}}
         ),
         registry_models AS (
           SELECT DISTINCT model_id
@@ -965,7 +989,7 @@ def check_model_registry_consistency(game_date: str) -> Tuple[str, str]:
         FROM prediction_models p
         LEFT JOIN registry_models r ON p.system_id = r.model_id
         WHERE r.model_id IS NULL
-        """
+        """, source or _predictions_scan(game_date).inline_source())
         results = list(bq.query(query).result())
         unregistered = [row.system_id for row in results]
 
@@ -982,6 +1006,27 @@ def check_model_registry_consistency(game_date: str) -> Tuple[str, str]:
         return ('warn', f'Check failed: {e}')
 
 
+def check_signal_canary(game_date: str) -> Tuple[str, str]:
+    """Session 404+: Flag signals that stopped firing (DEAD) or are fading (DEGRADING)."""
+    try:
+        from ml.signals.signal_health import check_signal_firing_canary
+        canary_alerts = check_signal_firing_canary(bq, game_date)
+        dead = [a for a in canary_alerts if a['firing_status'] == 'DEAD']
+        degrading = [a for a in canary_alerts if a['firing_status'] == 'DEGRADING']
+
+        if dead:
+            dead_names = ', '.join(a['signal_tag'] for a in dead)
+            return ('fail', f"{len(dead)} DEAD signal(s): {dead_names}")
+        elif degrading:
+            deg_names = ', '.join(a['signal_tag'] for a in degrading)
+            return ('warn', f"{len(degrading)} DEGRADING signal(s): {deg_names}")
+        else:
+            return ('pass', "All signals firing normally")
+    except Exception as e:
+        logger.warning(f"Signal canary check failed: {e}")
+        return ('warn', f"Check failed: {e}")
+
+
 @functions_framework.http
 def daily_health_check(request):
     """
@@ -1000,128 +1045,82 @@ def daily_health_check(request):
     yesterday = (datetime.now(timezone.utc) - timedelta(days=1)).strftime('%Y-%m-%d')
     today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
 
-    # ========================================================================
-    # CHECK 1: Service Health Endpoints
-    # ========================================================================
-    logger.info("Checking service health endpoints...")
+    # All checks are independent: run them concurrently, then report in order.
+    # The three per-date prediction checks share one scan of today's predictions.
+    runner = CanaryRunner(bq, name='daily_health_check')
+    predictions_scan = _predictions_scan(today)
+
+    def _on_error(e: Exception) -> Tuple[str, str]:
+        return ('warn', f'Check failed: {str(e)[:100]}')
 
+    # CHECK 1: Service Health Endpoints
     for service in SERVICES:
-        status, message = check_service_health(service)
-        results.add(f"Service: {service}", status, message)
+        runner.add(f"Service: {service}",
+                   lambda _client, service=service: check_service_health(service), on_error=_on_error)
 
-    # ========================================================================
     # CHECK 2: Pipeline Execution Status
-    # ========================================================================
-    logger.info(f"Checking pipeline execution for {yesterday}...")
+    runner.add(f"Phase 3→4 ({yesterday})", lambda _client: check_phase3_completion(yesterday), on_error=_on_error)
+    runner.add(f"Phase 4→5 ({yesterday})", lambda _client: check_phase4_completion(yesterday), on_error=_on_error)
 
-    status, message = check_phase3_completion(yesterday)
-    results.add(f"Phase 3→4 ({yesterday})", status, message)
-
-    status, message = check_phase4_completion(yesterday)
-    results.add(f"Phase 4→5 ({yesterday})", status, message)
-
-    # ========================================================================
     # CHECK 3: Today's Predictions
-    # ========================================================================
-    logger.info(f"Checking predictions for {today}...")
-
-    status, message = check_predictions(today)
-    results.add(f"Predictions ({today})", status, message)
+    runner.add(f"Predictions ({today})",
+               lambda _client, source: check_predictions(today, source=source),
+               scan=predictions_scan, on_error=_on_error)
 
-    # ========================================================================
     # CHECK 4: Game Completeness
-    # ========================================================================
-    logger.info(f"Checking game completeness for {yesterday}...")
-
-    status, message = check_game_completeness(yesterday)
-    results.add(f"Game Completeness ({yesterday})", status, message)
+    runner.add(f"Game Completeness ({yesterday})",
+               lambda _client: check_game_completeness(yesterday), on_error=_on_error)
 
-    # ========================================================================
     # CHECK 4b: Grading Freshness
-    # ========================================================================
-    logger.info("Checking grading freshness...")
+    runner.add("Grading Freshness", lambda _client: check_grading_freshness(),
+               on_error=lambda e: {'status': 'error', 'message': str(e)})
 
-    grading_freshness = check_grading_freshness()
-    results.add(
-        "Grading Freshness",
-        grading_freshness['status'] if grading_freshness['status'] in ('warn', 'error') else 'pass',
-        grading_freshness['message']
-    )
-
-    # ========================================================================
     # CHECK 5: BigQuery Quota Usage (prevent cascading failures)
-    # ========================================================================
-    logger.info("Checking BigQuery quota usage...")
-
-    status, message = check_bigquery_quota()
-    results.add("BigQuery Quota", status, message)
+    runner.add("BigQuery Quota", lambda _client: check_bigquery_quota(), on_error=_on_error)
 
-    # ========================================================================
     # CHECK 6: Meta-Monitoring (monitor the monitors)
-    # ========================================================================
-    logger.info("Checking monitoring system freshness...")
-
-    meta_checks = check_monitoring_freshness()
-    for check_name, status, message in meta_checks:
-        results.add(check_name, status, message)
+    runner.add("Meta-Monitoring", lambda _client: check_monitoring_freshness(),
+               on_error=lambda e: [('Meta-Monitoring', *_on_error(e))])
 
-    # ========================================================================
     # CHECK 7: Completion Tracking Staleness
-    # ========================================================================
-    logger.info("Checking completion tracking staleness...")
+    runner.add("Completion Tracking", lambda _client: check_completion_tracking_staleness(), on_error=_on_error)
 
-    status, message = check_completion_tracking_staleness()
-    results.add("Completion Tracking", status, message)
-
-    # ========================================================================
     # CHECK 8: Model Registry Consistency (Session 391)
-    # ========================================================================
-    logger.info("Checking model registry consistency...")
+    runner.add("Model Registry Consistency",
+               lambda _client, source: check_model_registry_consistency(today, source=source),
+               scan=predictions_scan, on_error=_on_error)
 
-    status, message = check_model_registry_consistency(today)
-    results.add("Model Registry Consistency", status, message)
-
-    # ========================================================================
     # CHECK 8b: Enabled Models Actually Producing (Session 474)
-    # ========================================================================
-    logger.info("Checking enabled models are producing predictions...")
-
-    status, message = check_enabled_models_producing(today)
-    results.add("Model Coverage (enabled→predicting)", status, message)
+    runner.add("Model Coverage (enabled→predicting)",
+               lambda _client, source: check_enabled_models_producing(today, source=source),
+               scan=predictions_scan, on_error=_on_error)
 
-    # ========================================================================
     # CHECK 9: GCS Export Freshness
-    # ========================================================================
-    logger.info("Checking GCS export freshness...")
-
-    export_checks = check_export_freshness()
-    for check_name, status, message in export_checks:
-        results.add(check_name, status, message)
+    runner.add("GCS Export Freshness", lambda _client: check_export_freshness(),
+               on_error=lambda e: [('GCS Export Freshness', *_on_error(e))])
 
-    # ========================================================================
     # CHECK 10: Signal Firing Canary (Session 404+)
-    # ========================================================================
-    logger.info("Checking signal firing status...")
+    runner.add("Signal Canary", lambda _client: check_signal_canary(today), on_error=_on_error)
 
-    try:
-        from ml.signals.signal_health import check_signal_firing_canary
-        canary_alerts = check_signal_firing_canary(bq, today)
-        dead = [a for a in canary_alerts if a['firing_status'] == 'DEAD']
-        degrading = [a for a in canary_alerts if a['firing_status'] == 'DEGRADING']
+    logger.info(f"Running {len(runner.checks)} checks (yesterday={yesterday}, today={today})...")
+    outcomes = runner.run()
 
-        if dead:
-            dead_names = ', '.join(a['signal_tag'] for a in dead)
-            results.add("Signal Canary", "fail",
-                        f"{len(dead)} DEAD signal(s): {dead_names}")
-        elif degrading:
-            deg_names = ', '.join(a['signal_tag'] for a in degrading)
-            results.add("Signal Canary", "warn",
-                        f"{len(degrading)} DEGRADING signal(s): {deg_names}")
+    # ========================================================================
+    # Collect results in check order
+    # ========================================================================
+    for name, outcome in outcomes.items():
+        if name == "Grading Freshness":
+            results.add(
+                name,
+                outcome['status'] if outcome['status'] in ('warn', 'error') else 'pass',
+                outcome['message']
+            )
+        elif name in ("Meta-Monitoring", "GCS Export Freshness"):
+            for check_name, status, message in outcome:
+                results.add(check_name, status, message)
         else:
-            results.add("Signal Canary", "pass", "All signals firing normally")
-    except Exception as e:
-        logger.warning(f"Signal canary check failed: {e}")
-        results.add("Signal Canary", "warn", f"Check failed: {e}")
+            status, message = outcome
+            results.add(name, status, message)
 
     # ========================================================================
     # Send Results
@@ -1144,6 +1143,7 @@ def daily_health_check(request):
         'failed': results.failed,
         'critical': results.critical,
         'checks': results.checks,
+        'check_stats': runner.summary(),
         'timestamp': datetime.now(timezone.utc).isoformat()
     }, 200  # Always return 200: this is a reporter, not a gatekeeper
 
@@ -42,6 +42,11 @@ Additional batch fields for subcollection mode:
   - completed_count: int (counter, replaces array length)
   - total_predictions_subcoll: int (subcollection total)
 
+Sharded completions (ENABLE_SHARDED_COMPLETIONS=true):
+Collection: prediction_batches/{batch_id}/completion_shards
+  - Completions coalesced per coordinator instance and spread over N shard
+    documents instead of one hot batch document (see completion_tracker.py)
+
 Migration Strategy:
 1. Dual-write mode: Write to both array AND subcollection (default)
 2. Validate consistency between both structures
@@ -70,6 +75,8 @@ from shared.utils.firestore_retry import (
     retry_firestore_critical,
 )
 
+from predictions.coordinator.completion_tracker import ShardedCompletionTracker
+
 # Add path for slack utilities (use relative path for Docker/cloud compatibility)
 _current_dir = os.path.dirname(os.path.abspath(__file__))
 _repo_root = os.path.dirname(os.path.dirname(_current_dir))
@@ -206,11 +213,25 @@ class BatchStateManager:
         self.dual_write_mode = os.getenv('DUAL_WRITE_MODE', 'true').lower() == 'true'
         self.use_subcollection_reads = os.getenv('USE_SUBCOLLECTION_READS', 'false').lower() == 'true'
 
+        # Sharded, write-coalescing completion counters (see completion_tracker.py).
+        # Takes precedence over the array/subcollection modes for completions.
+        self.sharded_completions = os.getenv('ENABLE_SHARDED_COMPLETIONS', 'false').lower() == 'true'
+        self.completion_tracker: Optional[ShardedCompletionTracker] = None
+        if self.sharded_completions:
+            self.completion_tracker = ShardedCompletionTracker(
+                self.collection,
+                self.db,
+                num_shards=int(os.getenv('COMPLETION_SHARDS', '16')),
+                coalesce_seconds=float(os.getenv('COMPLETION_COALESCE_MS', '50')) / 1000.0,
+                max_group=int(os.getenv('COMPLETION_MAX_GROUP', '200')),
+            )
+
         logger.info(
             f"BatchStateManager initialized for project: {project_id} "
             f"(subcollection_enabled={self.enable_subcollection}, "
             f"dual_write={self.dual_write_mode}, "
-            f"subcollection_reads={self.use_subcollection_reads})"
+            f"subcollection_reads={self.use_subcollection_reads}, "
+            f"sharded_completions={self.sharded_completions})"
         )
 
     @retry_on_firestore_error(max_attempts=3, base_delay=1.0)
@@ -273,7 +294,10 @@ class BatchStateManager:
             logger.warning(f"Batch state not found: {batch_id}")
             return None
 
-        return BatchState.from_firestore_dict(doc.to_dict())
+        state = BatchState.from_firestore_dict(doc.to_dict())
+        if self.completion_tracker:
+            state.completed_players, state.total_predictions = self.completion_tracker.get_totals(batch_id)
+        return state
 
     @retry_firestore_critical
     def record_completion(
@@ -312,6 +336,9 @@ class BatchStateManager:
             True if batch is now complete, False otherwise
         """
         try:
+            if self.completion_tracker:
+                return self._record_completion_sharded(batch_id, player_lookup, predictions_count)
+
             doc_ref = self.collection.document(batch_id)
 
             # Lazy-load Firestore helpers
@@ -403,6 +430,37 @@ class BatchStateManager:
             # Non-fatal - batch can continue
             return False
 
+    def _record_completion_sharded(
+        self,
+        batch_id: str,
+        player_lookup: str,
+        predictions_count: int
+    ) -> bool:
+        """
+        Record a completion in the sharded counters (coalesced group commit).
+
+        Returns True for exactly one completion per batch: the one whose group
+        commit first took the batch to expected_players (or stall-completed it).
+        """
+        result = self.completion_tracker.record(batch_id, player_lookup, predictions_count)
+        logger.info(f"Recorded completion for {player_lookup} in batch {batch_id} (sharded)")
+
+        if result.is_complete:
+            return True
+
+        completed, expected = result.completed, result.expected
+        completion_pct = (completed / expected * 100) if expected > 0 else 0
+        logger.debug(f"Batch {batch_id} progress: {completed}/{expected} ({completion_pct:.1f}%)")
+
+        # Someone else already completed it; otherwise same stall rule as the legacy path
+        if completed < expected and completion_pct >= 95.0:
+            return self.check_and_complete_stalled_batch(
+                batch_id=batch_id,
+                stall_threshold_minutes=10,
+                min_completion_pct=95.0
+            )
+        return False
+
     @retry_firestore_transaction
     def record_failure(
         self,
@@ -674,6 +732,9 @@ _Check Cloud Logging for detailed error traces._"""
         Returns:
             List of player_lookup strings
         """
+        if self.completion_tracker:
+            return self.completion_tracker.get_totals(batch_id)[0]
+
         if self.enable_subcollection and self.use_subcollection_reads:
             # NEW: Read from subcollection
             logger.debug(f"Reading completed players from subcollection for {batch_id}")
@@ -708,7 +769,9 @@ _Check Cloud Logging for detailed error traces._"""
 
         data = batch_doc.to_dict()
 
-        if self.enable_subcollection and self.use_subcollection_reads:
+        if self.completion_tracker:
+            completed_count = len(self.completion_tracker.get_totals(batch_id)[0])
+        elif self.enable_subcollection and self.use_subcollection_reads:
             # NEW: Use counter
             completed_count = data.get('completed_count', 0)
         else:
@@ -879,6 +942,11 @@ _Check Cloud Logging for detailed error traces._"""
                     f"force-completing (max_batch_age={max_batch_age_minutes} min)"
                 )
 
+                # Sharded mode: only the instance that creates the completion marker proceeds
+                if self.completion_tracker and not self.completion_tracker.claim_completion(
+                        batch_id, completed, expected, reason='timeout'):
+                    return False
+
                 _, _, SERVER_TIMESTAMP = _get_firestore_helpers()
                 doc_ref.update({
                     'is_complete': True,
@@ -932,6 +1000,10 @@ _Check Cloud Logging for detailed error traces._"""
             f"marking complete with partial results"
         )
 
+        if self.completion_tracker and not self.completion_tracker.claim_completion(
+                batch_id, completed, expected, reason='stalled'):
+            return False
+
         _, _, SERVER_TIMESTAMP = _get_firestore_helpers()
 
         doc_ref.update({
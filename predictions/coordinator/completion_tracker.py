@@ -0,0 +1,243 @@
+"""
+Sharded Completion Tracker - Write-coalescing batch completion counting
+
+BatchStateManager.record_completion() writes the batch document (or runs a
+dual-write transaction over it) for every player completion. When hundreds
+of workers finish together, that one document becomes a write hot spot:
+contention, aborted transactions, @retry_firestore_critical retries and a
+long completion-handling tail.
+
+This tracker spreads completions over N counter shards and coalesces them
+inside each coordinator instance:
+
+Firestore Schema:
+Collection: prediction_batches/{batch_id}/completion_shards
+Document ID: shard_{NN}   (NN = crc32(player_lookup) % num_shards)
+Fields:
+  - players: list of str (ArrayUnion - redelivered events do not double count)
+  - total_predictions: int (Increment)
+  - updated_at: timestamp
+
+Collection: prediction_batches/{batch_id}/completion_state
+Document ID: complete     (created exactly once, by whoever detects completion)
+
+Group commit:
+- The first completion in a window becomes the group leader, waits up to
+  ``coalesce_seconds`` (or until ``max_group`` completions arrive), then
+  writes the whole group as ONE WriteBatch per batch: one ArrayUnion per
+  touched shard plus one ``updated_at`` touch of the batch document.
+- Every caller in the group blocks until that commit lands, so a Pub/Sub
+  push is still only acked after its completion is durable.
+
+Exactly-once completion:
+- After committing, the leader sums the shards. If completed >= expected it
+  tries to create the ``completion_state/complete`` marker; Firestore's
+  create() fails with AlreadyExists for everyone but the first caller
+  (across all coordinator instances), so exactly one record() call returns
+  True and triggers consolidation.
+
+Enabled by ENABLE_SHARDED_COMPLETIONS=true (see BatchStateManager).
+"""
+
+import logging
+import threading
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _get_firestore_helpers():
+    """Lazy-load Firestore helper functions."""
+    from google.cloud.firestore import ArrayUnion, Increment, SERVER_TIMESTAMP
+    return ArrayUnion, Increment, SERVER_TIMESTAMP
+
+
+def _already_exists_error():
+    from google.api_core.exceptions import AlreadyExists
+    return AlreadyExists
+
+
+class CompletionResult(NamedTuple):
+    """Outcome of one recorded completion."""
+    is_complete: bool   # True for exactly one caller per batch
+    completed: int      # Distinct players completed after the group commit
+    expected: int
+
+
+@dataclass
+class _Group:
+    """Completions coalesced into one commit."""
+    events: List[Tuple[str, str, int]] = field(default_factory=list)
+    full: threading.Event = field(default_factory=threading.Event)
+    done: threading.Event = field(default_factory=threading.Event)
+    results: Dict[str, CompletionResult] = field(default_factory=dict)
+    winners: Dict[str, int] = field(default_factory=dict)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+    error: Optional[BaseException] = None
+
+
+class ShardedCompletionTracker:
+    """
+    Records player completions into sharded counters with group commit.
+
+    Usage:
+        tracker = ShardedCompletionTracker(db.collection('prediction_batches'), db)
+        result = tracker.record(batch_id, 'lebron-james', predictions_count=25)
+        if result.is_complete:
+            publish_batch_summary_from_firestore(batch_id)
+    """
+
+    SHARD_COLLECTION = 'completion_shards'
+    STATE_COLLECTION = 'completion_state'
+    COMPLETE_MARKER = 'complete'
+
+    def __init__(self, collection, db, num_shards: int = 16,
+                 coalesce_seconds: float = 0.05, max_group: int = 200):
+        """
+        Args:
+            collection: prediction_batches collection reference
+            db: Firestore client (for WriteBatch)
+            num_shards: Counter shards per batch
+            coalesce_seconds: How long a group leader waits for more completions
+            max_group: Flush early once this many completions are pending
+        """
+        self.collection = collection
+        self.db = db
+        self.num_shards = max(1, num_shards)
+        self.coalesce_seconds = coalesce_seconds
+        self.max_group = max(1, max_group)
+        self._lock = threading.Lock()
+        self._pending: Optional[_Group] = None
+        self.commits = 0
+
+    def shard_for(self, player_lookup: str) -> int:
+        """Stable shard index (same player -> same shard on every instance)."""
+        return zlib.crc32(player_lookup.encode('utf-8')) % self.num_shards
+
+    def _shards(self, batch_id: str):
+        return self.collection.document(batch_id).collection(self.SHARD_COLLECTION)
+
+    def record(self, batch_id: str, player_lookup: str, predictions_count: int) -> CompletionResult:
+        """
+        Record one completion; blocks until its group commit lands.
+
+        Raises:
+            Exception: The commit for this batch failed (nothing from this call was written)
+        """
+        with self._lock:
+            group = self._pending
+            leader = group is None
+            if leader:
+                group = self._pending = _Group()
+            ticket = len(group.events)
+            group.events.append((batch_id, player_lookup, predictions_count))
+            if len(group.events) >= self.max_group:
+                self._pending = None
+                group.full.set()
+
+        if leader:
+            group.full.wait(self.coalesce_seconds)
+            with self._lock:
+                if self._pending is group:
+                    self._pending = None
+            try:
+                self._flush(group)
+            except BaseException as e:
+                group.error = e
+            finally:
+                group.done.set()
+        else:
+            group.done.wait()
+
+        error = group.error or group.errors.get(batch_id)
+        if error is not None:
+            raise error
+        result = group.results[batch_id]
+        is_winner = group.winners.get(batch_id) == ticket
+        return result._replace(is_complete=is_winner)
+
+    def _flush(self, group: _Group) -> None:
+        ArrayUnion, Increment, SERVER_TIMESTAMP = _get_firestore_helpers()
+
+        by_batch: Dict[str, Dict[int, List[Tuple[str, int]]]] = defaultdict(lambda: defaultdict(list))
+        last_ticket: Dict[str, int] = {}
+        for ticket, (batch_id, player_lookup, count) in enumerate(group.events):
+            by_batch[batch_id][self.shard_for(player_lookup)].append((player_lookup, count))
+            last_ticket[batch_id] = ticket
+
+        # One WriteBatch per batch: a missing batch document fails only its own events
+        errors = group.errors
+        for batch_id, shards in by_batch.items():
+            try:
+                write = self.db.batch()
+                for shard, events in shards.items():
+                    write.set(self._shards(batch_id).document(f"shard_{shard:02d}"), {
+                        'players': ArrayUnion(sorted({player for player, _ in events})),
+                        'total_predictions': Increment(sum(count for _, count in events)),
+                        'updated_at': SERVER_TIMESTAMP,
+                    }, merge=True)
+                # Stall detection reads updated_at: one touch per group, not per player
+                write.update(self.collection.document(batch_id), {'updated_at': SERVER_TIMESTAMP})
+                write.commit()
+                self.commits += 1
+            except Exception as e:
+                errors[batch_id] = e
+                continue
+
+            completed, expected = self._count(batch_id)
+            group.results[batch_id] = CompletionResult(False, completed, expected)
+            if expected and completed >= expected and self.claim_completion(batch_id, completed, expected):
+                group.winners[batch_id] = last_ticket[batch_id]
+
+            logger.debug(
+                f"Committed {sum(len(e) for e in shards.values())} completions for {batch_id} "
+                f"({len(shards)} shards): {completed}/{expected}"
+            )
+
+        for batch_id, error in errors.items():
+            logger.error(f"Completion group commit failed for {batch_id}: {error}", exc_info=True)
+
+    def _count(self, batch_id: str) -> Tuple[int, int]:
+        """(distinct completed players, expected players) for a batch."""
+        completed = sum(len(doc.to_dict().get('players', [])) for doc in self._shards(batch_id).stream())
+        snapshot = self.collection.document(batch_id).get()
+        expected = snapshot.to_dict().get('expected_players', 0) if snapshot.exists else 0
+        return completed, expected
+
+    def claim_completion(self, batch_id: str, completed: int = 0, expected: int = 0,
+                         reason: str = 'all_players_complete') -> bool:
+        """
+        Mark the batch complete if nobody has yet.
+
+        Returns:
+            True for exactly one caller per batch, across coordinator instances
+        """
+        _, _, SERVER_TIMESTAMP = _get_firestore_helpers()
+        marker = self.collection.document(batch_id).collection(self.STATE_COLLECTION).document(
+            self.COMPLETE_MARKER
+        )
+        try:
+            marker.create({'completed': completed, 'expected': expected,
+                           'reason': reason, 'created_at': SERVER_TIMESTAMP})
+        except _already_exists_error():
+            return False
+
+        self.collection.document(batch_id).update({
+            'is_complete': True,
+            'completion_time': SERVER_TIMESTAMP,
+        })
+        logger.info(f"🎉 Batch {batch_id} complete! ({completed}/{expected} players, {reason})")
+        return True
+
+    def get_totals(self, batch_id: str) -> Tuple[List[str], int]:
+        """(completed players, total predictions) summed over shards."""
+        players: List[str] = []
+        total = 0
+        for doc in self._shards(batch_id).stream():
+            data = doc.to_dict()
+            players.extend(data.get('players', []))
+            total += data.get('total_predictions', 0)
+        return players, total
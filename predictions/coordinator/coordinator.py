@@ -74,6 +74,9 @@ from predictions.coordinator.instance_manager import (
 
 # Import batch consolidator for staging table merging
 from predictions.shared.batch_staging_writer import BatchConsolidator
+from predictions.shared.staging_buffer import get_staging_store
+from predictions.shared.payload_blobs import PayloadBlobStore
+from predictions.coordinator.request_fanout import PipelinedPublisher, ReadinessPacer
 
 # Import unified publishing (lazy import to avoid cold start)
 import sys
@@ -187,6 +190,11 @@ PREDICTION_REQUEST_TOPIC = os.environ.get('PREDICTION_REQUEST_TOPIC', 'predictio
 PREDICTION_READY_TOPIC = os.environ.get('PREDICTION_READY_TOPIC', 'prediction-ready-prod')
 BATCH_SUMMARY_TOPIC = os.environ.get('BATCH_SUMMARY_TOPIC', 'prediction-batch-complete')
 
+# Line deltas (/line-update, /check-lines) are first re-scored by a worker that keeps the
+# day's prepared features resident (worker /rescore-lines). 'off' always uses the full fan-out.
+LINE_RESCORE_MODE = os.environ.get('LINE_RESCORE_MODE', 'resident').lower()
+LINE_RESCORE_TIMEOUT_SECONDS = int(os.environ.get('LINE_RESCORE_TIMEOUT_SECONDS', '60'))
+
 # Week 1: Idempotency feature flags
 ENABLE_IDEMPOTENCY_KEYS = os.environ.get('ENABLE_IDEMPOTENCY_KEYS', 'false').lower() == 'true'
 DEDUP_TTL_DAYS = int(os.environ.get('DEDUP_TTL_DAYS', '7'))
@@ -562,7 +570,9 @@ def get_batch_consolidator() -> BatchConsolidator:
     global _batch_consolidator
     if _batch_consolidator is None:
         logger.info("Initializing BatchConsolidator...")
-        _batch_consolidator = BatchConsolidator(get_bq_client(), PROJECT_ID)
+        _batch_consolidator = BatchConsolidator(
+            get_bq_client(), PROJECT_ID, staging_store=get_staging_store()
+        )
         logger.info("BatchConsolidator initialized")
     return _batch_consolidator
 
@@ -1530,8 +1540,10 @@ def start_prediction_batch():
 
         # Publish viable requests to Pub/Sub (with batch historical data if available)
         # Session 76: Include prediction_run_mode for traceability
+        # PREDICTION_CHUNK_SIZE > 1 publishes multi-player chunks scored in one model call each
         published_count = publish_prediction_requests(
-            viable_requests, batch_id, batch_historical_games, dataset_prefix, prediction_run_mode
+            viable_requests, batch_id, batch_historical_games, dataset_prefix, prediction_run_mode,
+            chunk_size=int(os.environ.get('PREDICTION_CHUNK_SIZE', '1'))
         )
 
         # Update expected_players to match actual published count (quality gate may filter most)
@@ -1819,6 +1831,8 @@ def check_lines():
     2. Players whose lines moved >= threshold since prediction was made
 
     For affected players: supersedes old predictions, generates new ones.
+    Players a worker still holds resident are re-scored in place (line
+    features only); the rest go through a normal targeted batch.
     Phase 6 re-export triggers automatically via existing event-driven flow.
 
     Request body:
@@ -1964,6 +1978,7 @@ def check_lines():
             'line_moves': len(stale_line_players),
             'total_affected': len(all_affected),
             'superseded_count': superseded_count,
+            'players_rescored': gen_result.get('players_rescored', 0),
             'requests_published': gen_result.get('requests_published', 0),
             'batch_id': batch_id,
         }), 200
@@ -1981,7 +1996,8 @@ def line_update():
 
     Called by the enrichment trigger after prop lines are added to predictions.
     V9 uses vegas_points_line (feature #25) — when a line arrives, the prediction
-    changes. Supersedes old NO_PROP_LINE predictions and generates new ones.
+    changes. Supersedes old NO_PROP_LINE predictions and generates new ones,
+    re-scoring resident players in place before falling back to a targeted batch.
 
     Request body:
     {
@@ -2048,6 +2064,7 @@ def line_update():
 
         logger.info(
             f"Line update complete: superseded={superseded_count}, "
+            f"rescored={gen_result.get('players_rescored', 0)}, "
             f"published={gen_result.get('requests_published', 0)}, "
             f"batch_id={batch_id}"
         )
@@ -2057,6 +2074,7 @@ def line_update():
             'game_date': str(game_date),
             'players': len(player_lookups),
             'superseded_count': superseded_count,
+            'players_rescored': gen_result.get('players_rescored', 0),
             'requests_published': gen_result.get('requests_published', 0),
             'batch_id': batch_id,
         }), 200
@@ -2664,6 +2682,123 @@ def _generate_predictions_for_date(
         }
 
 
+def _rescore_resident_players(
+    game_date: str,
+    requests: List[Dict],
+    reason: str,
+    prediction_run_mode: str
+) -> dict:
+    """
+    Re-score line deltas on a worker that still holds the players' features.
+
+    Posts the prediction requests to the worker's /rescore-lines endpoint, which
+    re-applies only the line-dependent features, re-runs the models on those rows
+    and stages the predictions in one write. The batch is then consolidated here
+    with one MERGE and Phase 5 completion is published so Phase 6 re-exports.
+
+    Any failure leaves every player to the full prediction path.
+
+    Returns:
+        dict with 'rescored' (player_lookups written and merged) and 'batch_id'
+    """
+    import requests as http_requests
+    from shared.config.service_urls import get_service_url, Services
+
+    result = {'rescored': [], 'batch_id': None}
+    if LINE_RESCORE_MODE == 'off' or not requests:
+        return result
+
+    start_time = time.time()
+    batch_id = f"linerescore_{game_date}_{int(time.time())}"
+    worker_url = get_service_url(Services.PREDICTION_WORKER)
+
+    # Get auth token for service-to-service call
+    try:
+        import google.auth.transport.requests
+        import google.oauth2.id_token
+        auth_request = google.auth.transport.requests.Request()
+        token = google.oauth2.id_token.fetch_id_token(auth_request, worker_url)
+    except Exception as e:
+        logger.warning(f"[LINE_RESCORE] Failed to get auth token: {e}")
+        token = None
+
+    headers = {"Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+
+    try:
+        response = http_requests.post(
+            f"{worker_url}/rescore-lines",
+            headers=headers,
+            json={
+                'game_date': game_date,
+                'batch_id': batch_id,
+                'prediction_run_mode': prediction_run_mode,
+                'players': requests,
+            },
+            timeout=LINE_RESCORE_TIMEOUT_SECONDS,
+        )
+        if response.status_code != 200:
+            logger.warning(f"[LINE_RESCORE] Worker returned {response.status_code}, using full path")
+            return result
+        body = response.json()
+    except Exception as e:
+        logger.warning(f"[LINE_RESCORE] Worker re-score failed, using full path: {e}")
+        return result
+
+    rescored = body.get('rescored') or []
+    if not rescored:
+        logger.info(
+            f"[LINE_RESCORE] No resident players on the serving worker "
+            f"(missing={len(body.get('missing') or [])}, failed={len(body.get('failed') or [])})"
+        )
+        return result
+
+    consolidation = get_batch_consolidator().consolidate_batch(batch_id=batch_id, game_date=game_date)
+    if not consolidation.success:
+        logger.error(
+            f"[LINE_RESCORE] Consolidation failed for {batch_id}: {consolidation.error_message} "
+            f"- re-predicting all {len(requests)} players through the full path"
+        )
+        return result
+
+    try:
+        calculate_daily_signals(game_date=game_date)
+    except Exception as signal_err:
+        logger.warning(f"Signal calculation failed (non-fatal): {signal_err}")
+
+    try:
+        UnifiedPubSubPublisher(project_id=PROJECT_ID).publish_completion(
+            topic='nba-phase5-predictions-complete',
+            processor_name='PredictionCoordinator',
+            phase='phase_5_predictions',
+            execution_id=batch_id,
+            correlation_id=batch_id,
+            game_date=game_date,
+            output_table='player_prop_predictions',
+            output_dataset='nba_predictions',
+            status='success',
+            record_count=len(rescored),
+            records_failed=0,
+            trigger_source='automatic',
+            duration_seconds=time.time() - start_time,
+            metadata={
+                'batch_id': batch_id,
+                'reason': reason,
+                'rescored_players': len(rescored),
+                'predictions_written': body.get('predictions_written', 0),
+            }
+        )
+    except Exception as e:
+        logger.error(f"Failed to publish Phase 5 completion: {e}", exc_info=True)
+
+    logger.info(
+        f"[LINE_RESCORE] {len(rescored)}/{len(requests)} players re-scored and merged "
+        f"({consolidation.rows_affected} rows) in {time.time() - start_time:.2f}s (batch_id={batch_id})"
+    )
+    return {'rescored': rescored, 'batch_id': batch_id}
+
+
 def _generate_predictions_for_players(
     game_date: str,
     player_lookups: List[str],
@@ -2722,6 +2857,21 @@ def _generate_predictions_for_players(
 
         logger.info(f"Filtered to {len(requests)}/{len(all_requests)} requests for target players")
 
+        # Resident re-score first: only players the worker no longer holds take the full path
+        rescore = _rescore_resident_players(game_date, requests, reason, prediction_run_mode)
+        rescored = set(rescore['rescored'])
+        if rescored:
+            requests = [r for r in requests if r.get('player_lookup') not in rescored]
+            if not requests:
+                return {
+                    'status': 'success',
+                    'requests_published': 0,
+                    'players_rescored': len(rescored),
+                    'batch_id': rescore['batch_id'],
+                    'players_found': len(rescored),
+                    'reason': reason
+                }
+
         # Create batch state in Firestore
         try:
             state_manager = get_state_manager()
@@ -2819,8 +2969,9 @@ def _generate_predictions_for_players(
         return {
             'status': 'success',
             'requests_published': published_count,
+            'players_rescored': len(rescored),
             'batch_id': batch_id,
-            'players_found': len(requests),
+            'players_found': len(requests) + len(rescored),
             'reason': reason
         }
 
@@ -3552,7 +3703,8 @@ def publish_prediction_requests(
     batch_id: str,
     batch_historical_games: Optional[Dict[str, List[Dict]]] = None,
     dataset_prefix: str = '',
-    prediction_run_mode: str = 'OVERNIGHT'
+    prediction_run_mode: str = 'OVERNIGHT',
+    chunk_size: int = 1
 ) -> int:
     """
     Publish prediction requests to Pub/Sub
@@ -3564,9 +3716,12 @@ def publish_prediction_requests(
                                 Dict mapping player_lookup -> list of historical games
         dataset_prefix: Optional dataset prefix for test isolation (e.g., "test")
         prediction_run_mode: Run mode for traceability (EARLY, OVERNIGHT, SAME_DAY, BACKFILL)
+        chunk_size: Players per Pub/Sub message. 1 (default) publishes one message per
+                    player; >1 publishes {'players': [...]} chunks that the worker scores
+                    with one model call per chunk (see predictions/worker/batch_inference.py)
 
     Returns:
-        Number of successfully published messages
+        Number of successfully published player requests
     """
     publisher = get_pubsub_publisher()
     topic_path = publisher.topic_path(PROJECT_ID, PREDICTION_REQUEST_TOPIC)
@@ -3575,60 +3730,112 @@ def publish_prediction_requests(
     failed_count = 0
     publish_start_time = time.time()
 
-    # Use heartbeat logger to track long publish operations (5-min intervals)
-    with HeartbeatLogger(f"Publishing {len(requests)} prediction requests", interval=300):
-        for request_data in requests:
-            # Add batch metadata
-            message = {
-                **request_data,
-                'batch_id': batch_id,
-                'timestamp': datetime.now().isoformat(),
-                'correlation_id': current_correlation_id or batch_id,  # Include correlation_id for tracing
-                'prediction_run_mode': prediction_run_mode  # Session 76: Track run mode for analysis
-            }
+    # Large shared payloads go to a content-addressed blob instead of every message
+    historical_games_ref = None
+    payload_store = PayloadBlobStore.from_env() if batch_historical_games else None
+    if payload_store:
+        requested = {r.get('player_lookup') for r in requests}
+        try:
+            historical_games_ref = payload_store.put(
+                {p: games for p, games in batch_historical_games.items() if p in requested}
+            )
+        except Exception as e:
+            logger.warning(f"Payload blob upload failed, inlining historical games: {e}")
 
-            # Add dataset_prefix for test isolation if specified
-            if dataset_prefix:
-                message['dataset_prefix'] = dataset_prefix
+    messages = []
+    for request_data in requests:
+        # Add batch metadata
+        message = {
+            **request_data,
+            'batch_id': batch_id,
+            'timestamp': datetime.now().isoformat(),
+            'correlation_id': current_correlation_id or batch_id,  # Include correlation_id for tracing
+            'prediction_run_mode': prediction_run_mode  # Session 76: Track run mode for analysis
+        }
 
-            # BATCH OPTIMIZATION: Include pre-loaded historical games if available
-            if batch_historical_games:
-                player_lookup = request_data.get('player_lookup')
-                if player_lookup and player_lookup in batch_historical_games:
+        # Add dataset_prefix for test isolation if specified
+        if dataset_prefix:
+            message['dataset_prefix'] = dataset_prefix
+
+        # BATCH OPTIMIZATION: Include pre-loaded historical games if available
+        if batch_historical_games:
+            player_lookup = request_data.get('player_lookup')
+            if player_lookup and player_lookup in batch_historical_games:
+                if historical_games_ref:
+                    # Shared blob: message carries a reference, worker loads it once per batch
+                    message['historical_games_ref'] = historical_games_ref
+                else:
                     # Add historical games to message (worker will use this instead of querying)
                     message['historical_games_batch'] = batch_historical_games[player_lookup]
 
-            # Publish to Pub/Sub with retry logic
-            message_bytes = json.dumps(message).encode('utf-8')
-            player_lookup = request_data.get('player_lookup', 'unknown')
-
-            if publish_with_retry(publisher, topic_path, message_bytes, player_lookup):
-                published_count += 1
+        messages.append(message)
 
-                # Rate limit: ~50 messages/second to allow worker cold-start ramp-up
-                # Session 101: Added to prevent cold start auth failures
-                # Session 171: Reduced from 0.1s to 0.02s (45s→9s for 450 players)
-                time.sleep(0.02)
+    # Group into chunks; a chunk of one is the original single-player message
+    chunk_size = max(1, chunk_size)
+    if chunk_size > 1:
+        chunks = []
+        for i in range(0, len(messages), chunk_size):
+            chunk = {
+                'players': messages[i:i + chunk_size],
+                'batch_id': batch_id,
+                'timestamp': datetime.now().isoformat(),
+                'correlation_id': current_correlation_id or batch_id,
+                'prediction_run_mode': prediction_run_mode
+            }
+            if dataset_prefix:
+                chunk['dataset_prefix'] = dataset_prefix
+            chunks.append((chunk, [m.get('player_lookup', 'unknown') for m in chunk['players']]))
+        logger.info(f"Publishing {len(messages)} requests as {len(chunks)} chunks of up to {chunk_size} players")
+    else:
+        chunks = [(m, [m.get('player_lookup', 'unknown')]) for m in messages]
+
+    def on_result(player_lookups: List[str], success: bool) -> None:
+        nonlocal published_count, failed_count
+        if success:
+            published_count += len(player_lookups)
 
-                # Log every 50 players (more frequent than heartbeat for progress visibility)
-                if published_count % 50 == 0:
-                    logger.info(f"Published {published_count}/{len(requests)} requests")
-            else:
-                failed_count += 1
+            # Log every 50 players (more frequent than heartbeat for progress visibility)
+            if published_count % 50 < len(player_lookups):
+                logger.info(f"Published {published_count}/{len(requests)} requests")
+        else:
+            failed_count += len(player_lookups)
 
-                # Mark player as failed in tracker
-                if current_tracker:
+            # Mark players as failed in tracker
+            if current_tracker:
+                for player_lookup in player_lookups:
                     current_tracker.mark_player_failed(
                         player_lookup,
                         "Pub/Sub publish failed after retries"
                     )
 
+    # Pace by worker readiness instead of a fixed sleep: starts at the old
+    # ~50 msg/s cold-start rate (Session 101/171) and speeds up as completion
+    # events show warm workers
+    tracker = current_tracker
+    pacer = ReadinessPacer.from_env(
+        readiness=lambda: len(tracker.completed_players) if tracker else 0
+    )
+    fanout = PipelinedPublisher(
+        publisher, topic_path, pacer=pacer, on_result=on_result, mode=prediction_run_mode
+    )
+
+    # Use heartbeat logger to track long publish operations (5-min intervals)
+    with HeartbeatLogger(f"Publishing {len(requests)} prediction requests", interval=300):
+        for message, player_lookups in chunks:
+            fanout.submit(json.dumps(message).encode('utf-8'), player_lookups)
+        publish_stats = fanout.drain()
+
     publish_duration = time.time() - publish_start_time
     publish_rate = published_count / publish_duration if publish_duration > 0 else 0
     logger.info(
         f"PUBLISH_METRICS: Published {published_count} requests in {publish_duration:.1f}s "
         f"({publish_rate:.1f} req/s), {failed_count} failed "
-        f"[batch={batch_id}, mode={prediction_run_mode}]"
+        f"[batch={batch_id}, mode={prediction_run_mode}, chunk_size={chunk_size}] "
+        f"latency_ms p50={publish_stats['latency_p50_ms']} p95={publish_stats['latency_p95_ms']} "
+        f"p99={publish_stats['latency_p99_ms']}, peak_in_flight={publish_stats['peak_in_flight']}, "
+        f"pacing_wait={publish_stats['pacing_wait_seconds']}s, "
+        f"blob_ref={'yes' if historical_games_ref else 'no'}",
+        extra={'publish_latency_histogram': publish_stats['latency_histogram']}
     )
 
     return published_count
@@ -0,0 +1,276 @@
+# predictions/coordinator/request_fanout.py
+
+"""
+Prediction Request Fan-Out - Pipelined Pub/Sub Publishing
+
+publish_prediction_requests() used to publish one message at a time, block
+on each publish future and sleep a fixed 20ms between messages, so a
+450-player slate spent its whole publish phase serially before the last
+worker could start. This module pipelines that phase:
+
+- PipelinedPublisher keeps up to ``max_in_flight`` publish futures
+  outstanding and reaps them as they finish (failed publishes are retried
+  with the same 1s/2s/4s backoff as publish_with_retry).
+- ReadinessPacer replaces the fixed sleep with a token bucket whose refill
+  rate follows observed worker readiness: it starts at the old ~50 msg/s
+  cold-start rate and speeds up as completion events show warm workers.
+- Publish latencies (publish call -> server ack) go to a Prometheus-style
+  histogram and are summarized (p50/p95/p99) in the PUBLISH_METRICS log.
+
+Configuration (environment):
+    PUBLISH_MAX_IN_FLIGHT       (default 100)
+    PUBLISH_BASE_RATE           msgs/s before any worker reports (default 50)
+    PUBLISH_RATE_PER_READY      extra msgs/s per completed player (default 5)
+    PUBLISH_MAX_RATE            msgs/s ceiling (default 500)
+    PUBLISH_BURST               token bucket size (default 10)
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+
+from shared.utils.prometheus_metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+# Publish call -> ack, in seconds
+PUBLISH_LATENCY_BUCKETS = [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0]
+
+publish_latency_histogram = Histogram(
+    'prediction_request_publish_seconds',
+    'Pub/Sub publish latency for prediction requests',
+    label_names=['mode'],
+    buckets=PUBLISH_LATENCY_BUCKETS,
+)
+
+
+class TokenBucket:
+    """Blocking token bucket (tokens refill continuously at ``rate`` per second)."""
+
+    def __init__(self, rate: float, burst: float,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._last = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def set_rate(self, rate: float) -> None:
+        self._refill()  # tokens earned so far accrue at the old rate
+        self.rate = rate
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available. Returns seconds waited."""
+        waited = 0.0
+        self._refill()
+        while self.tokens < 1.0 - 1e-9:  # tolerate float residue after a sleep
+            delay = (1.0 - self.tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+            self._refill()
+        self.tokens -= 1.0
+        return waited
+
+
+class ReadinessPacer:
+    """
+    Token-bucket pacing tied to worker readiness.
+
+    rate = min(max_rate, base_rate + rate_per_ready * readiness())
+
+    ``readiness`` returns how many requests workers have completed so far
+    (ProgressTracker completions); each completion is evidence of a warm
+    worker instance, so the pacer can hand out messages faster.
+    """
+
+    def __init__(self, readiness: Callable[[], int], base_rate: float = 50.0,
+                 rate_per_ready: float = 5.0, max_rate: float = 500.0, burst: float = 10.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.readiness = readiness
+        self.base_rate = base_rate
+        self.rate_per_ready = rate_per_ready
+        self.max_rate = max_rate
+        self.bucket = TokenBucket(base_rate, burst, clock=clock, sleep=sleep)
+        self.total_wait = 0.0
+
+    @classmethod
+    def from_env(cls, readiness: Callable[[], int]) -> 'ReadinessPacer':
+        return cls(
+            readiness,
+            base_rate=float(os.environ.get('PUBLISH_BASE_RATE', 50)),
+            rate_per_ready=float(os.environ.get('PUBLISH_RATE_PER_READY', 5)),
+            max_rate=float(os.environ.get('PUBLISH_MAX_RATE', 500)),
+            burst=float(os.environ.get('PUBLISH_BURST', 10)),
+        )
+
+    def current_rate(self) -> float:
+        try:
+            ready = max(0, int(self.readiness()))
+        except Exception:
+            ready = 0
+        return min(self.max_rate, self.base_rate + self.rate_per_ready * ready)
+
+    def acquire(self) -> None:
+        self.bucket.set_rate(self.current_rate())
+        self.total_wait += self.bucket.acquire()
+
+
+def percentile(data: List[float], p: int) -> float:
+    """Linear-interpolated percentile of sorted ``data`` (0.0 when empty)."""
+    if not data:
+        return 0.0
+    k = (len(data) - 1) * (p / 100.0)
+    f = int(k)
+    c = f + 1 if f < len(data) - 1 else f
+    return data[f] + (k - f) * (data[c] - data[f])
+
+
+class _InFlight:
+    __slots__ = ('future', 'message_bytes', 'label', 'players', 'attempt', 'started')
+
+    def __init__(self, future, message_bytes: bytes, label: str, players: List[str],
+                 attempt: int, started: float):
+        self.future = future
+        self.message_bytes = message_bytes
+        self.label = label
+        self.players = players
+        self.attempt = attempt
+        self.started = started
+
+
+class PipelinedPublisher:
+    """
+    Publishes messages without waiting for each ack.
+
+    Usage:
+        fanout = PipelinedPublisher(publisher, topic_path, pacer=pacer, on_result=callback)
+        for message_bytes, players in messages:
+            fanout.submit(message_bytes, players)
+        stats = fanout.drain()
+
+    ``on_result(players, success)`` is called once per message, on the
+    submitting thread, when its publish is acknowledged or finally fails.
+    """
+
+    def __init__(self, publisher, topic_path: str, max_in_flight: Optional[int] = None,
+                 pacer: Optional[ReadinessPacer] = None,
+                 on_result: Optional[Callable[[List[str], bool], None]] = None,
+                 max_retries: int = 3, result_timeout: float = 5.0, mode: str = 'OVERNIGHT',
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.publisher = publisher
+        self.topic_path = topic_path
+        self.max_in_flight = max(1, max_in_flight or int(os.environ.get('PUBLISH_MAX_IN_FLIGHT', 100)))
+        self.pacer = pacer
+        self.on_result = on_result
+        self.max_retries = max_retries
+        self.result_timeout = result_timeout
+        self.mode = mode
+        self._clock = clock
+        self._sleep = sleep
+        self._in_flight: Deque[_InFlight] = deque()
+        self.latencies: List[float] = []
+        self.published_messages = 0
+        self.failed_messages = 0
+        self.peak_in_flight = 0
+
+    def submit(self, message_bytes: bytes, players: List[str]) -> None:
+        """Pace, then publish one message; blocks only while the window is full."""
+        self._reap(block=False)
+        while len(self._in_flight) >= self.max_in_flight:
+            self._reap(block=True)
+        if self.pacer is not None:
+            self.pacer.acquire()
+        label = players[0] if len(players) == 1 else f"chunk of {len(players)} ({players[0]}...)"
+        self._publish(message_bytes, label, players, attempt=0)
+
+    def drain(self) -> Dict:
+        """Wait for every outstanding publish and return publish stats."""
+        while self._in_flight:
+            self._reap(block=True)
+        return self.stats()
+
+    def stats(self) -> Dict:
+        latencies = sorted(self.latencies)
+        return {
+            'published_messages': self.published_messages,
+            'failed_messages': self.failed_messages,
+            'peak_in_flight': self.peak_in_flight,
+            'pacing_wait_seconds': round(self.pacer.total_wait, 3) if self.pacer else 0.0,
+            'latency_p50_ms': round(percentile(latencies, 50) * 1000, 1),
+            'latency_p95_ms': round(percentile(latencies, 95) * 1000, 1),
+            'latency_p99_ms': round(percentile(latencies, 99) * 1000, 1),
+            'latency_max_ms': round(latencies[-1] * 1000, 1) if latencies else 0.0,
+            'latency_histogram': self._histogram(latencies),
+        }
+
+    @staticmethod
+    def _histogram(latencies: List[float]) -> Dict[str, int]:
+        """Cumulative bucket counts for this run (le=seconds, like the Prometheus histogram)."""
+        counts = {}
+        i = 0
+        for bound in PUBLISH_LATENCY_BUCKETS:
+            while i < len(latencies) and latencies[i] <= bound:
+                i += 1
+            counts[str(bound)] = i
+        counts['+Inf'] = len(latencies)
+        return counts
+
+    def _publish(self, message_bytes: bytes, label: str, players: List[str], attempt: int) -> None:
+        started = self._clock()
+        try:
+            future = self.publisher.publish(self.topic_path, data=message_bytes)
+        except Exception as e:
+            self._failed(_InFlight(None, message_bytes, label, players, attempt, started), e)
+            return
+        self._in_flight.append(_InFlight(future, message_bytes, label, players, attempt, started))
+        self.peak_in_flight = max(self.peak_in_flight, len(self._in_flight))
+
+    def _reap(self, block: bool) -> None:
+        """Collect finished publishes from the head of the window (oldest first)."""
+        while self._in_flight:
+            head = self._in_flight[0]
+            if not block and not head.future.done():
+                return
+            self._in_flight.popleft()
+            try:
+                head.future.result(timeout=self.result_timeout)
+            except Exception as e:
+                self._failed(head, e)
+            else:
+                latency = self._clock() - head.started
+                self.latencies.append(latency)
+                publish_latency_histogram.observe(latency, {'mode': self.mode})
+                self.published_messages += 1
+                if self.on_result:
+                    self.on_result(head.players, True)
+            if block:
+                return
+
+    def _failed(self, entry: _InFlight, error: Exception) -> None:
+        attempt = entry.attempt + 1
+        if attempt < self.max_retries:
+            delay = 2 ** entry.attempt  # 1s, 2s, 4s
+            logger.warning(
+                f"Pub/Sub publish attempt {attempt}/{self.max_retries} failed for "
+                f"{entry.label}: {error}. Retrying in {delay}s..."
+            )
+            self._sleep(delay)
+            self._publish(entry.message_bytes, entry.label, entry.players, attempt)
+            return
+        logger.error(
+            f"Pub/Sub publish failed after {self.max_retries} attempts for {entry.label}: {error}"
+        )
+        self.failed_messages += 1
+        if self.on_result:
+            self.on_result(entry.players, False)
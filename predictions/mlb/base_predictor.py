@@ -17,16 +17,29 @@ Usage:
         def predict(self, pitcher_lookup: str, features: Dict, strikeouts_line: Optional[float] = None) -> Dict:
             # Custom prediction logic
             ...
+
+Whole-slate scoring:
+    predict_many() scores a list of PredictionRequests. Model-backed systems
+    opt in by returning a FeatureContract from feature_contract() and
+    implementing _predict_matrix() and _build_prediction(); they then get
+    one model call per slate (see predictions/mlb/feature_matrix.py).
+    Everything else falls back to one predict() per request.
 """
 
 import os
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 from datetime import datetime, timedelta
 import numpy as np
 
 from predictions.mlb.config import get_config
+from predictions.mlb.feature_matrix import (
+    FeatureContract,
+    FeatureMatrixCache,
+    PredictionRequest,
+    batch_predict_enabled,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +77,12 @@ class BaseMLBPredictor(ABC):
     _il_cache = None
     _il_cache_timestamp = None
 
+    # Whole-slate contract: features passed to the model as NaN when missing
+    # (not counted as defaults), and fill values for the remaining features
+    nan_tolerant_features: frozenset = frozenset()
+    feature_defaults: Dict[str, float] = {}
+    blocked_reason = 'features missing'
+
     def __init__(
         self,
         system_id: str,
@@ -458,3 +477,149 @@ class BaseMLBPredictor(ABC):
                 - error: str (optional)
         """
         pass
+
+    # =================================================================
+    # Whole-slate scoring
+    # =================================================================
+
+    def load_model(self) -> bool:
+        """Load model artifacts. Systems without a model have nothing to load."""
+        return True
+
+    def feature_contract(self) -> Optional[FeatureContract]:
+        """Feature contract for matrix scoring, or None to score row by row."""
+        return None
+
+    def _predict_matrix(self, matrix: np.ndarray) -> np.ndarray:
+        """Raw model output for every row of a prepared feature matrix."""
+        raise NotImplementedError
+
+    def _build_prediction(
+        self,
+        pitcher_lookup: str,
+        features: Dict,
+        strikeouts_line: Optional[float],
+        raw_output: float
+    ) -> Dict:
+        """Turn one raw model output into the prediction dict."""
+        raise NotImplementedError
+
+    def _error_result(self, pitcher_lookup: str, error: str) -> Dict:
+        return {
+            'pitcher_lookup': pitcher_lookup,
+            'predicted_strikeouts': None,
+            'confidence': 0.0,
+            'recommendation': 'ERROR',
+            'system_id': self.system_id,
+            'default_feature_count': 0,
+            'error': error
+        }
+
+    def _blocked_result(
+        self,
+        pitcher_lookup: str,
+        default_feature_count: int,
+        default_features: List[str]
+    ) -> Dict:
+        """ZERO TOLERANCE: result for a pitcher with missing core features."""
+        logger.info(
+            f"[{self.system_id}] BLOCKED {pitcher_lookup}: "
+            f"{default_feature_count} {self.blocked_reason} ({default_features[:5]})"
+        )
+        return {
+            'pitcher_lookup': pitcher_lookup,
+            'predicted_strikeouts': None,
+            'confidence': 0.0,
+            'recommendation': 'BLOCKED',
+            'system_id': self.system_id,
+            'default_feature_count': default_feature_count,
+            'default_features': default_features,
+            'error': f'Blocked: {default_feature_count} {self.blocked_reason}'
+        }
+
+    def predict_many(
+        self,
+        requests: Sequence[PredictionRequest],
+        matrices: Optional[FeatureMatrixCache] = None
+    ) -> List[Dict]:
+        """
+        Score a whole slate. Results are in request order and match what
+        predict() returns for each request.
+
+        Args:
+            requests: Pitchers to score
+            matrices: Per-slate cache shared across systems (optional)
+
+        Returns:
+            list: One prediction dict per request
+        """
+        if matrices is not None:
+            cached = matrices.get_results(self, requests)
+            if cached is not None:
+                return cached
+
+        results = self._score_slate(requests, matrices or FeatureMatrixCache())
+
+        if matrices is not None:
+            matrices.set_results(self, results)
+        return results
+
+    def _predict_rows(self, requests: Sequence[PredictionRequest]) -> List[Dict]:
+        return [self.predict(r.pitcher_lookup, r.features, r.strikeouts_line) for r in requests]
+
+    def _score_slate(
+        self,
+        requests: Sequence[PredictionRequest],
+        matrices: FeatureMatrixCache
+    ) -> List[Dict]:
+        if not batch_predict_enabled() or not requests or not self.load_model():
+            return self._predict_rows(requests)
+        contract = self.feature_contract()
+        if contract is None:
+            return self._predict_rows(requests)
+
+        feature_matrix = matrices.matrix(contract, requests)
+        matrix, default_counts, default_lists = feature_matrix.model_input(
+            self.nan_tolerant_features, self.feature_defaults
+        )
+
+        results: List[Optional[Dict]] = [None] * len(requests)
+        ready = []
+        for i, request in enumerate(requests):
+            if feature_matrix.errors[i] is not None:
+                logger.error(
+                    f"[{self.system_id}] Error preparing features for "
+                    f"{request.pitcher_lookup}: {feature_matrix.errors[i]}"
+                )
+                results[i] = self._error_result(request.pitcher_lookup, 'Failed to prepare features')
+            elif default_counts[i] > 0:
+                results[i] = self._blocked_result(
+                    request.pitcher_lookup, int(default_counts[i]), default_lists[i]
+                )
+            else:
+                ready.append(i)
+
+        if not ready:
+            return results
+
+        try:
+            outputs = np.asarray(self._predict_matrix(matrix[ready]), dtype=float)
+        except Exception as e:
+            # Re-run row by row so one bad row only fails itself
+            logger.warning(f"[{self.system_id}] Slate prediction failed, scoring per row: {e}")
+            for i in ready:
+                results[i] = self.predict(
+                    requests[i].pitcher_lookup, requests[i].features, requests[i].strikeouts_line
+                )
+            return results
+
+        for output, i in zip(outputs, ready):
+            request = requests[i]
+            results[i] = self._build_prediction(
+                request.pitcher_lookup, request.features, request.strikeouts_line, float(output)
+            )
+
+        logger.info(
+            f"[{self.system_id}] Scored {len(ready)}/{len(requests)} pitchers in one model call"
+        )
+        return results
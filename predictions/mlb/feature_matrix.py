@@ -0,0 +1,209 @@
+# predictions/mlb/feature_matrix.py
+"""
+Whole-Slate Feature Matrices for MLB Predictors
+
+The MLB batch endpoints used to call predict() once per pitcher per system:
+every call normalized the raw feature dict, built a 1-row vector and paid a
+full model invocation. For a 15-game slate and six systems that is ~180
+single-row model calls, most of them on the same handful of feature
+contracts.
+
+This module turns the slate into one aligned matrix per feature contract:
+
+    FeatureContract  - name mapping + column order a model was trained on
+    FeatureMatrix    - slate x contract matrix, NaN where a value is missing
+    FeatureMatrixCache - builds each contract's matrix once per slate, so
+                         CatBoost V2 / LightGBM / XGBoost (same 36-feature
+                         contract) share one matrix, and ensemble components
+                         reuse the results their standalone systems computed
+
+Predictors then score the whole slate with a single model call via
+BaseMLBPredictor.predict_many(). Missing-feature accounting (BLOCKED rows)
+and all post-processing (edge, confidence, red flags) are unchanged and
+stay per row.
+
+Usage:
+    from predictions.mlb.feature_matrix import FeatureMatrixCache, PredictionRequest
+
+    requests = [PredictionRequest(lookup, features, features.get('strikeouts_line'))
+                for lookup, features in features_by_pitcher.items()]
+    matrices = FeatureMatrixCache()
+    for system_id, predictor in systems.items():
+        results = predictor.predict_many(requests, matrices)
+
+Set MLB_BATCH_PREDICT=per_row to fall back to one predict() per pitcher.
+"""
+
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def batch_predict_enabled() -> bool:
+    """Return False when MLB_BATCH_PREDICT=per_row."""
+    return os.environ.get('MLB_BATCH_PREDICT', 'matrix').lower() != 'per_row'
+
+
+def _is_model_feature_name(key: str) -> bool:
+    """Model feature names look like f00_k_avg_last_3 / f19b_season_csw_pct."""
+    return key.startswith('f') and len(key) > 2 and key[1:3].isdigit()
+
+
+@dataclass(frozen=True)
+class PredictionRequest:
+    """One pitcher to score."""
+    pitcher_lookup: str
+    features: Dict[str, Any]
+    strikeouts_line: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class FeatureContract:
+    """
+    How raw feature dicts map onto a model's input columns.
+
+    Args:
+        name: Contract identifier (matrices are shared per name + order)
+        feature_order: Model input columns, in training order
+        raw_to_model: Raw feature name -> model feature name
+        bool_features: (raw name, model name) pairs coerced to 1.0/0.0
+        legacy_fallbacks: Apply the V1.x fallbacks (bottom-up K from
+            k_avg_last_5, ERA/WHIP from rolling or season values)
+    """
+    name: str
+    feature_order: Tuple[str, ...]
+    raw_to_model: Mapping[str, str]
+    bool_features: Tuple[Tuple[str, str], ...] = ()
+    legacy_fallbacks: bool = False
+
+    @property
+    def key(self) -> Tuple[str, Tuple[str, ...]]:
+        return self.name, self.feature_order
+
+    def normalize(self, raw_features: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a raw feature dict onto model feature names."""
+        normalized = {}
+        for key, value in raw_features.items():
+            if _is_model_feature_name(key):
+                normalized[key] = value
+            elif key in self.raw_to_model:
+                model_key = self.raw_to_model[key]
+                # Don't overwrite if already set (prefer explicit model names)
+                if model_key not in normalized:
+                    normalized[model_key] = value
+
+        for raw_key, model_key in self.bool_features:
+            if raw_key in raw_features:
+                normalized[model_key] = 1.0 if raw_features.get(raw_key) else 0.0
+
+        if self.legacy_fallbacks:
+            if 'f25_bottom_up_k_expected' not in normalized:
+                fallback = raw_features.get('bottom_up_k_expected') or raw_features.get('k_avg_last_5')
+                if fallback:
+                    normalized['f25_bottom_up_k_expected'] = fallback
+            if 'f06_season_era' not in normalized:
+                era = raw_features.get('era_rolling_10') or raw_features.get('season_era')
+                if era is not None:
+                    normalized['f06_season_era'] = era
+            if 'f07_season_whip' not in normalized:
+                whip = raw_features.get('whip_rolling_10') or raw_features.get('season_whip')
+                if whip is not None:
+                    normalized['f07_season_whip'] = whip
+
+        return normalized
+
+
+@dataclass
+class FeatureMatrix:
+    """
+    Slate x contract feature matrix.
+
+    ``values`` holds NaN wherever a feature is missing, null, NaN or inf.
+    ``errors[i]`` is set when row i could not be converted at all.
+    """
+    contract: FeatureContract
+    values: np.ndarray
+    errors: List[Optional[str]]
+
+    @classmethod
+    def build(cls, contract: FeatureContract, rows: Sequence[Dict[str, Any]]) -> 'FeatureMatrix':
+        order = contract.feature_order
+        values = np.full((len(rows), len(order)), np.nan)
+        errors: List[Optional[str]] = [None] * len(rows)
+
+        for i, raw in enumerate(rows):
+            try:
+                normalized = contract.normalize(raw)
+                values[i] = [
+                    np.nan if normalized.get(name) is None else float(normalized[name])
+                    for name in order
+                ]
+            except (TypeError, ValueError) as e:
+                errors[i] = str(e)
+
+        values[~np.isfinite(values)] = np.nan
+        return cls(contract, values, errors)
+
+    def model_input(
+        self,
+        nan_tolerant: frozenset = frozenset(),
+        defaults: Optional[Mapping[str, float]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, List[List[str]]]:
+        """
+        Matrix as a predictor feeds it to its model.
+
+        Missing NaN-tolerant features stay NaN. Other missing features are
+        filled with ``defaults`` (0.0 when absent) and counted per row.
+
+        Returns:
+            (matrix, default_feature_count per row, default feature names per row)
+        """
+        order = self.contract.feature_order
+        matrix = self.values.copy()
+        missing = np.isnan(matrix)
+        counted = np.array([name not in nan_tolerant for name in order], dtype=bool)
+        defaulted = missing & counted
+
+        fill = np.array([(defaults or {}).get(name, 0.0) for name in order], dtype=float)
+        matrix = np.where(defaulted, fill, matrix)
+
+        names = np.array(order, dtype=object)
+        default_features = [list(names[row]) for row in defaulted]
+        return matrix, defaulted.sum(axis=1), default_features
+
+
+@dataclass
+class FeatureMatrixCache:
+    """
+    Per-slate cache of contract matrices and predictor results.
+
+    Create one per batch run and pass it to every predictor's predict_many().
+    """
+    matrices: Dict[Tuple[str, Tuple[str, ...]], FeatureMatrix] = field(default_factory=dict)
+    results: Dict[Tuple[str, int], List[Dict]] = field(default_factory=dict)
+
+    def matrix(self, contract: FeatureContract, requests: Sequence[PredictionRequest]) -> FeatureMatrix:
+        matrix = self.matrices.get(contract.key)
+        if matrix is None or len(matrix.errors) != len(requests):
+            matrix = FeatureMatrix.build(contract, [r.features for r in requests])
+            self.matrices[contract.key] = matrix
+            logger.info(
+                f"[FEATURE_MATRIX] Built {contract.name} matrix "
+                f"{matrix.values.shape[0]}x{matrix.values.shape[1]}"
+            )
+        return matrix
+
+    def get_results(self, predictor, requests: Sequence[PredictionRequest]) -> Optional[List[Dict]]:
+        """Copies of a predictor's earlier results for this slate, if any."""
+        cached = self.results.get((predictor.system_id, id(predictor)))
+        if cached is None or len(cached) != len(requests):
+            return None
+        return [dict(result) for result in cached]
+
+    def set_results(self, predictor, results: List[Dict]) -> None:
+        self.results[(predictor.system_id, id(predictor))] = [dict(result) for result in results]
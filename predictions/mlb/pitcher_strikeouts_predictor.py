@@ -410,10 +410,74 @@ class PitcherStrikeoutsPredictor:
 
         # Make prediction
         try:
-            import xgboost as xgb
-            dmatrix = xgb.DMatrix(feature_vector, feature_names=self.feature_order)
-            raw_prediction = float(self.model.predict(dmatrix)[0])
+            raw_prediction = float(self._predict_matrix(feature_vector)[0])
+        except Exception as e:
+            logger.error(f"Prediction failed: {e}", exc_info=True)
+            return {
+                'pitcher_lookup': pitcher_lookup,
+                'predicted_strikeouts': None,
+                'confidence': 0.0,
+                'recommendation': 'ERROR',
+                'error': str(e)
+            }
+
+        return self._build_prediction(
+            pitcher_lookup, features, strikeouts_line, raw_prediction, feature_vector
+        )
+
+    def predict_many(self, requests: List) -> List[Dict]:
+        """
+        Predict a whole slate with one model call.
 
+        Args:
+            requests: PredictionRequests (pitcher_lookup, features, strikeouts_line)
+
+        Returns:
+            list: One prediction per request, identical to predict()
+        """
+        from predictions.mlb.feature_matrix import batch_predict_enabled
+
+        if not requests or not batch_predict_enabled() or not self.load_model():
+            return [self.predict(r.pitcher_lookup, r.features, r.strikeouts_line) for r in requests]
+
+        vectors = [self.prepare_features(r.features) for r in requests]
+        ready = [i for i, vector in enumerate(vectors) if vector is not None]
+        results = [None] * len(requests)
+
+        outputs = None
+        if ready:
+            try:
+                outputs = self._predict_matrix(np.vstack([vectors[i] for i in ready]))
+            except Exception as e:
+                logger.warning(f"Slate prediction failed, predicting per pitcher: {e}")
+
+        if outputs is not None:
+            for output, i in zip(outputs, ready):
+                request = requests[i]
+                results[i] = self._build_prediction(
+                    request.pitcher_lookup, request.features, request.strikeouts_line,
+                    float(output), vectors[i]
+                )
+        for i, request in enumerate(requests):
+            if results[i] is None:
+                results[i] = self.predict(request.pitcher_lookup, request.features, request.strikeouts_line)
+        return results
+
+    def _predict_matrix(self, matrix: np.ndarray) -> np.ndarray:
+        import xgboost as xgb
+        dmatrix = xgb.DMatrix(matrix, feature_names=self.feature_order)
+        return self.model.predict(dmatrix)
+
+    def _build_prediction(
+        self,
+        pitcher_lookup: str,
+        features: Dict,
+        strikeouts_line: Optional[float],
+        raw_prediction: float,
+        feature_vector: np.ndarray
+    ) -> Dict:
+        """Recommendation, confidence and red flags for one raw model output."""
+        try:
             # Check if this is a classifier model (outputs probability of OVER)
             is_classifier = self.model_metadata and self.model_metadata.get('model_type') == 'classifier'
 
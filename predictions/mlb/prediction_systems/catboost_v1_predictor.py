@@ -20,6 +20,7 @@ import numpy as np
 
 from predictions.mlb.base_predictor import BaseMLBPredictor
 from predictions.mlb.config import get_config
+from predictions.mlb.feature_matrix import FeatureContract
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +94,27 @@ RAW_TO_MODEL_MAPPING = {
     'gb_pct': 'f73_gb_pct',
 }
 
+# Statcast features (f50-f53) are NaN-tolerant: CatBoost handles them natively.
+# Core features still use zero-tolerance.
+NAN_TOLERANT_FEATURES = frozenset({
+    'f50_swstr_pct_last_3', 'f51_fb_velocity_last_3',
+    'f52_swstr_trend', 'f53_velocity_change',
+    'f19_season_swstr_pct', 'f19b_season_csw_pct',
+    'f65_vs_opp_k_per_9', 'f66_vs_opp_games',
+    'f67_season_starts', 'f68_k_per_pitch', 'f69_recent_workload_ratio',
+    'f70_o_swing_pct', 'f71_z_contact_pct', 'f72_fip', 'f73_gb_pct',
+    # BettingPros projection — NULL when bp_pitcher_props has no 2026 data;
+    # oddsa_pitcher_props has no projection equivalent so we pass NaN.
+    'f40_bp_projection',
+})
+
+CATBOOST_V1_CONTRACT = FeatureContract(
+    name='catboost_v1_40f',
+    feature_order=tuple(CATBOOST_V1_FEATURES),
+    raw_to_model=RAW_TO_MODEL_MAPPING,
+    bool_features=(('is_home', 'f10_is_home'), ('is_postseason', 'f24_is_postseason')),
+)
+
 
 class CatBoostV1Predictor(BaseMLBPredictor):
     """
@@ -103,6 +125,8 @@ class CatBoostV1Predictor(BaseMLBPredictor):
     are NaN-tolerant — CatBoost handles them natively (Session 433).
     """
 
+    nan_tolerant_features = NAN_TOLERANT_FEATURES
+
     def __init__(self, model_path: str = None, project_id: str = None):
         super().__init__(system_id='catboost_v1', project_id=project_id)
 
@@ -158,6 +182,9 @@ class CatBoostV1Predictor(BaseMLBPredictor):
             logger.error(f"[{self.system_id}] Failed to load model: {e}", exc_info=True)
             return False
 
+    def feature_contract(self) -> FeatureContract:
+        return CATBOOST_V1_CONTRACT
+
     def prepare_features(self, raw_features: Dict) -> tuple:
         """
         Prepare feature vector from raw features.
@@ -167,35 +194,9 @@ class CatBoostV1Predictor(BaseMLBPredictor):
         """
         try:
             # Normalize raw feature names to model feature names
-            normalized = {}
-            for key, value in raw_features.items():
-                if key.startswith('f') and len(key) > 2 and key[1:3].isdigit():
-                    normalized[key] = value
-                elif key in RAW_TO_MODEL_MAPPING:
-                    model_key = RAW_TO_MODEL_MAPPING[key]
-                    if model_key not in normalized:
-                        normalized[model_key] = value
-
-            # Handle boolean conversions
-            if 'is_home' in raw_features:
-                normalized['f10_is_home'] = 1.0 if raw_features.get('is_home') else 0.0
-            if 'is_postseason' in raw_features:
-                normalized['f24_is_postseason'] = 1.0 if raw_features.get('is_postseason') else 0.0
+            normalized = CATBOOST_V1_CONTRACT.normalize(raw_features)
 
             # Build feature vector — track defaults
-            # Statcast features (f50-f53) are NaN-tolerant: CatBoost handles them natively.
-            # Core features still use zero-tolerance.
-            NAN_TOLERANT_FEATURES = {
-                'f50_swstr_pct_last_3', 'f51_fb_velocity_last_3',
-                'f52_swstr_trend', 'f53_velocity_change',
-                'f19_season_swstr_pct', 'f19b_season_csw_pct',
-                'f65_vs_opp_k_per_9', 'f66_vs_opp_games',
-                'f67_season_starts', 'f68_k_per_pitch', 'f69_recent_workload_ratio',
-                'f70_o_swing_pct', 'f71_z_contact_pct', 'f72_fip', 'f73_gb_pct',
-                # BettingPros projection — NULL when bp_pitcher_props has no 2026 data;
-                # oddsa_pitcher_props has no projection equivalent so we pass NaN.
-                'f40_bp_projection',
-            }
             feature_vector = []
             default_feature_count = 0
             default_features = []
@@ -240,38 +241,29 @@ class CatBoostV1Predictor(BaseMLBPredictor):
 
         feature_vector, default_feature_count, default_features = self.prepare_features(features)
         if feature_vector is None:
-            return {
-                'pitcher_lookup': pitcher_lookup,
-                'predicted_strikeouts': None,
-                'confidence': 0.0,
-                'recommendation': 'ERROR',
-                'system_id': self.system_id,
-                'default_feature_count': 0,
-                'error': 'Failed to prepare features'
-            }
+            return self._error_result(pitcher_lookup, 'Failed to prepare features')
 
         # ZERO TOLERANCE: Block predictions with any missing features
         if default_feature_count > 0:
-            logger.info(
-                f"[{self.system_id}] BLOCKED {pitcher_lookup}: "
-                f"{default_feature_count} missing features ({default_features[:5]})"
-            )
-            return {
-                'pitcher_lookup': pitcher_lookup,
-                'predicted_strikeouts': None,
-                'confidence': 0.0,
-                'recommendation': 'BLOCKED',
-                'system_id': self.system_id,
-                'default_feature_count': default_feature_count,
-                'default_features': default_features,
-                'error': f'Blocked: {default_feature_count} features missing'
-            }
+            return self._blocked_result(pitcher_lookup, default_feature_count, default_features)
 
         try:
-            # CatBoost classifier predicts P(OVER)
-            proba = self.model.predict_proba(feature_vector)[0]
-            p_over = float(proba[1]) if len(proba) > 1 else float(proba[0])
+            p_over = float(self._predict_matrix(feature_vector)[0])
+        except Exception as e:
+            logger.error(f"[{self.system_id}] Prediction failed: {e}", exc_info=True)
+            return self._error_result(pitcher_lookup, str(e))
+
+        return self._build_prediction(pitcher_lookup, features, strikeouts_line, p_over)
+
+    def _predict_matrix(self, matrix: np.ndarray) -> np.ndarray:
+        # CatBoost classifier predicts P(OVER)
+        proba = np.asarray(self.model.predict_proba(matrix))
+        return proba[:, 1] if proba.shape[1] > 1 else proba[:, 0]
 
+    def _build_prediction(self, pitcher_lookup: str, features: Dict,
+                          strikeouts_line: Optional[float], p_over: float) -> Dict:
+        """Recommendation, edge and red flags for one P(OVER)."""
+        try:
             # Convert probability to recommendation
             if p_over > 0.5:
                 recommendation = 'OVER'
@@ -332,12 +324,4 @@ class CatBoostV1Predictor(BaseMLBPredictor):
 
         except Exception as e:
             logger.error(f"[{self.system_id}] Prediction failed: {e}", exc_info=True)
-            return {
-                'pitcher_lookup': pitcher_lookup,
-                'predicted_strikeouts': None,
-                'confidence': 0.0,
-                'recommendation': 'ERROR',
-                'system_id': self.system_id,
-                'default_feature_count': 0,
-                'error': str(e)
-            }
+            return self._error_result(pitcher_lookup, str(e))
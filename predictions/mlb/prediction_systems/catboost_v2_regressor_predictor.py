@@ -21,6 +21,7 @@ import numpy as np
 
 from predictions.mlb.base_predictor import BaseMLBPredictor
 from predictions.mlb.config import get_config
+from predictions.mlb.feature_matrix import FeatureContract
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +95,29 @@ RAW_TO_MODEL_MAPPING = {
     'gb_pct': 'f73_gb_pct',
 }
 
+# Statcast features (f50-f53) and advanced features are NaN-tolerant: CatBoost
+# handles them natively. Core features use zero-tolerance (BLOCKED if missing).
+NAN_TOLERANT_FEATURES = frozenset({
+    'f25_is_day_game',
+    'f50_swstr_pct_last_3', 'f51_fb_velocity_last_3',
+    'f52_swstr_trend', 'f53_velocity_change',
+    'f19_season_swstr_pct', 'f19b_season_csw_pct',
+    'f65_vs_opp_k_per_9', 'f66_vs_opp_games',
+    'f68_k_per_pitch',
+    'f70_o_swing_pct', 'f71_z_contact_pct', 'f72_fip', 'f73_gb_pct',
+    # BettingPros projection — NULL when bp_pitcher_props has no 2026 data;
+    # oddsa_pitcher_props has no projection equivalent so we pass NaN.
+    'f40_bp_projection',
+})
+
+# Shared by the LightGBM / XGBoost V1 regressors (same 36 columns)
+CATBOOST_V2_CONTRACT = FeatureContract(
+    name='mlb_regressor_36f',
+    feature_order=tuple(CATBOOST_V2_FEATURES),
+    raw_to_model=RAW_TO_MODEL_MAPPING,
+    bool_features=(('is_home', 'f10_is_home'), ('is_day_game', 'f25_is_day_game')),
+)
+
 # Sigmoid scale — retained ONLY because the shadow lightgbm_v1 / xgboost_v1
 # regressor predictors import it from this module. catboost_v2 itself no longer
 # uses it: as of Stage 1.1 its p_over comes from the Poisson tail below.
@@ -153,6 +177,8 @@ class CatBoostV2RegressorPredictor(BaseMLBPredictor):
     handles them natively.
     """
 
+    nan_tolerant_features = NAN_TOLERANT_FEATURES
+
     def __init__(self, model_path: str = None, project_id: str = None):
         super().__init__(system_id='catboost_v2_regressor', project_id=project_id)
 
@@ -208,6 +234,9 @@ class CatBoostV2RegressorPredictor(BaseMLBPredictor):
             logger.error(f"[{self.system_id}] Failed to load model: {e}", exc_info=True)
             return False
 
+    def feature_contract(self) -> FeatureContract:
+        return CATBOOST_V2_CONTRACT
+
     def prepare_features(self, raw_features: Dict) -> tuple:
         """
         Prepare feature vector from raw features.
@@ -218,37 +247,12 @@ class CatBoostV2RegressorPredictor(BaseMLBPredictor):
         """
         try:
             # Normalize raw feature names to model feature names
-            normalized = {}
-            for key, value in raw_features.items():
-                if key.startswith('f') and len(key) > 2 and key[1:3].isdigit():
-                    normalized[key] = value
-                elif key in RAW_TO_MODEL_MAPPING:
-                    model_key = RAW_TO_MODEL_MAPPING[key]
-                    if model_key not in normalized:
-                        normalized[model_key] = value
-
-            # Handle boolean conversions
-            if 'is_home' in raw_features:
-                normalized['f10_is_home'] = 1.0 if raw_features.get('is_home') else 0.0
-            if 'is_day_game' in raw_features:
-                normalized['f25_is_day_game'] = 1.0 if raw_features.get('is_day_game') else 0.0
+            normalized = CATBOOST_V2_CONTRACT.normalize(raw_features)
 
             # Build feature vector — track defaults
             # Statcast features (f50-f53) and advanced features are NaN-tolerant:
             # CatBoost handles them natively.
             # Core features still use zero-tolerance.
-            NAN_TOLERANT_FEATURES = {
-                'f25_is_day_game',
-                'f50_swstr_pct_last_3', 'f51_fb_velocity_last_3',
-                'f52_swstr_trend', 'f53_velocity_change',
-                'f19_season_swstr_pct', 'f19b_season_csw_pct',
-                'f65_vs_opp_k_per_9', 'f66_vs_opp_games',
-                'f68_k_per_pitch',
-                'f70_o_swing_pct', 'f71_z_contact_pct', 'f72_fip', 'f73_gb_pct',
-                # BettingPros projection — NULL when bp_pitcher_props has no 2026 data;
-                # oddsa_pitcher_props has no projection equivalent so we pass NaN.
-                'f40_bp_projection',
-            }
             feature_vector = []
             default_feature_count = 0
             default_features = []
@@ -278,6 +282,10 @@ class CatBoostV2RegressorPredictor(BaseMLBPredictor):
             logger.error(f"[{self.system_id}] Error preparing features: {e}", exc_info=True)
             return None, 0, []
 
+    def _predict_matrix(self, matrix: np.ndarray) -> np.ndarray:
+        # CatBoost regressor predicts raw strikeout count
+        return self.model.predict(matrix)
+
     def _get_blend_weight(self) -> float:
         """Resolve the model-market blend weight `w` for `w*model + (1-w)*line`.
 
@@ -325,37 +333,24 @@ class CatBoostV2RegressorPredictor(BaseMLBPredictor):
 
         feature_vector, default_feature_count, default_features = self.prepare_features(features)
         if feature_vector is None:
-            return {
-                'pitcher_lookup': pitcher_lookup,
-                'predicted_strikeouts': None,
-                'confidence': 0.0,
-                'recommendation': 'ERROR',
-                'system_id': self.system_id,
-                'default_feature_count': 0,
-                'error': 'Failed to prepare features'
-            }
+            return self._error_result(pitcher_lookup, 'Failed to prepare features')
 
         # ZERO TOLERANCE: Block predictions with any missing features
         if default_feature_count > 0:
-            logger.info(
-                f"[{self.system_id}] BLOCKED {pitcher_lookup}: "
-                f"{default_feature_count} missing features ({default_features[:5]})"
-            )
-            return {
-                'pitcher_lookup': pitcher_lookup,
-                'predicted_strikeouts': None,
-                'confidence': 0.0,
-                'recommendation': 'BLOCKED',
-                'system_id': self.system_id,
-                'default_feature_count': default_feature_count,
-                'default_features': default_features,
-                'error': f'Blocked: {default_feature_count} features missing'
-            }
+            return self._blocked_result(pitcher_lookup, default_feature_count, default_features)
 
         try:
-            # CatBoost regressor predicts raw strikeout count
-            predicted_K = float(self.model.predict(feature_vector)[0])
+            predicted_K = float(self._predict_matrix(feature_vector)[0])
+        except Exception as e:
+            logger.error(f"[{self.system_id}] Prediction failed: {e}", exc_info=True)
+            return self._error_result(pitcher_lookup, str(e))
+
+        return self._build_prediction(pitcher_lookup, features, strikeouts_line, predicted_K)
 
+    def _build_prediction(self, pitcher_lookup: str, features: Dict,
+                          strikeouts_line: Optional[float], predicted_K: float) -> Dict:
+        """Blend, edge, p_over and red flags for one raw regressor output."""
+        try:
             # Sanity guard: predicted_K should be non-negative and reasonable
             if predicted_K < 0:
                 logger.warning(
@@ -439,12 +434,4 @@ class CatBoostV2RegressorPredictor(BaseMLBPredictor):
 
         except Exception as e:
             logger.error(f"[{self.system_id}] Prediction failed: {e}", exc_info=True)
-            return {
-                'pitcher_lookup': pitcher_lookup,
-                'predicted_strikeouts': None,
-                'confidence': 0.0,
-                'recommendation': 'ERROR',
-                'system_id': self.system_id,
-                'default_feature_count': 0,
-                'error': str(e)
-            }
+            return self._error_result(pitcher_lookup, str(e))
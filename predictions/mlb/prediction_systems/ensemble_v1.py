@@ -18,10 +18,15 @@ System ID: 'ensemble_v1'
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 import numpy as np
 
 from predictions.mlb.base_predictor import BaseMLBPredictor
+from predictions.mlb.feature_matrix import (
+    FeatureMatrixCache,
+    PredictionRequest,
+    batch_predict_enabled,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +108,42 @@ class MLBEnsembleV1(BaseMLBPredictor):
                 'error': f'Component prediction failed: {str(e)}'
             }
 
+        return self._combine(pitcher_lookup, features, strikeouts_line, v1_pred, v1_6_pred)
+
+    def _score_slate(
+        self,
+        requests: Sequence[PredictionRequest],
+        matrices: FeatureMatrixCache
+    ) -> List[Dict]:
+        """
+        Score both components for the whole slate, then combine row by row.
+
+        Component results come from the shared cache when V1 / V1.6 already
+        ran as standalone systems in the same batch.
+        """
+        if not batch_predict_enabled():
+            return self._predict_rows(requests)
+        try:
+            v1_preds = self.v1_predictor.predict_many(requests, matrices)
+            v1_6_preds = self.v1_6_predictor.predict_many(requests, matrices)
+        except Exception as e:
+            logger.warning(f"[{self.system_id}] Slate component predictions failed, scoring per row: {e}")
+            return self._predict_rows(requests)
+
+        return [
+            self._combine(r.pitcher_lookup, r.features, r.strikeouts_line, v1_pred, v1_6_pred)
+            for r, v1_pred, v1_6_pred in zip(requests, v1_preds, v1_6_preds)
+        ]
+
+    def _combine(
+        self,
+        pitcher_lookup: str,
+        features: Dict,
+        strikeouts_line: Optional[float],
+        v1_pred: Dict,
+        v1_6_pred: Dict
+    ) -> Dict:
+        """Weighted ensemble of one pitcher's V1 and V1.6 predictions."""
         # Check if either system returned an error, skip, or blocked
         non_actionable = {'ERROR', 'SKIP', 'BLOCKED'}
         if v1_pred.get('recommendation') in non_actionable and v1_6_pred.get('recommendation') in non_actionable:
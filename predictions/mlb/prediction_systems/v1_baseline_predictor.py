@@ -25,6 +25,7 @@ import numpy as np
 
 from predictions.mlb.base_predictor import BaseMLBPredictor
 from predictions.mlb.config import get_config
+from predictions.mlb.feature_matrix import FeatureContract
 
 logger = logging.getLogger(__name__)
 
@@ -119,6 +120,9 @@ class V1BaselinePredictor(BaseMLBPredictor):
     Default model: mlb_pitcher_strikeouts_v1_4features_20260114_142456.json
     """
 
+    feature_defaults = FEATURE_DEFAULTS
+    blocked_reason = 'features used defaults'
+
     def __init__(
         self,
         model_path: str = None,
@@ -139,6 +143,7 @@ class V1BaselinePredictor(BaseMLBPredictor):
         self.model = None
         self.model_metadata = None
         self.feature_order = None
+        self._contract: Optional[FeatureContract] = None
 
     def load_model(self) -> bool:
         """
@@ -201,6 +206,20 @@ class V1BaselinePredictor(BaseMLBPredictor):
             logger.error(f"[{self.system_id}] Failed to load model: {e}", exc_info=True)
             return False
 
+    def feature_contract(self) -> Optional[FeatureContract]:
+        """Contract over the metadata feature order (None until the model loads)."""
+        if not self.feature_order:
+            return None
+        if self._contract is None or self._contract.feature_order != tuple(self.feature_order):
+            self._contract = FeatureContract(
+                name=self.system_id,
+                feature_order=tuple(self.feature_order),
+                raw_to_model=RAW_TO_MODEL_MAPPING,
+                bool_features=(('is_home', 'f10_is_home'), ('is_postseason', 'f24_is_postseason')),
+                legacy_fallbacks=True,
+            )
+        return self._contract
+
     def prepare_features(self, raw_features: Dict) -> tuple:
         """
         Prepare feature vector from raw features for V1 model.
@@ -220,42 +239,7 @@ class V1BaselinePredictor(BaseMLBPredictor):
             return None, 0, []
 
         try:
-            # First, normalize raw_features to model feature names
-            normalized_features = {}
-
-            for key, value in raw_features.items():
-                # Check if it's already a model feature name
-                if key.startswith('f') and len(key) > 2 and key[1:3].isdigit():
-                    normalized_features[key] = value
-                # Otherwise, try to map it using RAW_TO_MODEL_MAPPING
-                elif key in RAW_TO_MODEL_MAPPING:
-                    model_key = RAW_TO_MODEL_MAPPING[key]
-                    # Don't overwrite if already set (prefer explicit model names)
-                    if model_key not in normalized_features:
-                        normalized_features[model_key] = value
-
-            # Handle special boolean conversions
-            if 'is_home' in raw_features:
-                normalized_features['f10_is_home'] = 1.0 if raw_features.get('is_home') else 0.0
-            if 'is_postseason' in raw_features:
-                normalized_features['f24_is_postseason'] = 1.0 if raw_features.get('is_postseason') else 0.0
-
-            # Handle fallback mappings for V1.4 features
-            if 'f25_bottom_up_k_expected' not in normalized_features:
-                # Use k_avg_last_5 as fallback for bottom_up_k_expected
-                fallback = raw_features.get('bottom_up_k_expected') or raw_features.get('k_avg_last_5')
-                if fallback:
-                    normalized_features['f25_bottom_up_k_expected'] = fallback
-
-            # Handle ERA/WHIP that can come from rolling or season
-            if 'f06_season_era' not in normalized_features:
-                era = raw_features.get('era_rolling_10') or raw_features.get('season_era')
-                if era is not None:
-                    normalized_features['f06_season_era'] = era
-            if 'f07_season_whip' not in normalized_features:
-                whip = raw_features.get('whip_rolling_10') or raw_features.get('season_whip')
-                if whip is not None:
-                    normalized_features['f07_season_whip'] = whip
+            normalized_features = self.feature_contract().normalize(raw_features)
 
             # Build feature vector — track defaults instead of silently substituting
             feature_vector = []
@@ -314,39 +298,35 @@ class V1BaselinePredictor(BaseMLBPredictor):
         # Prepare features (zero-tolerance: tracks default count)
         feature_vector, default_feature_count, default_features = self.prepare_features(features)
         if feature_vector is None:
-            return {
-                'pitcher_lookup': pitcher_lookup,
-                'predicted_strikeouts': None,
-                'confidence': 0.0,
-                'recommendation': 'ERROR',
-                'system_id': self.system_id,
-                'default_feature_count': 0,
-                'error': 'Failed to prepare features'
-            }
+            return self._error_result(pitcher_lookup, 'Failed to prepare features')
 
         # ZERO TOLERANCE: Block predictions with any default features
         if default_feature_count > 0:
-            logger.info(
-                f"[{self.system_id}] BLOCKED {pitcher_lookup}: "
-                f"{default_feature_count} default features ({default_features[:5]})"
-            )
-            return {
-                'pitcher_lookup': pitcher_lookup,
-                'predicted_strikeouts': None,
-                'confidence': 0.0,
-                'recommendation': 'BLOCKED',
-                'system_id': self.system_id,
-                'default_feature_count': default_feature_count,
-                'default_features': default_features,
-                'error': f'Blocked: {default_feature_count} features used defaults'
-            }
+            return self._blocked_result(pitcher_lookup, default_feature_count, default_features)
 
         # Make prediction
         try:
-            import xgboost as xgb
-            dmatrix = xgb.DMatrix(feature_vector, feature_names=self.feature_order)
-            raw_prediction = float(self.model.predict(dmatrix)[0])
+            raw_prediction = float(self._predict_matrix(feature_vector)[0])
+        except Exception as e:
+            logger.error(f"[{self.system_id}] Prediction failed: {e}", exc_info=True)
+            return self._error_result(pitcher_lookup, str(e))
+
+        return self._build_prediction(pitcher_lookup, features, strikeouts_line, raw_prediction)
+
+    def _predict_matrix(self, matrix: np.ndarray) -> np.ndarray:
+        import xgboost as xgb
+        dmatrix = xgb.DMatrix(matrix, feature_names=self.feature_order)
+        return self.model.predict(dmatrix)
 
+    def _build_prediction(
+        self,
+        pitcher_lookup: str,
+        features: Dict,
+        strikeouts_line: Optional[float],
+        raw_prediction: float
+    ) -> Dict:
+        """Confidence, recommendation and red flags for one raw model output."""
+        try:
             # V1 is a regressor (outputs strikeout count directly)
             predicted_strikeouts = raw_prediction
 
@@ -354,7 +334,7 @@ class V1BaselinePredictor(BaseMLBPredictor):
             predicted_strikeouts = max(0, min(20, predicted_strikeouts))
 
             # Calculate base confidence
-            confidence = self._calculate_confidence(features, feature_vector)
+            confidence = self._calculate_confidence(features)
 
             # Calculate feature coverage
             coverage_pct, missing_features = self._calculate_feature_coverage(features, self.feature_order)
@@ -371,15 +351,7 @@ class V1BaselinePredictor(BaseMLBPredictor):
 
         except Exception as e:
             logger.error(f"[{self.system_id}] Prediction failed: {e}", exc_info=True)
-            return {
-                'pitcher_lookup': pitcher_lookup,
-                'predicted_strikeouts': None,
-                'confidence': 0.0,
-                'recommendation': 'ERROR',
-                'system_id': self.system_id,
-                'default_feature_count': 0,
-                'error': str(e)
-            }
+            return self._error_result(pitcher_lookup, str(e))
 
         # Check red flags
         red_flag_result = self._check_red_flags(features, recommendation)
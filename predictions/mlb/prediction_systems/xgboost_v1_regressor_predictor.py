@@ -16,14 +16,26 @@ from typing import Dict, Optional
 import numpy as np
 
 from predictions.mlb.base_predictor import BaseMLBPredictor
+from predictions.mlb.feature_matrix import FeatureContract
 from predictions.mlb.prediction_systems.catboost_v2_regressor_predictor import (
+    CATBOOST_V2_CONTRACT,
     CATBOOST_V2_FEATURES as FEATURE_ORDER,
-    RAW_TO_MODEL_MAPPING,
     SIGMOID_SCALE,
 )
 
 logger = logging.getLogger(__name__)
 
+# Same as CatBoost V2 except f40_bp_projection, which stays zero-tolerance
+NAN_TOLERANT_FEATURES = frozenset({
+    'f25_is_day_game',
+    'f50_swstr_pct_last_3', 'f51_fb_velocity_last_3',
+    'f52_swstr_trend', 'f53_velocity_change',
+    'f19_season_swstr_pct', 'f19b_season_csw_pct',
+    'f65_vs_opp_k_per_9', 'f66_vs_opp_games',
+    'f68_k_per_pitch',
+    'f70_o_swing_pct', 'f71_z_contact_pct', 'f72_fip', 'f73_gb_pct',
+})
+
 
 class XGBoostV1RegressorPredictor(BaseMLBPredictor):
     """XGBoost V1 regressor for pitcher strikeout predictions.
@@ -32,6 +44,8 @@ class XGBoostV1RegressorPredictor(BaseMLBPredictor):
     XGBoost handles NaN natively for NaN-tolerant features.
     """
 
+    nan_tolerant_features = NAN_TOLERANT_FEATURES
+
     def __init__(self, model_path: str = None, project_id: str = None):
         super().__init__(system_id='xgboost_v1_regressor', project_id=project_id)
 
@@ -87,6 +101,9 @@ class XGBoostV1RegressorPredictor(BaseMLBPredictor):
             logger.error(f"[{self.system_id}] Failed to load model: {e}", exc_info=True)
             return False
 
+    def feature_contract(self) -> FeatureContract:
+        return CATBOOST_V2_CONTRACT
+
     def prepare_features(self, raw_features: Dict) -> tuple:
         """Prepare feature vector from raw features.
 
@@ -94,29 +111,8 @@ class XGBoostV1RegressorPredictor(BaseMLBPredictor):
         Returns (feature_vector, default_feature_count, default_features).
         """
         try:
-            normalized = {}
-            for key, value in raw_features.items():
-                if key.startswith('f') and len(key) > 2 and key[1:3].isdigit():
-                    normalized[key] = value
-                elif key in RAW_TO_MODEL_MAPPING:
-                    model_key = RAW_TO_MODEL_MAPPING[key]
-                    if model_key not in normalized:
-                        normalized[model_key] = value
-
-            if 'is_home' in raw_features:
-                normalized['f10_is_home'] = 1.0 if raw_features.get('is_home') else 0.0
-            if 'is_day_game' in raw_features:
-                normalized['f25_is_day_game'] = 1.0 if raw_features.get('is_day_game') else 0.0
-
-            NAN_TOLERANT_FEATURES = {
-                'f25_is_day_game',
-                'f50_swstr_pct_last_3', 'f51_fb_velocity_last_3',
-                'f52_swstr_trend', 'f53_velocity_change',
-                'f19_season_swstr_pct', 'f19b_season_csw_pct',
-                'f65_vs_opp_k_per_9', 'f66_vs_opp_games',
-                'f68_k_per_pitch',
-                'f70_o_swing_pct', 'f71_z_contact_pct', 'f72_fip', 'f73_gb_pct',
-            }
+            normalized = CATBOOST_V2_CONTRACT.normalize(raw_features)
+
             feature_vector = []
             default_feature_count = 0
             default_features = []
@@ -148,8 +144,6 @@ class XGBoostV1RegressorPredictor(BaseMLBPredictor):
     def predict(self, pitcher_lookup: str, features: Dict,
                 strikeouts_line: Optional[float] = None) -> Dict:
         """Generate strikeout prediction using XGBoost V1 regressor."""
-        import xgboost as xgb
-
         if not self.load_model():
             return {
                 'pitcher_lookup': pitcher_lookup,
@@ -162,35 +156,29 @@ class XGBoostV1RegressorPredictor(BaseMLBPredictor):
 
         feature_vector, default_feature_count, default_features = self.prepare_features(features)
         if feature_vector is None:
-            return {
-                'pitcher_lookup': pitcher_lookup,
-                'predicted_strikeouts': None,
-                'confidence': 0.0,
-                'recommendation': 'ERROR',
-                'system_id': self.system_id,
-                'default_feature_count': 0,
-                'error': 'Failed to prepare features'
-            }
+            return self._error_result(pitcher_lookup, 'Failed to prepare features')
 
         if default_feature_count > 0:
-            logger.info(
-                f"[{self.system_id}] BLOCKED {pitcher_lookup}: "
-                f"{default_feature_count} missing features ({default_features[:5]})"
-            )
-            return {
-                'pitcher_lookup': pitcher_lookup,
-                'predicted_strikeouts': None,
-                'confidence': 0.0,
-                'recommendation': 'BLOCKED',
-                'system_id': self.system_id,
-                'default_feature_count': default_feature_count,
-                'default_features': default_features,
-                'error': f'Blocked: {default_feature_count} features missing'
-            }
+            return self._blocked_result(pitcher_lookup, default_feature_count, default_features)
+
+        try:
+            predicted_K = float(self._predict_matrix(feature_vector)[0])
+        except Exception as e:
+            logger.error(f"[{self.system_id}] Prediction failed: {e}", exc_info=True)
+            return self._error_result(pitcher_lookup, str(e))
+
+        return self._build_prediction(pitcher_lookup, features, strikeouts_line, predicted_K)
+
+    def _predict_matrix(self, matrix: np.ndarray) -> np.ndarray:
+        import xgboost as xgb
 
+        dmatrix = xgb.DMatrix(matrix, feature_names=FEATURE_ORDER)
+        return self.model.predict(dmatrix)
+
+    def _build_prediction(self, pitcher_lookup: str, features: Dict,
+                          strikeouts_line: Optional[float], predicted_K: float) -> Dict:
+        """Edge, p_over and red flags for one raw regressor output."""
         try:
-            dmatrix = xgb.DMatrix(feature_vector, feature_names=FEATURE_ORDER)
-            predicted_K = float(self.model.predict(dmatrix)[0])
             predicted_K = max(0.0, min(20.0, predicted_K))
 
             if strikeouts_line is not None:
@@ -241,12 +229,4 @@ class XGBoostV1RegressorPredictor(BaseMLBPredictor):
 
         except Exception as e:
             logger.error(f"[{self.system_id}] Prediction failed: {e}", exc_info=True)
-            return {
-                'pitcher_lookup': pitcher_lookup,
-                'predicted_strikeouts': None,
-                'confidence': 0.0,
-                'recommendation': 'ERROR',
-                'system_id': self.system_id,
-                'default_feature_count': 0,
-                'error': str(e)
-            }
+            return self._error_result(pitcher_lookup, str(e))
@@ -34,6 +34,8 @@ from typing import Dict, List, Optional
 from google.cloud import bigquery
 import google.api_core.exceptions
 
+from predictions.mlb.feature_matrix import PredictionRequest
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -325,6 +327,31 @@ def build_features_dict(pitcher_data: Dict, include_v1_6_features: bool = False)
     return features
 
 
+def _predict_slate(predictor, requests: List, label: str) -> List[Optional[Dict]]:
+    """
+    One model call for the whole slate; per-pitcher fallback if it fails.
+
+    A pitcher whose per-pitcher prediction raises gets None (skipped).
+    """
+    try:
+        return predictor.predict_many(requests)
+    except Exception as e:
+        logger.warning(f"{label} slate prediction failed, predicting per pitcher: {e}")
+
+    results = []
+    for request in requests:
+        try:
+            results.append(predictor.predict(
+                pitcher_lookup=request.pitcher_lookup,
+                features=request.features,
+                strikeouts_line=request.strikeouts_line
+            ))
+        except Exception as e:
+            logger.warning(f"{label} prediction failed for {request.pitcher_lookup}: {e}")
+            results.append(None)
+    return results
+
+
 def run_shadow_predictions(pitchers: List[Dict], game_date: date) -> List[ShadowPrediction]:
     """Run both V1.4 and V1.6 predictions for all pitchers"""
     from predictions.mlb.pitcher_strikeouts_predictor import PitcherStrikeoutsPredictor
@@ -343,6 +370,9 @@ def run_shadow_predictions(pitchers: List[Dict], game_date: date) -> List[Shadow
     results = []
     skipped = 0
 
+    # Build both feature sets for every pitcher with a line, then score each
+    # model over the whole slate in one call
+    slate = []
     for pitcher_data in pitchers:
         pitcher_lookup = pitcher_data['pitcher_lookup']
         strikeouts_line = pitcher_data.get('strikeouts_line')
@@ -352,34 +382,24 @@ def run_shadow_predictions(pitchers: List[Dict], game_date: date) -> List[Shadow
             logger.debug(f"Skipping {pitcher_lookup}: No betting line")
             skipped += 1
             continue
-
-        # Build features for V1.4
-        features_v1_4 = build_features_dict(pitcher_data, include_v1_6_features=False)
-
-        # Build features for V1.6 (includes rolling statcast)
-        features_v1_6 = build_features_dict(pitcher_data, include_v1_6_features=True)
-
-        # Run V1.4 prediction
-        try:
-            v1_4_result = v1_4_predictor.predict(
-                pitcher_lookup=pitcher_lookup,
-                features=features_v1_4,
-                strikeouts_line=strikeouts_line
-            )
-        except Exception as e:
-            logger.warning(f"V1.4 prediction failed for {pitcher_lookup}: {e}")
-            continue
-
-        # Run V1.6 prediction
-        try:
-            v1_6_result = v1_6_predictor.predict(
-                pitcher_lookup=pitcher_lookup,
-                features=features_v1_6,
-                strikeouts_line=strikeouts_line
-            )
-        except Exception as e:
-            logger.warning(f"V1.6 prediction failed for {pitcher_lookup}: {e}")
+        slate.append(pitcher_data)
+
+    v1_4_results = _predict_slate(v1_4_predictor, [
+        PredictionRequest(p['pitcher_lookup'], build_features_dict(p, include_v1_6_features=False),
+                          p.get('strikeouts_line'))
+        for p in slate
+    ], 'V1.4')
+    v1_6_results = _predict_slate(v1_6_predictor, [
+        PredictionRequest(p['pitcher_lookup'], build_features_dict(p, include_v1_6_features=True),
+                          p.get('strikeouts_line'))
+        for p in slate
+    ], 'V1.6')
+
+    for pitcher_data, v1_4_result, v1_6_result in zip(slate, v1_4_results, v1_6_results):
+        if v1_4_result is None or v1_6_result is None:
             continue
+        pitcher_lookup = pitcher_data['pitcher_lookup']
+        strikeouts_line = pitcher_data.get('strikeouts_line')
 
         # Extract predictions
         v1_4_pred = v1_4_result.get('predicted_strikeouts', 0) or 0
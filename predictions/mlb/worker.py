@@ -394,6 +394,35 @@ def predict_single():
         }), 500
 
 
+def _predict_slate(systems: Dict, requests: List, matrices) -> Dict[str, List[Dict]]:
+    """
+    Whole-slate predictions per system (system_id -> one dict per request).
+
+    Systems that cannot score a slate (not a BaseMLBPredictor, per_row mode,
+    or a failed slate call) are left out and predicted per pitcher instead.
+    """
+    from predictions.mlb.base_predictor import BaseMLBPredictor
+    from predictions.mlb.feature_matrix import batch_predict_enabled
+
+    slate_predictions = {}
+    if not batch_predict_enabled():
+        return slate_predictions
+
+    for system_id, predictor in systems.items():
+        if not isinstance(predictor, BaseMLBPredictor):
+            continue
+        try:
+            started = time.time()
+            slate_predictions[system_id] = predictor.predict_many(requests, matrices)
+            logger.info(
+                f"[SLATE_PREDICT] {system_id}: {len(requests)} pitchers in "
+                f"{time.time() - started:.2f}s"
+            )
+        except Exception as e:
+            logger.error(f"Slate prediction failed for {system_id}, predicting per pitcher: {e}", exc_info=True)
+    return slate_predictions
+
+
 def run_multi_system_batch_predictions(game_date: date, pitcher_lookups: Optional[List[str]] = None) -> List[Dict]:
     """
     Run batch predictions across all active systems
@@ -425,6 +454,7 @@ def run_multi_system_batch_predictions(game_date: date, pitcher_lookups: Optiona
         load_batch_features, load_schedule_context, _normalize_pitcher_name,
     )
     from predictions.mlb.supplemental_loader import load_supplemental_by_pitcher
+    from predictions.mlb.feature_matrix import FeatureMatrixCache, PredictionRequest
 
     logger.info(f"Loading features for {game_date} (pitcher_lookups={pitcher_lookups})")
     features_by_pitcher = load_batch_features(
@@ -455,8 +485,17 @@ def run_multi_system_batch_predictions(game_date: date, pitcher_lookups: Optiona
         project_id=PROJECT_ID
     )
 
-    # For each pitcher, run predictions through ALL active systems
-    for pitcher_lookup, features in features_by_pitcher.items():
+    # Score the whole slate once per system: one feature matrix per feature
+    # contract and one model call per system (MLB_BATCH_PREDICT=per_row to
+    # fall back to per-pitcher predict()).
+    requests = [
+        PredictionRequest(pitcher_lookup, features, features.get('strikeouts_line'))
+        for pitcher_lookup, features in features_by_pitcher.items()
+    ]
+    slate_predictions = _predict_slate(systems, requests, FeatureMatrixCache())
+
+    # For each pitcher, collect predictions from ALL active systems
+    for row, (pitcher_lookup, features) in enumerate(features_by_pitcher.items()):
         # Extract game context from features
         team_abbr = features.get('team_abbr')
         opponent_team_abbr = features.get('opponent_team_abbr')
@@ -465,12 +504,16 @@ def run_multi_system_batch_predictions(game_date: date, pitcher_lookups: Optiona
         # Run prediction through each active system
         for system_id, predictor in systems.items():
             try:
-                # Call system's predict() with preloaded features
-                prediction = predictor.predict(
-                    pitcher_lookup=pitcher_lookup,
-                    features=features,
-                    strikeouts_line=strikeouts_line
-                )
+                slate = slate_predictions.get(system_id)
+                if slate is not None:
+                    prediction = slate[row]
+                else:
+                    # Call system's predict() with preloaded features
+                    prediction = predictor.predict(
+                        pitcher_lookup=pitcher_lookup,
+                        features=features,
+                        strikeouts_line=strikeouts_line
+                    )
 
                 # Add metadata
                 prediction['system_id'] = system_id
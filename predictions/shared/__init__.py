@@ -24,6 +24,17 @@ from predictions.shared.batch_staging_writer import (
     create_batch_id,
     get_worker_id,
 )
+from predictions.shared.staging_buffer import (
+    BufferedStagingWriter,
+    GCSStagingStore,
+    LocalStagingStore,
+    get_staging_store,
+)
+from predictions.shared.payload_blobs import (
+    PayloadBlobStore,
+    load_payload,
+    resolve_historical_games,
+)
 
 # Distributed lock exports (consolidated from worker/coordinator)
 from predictions.shared.distributed_lock import (
@@ -59,6 +70,13 @@ __all__ = [
     'ConsolidationResult',
     'create_batch_id',
     'get_worker_id',
+    'BufferedStagingWriter',
+    'GCSStagingStore',
+    'LocalStagingStore',
+    'get_staging_store',
+    'PayloadBlobStore',
+    'load_payload',
+    'resolve_historical_games',
 
     # Distributed Lock
     'DistributedLock',
@@ -409,6 +409,10 @@ class BatchConsolidator:
     Used by the coordinator after all workers have completed. Executes a single
     MERGE operation with ROW_NUMBER deduplication, then cleans up staging tables.
 
+    When a staging_store is configured (see staging_buffer.py), buffered
+    staging objects for the batch are first loaded with ONE load job into
+    _staging_{batch_id}_buffered, so the MERGE reads a single source.
+
     Usage:
         consolidator = BatchConsolidator(bq_client, project_id)
         result = consolidator.consolidate_batch(batch_id, game_date)
@@ -416,7 +420,8 @@ class BatchConsolidator:
             print(f"Merged {result.rows_affected} rows from {result.staging_tables_merged} tables")
     """
 
-    def __init__(self, bq_client: bigquery.Client, project_id: str, dataset_prefix: str = ''):
+    def __init__(self, bq_client: bigquery.Client, project_id: str, dataset_prefix: str = '',
+                 staging_store=None):
         """
         Initialize the batch consolidator.
 
@@ -424,10 +429,12 @@ class BatchConsolidator:
             bq_client: BigQuery client instance
             project_id: GCP project ID
             dataset_prefix: Optional dataset prefix for test isolation (e.g., "test")
+            staging_store: Optional buffered staging object store (LocalStagingStore/GCSStagingStore)
         """
         self.bq_client = bq_client
         self.project_id = project_id
         self.dataset_prefix = dataset_prefix
+        self.staging_store = staging_store
         # Construct dataset name with optional prefix
         self.staging_dataset = f"{dataset_prefix}_nba_predictions" if dataset_prefix else "nba_predictions"
 
@@ -452,6 +459,67 @@ class BatchConsolidator:
             logger.error(f"Failed to get schema for staging table {staging_table_id}: {e}")
             raise
 
+    def _buffered_object_prefix(self, batch_id: str) -> str:
+        """Object prefix used by BufferedStagingWriter for this batch."""
+        return f"{self.staging_dataset}/{batch_id.replace('-', '_')}/"
+
+    def _load_buffered_staging(self, batch_id: str) -> Optional[str]:
+        """
+        Load all buffered staging objects for a batch into one staging table.
+
+        Uses a single load job (WRITE_TRUNCATE, so a retried consolidation
+        reloads rather than duplicates) with the main table schema.
+
+        Args:
+            batch_id: Batch identifier
+
+        Returns:
+            Full table ID of the loaded staging table, or None if no objects exist
+        """
+        if self.staging_store is None:
+            return None
+
+        object_names = self.staging_store.list(self._buffered_object_prefix(batch_id))
+        if not object_names:
+            return None
+
+        safe_batch_id = batch_id.replace("-", "_")
+        table_id = f"{self.project_id}.{self.staging_dataset}._staging_{safe_batch_id}_buffered"
+        main_table = self.bq_client.get_table(
+            f"{self.project_id}.{self.staging_dataset}.{MAIN_PREDICTIONS_TABLE}"
+        )
+        job_config = bigquery.LoadJobConfig(
+            schema=main_table.schema,
+            autodetect=False,
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
+            create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED
+        )
+
+        start_time = time.time()
+        load_job = self.staging_store.load_to_table(self.bq_client, object_names, table_id, job_config)
+        load_job.result(timeout=300)
+        elapsed_ms = (time.time() - start_time) * 1000
+        logger.info(
+            f"Loaded {len(object_names)} buffered staging objects into {table_id} "
+            f"with one load job in {elapsed_ms:.1f}ms (batch={batch_id})"
+        )
+        return table_id
+
+    def _cleanup_buffered_objects(self, batch_id: str) -> int:
+        """Delete buffered staging objects for a batch. Returns objects deleted."""
+        if self.staging_store is None:
+            return 0
+        try:
+            object_names = self.staging_store.list(self._buffered_object_prefix(batch_id))
+            deleted = self.staging_store.delete(object_names)
+            if object_names:
+                logger.info(f"Cleaned up {deleted}/{len(object_names)} buffered staging objects for batch={batch_id}")
+            return deleted
+        except Exception as e:
+            logger.warning(f"Error deleting buffered staging objects for batch={batch_id} ({type(e).__name__}): {e}")
+            return 0
+
     def _find_staging_tables(self, batch_id: str) -> List[str]:
         """
         Find all staging tables for a given batch.
@@ -894,6 +962,7 @@ class BatchConsolidator:
                 logger.warning(f"Unexpected error deleting staging table {table_id} ({type(e).__name__}): {e}")
 
         logger.info(f"Cleaned up {deleted_count}/{len(staging_tables)} staging tables for batch={batch_id}")
+        self._cleanup_buffered_objects(batch_id)
         return deleted_count
 
     def consolidate_batch(
@@ -993,6 +1062,20 @@ class BatchConsolidator:
         Returns:
             ConsolidationResult with rows affected and status
         """
+        # Buffered staging objects (if any) become one staging table first
+        try:
+            self._load_buffered_staging(batch_id)
+        except Exception as e:
+            error_msg = f"Failed to load buffered staging objects: {type(e).__name__}: {e}"
+            logger.error(f"{error_msg} (batch={batch_id})", exc_info=True)
+            return ConsolidationResult(
+                rows_affected=0,
+                staging_tables_merged=0,
+                staging_tables_cleaned=0,
+                success=False,
+                error_message=error_msg
+            )
+
         # Find all staging tables for this batch
         staging_tables = self._find_staging_tables(batch_id)
 
@@ -229,7 +229,8 @@ class InjuryFilter:
     def check_players_batch(
         self,
         player_lookups: List[str],
-        game_date: date
+        game_date: date,
+        refresh: bool = False
     ) -> Dict[str, InjuryStatus]:
         """
         Check injury status for multiple players efficiently
@@ -237,12 +238,17 @@ class InjuryFilter:
         Args:
             player_lookups: List of player identifiers
             game_date: Date of the game
+            refresh: Re-query players even if cached (the report changes
+                during the day; line re-scoring reuses rows prepared earlier)
 
         Returns:
             Dict mapping player_lookup to InjuryStatus
         """
         # Filter out already cached players
-        uncached = [p for p in player_lookups if f"{p}_{game_date}" not in self._cache]
+        if refresh:
+            uncached = list(dict.fromkeys(player_lookups))
+        else:
+            uncached = [p for p in player_lookups if f"{p}_{game_date}" not in self._cache]
 
         if uncached:
             query = """
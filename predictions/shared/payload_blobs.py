@@ -0,0 +1,137 @@
+# predictions/shared/payload_blobs.py
+
+"""
+Content-Addressed Payload Blobs - Shared Request Data by Reference
+
+The coordinator pre-loads every player's historical games for a batch and
+used to inline each player's list into that player's Pub/Sub request. That makes
+request messages several times bigger than the request itself.
+
+With PREDICTION_PAYLOAD_URI set, the coordinator writes the whole batch map
+ONCE as a gzipped JSON object named by its SHA-256:
+
+    {root}/payloads/{sha256[:2]}/{sha256}.json.gz
+
+and each request carries a small reference instead:
+
+    'historical_games_ref': {'store': 'gs://bucket/prefix',
+                             'name': 'payloads/ab/ab12....json.gz',
+                             'sha256': 'ab12...'}
+
+Workers resolve the reference with resolve_historical_games(); a decoded
+blob is cached per process (keyed by digest), so a worker downloads it once
+per batch no matter how many of the batch's requests it serves. If the blob
+cannot be read the worker falls back to querying BigQuery, exactly as when
+no pre-loaded games were sent.
+
+Backends are the staging_buffer stores (GCSStagingStore / LocalStagingStore).
+
+Configuration:
+    PREDICTION_PAYLOAD_URI=gs://bucket/prefix | file:///path | /path
+        Unset keeps inlined historical_games_batch payloads.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from predictions.shared.staging_buffer import get_staging_store
+
+logger = logging.getLogger(__name__)
+
+PAYLOAD_URI_ENV = 'PREDICTION_PAYLOAD_URI'
+PAYLOAD_PREFIX = 'payloads'
+_CACHE_ENTRIES = 4  # a worker serves one or two batches at a time
+
+_blob_cache: 'OrderedDict[str, Any]' = OrderedDict()
+_store_cache: Dict[str, Any] = {}
+_cache_lock = threading.Lock()
+
+
+def blob_name(digest: str) -> str:
+    """Object name of a payload with the given SHA-256 hex digest."""
+    return f"{PAYLOAD_PREFIX}/{digest[:2]}/{digest}.json.gz"
+
+
+class PayloadBlobStore:
+    """Writes JSON payloads as content-addressed objects and hands out references."""
+
+    def __init__(self, uri: str, store=None):
+        self.uri = uri
+        self.store = store if store is not None else get_staging_store(uri)
+
+    @classmethod
+    def from_env(cls) -> Optional['PayloadBlobStore']:
+        uri = os.environ.get(PAYLOAD_URI_ENV, '')
+        return cls(uri) if uri else None
+
+    def put(self, payload: Any) -> Dict[str, Any]:
+        """
+        Store ``payload`` (JSON-serializable) and return its reference.
+
+        Identical payloads map to the same object, so re-publishing a batch
+        rewrites the same name.
+        """
+        data = json.dumps(payload, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        name = blob_name(digest)
+        self.store.put(name, gzip.compress(data))
+        logger.info(f"Stored payload blob {name} ({len(data):,} bytes raw) in {self.uri}")
+        return {'store': self.uri, 'name': name, 'sha256': digest}
+
+
+def _remember(digest: str, payload: Any) -> None:
+    _blob_cache[digest] = payload
+    _blob_cache.move_to_end(digest)
+    while len(_blob_cache) > _CACHE_ENTRIES:
+        _blob_cache.popitem(last=False)
+
+
+def load_payload(ref: Dict[str, Any]) -> Any:
+    """
+    Load (and cache) the payload behind a reference returned by PayloadBlobStore.put().
+
+    Raises:
+        ValueError: The stored object does not match the reference digest.
+    """
+    digest = ref['sha256']
+    with _cache_lock:
+        if digest in _blob_cache:
+            _blob_cache.move_to_end(digest)
+            return _blob_cache[digest]
+        store = _store_cache.get(ref['store'])
+        if store is None:
+            store = _store_cache[ref['store']] = get_staging_store(ref['store'])
+
+    data = gzip.decompress(store.read(ref['name']))
+    if hashlib.sha256(data).hexdigest() != digest:
+        raise ValueError(f"Payload blob {ref['name']} does not match digest {digest}")
+    payload = json.loads(data)
+    with _cache_lock:
+        _remember(digest, payload)
+    return payload
+
+
+def resolve_historical_games(request_data: Dict[str, Any]) -> Optional[list]:
+    """
+    Pre-loaded historical games for a request, inline or by reference.
+
+    Returns:
+        The player's historical games, or None (worker queries BigQuery itself)
+    """
+    inline = request_data.get('historical_games_batch')
+    if inline is not None:
+        return inline
+    ref = request_data.get('historical_games_ref')
+    if not ref:
+        return None
+    try:
+        return load_payload(ref).get(request_data.get('player_lookup'))
+    except Exception as e:
+        logger.warning(f"Could not load historical games blob {ref.get('name')}: {e}")
+        return None
@@ -0,0 +1,385 @@
+# predictions/shared/staging_buffer.py
+
+"""
+Buffered Staging Writes - One Staging Source per Batch
+
+The table-per-write staging pattern (BatchStagingWriter) creates a
+_staging_{batch_id}_{worker_id} table on every worker write. Consolidation
+then lists the dataset, builds a UNION ALL MERGE over N tables and deletes
+N tables afterwards - on a full slate that fan-out dominates consolidation
+latency and burns table-operation quota.
+
+This module buffers prediction rows in memory and flushes them (by row
+count or age) as newline-delimited JSON objects under a single per-batch
+prefix in an object store:
+
+    {root}/{staging_dataset}/{batch_id}/{worker_id}_{seq}.json
+
+At consolidation time BatchConsolidator loads the whole prefix with ONE load
+job into _staging_{batch_id}_buffered and runs the usual MERGE over that
+single source. Objects are deleted together with the staging table.
+
+NDJSON (not Parquet) is used on purpose: it is the format
+load_table_from_json already sends, so JSON / ARRAY columns coerce exactly
+as they do for table-per-write staging.
+
+Backends:
+- GCSStagingStore:   gs://bucket/prefix (production)
+- LocalStagingStore: local directory (tests, local runs)
+
+Configuration:
+    STAGING_BUFFER_URI=gs://bucket/prefix | file:///path | /path
+        Unset keeps the table-per-write behaviour.
+    STAGING_BUFFER_FLUSH_ROWS (default 5000)
+    STAGING_BUFFER_FLUSH_SECONDS (default 30)
+"""
+
+import io
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from google.cloud import bigquery
+
+from predictions.shared.batch_staging_writer import (
+    BatchStagingWriter,
+    StagingWriteResult,
+    convert_numpy_types,
+)
+
+logger = logging.getLogger(__name__)
+
+STAGING_BUFFER_URI_ENV = 'STAGING_BUFFER_URI'
+DEFAULT_FLUSH_ROWS = 5000
+DEFAULT_FLUSH_SECONDS = 30.0
+# How long flush() waits for another thread's upload that holds the caller's rows
+UPLOAD_WAIT_SECONDS = 120.0
+
+
+def batch_object_prefix(staging_dataset: str, batch_id: str) -> str:
+    """Object prefix holding every buffered flush for one batch."""
+    return f"{staging_dataset}/{batch_id.replace('-', '_')}/"
+
+
+class LocalStagingStore:
+    """Staging objects as files under a local directory."""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.root, *name.split('/'))
+
+    def put(self, name: str, data: bytes) -> None:
+        path = self._path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)  # readers never see a partial object
+
+    def list(self, prefix: str) -> List[str]:
+        directory = self._path(prefix.rstrip('/'))
+        if not os.path.isdir(directory):
+            return []
+        return sorted(
+            f"{prefix.rstrip('/')}/{entry}"
+            for entry in os.listdir(directory)
+            if not entry.endswith('.tmp')
+        )
+
+    def read(self, name: str) -> bytes:
+        with open(self._path(name), 'rb') as f:
+            return f.read()
+
+    def delete(self, names: List[str]) -> int:
+        deleted = 0
+        for name in names:
+            try:
+                os.remove(self._path(name))
+                deleted += 1
+            except FileNotFoundError:
+                pass
+        return deleted
+
+    def load_to_table(self, bq_client: bigquery.Client, names: List[str], table_id: str,
+                      job_config: bigquery.LoadJobConfig):
+        """Load all objects with one load job (concatenated NDJSON upload)."""
+        payload = b''.join(self.read(name) for name in names)
+        return bq_client.load_table_from_file(io.BytesIO(payload), table_id, job_config=job_config)
+
+
+class GCSStagingStore:
+    """Staging objects in a GCS bucket under an optional base prefix."""
+
+    def __init__(self, bucket_name: str, base_prefix: str = '', storage_client=None):
+        if storage_client is None:
+            from google.cloud import storage
+            storage_client = storage.Client()
+        self.client = storage_client
+        self.bucket_name = bucket_name
+        self.bucket = storage_client.bucket(bucket_name)
+        self.base_prefix = base_prefix.strip('/')
+
+    def _key(self, name: str) -> str:
+        return f"{self.base_prefix}/{name}" if self.base_prefix else name
+
+    def put(self, name: str, data: bytes) -> None:
+        self.bucket.blob(self._key(name)).upload_from_string(data, content_type='application/x-ndjson')
+
+    def list(self, prefix: str) -> List[str]:
+        strip = len(self.base_prefix) + 1 if self.base_prefix else 0
+        return sorted(
+            blob.name[strip:]
+            for blob in self.client.list_blobs(self.bucket_name, prefix=self._key(prefix))
+        )
+
+    def read(self, name: str) -> bytes:
+        return self.bucket.blob(self._key(name)).download_as_bytes()
+
+    def delete(self, names: List[str]) -> int:
+        from google.api_core import exceptions as gcp_exceptions
+
+        deleted = 0
+        for name in names:
+            try:
+                self.bucket.blob(self._key(name)).delete()
+                deleted += 1
+            except gcp_exceptions.NotFound:
+                pass
+        return deleted
+
+    def load_to_table(self, bq_client: bigquery.Client, names: List[str], table_id: str,
+                      job_config: bigquery.LoadJobConfig):
+        """Load all objects with one load job (BigQuery reads them from GCS)."""
+        uris = [f"gs://{self.bucket_name}/{self._key(name)}" for name in names]
+        return bq_client.load_table_from_uri(uris, table_id, job_config=job_config)
+
+
+def get_staging_store(uri: Optional[str] = None):
+    """
+    Build the staging object store from STAGING_BUFFER_URI (or ``uri``).
+
+    Returns:
+        GCSStagingStore, LocalStagingStore, or None when buffering is not configured
+    """
+    uri = uri if uri is not None else os.environ.get(STAGING_BUFFER_URI_ENV, '')
+    if not uri:
+        return None
+    if uri.startswith('gs://'):
+        bucket_name, _, base_prefix = uri[len('gs://'):].partition('/')
+        return GCSStagingStore(bucket_name, base_prefix)
+    if uri.startswith('file://'):
+        uri = uri[len('file://'):]
+    return LocalStagingStore(uri)
+
+
+class _Upload:
+    """One batch buffer and, once flushed, the outcome of writing it."""
+
+    def __init__(self, worker_id: str):
+        self.worker_id = worker_id
+        self.rows: List[str] = []
+        self.since = time.time()
+        self.done = threading.Event()
+        self.result: Optional[StagingWriteResult] = None
+
+    def finish(self, result: StagingWriteResult) -> None:
+        self.result = result
+        self.rows = []  # written, or put back into the batch's current buffer
+        self.done.set()
+
+
+class BufferedStagingWriter(BatchStagingWriter):
+    """
+    Buffers staging rows in memory and flushes them to a per-batch object prefix.
+
+    Drop-in for BatchStagingWriter.write_to_staging(). Rows are flushed when a
+    batch's buffer reaches ``flush_rows`` or its oldest row is ``flush_seconds``
+    old; call flush() before acknowledging work that must be durable.
+
+    Worker threads share one buffer per batch, so a thread's rows may be
+    flushed by another thread. flush() therefore also waits for the uploads
+    holding rows this thread buffered and fails if any of them failed.
+
+    Usage:
+        writer = BufferedStagingWriter(bq_client, project_id, get_staging_store())
+        writer.write_to_staging(predictions, batch_id, worker_id)
+        result = writer.flush(batch_id)
+    """
+
+    def __init__(
+        self,
+        bq_client: bigquery.Client,
+        project_id: str,
+        store,
+        dataset_prefix: str = '',
+        flush_rows: Optional[int] = None,
+        flush_seconds: Optional[float] = None
+    ):
+        """
+        Initialize the buffered writer.
+
+        Args:
+            bq_client: BigQuery client instance (schema validation only)
+            project_id: GCP project ID
+            store: LocalStagingStore or GCSStagingStore
+            dataset_prefix: Optional dataset prefix for test isolation (e.g., "test")
+            flush_rows: Rows per batch that trigger a flush (env STAGING_BUFFER_FLUSH_ROWS)
+            flush_seconds: Buffer age that triggers a flush (env STAGING_BUFFER_FLUSH_SECONDS)
+        """
+        super().__init__(bq_client, project_id, dataset_prefix=dataset_prefix)
+        self.store = store
+        self.flush_rows = flush_rows if flush_rows is not None else int(
+            os.environ.get('STAGING_BUFFER_FLUSH_ROWS', DEFAULT_FLUSH_ROWS)
+        )
+        self.flush_seconds = flush_seconds if flush_seconds is not None else float(
+            os.environ.get('STAGING_BUFFER_FLUSH_SECONDS', DEFAULT_FLUSH_SECONDS)
+        )
+        self._lock = threading.Lock()
+        # batch_id -> buffer being filled
+        self._buffers: Dict[str, _Upload] = {}
+        self._sequence = 0
+        # Per thread: batch_id -> uploads holding rows this thread buffered
+        self._local = threading.local()
+
+    def _pending(self) -> Dict[str, List[_Upload]]:
+        if not hasattr(self._local, 'pending'):
+            self._local.pending = {}
+        return self._local.pending
+
+    def buffered_rows(self, batch_id: Optional[str] = None) -> int:
+        with self._lock:
+            if batch_id is not None:
+                buffer = self._buffers.get(batch_id)
+                return len(buffer.rows) if buffer else 0
+            return sum(len(b.rows) for b in self._buffers.values())
+
+    def write_to_staging(
+        self,
+        predictions: List[Dict[str, Any]],
+        batch_id: str,
+        worker_id: str
+    ) -> StagingWriteResult:
+        """
+        Buffer predictions for a batch, flushing if the size/age threshold is hit.
+
+        Returns:
+            StagingWriteResult. rows_written counts rows accepted into the buffer;
+            success is False only if a triggered flush failed.
+        """
+        prefix = batch_object_prefix(self.staging_dataset, batch_id)
+        if not predictions:
+            logger.warning(f"No predictions to write for batch={batch_id}, worker={worker_id}")
+            return StagingWriteResult(staging_table_name=prefix, rows_written=0, success=True)
+
+        # Session 159: Validate schema on first write to catch mismatches early
+        if not self._schema_validated:
+            validation = self.validate_output_schema(list(predictions[0].keys()))
+            self._schema_validated = True
+            if not validation['valid']:
+                error_msg = (
+                    f"SCHEMA MISMATCH: Worker output has {len(validation['missing_from_bq'])} fields "
+                    f"not in BQ table: {validation['missing_from_bq']}. Fix the BQ schema before retrying."
+                )
+                logger.critical(error_msg)
+                return StagingWriteResult(
+                    staging_table_name=prefix, rows_written=0, success=False, error_message=error_msg
+                )
+
+        lines = [json.dumps(convert_numpy_types(p)) for p in predictions]
+        with self._lock:
+            buffer = self._buffers.get(batch_id)
+            if buffer is None:
+                buffer = self._buffers[batch_id] = _Upload(worker_id)
+            buffer.rows.extend(lines)
+            due = (
+                len(buffer.rows) >= self.flush_rows
+                or time.time() - buffer.since >= self.flush_seconds
+            )
+        pending = self._pending().setdefault(batch_id, [])
+        if buffer not in pending:
+            pending.append(buffer)
+
+        if due:
+            result = self.flush(batch_id)
+            if not result.success:
+                return result
+
+        return StagingWriteResult(staging_table_name=prefix, rows_written=len(predictions), success=True)
+
+    def flush(self, batch_id: str) -> StagingWriteResult:
+        """
+        Write a batch's buffered rows as one object.
+
+        Then wait for every upload holding rows this thread buffered for the
+        batch (another thread may have flushed them). Succeeds only if all
+        of them were written. On failure the rows are put back so a later
+        flush (or retry) writes them.
+        """
+        prefix = batch_object_prefix(self.staging_dataset, batch_id)
+        with self._lock:
+            buffer = self._buffers.pop(batch_id, None)
+            self._sequence += 1
+            sequence = self._sequence
+        mine = self._pending().pop(batch_id, [])
+
+        result = StagingWriteResult(staging_table_name=prefix, rows_written=0, success=True)
+        if buffer is not None:
+            result = self._upload(batch_id, prefix, buffer, sequence)
+
+        for upload in mine:
+            if upload is buffer:
+                continue
+            if not upload.done.wait(UPLOAD_WAIT_SECONDS):
+                error_msg = f"Timed out waiting for a concurrent staging flush of batch {batch_id}"
+                logger.error(error_msg)
+                return StagingWriteResult(staging_table_name=prefix, rows_written=0, success=False,
+                                          error_message=error_msg)
+            if not upload.result.success:
+                return upload.result
+        return result
+
+    def _upload(self, batch_id: str, prefix: str, buffer: _Upload, sequence: int) -> StagingWriteResult:
+        if not buffer.rows:
+            result = StagingWriteResult(staging_table_name=prefix, rows_written=0, success=True)
+            buffer.finish(result)
+            return result
+
+        safe_worker_id = buffer.worker_id.replace('-', '_')
+        name = f"{prefix}{safe_worker_id}_{int(time.time() * 1000)}_{sequence:06d}.json"
+        start_time = time.time()
+        try:
+            self.store.put(name, ('\n'.join(buffer.rows) + '\n').encode('utf-8'))
+        except Exception as e:
+            with self._lock:
+                current = self._buffers.get(batch_id)
+                if current is None:
+                    current = self._buffers[batch_id] = _Upload(buffer.worker_id)
+                current.rows[:0] = buffer.rows
+                current.since = min(current.since, buffer.since)
+            error_msg = f"Buffered staging flush failed: {type(e).__name__}: {e}"
+            logger.error(f"{error_msg} (batch={batch_id}, rows={len(buffer.rows)})", exc_info=True)
+            result = StagingWriteResult(staging_table_name=name, rows_written=0, success=False,
+                                        error_message=error_msg)
+            buffer.finish(result)
+            return result
+
+        elapsed_ms = (time.time() - start_time) * 1000
+        rows_written = len(buffer.rows)
+        logger.info(
+            f"Staging flush complete: {rows_written} rows to {name} in {elapsed_ms:.1f}ms "
+            f"(batch={batch_id})"
+        )
+        result = StagingWriteResult(staging_table_name=name, rows_written=rows_written, success=True)
+        buffer.finish(result)
+        return result
+
+    def flush_all(self) -> List[StagingWriteResult]:
+        """Flush every batch that still has buffered rows (e.g., on shutdown)."""
+        with self._lock:
+            batch_ids = list(self._buffers)
+        return [self.flush(batch_id) for batch_id in batch_ids]
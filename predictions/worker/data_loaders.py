@@ -99,10 +99,13 @@ class PredictionDataLoader:
         # Query-level cache for BigQuery results (shared across instances via singleton)
         # Provides caching for expensive queries that don't change frequently
         # Uses TTL based on data freshness (shorter for same-day, longer for historical)
+        # Bounded by estimated bytes as well as entries: values are DataFrames / row lists.
+        # QUERY_CACHE_DISK_DIR lets gunicorn workers share warm entries across restarts.
         self._query_cache = get_query_cache(
             default_ttl_seconds=FEATURES_CACHE_TTL_HISTORICAL,
             max_size=5000,  # Limit memory usage
-            name="prediction_data_loader"
+            name="prediction_data_loader",
+            max_bytes=512 * 1024 * 1024,
         )
 
         logger.info(f"Initialized PredictionDataLoader for project {project_id} in {location} (dataset_prefix: {dataset_prefix or 'production'})")
@@ -0,0 +1,295 @@
+"""
+Resident Line-Delta Re-Scoring
+
+When prop lines arrive or move, /line-update and /check-lines superseded the
+players' predictions and ran the full machinery again: a new batch, Pub/Sub
+fan-out, a feature load per player, staging and consolidation. Only the
+line-dependent inputs actually change: the vegas features the models read
+and the line values the edge / recommendation are computed against.
+
+The worker already keeps its models loaded. It now also keeps the day's
+prepared feature rows resident (ResidentSlateStore): every production player
+it prepares is remembered together with the feature store's own vegas
+values. A line delta (worker /rescore-lines) then only:
+
+    1. restores the feature-store vegas columns and re-applies the new line
+       with apply_line_features() - the same code the full path runs
+    2. re-runs the models on the affected rows, one model call per system
+       (batch_inference)
+    3. stages the superseding predictions in one write; the coordinator
+       merges them with one consolidation
+
+The injury report is re-queried for the re-scored players first (the
+resident row may be hours old): players now OUT are skipped and the others
+carry the current injury fields, exactly as the full path records them.
+
+Players the serving instance has not prepared (fresh instance, evicted, or a
+different game_id) come back as missing and take the full path.
+
+Environment:
+    LINE_RESCORE_MODE: 'resident' (default) or 'off'
+    LINE_RESCORE_MAX_DATES: game dates kept resident (default 2)
+    LINE_RESCORE_TTL_SECONDS: max age of a resident row (default 21600)
+
+Created: 2026-10-16
+"""
+
+import copy
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Vegas model features overridden from the request's line (indices 25-28)
+VEGAS_FEATURES = ('vegas_points_line', 'vegas_opening_line', 'vegas_line_move', 'has_vegas_line')
+
+# Feature-store values restored before a new line is applied
+LINE_BASE_KEYS = VEGAS_FEATURES + ('vegas_source',)
+
+DEFAULT_MAX_DATES = 2
+DEFAULT_TTL_SECONDS = 6 * 3600
+
+
+def resident_enabled() -> bool:
+    """Return False when LINE_RESCORE_MODE=off."""
+    return os.environ.get('LINE_RESCORE_MODE', 'resident').lower() != 'off'
+
+
+def snapshot_line_base(features: Dict) -> Dict:
+    """Feature-store line values, taken before apply_line_features()."""
+    return {key: features[key] for key in LINE_BASE_KEYS if key in features}
+
+
+def apply_line_features(features: Dict, line_source_info: Dict, line_values: List[float]) -> Optional[float]:
+    """
+    Inject the request's line into a prepared feature dict (in place).
+
+    Sets the line source tracking fields and overrides the vegas features
+    from actual_prop_line (or the median of line_values when the coordinator
+    only sent fresh line values).
+
+    Returns:
+        The line used for the vegas features, or None when no line was applied
+    """
+    # v3.2: Inject line source tracking info into features for format_prediction_for_bigquery
+    features['has_prop_line'] = line_source_info.get('has_prop_line', True)
+    features['line_source'] = line_source_info.get('line_source', 'ACTUAL_PROP')
+    features['actual_prop_line'] = line_source_info.get('actual_prop_line')
+    features['estimated_line_value'] = line_source_info.get('estimated_line_value')
+    features['estimation_method'] = line_source_info.get('estimation_method')
+    # v3.3: Add line source API and sportsbook tracking
+    features['line_source_api'] = line_source_info.get('line_source_api')
+    features['sportsbook'] = line_source_info.get('sportsbook')
+    features['was_line_fallback'] = line_source_info.get('was_line_fallback', False)
+    # v3.6: Add line timing tracking (how close to closing line)
+    features['line_minutes_before_game'] = line_source_info.get('line_minutes_before_game')
+    # Session 77 FIX: Extract prediction_run_mode for BigQuery record
+    # Bug: Session 76 added to line_source_info but forgot to extract to features
+    features['prediction_run_mode'] = line_source_info.get('prediction_run_mode', 'OVERNIGHT')
+
+    # Session 79: Extract Kalshi prediction market data
+    features['kalshi_available'] = line_source_info.get('kalshi_available', False)
+    features['kalshi_line'] = line_source_info.get('kalshi_line')
+    features['kalshi_yes_price'] = line_source_info.get('kalshi_yes_price')
+    features['kalshi_no_price'] = line_source_info.get('kalshi_no_price')
+    features['kalshi_liquidity'] = line_source_info.get('kalshi_liquidity')
+    features['kalshi_market_ticker'] = line_source_info.get('kalshi_market_ticker')
+    features['line_discrepancy'] = line_source_info.get('line_discrepancy')
+
+    # Session 169: Save feature store original Vegas values BEFORE coordinator override.
+    # This enables post-hoc investigation of the disconnect between feature store (has data)
+    # and model input (may be null after override logic).
+    features['_fs_original_vegas_points_line'] = features.get('vegas_points_line')
+    features['_fs_original_has_vegas_line'] = features.get('has_vegas_line')
+
+    actual_prop = line_source_info.get('actual_prop_line')
+
+    # Session 169 FIX: Coordinator sets actual_prop_line from Phase 3's stale
+    # current_points_line (often NULL for pre-game), but sends fresh line_values
+    # from real-time odds queries. When actual_prop is None but we KNOW real lines
+    # exist (has_prop_line=True), use the median line_value as the Vegas override.
+    # This was the root cause of the UNDER bias crisis: model predicted without
+    # its most important feature (#25 vegas_points_line) for all FIRST-run predictions.
+    if actual_prop is None and line_source_info.get('has_prop_line') and line_values:
+        # Session 172: Validate line_values before median calculation
+        valid_lines = [v for v in line_values if isinstance(v, (int, float)) and v > 0]
+        if not valid_lines:
+            logger.warning(
+                f"Recovery median: line_values contained no valid numbers: {line_values}"
+            )
+            features['vegas_source'] = 'none'
+        else:
+            sorted_lines = sorted(valid_lines)
+            median_line = sorted_lines[len(sorted_lines) // 2]
+            # Session 172: Reduce noise — DEBUG per-prediction, summary logged by coordinator
+            logger.debug(
+                f"Vegas line recovery: actual_prop_line was None but has_prop_line=True "
+                f"with {len(valid_lines)} valid line_values. Using median line {median_line} "
+                f"(lines: {sorted_lines})"
+            )
+            actual_prop = median_line
+            features['vegas_source'] = 'recovery_median'  # Session 170: Track Vegas source
+
+    if actual_prop is not None:
+        # Vegas features (indices 25-28)
+        features['vegas_points_line'] = actual_prop
+        features['vegas_opening_line'] = actual_prop  # Use same as closing (no opening data)
+        features['vegas_line_move'] = 0.0  # No line movement data available
+        features['has_vegas_line'] = 1.0  # CRITICAL: Must be 1.0 when we have a line!
+        # Session 170: Track Vegas source (only set if not already set by recovery above)
+        if 'vegas_source' not in features:
+            features['vegas_source'] = 'coordinator_actual'
+    elif features.get('vegas_points_line') is not None:
+        # Session 168: Preserve feature store vegas values when coordinator has no line.
+        # Previously this branch nulled out valid feature store data, causing
+        # PRE_GAME predictions to run blind (e.g., Feb 4 -3.44 avg_pvl bug).
+        logger.info(f"No actual_prop_line from coordinator, preserving feature store vegas_points_line={features.get('vegas_points_line')}")
+        features['has_vegas_line'] = 1.0
+        features['vegas_source'] = 'feature_store'  # Session 170: Track Vegas source
+    else:
+        # No prop line from coordinator AND no line in feature store
+        features['vegas_points_line'] = None
+        features['vegas_opening_line'] = None
+        features['vegas_line_move'] = None
+        features['has_vegas_line'] = 0.0
+        features['vegas_source'] = 'none'  # Session 170: Track Vegas source
+
+    return actual_prop
+
+
+def apply_injury_status(features: Dict, metadata: Dict, injury_status: Any) -> None:
+    """Record an injury check (InjuryStatus) on a prepared row (in place)."""
+    # Inject injury info into features for format_prediction_for_bigquery
+    features['injury_status_at_prediction'] = injury_status.injury_status.upper() if injury_status.injury_status else None
+    features['injury_flag_at_prediction'] = injury_status.has_warning or injury_status.should_skip
+    features['injury_reason_at_prediction'] = injury_status.reason
+    features['injury_checked_at'] = datetime.utcnow().isoformat()
+
+    # Track in metadata
+    metadata['injury_status'] = injury_status.injury_status
+    metadata['injury_has_warning'] = injury_status.has_warning
+    metadata['injury_should_skip'] = injury_status.should_skip
+
+
+@dataclass
+class ResidentPlayer:
+    """One prepared player row kept in memory."""
+    player_lookup: str
+    game_date: date
+    game_id: str
+    features: Dict[str, Any]
+    metadata: Dict[str, Any]
+    line_base: Dict[str, Any]
+    stored_at: float = field(default_factory=time.time)
+
+
+class ResidentSlateStore:
+    """
+    Thread-safe per-date map of player -> prepared features.
+
+    Keeps the most recent ``max_dates`` game dates; rows older than
+    ``ttl_seconds`` are treated as missing so injury / context data is
+    never reused for too long.
+    """
+
+    def __init__(self, max_dates: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        self.max_dates = max_dates or int(os.environ.get('LINE_RESCORE_MAX_DATES', DEFAULT_MAX_DATES))
+        self.ttl_seconds = ttl_seconds or float(os.environ.get('LINE_RESCORE_TTL_SECONDS', DEFAULT_TTL_SECONDS))
+        self._slates: Dict[date, Dict[str, ResidentPlayer]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def remember(
+        self,
+        player_lookup: str,
+        game_date: date,
+        game_id: str,
+        features: Dict,
+        metadata: Dict,
+        line_base: Dict,
+    ) -> None:
+        """Store a copy of a player's prepared features (before any model runs)."""
+        resident = ResidentPlayer(
+            player_lookup=player_lookup,
+            game_date=game_date,
+            game_id=game_id,
+            features=copy.deepcopy(features),
+            metadata=copy.deepcopy(metadata),
+            line_base=dict(line_base),
+        )
+        with self._lock:
+            self._slates.setdefault(game_date, {})[player_lookup] = resident
+            for stale_date in sorted(self._slates)[:-self.max_dates]:
+                evicted = self._slates.pop(stale_date)
+                logger.info(f"[LINE_RESCORE] Evicted {len(evicted)} resident players for {stale_date}")
+
+    def get(self, game_date: date, player_lookup: str, game_id: Optional[str] = None) -> Optional[ResidentPlayer]:
+        with self._lock:
+            resident = self._slates.get(game_date, {}).get(player_lookup)
+            if resident is not None and (
+                time.time() - resident.stored_at > self.ttl_seconds
+                or (game_id is not None and resident.game_id != game_id)
+            ):
+                resident = None
+            if resident is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return resident
+
+    def rebase(
+        self,
+        resident: ResidentPlayer,
+        line_source_info: Dict,
+        line_values: List[float],
+        injury_status: Any = None,
+    ) -> Tuple[Dict, Dict]:
+        """
+        Fresh (features, metadata) for a resident player at a new line.
+
+        injury_status (a re-checked InjuryStatus) replaces the injury fields
+        recorded when the row was prepared. The stored row is never modified,
+        so it can be re-based again on the next line move.
+        """
+        features = copy.deepcopy(resident.features)
+        for key in LINE_BASE_KEYS:
+            features.pop(key, None)
+        features.update(resident.line_base)
+
+        actual_prop = apply_line_features(features, line_source_info, line_values)
+        _refresh_vegas_fallbacks(features, actual_prop)
+        metadata = copy.deepcopy(resident.metadata)
+        if injury_status is not None:
+            apply_injury_status(features, metadata, injury_status)
+        return features, metadata
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(players) for players in self._slates.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'dates': [str(d) for d in sorted(self._slates)],
+                'players': sum(len(players) for players in self._slates.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+def _refresh_vegas_fallbacks(features: Dict, actual_prop: Optional[float]) -> None:
+    """Recompute the V8 fallback tracking fields after the vegas features changed."""
+    if '_v8_fallback_features' not in features:
+        return
+    from predictions.worker.prediction_systems.catboost_v8 import classify_fallback_severity
+
+    other = [name for name in features['_v8_fallback_features'] if name not in VEGAS_FEATURES]
+    fallbacks = (list(VEGAS_FEATURES) if actual_prop is None else []) + other
+    features['_v8_fallback_features'] = fallbacks
+    features['_v8_fallback_severity'] = classify_fallback_severity(fallbacks).value
@@ -375,6 +375,11 @@ class CatBoostMonthly(CatBoostV8):
     from feature_contract.py instead of hardcoded.
     """
 
+    # Feature sets extracted by name (_predict_v12); all others use the V9 path
+    NAME_BASED_FEATURE_SETS = (
+        'v12', 'v12_noveg', 'v13', 'v13_noveg', 'v15', 'v15_noveg', 'v16_noveg', 'v17_noveg',
+    )
+
     def __init__(self, model_id: str, config: dict = None):
         if config is None:
             # Legacy: look up in MONTHLY_MODELS dict
@@ -511,7 +516,7 @@ class CatBoostMonthly(CatBoostV8):
         Feature-set-aware: V9 models use parent class extraction (33 features),
         V12 models use name-based extraction (54f with vegas, 50f without).
         """
-        if self._feature_set in ('v12', 'v12_noveg', 'v13', 'v13_noveg', 'v15', 'v15_noveg', 'v16_noveg', 'v17_noveg'):
+        if self._feature_set in self.NAME_BASED_FEATURE_SETS:
             # V12+ path: dynamic feature extraction (50f-60f depending on feature set)
             return self._predict_v12(player_lookup, features, betting_line)
         else:
@@ -710,6 +715,21 @@ class CatBoostMonthly(CatBoostV8):
 
         return result
 
+    def prepare_batch_vector(self, features: Dict) -> Optional[np.ndarray]:
+        """
+        Return the exact vector predict() passes to model.predict() (batch inference).
+
+        XGBoost models predict on a DMatrix built inside _predict_v12, so they
+        are not batched (returns None and predict() calls the model per row).
+        """
+        if self.model is None:
+            return None
+        if self._feature_set in self.NAME_BASED_FEATURE_SETS:
+            if getattr(self, '_is_xgboost', False):
+                return None
+            return self._prepare_v12_feature_vector(features)
+        return super().prepare_batch_vector(features)
+
     def _prepare_v12_feature_vector(self, features: Dict) -> Optional[np.ndarray]:
         """Build feature vector for V12/V16 models from feature store by name.
 
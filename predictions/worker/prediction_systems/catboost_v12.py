@@ -243,6 +243,12 @@ class CatBoostV12:
             },
         }
 
+    def prepare_batch_vector(self, features: Dict) -> Optional[np.ndarray]:
+        """Return the exact vector predict() passes to model.predict() (batch inference)."""
+        if self.model is None:
+            return None
+        return self._prepare_feature_vector(features)
+
     def _prepare_feature_vector(self, features: Dict) -> Optional[np.ndarray]:
         """Build 50-feature vector from feature store by name.
 
@@ -907,6 +907,26 @@ class CatBoostV8:
             'calibration_method': 'none',
         }
 
+    def prepare_batch_vector(self, features: Dict) -> Optional[np.ndarray]:
+        """
+        Return the exact (1, 33) vector predict() passes to model.predict().
+
+        Used by batch inference to score many players with one model call.
+        Mirrors the worker's predict() call (no explicit vegas/opponent/PPM
+        overrides - all values come from the features dict).
+        """
+        if self.model is None:
+            return None
+        return self._prepare_feature_vector(
+            features=features,
+            vegas_line=None,
+            vegas_opening=None,
+            opponent_avg=None,
+            games_vs_opponent=None,
+            minutes_avg_last_10=None,
+            ppm_avg_last_10=None,
+        )
+
     def get_model_info(self) -> Dict:
         """Get model information"""
         info = {
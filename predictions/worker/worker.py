@@ -155,6 +155,14 @@ if TYPE_CHECKING:
     from predictions.shared.injury_filter import InjuryFilter, InjuryStatus, DNPHistory
 
 from predictions.worker.write_metrics import PredictionWriteMetrics
+from predictions.shared.payload_blobs import resolve_historical_games
+from predictions.worker.line_rescoring import (
+    ResidentSlateStore,
+    apply_injury_status,
+    apply_line_features,
+    resident_enabled,
+    snapshot_line_base,
+)
 from shared.utils.bigquery_retry import retry_on_quota_exceeded
 from shared.validation.prediction_sanity import validate_prediction_record
 
@@ -220,6 +228,7 @@ _breakout_classifier = None  # Session 128: Breakout classifier for shadow mode
 _catboost_v12 = None  # Session 230: CatBoost V12 no-vegas shadow model
 _systems_initialized = False  # Session 391: Separate sentinel from _catboost (may be None when V9 disabled)
 _monthly_models_loaded_at: Optional[float] = None  # epoch timestamp of last registry read
+_resident_store: Optional[ResidentSlateStore] = None  # Prepared rows kept for line-delta re-scoring
 # Session 474: TTL-based registry refresh — re-read BQ model registry every N seconds
 # so enabled/disabled changes take effect within one batch cycle (default: 4 hours).
 # Eliminates the need to manually update MODEL_CACHE_REFRESH after registry changes.
@@ -246,15 +255,29 @@ def get_bq_client() -> 'bigquery.Client':
     return _bq_client
 
 def get_staging_writer() -> 'BatchStagingWriter':
-    """Lazy-load staging writer on first use"""
+    """Lazy-load staging writer on first use (buffered when STAGING_BUFFER_URI is set)"""
     from batch_staging_writer import BatchStagingWriter
+    from predictions.shared.staging_buffer import BufferedStagingWriter, get_staging_store
     global _staging_writer
     if _staging_writer is None:
-        logger.info("Initializing BatchStagingWriter...")
-        _staging_writer = BatchStagingWriter(get_bq_client(), PROJECT_ID)
-        logger.info("BatchStagingWriter initialized")
+        staging_store = get_staging_store()
+        if staging_store is not None:
+            logger.info(f"Initializing BufferedStagingWriter ({type(staging_store).__name__})...")
+            _staging_writer = BufferedStagingWriter(get_bq_client(), PROJECT_ID, staging_store)
+        else:
+            logger.info("Initializing BatchStagingWriter...")
+            _staging_writer = BatchStagingWriter(get_bq_client(), PROJECT_ID)
+        logger.info(f"{type(_staging_writer).__name__} initialized")
     return _staging_writer
 
+def get_resident_store() -> ResidentSlateStore:
+    """Lazy-load the resident slate store used by /rescore-lines"""
+    global _resident_store
+    if _resident_store is None:
+        _resident_store = ResidentSlateStore()
+    return _resident_store
+
+
 def get_pubsub_publisher() -> 'pubsub_v1.PublisherClient':
     """Lazy-load Pub/Sub publisher on first use via pool"""
     from shared.clients import get_pubsub_publisher as get_pooled_publisher
@@ -714,6 +737,36 @@ def validate_line_quality(predictions: List[Dict], player_lookup: str, game_date
     return True, None
 
 
+def _build_line_source_info(request_data: Dict) -> Dict:
+    """Line source, market and team context fields carried from the request into each prediction."""
+    return {
+        'has_prop_line': request_data.get('has_prop_line', True),  # Default True for backwards compat
+        'actual_prop_line': request_data.get('actual_prop_line'),
+        'line_source': request_data.get('line_source', 'ACTUAL_PROP'),  # Default to actual
+        'estimated_line_value': request_data.get('estimated_line_value'),
+        'estimation_method': request_data.get('estimation_method'),
+        # v3.3: Line source API and sportsbook tracking
+        'line_source_api': request_data.get('line_source_api'),  # 'ODDS_API', 'BETTINGPROS', 'ESTIMATED'
+        'sportsbook': request_data.get('sportsbook'),  # 'DRAFTKINGS', 'FANDUEL', etc.
+        'was_line_fallback': request_data.get('was_line_fallback', False),  # True if not primary
+        # v3.6: Line timing tracking (how close to closing line was the captured line)
+        'line_minutes_before_game': request_data.get('line_minutes_before_game'),  # Minutes before tipoff
+        # v4.0: Team context for teammate injury impact
+        'team_abbr': request_data.get('team_abbr'),
+        'opponent_team_abbr': request_data.get('opponent_team_abbr'),
+        # Session 76: Run mode tracking for early vs overnight analysis
+        'prediction_run_mode': request_data.get('prediction_run_mode', 'OVERNIGHT'),
+        # Session 79: Kalshi prediction market data
+        'kalshi_available': request_data.get('kalshi_available', False),
+        'kalshi_line': request_data.get('kalshi_line'),
+        'kalshi_yes_price': request_data.get('kalshi_yes_price'),
+        'kalshi_no_price': request_data.get('kalshi_no_price'),
+        'kalshi_liquidity': request_data.get('kalshi_liquidity'),
+        'kalshi_market_ticker': request_data.get('kalshi_market_ticker'),
+        'line_discrepancy': request_data.get('line_discrepancy'),
+    }
+
+
 @app.route('/predict', methods=['POST'])
 def handle_prediction_request():
     """
@@ -770,6 +823,10 @@ def handle_prediction_request():
         # Extract correlation_id for request tracing
         correlation_id = request_data.get('correlation_id')
 
+        # Batch mode: coordinator published a chunk of players in one message
+        if 'players' in request_data:
+            return handle_batch_prediction_request(request_data)
+
         # Validate required fields — ACK (204) malformed messages to prevent poison pill retries
         required_fields = ['player_lookup', 'game_date', 'game_id']
         missing_fields = [field for field in required_fields if field not in request_data]
@@ -789,10 +846,9 @@ def handle_prediction_request():
         game_id = request_data['game_id']
         line_values = request_data.get('line_values') or []  # Handle explicit None from JSON
         batch_id = request_data.get('batch_id')  # From coordinator for staging writes
-        prediction_run_mode = request_data.get('prediction_run_mode', 'OVERNIGHT')  # Session 76: Traceability
 
         # BATCH OPTIMIZATION: Extract pre-loaded historical games if available
-        historical_games_batch = request_data.get('historical_games_batch')
+        historical_games_batch = resolve_historical_games(request_data)
         if historical_games_batch:
             logger.info(f"Worker using pre-loaded historical games ({len(historical_games_batch)} games) from coordinator")
 
@@ -806,32 +862,7 @@ def handle_prediction_request():
             data_loader = get_data_loader()  # Use cached production loader
 
         # v3.2: Extract line source tracking info, v3.3: Add API/sportsbook tracking
-        line_source_info = {
-            'has_prop_line': request_data.get('has_prop_line', True),  # Default True for backwards compat
-            'actual_prop_line': request_data.get('actual_prop_line'),
-            'line_source': request_data.get('line_source', 'ACTUAL_PROP'),  # Default to actual
-            'estimated_line_value': request_data.get('estimated_line_value'),
-            'estimation_method': request_data.get('estimation_method'),
-            # v3.3: Line source API and sportsbook tracking
-            'line_source_api': request_data.get('line_source_api'),  # 'ODDS_API', 'BETTINGPROS', 'ESTIMATED'
-            'sportsbook': request_data.get('sportsbook'),  # 'DRAFTKINGS', 'FANDUEL', etc.
-            'was_line_fallback': request_data.get('was_line_fallback', False),  # True if not primary
-            # v3.6: Line timing tracking (how close to closing line was the captured line)
-            'line_minutes_before_game': request_data.get('line_minutes_before_game'),  # Minutes before tipoff
-            # v4.0: Team context for teammate injury impact
-            'team_abbr': request_data.get('team_abbr'),
-            'opponent_team_abbr': request_data.get('opponent_team_abbr'),
-            # Session 76: Run mode tracking for early vs overnight analysis
-            'prediction_run_mode': prediction_run_mode,
-            # Session 79: Kalshi prediction market data
-            'kalshi_available': request_data.get('kalshi_available', False),
-            'kalshi_line': request_data.get('kalshi_line'),
-            'kalshi_yes_price': request_data.get('kalshi_yes_price'),
-            'kalshi_no_price': request_data.get('kalshi_no_price'),
-            'kalshi_liquidity': request_data.get('kalshi_liquidity'),
-            'kalshi_market_ticker': request_data.get('kalshi_market_ticker'),
-            'line_discrepancy': request_data.get('line_discrepancy'),
-        }
+        line_source_info = _build_line_source_info(request_data)
 
         # Convert date string to date object
         game_date = datetime.strptime(game_date_str, '%Y-%m-%d').date()
@@ -1059,6 +1090,380 @@ def handle_prediction_request():
         return ('Internal Server Error', 500)
 
 
+def handle_batch_prediction_request(request_data: Dict):
+    """
+    Handle a coordinator chunk of players published as one Pub/Sub message.
+
+    Expected message format:
+    {
+        'batch_id': '...', 'correlation_id': '...', 'prediction_run_mode': 'OVERNIGHT',
+        'dataset_prefix': '',               # optional
+        'players': [<single-player /predict message>, ...]
+    }
+
+    Chunk-level fields are defaults for every player entry. Features are
+    prepared per player exactly as in the single-player path, then each ML
+    model is called once for the whole chunk (batch_inference) and the
+    results are fanned back out into the same per-player records.
+
+    Returns:
+        204 when every player was written or permanently skipped
+        500 if any player hit a transient failure. Nothing is written in
+            that case, so the Pub/Sub retry redoes the chunk without
+            duplicate staging rows.
+    """
+    from batch_inference import batch_inference
+    from datetime import date as _date_type, timedelta
+
+    start_time = time.time()
+    player_registry = get_player_registry()
+    moving_average, zone_matchup, catboost = get_prediction_systems()
+    circuit_breaker = get_circuit_breaker()
+    execution_logger = get_execution_logger()
+
+    chunk_defaults = {
+        k: request_data[k]
+        for k in ('batch_id', 'correlation_id', 'prediction_run_mode', 'dataset_prefix', 'game_date')
+        if k in request_data
+    }
+    players = [{**chunk_defaults, **player} for player in (request_data.get('players') or [])]
+    required_fields = ['player_lookup', 'game_date', 'game_id']
+    malformed = [p for p in players if any(field not in p for field in required_fields)]
+    if malformed:
+        logger.error(
+            f"POISON_MESSAGE: {len(malformed)}/{len(players)} chunk entries missing {required_fields} — skipping them"
+        )
+    players = [p for p in players if p not in malformed]
+    if not players:
+        return ('', 204)
+
+    batch_id = request_data.get('batch_id')
+    correlation_id = request_data.get('correlation_id')
+    dataset_prefix = request_data.get('dataset_prefix', '')
+    if dataset_prefix:
+        from data_loaders import PredictionDataLoader
+        data_loader = PredictionDataLoader(PROJECT_ID, dataset_prefix=dataset_prefix)
+    else:
+        data_loader = get_data_loader()
+
+    logger.info(
+        f"Processing prediction chunk: {len(players)} players "
+        f"(batch={batch_id}, dataset_prefix: {dataset_prefix or 'production'}, correlation_id: {correlation_id})"
+    )
+
+    # Steps 1-3 per player (feature load, validation, enrichment)
+    entries = []
+    for player in players:
+        entry = {
+            'player_lookup': player['player_lookup'],
+            'game_date_str': player['game_date'],
+            'game_id': player['game_id'],
+            'line_values': player.get('line_values') or [],
+            'universal_player_id': None,
+            'error': None,
+            'result': None,
+        }
+        entries.append(entry)
+        try:
+            entry['game_date'] = datetime.strptime(entry['game_date_str'], '%Y-%m-%d').date()
+            try:
+                entry['universal_player_id'] = player_registry.get_universal_id(entry['player_lookup'], required=False)
+            except Exception as e:
+                logger.warning(f"Failed to get universal_player_id for {entry['player_lookup']}: {e}")
+
+            prepared = _prepare_player_features(
+                player_lookup=entry['player_lookup'],
+                game_date=entry['game_date'],
+                line_values=entry['line_values'],
+                data_loader=data_loader,
+                line_source_info=_build_line_source_info(player),
+                historical_games_batch=resolve_historical_games(player)
+            )
+            if 'features' in prepared:
+                entry['prepared'] = prepared
+                _remember_resident(entry['player_lookup'], entry['game_date'], entry['game_id'], prepared, data_loader)
+            else:
+                entry['result'] = prepared
+        except Exception as e:
+            logger.error(f"Error preparing {entry['player_lookup']} in chunk: {e}", exc_info=True)
+            entry['error'] = e
+
+    # Step 4: one model call per system for the chunk, then per-player fan-out
+    ready = [e for e in entries if 'prepared' in e]
+    systems = [catboost, *(_monthly_models or []), _catboost_v12]
+    with batch_inference(systems, [e['prepared']['features'] for e in ready]) as batched_rows:
+        for entry in ready:
+            try:
+                entry['result'] = _run_prediction_systems(
+                    player_lookup=entry['player_lookup'],
+                    game_date=entry['game_date'],
+                    game_id=entry['game_id'],
+                    line_values=entry['line_values'],
+                    features=entry['prepared']['features'],
+                    metadata=entry['prepared']['metadata'],
+                    circuit_breaker=circuit_breaker
+                )
+            except Exception as e:
+                logger.error(f"Error predicting {entry['player_lookup']} in chunk: {e}", exc_info=True)
+                entry['error'] = e
+    logger.info(f"Batch inference: {len(ready)}/{len(entries)} players scored, rows per model call: {batched_rows}")
+
+    # Classify outcomes the same way the single-player handler does
+    today = _date_type.today()
+    to_write, completed, transient = [], [], []
+    for entry in entries:
+        player_lookup = entry['player_lookup']
+        game_date = entry.get('game_date')
+        if entry['error'] is not None:
+            execution_logger.log_failure(
+                player_lookup=player_lookup,
+                universal_player_id=entry['universal_player_id'],
+                game_date=entry['game_date_str'],
+                game_id=entry['game_id'],
+                line_values=entry['line_values'],
+                duration_seconds=time.time() - start_time,
+                error_message=str(entry['error']),
+                error_type=type(entry['error']).__name__
+            )
+            if game_date is None or game_date < today - timedelta(days=1):
+                logger.warning(f"STALE_MESSAGE: Exception for {player_lookup} on {entry['game_date_str']} — ACKing")
+            else:
+                transient.append(player_lookup)
+            continue
+
+        predictions = entry['result']['predictions']
+        metadata = entry['result']['metadata']
+        if predictions:
+            validation_passed, validation_error = validate_line_quality(predictions, player_lookup, entry['game_date_str'])
+            if not validation_passed:
+                logger.error(f"LINE QUALITY VALIDATION FAILED: {validation_error}")
+                if game_date >= today:
+                    transient.append(player_lookup)
+                continue
+            to_write.append(entry)
+            continue
+
+        execution_logger.log_failure(
+            player_lookup=player_lookup,
+            universal_player_id=entry['universal_player_id'],
+            game_date=entry['game_date_str'],
+            game_id=entry['game_id'],
+            line_values=entry['line_values'],
+            duration_seconds=time.time() - start_time,
+            error_message=metadata.get('error_message', 'No predictions generated'),
+            error_type=metadata.get('error_type', 'UnknownError'),
+            skip_reason=metadata.get('skip_reason'),
+            systems_attempted=metadata.get('systems_attempted', []),
+            systems_failed=metadata.get('systems_failed', []),
+            circuit_breaker_triggered=metadata.get('circuit_breaker_triggered', False),
+            circuits_opened=metadata.get('circuits_opened', [])
+        )
+        skip_reason = metadata.get('skip_reason') or 'unknown'
+        if skip_reason in PERMANENT_SKIP_REASONS or game_date < today:
+            completed.append((player_lookup, entry['game_date_str'], 0))
+        else:
+            transient.append(player_lookup)
+
+    if transient:
+        logger.error(
+            f"TRANSIENT failure for {len(transient)}/{len(entries)} players in chunk "
+            f"(batch={batch_id}): {transient[:10]} - returning 500 to retry the chunk"
+        )
+        return ('Transient failure in chunk - triggering retry', 500)
+
+    # One staging write for the whole chunk
+    all_predictions = [p for entry in to_write for p in entry['result']['predictions']]
+    write_start = time.time()
+    write_success = write_predictions_to_bigquery(all_predictions, batch_id=batch_id, dataset_prefix=dataset_prefix)
+    write_duration = time.time() - write_start
+    if not write_success:
+        logger.error(f"Staging write failed for chunk of {len(to_write)} players - returning 500 (batch={batch_id})")
+        return ('Staging write failed - triggering retry', 500)
+
+    completed.extend((e['player_lookup'], e['game_date_str'], len(e['result']['predictions'])) for e in to_write)
+    pubsub_start = time.time()
+    for player_lookup, game_date_str, count in completed:
+        publish_completion_event(player_lookup, game_date_str, count, batch_id=batch_id, correlation_id=correlation_id)
+    pubsub_duration = time.time() - pubsub_start
+
+    duration = time.time() - start_time
+    for entry in to_write:
+        metadata = entry['result']['metadata']
+        execution_logger.log_success(
+            player_lookup=entry['player_lookup'],
+            universal_player_id=entry['universal_player_id'],
+            game_date=entry['game_date_str'],
+            game_id=entry['game_id'],
+            line_values=entry['line_values'],
+            duration_seconds=duration,
+            predictions_generated=len(entry['result']['predictions']),
+            systems_succeeded=metadata.get('systems_succeeded', []),
+            systems_failed=metadata.get('systems_failed', []),
+            system_errors=metadata.get('system_errors', {}),
+            feature_quality_score=metadata.get('feature_quality_score', 0),
+            historical_games_count=metadata.get('historical_games_count', 0),
+            performance_breakdown={
+                'data_load': metadata.get('data_load_seconds', 0),
+                'prediction_compute': metadata.get('prediction_compute_seconds', 0),
+                'write_bigquery': write_duration,
+                'pubsub_publish': pubsub_duration
+            }
+        )
+
+    logger.info(
+        f"Successfully generated {len(all_predictions)} predictions for {len(to_write)}/{len(entries)} "
+        f"players in chunk ({duration:.1f}s)"
+    )
+    return ('', 204)
+
+
+@app.route('/rescore-lines', methods=['POST'])
+def rescore_lines():
+    """
+    Re-score resident players after a line delta (called by the coordinator).
+
+    Uses the feature rows this instance already prepared for the day: only the
+    line-dependent features are re-applied, each model runs once for all
+    affected players, and the predictions are staged in one write under
+    batch_id. The coordinator consolidates the batch.
+
+    Request body:
+    {
+        "game_date": "2026-02-13",
+        "batch_id": "linerescore_2026-02-13_...",
+        "prediction_run_mode": "LINE_UPDATE",
+        "players": [<prediction request>, ...]   // same fields as /predict messages
+    }
+
+    Returns:
+        200 with rescored / missing / failed / skipped player lists. Players
+            not in rescored must go through the full prediction path (skipped
+            players are OUT on the current injury report).
+        400 for a malformed request, 500 if the staging write failed.
+    """
+    from batch_inference import batch_inference
+
+    start_time = time.time()
+    data = request.get_json(force=True, silent=True) or {}
+    game_date_str = data.get('game_date')
+    batch_id = data.get('batch_id')
+    if not game_date_str or not batch_id:
+        return jsonify({'status': 'error', 'error': 'game_date and batch_id are required'}), 400
+
+    try:
+        game_date = datetime.strptime(game_date_str, '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        return jsonify({'status': 'error', 'error': f"Invalid game_date: {game_date_str!r} (expected YYYY-MM-DD)"}), 400
+    prediction_run_mode = data.get('prediction_run_mode', 'LINE_UPDATE')
+    players = data.get('players') or []
+
+    missing, failed, skipped, entries = [], [], [], []
+    residents = []
+    if resident_enabled():
+        store = get_resident_store()
+        for player in players:
+            player_lookup = player.get('player_lookup')
+            resident = store.get(game_date, player_lookup, player.get('game_id'))
+            if resident is None:
+                missing.append(player_lookup)
+            else:
+                residents.append((player, resident))
+    else:
+        missing = [player.get('player_lookup') for player in players]
+
+    # The resident row can be hours old: re-query the injury report (bypassing
+    # the filter's cache) so players ruled OUT since prep are skipped and the
+    # rest carry the current injury fields. No check -> full path.
+    injury_statuses = {}
+    if residents:
+        try:
+            injury_statuses = get_injury_filter().check_players_batch(
+                [resident.player_lookup for _, resident in residents], game_date, refresh=True
+            )
+        except Exception as e:
+            logger.warning(f"[LINE_RESCORE] Injury re-check failed, using full path: {e}")
+            missing.extend(resident.player_lookup for _, resident in residents)
+            residents = []
+
+    for player, resident in residents:
+        player_lookup = resident.player_lookup
+        injury_status = injury_statuses[player_lookup]
+        if injury_status.should_skip:
+            logger.warning(
+                f"[LINE_RESCORE] Skipping {player_lookup}: now listed as "
+                f"{injury_status.injury_status.upper() if injury_status.injury_status else 'OUT'} "
+                f"({injury_status.reason or 'no reason provided'})"
+            )
+            skipped.append(player_lookup)
+            continue
+        line_values = player.get('line_values') or []
+        line_source_info = _build_line_source_info({**player, 'prediction_run_mode': prediction_run_mode})
+        features, metadata = store.rebase(resident, line_source_info, line_values, injury_status)
+        entries.append((resident, line_values, features, metadata))
+
+    _, _, catboost = get_prediction_systems()
+    circuit_breaker = get_circuit_breaker()
+    rescored, predictions = [], []
+    systems = [catboost, *(_monthly_models or []), _catboost_v12]
+    with batch_inference(systems, [features for _, _, features, _ in entries]) as batched_rows:
+        for resident, line_values, features, metadata in entries:
+            player_lookup = resident.player_lookup
+            try:
+                result = _run_prediction_systems(
+                    player_lookup=player_lookup,
+                    game_date=game_date,
+                    game_id=resident.game_id,
+                    line_values=line_values,
+                    features=features,
+                    metadata=metadata,
+                    circuit_breaker=circuit_breaker
+                )
+            except Exception as e:
+                logger.error(f"[LINE_RESCORE] Error re-scoring {player_lookup}: {e}", exc_info=True)
+                failed.append(player_lookup)
+                continue
+
+            player_predictions = result['predictions']
+            if not player_predictions:
+                failed.append(player_lookup)
+                continue
+            validation_passed, validation_error = validate_line_quality(player_predictions, player_lookup, game_date_str)
+            if not validation_passed:
+                logger.error(f"[LINE_RESCORE] LINE QUALITY VALIDATION FAILED: {validation_error}")
+                failed.append(player_lookup)
+                continue
+            predictions.extend(player_predictions)
+            rescored.append(player_lookup)
+
+    if predictions and not write_predictions_to_bigquery(predictions, batch_id=batch_id):
+        logger.error(f"[LINE_RESCORE] Staging write failed for {len(rescored)} players (batch={batch_id})")
+        return jsonify({
+            'status': 'error',
+            'error': 'Staging write failed',
+            'batch_id': batch_id,
+            'rescored': [],
+            'missing': missing,
+            'failed': failed + rescored,
+            'skipped': skipped,
+        }), 500
+
+    logger.info(
+        f"[LINE_RESCORE] {len(rescored)}/{len(players)} players re-scored in "
+        f"{time.time() - start_time:.2f}s (missing={len(missing)}, failed={len(failed)}, "
+        f"skipped={len(skipped)}, rows per model call: {batched_rows}, batch={batch_id})"
+    )
+    return jsonify({
+        'status': 'success',
+        'batch_id': batch_id,
+        'rescored': rescored,
+        'missing': missing,
+        'failed': failed,
+        'skipped': skipped,
+        'predictions_written': len(predictions),
+        'resident': get_resident_store().stats(),
+    }), 200
+
+
 def process_player_predictions(
     player_lookup: str,
     game_date: date,
@@ -1094,6 +1499,67 @@ def process_player_predictions(
     Returns:
         Dict with 'predictions' and 'metadata' keys
     """
+    prepared = _prepare_player_features(
+        player_lookup=player_lookup,
+        game_date=game_date,
+        line_values=line_values,
+        data_loader=data_loader,
+        line_source_info=line_source_info,
+        historical_games_batch=historical_games_batch
+    )
+    if 'features' not in prepared:
+        return prepared
+    _remember_resident(player_lookup, game_date, game_id, prepared, data_loader)
+
+    return _run_prediction_systems(
+        player_lookup=player_lookup,
+        game_date=game_date,
+        game_id=game_id,
+        line_values=line_values,
+        features=prepared['features'],
+        metadata=prepared['metadata'],
+        circuit_breaker=circuit_breaker
+    )
+
+
+def _remember_resident(
+    player_lookup: str,
+    game_date: date,
+    game_id: str,
+    prepared: Dict,
+    data_loader: 'PredictionDataLoader'
+) -> None:
+    """Keep a prepared production row resident for line-delta re-scoring (non-fatal)."""
+    if not resident_enabled() or getattr(data_loader, 'dataset_prefix', ''):
+        return
+    try:
+        get_resident_store().remember(
+            player_lookup=player_lookup,
+            game_date=game_date,
+            game_id=game_id,
+            features=prepared['features'],
+            metadata=prepared['metadata'],
+            line_base=prepared.get('line_base', {})
+        )
+    except Exception as e:
+        logger.warning(f"Failed to keep {player_lookup} resident for line re-scoring: {e}")
+
+
+def _prepare_player_features(
+    player_lookup: str,
+    game_date: date,
+    line_values: List[float],
+    data_loader: 'PredictionDataLoader',
+    line_source_info: Dict = None,
+    historical_games_batch: List[Dict] = None
+) -> Dict:
+    """
+    Steps 1-3 of process_player_predictions: load, validate and enrich features.
+
+    Returns:
+        {'features': dict, 'metadata': dict} when the player can be predicted,
+        otherwise {'predictions': [], 'metadata': dict} with the skip reason.
+    """
     # Default line source info for backwards compatibility
     if line_source_info is None:
         line_source_info = {
@@ -1103,11 +1569,6 @@ def process_player_predictions(
             'estimated_line_value': None,
             'estimation_method': None
         }
-    # Lazy-load prediction systems
-    moving_average, zone_matchup, catboost = get_prediction_systems()
-
-    all_predictions = []
-
     # Metadata tracking
     metadata = {
         'systems_attempted': [],
@@ -1180,31 +1641,6 @@ def process_player_predictions(
     logger.info(f"Features validated for {player_lookup} (quality: {features['feature_quality_score']:.1f})")
     metadata['feature_quality_score'] = features['feature_quality_score']
 
-    # v3.2: Inject line source tracking info into features for format_prediction_for_bigquery
-    features['has_prop_line'] = line_source_info.get('has_prop_line', True)
-    features['line_source'] = line_source_info.get('line_source', 'ACTUAL_PROP')
-    features['actual_prop_line'] = line_source_info.get('actual_prop_line')
-    features['estimated_line_value'] = line_source_info.get('estimated_line_value')
-    features['estimation_method'] = line_source_info.get('estimation_method')
-    # v3.3: Add line source API and sportsbook tracking
-    features['line_source_api'] = line_source_info.get('line_source_api')
-    features['sportsbook'] = line_source_info.get('sportsbook')
-    features['was_line_fallback'] = line_source_info.get('was_line_fallback', False)
-    # v3.6: Add line timing tracking (how close to closing line)
-    features['line_minutes_before_game'] = line_source_info.get('line_minutes_before_game')
-    # Session 77 FIX: Extract prediction_run_mode for BigQuery record
-    # Bug: Session 76 added to line_source_info but forgot to extract to features
-    features['prediction_run_mode'] = line_source_info.get('prediction_run_mode', 'OVERNIGHT')
-
-    # Session 79: Extract Kalshi prediction market data
-    features['kalshi_available'] = line_source_info.get('kalshi_available', False)
-    features['kalshi_line'] = line_source_info.get('kalshi_line')
-    features['kalshi_yes_price'] = line_source_info.get('kalshi_yes_price')
-    features['kalshi_no_price'] = line_source_info.get('kalshi_no_price')
-    features['kalshi_liquidity'] = line_source_info.get('kalshi_liquidity')
-    features['kalshi_market_ticker'] = line_source_info.get('kalshi_market_ticker')
-    features['line_discrepancy'] = line_source_info.get('line_discrepancy')
-
     # v3.7 (Session 24 FIX): Add CatBoost V8 required features
     # The ml_feature_store_v2 only has 25 base features, but CatBoost V8 needs 33.
     # Features 25-32 (Vegas/opponent/PPM) must be populated from available data.
@@ -1214,63 +1650,11 @@ def process_player_predictions(
     # This is used by the v3.8 fallback severity logging below
     original_features = set(features.keys())
 
-    # Session 169: Save feature store original Vegas values BEFORE coordinator override.
-    # This enables post-hoc investigation of the disconnect between feature store (has data)
-    # and model input (may be null after override logic).
-    features['_fs_original_vegas_points_line'] = features.get('vegas_points_line')
-    features['_fs_original_has_vegas_line'] = features.get('has_vegas_line')
-
-    actual_prop = line_source_info.get('actual_prop_line')
-
-    # Session 169 FIX: Coordinator sets actual_prop_line from Phase 3's stale
-    # current_points_line (often NULL for pre-game), but sends fresh line_values
-    # from real-time odds queries. When actual_prop is None but we KNOW real lines
-    # exist (has_prop_line=True), use the median line_value as the Vegas override.
-    # This was the root cause of the UNDER bias crisis: model predicted without
-    # its most important feature (#25 vegas_points_line) for all FIRST-run predictions.
-    if actual_prop is None and line_source_info.get('has_prop_line') and line_values:
-        # Session 172: Validate line_values before median calculation
-        valid_lines = [v for v in line_values if isinstance(v, (int, float)) and v > 0]
-        if not valid_lines:
-            logger.warning(
-                f"Recovery median: line_values contained no valid numbers: {line_values}"
-            )
-            features['vegas_source'] = 'none'
-        else:
-            sorted_lines = sorted(valid_lines)
-            median_line = sorted_lines[len(sorted_lines) // 2]
-            # Session 172: Reduce noise — DEBUG per-prediction, summary logged by coordinator
-            logger.debug(
-                f"Vegas line recovery: actual_prop_line was None but has_prop_line=True "
-                f"with {len(valid_lines)} valid line_values. Using median line {median_line} "
-                f"(lines: {sorted_lines})"
-            )
-            actual_prop = median_line
-            features['vegas_source'] = 'recovery_median'  # Session 170: Track Vegas source
-
-    if actual_prop is not None:
-        # Vegas features (indices 25-28)
-        features['vegas_points_line'] = actual_prop
-        features['vegas_opening_line'] = actual_prop  # Use same as closing (no opening data)
-        features['vegas_line_move'] = 0.0  # No line movement data available
-        features['has_vegas_line'] = 1.0  # CRITICAL: Must be 1.0 when we have a line!
-        # Session 170: Track Vegas source (only set if not already set by recovery above)
-        if 'vegas_source' not in features:
-            features['vegas_source'] = 'coordinator_actual'
-    elif features.get('vegas_points_line') is not None:
-        # Session 168: Preserve feature store vegas values when coordinator has no line.
-        # Previously this branch nulled out valid feature store data, causing
-        # PRE_GAME predictions to run blind (e.g., Feb 4 -3.44 avg_pvl bug).
-        logger.info(f"No actual_prop_line from coordinator, preserving feature store vegas_points_line={features.get('vegas_points_line')}")
-        features['has_vegas_line'] = 1.0
-        features['vegas_source'] = 'feature_store'  # Session 170: Track Vegas source
-    else:
-        # No prop line from coordinator AND no line in feature store
-        features['vegas_points_line'] = None
-        features['vegas_opening_line'] = None
-        features['vegas_line_move'] = None
-        features['has_vegas_line'] = 0.0
-        features['vegas_source'] = 'none'  # Session 170: Track Vegas source
+    # Line source tracking + Vegas features (indices 25-28) from the request's line.
+    # The feature store's own values are kept so a resident row can be re-based
+    # onto a later line (see line_rescoring.py).
+    line_base = snapshot_line_base(features)
+    actual_prop = apply_line_features(features, line_source_info, line_values)
 
     # Opponent history features (indices 29-30)
     # These would require a separate query to player_game_summary.
@@ -1393,16 +1777,8 @@ def process_player_predictions(
         injury_filter = get_injury_filter()
         injury_status = injury_filter.check_player(player_lookup, game_date)
 
-        # Inject injury info into features for format_prediction_for_bigquery
-        features['injury_status_at_prediction'] = injury_status.injury_status.upper() if injury_status.injury_status else None
-        features['injury_flag_at_prediction'] = injury_status.has_warning or injury_status.should_skip
-        features['injury_reason_at_prediction'] = injury_status.reason
-        features['injury_checked_at'] = datetime.utcnow().isoformat()
-
-        # Track in metadata
-        metadata['injury_status'] = injury_status.injury_status
-        metadata['injury_has_warning'] = injury_status.has_warning
-        metadata['injury_should_skip'] = injury_status.should_skip
+        # Inject injury info into features / metadata (shared with line re-scoring)
+        apply_injury_status(features, metadata, injury_status)
 
         # v4.2: CRITICAL FIX - Actually skip predictions for OUT players
         # Previously the should_skip flag was recorded but never enforced
@@ -1559,6 +1935,31 @@ def process_player_predictions(
 
     metadata['data_load_seconds'] = time.time() - data_load_start
 
+    return {'features': features, 'metadata': metadata, 'line_base': line_base}
+
+
+def _run_prediction_systems(
+    player_lookup: str,
+    game_date: date,
+    game_id: str,
+    line_values: List[float],
+    features: Dict,
+    metadata: Dict,
+    circuit_breaker: 'SystemCircuitBreaker'
+) -> Dict:
+    """
+    Steps 4-5 of process_player_predictions: call each prediction system per line.
+
+    Inside a batch_inference() block the ML systems' model calls are served
+    from the chunk's single batched call (see batch_inference.py).
+
+    Returns:
+        Dict with 'predictions' and 'metadata' keys
+    """
+    # Lazy-load prediction systems
+    moving_average, zone_matchup, catboost = get_prediction_systems()
+
+    all_predictions = []
 
     # Step 4: Generate predictions for each line
     prediction_compute_start = time.time()
@@ -2394,6 +2795,7 @@ def write_predictions_to_bigquery(predictions: List[Dict], batch_id: Optional[st
               Returning False should trigger Pub/Sub retry (return 500), NOT silent continuation.
     """
     from batch_staging_writer import get_worker_id, BatchStagingWriter
+    from predictions.shared.staging_buffer import BufferedStagingWriter, get_staging_store
 
     if not predictions:
         logger.warning("No predictions to write")
@@ -2417,7 +2819,13 @@ def write_predictions_to_bigquery(predictions: List[Dict], batch_id: Optional[st
         # DATASET ISOLATION: Create staging writer with dataset_prefix if specified
         # Otherwise use the cached global writer for production
         if dataset_prefix:
-            staging_writer = BatchStagingWriter(get_bq_client(), PROJECT_ID, dataset_prefix=dataset_prefix)
+            staging_store = get_staging_store()
+            if staging_store is not None:
+                staging_writer = BufferedStagingWriter(
+                    get_bq_client(), PROJECT_ID, staging_store, dataset_prefix=dataset_prefix
+                )
+            else:
+                staging_writer = BatchStagingWriter(get_bq_client(), PROJECT_ID, dataset_prefix=dataset_prefix)
             logger.debug(f"Created isolated staging_writer with prefix: {dataset_prefix}")
         else:
             staging_writer = get_staging_writer()  # Use cached production writer
@@ -2429,6 +2837,12 @@ def write_predictions_to_bigquery(predictions: List[Dict], batch_id: Optional[st
             worker_id=worker_id
         )
 
+        # Buffered staging: rows must be durable before the Pub/Sub message is ACKed
+        if result.success and isinstance(staging_writer, BufferedStagingWriter):
+            flush_result = staging_writer.flush(batch_id)
+            if not flush_result.success:
+                result = flush_result
+
         if result.success:
             logger.info(
                 f"Staging write complete: {result.rows_written} rows to {result.staging_table_name} "
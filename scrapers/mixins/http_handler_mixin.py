@@ -599,14 +599,19 @@ class HttpHandlerMixin:
 
         Uses:
         - ProxyManager for health-based rotation (in-memory health tracking)
-        - Circuit breaker pattern for persistent state (BigQuery-backed)
+        - Circuit breaker pattern for persistent state (process-wide store,
+          reconciled with BigQuery in the background)
+
+        Proxy health state and telemetry never block the request: circuit
+        checks are in-memory and proxy results are buffered for a background
+        BigQuery flush.
         """
         import time as time_module
 
         # Extract target host for health tracking
         target_host = extract_host_from_url(self.url)
 
-        # Initialize circuit breaker (uses BigQuery for persistent state)
+        # Circuit breaker over the process-wide store (BigQuery sync runs in the background)
         circuit_breaker = ProxyCircuitBreaker(use_bigquery=True)
 
         # Get proxy pool ordered by health and filtered by circuit breaker
@@ -658,7 +663,7 @@ class HttpHandlerMixin:
                             circuit_breaker=circuit_breaker
                         )
 
-                        # Also log to BigQuery for monitoring
+                        # Also log to BigQuery for monitoring (buffered)
                         log_proxy_result(
                             scraper_name=self.__class__.__name__,
                             target_host=target_host,
@@ -689,7 +694,7 @@ class HttpHandlerMixin:
                             circuit_breaker=circuit_breaker
                         )
 
-                        # Also log to BigQuery for monitoring (host-level)
+                        # Also log to BigQuery for monitoring (host-level, buffered)
                         log_proxy_result(
                             scraper_name=self.__class__.__name__,
                             target_host=target_host,
@@ -753,7 +758,7 @@ class HttpHandlerMixin:
                             circuit_breaker=circuit_breaker
                         )
 
-                        # Also log to BigQuery for monitoring
+                        # Also log to BigQuery for monitoring (buffered)
                         log_proxy_result(
                             scraper_name=self.__class__.__name__,
                             target_host=target_host,
@@ -790,7 +795,7 @@ class HttpHandlerMixin:
                             circuit_breaker=circuit_breaker
                         )
 
-                        # Also log to BigQuery for monitoring
+                        # Also log to BigQuery for monitoring (buffered)
                         log_proxy_result(
                             scraper_name=self.__class__.__name__,
                             target_host=target_host,
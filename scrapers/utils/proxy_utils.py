@@ -16,6 +16,7 @@ Environment Variables:
 - DECODO_PROXY_CREDENTIALS: "username:password" for Decodo (from Secret Manager)
 - PROXYFUEL_CREDENTIALS: "username:password" for ProxyFuel (optional override)
 - BRIGHTDATA_CREDENTIALS: "username:password" for Bright Data (future)
+- PROXY_HEALTH_SYNC_SECONDS: how often circuit state is reconciled with BigQuery (default 60)
 
 Usage:
     from scrapers.utils.proxy_utils import get_proxy_urls, ProxyCircuitBreaker
@@ -28,13 +29,15 @@ Usage:
     proxies = get_proxy_urls_with_circuit_breaker("api.bettingpros.com", circuit_breaker)
 """
 
+import atexit
 import os
 import logging
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone, timedelta
 from enum import Enum
-from typing import List, Optional, Dict
+from typing import Callable, List, Optional, Dict
 from urllib.parse import quote, urlparse
 
 logger = logging.getLogger(__name__)
@@ -46,14 +49,10 @@ DECODO_PORTS = [10001, 10002, 10003]
 CIRCUIT_FAILURE_THRESHOLD = 3  # Consecutive failures to open circuit
 CIRCUIT_COOLDOWN_MINUTES = 5   # Time before testing OPEN circuit
 
-# Module-level circuit breaker state cache to avoid BigQuery on every HTTP request.
-# The ProxyCircuitBreaker is re-instantiated per scraper call, so its _local_cache
-# was empty on every request, causing 499+ BQ queries/day (one per scraper HTTP call).
-# This module-level cache persists across requests within the same Cloud Run instance.
-# TTL = 5 minutes — matches CIRCUIT_COOLDOWN_MINUTES so state transitions are seen promptly.
-_MODULE_CIRCUIT_CACHE: dict = {}          # key -> CircuitStatus
-_MODULE_CIRCUIT_CACHE_TS: dict = {}       # key -> datetime (when cached)
-_MODULE_CIRCUIT_CACHE_TTL_SECONDS = 300   # 5 minutes
+# Circuit state is held in a process-wide ProxyHealthStore and reconciled with
+# BigQuery on a background thread, so a scraper HTTP call never waits on a
+# BigQuery SELECT/MERGE. Other instances' transitions arrive within one sync.
+PROXY_HEALTH_SYNC_SECONDS = float(os.getenv("PROXY_HEALTH_SYNC_SECONDS", "60"))
 
 
 class CircuitState(Enum):
@@ -185,39 +184,263 @@ PROXY_PROVIDERS: List[ProxyProvider] = [
 # Circuit Breaker
 # ============================================================================
 
+def _status_key(proxy_provider: str, target_host: str) -> str:
+    """Key for a proxy+target combination."""
+    return f"{proxy_provider}:{target_host}"
+
+
+def _last_event_at(status: CircuitStatus) -> datetime:
+    """Most recent event recorded on a status (used to pick the newer of two)."""
+    events = [t for t in (status.last_failure_at, status.last_success_at, status.opened_at) if t]
+    return max(events) if events else datetime.min.replace(tzinfo=timezone.utc)
+
+
+class CircuitStateBackend(ABC):
+    """Shared store that process-local circuit state is reconciled with."""
+
+    @abstractmethod
+    def load_all(self) -> List[CircuitStatus]:
+        """Return every persisted circuit status."""
+        pass
+
+    @abstractmethod
+    def save(self, statuses: List[CircuitStatus]) -> None:
+        """Persist circuit statuses (upsert by proxy_provider + target_host)."""
+        pass
+
+
+class BigQueryCircuitBackend(CircuitStateBackend):
+    """Circuit state in nba_orchestration.proxy_circuit_breaker."""
+
+    TABLE = "nba-props-platform.nba_orchestration.proxy_circuit_breaker"
+
+    def __init__(self):
+        self._bq_client = None
+
+    def _get_bq_client(self):
+        """Lazy-load BigQuery client."""
+        if self._bq_client is None:
+            from google.cloud import bigquery
+            self._bq_client = bigquery.Client()
+        return self._bq_client
+
+    def load_all(self) -> List[CircuitStatus]:
+        query = f"""
+        SELECT proxy_provider, target_host, circuit_state, failure_count,
+               last_failure_at, last_success_at, opened_at
+        FROM `{self.TABLE}`
+        """
+        return [
+            CircuitStatus(
+                proxy_provider=row.proxy_provider,
+                target_host=row.target_host,
+                state=CircuitState(row.circuit_state),
+                failure_count=row.failure_count or 0,
+                last_failure_at=row.last_failure_at,
+                last_success_at=row.last_success_at,
+                opened_at=row.opened_at
+            )
+            for row in self._get_bq_client().query(query).result()
+        ]
+
+    def save(self, statuses: List[CircuitStatus]) -> None:
+        from google.cloud import bigquery
+        client = self._get_bq_client()
+        query = f"""
+        MERGE `{self.TABLE}` T
+        USING (SELECT @proxy_provider as proxy_provider, @target_host as target_host) S
+        ON T.proxy_provider = S.proxy_provider AND T.target_host = S.target_host
+        WHEN MATCHED THEN
+            UPDATE SET
+                circuit_state = @circuit_state,
+                failure_count = @failure_count,
+                last_failure_at = @last_failure_at,
+                last_success_at = @last_success_at,
+                opened_at = @opened_at,
+                updated_at = CURRENT_TIMESTAMP()
+        WHEN NOT MATCHED THEN
+            INSERT (proxy_provider, target_host, circuit_state, failure_count,
+                    last_failure_at, last_success_at, opened_at, updated_at)
+            VALUES (@proxy_provider, @target_host, @circuit_state, @failure_count,
+                    @last_failure_at, @last_success_at, @opened_at, CURRENT_TIMESTAMP())
+        """
+        for status in statuses:
+            job_config = bigquery.QueryJobConfig(query_parameters=[
+                bigquery.ScalarQueryParameter("proxy_provider", "STRING", status.proxy_provider),
+                bigquery.ScalarQueryParameter("target_host", "STRING", status.target_host),
+                bigquery.ScalarQueryParameter("circuit_state", "STRING", status.state.value),
+                bigquery.ScalarQueryParameter("failure_count", "INT64", status.failure_count),
+                bigquery.ScalarQueryParameter("last_failure_at", "TIMESTAMP", status.last_failure_at),
+                bigquery.ScalarQueryParameter("last_success_at", "TIMESTAMP", status.last_success_at),
+                bigquery.ScalarQueryParameter("opened_at", "TIMESTAMP", status.opened_at),
+            ])
+            client.query(query, job_config=job_config).result()
+
+
+class ProxyHealthStore:
+    """
+    Process-wide circuit state, reconciled with a shared backend.
+
+    Reads and writes are in-memory. Every ``sync_interval_seconds`` a
+    background reconcile pushes locally changed statuses to the backend and
+    adopts newer statuses written by other instances. Only the first access
+    in a process waits for the backend (initial load).
+
+    Args:
+        backend: Shared state backend (None = in-memory only)
+        sync_interval_seconds: Reconcile cadence
+        clock: Returns the current UTC datetime (injectable for tests)
+        background: Reconcile on a daemon thread (False = inline, for tests)
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CircuitStateBackend] = None,
+        sync_interval_seconds: Optional[float] = None,
+        clock: Optional[Callable[[], datetime]] = None,
+        background: bool = True,
+    ):
+        self.backend = backend
+        self.sync_interval = timedelta(seconds=(
+            sync_interval_seconds if sync_interval_seconds is not None else PROXY_HEALTH_SYNC_SECONDS
+        ))
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        self.background = background
+        self._statuses: Dict[str, CircuitStatus] = {}
+        self._dirty: Dict[str, CircuitStatus] = {}
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._last_sync: Optional[datetime] = None
+
+    def now(self) -> datetime:
+        return self.clock()
+
+    def get(self, proxy_provider: str, target_host: str) -> Optional[CircuitStatus]:
+        """Current status (a copy), or None if the circuit has never been used."""
+        self._ensure_loaded()
+        self._maybe_reconcile()
+        with self._lock:
+            status = self._statuses.get(_status_key(proxy_provider, target_host))
+            return replace(status) if status else None
+
+    def put(self, status: CircuitStatus) -> None:
+        """Record a status locally; it reaches the backend on the next reconcile."""
+        key = _status_key(status.proxy_provider, status.target_host)
+        with self._lock:
+            self._statuses[key] = replace(status)
+            self._dirty[key] = self._statuses[key]
+        self._maybe_reconcile()
+
+    def reconcile(self) -> bool:
+        """Push local changes and pull other instances' changes now."""
+        with self._sync_lock:
+            return self._reconcile_locked()
+
+    def pending(self) -> int:
+        """Number of local changes not yet pushed to the backend."""
+        with self._lock:
+            return len(self._dirty)
+
+    def _ensure_loaded(self) -> None:
+        if self.backend is None or self._last_sync is not None:
+            return
+        with self._sync_lock:
+            if self._last_sync is None:
+                self._reconcile_locked()
+
+    def _maybe_reconcile(self) -> None:
+        if self.backend is None or self._last_sync is None:
+            return
+        if self.now() - self._last_sync < self.sync_interval:
+            return
+        if not self._sync_lock.acquire(blocking=False):
+            return  # A reconcile is already running
+
+        def run():
+            try:
+                self._reconcile_locked()
+            finally:
+                self._sync_lock.release()
+
+        if self.background:
+            threading.Thread(target=run, daemon=True, name="ProxyHealthReconcile").start()
+        else:
+            run()
+
+    def _reconcile_locked(self) -> bool:
+        """Reconcile with the backend. Caller holds _sync_lock."""
+        self._last_sync = self.now()
+        if self.backend is None:
+            with self._lock:
+                self._dirty.clear()
+            return True
+
+        with self._lock:
+            pushed = dict(self._dirty)
+            self._dirty.clear()
+
+        try:
+            if pushed:
+                self.backend.save(list(pushed.values()))
+            remote = self.backend.load_all()
+        except Exception as e:
+            logger.warning(f"Proxy circuit state reconcile failed (will retry): {e}")
+            with self._lock:
+                for key, status in pushed.items():
+                    self._dirty.setdefault(key, status)
+            return False
+
+        with self._lock:
+            adopted = 0
+            for status in remote:
+                key = _status_key(status.proxy_provider, status.target_host)
+                if key in self._dirty:
+                    continue  # Changed locally while reconciling - ours is newer
+                local = self._statuses.get(key)
+                if local is None or _last_event_at(status) > _last_event_at(local):
+                    self._statuses[key] = status
+                    adopted += 1
+        logger.debug(f"Proxy circuit state reconciled: pushed={len(pushed)}, adopted={adopted}")
+        return True
+
+
+_proxy_health_store: Optional[ProxyHealthStore] = None
+_proxy_health_store_lock = threading.Lock()
+
+
+def get_proxy_health_store() -> ProxyHealthStore:
+    """Process-wide store backed by BigQuery (pending changes pushed at exit)."""
+    global _proxy_health_store
+    with _proxy_health_store_lock:
+        if _proxy_health_store is None:
+            _proxy_health_store = ProxyHealthStore(backend=BigQueryCircuitBackend())
+            atexit.register(_proxy_health_store.reconcile)
+        return _proxy_health_store
+
+
 class ProxyCircuitBreaker:
     """
     Circuit breaker for proxy+target combinations.
 
     Prevents using proxies that are known to be blocked for specific targets.
-    Uses BigQuery for persistent state (across Cloud Run instances).
+    State lives in the process-wide ProxyHealthStore, which is reconciled
+    with BigQuery in the background (shared across Cloud Run instances), so
+    checking and recording a circuit never waits on BigQuery.
     """
 
-    def __init__(self, use_bigquery: bool = True):
+    def __init__(self, use_bigquery: bool = True, store: Optional[ProxyHealthStore] = None):
         """
         Initialize circuit breaker.
 
         Args:
-            use_bigquery: If True, persist state to BigQuery. If False, use in-memory only.
+            use_bigquery: If True, use the process-wide store reconciled with
+                BigQuery. If False, use a private in-memory store.
+            store: Explicit store (overrides use_bigquery)
         """
         self.use_bigquery = use_bigquery
-        self._local_cache: Dict[str, CircuitStatus] = {}
-        self._bq_client = None
-
-    def _get_bq_client(self):
-        """Lazy-load BigQuery client."""
-        if self._bq_client is None and self.use_bigquery:
-            try:
-                from google.cloud import bigquery
-                self._bq_client = bigquery.Client()
-            except Exception as e:
-                logger.warning(f"Failed to init BigQuery client for circuit breaker: {e}")
-                self.use_bigquery = False
-        return self._bq_client
-
-    def _cache_key(self, proxy_provider: str, target_host: str) -> str:
-        """Generate cache key for proxy+target combination."""
-        return f"{proxy_provider}:{target_host}"
+        if store is None:
+            store = get_proxy_health_store() if use_bigquery else ProxyHealthStore()
+        self.store = store
 
     def get_circuit_state(self, proxy_provider: str, target_host: str) -> CircuitState:
         """
@@ -236,7 +459,7 @@ class ProxyCircuitBreaker:
 
         # Check if OPEN circuit should transition to HALF_OPEN
         if status.state == CircuitState.OPEN and status.opened_at:
-            cooldown_elapsed = datetime.now(timezone.utc) - status.opened_at
+            cooldown_elapsed = self.store.now() - status.opened_at
             if cooldown_elapsed >= timedelta(minutes=CIRCUIT_COOLDOWN_MINUTES):
                 logger.info(f"Circuit {proxy_provider}+{target_host}: OPEN → HALF_OPEN (cooldown elapsed)")
                 self._update_state(proxy_provider, target_host, CircuitState.HALF_OPEN)
@@ -268,7 +491,7 @@ class ProxyCircuitBreaker:
             state=CircuitState.CLOSED,
             failure_count=0,
             last_failure_at=status.last_failure_at if status else None,
-            last_success_at=datetime.now(timezone.utc),
+            last_success_at=self.store.now(),
             opened_at=None
         ))
 
@@ -277,7 +500,7 @@ class ProxyCircuitBreaker:
         status = self._get_status(proxy_provider, target_host)
         failure_count = (status.failure_count if status else 0) + 1
         current_state = status.state if status else CircuitState.CLOSED
-        now = datetime.now(timezone.utc)
+        now = self.store.now()
 
         # Determine new state
         if current_state == CircuitState.HALF_OPEN:
@@ -305,65 +528,8 @@ class ProxyCircuitBreaker:
         ))
 
     def _get_status(self, proxy_provider: str, target_host: str) -> Optional[CircuitStatus]:
-        """Get current status from cache or BigQuery.
-
-        Uses a two-level cache:
-        1. Instance _local_cache (per-request, zero latency)
-        2. Module-level _MODULE_CIRCUIT_CACHE with 5-min TTL (persists across Cloud Run
-           requests within the same instance, avoids BigQuery on every scraper HTTP call)
-        3. BigQuery fallback (only when module cache is stale or cold)
-        """
-        cache_key = self._cache_key(proxy_provider, target_host)
-
-        # Level 1: instance-local cache (within a single scraper run)
-        if cache_key in self._local_cache:
-            return self._local_cache[cache_key]
-
-        # Level 2: module-level TTL cache (across requests in the same Cloud Run instance)
-        if cache_key in _MODULE_CIRCUIT_CACHE:
-            cached_at = _MODULE_CIRCUIT_CACHE_TS.get(cache_key)
-            age_seconds = (datetime.now(timezone.utc) - cached_at).total_seconds() if cached_at else 9999
-            if age_seconds < _MODULE_CIRCUIT_CACHE_TTL_SECONDS:
-                status = _MODULE_CIRCUIT_CACHE[cache_key]
-                self._local_cache[cache_key] = status
-                return status
-
-        # Level 3: BigQuery (only when cache is cold or expired)
-        if self.use_bigquery:
-            client = self._get_bq_client()
-            if client:
-                try:
-                    query = """
-                    SELECT proxy_provider, target_host, circuit_state, failure_count,
-                           last_failure_at, last_success_at, opened_at
-                    FROM `nba-props-platform.nba_orchestration.proxy_circuit_breaker`
-                    WHERE proxy_provider = @proxy_provider AND target_host = @target_host
-                    """
-                    from google.cloud import bigquery
-                    job_config = bigquery.QueryJobConfig(query_parameters=[
-                        bigquery.ScalarQueryParameter("proxy_provider", "STRING", proxy_provider),
-                        bigquery.ScalarQueryParameter("target_host", "STRING", target_host),
-                    ])
-                    result = list(client.query(query, job_config=job_config).result())
-                    if result:
-                        row = result[0]
-                        status = CircuitStatus(
-                            proxy_provider=row.proxy_provider,
-                            target_host=row.target_host,
-                            state=CircuitState(row.circuit_state),
-                            failure_count=row.failure_count or 0,
-                            last_failure_at=row.last_failure_at,
-                            last_success_at=row.last_success_at,
-                            opened_at=row.opened_at
-                        )
-                        self._local_cache[cache_key] = status
-                        _MODULE_CIRCUIT_CACHE[cache_key] = status
-                        _MODULE_CIRCUIT_CACHE_TS[cache_key] = datetime.now(timezone.utc)
-                        return status
-                except Exception as e:
-                    logger.debug(f"BigQuery circuit breaker query failed: {e}")
-
-        return None
+        """Get current status from the process-wide store (no BigQuery round trip)."""
+        return self.store.get(proxy_provider, target_host)
 
     def _update_state(self, proxy_provider: str, target_host: str, new_state: CircuitState):
         """Update just the state field."""
@@ -375,48 +541,8 @@ class ProxyCircuitBreaker:
             self._upsert_status(proxy_provider, target_host, status)
 
     def _upsert_status(self, proxy_provider: str, target_host: str, status: CircuitStatus):
-        """Upsert status to cache and BigQuery."""
-        cache_key = self._cache_key(proxy_provider, target_host)
-        self._local_cache[cache_key] = status
-        # Update module-level cache so other requests in this instance see the new state
-        _MODULE_CIRCUIT_CACHE[cache_key] = status
-        _MODULE_CIRCUIT_CACHE_TS[cache_key] = datetime.now(timezone.utc)
-
-        if self.use_bigquery:
-            client = self._get_bq_client()
-            if client:
-                try:
-                    query = """
-                    MERGE `nba-props-platform.nba_orchestration.proxy_circuit_breaker` T
-                    USING (SELECT @proxy_provider as proxy_provider, @target_host as target_host) S
-                    ON T.proxy_provider = S.proxy_provider AND T.target_host = S.target_host
-                    WHEN MATCHED THEN
-                        UPDATE SET
-                            circuit_state = @circuit_state,
-                            failure_count = @failure_count,
-                            last_failure_at = @last_failure_at,
-                            last_success_at = @last_success_at,
-                            opened_at = @opened_at,
-                            updated_at = CURRENT_TIMESTAMP()
-                    WHEN NOT MATCHED THEN
-                        INSERT (proxy_provider, target_host, circuit_state, failure_count,
-                                last_failure_at, last_success_at, opened_at, updated_at)
-                        VALUES (@proxy_provider, @target_host, @circuit_state, @failure_count,
-                                @last_failure_at, @last_success_at, @opened_at, CURRENT_TIMESTAMP())
-                    """
-                    from google.cloud import bigquery
-                    job_config = bigquery.QueryJobConfig(query_parameters=[
-                        bigquery.ScalarQueryParameter("proxy_provider", "STRING", proxy_provider),
-                        bigquery.ScalarQueryParameter("target_host", "STRING", target_host),
-                        bigquery.ScalarQueryParameter("circuit_state", "STRING", status.state.value),
-                        bigquery.ScalarQueryParameter("failure_count", "INT64", status.failure_count),
-                        bigquery.ScalarQueryParameter("last_failure_at", "TIMESTAMP", status.last_failure_at),
-                        bigquery.ScalarQueryParameter("last_success_at", "TIMESTAMP", status.last_success_at),
-                        bigquery.ScalarQueryParameter("opened_at", "TIMESTAMP", status.opened_at),
-                    ])
-                    client.query(query, job_config=job_config).result()
-                except Exception as e:
-                    logger.warning(f"Failed to update circuit breaker in BigQuery: {e}")
+        """Record status in the store; BigQuery is updated by the next reconcile."""
+        self.store.put(status)
 
 
 # ============================================================================
@@ -0,0 +1,328 @@
+"""
+Canary Runner
+
+Concurrent executor for monitoring checks (pipeline canaries, daily health
+check).
+
+bin/monitoring/pipeline_canary_queries.py and the daily_health_check Cloud
+Function used to run their checks one at a time, each waiting on its own
+BigQuery round trip. Several checks also read the same table for the same
+dates, e.g. today's player_prop_predictions or yesterday's
+player_game_summary, so that scan was billed once per check.
+
+A CanaryRunner:
+    1. runs checks concurrently on a bounded pool (a FetchGraph)
+    2. lets checks that declare the same ScanSpec (table, date column and
+       date window) share one materialized scan. The union of their columns
+       for that window is selected once. Each check then reads the query's
+       result table instead of the source table, through a ``{source}``
+       placeholder in its SQL
+    3. attributes every BigQuery job a check starts to that check through
+       MeteredClient. Per-check latency, job count and bytes billed are
+       logged ([CANARY_TIMING]) and kept in ``runner.stats``
+
+Usage:
+    from shared.utils.canary_runner import CanaryRunner, ScanSpec
+
+    yesterday_pgs = ScanSpec(
+        table='nba-props-platform.nba_analytics.player_game_summary',
+        start='DATE_SUB(CURRENT_DATE(), INTERVAL 1 DAY)',
+        end='DATE_SUB(CURRENT_DATE(), INTERVAL 1 DAY)',
+        columns=('game_id', 'points'),
+    )
+
+    runner = CanaryRunner(client, name='pipeline_canary')
+    runner.add('records', lambda client, source: ..., scan=yesterday_pgs)
+    runner.add('scheduler', lambda client: check_scheduler_health(),
+               on_error=lambda e: (False, {}, str(e)))
+    results = runner.run()  # {check_name: return value}
+
+A check that declares a scan is called as ``fn(client, source=...)``.
+Otherwise it is called as ``fn(client)``. Some scans are inlined as a
+subquery instead: a scan declared by only one check, a scan whose
+materialization fails, and every scan in serial mode. The check still reads
+the same rows.
+
+A check that raises is logged and its result becomes ``on_error(exc)``
+(None if no on_error was given). One failing check never stops the others.
+
+Environment:
+    CANARY_RUNNER_MODE: 'parallel' (default) or 'serial' (one check at a
+        time, no shared scans)
+    CANARY_MAX_WORKERS: pool size (default 8)
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from shared.utils.fetch_graph import FetchGraph
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+SCAN_TIMEOUT_SECONDS = 120
+
+
+def parallel_canaries_enabled() -> bool:
+    """Return False when CANARY_RUNNER_MODE=serial."""
+    return os.environ.get('CANARY_RUNNER_MODE', 'parallel').lower() != 'serial'
+
+
+@dataclass(frozen=True)
+class ScanSpec:
+    """
+    A date-windowed read of one table that several checks can share.
+
+    ``start`` and ``end`` are SQL date expressions (inclusive), e.g.
+    ``'CURRENT_DATE()'`` or ``"'2026-02-13'"``. Checks with the same table,
+    date column and window share one scan; their ``columns`` are merged.
+    An empty ``columns`` selects every column.
+    """
+    table: str
+    start: str
+    end: str
+    date_column: str = 'game_date'
+    columns: Tuple[str, ...] = ()
+
+    @property
+    def key(self) -> Tuple[str, str, str, str]:
+        return (self.table, self.date_column, self.start, self.end)
+
+    @property
+    def label(self) -> str:
+        return f"{self.table.split('.')[-1]}[{self.start}..{self.end}]"
+
+    def select_sql(self, columns: Optional[Tuple[str, ...]] = None) -> str:
+        columns = self.columns if columns is None else columns
+        return (
+            f"SELECT {', '.join(columns) if columns else '*'} "
+            f"FROM `{self.table}` "
+            f"WHERE {self.date_column} BETWEEN {self.start} AND {self.end}"
+        )
+
+    def inline_source(self, columns: Optional[Tuple[str, ...]] = None) -> str:
+        """The scan as a FROM-clause subquery (no sharing)."""
+        return f"({self.select_sql(columns)})"
+
+
+def render_source(sql: str, source: str) -> str:
+    """Substitute the ``{source}`` placeholder of a scan-backed check query."""
+    return sql.replace('{source}', source)
+
+
+@dataclass
+class CheckStats:
+    """Latency and BigQuery usage of one check (or one shared scan)."""
+    name: str
+    seconds: float = 0.0
+    jobs: int = 0
+    bytes_billed: int = 0
+    cache_hits: int = 0
+    shared_scan: Optional[str] = None
+    error: Optional[str] = None
+    _jobs: List[Any] = field(default_factory=list, repr=False)
+
+    def finalize(self, seconds: float) -> None:
+        self.seconds = seconds
+        self.jobs = len(self._jobs)
+        self.bytes_billed = sum(getattr(job, 'total_bytes_billed', None) or 0 for job in self._jobs)
+        self.cache_hits = sum(1 for job in self._jobs if getattr(job, 'cache_hit', False))
+        self._jobs = []
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'seconds': round(self.seconds, 3),
+            'jobs': self.jobs,
+            'bytes_billed': self.bytes_billed,
+            'cache_hits': self.cache_hits,
+            'shared_scan': self.shared_scan,
+            'error': self.error,
+        }
+
+
+class MeteredClient:
+    """
+    Proxy over a bigquery.Client that records the query jobs of the running check.
+
+    Jobs are attributed through a thread-local binding set by CanaryRunner,
+    so check functions that use a module-level client are metered too.
+    Outside a runner the proxy is a plain pass-through.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._local = threading.local()
+
+    @property
+    def unwrapped(self):
+        return self._client
+
+    def bind(self, stats: Optional[CheckStats]) -> None:
+        self._local.stats = stats
+
+    def query(self, *args, **kwargs):
+        job = self._client.query(*args, **kwargs)
+        stats = getattr(self._local, 'stats', None)
+        if stats is not None:
+            stats._jobs.append(job)
+        return job
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+@dataclass
+class _Check:
+    name: str
+    fn: Callable[..., Any]
+    scan: Optional[ScanSpec]
+    on_error: Optional[Callable[[BaseException], Any]]
+
+
+def _format_bytes(num_bytes: int) -> str:
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if num_bytes < 1024 or unit == 'GB':
+            return f"{num_bytes:.0f} {unit}" if unit == 'B' else f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024.0
+
+
+class CanaryRunner:
+    """Runs monitoring checks concurrently with shared scans and per-check metering."""
+
+    def __init__(self, client, name: str = 'canary', max_workers: Optional[int] = None):
+        self.client = client if isinstance(client, MeteredClient) else MeteredClient(client)
+        self.name = name
+        self.max_workers = max_workers or int(os.environ.get('CANARY_MAX_WORKERS', DEFAULT_MAX_WORKERS))
+        self.checks: Dict[str, _Check] = {}
+        self.stats: Dict[str, CheckStats] = {}
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        scan: Optional[ScanSpec] = None,
+        on_error: Optional[Callable[[BaseException], Any]] = None,
+    ) -> 'CanaryRunner':
+        """Declare a check. Returns self so declarations can be chained."""
+        if name in self.checks:
+            raise ValueError(f"Check '{name}' already declared in runner {self.name}")
+        self.checks[name] = _Check(name, fn, scan, on_error)
+        return self
+
+    def run(self) -> Dict[str, Any]:
+        """Run every check and return {check_name: result} in declaration order."""
+        parallel = parallel_canaries_enabled()
+        self.stats = {}
+        started = time.time()
+
+        shared = self._shared_scans() if parallel else {}
+        graph = FetchGraph(self.name, max_workers=self.max_workers if parallel else 1)
+        for key, (scan_name, scan, columns) in shared.items():
+            graph.add(scan_name, self._scan_fetch(scan_name, scan, columns))
+        for check in self.checks.values():
+            if check.scan is not None and check.scan.key in shared:
+                scan_name, scan, columns = shared[check.scan.key]
+                graph.add(check.name, self._check_fetch(check, scan_name, scan, columns), inputs=(scan_name,))
+            else:
+                graph.add(check.name, self._check_fetch(check))
+
+        values = graph.run()
+        self._log_summary(time.time() - started, len(shared))
+        return {name: values[name] for name in self.checks}
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Stats of the last run as plain dicts (checks and shared scans)."""
+        return [stats.as_dict() for stats in self.stats.values()]
+
+    def _shared_scans(self) -> Dict[Tuple, Tuple[str, ScanSpec, Tuple[str, ...]]]:
+        """Scan keys declared by 2+ checks -> (fetch name, spec, merged columns)."""
+        by_key: Dict[Tuple, List[ScanSpec]] = {}
+        for check in self.checks.values():
+            if check.scan is not None:
+                by_key.setdefault(check.scan.key, []).append(check.scan)
+
+        shared = {}
+        for key, specs in by_key.items():
+            if len(specs) < 2:
+                continue
+            if any(not spec.columns for spec in specs):
+                columns: Tuple[str, ...] = ()
+            else:
+                columns = tuple(dict.fromkeys(col for spec in specs for col in spec.columns))
+            shared[key] = (f"scan:{specs[0].label}", specs[0], columns)
+        return shared
+
+    def _metered(self, stats: CheckStats, fn: Callable[[], Any]) -> Any:
+        self.stats[stats.name] = stats
+        self.client.bind(stats)
+        t0 = time.time()
+        try:
+            return fn()
+        finally:
+            self.client.bind(None)
+            stats.finalize(time.time() - t0)
+
+    def _scan_fetch(self, scan_name: str, scan: ScanSpec, columns: Tuple[str, ...]) -> Callable[[], Optional[str]]:
+        def materialize() -> Optional[str]:
+            stats = CheckStats(scan_name)
+
+            def query() -> str:
+                job = self.client.query(scan.select_sql(columns))
+                job.result(timeout=SCAN_TIMEOUT_SECONDS)
+                dest = job.destination
+                return f"`{dest.project}.{dest.dataset_id}.{dest.table_id}`"
+
+            try:
+                return self._metered(stats, query)
+            except Exception as e:
+                # Checks fall back to reading the source table themselves
+                stats.error = str(e)
+                logger.warning(f"[CANARY_RUNNER] {self.name}: shared scan {scan.label} failed, inlining: {e}")
+                return None
+        return materialize
+
+    def _check_fetch(
+        self,
+        check: _Check,
+        scan_name: Optional[str] = None,
+        scan: Optional[ScanSpec] = None,
+        columns: Tuple[str, ...] = (),
+    ) -> Callable[..., Any]:
+        def call(**inputs: Any) -> Any:
+            stats = CheckStats(check.name)
+            if check.scan is None:
+                invoke = lambda: check.fn(self.client)  # noqa: E731
+            else:
+                source = inputs.get(scan_name) if scan_name else None
+                if source is not None:
+                    stats.shared_scan = scan_name
+                else:
+                    source = check.scan.inline_source(columns if scan_name else None)
+                invoke = lambda: check.fn(self.client, source=source)  # noqa: E731
+
+            try:
+                return self._metered(stats, invoke)
+            except Exception as e:
+                stats.error = str(e)
+                logger.error(f"[CANARY_RUNNER] {self.name}: check '{check.name}' raised: {e}")
+                return check.on_error(e) if check.on_error else None
+        return call
+
+    def _log_summary(self, elapsed: float, shared_scans: int) -> None:
+        for stats in self.stats.values():
+            logger.info(
+                f"[CANARY_TIMING] {self.name}.{stats.name}: {stats.seconds:.1f}s, "
+                f"{stats.jobs} jobs, {_format_bytes(stats.bytes_billed)} billed"
+                + (f" (via {stats.shared_scan})" if stats.shared_scan else "")
+            )
+        serial = sum(stats.seconds for stats in self.stats.values())
+        billed = sum(stats.bytes_billed for stats in self.stats.values())
+        logger.info(
+            f"[CANARY_RUNNER] {self.name}: {len(self.checks)} checks in {elapsed:.1f}s "
+            f"(serial sum {serial:.1f}s), {shared_scans} shared scans, {_format_bytes(billed)} billed"
+        )
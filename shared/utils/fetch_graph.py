@@ -0,0 +1,247 @@
+"""
+Fetch Graph
+
+Declarative, dependency-aware runner for a processor's extraction queries.
+
+Processors that load a dozen independent lookups before computing anything
+(MLB pitcher features, NBA extraction stages) spend most of their wall time
+waiting on serial BigQuery round trips. A FetchGraph declares each fetch
+with the inputs it needs; fetches whose inputs are ready run concurrently on
+a bounded thread pool, and every fetch is timed.
+
+Usage:
+    from shared.utils.fetch_graph import FetchGraph, StaticFetchCache
+
+    static_cache = StaticFetchCache()  # keep on the processor instance
+
+    graph = FetchGraph('mlb_pitcher_features', max_workers=8, static_cache=static_cache)
+    graph.add('lineups', self._get_lineups, inputs=('game_date',))
+    graph.add('lineup_analysis', self._get_lineup_analysis, inputs=('game_date', 'lineups'))
+    graph.add('ballpark_factors', self._get_ballpark_factors, static=True)
+    results = graph.run(game_date=game_date)
+
+Inputs:
+    Each name in ``inputs`` is either a run parameter (keyword passed to
+    run()) or the name of another fetch. The fetch function is called with
+    those values as keyword arguments, so ``inputs=('game_date',)`` calls
+    ``fn(game_date=...)``.
+
+Static fetches:
+    ``static=True`` marks a fetch whose result does not depend on the run
+    parameters (reference tables such as ballpark factors). Its first
+    non-empty result is stored in the StaticFetchCache and reused by later
+    runs that share the cache, e.g. every date of a backfill in one process.
+    Empty / falsy results are not cached, since degrading fetches return {}
+    on a transient error; the next run fetches again.
+
+Errors:
+    An exception in a fetch cancels fetches that have not started and is
+    re-raised from run() once running fetches finish. Fetch functions that
+    prefer to degrade (return {} on failure) keep doing so.
+
+Set FETCH_GRAPH_MODE=serial to run fetches one at a time in declaration
+order (same results, no thread pool).
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def parallel_fetch_enabled() -> bool:
+    """Return False when FETCH_GRAPH_MODE=serial."""
+    return os.environ.get('FETCH_GRAPH_MODE', 'parallel').lower() != 'serial'
+
+
+@dataclass(frozen=True)
+class Fetch:
+    """One declared fetch."""
+    name: str
+    fn: Callable[..., Any]
+    inputs: Tuple[str, ...] = ()
+    static: bool = False
+
+
+class StaticFetchCache:
+    """Thread-safe store for static fetch results, shared across runs."""
+
+    def __init__(self):
+        self._values: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Tuple[bool, Any]:
+        with self._lock:
+            if name in self._values:
+                return True, self._values[name]
+            return False, None
+
+    def set(self, name: str, value: Any) -> None:
+        with self._lock:
+            self._values[name] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            return name in self._values
+
+
+class FetchGraph:
+    """Runs declared fetches concurrently in dependency order."""
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        static_cache: Optional[StaticFetchCache] = None,
+    ):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.static_cache = static_cache
+        self.fetches: Dict[str, Fetch] = {}
+        self.timings: Dict[str, float] = {}
+        self.cached: List[str] = []
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        inputs: Tuple[str, ...] = (),
+        static: bool = False,
+    ) -> 'FetchGraph':
+        """Declare a fetch. Returns self so declarations can be chained."""
+        if name in self.fetches:
+            raise ValueError(f"Fetch '{name}' already declared in graph {self.name}")
+        self.fetches[name] = Fetch(name, fn, tuple(inputs), static)
+        return self
+
+    def plan(self, params: Dict[str, Any]) -> List[List[str]]:
+        """
+        Return fetch names grouped into dependency levels.
+
+        Every fetch in a level only needs run parameters and fetches from
+        earlier levels. Raises ValueError on unknown inputs or cycles.
+        """
+        for fetch in self.fetches.values():
+            for dep in fetch.inputs:
+                if dep not in self.fetches and dep not in params:
+                    raise ValueError(
+                        f"Fetch '{fetch.name}' in graph {self.name} needs unknown input '{dep}'"
+                    )
+                if dep in self.fetches and dep in params:
+                    raise ValueError(
+                        f"Input '{dep}' in graph {self.name} is both a fetch and a run parameter"
+                    )
+
+        levels: List[List[str]] = []
+        done = set(params)
+        remaining = list(self.fetches)
+        while remaining:
+            level = [n for n in remaining if all(d in done for d in self.fetches[n].inputs)]
+            if not level:
+                raise ValueError(f"Dependency cycle in graph {self.name}: {sorted(remaining)}")
+            levels.append(level)
+            done.update(level)
+            remaining = [n for n in remaining if n not in done]
+        return levels
+
+    def run(self, **params: Any) -> Dict[str, Any]:
+        """Run every fetch and return {fetch_name: result}."""
+        levels = self.plan(params)
+        self.timings = {}
+        self.cached = []
+        values: Dict[str, Any] = dict(params)
+        started = time.time()
+
+        pending = [name for level in levels for name in level]
+        pending = [name for name in pending if not self._use_cached(name, values)]
+
+        if self.max_workers == 1 or not parallel_fetch_enabled():
+            for name in pending:
+                values[name] = self._call(name, values)
+        else:
+            self._run_parallel(pending, values)
+
+        self._log_summary(time.time() - started)
+        return {name: values[name] for name in self.fetches}
+
+    def _use_cached(self, name: str, values: Dict[str, Any]) -> bool:
+        if not (self.fetches[name].static and self.static_cache is not None):
+            return False
+        hit, value = self.static_cache.get(name)
+        if hit:
+            values[name] = value
+            self.cached.append(name)
+        return hit
+
+    def _call(self, name: str, values: Dict[str, Any]) -> Any:
+        fetch = self.fetches[name]
+        t0 = time.time()
+        result = fetch.fn(**{dep: values[dep] for dep in fetch.inputs})
+        self.timings[name] = time.time() - t0
+        if fetch.static and self.static_cache is not None:
+            if result:
+                self.static_cache.set(name, result)
+            else:
+                logger.warning(f"[FETCH_GRAPH] {self.name}: static fetch '{name}' returned empty, not cached")
+        return result
+
+    def _run_parallel(self, pending: List[str], values: Dict[str, Any]) -> None:
+        waiting = list(pending)
+        running: Dict[Future, str] = {}
+        error: Optional[BaseException] = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                thread_name_prefix=f'fetch-{self.name}') as executor:
+            while waiting or running:
+                if error is None:
+                    ready = [n for n in waiting if all(d in values for d in self.fetches[n].inputs)]
+                    for name in ready:
+                        waiting.remove(name)
+                        # Snapshot inputs: values is only mutated on this thread
+                        args = {d: values[d] for d in self.fetches[name].inputs}
+                        running[executor.submit(self._call, name, args)] = name
+                elif waiting:
+                    logger.warning(f"[FETCH_GRAPH] {self.name}: skipping {waiting} after failure")
+                    waiting = []
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        values[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"[FETCH_GRAPH] {self.name}: fetch '{name}' failed: {e}")
+                        if error is None:
+                            error = e
+
+        if error is not None:
+            raise error
+
+    def _log_summary(self, elapsed: float) -> None:
+        for name, seconds in self.timings.items():
+            logger.info(f"[QUERY_TIMING] {self.name}.{name}: {seconds:.1f}s")
+        if self.timings:
+            breakdown = ", ".join(
+                f"{name}={seconds:.1f}s"
+                for name, seconds in sorted(self.timings.items(), key=lambda x: x[1], reverse=True)
+            )
+            logger.info(f"[QUERY_TIMING_BREAKDOWN] {self.name}: {breakdown}")
+        serial = sum(self.timings.values())
+        logger.info(
+            f"[FETCH_GRAPH] {self.name}: {len(self.timings)} fetches in {elapsed:.1f}s "
+            f"(serial sum {serial:.1f}s), {len(self.cached)} static cached"
+        )
@@ -2,6 +2,10 @@
 """
 Proxy Health Logger - tracks proxy success/failure metrics to BigQuery.
 
+Rows are buffered and streamed in the background by the shared
+BigQueryBatchWriter, so logging a proxy attempt never adds a BigQuery
+round trip to the scraper's HTTP path.
+
 Usage:
     from shared.utils.proxy_health_logger import log_proxy_result
 
@@ -14,29 +18,47 @@ Usage:
         success=False,
         error_type="forbidden"
     )
+
+Environment:
+    PROXY_TELEMETRY_MODE: 'batched' (default) or 'sync' (one insert per attempt)
+    PROXY_TELEMETRY_BATCH_SIZE: rows buffered before a flush (default 500)
+    PROXY_TELEMETRY_FLUSH_SECONDS: max age of buffered rows (default 10)
 """
 
 import logging
+import os
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
-# Lazy-loaded BigQuery client
-_bq_client = None
+PROXY_HEALTH_TABLE = "nba_orchestration.proxy_health_metrics"
+
+# Large batches so flushes happen on the writer's background thread
+# (timeout) rather than inline in the request that fills the buffer.
+PROXY_TELEMETRY_BATCH_SIZE = int(os.getenv("PROXY_TELEMETRY_BATCH_SIZE", "500"))
+PROXY_TELEMETRY_FLUSH_SECONDS = float(os.getenv("PROXY_TELEMETRY_FLUSH_SECONDS", "10"))
+
+
+def write_proxy_health_row(row: Dict[str, Any]) -> bool:
+    """
+    Queue one proxy_health_metrics row.
+
+    Returns:
+        True if the row was accepted (batched) or written (sync mode)
+    """
+    if os.getenv("PROXY_TELEMETRY_MODE", "batched").lower() == "sync":
+        from shared.utils.bigquery_utils import insert_bigquery_rows
+        return insert_bigquery_rows(PROXY_HEALTH_TABLE, [row])
 
-def _get_bq_client():
-    """Lazy-load BigQuery client."""
-    global _bq_client
-    if _bq_client is None:
-        try:
-            from google.cloud import bigquery
-            _bq_client = bigquery.Client()
-        except Exception as e:
-            logger.warning(f"Failed to initialize BigQuery client: {e}")
-            return None
-    return _bq_client
+    from shared.utils.bigquery_batch_writer import get_batch_writer
+    get_batch_writer(
+        PROXY_HEALTH_TABLE,
+        batch_size=PROXY_TELEMETRY_BATCH_SIZE,
+        timeout_seconds=PROXY_TELEMETRY_FLUSH_SECONDS,
+    ).add_record(row)
+    return True
 
 
 def log_proxy_result(
@@ -51,7 +73,7 @@ def log_proxy_result(
     proxy_provider: str = "proxyfuel"
 ) -> bool:
     """
-    Log a proxy request result to BigQuery.
+    Log a proxy request result to BigQuery (buffered, non-blocking).
 
     Args:
         scraper_name: Name of the scraper (e.g., "bp_player_props")
@@ -65,13 +87,9 @@ def log_proxy_result(
         proxy_provider: Proxy provider name (default: "proxyfuel")
 
     Returns:
-        True if logged successfully, False otherwise
+        True if the row was queued (or written in sync mode), False otherwise
     """
     try:
-        client = _get_bq_client()
-        if client is None:
-            return False
-
         row = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "scraper_name": scraper_name,
@@ -85,13 +103,7 @@ def log_proxy_result(
             "proxy_ip": proxy_ip
         }
 
-        # Insert to BigQuery using batch loading (not streaming)
-        # to avoid 90-minute streaming buffer that blocks DML operations
-        from shared.utils.bigquery_utils import insert_bigquery_rows
-        table_id = "nba_orchestration.proxy_health_metrics"
-        success = insert_bigquery_rows(table_id, [row])
-
-        if not success:
+        if not write_proxy_health_row(row):
             logger.warning(f"Failed to log proxy result to BigQuery")
             return False
 
@@ -762,10 +762,6 @@ class ProxyManager:
             return
 
         try:
-            client = self._get_bq_client()
-            if client is None:
-                return
-
             provider = extract_provider_from_url(proxy_url)
             health = self._proxies.get(proxy_url)
             health_score = health.health_score if health else None
@@ -783,12 +779,9 @@ class ProxyManager:
                 "scraper_name": "proxy_manager"  # Generic source
             }
 
-            # Use batch loading to avoid streaming buffer issues
-            from shared.utils.bigquery_utils import insert_bigquery_rows
-            table_id = "nba_orchestration.proxy_health_metrics"
-            success = insert_bigquery_rows(table_id, [row])
-
-            if not success:
+            # Buffered: flushed in the background by the shared batch writer
+            from shared.utils.proxy_health_logger import write_proxy_health_row
+            if not write_proxy_health_row(row):
                 logger.debug(f"Failed to log proxy result")
 
         except Exception as e:
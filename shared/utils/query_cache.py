@@ -22,27 +22,84 @@ Usage:
     cache.set(cache_key, result, ttl_seconds=300)
 
 Features:
-- Thread-safe in-memory cache (dict-based)
+- Thread-safe in-memory cache (OrderedDict-based, O(1) LRU)
 - TTL-based expiration with configurable defaults
 - Cache key generation from query + parameters
-- Hit/miss metrics tracking
-- Optional max size with LRU eviction
+- Hit/miss/eviction metrics, overall and per key prefix
+- Optional max size (entries) and max bytes (estimated value size) with LRU eviction
+- Optional disk tier shared by every process on the host
 - Data freshness awareness (shorter TTL for today's data)
 
+Disk tier:
+    With disk_dir set (or QUERY_CACHE_DISK_DIR for the global cache), every
+    set() also writes the entry to disk (pickle protocol 5, large buffers such
+    as DataFrame columns stored out-of-band). A memory miss checks disk before
+    reporting a miss, so gunicorn workers in one container share warm entries
+    and a restarted worker starts warm. Entries keep their original expiry.
+    The directory must be private to the service: entries are unpickled.
+
 Reference:
 - Design: Session 102 - BigQuery caching layer implementation
 """
 
 import hashlib
+import json
 import logging
+import os
+import pickle
+import struct
+import sys
 import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote
 
 logger = logging.getLogger(__name__)
 
+# Lists/dicts larger than this are sized from a sample of their elements
+SIZE_SAMPLE = 64
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """
+    Estimate the in-memory size of a cached value in bytes.
+
+    Exact for DataFrames/Series (deep memory_usage) and numpy arrays; lists,
+    tuples and dicts (e.g. lists of row dicts) are sized from up to
+    SIZE_SAMPLE elements and extrapolated, so the cost is bounded.
+    """
+    memory_usage = getattr(value, 'memory_usage', None)
+    if callable(memory_usage):  # pandas DataFrame / Series
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, 'sum') else usage)
+        except (TypeError, ValueError):
+            pass
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):  # numpy arrays, memoryview
+        return nbytes
+    if isinstance(value, (str, bytes, bytearray)) or _depth >= 3:
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        items = list(value.items())
+        sample = items[:SIZE_SAMPLE]
+        per_item = sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in sample)
+        return sys.getsizeof(value) + (per_item * len(items) // len(sample) if sample else 0)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = value if isinstance(value, (list, tuple)) else list(value)
+        sample = items[:SIZE_SAMPLE]
+        per_item = sum(estimate_size(v, _depth + 1) for v in sample)
+        return sys.getsizeof(value) + (per_item * len(items) // len(sample) if sample else 0)
+    return sys.getsizeof(value)
+
+
+def _key_prefix(key: str) -> str:
+    """Metrics prefix of a key ("features:abc123" -> "features")."""
+    return key.split(':', 1)[0] if ':' in key else ''
+
 
 @dataclass
 class CacheEntry:
@@ -50,6 +107,7 @@ class CacheEntry:
     value: Any
     expires_at: float  # Unix timestamp
     created_at: float = field(default_factory=time.time)
+    size_bytes: int = 0
 
     def is_expired(self) -> bool:
         """Check if entry has expired."""
@@ -63,6 +121,7 @@ class CacheMetrics:
     misses: int = 0
     evictions: int = 0
     expired_evictions: int = 0
+    disk_hits: int = 0
 
     @property
     def total_requests(self) -> int:
@@ -81,12 +140,158 @@ class CacheMetrics:
             'misses': self.misses,
             'evictions': self.evictions,
             'expired_evictions': self.expired_evictions,
+            'disk_hits': self.disk_hits,
             'total_requests': self.total_requests,
             'hit_rate': round(self.hit_rate, 4),
             'hit_rate_pct': round(self.hit_rate * 100, 2)
         }
 
 
+class DiskTier:
+    """
+    File-per-entry cache directory shared by all processes on a host.
+
+    File layout: MAGIC, then length-prefixed (meta JSON, pickle body,
+    out-of-band buffer...) sections. Writes go to a temp file and are renamed
+    into place, so concurrent readers never see partial entries.
+    """
+
+    MAGIC = b'QCACHE5\n'
+    SUFFIX = '.qc'
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        name = quote(key, safe='')
+        if len(name) > 200:  # keep file names within filesystem limits
+            name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, name + self.SUFFIX)
+
+    def write(self, key: str, value: Any, expires_at: float) -> bool:
+        buffers: List[pickle.PickleBuffer] = []
+        try:
+            body = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+            raw_buffers = [b.raw() for b in buffers]
+        except BufferError:  # non-contiguous buffer: keep everything in-band
+            body, raw_buffers = pickle.dumps(value, protocol=5), []
+        except Exception as e:
+            logger.debug(f"Disk cache skip (not picklable): {key}: {e}")
+            return False
+
+        meta = json.dumps({'key': key, 'expires_at': expires_at}).encode('utf-8')
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(self.MAGIC)
+                for section in [meta, body] + raw_buffers:
+                    f.write(struct.pack('<Q', memoryview(section).nbytes))
+                    f.write(section)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Disk cache write failed for {key}: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return False
+
+        if self.max_bytes:
+            self._prune()
+        return True
+
+    def read(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return (value, expires_at), or None if missing, expired or unreadable."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = bytearray(f.read())  # writable: unpickled arrays stay writable
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Disk cache read failed for {key}: {e}")
+            return None
+
+        try:
+            if not data.startswith(self.MAGIC):
+                raise ValueError("bad magic")
+            view = memoryview(data)
+            offset = len(self.MAGIC)
+            sections = []
+            while offset < len(data):
+                (length,) = struct.unpack_from('<Q', data, offset)
+                offset += 8
+                sections.append(view[offset:offset + length])
+                offset += length
+            meta = json.loads(bytes(sections[0]))
+            if meta['key'] != key:
+                return None
+            if time.time() > meta['expires_at']:
+                self.delete(key)
+                return None
+            value = pickle.loads(sections[1], buffers=sections[2:])
+        except Exception as e:
+            logger.warning(f"Disk cache entry unreadable, dropping {key}: {e}")
+            self.delete(key)
+            return None
+
+        try:
+            os.utime(path)  # mtime = last access, for pruning
+        except OSError:
+            pass
+        return value, meta['expires_at']
+
+    def delete(self, key: str) -> bool:
+        try:
+            os.unlink(self._path(key))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def keys(self) -> List[str]:
+        """Keys with readable file names (hashed long keys are not listed)."""
+        return [
+            unquote(name[:-len(self.SUFFIX)])
+            for name in os.listdir(self.directory) if name.endswith(self.SUFFIX)
+        ]
+
+    def clear(self) -> int:
+        count = 0
+        for name in os.listdir(self.directory):
+            if name.endswith(self.SUFFIX):
+                try:
+                    os.unlink(os.path.join(self.directory, name))
+                    count += 1
+                except FileNotFoundError:
+                    pass
+        return count
+
+    def _prune(self) -> None:
+        """Drop least recently used files until the directory fits max_bytes."""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(self.SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+
 class QueryCache:
     """
     Thread-safe in-memory cache for BigQuery query results.
@@ -120,7 +325,10 @@ class QueryCache:
         self,
         default_ttl_seconds: int = 300,
         max_size: Optional[int] = None,
-        name: str = "query_cache"
+        name: str = "query_cache",
+        max_bytes: Optional[int] = None,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: Optional[int] = None,
     ):
         """
         Initialize query cache.
@@ -128,22 +336,29 @@ class QueryCache:
         Args:
             default_ttl_seconds: Default TTL for cache entries (default: 300s = 5 min)
             max_size: Maximum number of entries. If None, unlimited (be careful!).
-                      When exceeded, oldest entries are evicted.
+                      When exceeded, least recently used entries are evicted.
             name: Cache name for logging/metrics identification
+            max_bytes: Maximum estimated bytes held in memory (see estimate_size).
+                       If None, only max_size applies.
+            disk_dir: Optional directory for the shared disk tier.
+            disk_max_bytes: Size budget for disk_dir (least recently used files pruned).
         """
-        self._cache: Dict[str, CacheEntry] = {}
+        # Insertion order = LRU order: oldest first, move_to_end() on access
+        self._cache: 'OrderedDict[str, CacheEntry]' = OrderedDict()
         self._lock = threading.Lock()
         self._default_ttl = default_ttl_seconds
         self._max_size = max_size
+        self._max_bytes = max_bytes
         self._name = name
         self._metrics = CacheMetrics()
-
-        # Track access order for LRU eviction
-        self._access_order: Dict[str, float] = {}
+        self._prefix_metrics: Dict[str, CacheMetrics] = {}
+        self._bytes = 0
+        self._disk = DiskTier(disk_dir, disk_max_bytes) if disk_dir else None
 
         logger.info(
             f"QueryCache '{name}' initialized: "
-            f"default_ttl={default_ttl_seconds}s, max_size={max_size or 'unlimited'}"
+            f"default_ttl={default_ttl_seconds}s, max_size={max_size or 'unlimited'}, "
+            f"max_bytes={max_bytes or 'unlimited'}, disk_dir={disk_dir or 'none'}"
         )
 
     def generate_key(
@@ -197,11 +412,26 @@ class QueryCache:
             return f"{prefix}:{key_hash}"
         return key_hash
 
+    def _prefix_stats(self, key: str) -> CacheMetrics:
+        prefix = _key_prefix(key)
+        stats = self._prefix_metrics.get(prefix)
+        if stats is None:
+            stats = self._prefix_metrics[prefix] = CacheMetrics()
+        return stats
+
+    def _remove(self, key: str) -> Optional[CacheEntry]:
+        """Drop an entry from memory (caller holds the lock)."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size_bytes
+        return entry
+
     def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache if exists and not expired.
 
-        Thread-safe read with automatic expired entry cleanup.
+        Thread-safe read with automatic expired entry cleanup. A memory miss
+        falls through to the disk tier (if configured) and promotes the entry.
 
         Args:
             key: Cache key
@@ -212,25 +442,38 @@ class QueryCache:
         with self._lock:
             entry = self._cache.get(key)
 
-            if entry is None:
-                self._metrics.misses += 1
-                return None
-
-            if entry.is_expired():
+            if entry is not None and entry.is_expired():
                 # Remove expired entry
-                del self._cache[key]
-                if key in self._access_order:
-                    del self._access_order[key]
-                self._metrics.misses += 1
+                self._remove(key)
                 self._metrics.expired_evictions += 1
+                self._prefix_stats(key).expired_evictions += 1
                 logger.debug(f"Cache expired: {key}")
-                return None
+                entry = None
 
-            # Cache hit - update access time for LRU
-            self._access_order[key] = time.time()
+            if entry is not None:
+                # Cache hit - mark most recently used
+                self._cache.move_to_end(key)
+                self._metrics.hits += 1
+                self._prefix_stats(key).hits += 1
+                logger.debug(f"Cache hit: {key}")
+                return entry.value
+
+        disk_entry = self._disk.read(key) if self._disk else None
+
+        with self._lock:
+            stats = self._prefix_stats(key)
+            if disk_entry is None:
+                self._metrics.misses += 1
+                stats.misses += 1
+                return None
+            value, expires_at = disk_entry
             self._metrics.hits += 1
-            logger.debug(f"Cache hit: {key}")
-            return entry.value
+            self._metrics.disk_hits += 1
+            stats.hits += 1
+            stats.disk_hits += 1
+            self._store(key, value, expires_at)
+        logger.debug(f"Cache hit (disk): {key}")
+        return value
 
     def set(
         self,
@@ -241,7 +484,8 @@ class QueryCache:
         """
         Store value in cache with TTL.
 
-        Thread-safe write with automatic eviction if max_size exceeded.
+        Thread-safe write with automatic LRU eviction when max_size or
+        max_bytes would be exceeded. Also written to the disk tier, if any.
 
         Args:
             key: Cache key
@@ -254,16 +498,31 @@ class QueryCache:
         expires_at = time.time() + ttl_seconds
 
         with self._lock:
-            # Check if we need to evict before adding
-            if self._max_size and len(self._cache) >= self._max_size:
-                if key not in self._cache:  # Only evict if adding new key
-                    self._evict_oldest()
+            self._store(key, value, expires_at)
 
-            self._cache[key] = CacheEntry(value=value, expires_at=expires_at)
-            self._access_order[key] = time.time()
+        if self._disk:
+            self._disk.write(key, value, expires_at)
 
         logger.debug(f"Cache set: {key} (ttl={ttl_seconds}s)")
 
+    def _store(self, key: str, value: Any, expires_at: float) -> None:
+        """Insert into memory, evicting LRU entries to fit (caller holds the lock)."""
+        size = estimate_size(value) if self._max_bytes else 0
+        self._remove(key)  # updating a key never evicts another
+
+        if self._max_bytes and size > self._max_bytes:
+            logger.debug(f"Cache value too large for memory tier: {key} ({size} bytes)")
+            return
+
+        while self._cache and (
+            (self._max_size and len(self._cache) >= self._max_size)
+            or (self._max_bytes and self._bytes + size > self._max_bytes)
+        ):
+            self._evict_oldest()
+
+        self._cache[key] = CacheEntry(value=value, expires_at=expires_at, size_bytes=size)
+        self._bytes += size
+
     def delete(self, key: str) -> bool:
         """
         Delete entry from cache.
@@ -275,17 +534,16 @@ class QueryCache:
             True if entry was deleted, False if not found
         """
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                if key in self._access_order:
-                    del self._access_order[key]
-                logger.debug(f"Cache deleted: {key}")
-                return True
-            return False
+            deleted = self._remove(key) is not None
+        if self._disk:
+            deleted = self._disk.delete(key) or deleted
+        if deleted:
+            logger.debug(f"Cache deleted: {key}")
+        return deleted
 
     def clear(self) -> int:
         """
-        Clear all cache entries.
+        Clear all cache entries (memory and disk tier).
 
         Returns:
             Number of entries cleared
@@ -293,9 +551,11 @@ class QueryCache:
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
-            self._access_order.clear()
-            logger.info(f"Cache '{self._name}' cleared: {count} entries removed")
-            return count
+            self._bytes = 0
+        if self._disk:
+            count = max(count, self._disk.clear())
+        logger.info(f"Cache '{self._name}' cleared: {count} entries removed")
+        return count
 
     def invalidate_prefix(self, prefix: str) -> int:
         """
@@ -310,31 +570,30 @@ class QueryCache:
             Number of entries invalidated
         """
         with self._lock:
-            keys_to_delete = [k for k in self._cache.keys() if k.startswith(prefix)]
+            keys_to_delete = {k for k in self._cache.keys() if k.startswith(prefix)}
             for key in keys_to_delete:
-                del self._cache[key]
-                if key in self._access_order:
-                    del self._access_order[key]
+                self._remove(key)
+
+        if self._disk:
+            for key in self._disk.keys():
+                if key.startswith(prefix) and self._disk.delete(key):
+                    keys_to_delete.add(key)
 
-            if keys_to_delete:
-                logger.info(f"Cache prefix invalidated: {prefix} ({len(keys_to_delete)} entries)")
+        if keys_to_delete:
+            logger.info(f"Cache prefix invalidated: {prefix} ({len(keys_to_delete)} entries)")
 
-            return len(keys_to_delete)
+        return len(keys_to_delete)
 
     def _evict_oldest(self) -> None:
-        """Evict the least recently accessed entry (LRU)."""
-        if not self._access_order:
+        """Evict the least recently accessed entry (LRU), O(1)."""
+        if not self._cache:
             return
 
-        # Find oldest accessed key
-        oldest_key = min(self._access_order.keys(), key=lambda k: self._access_order[k])
-
-        if oldest_key in self._cache:
-            del self._cache[oldest_key]
-        if oldest_key in self._access_order:
-            del self._access_order[oldest_key]
+        oldest_key, entry = self._cache.popitem(last=False)
+        self._bytes -= entry.size_bytes
 
         self._metrics.evictions += 1
+        self._prefix_stats(oldest_key).evictions += 1
         logger.debug(f"Cache evicted (LRU): {oldest_key}")
 
     def cleanup_expired(self) -> int:
@@ -353,10 +612,9 @@ class QueryCache:
             ]
 
             for key in expired_keys:
-                del self._cache[key]
-                if key in self._access_order:
-                    del self._access_order[key]
+                self._remove(key)
                 self._metrics.expired_evictions += 1
+                self._prefix_stats(key).expired_evictions += 1
 
             if expired_keys:
                 logger.debug(f"Cache cleanup: {len(expired_keys)} expired entries removed")
@@ -368,6 +626,11 @@ class QueryCache:
         """Current number of entries in cache."""
         return len(self._cache)
 
+    @property
+    def size_bytes(self) -> int:
+        """Estimated bytes held in memory (tracked only when max_bytes is set)."""
+        return self._bytes
+
     @property
     def metrics(self) -> CacheMetrics:
         """Get cache metrics."""
@@ -378,14 +641,23 @@ class QueryCache:
         Get comprehensive cache statistics.
 
         Returns:
-            Dict with size, metrics, and configuration
+            Dict with size, metrics, per-prefix metrics, and configuration
         """
+        with self._lock:
+            by_prefix = {
+                prefix or '(none)': stats.to_dict()
+                for prefix, stats in sorted(self._prefix_metrics.items())
+            }
         return {
             'name': self._name,
             'size': self.size,
             'max_size': self._max_size,
+            'size_bytes': self._bytes,
+            'max_bytes': self._max_bytes,
+            'disk_dir': self._disk.directory if self._disk else None,
             'default_ttl': self._default_ttl,
-            **self._metrics.to_dict()
+            **self._metrics.to_dict(),
+            'by_prefix': by_prefix,
         }
 
     def get_ttl_for_date(self, target_date: date) -> int:
@@ -413,20 +685,32 @@ _global_cache: Optional[QueryCache] = None
 _global_cache_lock = threading.Lock()
 
 
+def _env_int(name: str) -> Optional[int]:
+    value = os.environ.get(name, '').strip()
+    return int(value) if value else None
+
+
 def get_query_cache(
     default_ttl_seconds: int = 300,
     max_size: Optional[int] = 10000,
-    name: str = "global_query_cache"
+    name: str = "global_query_cache",
+    max_bytes: Optional[int] = None,
 ) -> QueryCache:
     """
     Get or create the global query cache singleton.
 
-    Thread-safe access to a shared cache instance.
+    Thread-safe access to a shared cache instance. Memory budget and disk
+    tier come from the environment (only used on first call):
+
+        QUERY_CACHE_MAX_BYTES       in-memory byte budget (overrides max_bytes)
+        QUERY_CACHE_DISK_DIR        shared disk tier directory (e.g. /tmp/query_cache)
+        QUERY_CACHE_DISK_MAX_BYTES  disk tier byte budget
 
     Args:
         default_ttl_seconds: Default TTL (only used on first call)
         max_size: Maximum entries (only used on first call)
         name: Cache name (only used on first call)
+        max_bytes: In-memory byte budget (only used on first call)
 
     Returns:
         Global QueryCache instance
@@ -441,7 +725,10 @@ def get_query_cache(
             _global_cache = QueryCache(
                 default_ttl_seconds=default_ttl_seconds,
                 max_size=max_size,
-                name=name
+                name=name,
+                max_bytes=_env_int('QUERY_CACHE_MAX_BYTES') or max_bytes,
+                disk_dir=os.environ.get('QUERY_CACHE_DISK_DIR') or None,
+                disk_max_bytes=_env_int('QUERY_CACHE_DISK_MAX_BYTES'),
             )
         return _global_cache
 
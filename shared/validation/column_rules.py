@@ -0,0 +1,589 @@
+"""
+Column Rules for Pre-Write Validation
+=====================================
+Column predicates that PreWriteValidator compiles once per table and
+evaluates over a whole batch of rows.
+
+PreWriteValidator rules used to be lambdas called once per record per rule.
+A full-season rewrite of player_game_summary or ml_feature_store_v2 is
+millions of rows, and validation showed up as a noticeable slice of save
+time. A rule built from column expressions works both ways:
+
+    col('points').is_null() | col('points').between(0, 100)
+
+- Called with a record dict, it behaves exactly like the lambda it
+  replaces (``r.get('points') is None or 0 <= r.get('points') <= 100``),
+  including short-circuiting and exceptions.
+- evaluate(batch) computes it for every row of a ColumnBatch as numpy
+  boolean masks. Each column is extracted once per batch and shared by
+  every rule that reads it.
+
+Some rows cannot be decided exactly by the vectorized path: a None where
+Python would raise TypeError, a string where a number is expected, or a
+ragged feature array. Those rows are marked undecided and re-checked with
+the row path, so violations and messages match the row-by-row validator.
+
+Batches can be built from a list of record dicts, a pandas DataFrame or a
+pyarrow Table / RecordBatch. Null handling differs by source:
+- Records keep missing keys and None distinct, so col(name, default=...)
+  applies the default only to a missing key, like dict.get().
+- A DataFrame treats both NaN and None as None.
+- Arrow keeps null and NaN distinct.
+
+Usage:
+    from shared.validation.column_rules import ColumnBatch, col, compile_rules
+
+    compiled = compile_rules(rules)            # once per table
+    batch = ColumnBatch.of(records)            # or a DataFrame / Arrow table
+    for rule, (failed, undecided) in zip(rules, compiled.evaluate(batch)):
+        ...
+
+Created: 2026-10-16
+"""
+
+import operator
+from dataclasses import dataclass
+from decimal import Decimal
+from itertools import repeat
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+
+# A value the row path could not compute (e.g. len(None), features[5] of a short list)
+_ERROR = object()
+
+_NUMERIC_TYPES = (int, float, Decimal, np.number)
+
+# Column value types handled with C-level map() instead of a per-row Python test
+_PLAIN_NUMBERS = frozenset({int, float, bool})
+_PLAIN_SCALARS = frozenset({int, float, bool, str, type(None)})
+
+
+class ColumnBatch:
+    """Lazily extracted, cached columns for one batch of rows."""
+
+    def __init__(
+        self,
+        num_rows: int,
+        column_getter: Callable[[str, Any], List[Any]],
+        row_getter: Callable[[int], dict],
+    ):
+        self.num_rows = num_rows
+        self._column_getter = column_getter
+        self._row_getter = row_getter
+        self._values: Dict[tuple, List[Any]] = {}
+        self._numeric: Dict[tuple, Tuple[np.ndarray, np.ndarray]] = {}
+        self._masks: Dict[tuple, np.ndarray] = {}
+
+    @classmethod
+    def from_records(cls, records: Sequence[dict]) -> 'ColumnBatch':
+        return cls(
+            len(records),
+            lambda name, default: list(map(operator.methodcaller('get', name, default), records)),
+            lambda i: records[i],
+        )
+
+    @classmethod
+    def from_frame(cls, frame) -> 'ColumnBatch':
+        """A pandas DataFrame. NaN and None are both treated as None."""
+        def column(name, default):
+            if name not in frame.columns:
+                return [default] * len(frame)
+            series = frame[name]
+            return series.astype(object).where(series.notna(), None).tolist()
+
+        def row(i):
+            values = frame.iloc[i].to_dict()
+            return {k: (None if _is_scalar_na(v) else v) for k, v in values.items()}
+
+        return cls(len(frame), column, row)
+
+    @classmethod
+    def from_arrow(cls, table) -> 'ColumnBatch':
+        """A pyarrow Table or RecordBatch."""
+        names = set(table.schema.names)
+
+        def column(name, default):
+            if name not in names:
+                return [default] * table.num_rows
+            return table.column(name).to_pylist()
+
+        return cls(table.num_rows, column, lambda i: table.slice(i, 1).to_pylist()[0])
+
+    @classmethod
+    def of(cls, data) -> 'ColumnBatch':
+        """Build a batch from records, a DataFrame or an Arrow table / record batch."""
+        if isinstance(data, ColumnBatch):
+            return data
+        if hasattr(data, 'iloc') and hasattr(data, 'columns'):
+            return cls.from_frame(data)
+        if hasattr(data, 'schema') and hasattr(data, 'num_rows'):
+            return cls.from_arrow(data)
+        return cls.from_records(data)
+
+    def row(self, index: int) -> dict:
+        return self._row_getter(index)
+
+    def column(self, name: str, default: Any = None) -> List[Any]:
+        return self._column_getter(name, default)
+
+    def values(self, expr: 'Expr') -> List[Any]:
+        if expr.key not in self._values:
+            self._values[expr.key] = expr.batch_values(self)
+        return self._values[expr.key]
+
+    def numeric(self, expr: 'Expr') -> Tuple[np.ndarray, np.ndarray]:
+        """(float values, mask of rows holding a real number) for an expression."""
+        if expr.key not in self._numeric:
+            values = self.values(expr)
+            types = self.types(expr)
+            if types <= _PLAIN_NUMBERS:
+                floats = np.fromiter(values, dtype=float, count=self.num_rows)
+                ok = np.ones(self.num_rows, dtype=bool)
+            elif types <= _PLAIN_NUMBERS | {type(None)}:
+                floats = np.array(values, dtype=float)  # None -> nan
+                ok = ~self.is_value(expr, None)
+            else:
+                ok = np.fromiter(
+                    (isinstance(v, _NUMERIC_TYPES) for v in values), dtype=bool, count=self.num_rows
+                )
+                floats = np.fromiter(
+                    (float(v) if is_num else np.nan for v, is_num in zip(values, ok)),
+                    dtype=float, count=self.num_rows,
+                )
+            self._numeric[expr.key] = (floats, ok)
+        return self._numeric[expr.key]
+
+    def types(self, expr: 'Expr') -> frozenset:
+        """The set of Python types in an expression's values."""
+        key = (expr.key, 'types')
+        if key not in self._masks:
+            self._masks[key] = frozenset(map(type, self.values(expr)))
+        return self._masks[key]
+
+    def is_value(self, expr: 'Expr', sentinel: Any) -> np.ndarray:
+        """Rows whose value is ``sentinel`` (None or _ERROR), by identity."""
+        key = (expr.key, 'is', id(sentinel))
+        if key not in self._masks:
+            self._masks[key] = np.fromiter(
+                map(operator.is_, self.values(expr), repeat(sentinel)), dtype=bool, count=self.num_rows
+            )
+        return self._masks[key]
+
+    def mask(self, values: List[Any], test: Callable[[Any], bool]) -> np.ndarray:
+        return np.fromiter((test(v) for v in values), dtype=bool, count=self.num_rows)
+
+
+def _is_scalar_na(value: Any) -> bool:
+    try:
+        return value is None or bool(value != value)
+    except (TypeError, ValueError):
+        return False
+
+
+# =============================================================================
+# VALUE EXPRESSIONS
+# =============================================================================
+
+class Expr:
+    """A per-row value: a column, the length of a column, or an item of a list column."""
+
+    key: tuple
+
+    def row_value(self, record: dict) -> Any:
+        raise NotImplementedError
+
+    def batch_values(self, batch: ColumnBatch) -> List[Any]:
+        raise NotImplementedError
+
+    @property
+    def columns(self) -> Set[str]:
+        raise NotImplementedError
+
+    # Comparisons build predicates (like pandas / polars expressions)
+    def __lt__(self, other): return Compare(self, '<', other)
+    def __le__(self, other): return Compare(self, '<=', other)
+    def __gt__(self, other): return Compare(self, '>', other)
+    def __ge__(self, other): return Compare(self, '>=', other)
+    def __eq__(self, other): return Compare(self, '==', other)  # type: ignore[override]
+    def __ne__(self, other): return Compare(self, '!=', other)  # type: ignore[override]
+    __hash__ = None  # type: ignore[assignment]
+
+    def is_null(self) -> 'Predicate':
+        return IsNull(self)
+
+    def is_not_null(self) -> 'Predicate':
+        return IsNull(self, negate=True)
+
+    def truthy(self) -> 'Predicate':
+        return Truthy(self)
+
+    def falsy(self) -> 'Predicate':
+        return Truthy(self, negate=True)
+
+    def between(self, low: float, high: float, inclusive: str = 'both') -> 'Predicate':
+        """
+        ``low <= value <= high`` (Python chained comparison).
+
+        inclusive='right' is ``low < value <= high``.
+        """
+        if inclusive not in ('both', 'right'):
+            raise ValueError(f"inclusive must be 'both' or 'right', got {inclusive!r}")
+        low_op = '<=' if inclusive == 'both' else '<'
+        return And(Compare(self, low_op, low, reflected=True), Compare(self, '<=', high))
+
+    def length(self) -> 'Expr':
+        return Length(self)
+
+    def item(self, index: int) -> 'Expr':
+        return Item(self, index)
+
+    def no_nan_or_inf(self) -> 'Predicate':
+        return NoNanOrInf(self)
+
+
+class Col(Expr):
+    """``record.get(name, default)``"""
+
+    def __init__(self, name: str, default: Any = None):
+        self.name = name
+        self.default = default
+        self.key = ('col', name, repr(default))
+
+    def row_value(self, record: dict) -> Any:
+        return record.get(self.name, self.default)
+
+    def batch_values(self, batch: ColumnBatch) -> List[Any]:
+        return batch.column(self.name, self.default)
+
+    @property
+    def columns(self) -> Set[str]:
+        return {self.name}
+
+    def __repr__(self) -> str:
+        return f"col({self.name!r})" if self.default is None else f"col({self.name!r}, default={self.default!r})"
+
+
+class Length(Expr):
+    """``len(value)``"""
+
+    def __init__(self, source: Expr):
+        self.source = source
+        self.key = ('len',) + source.key
+
+    def row_value(self, record: dict) -> Any:
+        return len(self.source.row_value(record))
+
+    def batch_values(self, batch: ColumnBatch) -> List[Any]:
+        return [_safe(len, v) for v in batch.values(self.source)]
+
+    @property
+    def columns(self) -> Set[str]:
+        return self.source.columns
+
+
+class Item(Expr):
+    """``value[index]``"""
+
+    def __init__(self, source: Expr, index: int):
+        self.source = source
+        self.index = index
+        self.key = ('item', index) + source.key
+
+    def row_value(self, record: dict) -> Any:
+        return self.source.row_value(record)[self.index]
+
+    def batch_values(self, batch: ColumnBatch) -> List[Any]:
+        return [_safe(operator.itemgetter(self.index), v) for v in batch.values(self.source)]
+
+    @property
+    def columns(self) -> Set[str]:
+        return self.source.columns
+
+
+def _safe(fn: Callable[[Any], Any], value: Any) -> Any:
+    if value is _ERROR:
+        return _ERROR
+    try:
+        return fn(value)
+    except Exception:
+        return _ERROR
+
+
+def col(name: str, default: Any = None) -> Col:
+    """A column reference. ``default`` mirrors ``record.get(name, default)``."""
+    return Col(name, default)
+
+
+# =============================================================================
+# PREDICATES
+# =============================================================================
+
+# evaluate() returns (valid, undecided); valid is only meaningful where not undecided
+Masks = Tuple[np.ndarray, np.ndarray]
+
+
+class Predicate:
+    """A rule condition usable per record (callable) and per batch (evaluate)."""
+
+    def __call__(self, record: dict) -> Any:
+        raise NotImplementedError
+
+    def evaluate(self, batch: ColumnBatch) -> Masks:
+        raise NotImplementedError
+
+    @property
+    def columns(self) -> Set[str]:
+        raise NotImplementedError
+
+    def __or__(self, other: 'Predicate') -> 'Predicate':
+        return Or(self, other)
+
+    def __and__(self, other: 'Predicate') -> 'Predicate':
+        return And(self, other)
+
+
+class IsNull(Predicate):
+
+    def __init__(self, expr: Expr, negate: bool = False):
+        self.expr = expr
+        self.negate = negate
+
+    def __call__(self, record: dict) -> bool:
+        return (self.expr.row_value(record) is None) != self.negate
+
+    def evaluate(self, batch: ColumnBatch) -> Masks:
+        undecided = batch.is_value(self.expr, _ERROR)
+        return batch.is_value(self.expr, None) != self.negate, undecided
+
+    @property
+    def columns(self) -> Set[str]:
+        return self.expr.columns
+
+
+class Truthy(Predicate):
+
+    def __init__(self, expr: Expr, negate: bool = False):
+        self.expr = expr
+        self.negate = negate
+
+    def __call__(self, record: dict) -> bool:
+        return bool(self.expr.row_value(record)) != self.negate
+
+    def evaluate(self, batch: ColumnBatch) -> Masks:
+        values = batch.values(self.expr)
+        if batch.types(self.expr) <= _PLAIN_SCALARS:
+            # bool() cannot raise for these types
+            truth = np.fromiter(map(bool, values), dtype=bool, count=batch.num_rows)
+            return truth != self.negate, np.zeros(batch.num_rows, dtype=bool)
+        truth = [_safe(bool, v) for v in values]
+        undecided = batch.mask(truth, lambda t: t is _ERROR)
+        return batch.mask(truth, lambda t: t is True) != self.negate, undecided
+
+    @property
+    def columns(self) -> Set[str]:
+        return self.expr.columns
+
+
+_OPS = {
+    '<': operator.lt, '<=': operator.le, '>': operator.gt,
+    '>=': operator.ge, '==': operator.eq, '!=': operator.ne,
+}
+
+
+class Compare(Predicate):
+    """
+    ``left <op> right``; right is an expression or a number.
+
+    reflected=True evaluates ``right <op> left`` (e.g. the ``0 <= x`` half of
+    ``0 <= x <= 100``), so a TypeError raised by the row path names the
+    operands in the same order as the original lambda.
+    """
+
+    def __init__(self, left: Expr, op: str, right: Any, reflected: bool = False):
+        self.left = left
+        self.op = op
+        self.right = right
+        self.reflected = reflected
+
+    def __call__(self, record: dict) -> bool:
+        left = self.left.row_value(record)
+        right = self.right.row_value(record) if isinstance(self.right, Expr) else self.right
+        return _OPS[self.op](right, left) if self.reflected else _OPS[self.op](left, right)
+
+    def evaluate(self, batch: ColumnBatch) -> Masks:
+        left, left_ok = batch.numeric(self.left)
+        if isinstance(self.right, Expr):
+            right, right_ok = batch.numeric(self.right)
+            decided = left_ok & right_ok
+        else:
+            right = float(self.right)
+            decided = left_ok.copy()
+
+        with np.errstate(invalid='ignore'):
+            valid = _OPS[self.op](right, left) if self.reflected else _OPS[self.op](left, right)
+
+        if self.op in ('==', '!=') and not isinstance(self.right, Expr):
+            # None == number is False (no TypeError), so None rows are decided too
+            nulls = batch.is_value(self.left, None)
+            valid = np.where(nulls, self.op == '!=', valid)
+            decided |= nulls
+        return valid & decided, ~decided
+
+    @property
+    def columns(self) -> Set[str]:
+        return self.left.columns | (self.right.columns if isinstance(self.right, Expr) else set())
+
+
+class NoNanOrInf(Predicate):
+    """No element of a list value renders as nan / inf / -inf / none."""
+
+    BAD = ('nan', 'inf', '-inf', 'none')
+
+    def __init__(self, expr: Expr):
+        self.expr = expr
+
+    def __call__(self, record: dict) -> bool:
+        return not any(str(f).lower() in self.BAD for f in self.expr.row_value(record))
+
+    def evaluate(self, batch: ColumnBatch) -> Masks:
+        values = batch.values(self.expr)
+        valid = np.zeros(batch.num_rows, dtype=bool)
+        undecided = np.ones(batch.num_rows, dtype=bool)
+
+        rows = [i for i, v in enumerate(values) if isinstance(v, (list, tuple, np.ndarray))]
+        if rows:
+            try:
+                matrix = np.asarray([values[i] for i in rows])
+            except ValueError:  # ragged
+                matrix = None
+            # Only plain numeric matrices are exact; strings / None / Decimal go row by row
+            if matrix is not None and matrix.ndim == 2 and matrix.dtype.kind in 'fiub':
+                valid[rows] = np.isfinite(matrix).all(axis=1) if matrix.dtype.kind == 'f' else True
+                undecided[rows] = False
+        return valid, undecided
+
+    @property
+    def columns(self) -> Set[str]:
+        return self.expr.columns
+
+
+class Or(Predicate):
+    """Python ``left or right``: right only matters where left is falsy."""
+
+    def __init__(self, left: Predicate, right: Predicate):
+        self.left = left
+        self.right = right
+
+    def __call__(self, record: dict) -> Any:
+        return self.left(record) or self.right(record)
+
+    def evaluate(self, batch: ColumnBatch) -> Masks:
+        left_valid, left_und = self.left.evaluate(batch)
+        right_valid, right_und = self.right.evaluate(batch)
+        needs_right = ~left_und & ~left_valid
+        undecided = left_und | (needs_right & right_und)
+        valid = ~left_und & (left_valid | (~right_und & right_valid))
+        return valid, undecided
+
+    @property
+    def columns(self) -> Set[str]:
+        return self.left.columns | self.right.columns
+
+
+class And(Predicate):
+    """Python ``left and right``: right only matters where left is truthy."""
+
+    def __init__(self, left: Predicate, right: Predicate):
+        self.left = left
+        self.right = right
+
+    def __call__(self, record: dict) -> Any:
+        return self.left(record) and self.right(record)
+
+    def evaluate(self, batch: ColumnBatch) -> Masks:
+        left_valid, left_und = self.left.evaluate(batch)
+        right_valid, right_und = self.right.evaluate(batch)
+        needs_right = ~left_und & left_valid
+        undecided = left_und | (needs_right & right_und)
+        valid = needs_right & ~right_und & right_valid
+        return valid, undecided
+
+    @property
+    def columns(self) -> Set[str]:
+        return self.left.columns | self.right.columns
+
+
+# =============================================================================
+# COMMON RULE SHAPES
+# =============================================================================
+
+def required(name: str) -> Predicate:
+    """``r.get(name) is not None``"""
+    return col(name).is_not_null()
+
+
+def null_or_between(name: str, low: float, high: float) -> Predicate:
+    """``r.get(name) is None or low <= r.get(name) <= high``"""
+    return col(name).is_null() | col(name).between(low, high)
+
+
+def null_or_at_least(name: str, low: float) -> Predicate:
+    """``r.get(name) is None or r.get(name) >= low``"""
+    return col(name).is_null() | (col(name) >= low)
+
+
+def null_when(flag: str, name: str) -> Predicate:
+    """``not r.get(flag) or r.get(name) is None``"""
+    return col(flag).falsy() | col(name).is_null()
+
+
+# =============================================================================
+# COMPILATION
+# =============================================================================
+
+@dataclass
+class CompiledRules:
+    """
+    A table's rules split into column predicates and row-only callables.
+
+    evaluate() returns one (failed, undecided) mask pair per rule, in rule
+    order. Rules whose condition is a plain callable are undecided for every
+    row and are checked with the row path.
+    """
+    conditions: List[Any]
+    columnar: List[bool]
+    columns: Tuple[str, ...]
+
+    def evaluate(self, batch: ColumnBatch) -> List[Masks]:
+        none = np.zeros(batch.num_rows, dtype=bool)
+        every = np.ones(batch.num_rows, dtype=bool)
+        outcomes = []
+        for condition, is_columnar in zip(self.conditions, self.columnar):
+            if not is_columnar:
+                outcomes.append((none, every))
+                continue
+            valid, undecided = condition.evaluate(batch)
+            outcomes.append((~valid & ~undecided, undecided))
+        return outcomes
+
+    @property
+    def row_only_count(self) -> int:
+        return self.columnar.count(False)
+
+    def matches(self, rules: Sequence[Any]) -> bool:
+        """True if these are the compiled conditions of ``rules`` (same objects, same order)."""
+        return len(rules) == len(self.conditions) and all(
+            rule.condition is condition for rule, condition in zip(rules, self.conditions)
+        )
+
+
+def compile_rules(rules: Sequence[Any]) -> CompiledRules:
+    """Compile a table's ValidationRules (anything with a ``condition``)."""
+    conditions = [rule.condition for rule in rules]
+    columnar = [isinstance(c, Predicate) for c in conditions]
+    columns: Dict[str, None] = {}
+    for condition, is_columnar in zip(conditions, columnar):
+        if is_columnar:
+            columns.update(dict.fromkeys(sorted(condition.columns)))
+    return CompiledRules(conditions, columnar, tuple(columns))
@@ -9,6 +9,13 @@ This module provides:
 2. PreWriteValidator - Validate records against rules for a target table
 3. Pre-built rules for player_game_summary, player_composite_factors, ml_feature_store_v2
 
+Rule conditions are column predicates (shared/validation/column_rules.py),
+e.g. ``null_or_between('points', 0, 100)``. They are compiled once per table
+and evaluated over the whole batch as boolean masks. Violation details are
+built only for failing rows. Plain callables still work as conditions and
+are checked row by row. PRE_WRITE_VALIDATION_MODE=rowwise turns the
+compiled path off.
+
 Usage:
     from shared.validation.pre_write_validator import PreWriteValidator
 
@@ -22,25 +29,45 @@ Usage:
     # Only write valid records
     write_to_bigquery(valid_records)
 
-Version: 1.0
+Version: 1.1 - Compiled column-wise validation
 Created: 2026-01-30
 Part of: Data Quality Self-Healing System
 """
 
 import logging
+import os
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional, Tuple
 import uuid
 
+import numpy as np
+
+from shared.validation.column_rules import (
+    ColumnBatch,
+    CompiledRules,
+    col,
+    compile_rules,
+    null_or_at_least,
+    null_or_between,
+    null_when,
+    required,
+)
+
 logger = logging.getLogger(__name__)
 
 
+def compiled_validation_enabled() -> bool:
+    """Return False when PRE_WRITE_VALIDATION_MODE=rowwise."""
+    return os.environ.get('PRE_WRITE_VALIDATION_MODE', 'compiled').lower() != 'rowwise'
+
+
 @dataclass
 class ValidationRule:
     """A single validation rule with condition and error message."""
     name: str
-    condition: Callable[[dict], bool]  # Returns True if record is VALID
+    condition: Callable[[dict], bool]  # Returns True if record is VALID (column predicate or callable)
     error_message: str
     severity: str = "ERROR"  # ERROR blocks write, WARNING logs only
 
@@ -77,6 +104,25 @@ class ValidationResult:
         return len([v for v in self.violations if v.get('severity') == 'WARNING'])
 
 
+@dataclass
+class BatchValidationResult:
+    """Result of validating a batch (records, DataFrame or Arrow table)."""
+    valid_mask: np.ndarray  # True for rows without ERROR violations
+    violations: Dict[int, List[dict]] = field(default_factory=dict)  # failing rows only
+
+    @property
+    def invalid_indices(self) -> List[int]:
+        return np.flatnonzero(~self.valid_mask).tolist()
+
+    @property
+    def error_count(self) -> int:
+        return sum(1 for vs in self.violations.values() for v in vs if v.get('severity') == 'ERROR')
+
+    @property
+    def warning_count(self) -> int:
+        return sum(1 for vs in self.violations.values() for v in vs if v.get('severity') == 'WARNING')
+
+
 # =============================================================================
 # BUSINESS RULES BY TABLE
 # =============================================================================
@@ -91,70 +137,70 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
         # This is the EXACT bug that caused the January 2026 incident
         ValidationRule(
             name='dnp_null_points',
-            condition=lambda r: not r.get('is_dnp') or r.get('points') is None,
+            condition=null_when('is_dnp', 'points'),
             error_message="DNP players must have NULL points, not 0 or any value"
         ),
         ValidationRule(
             name='dnp_null_minutes',
-            condition=lambda r: not r.get('is_dnp') or r.get('minutes') is None,
+            condition=null_when('is_dnp', 'minutes'),
             error_message="DNP players must have NULL minutes"
         ),
         ValidationRule(
             name='dnp_null_rebounds',
-            condition=lambda r: not r.get('is_dnp') or r.get('rebounds') is None,
+            condition=null_when('is_dnp', 'rebounds'),
             error_message="DNP players must have NULL rebounds"
         ),
         ValidationRule(
             name='dnp_null_assists',
-            condition=lambda r: not r.get('is_dnp') or r.get('assists') is None,
+            condition=null_when('is_dnp', 'assists'),
             error_message="DNP players must have NULL assists"
         ),
 
         # Active players must have valid stats
         ValidationRule(
             name='active_non_negative_points',
-            condition=lambda r: r.get('is_dnp') or (r.get('points') is None or r.get('points', 0) >= 0),
+            condition=col('is_dnp').truthy() | null_or_at_least('points', 0),
             error_message="Active players cannot have negative points"
         ),
         ValidationRule(
             name='active_non_negative_minutes',
-            condition=lambda r: r.get('is_dnp') or (r.get('minutes') is None or r.get('minutes', 0) >= 0),
+            condition=col('is_dnp').truthy() | null_or_at_least('minutes', 0),
             error_message="Active players cannot have negative minutes"
         ),
 
         # Required fields for identity
         ValidationRule(
             name='required_player_lookup',
-            condition=lambda r: r.get('player_lookup') is not None,
+            condition=required('player_lookup'),
             error_message="player_lookup is required"
         ),
         ValidationRule(
             name='required_game_date',
-            condition=lambda r: r.get('game_date') is not None,
+            condition=required('game_date'),
             error_message="game_date is required"
         ),
         ValidationRule(
             name='required_game_id',
-            condition=lambda r: r.get('game_id') is not None,
+            condition=required('game_id'),
             error_message="game_id is required"
         ),
 
         # Stat ranges (when not NULL)
         ValidationRule(
             name='points_range',
-            condition=lambda r: r.get('points') is None or 0 <= r.get('points', 0) <= 100,
+            condition=null_or_between('points', 0, 100),
             error_message="points must be 0-100 (or NULL)",
             severity="WARNING"
         ),
         ValidationRule(
             name='minutes_range',
-            condition=lambda r: r.get('minutes') is None or 0 <= r.get('minutes', 0) <= 60,
+            condition=null_or_between('minutes', 0, 60),
             error_message="minutes must be 0-60 (or NULL)",
             severity="WARNING"
         ),
         ValidationRule(
             name='usage_rate_range',
-            condition=lambda r: r.get('usage_rate') is None or 0 <= r.get('usage_rate', 0) <= 50,
+            condition=null_or_between('usage_rate', 0, 50),
             error_message="usage_rate must be 0-50% (or NULL) - values >100% indicate calculation error",
             severity="ERROR"  # BLOCK writes - this is a data corruption issue
         ),
@@ -168,7 +214,7 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
         # This catches the parallel processing bug from January 2026
         ValidationRule(
             name='fatigue_score_range',
-            condition=lambda r: r.get('fatigue_score') is None or 0 <= r.get('fatigue_score', 0) <= 100,
+            condition=null_or_between('fatigue_score', 0, 100),
             error_message="fatigue_score must be 0-100"
         ),
 
@@ -176,25 +222,25 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
         # shot_zone_mismatch_score: adjustment factor, typically -10 to +10 (processor allows -15 to +15)
         ValidationRule(
             name='shot_zone_mismatch_range',
-            condition=lambda r: r.get('shot_zone_mismatch_score') is None or -15 <= r.get('shot_zone_mismatch_score', 0) <= 15,
+            condition=null_or_between('shot_zone_mismatch_score', -15, 15),
             error_message="shot_zone_mismatch_score must be -15 to 15"
         ),
         # pace_score: adjustment factor, typically -3 to +3 (processor allows -8 to +8)
         ValidationRule(
             name='pace_score_range',
-            condition=lambda r: r.get('pace_score') is None or -8 <= r.get('pace_score', 0) <= 8,
+            condition=null_or_between('pace_score', -8, 8),
             error_message="pace_score must be -8 to 8"
         ),
 
         # Required fields
         ValidationRule(
             name='required_player_lookup',
-            condition=lambda r: r.get('player_lookup') is not None,
+            condition=required('player_lookup'),
             error_message="player_lookup is required"
         ),
         ValidationRule(
             name='required_game_date',
-            condition=lambda r: r.get('game_date') is not None,
+            condition=required('game_date'),
             error_message="game_date is required"
         ),
     ],
@@ -206,29 +252,26 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
         # Feature array must have correct count
         ValidationRule(
             name='feature_array_length',
-            condition=lambda r: r.get('features') is None or len(r.get('features', [])) == 34,
+            condition=col('features').is_null() | (col('features').length() == 34),
             error_message="features array must have exactly 34 elements"
         ),
 
         # No NaN or Inf in features
         ValidationRule(
             name='no_nan_features',
-            condition=lambda r: r.get('features') is None or not any(
-                str(f).lower() in ('nan', 'inf', '-inf', 'none')
-                for f in r.get('features', [])
-            ),
+            condition=col('features').is_null() | col('features').no_nan_or_inf(),
             error_message="features array cannot contain NaN or Inf values"
         ),
 
         # Required fields
         ValidationRule(
             name='required_player_lookup',
-            condition=lambda r: r.get('player_lookup') is not None,
+            condition=required('player_lookup'),
             error_message="player_lookup is required"
         ),
         ValidationRule(
             name='required_game_date',
-            condition=lambda r: r.get('game_date') is not None,
+            condition=required('game_date'),
             error_message="game_date is required"
         ),
 
@@ -236,11 +279,11 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
         # Index 0: points_avg (0-50 typical)
         ValidationRule(
             name='feature_points_avg_range',
-            condition=lambda r: (
-                r.get('features') is None or
-                len(r.get('features', [])) < 1 or
-                r.get('features')[0] is None or
-                0 <= r.get('features')[0] <= 60
+            condition=(
+                col('features').is_null() |
+                (col('features').length() < 1) |
+                col('features').item(0).is_null() |
+                col('features').item(0).between(0, 60)
             ),
             error_message="features[0] (points_avg) should be 0-60",
             severity="WARNING"
@@ -248,11 +291,11 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
         # Index 5: fatigue_score (0-100)
         ValidationRule(
             name='feature_fatigue_range',
-            condition=lambda r: (
-                r.get('features') is None or
-                len(r.get('features', [])) < 6 or
-                r.get('features')[5] is None or
-                0 <= r.get('features')[5] <= 100
+            condition=(
+                col('features').is_null() |
+                (col('features').length() < 6) |
+                col('features').item(5).is_null() |
+                col('features').item(5).between(0, 100)
             ),
             error_message="features[5] (fatigue_score) must be 0-100"
         ),
@@ -264,17 +307,17 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
     'prediction_accuracy': [
         ValidationRule(
             name='required_prediction_id',
-            condition=lambda r: r.get('prediction_id') is not None,
+            condition=required('prediction_id'),
             error_message="prediction_id is required"
         ),
         ValidationRule(
             name='required_game_date',
-            condition=lambda r: r.get('game_date') is not None,
+            condition=required('game_date'),
             error_message="game_date is required"
         ),
         ValidationRule(
             name='actual_points_range',
-            condition=lambda r: r.get('actual_points') is None or 0 <= r.get('actual_points', 0) <= 100,
+            condition=null_or_between('actual_points', 0, 100),
             error_message="actual_points must be 0-100",
             severity="WARNING"
         ),
@@ -288,24 +331,24 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
         # ERROR: Block placeholder/incomplete data
         ValidationRule(
             name='points_not_zero',
-            condition=lambda r: r.get('points_scored', 0) > 0,
+            condition=col('points_scored', default=0) > 0,
             error_message="Team scored 0 points - bad source data or placeholder"
         ),
         ValidationRule(
             name='fg_attempts_not_zero',
-            condition=lambda r: r.get('fg_attempts', 0) > 0,
+            condition=col('fg_attempts', default=0) > 0,
             error_message="Team has 0 FG attempts - bad source data"
         ),
         ValidationRule(
             name='possessions_required',
-            condition=lambda r: r.get('possessions') is not None,
+            condition=required('possessions'),
             error_message="Possessions NULL - cannot calculate usage_rate"
         ),
 
         # WARNING: Unusual but possible scenarios
         ValidationRule(
             name='unusually_low_score',
-            condition=lambda r: r.get('points_scored', 0) == 0 or r.get('points_scored', 100) >= 80,
+            condition=(col('points_scored', default=0) == 0) | (col('points_scored', default=100) >= 80),
             error_message="Team scored <80 points - unusual but possible",
             severity="WARNING"
         ),
@@ -313,29 +356,29 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
         # Required identity fields
         ValidationRule(
             name='required_game_id',
-            condition=lambda r: r.get('game_id') is not None,
+            condition=required('game_id'),
             error_message="game_id is required"
         ),
         ValidationRule(
             name='required_game_date',
-            condition=lambda r: r.get('game_date') is not None,
+            condition=required('game_date'),
             error_message="game_date is required"
         ),
         ValidationRule(
             name='required_team_abbr',
-            condition=lambda r: r.get('team_abbr') is not None,
+            condition=required('team_abbr'),
             error_message="team_abbr is required"
         ),
 
         # Stat sanity checks
         ValidationRule(
             name='fg_made_not_exceed_attempts',
-            condition=lambda r: r.get('fg_made', 0) <= r.get('fg_attempts', 999),
+            condition=col('fg_made', default=0) <= col('fg_attempts', default=999),
             error_message="FG made cannot exceed FG attempts"
         ),
         ValidationRule(
             name='points_reasonable_range',
-            condition=lambda r: r.get('points_scored') is None or 0 < r.get('points_scored', 100) <= 200,
+            condition=col('points_scored').is_null() | col('points_scored').between(0, 200, inclusive='right'),
             error_message="points_scored must be 1-200",
             severity="WARNING"
         ),
@@ -349,30 +392,30 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
         # ERROR: Block placeholder/incomplete data
         ValidationRule(
             name='points_allowed_not_zero',
-            condition=lambda r: r.get('points_allowed', 0) > 0,
+            condition=col('points_allowed', default=0) > 0,
             error_message="Team allowed 0 points - bad source data or placeholder"
         ),
         ValidationRule(
             name='opp_fg_attempts_not_zero',
-            condition=lambda r: r.get('opp_fg_attempts', 0) > 0,
+            condition=col('opp_fg_attempts', default=0) > 0,
             error_message="Opponent had 0 FG attempts - bad source data"
         ),
         ValidationRule(
             name='defensive_rating_valid',
-            condition=lambda r: r.get('defensive_rating') is None or r.get('defensive_rating', 1) > 0,
+            condition=col('defensive_rating').is_null() | (col('defensive_rating') > 0),
             error_message="Defensive rating is 0 or negative - calculation error"
         ),
 
         # WARNING: Unusual but possible scenarios
         ValidationRule(
             name='unusually_low_points_allowed',
-            condition=lambda r: r.get('points_allowed', 0) == 0 or r.get('points_allowed', 100) >= 70,
+            condition=(col('points_allowed', default=0) == 0) | (col('points_allowed', default=100) >= 70),
             error_message="Team allowed <70 points - unusual but possible",
             severity="WARNING"
         ),
         ValidationRule(
             name='unusually_high_points_allowed',
-            condition=lambda r: r.get('points_allowed') is None or r.get('points_allowed', 100) <= 180,
+            condition=col('points_allowed').is_null() | (col('points_allowed') <= 180),
             error_message="Team allowed >180 points - unusual but possible",
             severity="WARNING"
         ),
@@ -380,29 +423,29 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
         # Required identity fields
         ValidationRule(
             name='required_game_id',
-            condition=lambda r: r.get('game_id') is not None,
+            condition=required('game_id'),
             error_message="game_id is required"
         ),
         ValidationRule(
             name='required_game_date',
-            condition=lambda r: r.get('game_date') is not None,
+            condition=required('game_date'),
             error_message="game_date is required"
         ),
         ValidationRule(
             name='required_defending_team',
-            condition=lambda r: r.get('defending_team_abbr') is not None,
+            condition=required('defending_team_abbr'),
             error_message="defending_team_abbr is required"
         ),
 
         # Stat sanity checks
         ValidationRule(
             name='opp_fg_made_not_exceed_attempts',
-            condition=lambda r: r.get('opp_fg_makes', 0) <= r.get('opp_fg_attempts', 999),
+            condition=col('opp_fg_makes', default=0) <= col('opp_fg_attempts', default=999),
             error_message="Opponent FG made cannot exceed FG attempts"
         ),
         ValidationRule(
             name='opp_ft_made_not_exceed_attempts',
-            condition=lambda r: r.get('opp_ft_makes', 0) <= r.get('opp_ft_attempts', 999),
+            condition=col('opp_ft_makes', default=0) <= col('opp_ft_attempts', default=999),
             error_message="Opponent FT made cannot exceed FT attempts"
         ),
     ],
@@ -414,77 +457,77 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
         # Required fields
         ValidationRule(
             name='required_player_lookup',
-            condition=lambda r: r.get('player_lookup') is not None,
+            condition=required('player_lookup'),
             error_message="player_lookup is required"
         ),
         ValidationRule(
             name='required_analysis_date',
-            condition=lambda r: r.get('analysis_date') is not None,
+            condition=required('analysis_date'),
             error_message="analysis_date is required"
         ),
 
         # Zone rate percentages (distribution: should sum to ~100%)
         ValidationRule(
             name='paint_rate_range',
-            condition=lambda r: r.get('paint_rate_last_10') is None or 0 <= r.get('paint_rate_last_10') <= 100,
+            condition=null_or_between('paint_rate_last_10', 0, 100),
             error_message="paint_rate_last_10 must be 0-100%"
         ),
         ValidationRule(
             name='mid_range_rate_range',
-            condition=lambda r: r.get('mid_range_rate_last_10') is None or 0 <= r.get('mid_range_rate_last_10') <= 100,
+            condition=null_or_between('mid_range_rate_last_10', 0, 100),
             error_message="mid_range_rate_last_10 must be 0-100%"
         ),
         ValidationRule(
             name='three_pt_rate_range',
-            condition=lambda r: r.get('three_pt_rate_last_10') is None or 0 <= r.get('three_pt_rate_last_10') <= 100,
+            condition=null_or_between('three_pt_rate_last_10', 0, 100),
             error_message="three_pt_rate_last_10 must be 0-100%"
         ),
 
         # Zone efficiency percentages (FG%)
         ValidationRule(
             name='paint_pct_range',
-            condition=lambda r: r.get('paint_pct_last_10') is None or 0 <= r.get('paint_pct_last_10') <= 1.0,
+            condition=null_or_between('paint_pct_last_10', 0, 1.0),
             error_message="paint_pct_last_10 must be 0-1.0 (0-100%)"
         ),
         ValidationRule(
             name='mid_range_pct_range',
-            condition=lambda r: r.get('mid_range_pct_last_10') is None or 0 <= r.get('mid_range_pct_last_10') <= 1.0,
+            condition=null_or_between('mid_range_pct_last_10', 0, 1.0),
             error_message="mid_range_pct_last_10 must be 0-1.0 (0-100%)"
         ),
         ValidationRule(
             name='three_pt_pct_range',
-            condition=lambda r: r.get('three_pt_pct_last_10') is None or 0 <= r.get('three_pt_pct_last_10') <= 1.0,
+            condition=null_or_between('three_pt_pct_last_10', 0, 1.0),
             error_message="three_pt_pct_last_10 must be 0-1.0 (0-100%)"
         ),
 
         # Attempts per game (non-negative, reasonable max)
         ValidationRule(
             name='paint_attempts_pg_range',
-            condition=lambda r: r.get('paint_attempts_per_game') is None or 0 <= r.get('paint_attempts_per_game') <= 40,
+            condition=null_or_between('paint_attempts_per_game', 0, 40),
             error_message="paint_attempts_per_game must be 0-40"
         ),
         ValidationRule(
             name='mid_range_attempts_pg_range',
-            condition=lambda r: r.get('mid_range_attempts_per_game') is None or 0 <= r.get('mid_range_attempts_per_game') <= 40,
+            condition=null_or_between('mid_range_attempts_per_game', 0, 40),
             error_message="mid_range_attempts_per_game must be 0-40"
         ),
         ValidationRule(
             name='three_pt_attempts_pg_range',
-            condition=lambda r: r.get('three_pt_attempts_per_game') is None or 0 <= r.get('three_pt_attempts_per_game') <= 40,
+            condition=null_or_between('three_pt_attempts_per_game', 0, 40),
             error_message="three_pt_attempts_per_game must be 0-40"
         ),
 
         # Games in sample (positive integer)
         ValidationRule(
             name='games_in_sample_positive',
-            condition=lambda r: r.get('games_in_sample_10') is None or r.get('games_in_sample_10', 0) >= 0,
+            condition=null_or_at_least('games_in_sample_10', 0),
             error_message="games_in_sample_10 must be non-negative"
         ),
 
         # Total shots sanity check
         ValidationRule(
             name='total_shots_reasonable',
-            condition=lambda r: r.get('total_shots_last_10') is None or 0 <= r.get('total_shots_last_10') <= 400,
+            condition=null_or_between('total_shots_last_10', 0, 400),
             error_message="total_shots_last_10 must be 0-400 (reasonable for 10 games)"
         ),
     ],
@@ -496,74 +539,74 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
         # Required fields
         ValidationRule(
             name='required_team_abbr',
-            condition=lambda r: r.get('team_abbr') is not None,
+            condition=required('team_abbr'),
             error_message="team_abbr is required"
         ),
         ValidationRule(
             name='required_analysis_date',
-            condition=lambda r: r.get('analysis_date') is not None,
+            condition=required('analysis_date'),
             error_message="analysis_date is required"
         ),
 
         # FG% allowed by zone (0-100% stored as 0-1.0)
         ValidationRule(
             name='paint_pct_allowed_range',
-            condition=lambda r: r.get('paint_pct_allowed_last_15') is None or 0 <= r.get('paint_pct_allowed_last_15') <= 1.0,
+            condition=null_or_between('paint_pct_allowed_last_15', 0, 1.0),
             error_message="paint_pct_allowed_last_15 must be 0-1.0 (0-100%)"
         ),
         ValidationRule(
             name='mid_range_pct_allowed_range',
-            condition=lambda r: r.get('mid_range_pct_allowed_last_15') is None or 0 <= r.get('mid_range_pct_allowed_last_15') <= 1.0,
+            condition=null_or_between('mid_range_pct_allowed_last_15', 0, 1.0),
             error_message="mid_range_pct_allowed_last_15 must be 0-1.0 (0-100%)"
         ),
         ValidationRule(
             name='three_pt_pct_allowed_range',
-            condition=lambda r: r.get('three_pt_pct_allowed_last_15') is None or 0 <= r.get('three_pt_pct_allowed_last_15') <= 1.0,
+            condition=null_or_between('three_pt_pct_allowed_last_15', 0, 1.0),
             error_message="three_pt_pct_allowed_last_15 must be 0-1.0 (0-100%)"
         ),
 
         # Attempts allowed per game (non-negative, reasonable max)
         ValidationRule(
             name='paint_attempts_allowed_range',
-            condition=lambda r: r.get('paint_attempts_allowed_per_game') is None or 0 <= r.get('paint_attempts_allowed_per_game') <= 100,
+            condition=null_or_between('paint_attempts_allowed_per_game', 0, 100),
             error_message="paint_attempts_allowed_per_game must be 0-100"
         ),
         ValidationRule(
             name='mid_range_attempts_allowed_range',
-            condition=lambda r: r.get('mid_range_attempts_allowed_per_game') is None or 0 <= r.get('mid_range_attempts_allowed_per_game') <= 100,
+            condition=null_or_between('mid_range_attempts_allowed_per_game', 0, 100),
             error_message="mid_range_attempts_allowed_per_game must be 0-100"
         ),
         ValidationRule(
             name='three_pt_attempts_allowed_range',
-            condition=lambda r: r.get('three_pt_attempts_allowed_per_game') is None or 0 <= r.get('three_pt_attempts_allowed_per_game') <= 100,
+            condition=null_or_between('three_pt_attempts_allowed_per_game', 0, 100),
             error_message="three_pt_attempts_allowed_per_game must be 0-100"
         ),
 
         # Points allowed per game (paint zone)
         ValidationRule(
             name='paint_points_allowed_range',
-            condition=lambda r: r.get('paint_points_allowed_per_game') is None or 0 <= r.get('paint_points_allowed_per_game') <= 150,
+            condition=null_or_between('paint_points_allowed_per_game', 0, 150),
             error_message="paint_points_allowed_per_game must be 0-150"
         ),
 
         # Defensive rating (typical range: 80-130)
         ValidationRule(
             name='defensive_rating_range',
-            condition=lambda r: r.get('defensive_rating_last_15') is None or 70 <= r.get('defensive_rating_last_15') <= 140,
+            condition=null_or_between('defensive_rating_last_15', 70, 140),
             error_message="defensive_rating_last_15 must be 70-140 (reasonable NBA range)"
         ),
 
         # Opponent points per game
         ValidationRule(
             name='opponent_ppg_range',
-            condition=lambda r: r.get('opponent_points_per_game') is None or 70 <= r.get('opponent_points_per_game') <= 150,
+            condition=null_or_between('opponent_points_per_game', 70, 150),
             error_message="opponent_points_per_game must be 70-150"
         ),
 
         # Games in sample (positive integer)
         ValidationRule(
             name='games_in_sample_positive',
-            condition=lambda r: r.get('games_in_sample') is None or r.get('games_in_sample', 0) >= 0,
+            condition=null_or_at_least('games_in_sample', 0),
             error_message="games_in_sample must be non-negative"
         ),
 
@@ -573,17 +616,17 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
         # Session 162: Fixed from ±0.30 (fractions) to ±15.0 (percentage points) — unit mismatch
         ValidationRule(
             name='paint_defense_vs_avg_range',
-            condition=lambda r: r.get('paint_defense_vs_league_avg') is None or -15.0 <= r.get('paint_defense_vs_league_avg') <= 15.0,
+            condition=null_or_between('paint_defense_vs_league_avg', -15.0, 15.0),
             error_message="paint_defense_vs_league_avg must be -15.0 to +15.0 (percentage points)"
         ),
         ValidationRule(
             name='mid_range_defense_vs_avg_range',
-            condition=lambda r: r.get('mid_range_defense_vs_league_avg') is None or -15.0 <= r.get('mid_range_defense_vs_league_avg') <= 15.0,
+            condition=null_or_between('mid_range_defense_vs_league_avg', -15.0, 15.0),
             error_message="mid_range_defense_vs_league_avg must be -15.0 to +15.0 (percentage points)"
         ),
         ValidationRule(
             name='three_pt_defense_vs_avg_range',
-            condition=lambda r: r.get('three_pt_defense_vs_league_avg') is None or -15.0 <= r.get('three_pt_defense_vs_league_avg') <= 15.0,
+            condition=null_or_between('three_pt_defense_vs_league_avg', -15.0, 15.0),
             error_message="three_pt_defense_vs_league_avg must be -15.0 to +15.0 (percentage points)"
         ),
     ],
@@ -595,90 +638,102 @@ BUSINESS_RULES: Dict[str, List[ValidationRule]] = {
         # Required fields
         ValidationRule(
             name='required_game_date',
-            condition=lambda r: r.get('game_date') is not None,
+            condition=required('game_date'),
             error_message="game_date is required"
         ),
         ValidationRule(
             name='required_opponent_team_abbr',
-            condition=lambda r: r.get('opponent_team_abbr') is not None,
+            condition=required('opponent_team_abbr'),
             error_message="opponent_team_abbr is required"
         ),
 
         # FG% allowed by zone (0-100% stored as 0-1.0 in NUMERIC)
         ValidationRule(
             name='paint_fg_pct_allowed_range',
-            condition=lambda r: r.get('paint_fg_pct_allowed') is None or 0 <= r.get('paint_fg_pct_allowed') <= 1.0,
+            condition=null_or_between('paint_fg_pct_allowed', 0, 1.0),
             error_message="paint_fg_pct_allowed must be 0-1.0 (0-100%)"
         ),
         ValidationRule(
             name='mid_range_fg_pct_allowed_range',
-            condition=lambda r: r.get('mid_range_fg_pct_allowed') is None or 0 <= r.get('mid_range_fg_pct_allowed') <= 1.0,
+            condition=null_or_between('mid_range_fg_pct_allowed', 0, 1.0),
             error_message="mid_range_fg_pct_allowed must be 0-1.0 (0-100%)"
         ),
         ValidationRule(
             name='three_pt_fg_pct_allowed_range',
-            condition=lambda r: r.get('three_pt_fg_pct_allowed') is None or 0 <= r.get('three_pt_fg_pct_allowed') <= 1.0,
+            condition=null_or_between('three_pt_fg_pct_allowed', 0, 1.0),
             error_message="three_pt_fg_pct_allowed must be 0-1.0 (0-100%)"
         ),
 
         # Attempts allowed (non-negative)
         ValidationRule(
             name='paint_attempts_allowed_nonnegative',
-            condition=lambda r: r.get('paint_attempts_allowed') is None or r.get('paint_attempts_allowed', 0) >= 0,
+            condition=null_or_at_least('paint_attempts_allowed', 0),
             error_message="paint_attempts_allowed must be non-negative"
         ),
         ValidationRule(
             name='mid_range_attempts_allowed_nonnegative',
-            condition=lambda r: r.get('mid_range_attempts_allowed') is None or r.get('mid_range_attempts_allowed', 0) >= 0,
+            condition=null_or_at_least('mid_range_attempts_allowed', 0),
             error_message="mid_range_attempts_allowed must be non-negative"
         ),
         ValidationRule(
             name='three_pt_attempts_allowed_nonnegative',
-            condition=lambda r: r.get('three_pt_attempts_allowed') is None or r.get('three_pt_attempts_allowed', 0) >= 0,
+            condition=null_or_at_least('three_pt_attempts_allowed', 0),
             error_message="three_pt_attempts_allowed must be non-negative"
         ),
 
         # Blocks (non-negative)
         ValidationRule(
             name='paint_blocks_nonnegative',
-            condition=lambda r: r.get('paint_blocks') is None or r.get('paint_blocks', 0) >= 0,
+            condition=null_or_at_least('paint_blocks', 0),
             error_message="paint_blocks must be non-negative"
         ),
         ValidationRule(
             name='mid_range_blocks_nonnegative',
-            condition=lambda r: r.get('mid_range_blocks') is None or r.get('mid_range_blocks', 0) >= 0,
+            condition=null_or_at_least('mid_range_blocks', 0),
             error_message="mid_range_blocks must be non-negative"
         ),
         ValidationRule(
             name='three_pt_blocks_nonnegative',
-            condition=lambda r: r.get('three_pt_blocks') is None or r.get('three_pt_blocks', 0) >= 0,
+            condition=null_or_at_least('three_pt_blocks', 0),
             error_message="three_pt_blocks must be non-negative"
         ),
 
         # Defensive rating (typical range: 80-130)
         ValidationRule(
             name='defensive_rating_range',
-            condition=lambda r: r.get('defensive_rating') is None or 70 <= r.get('defensive_rating') <= 140,
+            condition=null_or_between('defensive_rating', 70, 140),
             error_message="defensive_rating must be 70-140 (reasonable NBA range)"
         ),
 
         # Opponent points average
         ValidationRule(
             name='opponent_points_avg_range',
-            condition=lambda r: r.get('opponent_points_avg') is None or 70 <= r.get('opponent_points_avg') <= 150,
+            condition=null_or_between('opponent_points_avg', 70, 150),
             error_message="opponent_points_avg must be 70-150"
         ),
 
         # Games in sample (positive integer)
         ValidationRule(
             name='games_in_sample_positive',
-            condition=lambda r: r.get('games_in_sample') is None or r.get('games_in_sample', 0) >= 0,
+            condition=null_or_at_least('games_in_sample', 0),
             error_message="games_in_sample must be non-negative"
         ),
     ],
 }
 
 
+_compiled_rules: Dict[str, CompiledRules] = {}
+_compiled_rules_lock = threading.Lock()
+
+
+def _compiled_business_rules(table_name: str) -> CompiledRules:
+    """BUSINESS_RULES for a table, compiled once per process."""
+    with _compiled_rules_lock:
+        if table_name not in _compiled_rules:
+            _compiled_rules[table_name] = compile_rules(BUSINESS_RULES.get(table_name, []))
+        return _compiled_rules[table_name]
+
+
 class PreWriteValidator:
     """
     Validates records against business rules before BigQuery write.
@@ -686,6 +741,10 @@ class PreWriteValidator:
     Usage:
         validator = PreWriteValidator('player_game_summary')
         valid, invalid = validator.validate(records)
+
+        # DataFrame / Arrow batches: masks plus violations for failing rows only
+        result = validator.validate_batch(df)
+        df = df[result.valid_mask]
     """
 
     def __init__(self, table_name: str, custom_rules: List[ValidationRule] = None):
@@ -705,6 +764,8 @@ class PreWriteValidator:
         if not self.rules:
             logger.warning(f"No validation rules defined for table: {table_name}")
 
+        self._compiled: Optional[CompiledRules] = None
+
     def validate(self, records: List[dict]) -> Tuple[List[dict], List[dict]]:
         """
         Validate records, returning (valid_records, invalid_records).
@@ -720,6 +781,72 @@ class PreWriteValidator:
         if not records:
             return [], []
 
+        if not compiled_validation_enabled():
+            return self._validate_rowwise(records)
+
+        result = self.validate_batch(records)
+        valid_records = [records[i] for i in np.flatnonzero(result.valid_mask)]
+        invalid_records = []
+        timestamp = datetime.now(timezone.utc).isoformat()
+
+        for i, violations in result.violations.items():
+            record = records[i]
+            if not result.valid_mask[i]:
+                record_copy = record.copy()
+                record_copy['_validation_violations'] = violations
+                record_copy['_validation_timestamp'] = timestamp
+                invalid_records.append(record_copy)
+                self._log_violations(record, violations)
+            else:
+                # Log warnings but don't block
+                self._log_warnings(record, violations)
+
+        return valid_records, invalid_records
+
+    def validate_batch(self, data: Any) -> BatchValidationResult:
+        """
+        Validate a batch column-wise with the table's compiled rules.
+
+        Args:
+            data: List of record dicts, pandas DataFrame, or pyarrow Table / RecordBatch
+
+        Returns:
+            BatchValidationResult with a valid-row mask and violation dicts
+            (same shape as validate()) for failing rows only
+        """
+        batch = ColumnBatch.of(data)
+        compiled = self._compiled_rules_for_batch()
+        rows: Dict[int, dict] = {}
+        violations: Dict[int, List[dict]] = {}
+
+        def row(i: int) -> dict:
+            if i not in rows:
+                rows[i] = batch.row(i)
+            return rows[i]
+
+        for rule, (failed, undecided) in zip(self.rules, compiled.evaluate(batch)):
+            for i in np.flatnonzero(failed | undecided).tolist():
+                # Undecided rows (and row-only rules) take the exact per-record path
+                error_msg = rule.validate(row(i)) if undecided[i] else f"{rule.name}: {rule.error_message}"
+                if error_msg:
+                    violations.setdefault(i, []).append(self._violation(rule, error_msg, row(i), i))
+
+        valid_mask = np.ones(batch.num_rows, dtype=bool)
+        for i, row_violations in violations.items():
+            if any(v['severity'] == 'ERROR' for v in row_violations):
+                valid_mask[i] = False
+
+        return BatchValidationResult(valid_mask=valid_mask, violations=dict(sorted(violations.items())))
+
+    def _compiled_rules_for_batch(self) -> CompiledRules:
+        """Compiled rules matching self.rules (shared per table unless rules were customized)."""
+        if self._compiled is None or not self._compiled.matches(self.rules):
+            shared = _compiled_business_rules(self.table_name)
+            self._compiled = shared if shared.matches(self.rules) else compile_rules(self.rules)
+        return self._compiled
+
+    def _validate_rowwise(self, records: List[dict]) -> Tuple[List[dict], List[dict]]:
+        """Per-record validation (PRE_WRITE_VALIDATION_MODE=rowwise)."""
         valid_records = []
         invalid_records = []
 
@@ -772,16 +899,19 @@ class PreWriteValidator:
         for rule in self.rules:
             error_msg = rule.validate(record)
             if error_msg:
-                violations.append({
-                    'rule_name': rule.name,
-                    'error_message': error_msg,
-                    'severity': rule.severity,
-                    'record_index': record_index,
-                    'field_values': self._extract_relevant_fields(record, rule.name)
-                })
+                violations.append(self._violation(rule, error_msg, record, record_index))
 
         return violations
 
+    def _violation(self, rule: ValidationRule, error_msg: str, record: dict, record_index: int) -> dict:
+        return {
+            'rule_name': rule.name,
+            'error_message': error_msg,
+            'severity': rule.severity,
+            'record_index': record_index,
+            'field_values': self._extract_relevant_fields(record, rule.name)
+        }
+
     def _extract_relevant_fields(self, record: dict, rule_name: str) -> dict:
         """Extract fields relevant to a rule for debugging."""
         # Map rule names to relevant fields
@@ -0,0 +1,114 @@
+"""
+Unit tests for ml/experiments/training_runner.py
+
+Tests cover:
+1. DatasetCache round-trips frames + metadata, keys on every part, and only
+   caches closed windows
+2. ResultsLedger survives a truncated last line
+3. run_cells() returns results in cell order (serial and process pool) and
+   resumes from a ledger without re-running completed cells
+
+Path: tests/ml/unit/test_training_runner.py
+Created: 2026-10-16
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from ml.experiments.training_runner import (
+    DatasetCache,
+    ResultsLedger,
+    cell_key,
+    get_dataset_cache,
+    run_cells,
+    threads_per_worker,
+)
+
+
+def _square_cell(params, shared, thread_count):
+    return {'x': params['x'], 'value': params['x'] ** 2 + shared, 'threads': thread_count}
+
+
+class TestDatasetCache:
+
+    def test_round_trip_with_meta(self, tmp_path):
+        cache = DatasetCache(str(tmp_path))
+        df = pd.DataFrame({
+            'player_lookup': ['a', 'b'],
+            'game_date': pd.to_datetime(['2026-01-05', '2026-01-06']),
+            'features': [[1.0, 2.0], [3.0, 4.0]],
+            'star_teammates_out': [1.0, np.nan],
+        })
+        parts = {'start': '2026-01-01', 'end': '2026-01-31', 'feature_set': 'v12'}
+        assert cache.save('train', df, {'experiment_feature_names': ['f1']}, **parts)
+
+        loaded, meta = cache.load('train', **parts)
+
+        assert meta == {'experiment_feature_names': ['f1']}
+        pd.testing.assert_frame_equal(loaded[['player_lookup', 'game_date', 'star_teammates_out']],
+                                      df[['player_lookup', 'game_date', 'star_teammates_out']])
+        assert [list(v) for v in loaded['features']] == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_any_part_changes_key(self, tmp_path):
+        cache = DatasetCache(str(tmp_path))
+        cache.save('train', pd.DataFrame({'a': [1]}), start='2026-01-01', min_ppg=None)
+        assert cache.load('train', start='2026-01-01', min_ppg=None) is not None
+        assert cache.load('train', start='2026-01-01', min_ppg=10) is None
+        assert cache.load('eval', start='2026-01-01', min_ppg=None) is None
+
+    def test_only_closed_windows_are_cacheable(self):
+        assert DatasetCache.cacheable((date.today() - timedelta(days=1)).isoformat())
+        assert not DatasetCache.cacheable(date.today().isoformat())
+
+    def test_disabled_without_dir(self, monkeypatch):
+        monkeypatch.delenv('QUICK_RETRAIN_DATA_CACHE', raising=False)
+        assert get_dataset_cache(None) is None
+        monkeypatch.setenv('QUICK_RETRAIN_DATA_CACHE', '/tmp/qr')
+        assert get_dataset_cache(None).root.as_posix() == '/tmp/qr'
+
+
+class TestResultsLedger:
+
+    def test_truncated_line_is_ignored(self, tmp_path):
+        ledger = ResultsLedger(str(tmp_path / 'ledger.jsonl'))
+        ledger.record('k1', {'mae': 5.1})
+        with open(ledger.path, 'a') as f:
+            f.write('{"cell": "k2", "res')
+
+        assert ledger.completed() == {'k1': {'mae': 5.1}}
+
+    def test_cell_key_is_order_independent(self):
+        assert cell_key({'a': 1, 'b': 2}, {'d': 'x'}) == cell_key({'b': 2, 'a': 1}, {'d': 'x'})
+        assert cell_key({'a': 1}, {'d': 'x'}) != cell_key({'a': 1}, {'d': 'y'})
+
+
+class TestRunCells:
+
+    def test_serial_keeps_order(self):
+        cells = [{'x': x} for x in (3, 1, 2)]
+        results = run_cells(_square_cell, cells, shared=10)
+        assert [r['value'] for r in results] == [19, 11, 14]
+        assert {r['threads'] for r in results} == {-1}
+
+    def test_process_pool_keeps_order(self):
+        cells = [{'x': x} for x in range(6)]
+        results = run_cells(_square_cell, cells, shared=1, workers=2)
+        assert [r['value'] for r in results] == [x ** 2 + 1 for x in range(6)]
+        assert {r['threads'] for r in results} == {threads_per_worker(2)}
+
+    def test_resumes_from_ledger(self, tmp_path):
+        ledger = ResultsLedger(str(tmp_path / 'ledger.jsonl'))
+        cells = [{'x': x} for x in range(4)]
+        run_cells(_square_cell, cells[:2], shared=0, ledger=ledger, context={'data': 'd1'})
+
+        seen = []
+        results = run_cells(
+            _square_cell, cells, shared=0, ledger=ledger, context={'data': 'd1'},
+            on_result=lambda i, params, result, from_ledger: seen.append((i, from_ledger)),
+        )
+
+        assert [r['value'] for r in results] == [0, 1, 4, 9]
+        assert sorted(seen) == [(0, True), (1, True), (2, False), (3, False)]
+        assert len(ledger.completed()) == 4
@@ -0,0 +1,248 @@
+# tests/mlb/test_feature_matrix.py
+"""
+Unit tests for whole-slate MLB scoring
+
+Tests cover:
+1. FeatureContract normalization and FeatureMatrix NaN / default accounting
+2. predict_many() matches per-row predict() for every model-backed system,
+   including BLOCKED and unconvertible rows
+3. One model call per slate; per-row fallback when the slate call fails
+4. Shared matrices across same-contract systems and ensemble result reuse
+5. MLB_BATCH_PREDICT=per_row
+6. Legacy PitcherStrikeoutsPredictor slate path (shadow mode)
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+from predictions.mlb.feature_matrix import (
+    FeatureContract,
+    FeatureMatrix,
+    FeatureMatrixCache,
+    PredictionRequest,
+)
+from predictions.mlb.prediction_systems.catboost_v1_predictor import CatBoostV1Predictor
+from predictions.mlb.prediction_systems.catboost_v2_regressor_predictor import (
+    CATBOOST_V2_CONTRACT,
+    CatBoostV2RegressorPredictor,
+)
+from predictions.mlb.prediction_systems.ensemble_v1 import MLBEnsembleV1
+from predictions.mlb.prediction_systems.lightgbm_v1_regressor_predictor import LightGBMV1RegressorPredictor
+from predictions.mlb.prediction_systems.v1_baseline_predictor import (
+    FEATURE_ORDER_V1_4,
+    V1BaselinePredictor,
+)
+from tests.mlb.test_catboost_v2_regressor import _make_features
+
+
+class FakeModel:
+    """Deterministic numpy model that records how many rows each call scored."""
+
+    def __init__(self):
+        self.calls = []
+        self.fail_batches = False
+
+    def _score(self, matrix):
+        matrix = np.asarray(matrix, dtype=float)
+        self.calls.append(matrix.shape[0])
+        if self.fail_batches and matrix.shape[0] > 1:
+            raise RuntimeError('batch rejected')
+        return 2.0 + 0.5 * np.nan_to_num(matrix[:, 0]) + 0.001 * np.nansum(matrix, axis=1)
+
+    def predict(self, matrix):
+        return self._score(matrix)
+
+    def predict_proba(self, matrix):
+        p_over = 1.0 / (1.0 + np.exp(-(self._score(matrix) - 5.0)))
+        return np.column_stack([1.0 - p_over, p_over])
+
+
+def _features(**overrides):
+    """36-feature dict plus the V1.4 lineup features."""
+    features = _make_features(
+        lineup_k_vs_hand=0.24, avg_k_vs_opponent=6.1, games_vs_opponent=3, lineup_weak_spots=2,
+    )
+    features.update(overrides)
+    return features
+
+
+def _slate():
+    """Five pitchers: complete, different values, NaN-tolerant gap, missing feature, bad value."""
+    return [
+        PredictionRequest('ace', _features(), 5.5),
+        PredictionRequest('mid', _features(k_avg_last_3=4.0, is_home=False), 4.5),
+        PredictionRequest('gap', _features(fip=None), 6.5),
+        PredictionRequest('thin', _features(season_k_per_9=None), 5.5),
+        PredictionRequest('bad', _features(k_avg_last_5='n/a'), 5.5),
+    ]
+
+
+def _per_row(predictor, requests):
+    return [predictor.predict(r.pitcher_lookup, r.features, r.strikeouts_line) for r in requests]
+
+
+def _v1_baseline(model):
+    predictor = V1BaselinePredictor(model_path='gs://test-bucket/model.json', project_id='test-project')
+    predictor.model = model
+    predictor.model_metadata = {}
+    predictor.feature_order = FEATURE_ORDER_V1_4
+    # xgboost is not needed to exercise the slate path
+    predictor._predict_matrix = model.predict
+    return predictor
+
+
+MODEL_SYSTEMS = {
+    'catboost_v2': lambda model: _with_model(CatBoostV2RegressorPredictor(project_id='test-project'), model),
+    'lightgbm_v1': lambda model: _with_model(LightGBMV1RegressorPredictor(project_id='test-project'), model),
+    'catboost_v1': lambda model: _with_model(CatBoostV1Predictor(project_id='test-project'), model),
+    'v1_baseline': _v1_baseline,
+}
+
+
+def _with_model(predictor, model):
+    predictor.model = model
+    predictor.model_metadata = {}
+    return predictor
+
+
+class TestFeatureMatrix:
+    """Contract normalization and matrix accounting"""
+
+    def test_normalize_prefers_model_names_and_coerces_bools(self):
+        normalized = CATBOOST_V2_CONTRACT.normalize({
+            'f00_k_avg_last_3': 7.0,
+            'k_avg_last_3': 1.0,
+            'is_home': True,
+            'is_day_game': 0,
+        })
+        assert normalized['f00_k_avg_last_3'] == 7.0
+        assert normalized['f10_is_home'] == 1.0
+        assert normalized['f25_is_day_game'] == 0.0
+
+    def test_missing_and_non_finite_are_nan(self):
+        contract = FeatureContract('t', ('f00_a', 'f01_b'), {'a': 'f00_a', 'b': 'f01_b'})
+        matrix = FeatureMatrix.build(contract, [{'a': 1, 'b': float('inf')}, {'a': None}, {'a': 'x'}])
+
+        assert matrix.values[0, 0] == 1.0
+        assert np.isnan(matrix.values[0, 1]) and np.isnan(matrix.values[1]).all()
+        assert matrix.errors[:2] == [None, None] and matrix.errors[2] is not None
+
+        filled, counts, names = matrix.model_input(frozenset({'f01_b'}), {'f00_a': 9.0})
+        assert counts.tolist() == [0, 1, 1]
+        assert names[1] == ['f00_a']
+        assert filled[1, 0] == 9.0 and np.isnan(filled[1, 1])
+
+
+class TestPredictMany:
+    """Slate scoring vs per-row scoring"""
+
+    @pytest.mark.parametrize('system', sorted(MODEL_SYSTEMS))
+    def test_matches_per_row(self, system):
+        requests = _slate()
+        expected = _per_row(MODEL_SYSTEMS[system](FakeModel()), requests)
+
+        model = FakeModel()
+        results = MODEL_SYSTEMS[system](model).predict_many(requests)
+
+        assert results == expected
+        assert len(model.calls) == 1
+        assert results[4]['recommendation'] == 'ERROR'
+
+    def test_blocked_rows_skip_the_model(self):
+        model = FakeModel()
+        results = MODEL_SYSTEMS['catboost_v2'](model).predict_many(_slate())
+
+        assert results[3]['recommendation'] == 'BLOCKED'
+        # thin (missing) and bad (unconvertible) never reach the model
+        assert model.calls == [3]
+
+    def test_failed_slate_call_falls_back_per_row(self):
+        requests = _slate()
+        expected = _per_row(MODEL_SYSTEMS['lightgbm_v1'](FakeModel()), requests)
+
+        model = FakeModel()
+        model.fail_batches = True
+        results = MODEL_SYSTEMS['lightgbm_v1'](model).predict_many(requests)
+
+        assert results == expected
+        assert model.calls == [3, 1, 1, 1]
+
+    def test_per_row_mode(self, monkeypatch):
+        monkeypatch.setenv('MLB_BATCH_PREDICT', 'per_row')
+        model = FakeModel()
+        MODEL_SYSTEMS['catboost_v2'](model).predict_many(_slate())
+
+        assert model.calls == [1, 1, 1]
+
+
+class TestSharedSlate:
+    """Matrix sharing and ensemble reuse"""
+
+    def test_same_contract_systems_share_one_matrix(self):
+        matrices = FeatureMatrixCache()
+        requests = _slate()
+        MODEL_SYSTEMS['catboost_v2'](FakeModel()).predict_many(requests, matrices)
+        MODEL_SYSTEMS['lightgbm_v1'](FakeModel()).predict_many(requests, matrices)
+
+        assert list(matrices.matrices) == [CATBOOST_V2_CONTRACT.key]
+
+    def test_ensemble_reuses_component_results(self):
+        requests = _slate()
+        v1_model, v1_6_model = FakeModel(), FakeModel()
+        v1 = _v1_baseline(v1_model)
+        v1_6 = _v1_baseline(v1_6_model)
+        v1_6.system_id = 'v1_6_rolling'
+        ensemble = MLBEnsembleV1(v1_predictor=v1, v1_6_predictor=v1_6, project_id='test-project')
+        expected = _per_row(ensemble, requests)
+        v1_model.calls.clear()
+        v1_6_model.calls.clear()
+
+        matrices = FeatureMatrixCache()
+        v1.predict_many(requests, matrices)
+        v1_6.predict_many(requests, matrices)
+        results = ensemble.predict_many(requests, matrices)
+
+        assert results == expected
+        assert v1_model.calls == [3] and v1_6_model.calls == [3]
+
+    def test_cached_results_are_copies(self):
+        matrices = FeatureMatrixCache()
+        predictor = MODEL_SYSTEMS['catboost_v2'](FakeModel())
+        first = predictor.predict_many(_slate(), matrices)
+        first[0]['game_id'] = 123
+
+        assert 'game_id' not in predictor.predict_many(_slate(), matrices)[0]
+
+    def test_worker_skips_non_base_predictors(self):
+        from predictions.mlb.worker import _predict_slate
+
+        predictor = MODEL_SYSTEMS['catboost_v2'](FakeModel())
+        slate = _predict_slate({'catboost_v2_regressor': predictor, 'mock': MagicMock()},
+                               _slate(), FeatureMatrixCache())
+
+        assert list(slate) == ['catboost_v2_regressor']
+        assert len(slate['catboost_v2_regressor']) == 5
+
+
+class TestLegacyPredictor:
+    """PitcherStrikeoutsPredictor slate path used by shadow mode"""
+
+    def test_predict_many_matches_predict(self):
+        from predictions.mlb.pitcher_strikeouts_predictor import PitcherStrikeoutsPredictor
+
+        def make(model):
+            predictor = PitcherStrikeoutsPredictor(model_path='gs://test-bucket/model.json')
+            predictor.model = model
+            predictor.model_metadata = {'features': FEATURE_ORDER_V1_4}
+            predictor.feature_order = FEATURE_ORDER_V1_4
+            predictor._predict_matrix = model.predict
+            return predictor
+
+        requests = _slate()
+        expected = _per_row(make(FakeModel()), requests)
+        model = FakeModel()
+        results = make(model).predict_many(requests)
+
+        assert results == expected
+        assert model.calls[0] > 1
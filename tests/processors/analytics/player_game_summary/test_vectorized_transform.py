@@ -0,0 +1,195 @@
+"""
+Vectorized Transform Tests for Player Game Summary Processor
+
+The column-oriented path (_process_player_games_vectorized) must produce the
+same records as the row path (_process_single_player_game), including for
+DNP rows, derived team abbreviations, shot zone joins and rows that need the
+row-path fallback.
+
+Run with: pytest test_vectorized_transform.py -v
+
+Directory: tests/processors/analytics/player_game_summary/
+"""
+
+from datetime import date
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_processors.analytics.player_game_summary.player_game_summary_processor import (
+    PlayerGameSummaryProcessor
+)
+from data_processors.analytics.player_game_summary.calculators import ColumnTransforms
+from data_processors.analytics.player_game_summary.sources import ShotZoneAnalyzer
+
+TIMESTAMP_FIELDS = ('processed_at', 'quality_calculated_at')
+
+UID_MAP = {f'player{i}': f'player{i}_001' for i in range(12)}
+
+
+def _row(i, **overrides):
+    row = {
+        'game_id': '20250115_LAL_GSW',
+        'game_date': date(2025, 1, 15),
+        'season_year': 2024,
+        'player_lookup': f'player{i}',
+        'player_full_name': f'Player {i}',
+        'team_abbr': 'LAL',
+        'opponent_team_abbr': 'GSW',
+        'player_status': 'active',
+        'dnp_reason': None,
+        'is_home': False,
+        'source_home_team': 'GSW',
+        'source_away_team': 'LAL',
+        'points': 20.0 + i,
+        'assists': 5.0,
+        'offensive_rebounds': 1.0,
+        'defensive_rebounds': 4.0,
+        'steals': 1.0,
+        'blocks': 0.0,
+        'turnovers': 2.0,
+        'personal_fouls': 3.0,
+        'field_goals_made': 8.0,
+        'field_goals_attempted': 17.0 + i,
+        'three_pointers_made': 2.0,
+        'three_pointers_attempted': 6.0,
+        'free_throws_made': 2.0 + i % 3,
+        'free_throws_attempted': 3.0 + i % 3,
+        'minutes': f'{30 + i}:{(7 * i) % 60:02d}',
+        'plus_minus': float(i - 5),
+        'points_line': 21.5,
+        'points_line_source': 'draftkings',
+        'primary_source': 'nbac_gamebook',
+        'team_fg_attempts': 88.0,
+        'team_ft_attempts': 20.0,
+        'team_turnovers': 13.0,
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def raw_data():
+    rows = [
+        _row(0),
+        _row(1, primary_source='bdl_boxscores', points_line=None, points_line_source=None),
+        # DNP players with NULL team_abbr: derived from game_id / source teams
+        _row(2, player_status='dnp', minutes=None, team_abbr=None, opponent_team_abbr=None,
+             is_home=True, dnp_reason='Coach decision', points=np.nan, plus_minus=np.nan),
+        _row(3, player_status='inactive', minutes='-', team_abbr=None, opponent_team_abbr=None,
+             is_home=None, source_home_team=None, dnp_reason='Injury/Illness - Left Ankle; Sprain'),
+        _row(4, player_status='inactive', minutes='', dnp_reason='Rest'),
+        # Zero minutes while active is a DNP
+        _row(5, minutes='0:00', field_goals_attempted=0.0, field_goals_made=0.0, points=0.0),
+        # No team stats for this game, plain-number minutes
+        _row(6, minutes='24', team_fg_attempts=np.nan),
+        # Impossible usage rate (tiny team totals) is dropped
+        _row(7, team_fg_attempts=2.0, team_ft_attempts=0.0, team_turnovers=0.0),
+        # Irregular rows take the row path
+        _row(8, minutes='12:75'),
+        _row(9, game_id=None, team_abbr=None),
+        _row(10, player_lookup='unknown_player'),
+        _row(11, minutes=' 33 : 05 ', three_pointers_made=np.nan),
+    ]
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def processor():
+    proc = PlayerGameSummaryProcessor()
+    proc.bq_client = Mock()
+    proc.project_id = 'test-project'
+    proc.opts = {'start_date': '2025-01-15', 'end_date': '2025-01-15'}
+    proc._registry_handler = Mock()
+
+    analyzer = ShotZoneAnalyzer(bq_client=Mock(), project_id='test-project')
+    analyzer.shot_zones_available = True
+    analyzer.shot_zones_source = 'bigdataball_pbp'
+    zones = {field: None for field in ShotZoneAnalyzer.SHOT_ZONE_FIELDS}
+    analyzer.shot_zone_data = {
+        ('20250115_LAL_GSW', 'player0'): {**zones, 'paint_attempts': 6, 'paint_makes': 4,
+                                          'mid_range_attempts': 3, 'mid_range_makes': 1,
+                                          'three_attempts_pbp': 7, 'three_makes_pbp': 3,
+                                          'and1_count': 1},
+        # Partial zones: PBP three_pt missing, box score fallback
+        ('20250115_LAL_GSW', 'player1'): {**zones, 'paint_attempts': 2, 'mid_range_attempts': 5},
+    }
+    proc._shot_zone_analyzer = analyzer
+    return proc
+
+
+def _row_path(processor, df):
+    records = []
+    for idx, row in df.iterrows():
+        record = processor._process_single_player_game(idx, row, UID_MAP)
+        if record is not None:
+            records.append(record)
+    return records
+
+
+def _strip_timestamps(records):
+    return [{k: v for k, v in record.items() if k not in TIMESTAMP_FIELDS} for record in records]
+
+
+class TestVectorizedMatchesRowPath:
+    """Vectorized records equal row-path records field for field."""
+
+    def test_records_identical(self, processor, raw_data):
+        processor.raw_data = raw_data
+        expected = _row_path(processor, raw_data)
+        actual = processor._process_player_games_vectorized(UID_MAP)
+
+        assert len(actual) == len(expected) == 11
+        for exp, act in zip(_strip_timestamps(expected), _strip_timestamps(actual)):
+            assert list(act) == list(exp)
+            for key in exp:
+                assert act[key] == exp[key] or (act[key] != act[key] and exp[key] != exp[key]), key
+            assert type(act['plus_minus']) is type(exp['plus_minus'])
+
+    def test_derived_fields(self, processor, raw_data):
+        processor.raw_data = raw_data
+        records = {r['player_lookup']: r for r in processor._process_player_games_vectorized(UID_MAP)}
+
+        assert records['player2']['team_abbr'] == 'GSW'
+        assert records['player2']['opponent_team_abbr'] == 'LAL'
+        assert records['player2']['dnp_reason_category'] == 'coach_decision'
+        assert records['player3']['team_abbr'] == 'LAL'
+        assert records['player3']['dnp_reason_category'] == 'injury'
+        assert records['player5']['is_dnp'] is True
+        assert records['player6']['data_quality_flag'] == 'partial_no_team_stats'
+        assert records['player7']['usage_rate'] is None
+        assert records['player0']['three_pt_attempts'] == 7
+        assert records['player0']['has_complete_shot_zones'] is True
+        assert records['player1']['three_pt_attempts'] == 6
+        assert records['player8']['minutes_played'] is None
+
+    def test_unresolved_player_uses_row_path(self, processor, raw_data):
+        processor.raw_data = raw_data
+        records = processor._process_player_games_vectorized(UID_MAP)
+
+        assert 'unknown_player' not in {r['player_lookup'] for r in records}
+        processor.registry_handler.log_unresolved_player.assert_called_once()
+        processor.registry_handler.track_registry_failure.assert_called_once()
+
+
+class TestColumnTransforms:
+    """Column transforms agree with the scalar helpers."""
+
+    def test_parse_minutes_matches_scalar(self, processor):
+        values = pd.Series(['40:11', '04:00', ' 14 : 21 ', '32', '32.5', '-', 'null', '', None,
+                            '12:75', '1:2:3', 'abc', '61:00'])
+        minutes, regular = ColumnTransforms.parse_minutes(values)
+
+        for value, parsed, ok in zip(values, minutes, regular):
+            if ok:
+                expected = processor._parse_minutes_to_decimal(value)
+                assert (np.isnan(parsed) and expected is None) or parsed == expected, value
+        assert regular.tolist() == [True] * 9 + [False] * 4
+
+    def test_categorize_dnp_reasons_matches_scalar(self, processor):
+        reasons = pd.Series(['Injury - Right Knee', 'Rest', 'Personal Reasons', 'Coach Decision',
+                             'G League - Two-Way', None, '', np.nan])
+        categories = ColumnTransforms.categorize_dnp_reasons(reasons)
+        assert list(categories) == [processor._categorize_dnp_reason(r) for r in reasons]
@@ -0,0 +1,264 @@
+"""
+Unit Tests for the vectorized grading engine
+
+Checks grade_frame() against grade_prediction() record by record, the run
+summary against the per-record summary loop, and the grading backfill's
+chunked process_date_range path.
+
+Path: tests/processors/grading/prediction_accuracy/test_grading_engine.py
+"""
+
+import random
+from datetime import date
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from data_processors.grading.prediction_accuracy.grading_engine import (
+    grade_frame,
+    normalize_actuals,
+    summarize_graded,
+)
+from data_processors.grading.prediction_accuracy.prediction_accuracy_processor import (
+    PredictionAccuracyProcessor
+)
+
+GAME_DATE = date(2025, 12, 15)
+
+
+@pytest.fixture
+def processor():
+    """Create processor instance with mocked BigQuery client."""
+    with patch('data_processors.grading.prediction_accuracy.prediction_accuracy_processor.bigquery'):
+        proc = PredictionAccuracyProcessor(project_id='test-project')
+        proc.bq_client = Mock()
+        proc._check_for_duplicates = Mock(return_value=0)
+        return proc
+
+
+def _make_day(seed: int, game_date: date = GAME_DATE, players: int = 40):
+    """Random predictions (several systems per player), actuals and injury reports."""
+    rng = random.Random(seed)
+    systems = ['catboost_v9', 'catboost_v12', 'ensemble_v1']
+    predictions, actuals, injuries = [], {}, {}
+
+    for p in range(players):
+        lookup = f'player-{p}'
+        if rng.random() < 0.9:  # some players have no boxscore row
+            roll = rng.random()
+            if roll < 0.1:
+                actual = {'actual_points': 0, 'minutes_played': rng.choice([0.0, None]), 'is_dnp': False}
+            elif roll < 0.15:
+                actual = {'actual_points': None, 'minutes_played': None, 'is_dnp': True}
+            elif roll < 0.2:
+                actual = {'actual_points': 0, 'minutes_played': 4.0, 'is_dnp': False}
+            else:
+                actual = {'actual_points': rng.randint(2, 40), 'minutes_played': rng.uniform(10, 40),
+                          'is_dnp': False}
+            actuals[lookup] = {
+                **actual,
+                'team_abbr': rng.choice(['LAL', 'BOS', None]),
+                'opponent_team_abbr': 'NYK',
+            }
+        if rng.random() < 0.3:
+            injuries[lookup] = {
+                'injury_status': rng.choice(['OUT', 'DOUBTFUL', 'QUESTIONABLE', 'PROBABLE', 'AVAILABLE']),
+                'reason': 'Ankle',
+            }
+
+        for system_id in systems:
+            line = rng.choice([None, 14.5, 20.0, 22.5, 25.0, float(rng.randint(5, 35)) + 0.5])
+            captured = rng.random() < 0.5
+            predictions.append({
+                'player_lookup': lookup,
+                'game_id': f'20251215_LAL_{p % 7}',
+                'game_date': game_date,
+                'system_id': system_id,
+                'predicted_points': round(rng.uniform(5, 35), 1),
+                'confidence_score': rng.choice([round(rng.uniform(0, 1), 2), round(rng.uniform(40, 95), 1)]),
+                'recommendation': rng.choice(['OVER', 'UNDER', 'PASS', 'HOLD', 'NO_LINE'])
+                if line is not None else rng.choice(['NO_LINE', 'OVER']),
+                'line_value': line,
+                'pace_adjustment': rng.choice([None, round(rng.uniform(-2, 2), 3)]),
+                'similarity_sample_size': rng.choice([None, 12, 30]),
+                'model_version': 'v1.0',
+                'has_prop_line': line is not None,
+                'line_source': 'ACTUAL_PROP' if line is not None else 'NO_PROP_LINE',
+                'estimated_line_value': rng.choice([None, 18.5]),
+                'is_actionable': rng.random() < 0.8,
+                'filter_reason': rng.choice([None, 'low_edge\n']),
+                'injury_status_at_prediction': rng.choice(['out', 'QUESTIONABLE', 'available', None])
+                if captured else None,
+                'injury_flag_at_prediction': rng.random() < 0.6 if captured else None,
+                'injury_reason_at_prediction': None,
+            })
+    return predictions, actuals, injuries
+
+
+def _scalar_records(processor, predictions, actuals, game_date=GAME_DATE):
+    records = []
+    for pred in predictions:
+        actual = actuals.get(pred['player_lookup'])
+        if actual is None:
+            continue
+        records.append(processor._sanitize_record(processor.grade_prediction(pred, actual, game_date)))
+    return records
+
+
+def _strip(records):
+    return [{k: v for k, v in r.items() if k != 'graded_at'} for r in records]
+
+
+class TestGradeFrameMatchesRecordPath:
+    """grade_frame() vs grade_prediction()."""
+
+    @pytest.mark.parametrize('seed', [1, 2, 3, 4])
+    def test_records_identical(self, processor, seed):
+        predictions, actuals, injuries = _make_day(seed)
+        processor.get_injury_status = lambda lookup, game_date: injuries.get(lookup)
+
+        expected = _scalar_records(processor, predictions, actuals)
+        graded = grade_frame(
+            processor,
+            pd.DataFrame.from_records(predictions),
+            normalize_actuals(pd.DataFrame.from_records(
+                [{'player_lookup': k, **v} for k, v in actuals.items()]
+            )),
+            lambda lookup, _: injuries.get(lookup),
+        )
+
+        assert _strip(processor._sanitize_record(r) for r in graded.records) == _strip(expected)
+        assert graded.missing_actuals == sum(1 for p in predictions if p['player_lookup'] not in actuals)
+
+    def test_injury_lookup_only_for_uncaptured_dnp(self, processor):
+        predictions, actuals, injuries = _make_day(6)
+        lookup = Mock(side_effect=lambda player, _: injuries.get(player))
+
+        grade_frame(
+            processor,
+            pd.DataFrame.from_records(predictions),
+            normalize_actuals(pd.DataFrame.from_records(
+                [{'player_lookup': k, **v} for k, v in actuals.items()]
+            )),
+            lookup,
+        )
+
+        called = [c.args[0] for c in lookup.call_args_list]
+        assert len(called) == len(set(called))  # once per player
+        for player in called:
+            a = actuals[player]
+            assert a['is_dnp'] or a['actual_points'] in (0, None)
+
+
+class TestProcessDateEngines:
+    """process_date() summary is the same with either engine."""
+
+    def test_scalar_and_vectorized_summaries_match(self, processor, monkeypatch):
+        predictions, actuals, injuries = _make_day(7)
+        processor.get_predictions_for_date = Mock(return_value=predictions)
+        processor.get_actuals_for_date = Mock(return_value=actuals)
+        processor.get_injury_status = lambda lookup, game_date: injuries.get(lookup)
+        processor.write_graded_results = Mock(side_effect=lambda records, game_date: len(records))
+
+        monkeypatch.setenv('GRADING_ENGINE', 'scalar')
+        scalar = processor.process_date(GAME_DATE)
+        scalar_rows = processor.write_graded_results.call_args[0][0]
+        monkeypatch.setenv('GRADING_ENGINE', 'vectorized')
+        vectorized = processor.process_date(GAME_DATE)
+        vectorized_rows = processor.write_graded_results.call_args[0][0]
+
+        assert vectorized == scalar
+        assert _strip(processor._sanitize_record(r) for r in vectorized_rows) == \
+            _strip(processor._sanitize_record(r) for r in scalar_rows)
+
+
+class TestRollups:
+    """Summary and per-system rollups."""
+
+    def test_summarize_graded(self):
+        frame = pd.DataFrame({
+            'absolute_error': [1.5, None, 3.0],
+            'signed_error': [1.5, None, -3.0],
+            'prediction_correct': [True, None, False],
+            'is_voided': [False, True, False],
+            'void_reason': [None, 'dnp_unknown', None],
+        })
+
+        stats = summarize_graded(frame)
+
+        assert stats['mae'] == 2.25
+        assert stats['bias'] == -0.75
+        assert stats['accuracy'] == 0.5
+        assert stats['voided_count'] == 1
+        assert stats['voided_unknown'] == 1
+        assert stats['net_accuracy'] == 0.5
+
+
+class TestProcessDateRange:
+    """Single-pass range grading."""
+
+    def test_range_matches_per_date_grading(self, processor):
+        day1 = _make_day(8, date(2025, 12, 15))
+        day2 = _make_day(9, date(2025, 12, 16))
+        processor.get_predictions_frame = Mock(return_value=pd.DataFrame.from_records(day1[0] + day2[0]))
+        processor.get_actuals_frame = Mock(return_value=normalize_actuals(pd.DataFrame.from_records(
+            [{'game_date': d, 'player_lookup': k, **v}
+             for d, (_, actuals, _) in ((date(2025, 12, 15), day1), (date(2025, 12, 16), day2))
+             for k, v in actuals.items()]
+        )))
+        processor.load_injury_status_for_range = Mock(return_value={
+            (d.isoformat(), k): v
+            for d, (_, _, injuries) in ((date(2025, 12, 15), day1), (date(2025, 12, 16), day2))
+            for k, v in injuries.items()
+        })
+        processor.write_graded_results = Mock(side_effect=lambda records, game_date: len(records))
+
+        result = processor.process_date_range(date(2025, 12, 15), date(2025, 12, 16))
+
+        assert [r['date'] for r in result['dates']] == ['2025-12-15', '2025-12-16']
+        written = {c.args[1]: c.args[0] for c in processor.write_graded_results.call_args_list}
+        for game_date, (predictions, actuals, injuries) in ((date(2025, 12, 15), day1), (date(2025, 12, 16), day2)):
+            processor.get_injury_status = lambda lookup, _, injuries=injuries: injuries.get(lookup)
+            expected = _scalar_records(processor, predictions, actuals, game_date)
+            assert _strip(processor._sanitize_record(r) for r in written[game_date]) == _strip(expected)
+
+
+class TestGradingBackfill:
+    """The grading backfill grades chunks through process_date_range"""
+
+    @pytest.fixture
+    def backfill(self, processor):
+        from backfill_jobs.grading.prediction_accuracy.prediction_accuracy_grading_backfill import (
+            PredictionAccuracyBackfill
+        )
+        backfill = PredictionAccuracyBackfill.__new__(PredictionAccuracyBackfill)
+        backfill.processor = processor
+        backfill.chunk_dates = 2
+        backfill.per_date = False
+        return backfill
+
+    def test_chunks_and_per_date_flag(self, backfill, processor):
+        dates = [date(2025, 12, 15), date(2025, 12, 16), date(2025, 12, 18)]
+        processor.process_date_range = Mock(side_effect=lambda start, end: {
+            'status': 'success',
+            'dates': [{'status': 'success', 'date': d.isoformat(), 'graded': 5}
+                      for d in dates if start <= d <= end and d != date(2025, 12, 16)],
+        })
+        processor.process_date = Mock(return_value={'status': 'success', 'graded': 5})
+        processor.check_predictions_exist = Mock(return_value={'exists': True, 'total_predictions': 5})
+        processor.check_actuals_exist = Mock(return_value={'exists': True})
+
+        results = {d: r['status'] for d, r, _ in backfill._grade_dates(dates, 0, len(dates), dry_run=False)}
+
+        assert [c.args for c in processor.process_date_range.call_args_list] == [
+            (date(2025, 12, 15), date(2025, 12, 16)), (date(2025, 12, 18), date(2025, 12, 18)),
+        ]
+        assert results == {date(2025, 12, 15): 'success', date(2025, 12, 16): 'no_predictions',
+                           date(2025, 12, 18): 'success'}
+        processor.process_date.assert_not_called()
+
+        backfill.per_date = True
+        list(backfill._grade_dates(dates, 0, len(dates), dry_run=False))
+        assert processor.process_date.call_count == 3
+        assert processor.process_date_range.call_count == 2
@@ -0,0 +1,377 @@
+"""
+Equivalence Tests for the Columnar Feature Builder
+
+The columnar build mode (MLFS_BUILD_MODE=columnar) must write exactly the
+same records as the per-player row path. These tests build a synthetic day
+with every fallback branch represented (Phase 4 hits, Phase 3 fallbacks,
+defaults, NULL/NaN values, cache misses, missing Vegas lines, BettingPros
+fallback, irregular rows) and compare the serialized records.
+
+Run with: pytest test_columnar_builder.py -v
+
+Directory: tests/processors/precompute/ml_feature_store/
+"""
+
+import json
+import random
+from datetime import date, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from data_processors.precompute.ml_feature_store.columnar_builder import (
+    ColumnarFeatureBuilder,
+    MATRIX_FEATURE_COUNT,
+)
+from data_processors.precompute.ml_feature_store.feature_calculator import FeatureCalculator
+from data_processors.precompute.ml_feature_store.feature_extractor import FeatureExtractor
+from data_processors.precompute.ml_feature_store.ml_feature_store_processor import (
+    FEATURE_COUNT,
+    FEATURE_NAMES,
+    MLFeatureStoreProcessor,
+    validate_batch_variance,
+    validate_feature_matrix_ranges,
+    validate_feature_ranges,
+)
+from data_processors.precompute.ml_feature_store.quality_scorer import QualityScorer
+
+
+GAME_DATE = date(2026, 1, 15)
+TEAMS = ['LAL', 'BOS', 'DEN', 'OKC', 'MIA', 'NYK']
+
+# Fields that legitimately differ between two runs (wall-clock / timing)
+VOLATILE_FIELDS = ('created_at', 'quality_computed_at', 'feature_generation_time_ms')
+
+
+def _maybe(rng, value, p_none=0.15, p_nan=0.05):
+    """Return value, None or NaN to exercise the NULL handling branches."""
+    roll = rng.random()
+    if roll < p_none:
+        return None
+    if roll < p_none + p_nan:
+        return float('nan')
+    return value
+
+
+def _build_extractor(n_players: int, seed: int = 7) -> tuple:
+    """Populate a FeatureExtractor batch cache with synthetic data."""
+    rng = random.Random(seed)
+    extractor = FeatureExtractor(Mock(), 'test-project')
+    extractor._batch_cache_date = GAME_DATE
+
+    players = []
+    for i in range(n_players):
+        player_lookup = f'player{i:03d}'
+        team = TEAMS[i % len(TEAMS)]
+        opponent = TEAMS[(i + 1) % len(TEAMS)] if i % 17 else None
+        players.append({
+            'player_lookup': player_lookup,
+            'universal_player_id': f'uid{i}',
+            'game_id': f'20260115_{team}_{opponent}',
+            'team_abbr': team,
+            'opponent_team_abbr': opponent,
+            'is_home': bool(i % 2),
+        })
+
+        # Phase 4 daily cache (some players missing → cache-miss fallback)
+        if i % 9 != 0:
+            extractor._daily_cache_lookup[player_lookup] = {
+                'points_avg_last_5': _maybe(rng, rng.uniform(0, 35)),
+                'points_avg_last_10': _maybe(rng, rng.uniform(0, 35)),
+                'points_avg_season': _maybe(rng, rng.choice([0.0, rng.uniform(2, 30)])),
+                'points_std_last_10': _maybe(rng, rng.uniform(0, 9)),
+                'games_in_last_7_days': _maybe(rng, rng.randint(0, 4)),
+                'minutes_avg_last_10': _maybe(rng, rng.uniform(5, 38)),
+                'ppm_avg_last_10': _maybe(rng, rng.uniform(0.1, 1.1)),
+                'team_pace_last_10': _maybe(rng, rng.uniform(95, 105)),
+                'team_off_rating_last_10': _maybe(rng, rng.uniform(105, 120)),
+            }
+        if i % 5 != 0:
+            extractor._composite_factors_lookup[player_lookup] = {
+                'fatigue_score': _maybe(rng, rng.uniform(40, 100)),
+                'shot_zone_mismatch_score': _maybe(rng, rng.uniform(-10, 10)),
+                'pace_score': _maybe(rng, rng.uniform(-3, 3)),
+                'usage_spike_score': _maybe(rng, rng.uniform(-3, 3)),
+                '_source': 'exact_date',
+                '_matchup_valid': bool(i % 3),
+            }
+        if i % 4 != 0:
+            extractor._shot_zone_lookup[player_lookup] = {
+                'paint_rate_last_10': _maybe(rng, rng.uniform(10, 70)),
+                'mid_range_rate_last_10': _maybe(rng, rng.uniform(0, 40)),
+                'three_pt_rate_last_10': _maybe(rng, rng.uniform(0, 60)),
+            }
+
+        # Phase 3 context
+        extractor._player_context_lookup[player_lookup] = {
+            'team_abbr': team,
+            'home_game': rng.choice([True, False, None]),
+            'back_to_back': rng.choice([True, False, None]),
+            'season_phase': rng.choice(['regular_season', 'Playoffs', None]),
+            'days_rest': rng.choice([0, 1, 2, 3, None]),
+            'opponent_days_rest': rng.choice([0, 1, 2, None]),
+            'player_status': rng.choice(['available', 'questionable', 'OUT', None]),
+            'star_teammates_out': _maybe(rng, rng.randint(0, 3), p_nan=0.0),
+            'game_total': _maybe(rng, rng.uniform(200, 250), p_nan=0.0),
+            'minutes_in_last_7_days': _maybe(rng, rng.uniform(0, 120), p_nan=0.0),
+            'game_spread': _maybe(rng, rng.uniform(-12, 12), p_nan=0.0),
+            'prop_over_streak': _maybe(rng, rng.randint(0, 6), p_nan=0.0),
+            'prop_under_streak': _maybe(rng, rng.randint(0, 6), p_nan=0.0),
+        }
+
+        n_games = rng.choice([0, 2, 4, 6, 10])
+        games = []
+        for g in range(n_games):
+            is_dnp = rng.random() < 0.1
+            games.append({
+                'game_date': GAME_DATE - timedelta(days=2 * (g + 1)),
+                'points': None if is_dnp else rng.randint(0, 40),
+                'minutes_played': 0 if is_dnp else rng.randint(5, 40),
+                'ft_makes': rng.randint(0, 10),
+                'is_dnp': is_dnp,
+            })
+        if games:
+            extractor._last_10_games_lookup[player_lookup] = games
+            extractor._total_games_available_lookup[player_lookup] = n_games + rng.randint(0, 20)
+
+        extractor._season_stats_lookup[player_lookup] = {
+            'points_avg_season': _maybe(rng, rng.uniform(2, 30)),
+            'minutes_avg_season': _maybe(rng, rng.uniform(5, 36), p_nan=0.0),
+        }
+
+        # V8+ lookups
+        if rng.random() < 0.6:
+            line = rng.uniform(5, 35)
+            extractor._vegas_lines_lookup[player_lookup] = {
+                'vegas_points_line': line,
+                'vegas_opening_line': _maybe(rng, line + 0.5, p_nan=0.0),
+                'vegas_line_move': _maybe(rng, 0.5, p_nan=0.0),
+                'vegas_line_source': 'odds_api',
+            }
+        if opponent and rng.random() < 0.7:
+            extractor._opponent_history_lookup[f'{player_lookup}_{opponent}'] = {
+                'avg_points_vs_opponent': _maybe(rng, rng.uniform(0, 35)),
+                'games_vs_opponent': _maybe(rng, rng.randint(1, 8)),
+            }
+        if rng.random() < 0.8:
+            extractor._minutes_ppm_lookup[player_lookup] = {
+                'minutes_avg_last_10': _maybe(rng, rng.uniform(5, 38)),
+                'ppm_avg_last_10': _maybe(rng, rng.uniform(0.1, 1.1)),
+            }
+        if rng.random() < 0.8:
+            extractor._player_rolling_stats_lookup[player_lookup] = {
+                'points_avg_last_3': _maybe(rng, rng.uniform(0, 40), p_nan=0.0),
+                'scoring_trend_slope': _maybe(rng, rng.uniform(-3, 3), p_nan=0.0),
+                'deviation_from_avg_last3': _maybe(rng, rng.uniform(-10, 10), p_nan=0.0),
+                'consecutive_games_below_avg': _maybe(rng, rng.randint(0, 5), p_nan=0.0),
+                'usage_rate_last_5': _maybe(rng, rng.uniform(5, 35), p_nan=0.0),
+                'games_since_structural_change': _maybe(rng, rng.randint(0, 30), p_nan=0.0),
+            }
+        if rng.random() < 0.5:
+            extractor._teammate_usage_lookup[player_lookup] = rng.uniform(0, 80)
+        if rng.random() < 0.6:
+            extractor._multi_book_std_lookup[player_lookup] = rng.uniform(0, 2)
+            extractor._multi_book_std_source_lookup[player_lookup] = rng.choice(
+                ['odds_api', 'bettingpros'])
+        if rng.random() < 0.5:
+            extractor._prop_line_delta_lookup[player_lookup] = rng.uniform(-4, 4)
+        if rng.random() < 0.7:
+            extractor._v16_line_history_lookup[player_lookup] = {
+                'over_rate_last_10': _maybe(rng, rng.uniform(0, 1), p_nan=0.0),
+                'margin_vs_line_avg_last_5': _maybe(rng, rng.uniform(-8, 8), p_nan=0.0),
+            }
+        if rng.random() < 0.7:
+            extractor._v17_opportunity_risk_lookup[player_lookup] = {
+                'blowout_minutes_risk': _maybe(rng, rng.uniform(0, 1), p_nan=0.0),
+                'minutes_volatility_last_10': _maybe(rng, rng.uniform(0, 12), p_nan=0.0),
+            }
+        if rng.random() < 0.5:
+            extractor._v18_line_movement_lookup[player_lookup] = {
+                'line_movement_direction': _maybe(rng, rng.uniform(-3, 3), p_nan=0.0),
+                'vig_skew': _maybe(rng, rng.uniform(-0.5, 0.5), p_nan=0.0),
+                'late_line_movement_count': _maybe(rng, rng.randint(0, 6), p_nan=0.0),
+            }
+        if rng.random() < 0.5:
+            extractor._v18_self_creation_lookup[player_lookup] = rng.uniform(0, 1)
+
+    for team in TEAMS:
+        extractor._team_defense_lookup[team] = {
+            'opponent_def_rating': _maybe(rng, rng.uniform(105, 120)),
+            'opponent_pace': _maybe(rng, rng.uniform(95, 105)),
+        }
+        extractor._team_games_lookup[team] = [
+            {'win_flag': rng.random() < 0.5} for _ in range(rng.choice([3, 20, 40]))
+        ]
+
+    return extractor, players
+
+
+def _build_processor(extractor) -> MLFeatureStoreProcessor:
+    """Create a processor wired to the synthetic extractor (no GCP clients)."""
+    processor = object.__new__(MLFeatureStoreProcessor)
+    processor.bq_client = Mock()
+    processor.project_id = 'test-project'
+    processor.opts = {'analysis_date': GAME_DATE, 'skip_dependency_check': True}
+    processor.stats = {}
+    processor.feature_extractor = extractor
+    processor.feature_calculator = FeatureCalculator()
+    processor.quality_scorer = QualityScorer()
+    processor.columnar_builder = ColumnarFeatureBuilder(extractor, processor.feature_calculator)
+    processor.source_daily_cache_hash = 'hash_dc'
+    processor.source_composite_hash = 'hash_cf'
+    processor.source_shot_zones_hash = 'hash_sz'
+    processor.source_team_defense_hash = 'hash_td'
+    processor.build_source_tracking_fields = Mock(return_value={'source_daily_cache_last_updated': None})
+    processor._check_circuit_breaker = Mock(return_value={'active': False, 'attempts': 0, 'until': None})
+    processor._increment_reprocess_count = Mock()
+    return processor
+
+
+def _serialize(records: list) -> list:
+    """JSON-serialize records (key order preserved) without volatile fields."""
+    out = []
+    for record in sorted(records, key=lambda r: r.get('player_lookup') or r.get('entity_id')):
+        stable = {k: v for k, v in record.items() if k not in VOLATILE_FIELDS}
+        out.append(json.dumps(stable, default=str))
+    return out
+
+
+def _run_both(n_players: int, seed: int = 7) -> tuple:
+    extractor, players = _build_extractor(n_players, seed)
+    processor = _build_processor(extractor)
+    completeness = {
+        p['player_lookup']: {
+            'is_production_ready': True, 'completeness_pct': 100.0, 'expected_count': 10,
+            'actual_count': 10, 'missing_count': 0, 'is_complete': True,
+        }
+        for p in players
+    }
+    upstream = {
+        p['player_lookup']: {
+            'player_daily_cache_ready': True, 'player_composite_factors_ready': True,
+            'player_shot_zone_ready': True, 'team_defense_zone_ready': True,
+            'all_upstreams_ready': True,
+        }
+        for p in players
+    }
+    args = (players, completeness, upstream, False, False, GAME_DATE)
+    row_ok, row_failed = processor._process_players_parallel(*args)
+    col_ok, col_failed = processor._process_players_columnar(*args)
+    return row_ok, row_failed, col_ok, col_failed, processor, players
+
+
+# ============================================================================
+# EQUIVALENCE
+# ============================================================================
+
+class TestColumnarEquivalence:
+    """Columnar records must be byte-identical to row-path records."""
+
+    @pytest.mark.parametrize('seed', [7, 11, 2026])
+    def test_records_identical_to_row_path(self, seed):
+        row_ok, row_failed, col_ok, col_failed, _, _ = _run_both(120, seed)
+
+        assert len(row_ok) > 0
+        assert _serialize(col_ok) == _serialize(row_ok)
+        assert _serialize(col_failed) == _serialize(row_failed)
+
+    def test_feature_vectors_identical(self):
+        extractor, players = _build_extractor(80)
+        processor = _build_processor(extractor)
+        matrix = processor.columnar_builder.build(players, GAME_DATE)
+
+        assert matrix.values.shape == (80, MATRIX_FEATURE_COUNT)
+        for row, player in enumerate(players):
+            if row in matrix.irregular_rows:
+                continue
+            phase4 = extractor.extract_phase4_data(
+                player['player_lookup'], GAME_DATE,
+                opponent_team_abbr=player['opponent_team_abbr'])
+            phase3 = extractor.extract_phase3_data(player['player_lookup'], GAME_DATE)
+            features, sources = processor._extract_all_features(
+                phase4, phase3, player_lookup=player['player_lookup'],
+                opponent=player['opponent_team_abbr'])
+
+            assert json.dumps(matrix.row_features(row)) == json.dumps(features)
+            assert matrix.row_sources(row) == sources
+            assert list(matrix.row_sources(row)) == list(sources)
+
+    def test_irregular_row_falls_back_to_row_path(self):
+        extractor, players = _build_extractor(20)
+        bad = players[3]['player_lookup']
+        extractor._daily_cache_lookup.setdefault(bad, {})['points_avg_last_5'] = 'not-a-number'
+        processor = _build_processor(extractor)
+
+        matrix = processor.columnar_builder.build(players, GAME_DATE)
+        assert 3 in matrix.irregular_rows
+
+        completeness = {p['player_lookup']: {
+            'is_production_ready': True, 'completeness_pct': 100.0, 'expected_count': 10,
+            'actual_count': 10, 'missing_count': 0, 'is_complete': True} for p in players}
+        upstream = {p['player_lookup']: {'all_upstreams_ready': True} for p in players}
+        args = (players, completeness, upstream, False, False, GAME_DATE)
+        row_ok, row_failed = processor._process_players_parallel(*args)
+        col_ok, col_failed = processor._process_players_columnar(*args)
+
+        assert _serialize(col_ok) == _serialize(row_ok)
+        assert _serialize(col_failed) == _serialize(row_failed)
+        assert bad in {f['entity_id'] for f in col_failed}
+
+
+# ============================================================================
+# ARRAY VALIDATION / SCORING
+# ============================================================================
+
+class TestColumnarValidation:
+    """Array validators and batch quality scoring match the per-record versions."""
+
+    def test_matrix_ranges_match_per_record(self):
+        extractor, players = _build_extractor(60)
+        processor = _build_processor(extractor)
+        matrix = processor.columnar_builder.build(players, GAME_DATE)
+        # Push a few cells out of range (critical and non-critical)
+        matrix.values[0, 0] = 120.0
+        matrix.values[1, 5] = -5.0
+
+        is_valid, warnings, critical = validate_feature_matrix_ranges(
+            matrix.values, matrix.null_mask, matrix.player_lookups)
+
+        for row in range(len(matrix)):
+            expected = validate_feature_ranges(matrix.row_features(row), matrix.player_lookups[row])
+            assert (bool(is_valid[row]), warnings[row], critical[row]) == expected
+
+    def test_batch_quality_fields_match_per_record(self):
+        extractor, players = _build_extractor(60)
+        processor = _build_processor(extractor)
+        matrix = processor.columnar_builder.build(players, GAME_DATE)
+        scorer = QualityScorer()
+        scored = matrix.sources[:, :FEATURE_COUNT]
+
+        scores = scorer.calculate_quality_scores(scored)
+        primaries = scorer.determine_primary_sources(scored)
+        fields = scorer.build_quality_visibility_fields_batch(scored, FEATURE_NAMES, scores)
+
+        for row in range(len(matrix)):
+            sources = {k: v for k, v in matrix.row_sources(row).items() if k < FEATURE_COUNT}
+            score = scorer.calculate_quality_score(sources)
+            assert scores[row] == score
+            assert primaries[row] == scorer.determine_primary_source(sources)
+            expected = scorer.build_quality_visibility_fields(
+                feature_sources=sources,
+                feature_values=matrix.row_features(row)[:FEATURE_COUNT],
+                feature_names=FEATURE_NAMES,
+                quality_score=score,
+            )
+            expected.pop('quality_computed_at')
+            actual = dict(fields[row])
+            actual.pop('quality_computed_at')
+            assert json.dumps(actual) == json.dumps(expected)
+
+    def test_batch_variance_constant_feature(self):
+        records = [{'features': [float(i % 7)] * 5 + [50.0] + [None] * 3} for i in range(60)]
+        result = validate_batch_variance(records, min_records=50)
+
+        assert not result['is_valid']
+        assert any('fatigue_score' in err for err in result['critical_errors'])
+        assert result['stats']['fatigue_score']['count'] == 60
+
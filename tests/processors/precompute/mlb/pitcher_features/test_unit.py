@@ -448,3 +448,41 @@ class TestFeatureVectorConstruction:
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
+
+
+class TestPitcherFeaturesFetchGraph:
+    """Tests for the per-date fetch graph."""
+
+    @pytest.fixture
+    def processor(self):
+        with patch('data_processors.precompute.precompute_base.bigquery'):
+            from data_processors.precompute.mlb.pitcher_features_processor import (
+                MlbPitcherFeaturesProcessor
+            )
+            proc = MlbPitcherFeaturesProcessor()
+            proc.bq_client = Mock()
+            proc.project_id = 'test-project'
+            return proc
+
+    def test_static_lookups_queried_once_across_dates(self, processor):
+        date_fetches = [
+            '_get_lineups', '_get_pitcher_analytics', '_get_batter_analytics',
+            '_get_betting_lines', '_get_pitcher_splits', '_get_game_lines',
+            '_get_pitcher_vs_team', '_get_lineup_analysis', '_get_umpire_data',
+            '_get_innings_projections', '_get_arsenal_data', '_get_batter_profiles',
+            '_get_batter_splits',
+        ]
+        for name in date_fetches:
+            setattr(processor, name, Mock(side_effect=lambda game_date, name=name: {name: game_date}))
+        processor._get_ballpark_factors = Mock(return_value={'NYY': {'strikeouts_factor': 1.0}})
+        processor._get_pitcher_handedness = Mock(return_value={'gerrit_cole': 'Right'})
+
+        first = processor._fetch_inputs(date(2025, 6, 1))
+        second = processor._fetch_inputs(date(2025, 6, 2))
+
+        assert first['lineups'] == {'_get_lineups': date(2025, 6, 1)}
+        assert second['batter_splits'] == {'_get_batter_splits': date(2025, 6, 2)}
+        assert second['pitcher_hands'] == {'gerrit_cole': 'Right'}
+        assert processor._get_ballpark_factors.call_count == 1
+        assert processor._get_pitcher_handedness.call_count == 1
+        assert processor._get_umpire_data.call_count == 2
@@ -0,0 +1,125 @@
+"""
+Unit Tests for Shared-Memory Input Frames
+
+Tests the SharedFrameStore used by the Phase 4 ProcessPool processors
+(PlayerDailyCache, PlayerCompositeFactors, PlayerShotZoneAnalysis):
+- Published slices match the boolean-filter results workers used to get
+- Empty/missing keys yield empty frames with the same columns
+- Workers in a real ProcessPoolExecutor attach and read zero-copy
+- Bytes-per-task accounting
+
+Run with: pytest tests/processors/precompute/test_shared_frames.py -v
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from data_processors.precompute.utils.shared_frames import (
+    EMPTY_SPAN,
+    SharedFrameStore,
+    attach_shared_frames,
+    build_span_index,
+    pick_key,
+    read_shared_slice,
+)
+
+
+@pytest.fixture
+def player_games():
+    """Interleaved player rows with BigQuery-like dtypes."""
+    rows = []
+    for game in range(6):
+        for player in ['lebronjames', 'stephcurry', 'nikolajokic']:
+            rows.append({
+                'player_lookup': player,
+                'game_date': date(2026, 1, 1 + game),
+                'points': game * 3 if player != 'stephcurry' else None,
+                'minutes_played': float(20 + game),
+                'usage_rate': Decimal('25.5'),
+                'processed_at': datetime(2026, 1, 10, tzinfo=timezone.utc),
+            })
+    return pd.DataFrame(rows)
+
+
+def _read_in_worker(name, span):
+    return read_shared_slice(name, span)
+
+
+class TestSpanIndex:
+
+    def test_contiguous_spans(self):
+        df = pd.DataFrame({'k': ['a', 'a', 'b', 'c', 'c', 'c']})
+        assert build_span_index(df, 'k') == {'a': (0, 2), 'b': (2, 1), 'c': (3, 3)}
+
+    def test_empty_frame(self):
+        assert build_span_index(pd.DataFrame({'k': []}), 'k') == {}
+
+    def test_pick_key(self):
+        lookup = {'a': {'is_production_ready': True}, 'b': {}}
+        assert pick_key(lookup, 'a') == {'a': {'is_production_ready': True}}
+        assert pick_key(lookup, 'z') == {}
+
+
+class TestSharedFrameStore:
+
+    def test_slices_match_boolean_filter(self, player_games):
+        with SharedFrameStore() as store:
+            spans = store.publish('player_game', player_games, key='player_lookup')
+            attach_shared_frames(store.handle)
+
+            for player in player_games['player_lookup'].unique():
+                expected = player_games[player_games['player_lookup'] == player]
+                actual = read_shared_slice('player_game', spans[player])
+                pd.testing.assert_frame_equal(actual, expected.reset_index(drop=True))
+
+    def test_missing_key_returns_empty_frame(self, player_games):
+        with SharedFrameStore() as store:
+            store.publish('player_game', player_games, key='player_lookup')
+            attach_shared_frames(store.handle)
+
+            empty = read_shared_slice('player_game', EMPTY_SPAN)
+            assert empty.empty
+            assert list(empty.columns) == list(player_games.columns)
+
+    def test_none_frame_round_trips(self):
+        with SharedFrameStore() as store:
+            assert store.publish('shot_zone', None, key='player_lookup') == {}
+            attach_shared_frames(store.handle)
+            assert read_shared_slice('shot_zone', EMPTY_SPAN) is None
+
+    def test_workers_attach_in_process_pool(self, player_games):
+        with SharedFrameStore() as store:
+            spans = store.publish('player_game', player_games, key='player_lookup')
+            with ProcessPoolExecutor(**store.pool_kwargs(max_workers=2)) as executor:
+                futures = {
+                    player: executor.submit(_read_in_worker, 'player_game', span)
+                    for player, span in spans.items()
+                }
+                results = {player: f.result() for player, f in futures.items()}
+
+        for player, actual in results.items():
+            expected = player_games[player_games['player_lookup'] == player]
+            pd.testing.assert_frame_equal(actual, expected.reset_index(drop=True))
+
+    def test_task_bytes_accounting(self, player_games):
+        with SharedFrameStore() as store:
+            spans = store.publish('player_game', player_games, key='player_lookup')
+            for player, span in spans.items():
+                store.record_task((player, {'player_game': span}))
+
+            stats = store.stats()
+            assert stats['shared_frames'] == 1
+            assert stats['shared_tasks_submitted'] == 3
+            assert stats['shared_bytes_published'] > 0
+            # Per-task payload is a span, not the frame
+            assert 0 < stats['shared_avg_task_bytes'] < 200
+
+    def test_unconvertible_frame_raises(self):
+        df = pd.DataFrame({'player_lookup': ['a', 'b'], 'mixed': [1, 'x']})
+        with SharedFrameStore() as store:
+            with pytest.raises(Exception):
+                store.publish('bad', df, key='player_lookup')
@@ -0,0 +1,260 @@
+"""
+Unit Tests for the travel engine
+
+Tests cover:
+1. Bundled matrix matches the generated travel_distances rows
+2. ScheduleTravelEngine windows match NBATravel.get_travel_last_n_days
+3. Road trips, back-to-backs and rest from the season pass
+4. Team context Travel/Fatigue calculators: engine vs schedule scan
+5. Player travel context loads the schedule once per date and reports the
+   real 14-day miles / time zones and road-trip length; TRAVEL_ENGINE=query
+   stores the same metrics
+"""
+
+import random
+import re
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from data_processors.analytics.utils.travel_engine import (
+    TEAMS,
+    ScheduleTravelEngine,
+    matrix_travel,
+)
+
+ARCHIVED_SQL = Path(__file__).resolve().parents[3] / 'sql' / 'archive' / 'nba_travel_distances_insert.sql'
+SEASON_START = date(2024, 10, 22)
+
+
+def _random_schedule(seed: int, days: int = 60) -> pd.DataFrame:
+    """Each day, a random subset of teams plays (every team at most once a day)."""
+    rng = random.Random(seed)
+    rows = []
+    for offset in range(days):
+        teams = list(TEAMS)
+        rng.shuffle(teams)
+        for k in range(0, rng.randrange(4, 16) * 2, 2):
+            rows.append({
+                'game_date': pd.Timestamp(SEASON_START + timedelta(days=offset)),
+                'home_team_abbr': teams[k],
+                'away_team_abbr': teams[k + 1],
+                'game_status': rng.choice([3, 3, 3, 1]),
+            })
+    return pd.DataFrame(rows)
+
+
+def _make_travel():
+    with patch('data_processors.analytics.utils.travel_utils.get_bigquery_client'):
+        from data_processors.analytics.utils.travel_utils import NBATravel
+        return NBATravel('test-project')
+
+
+def _fake_bigquery():
+    return SimpleNamespace(
+        QueryJobConfig=lambda query_parameters: SimpleNamespace(
+            params={name: value for name, value in query_parameters}
+        ),
+        ScalarQueryParameter=lambda name, _type, value: (name, value),
+    )
+
+
+class TestMatrix:
+    """Test suite for the bundled distance matrix"""
+
+    def test_matches_generated_table(self):
+        pattern = re.compile(r"\('(\w+)', '(\w+)', '[^']*', '[^']*', (\d+), (\d+), '(\w+)', ([\d.]+)\)")
+        rows = pattern.findall(ARCHIVED_SQL.read_text())
+        assert len(rows) == 870
+
+        for from_team, to_team, miles, zones, direction, jet_lag in rows:
+            travel = matrix_travel(from_team, to_team)
+            assert travel['distance_miles'] == int(miles), (from_team, to_team)
+            assert travel['time_zones_crossed'] == int(zones)
+            assert travel['travel_direction'] == direction
+            assert travel['jet_lag_factor'] == float(jet_lag)
+
+    def test_unknown_venue(self):
+        assert matrix_travel('LAL', 'LONDON') is None
+
+    def test_get_travel_distance_skips_query(self):
+        travel = _make_travel()
+
+        result = travel.get_travel_distance('LAL', 'BOS')
+
+        assert result == matrix_travel('LAL', 'BOS')
+        travel.client.query.assert_not_called()
+
+
+class TestScheduleTravelEngine:
+    """Test suite for the season pass"""
+
+    @pytest.mark.parametrize('seed', [1, 2])
+    def test_windows_match_per_team_query(self, seed):
+        schedule = _random_schedule(seed)
+        completed = schedule[schedule['game_status'] == 3]
+        engine = ScheduleTravelEngine(completed)
+        travel = _make_travel()
+
+        def run_query(query, job_config):
+            # The per-team window query (completed games, LAG within window)
+            p = job_config.params
+            team, start, end = p['team_abbr'], pd.Timestamp(p['start_date']), pd.Timestamp(p['end_date'])
+            games = completed[
+                ((completed['home_team_abbr'] == team) | (completed['away_team_abbr'] == team))
+                & (completed['game_date'] >= start) & (completed['game_date'] <= end)
+            ].sort_values('game_date')
+            df = pd.DataFrame({'game_location': games['home_team_abbr'].tolist()})
+            df['prev_game_location'] = df['game_location'].shift(1)
+            return Mock(to_dataframe=Mock(return_value=df))
+
+        travel.client.query.side_effect = run_query
+        with patch('data_processors.analytics.utils.travel_utils.bigquery', _fake_bigquery()):
+            for team in ('LAL', 'BOS', 'DEN', 'TOR'):
+                for offset in (5, 20, 45, 59):
+                    current = datetime.combine(SEASON_START + timedelta(days=offset), datetime.min.time())
+                    for days in (7, 14):
+                        assert engine.travel_last_n_days(team, current, days) == \
+                            travel.get_travel_last_n_days(team, current, days), (team, offset, days)
+
+    def test_road_trip_and_rest(self):
+        schedule = pd.DataFrame([
+            {'game_date': '2025-01-10', 'home_team_abbr': 'LAL', 'away_team_abbr': 'BOS'},
+            {'game_date': '2025-01-12', 'home_team_abbr': 'DEN', 'away_team_abbr': 'LAL'},
+            {'game_date': '2025-01-13', 'home_team_abbr': 'UTA', 'away_team_abbr': 'LAL'},
+            {'game_date': '2025-01-15', 'home_team_abbr': 'PHX', 'away_team_abbr': 'LAL'},
+            {'game_date': '2025-01-18', 'home_team_abbr': 'LAL', 'away_team_abbr': 'MIA'},
+        ])
+        engine = ScheduleTravelEngine(schedule)
+
+        utah = engine.context('LAL', date(2025, 1, 13))
+        assert utah['road_trip_length'] == 2
+        assert utah['is_back_to_back'] is True
+        assert utah['travel_miles'] == matrix_travel('DEN', 'UTA')['distance_miles']
+        assert utah['game_number_in_season'] == 3
+
+        home = engine.context('LAL', date(2025, 1, 18))
+        assert home['road_trip_length'] == 0
+        assert home['days_since_last_game'] == 3
+        assert home['miles_traveled_last_7_days'] == sum(
+            matrix_travel(a, b)['distance_miles'] for a, b in (('DEN', 'UTA'), ('UTA', 'PHX'), ('PHX', 'LAL'))
+        )
+
+        last = engine.last_game_before('LAL', date(2025, 1, 18))
+        assert (last['location'], last['road_trip_length'], last['games_played']) == ('PHX', 3, 4)
+        assert engine.last_game_before('LAL', date(2025, 1, 10)) is None
+        assert engine.context('BOS', date(2025, 1, 10))['days_since_last_game'] is None
+
+
+class TestTeamContextCalculators:
+    """Engine path vs schedule scan in upcoming team game context"""
+
+    def test_fatigue_and_travel_match_scan(self, monkeypatch):
+        from data_processors.analytics.upcoming_team_game_context.calculators.fatigue_calculator import (
+            FatigueCalculator
+        )
+        from data_processors.analytics.upcoming_team_game_context.calculators.travel_calculator import (
+            TravelCalculator
+        )
+
+        schedule = _random_schedule(3, days=40)
+        distances = {f'{a}_{b}': matrix_travel(a, b)['distance_miles'] for a in TEAMS for b in TEAMS if a != b}
+        games = [(game, team) for _, game in schedule.iterrows()
+                 for team in (game['home_team_abbr'], game['away_team_abbr'])]
+
+        def run():
+            fatigue = FatigueCalculator(schedule)
+            travel = TravelCalculator(schedule, distances)
+            return [
+                (fatigue.calculate_fatigue_context(game, team),
+                 travel.calculate_travel_context(game, team, team == game['home_team_abbr'], {}))
+                for game, team in games
+            ]
+
+        monkeypatch.setenv('TRAVEL_ENGINE', 'query')
+        expected = run()
+        monkeypatch.setenv('TRAVEL_ENGINE', 'matrix')
+        assert run() == expected
+
+
+class TestPlayerTravelContext:
+    """Player travel context reads the loaded schedule"""
+
+    def test_one_schedule_query_for_all_teams(self):
+        from data_processors.analytics.upcoming_player_game_context.travel_context import (
+            TravelContextCalculator
+        )
+
+        schedule = _random_schedule(4, days=30)
+        completed = schedule[schedule['game_status'] == 3].rename(columns={
+            'home_team_abbr': 'home_team_tricode', 'away_team_abbr': 'away_team_tricode',
+        })
+        travel = _make_travel()
+        travel.client.query.return_value = Mock(to_dataframe=Mock(return_value=completed))
+        calc = TravelContextCalculator('test-project')
+        calc._travel_utils = travel
+        target = SEASON_START + timedelta(days=29)
+
+        with patch('data_processors.analytics.utils.travel_utils.bigquery', _fake_bigquery()):
+            results = {team: calc.calculate_travel_context(team, target, {}) for team in TEAMS}
+
+        assert travel.client.query.call_count == 1
+        engine = travel.schedule_engine
+        for team, metrics in results.items():
+            window = engine.travel_last_n_days(team, target, 14)
+            last = engine.last_game_before(team, target)
+            assert metrics['miles_traveled_last_14_days'] == window['miles_traveled_last_14_days']
+            assert metrics['time_zones_crossed_last_14_days'] == window['time_zones_crossed_last_14_days']
+            assert metrics['consecutive_road_games'] == (last['road_trip_length'] if last else 0)
+        # Real values, not the 0s stored before the key fix
+        assert any(m['miles_traveled_last_14_days'] > 0 for m in results.values())
+
+    def test_query_mode_stores_same_metrics(self, monkeypatch):
+        from data_processors.analytics.upcoming_player_game_context.travel_context import (
+            TravelContextCalculator
+        )
+
+        completed = _random_schedule(5, days=40)
+        completed = completed[completed['game_status'] == 3].rename(columns={
+            'home_team_abbr': 'home_team_tricode', 'away_team_abbr': 'away_team_tricode',
+        })
+
+        def run_query(query, job_config):
+            p = job_config.params
+            if 'from_team' in p:  # travel_distances rows (generated from the same matrix)
+                return Mock(to_dataframe=Mock(return_value=pd.DataFrame([matrix_travel(p['from_team'], p['to_team'])])))
+            start, end = pd.Timestamp(p['start_date']), pd.Timestamp(p['end_date'])
+            games = completed[(completed['game_date'] >= start) & (completed['game_date'] <= end)]
+            if 'team_abbr' not in p:
+                return Mock(to_dataframe=Mock(return_value=games))
+            # Per-team window / road-trip queries
+            team = p['team_abbr']
+            games = games[(games['home_team_tricode'] == team) | (games['away_team_tricode'] == team)]
+            games = games.sort_values('game_date')
+            df = pd.DataFrame({
+                'game_date': games['game_date'].tolist(),
+                'home_away': ['HOME' if home == team else 'AWAY' for home in games['home_team_tricode']],
+                'game_location': games['home_team_tricode'].tolist(),
+            })
+            df['prev_game_location'] = df['game_location'].shift(1)
+            return Mock(to_dataframe=Mock(return_value=df))
+
+        def run(mode):
+            monkeypatch.setenv('TRAVEL_ENGINE', mode)
+            travel = _make_travel()
+            travel.client.query.side_effect = run_query
+            calc = TravelContextCalculator('test-project')
+            calc._travel_utils = travel
+            with patch('data_processors.analytics.utils.travel_utils.bigquery', _fake_bigquery()):
+                return {
+                    (team, offset): calc.calculate_travel_context(team, SEASON_START + timedelta(days=offset), {})
+                    for team in TEAMS for offset in (12, 25, 39)
+                }
+
+        expected = run('query')
+        assert run('matrix') == expected
+        assert any(m['consecutive_road_games'] > 1 for m in expected.values())
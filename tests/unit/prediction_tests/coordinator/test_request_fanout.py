@@ -0,0 +1,203 @@
+"""
+Unit Tests for Pipelined Prediction Request Fan-Out
+
+Tests cover:
+1. Token bucket refills at its rate and sleeps only when empty
+2. Readiness pacer speeds up with worker completions, capped at max_rate
+3. Pipelined publisher keeps a bounded window of futures, retries and reports results
+4. Historical games blobs round-trip by content address and reject bad digests
+"""
+
+import gzip
+from unittest.mock import MagicMock
+
+import pytest
+
+from predictions.coordinator.request_fanout import (
+    PipelinedPublisher,
+    ReadinessPacer,
+    TokenBucket,
+)
+from predictions.shared import payload_blobs
+from predictions.shared.payload_blobs import (
+    PayloadBlobStore,
+    load_payload,
+    resolve_historical_games,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeFuture:
+    def __init__(self, error=None, done=True):
+        self.error = error
+        self._done = done
+
+    def done(self):
+        return self._done
+
+    def result(self, timeout=None):
+        self._done = True
+        if self.error:
+            raise self.error
+        return 'message-id'
+
+
+class TestTokenBucket:
+
+    def test_burst_then_paced(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=50, burst=2, clock=clock, sleep=clock.sleep)
+
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        waited = bucket.acquire()
+
+        assert waited == pytest.approx(0.02)
+        assert clock.now == pytest.approx(0.02)
+
+    def test_refill_capped_at_burst(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=3, clock=clock, sleep=clock.sleep)
+        for _ in range(3):
+            bucket.acquire()
+
+        clock.now += 60
+        for _ in range(3):
+            assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(0.1)
+
+
+class TestReadinessPacer:
+
+    def test_rate_follows_readiness(self):
+        ready = {'count': 0}
+        pacer = ReadinessPacer(lambda: ready['count'], base_rate=50, rate_per_ready=5, max_rate=200)
+
+        assert pacer.current_rate() == 50
+        ready['count'] = 10
+        assert pacer.current_rate() == 100
+        ready['count'] = 1000
+        assert pacer.current_rate() == 200
+
+    def test_readiness_errors_fall_back_to_base_rate(self):
+        def broken():
+            raise RuntimeError('tracker unavailable')
+
+        assert ReadinessPacer(broken, base_rate=50).current_rate() == 50
+
+    def test_acquire_uses_current_rate(self):
+        clock = FakeClock()
+        ready = {'count': 0}
+        pacer = ReadinessPacer(lambda: ready['count'], base_rate=50, rate_per_ready=50,
+                               max_rate=1000, burst=1, clock=clock, sleep=clock.sleep)
+        pacer.acquire()
+        pacer.acquire()
+        assert clock.sleeps[-1] == pytest.approx(1 / 50)
+
+        ready['count'] = 9
+        pacer.acquire()
+        assert clock.sleeps[-1] == pytest.approx(1 / 500)
+        assert pacer.total_wait == pytest.approx(1 / 50 + 1 / 500)
+
+
+class TestPipelinedPublisher:
+
+    def test_window_is_bounded_and_all_published(self):
+        publisher = MagicMock()
+        publisher.publish.side_effect = lambda topic, data: FakeFuture(done=False)
+        results = []
+
+        fanout = PipelinedPublisher(publisher, 'topic', max_in_flight=4,
+                                    on_result=lambda players, ok: results.append((players, ok)))
+        for i in range(10):
+            fanout.submit(f'msg{i}'.encode(), [f'player{i}'])
+        stats = fanout.drain()
+
+        assert publisher.publish.call_count == 10
+        assert stats['published_messages'] == 10
+        assert stats['failed_messages'] == 0
+        assert stats['peak_in_flight'] == 4
+        assert stats['latency_histogram']['+Inf'] == 10
+        assert [players[0] for players, _ in results] == [f'player{i}' for i in range(10)]
+
+    def test_failed_publish_is_retried(self):
+        clock = FakeClock()
+        publisher = MagicMock()
+        publisher.publish.side_effect = [FakeFuture(error=TimeoutError('ack timeout')), FakeFuture()]
+        results = []
+
+        fanout = PipelinedPublisher(publisher, 'topic', max_in_flight=8, sleep=clock.sleep,
+                                    on_result=lambda players, ok: results.append((players, ok)))
+        fanout.submit(b'msg', ['lebronjames'])
+        stats = fanout.drain()
+
+        assert publisher.publish.call_count == 2
+        assert clock.sleeps == [1]
+        assert stats['published_messages'] == 1
+        assert results == [(['lebronjames'], True)]
+
+    def test_exhausted_retries_report_failure(self):
+        clock = FakeClock()
+        publisher = MagicMock()
+        publisher.publish.side_effect = RuntimeError('topic not found')
+        results = []
+
+        fanout = PipelinedPublisher(publisher, 'topic', max_in_flight=8, sleep=clock.sleep,
+                                    on_result=lambda players, ok: results.append((players, ok)))
+        fanout.submit(b'chunk', ['a', 'b', 'c'])
+        stats = fanout.drain()
+
+        assert publisher.publish.call_count == 3
+        assert clock.sleeps == [1, 2]
+        assert stats['failed_messages'] == 1
+        assert results == [(['a', 'b', 'c'], False)]
+
+
+class TestPayloadBlobs:
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        payload_blobs._blob_cache.clear()
+        payload_blobs._store_cache.clear()
+        yield
+        payload_blobs._blob_cache.clear()
+        payload_blobs._store_cache.clear()
+
+    def test_round_trip_by_reference(self, tmp_path):
+        games = {'lebronjames': [{'points': 25}], 'stephcurry': [{'points': 31}]}
+        store = PayloadBlobStore(str(tmp_path))
+
+        ref = store.put(games)
+
+        assert ref == store.put(dict(reversed(list(games.items()))))
+        assert ref['name'] == f"payloads/{ref['sha256'][:2]}/{ref['sha256']}.json.gz"
+        assert resolve_historical_games(
+            {'player_lookup': 'stephcurry', 'historical_games_ref': ref}
+        ) == [{'points': 31}]
+        assert resolve_historical_games({'player_lookup': 'nobody', 'historical_games_ref': ref}) is None
+
+    def test_inline_games_take_precedence(self):
+        request = {'player_lookup': 'x', 'historical_games_batch': [{'points': 1}],
+                   'historical_games_ref': {'store': '/nonexistent', 'name': 'n', 'sha256': 'd'}}
+        assert resolve_historical_games(request) == [{'points': 1}]
+
+    def test_digest_mismatch_rejected(self, tmp_path):
+        store = PayloadBlobStore(str(tmp_path))
+        ref = store.put({'a': [1]})
+        store.store.put(ref['name'], gzip.compress(b'{"a":[2]}'))
+
+        with pytest.raises(ValueError):
+            load_payload(ref)
+        assert resolve_historical_games({'player_lookup': 'a', 'historical_games_ref': ref}) is None
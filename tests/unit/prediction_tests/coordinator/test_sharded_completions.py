@@ -0,0 +1,302 @@
+"""
+Unit Tests for Sharded, Write-Coalescing Batch Completion Tracking
+
+Tests cover:
+1. Completions land in sharded counters; redelivered events do not double count
+2. Concurrent completions are coalesced into few group commits
+3. "Batch complete" is reported exactly once, across coordinator instances
+4. Stall/timeout completion goes through the same once-only marker
+5. Load test: 500+ completion events/second with no lost updates
+
+Uses an in-memory Firestore stand-in (nested collections, WriteBatch,
+create() preconditions and ArrayUnion/Increment/SERVER_TIMESTAMP transforms).
+
+Reference: predictions/coordinator/completion_tracker.py
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from google.api_core.exceptions import AlreadyExists, NotFound
+from google.cloud.firestore_v1 import transforms
+
+from predictions.coordinator import batch_state_manager
+from predictions.coordinator.completion_tracker import ShardedCompletionTracker
+
+
+class InMemoryFirestore:
+    """Thread-safe in-memory Firestore with the calls the completion tracker makes."""
+
+    def __init__(self, commit_latency: float = 0.0):
+        self._data = {}
+        self._lock = threading.Lock()
+        self.commit_latency = commit_latency
+        self.writes = 0
+
+    def collection(self, name):
+        return InMemoryCollection(self, name)
+
+    def batch(self):
+        return InMemoryWriteBatch(self)
+
+    # Applied under self._lock
+    def _apply(self, path, data, mode):
+        existing = self._data.get(path)
+        if mode == 'update' and existing is None:
+            raise NotFound(f"No document to update: {path}")
+        if mode == 'create' and existing is not None:
+            raise AlreadyExists(f"Document already exists: {path}")
+        doc = dict(existing or {}) if mode in ('update', 'merge') else {}
+        for key, value in data.items():
+            if isinstance(value, transforms.ArrayUnion):
+                current = list(doc.get(key, []))
+                current.extend(v for v in value.values if v not in current)
+                doc[key] = current
+            elif isinstance(value, transforms.Increment):
+                doc[key] = doc.get(key, 0) + value.value
+            elif isinstance(value, transforms.Sentinel):
+                doc[key] = datetime.now(timezone.utc)
+            else:
+                doc[key] = value
+        self._data[path] = doc
+        self.writes += 1
+
+
+class InMemoryCollection:
+    def __init__(self, db, path):
+        self._db = db
+        self._path = path
+
+    def document(self, doc_id):
+        return InMemoryDocumentRef(self._db, f"{self._path}/{doc_id}")
+
+    def stream(self):
+        prefix = self._path + '/'
+        with self._db._lock:
+            docs = [(path, dict(data)) for path, data in self._db._data.items()
+                    if path.startswith(prefix) and '/' not in path[len(prefix):]]
+        return [InMemoryDocumentSnapshot(path.rsplit('/', 1)[1], data) for path, data in docs]
+
+
+class InMemoryDocumentRef:
+    def __init__(self, db, path):
+        self._db = db
+        self.path = path
+        self.id = path.rsplit('/', 1)[1]
+
+    def collection(self, name):
+        return InMemoryCollection(self._db, f"{self.path}/{name}")
+
+    def get(self, transaction=None):
+        with self._db._lock:
+            data = self._db._data.get(self.path)
+        return InMemoryDocumentSnapshot(self.id, dict(data) if data is not None else None)
+
+    def set(self, data, merge=False):
+        with self._db._lock:
+            self._db._apply(self.path, data, 'merge' if merge else 'set')
+
+    def update(self, data):
+        with self._db._lock:
+            self._db._apply(self.path, data, 'update')
+
+    def create(self, data):
+        with self._db._lock:
+            self._db._apply(self.path, data, 'create')
+
+
+class InMemoryDocumentSnapshot:
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self):
+        return dict(self._data) if self._data is not None else None
+
+
+class InMemoryWriteBatch:
+    """All-or-nothing commit of buffered writes."""
+
+    def __init__(self, db):
+        self._db = db
+        self._ops = []
+
+    def set(self, ref, data, merge=False):
+        self._ops.append((ref.path, data, 'merge' if merge else 'set'))
+
+    def update(self, ref, data):
+        self._ops.append((ref.path, data, 'update'))
+
+    def commit(self):
+        if self._db.commit_latency:
+            time.sleep(self._db.commit_latency)
+        with self._db._lock:
+            snapshot = dict(self._db._data)
+            try:
+                for path, data, mode in self._ops:
+                    self._db._apply(path, data, mode)
+            except Exception:
+                self._db._data = snapshot
+                raise
+
+
+@pytest.fixture
+def db():
+    return InMemoryFirestore()
+
+
+def _create_batch(db, batch_id, expected):
+    db.collection('prediction_batches').document(batch_id).set({
+        'batch_id': batch_id,
+        'game_date': '2026-10-16',
+        'expected_players': expected,
+        'completed_players': [],
+        'failed_players': [],
+        'is_complete': False,
+        'start_time': datetime.now(timezone.utc),
+        'updated_at': datetime.now(timezone.utc),
+    })
+
+
+def _tracker(db, **kwargs):
+    return ShardedCompletionTracker(db.collection('prediction_batches'), db, **kwargs)
+
+
+def _manager(db):
+    env = {'ENABLE_SHARDED_COMPLETIONS': 'true', 'COMPLETION_COALESCE_MS': '5'}
+    with patch.dict('os.environ', env), patch('shared.clients.get_firestore_client', return_value=db):
+        return batch_state_manager.BatchStateManager('test-project')
+
+
+class TestShardedCompletionTracker:
+
+    def test_completions_spread_over_shards(self, db):
+        _create_batch(db, 'b1', expected=100)
+        tracker = _tracker(db, num_shards=8, coalesce_seconds=0)
+
+        for i in range(20):
+            tracker.record('b1', f'player-{i}', 3)
+
+        shards = db.collection('prediction_batches').document('b1').collection('completion_shards').stream()
+        assert 1 < len(shards) <= 8
+        players, total = tracker.get_totals('b1')
+        assert sorted(players) == sorted(f'player-{i}' for i in range(20))
+        assert total == 60
+
+    def test_redelivered_completion_counted_once(self, db):
+        _create_batch(db, 'b1', expected=2)
+        tracker = _tracker(db, coalesce_seconds=0)
+
+        assert tracker.record('b1', 'lebron-james', 5).completed == 1
+        assert tracker.record('b1', 'lebron-james', 5).completed == 1
+        assert tracker.record('b1', 'stephen-curry', 5).is_complete is True
+
+    def test_missing_batch_raises_for_its_callers_only(self, db):
+        _create_batch(db, 'b1', expected=10)
+        tracker = _tracker(db, coalesce_seconds=0.05)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            ok = pool.submit(tracker.record, 'b1', 'a', 1)
+            time.sleep(0.01)
+            missing = pool.submit(tracker.record, 'no-such-batch', 'b', 1)
+
+            assert ok.result().completed == 1
+            with pytest.raises(NotFound):
+                missing.result()
+
+    def test_concurrent_completions_are_coalesced(self, db):
+        db.commit_latency = 0.005
+        _create_batch(db, 'b1', expected=200)
+        tracker = _tracker(db, coalesce_seconds=0.01)
+
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            results = list(pool.map(lambda i: tracker.record('b1', f'p{i}', 1), range(200)))
+
+        assert sum(r.is_complete for r in results) == 1
+        assert tracker.commits < 50
+        assert len(tracker.get_totals('b1')[0]) == 200
+
+
+class TestExactlyOnceCompletion:
+
+    def test_two_instances_one_completion(self, db):
+        _create_batch(db, 'b1', expected=300)
+        instances = [_tracker(db, coalesce_seconds=0.002) for _ in range(3)]
+
+        def complete(i):
+            return instances[i % 3].record('b1', f'p{i}', 2).is_complete
+
+        with ThreadPoolExecutor(max_workers=24) as pool:
+            outcomes = list(pool.map(complete, range(300)))
+
+        assert outcomes.count(True) == 1
+        batch = db.collection('prediction_batches').document('b1').get().to_dict()
+        assert batch['is_complete'] is True
+        # Late redelivery after completion does not complete it again
+        assert instances[0].record('b1', 'p0', 2).is_complete is False
+
+    def test_claim_completion_once(self, db):
+        _create_batch(db, 'b1', expected=5)
+        tracker = _tracker(db)
+
+        assert tracker.claim_completion('b1', 4, 5, reason='stalled') is True
+        assert tracker.claim_completion('b1', 5, 5) is False
+
+
+class TestBatchStateManagerSharded:
+
+    def test_record_completion_and_state(self, db):
+        manager = _manager(db)
+        _create_batch(db, 'b1', expected=3)
+
+        assert manager.record_completion('b1', 'a', 10) is False
+        assert manager.record_completion('b1', 'b', 10) is False
+        assert manager.record_completion('b1', 'c', 10) is True
+        assert manager.record_completion('b1', 'c', 10) is False
+
+        state = manager.get_batch_state('b1')
+        assert sorted(state.completed_players) == ['a', 'b', 'c']
+        assert state.total_predictions == 40  # redelivery still increments predictions
+        assert state.is_complete is True
+        assert manager.get_completion_progress('b1')['completed'] == 3
+
+    def test_stall_completion_uses_marker(self, db):
+        manager = _manager(db)
+        _create_batch(db, 'b1', expected=20)
+        for i in range(19):
+            manager.completion_tracker.record('b1', f'p{i}', 1)
+        batch_ref = db.collection('prediction_batches').document('b1')
+        batch_ref.update({'updated_at': datetime.now(timezone.utc) - timedelta(minutes=30)})
+
+        assert manager.check_and_complete_stalled_batch('b1', stall_threshold_minutes=10) is True
+
+        # Late final completion must not trigger a second consolidation
+        batch_ref.update({'is_complete': False})
+        assert manager.record_completion('b1', 'p19', 1) is False
+
+
+class TestLoad:
+
+    def test_500_events_per_second_no_lost_updates(self, db):
+        db.commit_latency = 0.01  # realistic-ish Firestore commit round trip
+        _create_batch(db, 'load', expected=2000)
+        instances = [_tracker(db, coalesce_seconds=0.02) for _ in range(2)]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=64) as pool:
+            outcomes = list(pool.map(
+                lambda i: instances[i % 2].record('load', f'player-{i}', 1).is_complete,
+                range(2000)
+            ))
+        elapsed = time.perf_counter() - start
+
+        players, total = instances[0].get_totals('load')
+        assert len(players) == len(set(players)) == 2000
+        assert total == 2000
+        assert outcomes.count(True) == 1
+        assert 2000 / elapsed >= 500, f"{2000 / elapsed:.0f} events/s"
@@ -0,0 +1,127 @@
+"""
+Unit Tests for Batched Model Inference (Phase 5 Worker)
+
+Tests cover:
+1. Batched outputs are bitwise identical to per-row predict() calls
+2. Cache misses and calls outside a batch fall through to the real model
+3. Primed rows are isolated per context (gunicorn threads)
+4. Models that fail on a batched call fall back to per-row calls
+"""
+
+import contextvars
+
+import numpy as np
+import pytest
+
+from predictions.worker.batch_inference import BatchedModel, batch_inference
+
+catboost = pytest.importorskip('catboost')
+
+
+class CountingModel:
+    """Wraps a real model and counts predict() calls and rows."""
+
+    def __init__(self, model):
+        self.model = model
+        self.calls = 0
+        self.rows = 0
+
+    def predict(self, data):
+        self.calls += 1
+        self.rows += len(data)
+        return self.model.predict(data)
+
+
+class FakeSystem:
+    """Minimal prediction system: predict() scores one prepared vector."""
+
+    model_id = 'fake_catboost'
+
+    def __init__(self, model):
+        self.model = model
+
+    def prepare_batch_vector(self, features):
+        return np.array([features['values']], dtype=np.float64)
+
+    def predict(self, features):
+        return float(self.model.predict(self.prepare_batch_vector(features))[0])
+
+
+@pytest.fixture(scope='module')
+def trained_model():
+    rng = np.random.default_rng(7)
+    X = rng.normal(size=(200, 6))
+    y = X @ rng.normal(size=6) + rng.normal(scale=0.1, size=200)
+    model = catboost.CatBoostRegressor(iterations=30, depth=4, verbose=False, random_seed=7,
+                                      allow_writing_files=False)
+    model.fit(X, y)
+    return model
+
+
+@pytest.fixture
+def features_list():
+    rng = np.random.default_rng(11)
+    return [{'values': list(rng.normal(size=6))} for _ in range(25)]
+
+
+class TestBatchInference:
+
+    def test_batched_outputs_match_single_row(self, trained_model, features_list):
+        expected = [FakeSystem(trained_model).predict(f) for f in features_list]
+
+        counting = CountingModel(trained_model)
+        system = FakeSystem(counting)
+        with batch_inference([system], features_list) as stats:
+            actual = [system.predict(f) for f in features_list]
+
+        assert actual == expected
+        assert counting.calls == 1
+        assert stats == {'fake_catboost': 25}
+
+    def test_duplicate_rows_scored_once(self, trained_model, features_list):
+        counting = CountingModel(trained_model)
+        system = FakeSystem(counting)
+        with batch_inference([system], features_list + features_list[:5]):
+            pass
+        assert counting.rows == 25
+
+    def test_cache_miss_falls_through(self, trained_model, features_list):
+        counting = CountingModel(trained_model)
+        system = FakeSystem(counting)
+        other = {'values': [0.5] * 6}
+        with batch_inference([system], features_list):
+            result = system.predict(other)
+
+        assert result == FakeSystem(trained_model).predict(other)
+        assert counting.calls == 2
+
+    def test_outside_batch_delegates(self, trained_model, features_list):
+        counting = CountingModel(trained_model)
+        system = FakeSystem(counting)
+        with batch_inference([system], features_list):
+            pass
+
+        assert isinstance(system.model, BatchedModel)
+        system.predict(features_list[0])
+        assert counting.calls == 2
+
+    def test_primed_rows_isolated_per_context(self, trained_model, features_list):
+        counting = CountingModel(trained_model)
+        system = FakeSystem(counting)
+        with batch_inference([system], features_list):
+            contextvars.Context().run(system.predict, features_list[0])
+        assert counting.calls == 2
+
+    def test_batched_failure_falls_back_per_row(self, features_list):
+        class RowOnlyModel:
+            def predict(self, data):
+                if len(data) > 1:
+                    raise ValueError('batch not supported')
+                return np.array([data[0].sum()])
+
+        system = FakeSystem(RowOnlyModel())
+        with batch_inference([system, None], features_list) as stats:
+            result = system.predict(features_list[0])
+
+        assert stats == {}
+        assert result == pytest.approx(sum(features_list[0]['values']))
@@ -0,0 +1,196 @@
+"""
+Unit Tests for Resident Line-Delta Re-Scoring (Phase 5 Worker)
+
+Tests cover:
+1. apply_line_features: coordinator line, recovery median, feature store, no line
+2. Re-basing a resident row matches preparing the row fresh at the new line
+3. Resident rows are never mutated by a re-score
+4. Store eviction by date, TTL and game_id mismatch
+5. An injury status that changes between prep and re-score is re-queried
+   (not served from the filter's cache) and replaces the prep-time fields
+"""
+
+import copy
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from predictions.shared.injury_filter import InjuryFilter
+from predictions.worker.line_rescoring import (
+    ResidentSlateStore,
+    apply_injury_status,
+    apply_line_features,
+    snapshot_line_base,
+)
+
+GAME_DATE = date(2026, 2, 13)
+
+
+def _feature_store_row(**overrides):
+    row = {
+        'points_avg_last_5': 24.2,
+        'points_avg_season': 22.8,
+        'vegas_points_line': 23.5,
+        'vegas_opening_line': 22.5,
+        'vegas_line_move': 1.0,
+        'has_vegas_line': 1.0,
+        'context': {'is_starter': True},
+    }
+    row.update(overrides)
+    return row
+
+
+def _line_info(actual_prop_line=None, has_prop_line=True, **extra):
+    return {
+        'has_prop_line': has_prop_line,
+        'actual_prop_line': actual_prop_line,
+        'line_source': 'ACTUAL_PROP',
+        'prediction_run_mode': 'LINE_UPDATE',
+        **extra,
+    }
+
+
+def _prepare(row, line_info, line_values):
+    """What the worker's full path does with the line."""
+    features = copy.deepcopy(row)
+    base = snapshot_line_base(features)
+    apply_line_features(features, line_info, line_values)
+    return features, base
+
+
+class TestApplyLineFeatures:
+    """Line injection shared by the full and resident paths"""
+
+    def test_coordinator_line(self):
+        features, _ = _prepare(_feature_store_row(), _line_info(25.5), [25.5])
+        assert features['vegas_points_line'] == 25.5
+        assert features['vegas_line_move'] == 0.0
+        assert features['vegas_source'] == 'coordinator_actual'
+        assert features['_fs_original_vegas_points_line'] == 23.5
+
+    def test_recovery_median(self):
+        features, _ = _prepare(_feature_store_row(), _line_info(None), [26.5, 24.5, 25.5])
+        assert features['vegas_points_line'] == 25.5
+        assert features['vegas_source'] == 'recovery_median'
+
+    def test_feature_store_and_no_line(self):
+        preserved, _ = _prepare(_feature_store_row(), _line_info(None, has_prop_line=False), [])
+        assert preserved['vegas_points_line'] == 23.5
+        assert preserved['vegas_source'] == 'feature_store'
+
+        blind, _ = _prepare(_feature_store_row(vegas_points_line=None), _line_info(None, has_prop_line=False), [])
+        assert blind['has_vegas_line'] == 0.0
+        assert blind['vegas_source'] == 'none'
+
+
+class TestResidentSlateStore:
+    """Remember / rebase / evict"""
+
+    @pytest.mark.parametrize('new_info,new_lines', [
+        (_line_info(27.5), [27.5]),
+        (_line_info(None), [21.5, 22.5]),
+        (_line_info(None, has_prop_line=False), []),
+    ])
+    def test_rebase_matches_fresh_prepare(self, new_info, new_lines):
+        store = ResidentSlateStore()
+        prepared, base = _prepare(_feature_store_row(), _line_info(25.5), [25.5])
+        store.remember('lebronjames', GAME_DATE, 'g1', prepared, {'systems_attempted': []}, base)
+
+        rebased, metadata = store.rebase(store.get(GAME_DATE, 'lebronjames'), new_info, new_lines)
+        fresh, _ = _prepare(_feature_store_row(), new_info, new_lines)
+
+        assert rebased == fresh
+        assert metadata == {'systems_attempted': []}
+
+    def test_resident_row_is_not_mutated(self):
+        store = ResidentSlateStore()
+        prepared, base = _prepare(_feature_store_row(), _line_info(25.5), [25.5])
+        store.remember('lebronjames', GAME_DATE, 'g1', prepared, {'systems_attempted': []}, base)
+        prepared['vegas_points_line'] = -1
+
+        resident = store.get(GAME_DATE, 'lebronjames')
+        features, metadata = store.rebase(resident, _line_info(30.5), [30.5])
+        features['context']['is_starter'] = False
+        metadata['systems_attempted'].append('catboost_v9')
+
+        again, again_metadata = store.rebase(resident, _line_info(25.5), [25.5])
+        assert again['vegas_points_line'] == 25.5
+        assert again['context'] == {'is_starter': True}
+        assert again_metadata == {'systems_attempted': []}
+
+    def test_vegas_fallbacks_follow_the_line(self):
+        store = ResidentSlateStore()
+        prepared, base = _prepare(_feature_store_row(vegas_points_line=None), _line_info(None, has_prop_line=False), [])
+        prepared['_v8_fallback_features'] = [
+            'vegas_points_line', 'vegas_opening_line', 'vegas_line_move', 'has_vegas_line', 'games_vs_opponent',
+        ]
+        prepared['_v8_fallback_severity'] = 'critical'
+        store.remember('lebronjames', GAME_DATE, 'g1', prepared, {}, base)
+
+        features, _ = store.rebase(store.get(GAME_DATE, 'lebronjames'), _line_info(24.5), [24.5])
+
+        assert features['_v8_fallback_features'] == ['games_vs_opponent']
+        assert features['_v8_fallback_severity'] == 'minor'
+
+    def test_eviction_ttl_and_game_id(self, monkeypatch):
+        store = ResidentSlateStore(max_dates=2, ttl_seconds=60)
+        for day in (11, 12, 13):
+            store.remember('p', date(2026, 2, day), 'g', {}, {}, {})
+
+        assert store.get(date(2026, 2, 11), 'p') is None
+        assert store.get(date(2026, 2, 13), 'p') is not None
+        assert store.get(date(2026, 2, 13), 'p', game_id='other') is None
+        assert len(store) == 2
+
+        import predictions.worker.line_rescoring as line_rescoring
+        now = line_rescoring.time.time()
+        monkeypatch.setattr(line_rescoring.time, 'time', lambda: now + 120)
+        assert store.get(date(2026, 2, 13), 'p') is None
+        assert store.stats()['hits'] == 1
+
+
+class TestInjuryRecheck:
+    """Injury report re-queried at re-score time"""
+
+    @staticmethod
+    def _injury_filter(report):
+        injury_filter = InjuryFilter(project_id='test-project')
+        injury_filter._client = MagicMock()
+        injury_filter._client.query.side_effect = lambda *args, **kwargs: MagicMock(result=lambda: [
+            SimpleNamespace(player_lookup=player, injury_status=status, reason=reason)
+            for player, (status, reason) in report.items()
+        ])
+        return injury_filter
+
+    def test_status_change_between_prep_and_rescore(self):
+        report = {'lebronjames': ('Questionable', 'Ankle')}
+        injury_filter = self._injury_filter(report)
+
+        # Prep: the full path checks the player and records the status
+        prepared, base = _prepare(_feature_store_row(), _line_info(25.5), [25.5])
+        metadata = {}
+        apply_injury_status(prepared, metadata, injury_filter.check_player('lebronjames', GAME_DATE))
+        store = ResidentSlateStore()
+        store.remember('lebronjames', GAME_DATE, 'g1', prepared, metadata, base)
+
+        # Ruled out later in the day
+        report['lebronjames'] = ('Out', 'Ankle')
+        cached = injury_filter.check_players_batch(['lebronjames'], GAME_DATE)
+        assert cached['lebronjames'].injury_status == 'questionable'
+        status = injury_filter.check_players_batch(['lebronjames'], GAME_DATE, refresh=True)['lebronjames']
+        assert status.should_skip
+
+        features, metadata = store.rebase(store.get(GAME_DATE, 'lebronjames'), _line_info(27.5), [27.5], status)
+        assert features['injury_status_at_prediction'] == 'OUT'
+        assert metadata['injury_should_skip'] is True
+
+        # Upgraded back to available: the prep-time warning is cleared
+        del report['lebronjames']
+        status = injury_filter.check_players_batch(['lebronjames'], GAME_DATE, refresh=True)['lebronjames']
+        features, metadata = store.rebase(store.get(GAME_DATE, 'lebronjames'), _line_info(27.5), [27.5], status)
+        assert features['injury_status_at_prediction'] is None
+        assert features['injury_flag_at_prediction'] is False
+        assert metadata == {'injury_status': None, 'injury_has_warning': False, 'injury_should_skip': False}
+        assert store.get(GAME_DATE, 'lebronjames').metadata['injury_status'] == 'questionable'
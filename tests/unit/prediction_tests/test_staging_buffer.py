@@ -0,0 +1,205 @@
+"""
+Unit Tests for Buffered Staging Writes
+
+Tests cover:
+1. Rows are buffered until the row/age threshold and flushed as one NDJSON object
+2. Failed flushes keep rows buffered for the next attempt; a thread whose
+   rows another thread flushed gets that upload's outcome from flush()
+3. Consolidation loads every buffered object with ONE load job and merges a single table
+4. Buffered objects are cleaned up with the staging tables
+"""
+
+import json
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from google.cloud import bigquery
+
+from predictions.shared.batch_staging_writer import BatchConsolidator
+from predictions.shared.staging_buffer import (
+    BufferedStagingWriter,
+    GCSStagingStore,
+    LocalStagingStore,
+    get_staging_store,
+)
+
+PROJECT = 'test-project'
+
+
+def _prediction(player, line=20.5):
+    return {
+        'player_lookup': player,
+        'game_id': '20261016_LAL_BOS',
+        'system_id': 'catboost_v8',
+        'current_points_line': line,
+        'predicted_points': np.float64(22.25),
+        'confidence_score': np.nan,
+    }
+
+
+@pytest.fixture
+def bq_client():
+    client = MagicMock()
+    schema = [bigquery.SchemaField(name, 'STRING') for name in _prediction('x')]
+    client.get_table.return_value = SimpleNamespace(schema=schema)
+    return client
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalStagingStore(str(tmp_path))
+
+
+class TestBufferedStagingWriter:
+
+    def test_buffers_until_row_threshold(self, bq_client, store):
+        writer = BufferedStagingWriter(bq_client, PROJECT, store, flush_rows=3, flush_seconds=3600)
+
+        writer.write_to_staging([_prediction('a'), _prediction('b')], 'batch-1', 'worker-1')
+        assert store.list('nba_predictions/batch_1/') == []
+        assert writer.buffered_rows('batch-1') == 2
+
+        result = writer.write_to_staging([_prediction('c')], 'batch-1', 'worker-1')
+        assert result.success
+        objects = store.list('nba_predictions/batch_1/')
+        assert len(objects) == 1
+        rows = [json.loads(line) for line in store.read(objects[0]).decode().splitlines()]
+        assert [r['player_lookup'] for r in rows] == ['a', 'b', 'c']
+        assert rows[0]['predicted_points'] == 22.25
+        assert rows[0]['confidence_score'] is None
+        assert writer.buffered_rows() == 0
+
+    def test_age_threshold_flushes(self, bq_client, store):
+        writer = BufferedStagingWriter(bq_client, PROJECT, store, flush_rows=1000, flush_seconds=0)
+        writer.write_to_staging([_prediction('a')], 'batch-1', 'worker-1')
+        assert len(store.list('nba_predictions/batch_1/')) == 1
+
+    def test_explicit_flush_and_empty_flush(self, bq_client, store):
+        writer = BufferedStagingWriter(bq_client, PROJECT, store, flush_rows=1000, flush_seconds=3600)
+        writer.write_to_staging([_prediction('a')], 'batch-1', 'worker-1')
+        writer.write_to_staging([_prediction('b')], 'batch-2', 'worker-1')
+
+        assert writer.flush('batch-1').rows_written == 1
+        assert writer.flush('batch-1').rows_written == 0
+        assert [r.rows_written for r in writer.flush_all()] == [1]
+        assert len(store.list('nba_predictions/batch_2/')) == 1
+
+    def test_dataset_prefix_isolates_objects(self, bq_client, store):
+        writer = BufferedStagingWriter(bq_client, PROJECT, store, dataset_prefix='test', flush_rows=1)
+        writer.write_to_staging([_prediction('a')], 'batch-1', 'worker-1')
+        assert len(store.list('test_nba_predictions/batch_1/')) == 1
+
+    def test_failed_flush_keeps_rows(self, bq_client, store):
+        writer = BufferedStagingWriter(bq_client, PROJECT, store, flush_rows=1000, flush_seconds=3600)
+        writer.write_to_staging([_prediction('a')], 'batch-1', 'worker-1')
+
+        original_put = store.put
+        store.put = MagicMock(side_effect=OSError('disk full'))
+        result = writer.flush('batch-1')
+        assert not result.success
+        assert writer.buffered_rows('batch-1') == 1
+
+        store.put = original_put
+        assert writer.flush('batch-1').rows_written == 1
+
+    def test_flush_waits_for_upload_by_other_thread(self, bq_client, store):
+        writer = BufferedStagingWriter(bq_client, PROJECT, store, flush_rows=1000, flush_seconds=3600)
+        upload_started, release_upload = threading.Event(), threading.Event()
+
+        def failing_put(name, data):
+            upload_started.set()
+            release_upload.wait(5)
+            raise OSError('disk full')
+
+        wrote, flush_now, results = threading.Event(), threading.Event(), []
+
+        def request():
+            writer.write_to_staging([_prediction('a')], 'batch-1', 'worker-1')
+            wrote.set()
+            flush_now.wait(5)
+            results.append(writer.flush('batch-1'))
+
+        request_thread = threading.Thread(target=request)
+        request_thread.start()
+        wrote.wait(5)
+
+        # Another thread flushes the shared buffer, including the request's row
+        store.put = failing_put
+        other = threading.Thread(target=writer.flush, args=('batch-1',))
+        other.start()
+        upload_started.wait(5)
+
+        flush_now.set()
+        request_thread.join(timeout=0.2)
+        assert request_thread.is_alive()  # waiting on the other thread's upload
+
+        release_upload.set()
+        request_thread.join(timeout=5)
+        other.join(timeout=5)
+        assert not results[0].success and 'disk full' in results[0].error_message
+        assert writer.buffered_rows('batch-1') == 1
+
+    def test_schema_mismatch_rejected(self, bq_client, store):
+        writer = BufferedStagingWriter(bq_client, PROJECT, store, flush_rows=1)
+        result = writer.write_to_staging([{**_prediction('a'), 'not_a_column': 1}], 'batch-1', 'worker-1')
+        assert not result.success
+        assert store.list('nba_predictions/batch_1/') == []
+
+
+class TestBufferedConsolidation:
+
+    def _write_two_workers(self, bq_client, store):
+        for worker in ('worker-1', 'worker-2'):
+            writer = BufferedStagingWriter(bq_client, PROJECT, store, flush_rows=1)
+            writer.write_to_staging([_prediction(f'{worker}_a'), _prediction(f'{worker}_b')], 'batch-1', worker)
+
+    def test_single_load_and_single_source_merge(self, bq_client, store):
+        self._write_two_workers(bq_client, store)
+        loaded_table = f'{PROJECT}.nba_predictions._staging_batch_1_buffered'
+        bq_client.list_tables.return_value = [SimpleNamespace(table_id='_staging_batch_1_buffered')]
+        bq_client.query.return_value = MagicMock(num_dml_affected_rows=4)
+
+        consolidator = BatchConsolidator(bq_client, PROJECT, staging_store=store)
+        consolidator._check_for_duplicates = MagicMock(return_value=0)
+        result = consolidator.consolidate_batch('batch-1', '2026-10-16', use_lock=False)
+
+        assert result.success
+        assert result.staging_tables_merged == 1
+        bq_client.load_table_from_file.assert_called_once()
+        payload, table_id = bq_client.load_table_from_file.call_args.args
+        assert table_id == loaded_table
+        assert len(payload.getvalue().decode().splitlines()) == 4
+
+        merge_sql = bq_client.query.call_args_list[0].args[0]
+        assert merge_sql.count('UNION ALL') == 0
+        assert loaded_table in merge_sql
+
+        # Objects are removed along with the staging table
+        bq_client.delete_table.assert_called_once_with(loaded_table, not_found_ok=True)
+        assert store.list('nba_predictions/batch_1/') == []
+
+    def test_no_store_keeps_table_staging(self, bq_client):
+        bq_client.list_tables.return_value = []
+        consolidator = BatchConsolidator(bq_client, PROJECT)
+        result = consolidator.consolidate_batch('batch-1', '2026-10-16', use_lock=False)
+        assert result.success
+        assert result.staging_tables_merged == 0
+        bq_client.load_table_from_file.assert_not_called()
+
+
+class TestGetStagingStore:
+
+    def test_unset_disables_buffering(self, monkeypatch):
+        monkeypatch.delenv('STAGING_BUFFER_URI', raising=False)
+        assert get_staging_store() is None
+
+    def test_local_paths(self, tmp_path):
+        assert isinstance(get_staging_store(f'file://{tmp_path}'), LocalStagingStore)
+        assert get_staging_store(str(tmp_path)).root == str(tmp_path)
+
+    def test_gcs_object_keys(self):
+        gcs = GCSStagingStore('bucket', 'staging/predictions', storage_client=MagicMock())
+        assert gcs._key('nba_predictions/b/x.json') == 'staging/predictions/nba_predictions/b/x.json'
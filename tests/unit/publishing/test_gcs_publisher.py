@@ -0,0 +1,213 @@
+"""
+Unit Tests for GCSPublisher
+
+Tests cover:
+1. Compact / gzip serialization to a local bucket stand-in
+2. Manifest-based skip of unchanged payloads (and TTL expiry)
+3. Queued uploads with flush()
+4. Per-exporter stats
+5. BaseExporter integration (upload_to_gcs / queue_upload)
+"""
+
+import gzip
+import json
+import time
+
+import pytest
+from unittest.mock import patch
+
+from data_processors.publishing.gcs_publisher import (
+    GCSPublisher,
+    LocalStorageClient,
+    PublishManifest,
+)
+
+
+def _make_publisher(tmp_path, manifest=True, **kwargs):
+    client = LocalStorageClient(str(tmp_path / 'gcs'))
+    bucket = client.bucket('test-bucket')
+
+    def writer(object_path, data, cache_control, content_encoding):
+        blob = bucket.blob(object_path)
+        blob.cache_control = cache_control
+        blob.content_encoding = content_encoding
+        blob.upload_from_string(data, content_type='application/json')
+
+    manifest_obj = PublishManifest(str(tmp_path / 'manifest.json')) if manifest else None
+    publisher = GCSPublisher(writer, 'test-bucket', name='TestExporter', manifest=manifest_obj, **kwargs)
+    return publisher, bucket
+
+
+class TestSerialization:
+    """Test suite for payload serialization"""
+
+    def test_publish_writes_compact_json(self, tmp_path):
+        publisher, bucket = _make_publisher(tmp_path)
+
+        path = publisher.publish({'a': 1, 'b': [1, 2]}, 'v1/x.json', 'public, max-age=60')
+
+        assert path == 'gs://test-bucket/v1/x.json'
+        blob = bucket.blob('v1/x.json')
+        assert blob.download_as_text() == '{"a":1,"b":[1,2]}'
+        assert blob.cache_control == 'public, max-age=60'
+
+    def test_publish_indented_when_not_compact(self, tmp_path):
+        publisher, bucket = _make_publisher(tmp_path, compact=False)
+
+        publisher.publish({'a': 1}, 'v1/x.json')
+
+        assert bucket.blob('v1/x.json').download_as_text() == '{\n  "a": 1\n}'
+
+    def test_gzip_content_encoding(self, tmp_path):
+        publisher, bucket = _make_publisher(tmp_path, gzip_enabled=True)
+
+        publisher.publish({'a': 'b' * 500}, 'v1/x.json')
+
+        blob = bucket.blob('v1/x.json')
+        raw = blob.download_as_bytes()
+        assert gzip.decompress(raw) == json.dumps({'a': 'b' * 500}, separators=(',', ':')).encode()
+        assert json.loads(blob.download_as_text()) == {'a': 'b' * 500}
+        assert blob.content_encoding == 'gzip'
+        assert publisher.stats.bytes_uploaded == len(raw)
+
+
+class TestUnchangedSkip:
+    """Test suite for manifest-based skipping"""
+
+    def test_unchanged_payload_skipped(self, tmp_path):
+        publisher, _ = _make_publisher(tmp_path)
+
+        publisher.publish({'a': 1, 'generated_at': 't1'}, 'v1/x.json')
+        publisher.publish({'a': 1, 'generated_at': 't2'}, 'v1/x.json')
+
+        assert publisher.stats.uploads == 1
+        assert publisher.stats.skipped == 1
+        assert publisher.stats.skip_rate == 0.5
+
+    def test_changed_payload_or_cache_control_uploaded(self, tmp_path):
+        publisher, bucket = _make_publisher(tmp_path)
+
+        publisher.publish({'a': 1}, 'v1/x.json')
+        publisher.publish({'a': 2}, 'v1/x.json')
+        publisher.publish({'a': 2}, 'v1/x.json', 'public, max-age=60')
+
+        assert publisher.stats.uploads == 3
+        assert json.loads(bucket.blob('v1/x.json').download_as_text()) == {'a': 2}
+
+    def test_manifest_persists_across_publishers(self, tmp_path):
+        first, _ = _make_publisher(tmp_path)
+        first.submit({'a': 1}, 'v1/x.json')
+        first.flush()
+
+        second, _ = _make_publisher(tmp_path)
+        second.publish({'a': 1}, 'v1/x.json')
+
+        assert second.stats.skipped == 1
+        assert second.stats.uploads == 0
+
+    def test_manifest_entry_expires(self, tmp_path):
+        publisher, _ = _make_publisher(tmp_path)
+        publisher.manifest.ttl_seconds = 0.01
+
+        publisher.publish({'a': 1}, 'v1/x.json')
+        time.sleep(0.02)
+        publisher.publish({'a': 1}, 'v1/x.json')
+
+        assert publisher.stats.uploads == 2
+
+    def test_no_manifest_always_uploads(self, tmp_path):
+        publisher, _ = _make_publisher(tmp_path, manifest=False)
+
+        publisher.publish({'a': 1}, 'v1/x.json')
+        publisher.publish({'a': 1}, 'v1/x.json')
+
+        assert publisher.stats.uploads == 2
+        assert publisher.is_unchanged({'a': 1}, 'v1/x.json') is False
+
+
+class TestQueuedUploads:
+    """Test suite for submit()/flush()"""
+
+    def test_flush_returns_paths_in_order(self, tmp_path):
+        publisher, bucket = _make_publisher(tmp_path, max_workers=4)
+
+        for i in range(20):
+            publisher.submit({'i': i}, f'v1/p/{i}.json')
+        paths = publisher.flush()
+
+        assert paths == [f'gs://test-bucket/v1/p/{i}.json' for i in range(20)]
+        assert json.loads(bucket.blob('v1/p/7.json').download_as_text()) == {'i': 7}
+        assert publisher.stats.uploads == 20
+
+    def test_flush_raises_first_error_after_all_complete(self, tmp_path):
+        written = []
+
+        def writer(object_path, data, cache_control, content_encoding):
+            if object_path.endswith('3.json'):
+                raise IOError('boom')
+            written.append(object_path)
+
+        publisher = GCSPublisher(writer, 'test-bucket', max_workers=2)
+        for i in range(6):
+            publisher.submit({'i': i}, f'v1/{i}.json')
+
+        with pytest.raises(IOError):
+            publisher.flush()
+
+        assert len(written) == 5
+        assert publisher.stats.failures == 1
+
+    def test_failed_upload_not_recorded_in_manifest(self, tmp_path):
+        calls = []
+
+        def writer(object_path, data, cache_control, content_encoding):
+            calls.append(object_path)
+            if len(calls) == 1:
+                raise IOError('transient')
+
+        publisher = GCSPublisher(writer, 'test-bucket', manifest=PublishManifest())
+
+        with pytest.raises(IOError):
+            publisher.publish({'a': 1}, 'v1/x.json')
+        publisher.publish({'a': 1}, 'v1/x.json')
+
+        assert len(calls) == 2
+
+
+class TestExporterIntegration:
+    """Test suite for BaseExporter routing through the publisher"""
+
+    def _make_exporter(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('PUBLISH_MANIFEST_PATH', str(tmp_path / 'exporter_manifest.json'))
+        with patch('google.cloud.bigquery.Client'):
+            with patch('data_processors.publishing.base_exporter.storage.Client'):
+                from data_processors.publishing.tonight_player_exporter import TonightPlayerExporter
+                exporter = TonightPlayerExporter(bucket_name='api-bucket')
+        exporter.gcs_client = LocalStorageClient(str(tmp_path / 'gcs'))
+        exporter._upload_blob_with_retry = lambda blob, data, cache_control, content_encoding=None: (
+            setattr(blob, 'cache_control', cache_control),
+            setattr(blob, 'content_encoding', content_encoding),
+            blob.upload_from_string(data, content_type='application/json'),
+        )
+        return exporter
+
+    def test_upload_to_gcs_writes_versioned_path(self, tmp_path, monkeypatch):
+        exporter = self._make_exporter(tmp_path, monkeypatch)
+
+        path = exporter.upload_to_gcs({'a': 1}, 'tonight/x.json', 'public, max-age=300')
+
+        assert path == 'gs://api-bucket/v1/tonight/x.json'
+        blob = exporter.gcs_client.bucket('api-bucket').blob('v1/tonight/x.json')
+        assert json.loads(blob.download_as_text()) == {'a': 1}
+
+    def test_queue_upload_and_stats(self, tmp_path, monkeypatch):
+        exporter = self._make_exporter(tmp_path, monkeypatch)
+
+        exporter.queue_upload({'a': 1}, 'x.json')
+        exporter.queue_upload({'a': 1}, 'y.json')
+        exporter.flush_uploads()
+        exporter.upload_to_gcs({'a': 1}, 'x.json')
+
+        stats = exporter.publish_stats()
+        assert stats['uploads'] == 2
+        assert stats['skipped'] == 1
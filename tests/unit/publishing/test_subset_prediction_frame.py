@@ -0,0 +1,201 @@
+"""
+Unit Tests for DatePredictionFrame
+
+Tests cover:
+1. Per-model row selection and composite ordering
+2. Vectorized subset filters match SubsetMaterializer._filter_picks_for_subset
+3. Cross-model rows
+4. SubsetMaterializer single-scan path
+"""
+
+import copy
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from data_processors.publishing.subset_prediction_frame import DatePredictionFrame
+
+
+def _row(system_id, player, edge, confidence, recommendation='OVER', quality=90.0,
+         alert='green', line=20.5, team='LAL', current=True, family=True):
+    if line is None:
+        # ABS(predicted - NULL) is NULL in the scan
+        predicted, edge, signed_edge, composite = 25.0, None, None, None
+    else:
+        predicted = line + edge if recommendation == 'OVER' else line - edge
+        signed_edge, composite = predicted - line, edge * 10 + confidence * 0.5
+    return {
+        'system_id': system_id,
+        'prediction_id': f'{system_id}_{player}',
+        'game_id': f'20260101_LAL_{player}',
+        'player_lookup': player,
+        'player_name': player.title(),
+        'team': team,
+        'opponent': 'BOS',
+        'predicted_points': predicted,
+        'current_points_line': line,
+        'recommendation': recommendation,
+        'confidence_score': confidence,
+        'edge': edge,
+        'composite_score': composite,
+        'feature_quality_score': quality,
+        'default_feature_count': 0,
+        'line_source': 'ACTUAL_PROP',
+        'prediction_run_mode': 'OVERNIGHT',
+        'prediction_made_before_game': True,
+        'quality_alert_level': alert,
+        'line_value': line,
+        'signed_edge': signed_edge,
+        'is_current_version': current,
+        'in_model_family': family,
+    }
+
+
+@pytest.fixture
+def rows():
+    return [
+        _row('catboost_v9', 'a', 1.0, 60),
+        _row('catboost_v9', 'b', 6.0, 80),
+        _row('catboost_v9', 'c', 3.5, 70, recommendation='UNDER'),
+        _row('catboost_v9', 'd', 5.0, 90, alert='red'),
+        _row('catboost_v9', 'e', 8.0, 85, quality=50.0),
+        _row('catboost_v9', 'f', 9.0, 85, line=None),
+        _row('catboost_v9', 'g', 9.0, 85, team=None),
+        _row('catboost_v9', 'h', 9.0, 85, current=False),
+        _row('catboost_v12', 'a', 4.0, 75),
+        _row('catboost_v12', 'b', 2.0, 65, recommendation='UNDER'),
+        _row('experimental_x', 'a', 7.0, 99, family=False),
+    ]
+
+
+def _materializer():
+    with patch('data_processors.publishing.subset_materializer.get_bigquery_client'):
+        from data_processors.publishing.subset_materializer import SubsetMaterializer
+        return SubsetMaterializer(project_id='test-project')
+
+
+def _legacy_predictions(rows, system_id, min_quality):
+    """What _query_all_predictions returns for the same rows."""
+    selected = [
+        r for r in rows
+        if r['system_id'] == system_id
+        and r['current_points_line'] is not None
+        and r['team'] is not None
+        and r['is_current_version']
+        and r['feature_quality_score'] >= min_quality
+    ]
+    return sorted(selected, key=lambda r: -r['composite_score'])
+
+
+class TestModelIndices:
+    """Test suite for per-model row selection"""
+
+    def test_matches_per_model_query(self, rows):
+        frame = DatePredictionFrame('2026-01-01', rows)
+
+        for min_quality in (85, 0):
+            indices = frame.model_indices('catboost_v9', min_quality)
+            assert [rows[i] for i in indices] == _legacy_predictions(rows, 'catboost_v9', min_quality)
+
+    def test_system_ids(self, rows):
+        frame = DatePredictionFrame('2026-01-01', rows)
+
+        assert frame.system_ids == ['catboost_v12', 'catboost_v9', 'experimental_x']
+
+    def test_empty_frame(self):
+        frame = DatePredictionFrame('2026-01-01', [])
+
+        assert frame.system_ids == []
+        assert len(frame.model_indices('catboost_v9', 85)) == 0
+        assert frame.cross_model_predictions() == []
+
+
+class TestSubsetIndices:
+    """Test suite for vectorized subset filters"""
+
+    SUBSETS = [
+        {'subset_id': 'top_3', 'top_n': 3},
+        {'subset_id': 'edge_3', 'min_edge': 3.0},
+        {'subset_id': 'over_conf', 'min_edge': 2.0, 'min_confidence': 75, 'direction': 'OVER'},
+        {'subset_id': 'under', 'direction': 'UNDER'},
+        {'subset_id': 'ready', 'require_quality_ready': True, 'top_n': 2},
+        {'subset_id': 'green_only', 'signal_condition': 'GREEN'},
+        {'subset_id': 'green_or_yellow', 'signal_condition': 'GREEN_OR_YELLOW'},
+        {'subset_id': 'pct_band', 'pct_over_min': 30, 'pct_over_max': 40},
+    ]
+
+    @pytest.mark.parametrize('daily_signal', [
+        None,
+        {'daily_signal': 'GREEN', 'pct_over': 35.0},
+        {'daily_signal': 'YELLOW', 'pct_over': 45.0},
+        {'daily_signal': 'RED', 'pct_over': 20.0},
+    ])
+    def test_matches_filter_picks_for_subset(self, rows, daily_signal):
+        frame = DatePredictionFrame('2026-01-01', rows)
+        materializer = _materializer()
+        candidates = frame.model_indices('catboost_v9', 0)
+        legacy = _legacy_predictions(rows, 'catboost_v9', 0)
+
+        for subset in self.SUBSETS:
+            expected = materializer._filter_picks_for_subset(
+                copy.deepcopy(legacy), subset, daily_signal
+            )
+            selected = frame.subset_indices(candidates, subset, daily_signal)
+            assert [rows[i]['prediction_id'] for i in selected] == \
+                [p['prediction_id'] for p in expected], subset['subset_id']
+
+
+class TestCrossModelPredictions:
+    """Test suite for the cross-model row shape"""
+
+    def test_family_rows_with_signed_edge(self, rows):
+        frame = DatePredictionFrame('2026-01-01', rows)
+
+        preds = frame.cross_model_predictions()
+
+        assert len(preds) == len(rows) - 1
+        assert all(p['system_id'] != 'experimental_x' for p in preds)
+        under = next(p for p in preds if p['system_id'] == 'catboost_v12' and p['player_lookup'] == 'b')
+        assert under['edge'] == pytest.approx(-2.0)
+        assert set(under) == {
+            'player_lookup', 'game_id', 'system_id', 'predicted_points',
+            'line_value', 'recommendation', 'edge', 'confidence_score',
+        }
+
+
+class TestMaterializeWithFrame:
+    """Test suite for SubsetMaterializer.materialize single-scan path"""
+
+    def test_frame_and_per_model_paths_write_same_rows(self, rows):
+        subsets = [
+            {'subset_id': 'v9_top_3', 'system_id': 'catboost_v9', 'top_n': 3},
+            {'subset_id': 'v9_all_predictions', 'system_id': 'catboost_v9'},
+            {'subset_id': 'v12_edge_3', 'system_id': 'catboost_v12', 'min_edge': 3.0},
+        ]
+        daily_signal = {'daily_signal': 'GREEN', 'pct_over': 35.0}
+
+        def run(frame):
+            materializer = _materializer()
+            materializer._query_subset_definitions = MagicMock(return_value=copy.deepcopy(subsets))
+            materializer._query_daily_signal = MagicMock(return_value=daily_signal)
+            materializer._query_all_predictions = MagicMock(
+                side_effect=lambda game_date, system_id, min_quality=85:
+                    copy.deepcopy(_legacy_predictions(rows, system_id, min_quality))
+            )
+            materializer._write_rows = MagicMock()
+            result = materializer.materialize(
+                '2026-01-01', active_system_ids=['catboost_v9', 'catboost_v12'],
+                prediction_frame=frame,
+            )
+            written = materializer._write_rows.call_args[0][0]
+            return result, materializer._query_all_predictions.call_count, written
+
+        with patch.dict('os.environ', {'SUBSET_SCAN_MODE': 'per_model'}):
+            legacy_result, legacy_queries, legacy_rows = run(None)
+        frame_result, frame_queries, frame_rows = run(DatePredictionFrame('2026-01-01', rows))
+
+        assert legacy_queries == 3
+        assert frame_queries == 0
+        assert frame_result['subsets'] == legacy_result['subsets']
+        strip = lambda r: {k: v for k, v in r.items() if k not in ('computed_at', 'version_id')}
+        assert [strip(r) for r in frame_rows] == [strip(r) for r in legacy_rows]
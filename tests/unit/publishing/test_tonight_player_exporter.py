@@ -670,3 +670,227 @@ class TestSafeFloat:
         from data_processors.publishing.exporter_utils import safe_float
 
         assert safe_float(float('nan')) is None
+
+
+def _done(result=None, error=None):
+    """Completed future standing in for a queued upload"""
+    from concurrent.futures import Future
+    future = Future()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return future
+
+
+class TestBatchExport:
+    """Test suite for whole-date batch generation"""
+
+    CONTEXT_ROW = {
+        'player_lookup': 'lebronjames',
+        'player_full_name': 'LeBron James',
+        'game_id': '20250115_LAL_GSW',
+        'team_abbr': 'LAL',
+        'opponent_team_abbr': 'GSW',
+        'home_game': False,
+        'days_rest': None,
+        'back_to_back': True,
+        'opening_points_line': 26.5,
+        'current_points_line': 25.5,
+        'line_movement': -1.0,
+        'injury_status': None,
+        'injury_reason': None,
+    }
+    PREDICTION_ROW = {
+        'predicted_points': 28.1, 'confidence_score': 72, 'recommendation': 'OVER',
+        'current_points_line': 25.5, 'line_margin': 2.6, 'pace_adjustment': 0.4,
+        'similar_games_count': 12,
+    }
+    FATIGUE_ROW = {'fatigue_score': 70, 'fatigue_context_json': '{"days_rest": 1}'}
+    FORM_ROWS = [
+        {'game_date': '2025-01-14', 'game_id': '20250114_LAL_SAC', 'opponent_team_abbr': 'SAC',
+         'team_abbr': 'LAL', 'points': 31, 'minutes_played': 36.0, 'fg_makes': 12, 'fg_attempts': 22,
+         'three_pt_makes': 3, 'three_pt_attempts': 7, 'ft_makes': 4, 'ft_attempts': 5,
+         'over_under_result': 'OVER', 'points_line': 25.5, 'is_dnp': False},
+        {'game_date': '2025-01-12', 'game_id': '20250112_GSW_LAL', 'opponent_team_abbr': 'GSW',
+         'team_abbr': 'LAL', 'points': None, 'minutes_played': None, 'fg_makes': None, 'fg_attempts': None,
+         'three_pt_makes': None, 'three_pt_attempts': None, 'ft_makes': None, 'ft_attempts': None,
+         'over_under_result': None, 'points_line': 24.5, 'is_dnp': True},
+    ]
+    QUICK_ROW = {
+        'season_ppg': 25.2, 'season_mpg': 34.8, 'games_played': 38,
+        'last_10_ppg': 27.4, 'last_10_mpg': 35.1, 'last_5_ppg': 29.0, 'last_5_mpg': 36.0,
+    }
+    BASE_SPLITS = {
+        'home_ppg': 24.0, 'home_games': 19, 'home_vs_line_pct': 0.5,
+        'away_ppg': 26.4, 'away_games': 19, 'away_vs_line_pct': 0.55,
+        'b2b_ppg': 21.0, 'b2b_games': 6, 'b2b_vs_line_pct': 0.333, 'non_b2b_ppg': 26.0,
+        'rested_ppg': 26.1, 'rested_games': 30, 'rested_vs_line_pct': 0.6,
+    }
+    VS_GSW = {'vs_opponent_ppg': 30.5, 'vs_opponent_games': 2, 'vs_opponent_vs_line_pct': 1.0}
+    DEFENSE_ROW = {
+        'team_abbr': 'GSW', 'opponent_points_per_game': 108.04,
+        'defensive_rating_last_15': 110.2, 'rank_ppg': 4, 'tier_label': 'elite',
+    }
+
+    def _make_exporter(self):
+        from data_processors.publishing.tonight_player_exporter import TonightPlayerExporter
+        exporter = TonightPlayerExporter()
+        exporter.get_generated_at = Mock(return_value='2025-01-15T12:00:00+00:00')
+        return exporter
+
+    def _per_player_rows(self, query, params):
+        if 'upcoming_player_game_context' in query:
+            return [dict(self.CONTEXT_ROW)]
+        if 'player_prop_predictions' in query:
+            return [dict(self.PREDICTION_ROW)]
+        if 'player_composite_factors' in query:
+            return [dict(self.FATIGUE_ROW)]
+        if 'last_10' in query:
+            return [dict(self.QUICK_ROW)]
+        if 'home_ppg' in query:
+            return [{**self.BASE_SPLITS, **self.VS_GSW}]
+        if 'team_defense_zone_analysis' in query:
+            return [dict(self.DEFENSE_ROW)]
+        if 'player_game_summary' in query:
+            return [dict(r) for r in self.FORM_ROWS]
+        raise AssertionError(f"Unexpected query: {query}")
+
+    def _batch_data(self, exporter):
+        lookup = 'lebronjames'
+        exporter._query_batch_game_context = Mock(return_value=[dict(self.CONTEXT_ROW)])
+        exporter._query_batch_predictions = Mock(return_value=[{'player_lookup': lookup, **self.PREDICTION_ROW}])
+        exporter._query_batch_fatigue = Mock(return_value=[{'player_lookup': lookup, **self.FATIGUE_ROW}])
+        exporter._query_batch_recent_form = Mock(
+            return_value=[{'player_lookup': lookup, **r} for r in self.FORM_ROWS]
+        )
+        exporter._query_batch_quick_numbers = Mock(return_value=[{'player_lookup': lookup, **self.QUICK_ROW}])
+        exporter._query_batch_relevant_splits = Mock(return_value=[{
+            'player_lookup': lookup, **self.BASE_SPLITS,
+            'by_opponent': [{'opponent': 'GSW', **self.VS_GSW}, {'opponent': 'SAC', 'vs_opponent_ppg': 20.0,
+                                                                 'vs_opponent_games': 1, 'vs_opponent_vs_line_pct': 0.0}],
+        }])
+        exporter._query_batch_defense_tiers = Mock(return_value=[
+            dict(self.DEFENSE_ROW),
+            {'team_abbr': 'SAC', 'opponent_points_per_game': 118.0,
+             'defensive_rating_last_15': 117.0, 'rank_ppg': 28, 'tier_label': 'weak'},
+        ])
+        return exporter._query_date_batch('2025-01-15', [lookup])
+
+    def test_batch_json_identical_to_per_player(self):
+        """Test that batch assembly produces the same JSON as per-player queries"""
+        with patch('google.cloud.bigquery.Client'):
+            with patch('data_processors.publishing.base_exporter.storage.Client'):
+                exporter = self._make_exporter()
+                exporter.query_to_list = Mock(side_effect=self._per_player_rows)
+                expected = exporter.generate_json('lebronjames', '2025-01-15')
+
+                batch = self._batch_data(exporter)
+                result = exporter.generate_json_from_batch('lebronjames', '2025-01-15', batch)
+
+                assert result == expected
+                assert len(result['tonights_factors']) > 0
+
+    def test_batch_assembly_does_not_mutate_indexes(self):
+        """Test that assembling a player leaves shared batch rows untouched"""
+        with patch('google.cloud.bigquery.Client'):
+            with patch('data_processors.publishing.base_exporter.storage.Client'):
+                exporter = self._make_exporter()
+                batch = self._batch_data(exporter)
+
+                first = exporter.generate_json_from_batch('lebronjames', '2025-01-15', batch)
+                second = exporter.generate_json_from_batch('lebronjames', '2025-01-15', batch)
+
+                assert first == second
+                assert batch['game_context']['lebronjames']['days_rest'] is None
+
+    def test_batch_missing_player_returns_empty_response(self):
+        """Test that a player absent from the context index gets the empty response"""
+        with patch('google.cloud.bigquery.Client'):
+            with patch('data_processors.publishing.base_exporter.storage.Client'):
+                exporter = self._make_exporter()
+                batch = self._batch_data(exporter)
+
+                result = exporter.generate_json_from_batch('unknownplayer', '2025-01-15', batch)
+
+                assert result['game_context'] is None
+                assert result['prediction'] is None
+
+    def test_lookup_splits_without_opponent_history(self):
+        """Test vs-opponent split defaults when the player never faced tonight's opponent"""
+        from data_processors.publishing.tonight_player_exporter import TonightPlayerExporter
+        index = {'p1': {'player_lookup': 'p1', 'home_ppg': 20.0, 'by_opponent': {}}}
+
+        splits = TonightPlayerExporter._lookup_splits(index, 'p1', 'BOS')
+
+        assert splits['home_ppg'] == 20.0
+        assert splits['vs_opponent_ppg'] is None
+        assert splits['vs_opponent_games'] == 0
+        assert splits['vs_opponent_vs_line_pct'] is None
+        assert 'by_opponent' not in splits
+
+    def test_export_all_runs_one_query_per_source(self):
+        """Test that export_all_for_date issues a fixed number of queries in batch mode"""
+        with patch('google.cloud.bigquery.Client'):
+            with patch('data_processors.publishing.base_exporter.storage.Client'):
+                exporter = self._make_exporter()
+                players = [{'player_lookup': f'player{i}'} for i in range(25)]
+
+                def rows(query, params=None):
+                    if 'SELECT DISTINCT player_lookup' in query:
+                        return players
+                    return []
+
+                exporter.query_to_list = Mock(side_effect=rows)
+                exporter.queue_upload = Mock(side_effect=lambda data, path, cache: _done(f'gs://b/{path}'))
+                exporter.flush_uploads = Mock(return_value=[])
+
+                paths = exporter.export_all_for_date('2025-01-15', update_latest=True)
+
+                assert exporter.query_to_list.call_count == 8  # player list + 7 sources
+                assert len(paths) == 25
+                assert paths[0] == 'gs://b/tonight/player/2025-01-15/player0.json'
+                assert exporter.queue_upload.call_count == 50
+                exporter.flush_uploads.assert_called_once()
+
+    def test_export_all_falls_back_when_batch_fails(self):
+        """Test that a failed batch prefetch falls back to per-player export"""
+        with patch('google.cloud.bigquery.Client'):
+            with patch('data_processors.publishing.base_exporter.storage.Client'):
+                exporter = self._make_exporter()
+                exporter.query_to_list = Mock(return_value=[{'player_lookup': 'p1'}, {'player_lookup': 'p2'}])
+                exporter._query_date_batch = Mock(side_effect=RuntimeError('quota exceeded'))
+                exporter.generate_json = Mock(side_effect=lambda p, d: {'player_lookup': p})
+                exporter.queue_upload = Mock(side_effect=lambda data, path, cache: _done(f'gs://b/{path}'))
+                exporter.flush_uploads = Mock(return_value=[])
+
+                paths = exporter.export_all_for_date('2025-01-15', update_latest=False)
+
+                assert paths == [
+                    'gs://b/tonight/player/2025-01-15/p1.json',
+                    'gs://b/tonight/player/2025-01-15/p2.json',
+                ]
+                assert exporter.generate_json.call_count == 2
+
+    def test_export_all_counts_failed_uploads(self):
+        """Test that a failed upload is reported as a player failure"""
+        with patch('google.cloud.bigquery.Client'):
+            with patch('data_processors.publishing.base_exporter.storage.Client'):
+                exporter = self._make_exporter()
+                players = [{'player_lookup': f'p{i}'} for i in range(10)]
+                exporter.query_to_list = Mock(return_value=players)
+                exporter._query_date_batch = Mock(side_effect=RuntimeError('quota exceeded'))
+                exporter.generate_json = Mock(side_effect=lambda p, d: {'player_lookup': p})
+                exporter.flush_uploads = Mock(return_value=[])
+
+                def upload(data, path, cache):
+                    if path.endswith('p3.json'):
+                        return _done(error=IOError('503'))
+                    return _done(f'gs://b/{path}')
+
+                exporter.queue_upload = Mock(side_effect=upload)
+
+                paths = exporter.export_all_for_date('2025-01-15', update_latest=False)
+
+                assert len(paths) == 9
+                assert not any(p.endswith('/p3.json') for p in paths)
@@ -0,0 +1,165 @@
+"""
+Unit Tests for local-first proxy health
+
+Tests cover:
+1. Circuit transitions (CLOSED -> OPEN -> HALF_OPEN -> CLOSED) are in-memory,
+   driven by a fake clock, with no backend call inside the sync interval
+2. Reconcile pushes local changes, adopts newer remote state, keeps local
+   changes made after the last push, and re-queues a failed push
+3. Proxy telemetry is queued on the batch writer (sync mode inserts directly)
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scrapers.utils.proxy_utils import (
+    CIRCUIT_COOLDOWN_MINUTES,
+    CircuitState,
+    CircuitStateBackend,
+    CircuitStatus,
+    ProxyCircuitBreaker,
+    ProxyHealthStore,
+)
+
+HOST = 'api.bettingpros.com'
+T0 = datetime(2026, 2, 13, 18, 0, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = T0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs)
+
+
+class FakeBackend(CircuitStateBackend):
+    def __init__(self, rows=()):
+        self.rows = {(s.proxy_provider, s.target_host): s for s in rows}
+        self.loads = 0
+        self.saved = []
+        self.fail = False
+
+    def load_all(self):
+        self.loads += 1
+        if self.fail:
+            raise RuntimeError('backend unavailable')
+        return list(self.rows.values())
+
+    def save(self, statuses):
+        if self.fail:
+            raise RuntimeError('backend unavailable')
+        for status in statuses:
+            self.saved.append((status.proxy_provider, status.state))
+            self.rows[(status.proxy_provider, status.target_host)] = status
+
+
+def _status(provider, state, at, failures=0):
+    return CircuitStatus(provider, HOST, state, failures, at, None, at if state == CircuitState.OPEN else None)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _breaker(backend, clock, sync_seconds=60):
+    store = ProxyHealthStore(backend=backend, sync_interval_seconds=sync_seconds, clock=clock, background=False)
+    return ProxyCircuitBreaker(store=store)
+
+
+class TestLocalCircuit:
+
+    def test_transitions_stay_in_memory(self, clock):
+        backend = FakeBackend()
+        breaker = _breaker(backend, clock, sync_seconds=3600)
+
+        for _ in range(3):
+            breaker.record_failure('proxyfuel', HOST)
+        assert breaker.should_skip_proxy('proxyfuel', HOST)
+
+        clock.advance(minutes=CIRCUIT_COOLDOWN_MINUTES)
+        assert breaker.get_circuit_state('proxyfuel', HOST) == CircuitState.HALF_OPEN
+        breaker.record_success('proxyfuel', HOST)
+        assert breaker.get_circuit_state('proxyfuel', HOST) == CircuitState.CLOSED
+
+        # Only the initial load reached the backend; changes wait for the next sync
+        assert backend.loads == 1
+        assert backend.saved == []
+        assert breaker.store.pending() == 1
+
+    def test_breakers_share_the_store(self, clock):
+        store = ProxyHealthStore(clock=clock)
+        for _ in range(3):
+            ProxyCircuitBreaker(store=store).record_failure('decodo', HOST)
+
+        assert ProxyCircuitBreaker(store=store).should_skip_proxy('decodo', HOST)
+
+
+class TestReconcile:
+
+    def test_initial_load_adopts_shared_state(self, clock):
+        backend = FakeBackend([_status('decodo', CircuitState.OPEN, T0, failures=3)])
+        assert _breaker(backend, clock).should_skip_proxy('decodo', HOST)
+
+    def test_push_and_adopt_on_interval(self, clock):
+        backend = FakeBackend()
+        breaker = _breaker(backend, clock)
+        breaker.record_failure('proxyfuel', HOST)
+
+        # Another instance opens decodo
+        backend.rows[('decodo', HOST)] = _status('decodo', CircuitState.OPEN, T0 + timedelta(seconds=30), 3)
+        clock.advance(seconds=61)
+
+        assert breaker.should_skip_proxy('decodo', HOST)
+        assert backend.saved == [('proxyfuel', CircuitState.CLOSED)]
+        assert breaker.store.pending() == 0
+
+    def test_older_remote_state_does_not_override_local(self, clock):
+        backend = FakeBackend([_status('proxyfuel', CircuitState.OPEN, T0 - timedelta(hours=1), 3)])
+        breaker = _breaker(backend, clock)
+        clock.advance(minutes=CIRCUIT_COOLDOWN_MINUTES)
+        breaker.record_success('proxyfuel', HOST)
+
+        backend.fail = True
+        clock.advance(seconds=61)
+        breaker.get_circuit_state('proxyfuel', HOST)
+        assert breaker.store.pending() == 1
+
+        backend.fail = False
+        backend.rows[('proxyfuel', HOST)] = _status('proxyfuel', CircuitState.OPEN, T0 - timedelta(hours=1), 3)
+        clock.advance(seconds=61)
+
+        assert breaker.get_circuit_state('proxyfuel', HOST) == CircuitState.CLOSED
+        assert backend.rows[('proxyfuel', HOST)].state == CircuitState.CLOSED
+
+
+class TestTelemetry:
+
+    def test_log_proxy_result_is_batched(self, monkeypatch):
+        from shared.utils import proxy_health_logger
+
+        monkeypatch.delenv('PROXY_TELEMETRY_MODE', raising=False)
+        writer = MagicMock()
+        with patch('shared.utils.bigquery_batch_writer.get_batch_writer', return_value=writer) as get_writer, \
+                patch('shared.utils.bigquery_utils.insert_bigquery_rows') as insert:
+            assert proxy_health_logger.log_proxy_result('BettingPros', HOST, 403, 120, False, 'forbidden')
+
+        get_writer.assert_called_once()
+        assert get_writer.call_args[0][0] == 'nba_orchestration.proxy_health_metrics'
+        assert writer.add_record.call_args[0][0]['error_type'] == 'forbidden'
+        insert.assert_not_called()
+
+    def test_sync_mode(self, monkeypatch):
+        from shared.utils import proxy_health_logger
+
+        monkeypatch.setenv('PROXY_TELEMETRY_MODE', 'sync')
+        with patch('shared.utils.bigquery_utils.insert_bigquery_rows', return_value=True) as insert:
+            assert proxy_health_logger.log_proxy_result('BettingPros', HOST, 200, 90, True)
+
+        insert.assert_called_once()
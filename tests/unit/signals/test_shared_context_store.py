@@ -0,0 +1,189 @@
+"""
+Unit Tests for incremental SharedContext refreshes
+
+Tests cover:
+1. merge_prediction_delta() replaces changed players across every model and
+   drops players whose predictions were superseded
+2. SharedContextStore tier TTLs, failed fetches not cached, copies in and out
+3. build_shared_context(): a same-day rebuild re-runs only the fingerprint
+   probe when nothing changed, and only the changed players' prediction query
+   after a line update or a late-consolidated batch (rows with an old
+   created_at and no updated_at)
+4. SHARED_CONTEXT_MODE=full re-runs every fetch
+"""
+
+from collections import Counter
+
+import pytest
+
+import ml.signals.per_model_pipeline as pipeline
+from ml.signals.shared_context_store import (
+    CONTEXT_TIERS,
+    PredictionSnapshot,
+    SharedContextStore,
+    changed_players,
+    merge_prediction_delta,
+)
+
+TARGET_DATE = '2026-02-13'
+
+
+def _pred(player, system_id='catboost_v12', line=20.5):
+    return {'player_lookup': player, 'system_id': system_id, 'line_value': line}
+
+
+def _by_model(*preds):
+    grouped = {}
+    for pred in preds:
+        grouped.setdefault(pred['system_id'], []).append(pred)
+    return grouped
+
+
+class TestMergePredictionDelta:
+
+    def test_changed_players_replaced_for_every_model(self):
+        base = PredictionSnapshot(
+            _by_model(_pred('a'), _pred('b'), _pred('c'), _pred('b', 'catboost_v9')),
+            {'a': {'x': 1}, 'b': {'x': 1}, 'c': {'x': 1}},
+            fingerprints={'a': '1', 'b': '1', 'c': '1'},
+        )
+        merged = merge_prediction_delta(
+            base, ['b', 'c'], _by_model(_pred('b', line=22.5)), {'b': {'x': 2}},
+            fingerprints={'a': '1', 'b': '2'},
+        )
+
+        assert merged.predictions_by_model == {
+            'catboost_v12': [_pred('a'), _pred('b', line=22.5)],
+        }
+        assert merged.supplemental_map == {'a': {'x': 1}, 'b': {'x': 2}}
+        assert merged.fingerprints == {'a': '1', 'b': '2'} and merged.built_at == base.built_at
+
+    def test_changed_players(self):
+        assert changed_players({'a': '1', 'b': '1', 'c': '1'}, {'a': '1', 'b': '2', 'd': '1'}) == ['b', 'c', 'd']
+
+
+class TestSharedContextStore:
+
+    def test_tier_ttl_and_failed_values(self, monkeypatch):
+        store = SharedContextStore()
+        store.update(TARGET_DATE, False, {'signal_health': {'s': 1}, 'filter_overrides': {'f'},
+                                          'direction_health': None})
+
+        assert store.fresh_values(TARGET_DATE) == {'signal_health': {'s': 1}, 'filter_overrides': {'f'}}
+
+        monkeypatch.setenv('SHARED_CONTEXT_HOURLY_TTL_SECONDS', '-1')
+        assert store.fresh_values(TARGET_DATE) == {'signal_health': {'s': 1}}
+        assert store.fresh_values(TARGET_DATE, include_disabled=True) == {}
+
+    def test_values_are_copied(self):
+        store = SharedContextStore()
+        health = {'s': {'hr': 60.0}}
+        store.update(TARGET_DATE, False, {'signal_health': health})
+        health['s']['hr'] = 0.0
+        store.fresh_values(TARGET_DATE)['signal_health']['s']['hr'] = 1.0
+
+        assert store.fresh_values(TARGET_DATE)['signal_health'] == {'s': {'hr': 60.0}}
+
+    def test_evicts_old_dates(self):
+        store = SharedContextStore(max_dates=2)
+        for target_date in ('2026-02-11', '2026-02-12', '2026-02-13'):
+            store.update(target_date, False, {'signal_health': {}})
+
+        assert store.fresh_values('2026-02-11') == {}
+        assert len(store) == 2
+
+
+class FakeSource:
+    """Counts context / prediction fetches and serves a mutable prediction table."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.rows = [_pred('a'), _pred('b'), _pred('b', 'catboost_v9')]
+
+    def fetches(self, bq_client, target_date):
+        def make(name):
+            def fetch():
+                self.calls[name] += 1
+                return {
+                    'player_blacklist': ({'x'}, {}),
+                    'player_under_suppression': (set(), {}),
+                    'model_direction_affinity': ({}, set(), {}),
+                    'filter_overrides': set(),
+                }.get(name, {})
+            return fetch
+        return {name: make(name) for name in CONTEXT_TIERS}
+
+    def probe(self, bq_client, target_date):
+        # Stand-in for COUNT(*) / MAX(prediction_id) / MAX(updated_at) per player:
+        # depends only on the rows, not on when they were staged
+        self.calls['prediction_fingerprints'] += 1
+        fingerprints = {}
+        for row in self.rows:
+            fingerprints.setdefault(row['player_lookup'], []).append(repr(sorted(row.items())))
+        return {player: '|'.join(sorted(rows)) for player, rows in fingerprints.items()}
+
+    def predictions(self, bq_client, target_date, include_disabled=False, player_lookups=None):
+        self.calls['predictions'] += 1
+        rows = [dict(r) for r in self.rows if player_lookups is None or r['player_lookup'] in player_lookups]
+        self.calls['prediction_rows'] += len(rows)
+        return _by_model(*rows), {r['player_lookup']: {} for r in rows}
+
+
+@pytest.fixture
+def source(monkeypatch):
+    fake = FakeSource()
+    store = SharedContextStore()
+    monkeypatch.setattr(pipeline, '_context_fetches', fake.fetches)
+    monkeypatch.setattr(pipeline, '_query_prediction_fingerprints', fake.probe)
+    monkeypatch.setattr(pipeline, '_query_all_model_predictions', fake.predictions)
+    monkeypatch.setattr(pipeline, 'get_shared_context_store', lambda: store)
+    return fake
+
+
+class TestBuildSharedContext:
+
+    def test_unchanged_rebuild_is_one_probe(self, source):
+        first = pipeline.build_shared_context(None, TARGET_DATE)
+        first.all_predictions['catboost_v12'][0]['games_vs_opponent'] = 3
+        source.calls.clear()
+
+        second = pipeline.build_shared_context(None, TARGET_DATE)
+
+        assert source.calls == Counter({'prediction_fingerprints': 1})
+        assert second.player_blacklist == {'x'}
+        assert 'games_vs_opponent' not in second.all_predictions['catboost_v12'][0]
+
+    def test_line_update_requeries_changed_players_only(self, source):
+        pipeline.build_shared_context(None, TARGET_DATE)
+        source.calls.clear()
+
+        source.rows = [_pred('a'), _pred('b', line=23.5)]
+        ctx = pipeline.build_shared_context(None, TARGET_DATE)
+
+        assert source.calls['predictions'] == 1 and source.calls['prediction_rows'] == 1
+        assert ctx.all_predictions == {'catboost_v12': [_pred('a'), _pred('b', line=23.5)]}
+
+        source.calls.clear()
+        pipeline.build_shared_context(None, TARGET_DATE)
+        assert source.calls == Counter({'prediction_fingerprints': 1})
+
+    def test_late_consolidated_batch_is_picked_up(self, source):
+        pipeline.build_shared_context(None, TARGET_DATE)
+        source.calls.clear()
+
+        # A batch staged before the last build is consolidated after it: new rows
+        # keep the worker's created_at and have no updated_at
+        source.rows = source.rows + [_pred('c', 'catboost_v9', line=15.5)]
+        ctx = pipeline.build_shared_context(None, TARGET_DATE)
+
+        assert source.calls['prediction_rows'] == 1
+        assert ctx.all_predictions['catboost_v9'] == [_pred('b', 'catboost_v9'), _pred('c', 'catboost_v9', line=15.5)]
+
+    def test_full_mode_refetches_everything(self, source, monkeypatch):
+        monkeypatch.setenv('SHARED_CONTEXT_MODE', 'full')
+        pipeline.build_shared_context(None, TARGET_DATE)
+        pipeline.build_shared_context(None, TARGET_DATE)
+
+        assert source.calls['signal_health'] == 2
+        assert source.calls['predictions'] == 2
+        assert source.calls['prediction_fingerprints'] == 0
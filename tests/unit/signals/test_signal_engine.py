@@ -0,0 +1,244 @@
+"""
+Unit Tests for the vectorized signal engine
+
+Tests cover:
+1. Vectorized evaluation matches the scalar evaluate() loop for the full default
+   registry, including None / NaN / zero / int / missing column values
+2. Rows with uncertain values fall back to evaluate()
+3. evaluate_all_model_signals() splits one stacked pass back into per-model maps
+   with each model's own health injected
+"""
+
+import math
+import random
+from decimal import Decimal
+
+import numpy as np
+
+from ml.signals.base_signal import BaseSignal, SignalFrame, SignalResult
+from ml.signals.per_model_pipeline import (
+    SharedContext,
+    _model_supplementals,
+    _signal_results_by_key,
+    evaluate_all_model_signals,
+)
+from ml.signals.registry import build_default_registry
+from ml.signals.signal_engine import evaluate_signals
+
+# Always populated in production rows
+CORE_KEYS = {
+    'edge': (-12, 12),
+    'line_value': (3, 35),
+    'confidence_score': (50, 95),
+}
+# Enrichment columns -- may be missing, None, NaN, zero or int
+NUMERIC_KEYS = {
+    'rest_days': (0, 6),
+    'implied_team_total': (100, 130),
+    'opponent_pace': (0.5, 104),
+    'points_avg_season': (5, 32),
+    'q4_scoring_ratio': (0.1, 0.6),
+    'minutes_load_7d': (60, 140),
+    'usage_rate_l5': (10, 35),
+    'prop_line_delta': (-4, 4),
+    'blowout_risk': (0, 0.8),
+    'prop_under_streak': (0, 6),
+    'points_std_last_10': (0, 15),
+    'spread_magnitude': (0, 12),
+    'trend_slope': (-2.5, 1),
+    'bp_line_movement': (-1, 0.5),
+    'predicted_game_pace': (95, 106),
+    'self_creation_rate_last_10': (0.2, 0.8),
+    'avg_pts_vs_opp': (5, 35),
+    'games_vs_opp': (0, 8),
+    'dk_line_move_direction': (-4, 4),
+    'minutes_projection_delta': (-6, 6),
+    'rotowire_projected_minutes': (10, 40),
+    'sharp_book_lean': (-3, 3),
+    'projection_sources_total': (0, 4),
+    'projection_sources_above_line': (0, 3),
+    'projection_sources_below_line': (0, 3),
+    'opponent_dvp_rank': (1, 30),
+    'closing_line_value': (-2, 2),
+    'vsin_over_money_pct': (30, 90),
+    'vsin_over_ticket_pct': (20, 95),
+    'vsin_under_money_pct': (30, 90),
+    'vsin_under_ticket_pct': (20, 95),
+    'points_avg_last_5': (5, 35),
+    'points_avg_last_10': (5, 35),
+    'pts_avg_last3': (5, 35),
+    'over_rate_last_10': (0, 1),
+    'prev_game_ratio': (0, 1.5),
+    'prev_game_line': (5, 30),
+    'prev_game_fg_pct': (0.1, 0.7),
+    'current_points_line': (5, 35),
+    'quantile_p25': (5, 30),
+    'quantile_p75': (10, 40),
+    'crew_avg_over_pct': (0.3, 0.6),
+    'games_in_last_7_days': (1, 5),
+    'book_count_current': (2, 10),
+    'books_converging_down': (0, 6),
+    'books_converging_up': (0, 6),
+}
+
+
+# Never NaN: counts are int()ed, current_points_line int()ed by whole_line_precision
+NON_NAN_KEYS = {
+    'games_vs_opp', 'prop_under_streak', 'rest_days', 'current_points_line',
+    'projection_sources_total', 'projection_sources_above_line', 'projection_sources_below_line',
+}
+# Missing rather than NULL when absent (evaluate() compares the default)
+NOT_NULL_KEYS = {
+    'projection_sources_total', 'projection_sources_above_line', 'projection_sources_below_line',
+}
+
+
+def _value(rng, key, low, high):
+    roll = rng.random()
+    if roll < 0.08 and key not in NOT_NULL_KEYS:
+        return None
+    if roll < 0.11 and key not in NON_NAN_KEYS:
+        return math.nan
+    if roll < 0.14:
+        return 0
+    if roll < 0.18:
+        return rng.randint(int(low), int(high))
+    return rng.uniform(low, high)
+
+
+def _predictions(n=600, seed=7):
+    rng = random.Random(seed)
+    predictions = []
+    for i in range(n):
+        pred = {
+            'player_lookup': f'player_{i % 150}',
+            'game_id': f'20260220_G{i % 7}',
+            'recommendation': rng.choice(['OVER', 'UNDER', 'PASS', None]),
+            'is_home': rng.choice([True, False, None, 1, 0]),
+            'opponent_team_abbr': rng.choice(['DEN', 'LAL', 'BOS', None]),
+            'predicted_points': rng.uniform(5, 35),
+            'crew_under_data_available': rng.choice([True, False, None]),
+            'prev_over_1': rng.choice([0, 1, None]),
+            'prev_over_2': rng.choice([0, 1, None]),
+            'prev_over_3': rng.choice([0, 1]),
+            'prev_over_4': rng.choice([0, 1]),
+        }
+        for key, (low, high) in CORE_KEYS.items():
+            pred[key] = rng.choice([0, rng.randint(int(low), int(high)), rng.uniform(low, high)])
+        for key, (low, high) in NUMERIC_KEYS.items():
+            if rng.random() < 0.9:
+                pred[key] = _value(rng, key, low, high)
+        if pred.get('rotowire_projected_minutes') is None:
+            pred['rotowire_projected_minutes'] = 30.0
+        predictions.append(pred)
+    return predictions
+
+
+def _scalar(signals, predictions, supplementals):
+    return [
+        [s.evaluate(p, features=None, supplemental=supp) for s in signals]
+        for p, supp in zip(predictions, supplementals)
+    ]
+
+
+def _assert_same(actual, expected):
+    assert len(actual) == len(expected)
+    for row_actual, row_expected in zip(actual, expected):
+        assert [r.source_tag for r in row_actual] == [r.source_tag for r in row_expected]
+        for a, e in zip(row_actual, row_expected):
+            assert a.qualifies == e.qualifies, a.source_tag
+            if e.qualifies:
+                assert repr(a) == repr(e)
+
+
+class TestEvaluateSignals:
+
+    def test_matches_scalar_for_default_registry(self):
+        signals = build_default_registry().all()
+        predictions = _predictions()
+        supplementals = [{'model_health': {'hit_rate_7d_edge3': 60.0}} for _ in predictions]
+
+        vectorized = evaluate_signals(signals, predictions, supplementals, vectorized=True)
+        scalar = evaluate_signals(signals, predictions, supplementals, vectorized=False)
+
+        _assert_same(vectorized, scalar)
+        _assert_same(vectorized, _scalar(signals, predictions, supplementals))
+        assert any(r.qualifies for row in vectorized for r in row)
+
+    def test_registry_has_vectorized_signals(self):
+        frame = SignalFrame(_predictions(10))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ported = [s.tag for s in build_default_registry().all() if s.vector_mask(frame) is not None]
+        assert 'high_edge' in ported
+        assert len(ported) >= 50
+
+    def test_uncertain_rows_use_evaluate(self):
+        class CountingSignal(BaseSignal):
+            tag = 'counting'
+
+            def __init__(self):
+                self.calls = []
+
+            def evaluate(self, prediction, features=None, supplemental=None):
+                self.calls.append(prediction['id'])
+                x = prediction.get('x') or 0
+                if x > 1:
+                    return SignalResult(True, 1.0, self.tag)
+                return self._no_qualify()
+
+            def vector_mask(self, frame):
+                return frame.num('x') > 1
+
+        signal = CountingSignal()
+        predictions = [
+            {'id': 0, 'x': 2.0},
+            {'id': 1, 'x': 0.5},
+            {'id': 2, 'x': None},
+            {'id': 3, 'x': math.nan},
+            {'id': 4, 'x': Decimal('3')},
+        ]
+        results = evaluate_signals([signal], predictions, [{}] * 5, vectorized=True)
+
+        assert signal.calls == [0, 3, 4]
+        assert [row[0].qualifies for row in results] == [True, False, False, False, True]
+
+    def test_empty_inputs(self):
+        assert evaluate_signals(build_default_registry().all(), [], []) == []
+        assert evaluate_signals([], [{'a': 1}], [{}]) == [[]]
+
+
+class TestEvaluateAllModelSignals:
+
+    def _ctx(self):
+        predictions = _predictions(200)
+        return SharedContext(
+            target_date='2026-02-20',
+            all_predictions={'model_a': predictions[:120], 'model_b': predictions[120:]},
+            supplemental_map={'player_3': {'three_pt_stats': {'three_pct_last_3': 0.5}}},
+            model_health_map={'model_a': 45.0},
+            default_model_health_hr=62.0,
+        )
+
+    def test_per_model_maps_match_scalar(self):
+        ctx = self._ctx()
+        registry = build_default_registry()
+
+        by_model = evaluate_all_model_signals(ctx, registry)
+
+        assert set(by_model) == {'model_a', 'model_b'}
+        for system_id, predictions in ctx.all_predictions.items():
+            supplementals = _model_supplementals(system_id, predictions, ctx)
+            expected = _signal_results_by_key(
+                predictions, _scalar(registry.all(), predictions, supplementals)
+            )
+            assert list(by_model[system_id]) == list(expected)
+            _assert_same(list(by_model[system_id].values()), list(expected.values()))
+            assert all('games_vs_opponent' in p for p in predictions)
+
+    def test_model_health_is_per_model(self):
+        ctx = self._ctx()
+        predictions = ctx.all_predictions['model_b']
+        health = {s['model_health']['hit_rate_7d_edge3'] for s in _model_supplementals('model_b', predictions, ctx)}
+        assert health == {62.0}
+        health = {s['model_health']['hit_rate_7d_edge3'] for s in _model_supplementals('model_a', predictions, ctx)}
+        assert health == {45.0}
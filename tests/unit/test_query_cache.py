@@ -2,7 +2,8 @@
 Unit tests for QueryCache functionality
 
 Tests the in-memory caching layer for BigQuery queries including
-cache hit/miss, TTL expiration, LRU eviction, and thread safety.
+cache hit/miss, TTL expiration, LRU eviction, byte budgets, per-prefix
+metrics, the shared disk tier, and thread safety.
 
 Related: shared/utils/query_cache.py
 """
@@ -11,7 +12,11 @@ import pytest
 import time
 import threading
 from datetime import date, datetime
-from shared.utils.query_cache import QueryCache, CacheEntry, CacheMetrics
+
+import numpy as np
+import pandas as pd
+
+from shared.utils.query_cache import QueryCache, CacheEntry, CacheMetrics, estimate_size
 
 
 class TestCacheEntry:
@@ -451,3 +456,113 @@ class TestQueryCacheThreadSafety:
 
         # Cache should have evicted entries to stay under max_size
         assert len(cache._cache) <= 50
+
+
+class TestQueryCacheMemoryBudget:
+    """Test byte-size-aware capacity."""
+
+    def test_lru_order_without_timestamps(self):
+        """LRU order comes from access order, not clock resolution."""
+        cache = QueryCache(max_size=3)
+        for key in ("key1", "key2", "key3"):
+            cache.set(key, key)
+        cache.get("key1")
+
+        cache.set("key4", "value4")
+
+        assert cache.get("key2") is None
+        assert cache.get("key1") == "key1"
+
+    def test_estimate_size_dataframe_and_rows(self):
+        df = pd.DataFrame({'points': np.arange(1000, dtype=np.float64)})
+        rows = [{'player_lookup': f'player_{i}', 'points': float(i)} for i in range(1000)]
+
+        assert estimate_size(df) >= 8000
+        assert estimate_size(np.zeros(500)) == 4000
+        assert estimate_size(rows) > 100 * estimate_size(rows[:5]) > 0
+
+    def test_max_bytes_evicts_lru(self):
+        frame = pd.DataFrame({'x': np.zeros(1000)})  # ~8KB
+        cache = QueryCache(max_bytes=int(estimate_size(frame) * 2.5))
+
+        cache.set("features:a", frame)
+        cache.set("features:b", frame)
+        cache.get("features:a")
+        cache.set("features:c", frame)
+
+        assert cache.get("features:b") is None
+        assert cache.get("features:a") is not None
+        assert cache.size_bytes <= cache.get_stats()['max_bytes']
+        assert cache.metrics.evictions == 1
+
+    def test_oversized_value_not_kept_in_memory(self):
+        cache = QueryCache(max_bytes=100)
+        cache.set("small", 1)
+        cache.set("big", np.zeros(1000))
+
+        assert cache.get("big") is None
+        assert cache.get("small") == 1
+
+    def test_per_prefix_metrics(self):
+        cache = QueryCache(max_size=1)
+        cache.set("features:a", 1)
+        cache.get("features:a")
+        cache.get("games:b")
+        cache.set("games:b", 2)  # evicts features:a
+
+        by_prefix = cache.get_stats()['by_prefix']
+        assert by_prefix['features']['hits'] == 1
+        assert by_prefix['features']['evictions'] == 1
+        assert by_prefix['games']['misses'] == 1
+
+
+class TestQueryCacheDiskTier:
+    """Test the disk tier shared between processes."""
+
+    def test_second_instance_reads_warm_entry(self, tmp_path):
+        df = pd.DataFrame({'player_lookup': ['a', 'b'], 'points': [21.5, 12.0]})
+        worker_a = QueryCache(disk_dir=str(tmp_path))
+        worker_b = QueryCache(disk_dir=str(tmp_path))
+
+        worker_a.set("features:2026-01-05", df, ttl_seconds=60)
+        result = worker_b.get("features:2026-01-05")
+
+        pd.testing.assert_frame_equal(result, df)
+        result.loc[0, 'points'] = 30.0  # promoted frames stay writable
+        assert worker_b.metrics.disk_hits == 1
+        assert worker_b.size == 1
+
+    def test_expired_disk_entry_is_a_miss(self, tmp_path):
+        QueryCache(disk_dir=str(tmp_path)).set("k", [1, 2], ttl_seconds=-1)
+        cache = QueryCache(disk_dir=str(tmp_path))
+
+        assert cache.get("k") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_invalidate_prefix_and_delete_reach_disk(self, tmp_path):
+        writer = QueryCache(disk_dir=str(tmp_path))
+        writer.set("features:2026-01-05:a", 1)
+        writer.set("features:2026-01-06:a", 2)
+        reader = QueryCache(disk_dir=str(tmp_path))
+
+        assert reader.invalidate_prefix("features:2026-01-05") == 1
+        assert writer.delete("features:2026-01-06:a") is True
+        assert QueryCache(disk_dir=str(tmp_path)).get("features:2026-01-05:a") is None
+        assert QueryCache(disk_dir=str(tmp_path)).get("features:2026-01-06:a") is None
+
+    def test_disk_budget_prunes_least_recent(self, tmp_path):
+        cache = QueryCache(disk_dir=str(tmp_path), disk_max_bytes=30_000)
+        for i in range(5):
+            cache.set(f"k{i}", np.zeros(1000))  # ~8KB each on disk
+            time.sleep(0.01)
+
+        remaining = sorted(p.name for p in tmp_path.iterdir())
+        assert remaining == ['k2.qc', 'k3.qc', 'k4.qc']
+
+    def test_corrupt_file_is_dropped(self, tmp_path):
+        cache = QueryCache(disk_dir=str(tmp_path))
+        cache.set("k", "v")
+        (tmp_path / "k.qc").write_bytes(b"garbage")
+
+        assert QueryCache(disk_dir=str(tmp_path)).get("k") is None
+        assert not (tmp_path / "k.qc").exists()
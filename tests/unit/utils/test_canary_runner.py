@@ -0,0 +1,165 @@
+"""
+Unit Tests for the concurrent canary runner
+
+Tests cover:
+1. Checks run concurrently; results come back in declaration order
+2. Checks declaring the same ScanSpec share one materialized scan with the
+   union of their columns; a scan used by one check is inlined
+3. A failed shared scan falls back to inline subqueries
+4. Jobs and bytes billed are attributed to the check that started them;
+   a raising check returns on_error() without stopping the others
+5. CANARY_RUNNER_MODE=serial runs without shared scans
+"""
+
+import threading
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+
+from shared.utils.canary_runner import CanaryRunner, ScanSpec, render_source
+
+PREDICTIONS = ScanSpec(
+    table='proj.nba_predictions.player_prop_predictions',
+    start='CURRENT_DATE()',
+    end='CURRENT_DATE()',
+)
+
+
+class FakeJob:
+    def __init__(self, sql, bytes_billed, scan_number):
+        self.sql = sql
+        self.total_bytes_billed = bytes_billed
+        self.cache_hit = False
+        self.destination = SimpleNamespace(project='proj', dataset_id='_anon', table_id=f'scan{scan_number}')
+
+    def result(self, timeout=None):
+        return [{'ok': 1}]
+
+
+class FakeClient:
+    def __init__(self, fail_scans=False):
+        self.queries = []
+        self.fail_scans = fail_scans
+        self._lock = threading.Lock()
+
+    def query(self, sql):
+        with self._lock:
+            self.queries.append(sql)
+            number = len(self.queries)
+        if self.fail_scans and sql.startswith('SELECT') and 'FROM `' in sql and 'FROM (' not in sql:
+            raise RuntimeError('scan failed')
+        return FakeJob(sql, 1000 * number, number)
+
+
+def _scan_check(sql):
+    def check(client, source):
+        rendered = render_source(sql, source)
+        client.query(rendered).result()
+        return rendered
+    return check
+
+
+@pytest.fixture(autouse=True)
+def parallel_mode(monkeypatch):
+    monkeypatch.delenv('CANARY_RUNNER_MODE', raising=False)
+    monkeypatch.delenv('FETCH_GRAPH_MODE', raising=False)
+
+
+class TestConcurrency:
+
+    def test_checks_overlap_and_keep_order(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def check(value):
+            def fn(client):
+                barrier.wait()  # deadlocks (BrokenBarrierError) if run serially
+                return value
+            return fn
+
+        runner = CanaryRunner(FakeClient(), name='test')
+        for value in ('c', 'a', 'b'):
+            runner.add(value, check(value), on_error=lambda e: 'failed')
+
+        assert list(runner.run().items()) == [('c', 'c'), ('a', 'a'), ('b', 'b')]
+
+
+class TestSharedScans:
+
+    def test_same_window_shares_one_scan(self):
+        client = FakeClient()
+        runner = CanaryRunner(client, name='test')
+        runner.add('count', _scan_check('SELECT COUNT(*) FROM {source}'),
+                   scan=replace(PREDICTIONS, columns=('system_id', 'is_active')))
+        runner.add('models', _scan_check('SELECT DISTINCT system_id FROM {source}'),
+                   scan=replace(PREDICTIONS, columns=('system_id', 'game_id')))
+        runner.add('other_day', _scan_check('SELECT 1 FROM {source}'),
+                   scan=replace(PREDICTIONS, start="'2026-02-12'", columns=('game_id',)))
+
+        results = runner.run()
+
+        scans = [q for q in client.queries if 'BETWEEN CURRENT_DATE()' in q]
+        assert scans == [
+            'SELECT system_id, is_active, game_id FROM `proj.nba_predictions.player_prop_predictions` '
+            'WHERE game_date BETWEEN CURRENT_DATE() AND CURRENT_DATE()'
+        ]
+        assert results['count'] == 'SELECT COUNT(*) FROM `proj._anon.scan1`'
+        assert results['models'] == 'SELECT DISTINCT system_id FROM `proj._anon.scan1`'
+        # Only one check reads that window: inlined, no materialization
+        assert results['other_day'].startswith('SELECT 1 FROM (SELECT game_id FROM')
+        assert runner.stats['count'].shared_scan == runner.stats['models'].shared_scan
+
+    def test_failed_scan_inlines_merged_columns(self):
+        client = FakeClient(fail_scans=True)
+        runner = CanaryRunner(client, name='test')
+        runner.add('a', _scan_check('SELECT * FROM {source}'), scan=PREDICTIONS)
+        runner.add('b', _scan_check('SELECT * FROM {source}'), scan=PREDICTIONS)
+
+        results = runner.run()
+
+        inline = f'SELECT * FROM ({PREDICTIONS.select_sql()})'
+        assert results == {'a': inline, 'b': inline}
+        assert runner.stats['scan:player_prop_predictions[CURRENT_DATE()..CURRENT_DATE()]'].error == 'scan failed'
+
+
+class TestMetering:
+
+    def test_jobs_and_errors_attributed_per_check(self):
+        client = FakeClient()
+
+        def two_queries(c):
+            c.query('SELECT 1').result()
+            c.query('SELECT 2').result()
+            return 'ok'
+
+        def broken(c):
+            c.query('SELECT 3')
+            raise ValueError('boom')
+
+        runner = CanaryRunner(client, name='test', max_workers=1)
+        runner.add('two', two_queries)
+        runner.add('broken', broken, on_error=lambda e: (False, {}, str(e)))
+        results = runner.run()
+
+        assert results == {'two': 'ok', 'broken': (False, {}, 'boom')}
+        assert (runner.stats['two'].jobs, runner.stats['two'].bytes_billed) == (2, 3000)
+        assert (runner.stats['broken'].jobs, runner.stats['broken'].error) == (1, 'boom')
+        assert {s['name'] for s in runner.summary()} == {'two', 'broken'}
+
+    def test_client_outside_runner_is_passthrough(self):
+        runner = CanaryRunner(FakeClient(), name='test')
+        assert runner.client.query('SELECT 1').sql == 'SELECT 1'
+        assert runner.stats == {}
+
+
+def test_serial_mode_has_no_shared_scans(monkeypatch):
+    monkeypatch.setenv('CANARY_RUNNER_MODE', 'serial')
+    client = FakeClient()
+    runner = CanaryRunner(client, name='test')
+    runner.add('a', _scan_check('SELECT * FROM {source}'), scan=PREDICTIONS)
+    runner.add('b', _scan_check('SELECT * FROM {source}'), scan=PREDICTIONS)
+
+    results = runner.run()
+
+    assert len(client.queries) == 2
+    assert results['a'] == results['b'] == f'SELECT * FROM ({PREDICTIONS.select_sql()})'
@@ -0,0 +1,140 @@
+"""
+Unit Tests for FetchGraph
+
+Tests cover:
+1. Dependency planning (levels, unknown inputs, cycles)
+2. Concurrent execution with inputs passed as keyword arguments
+3. Static fetch caching across runs; empty (degraded) results are refetched
+4. Error propagation
+5. Serial mode
+"""
+
+import threading
+import time
+
+import pytest
+
+from shared.utils.fetch_graph import FetchGraph, StaticFetchCache
+
+
+class TestPlan:
+    """Test suite for dependency planning"""
+
+    def test_levels(self):
+        graph = FetchGraph('test')
+        graph.add('a', lambda game_date: 1, inputs=('game_date',))
+        graph.add('b', lambda a: a + 1, inputs=('a',))
+        graph.add('c', lambda: 3)
+
+        assert graph.plan({'game_date': '2025-06-01'}) == [['a', 'c'], ['b']]
+
+    def test_unknown_input(self):
+        graph = FetchGraph('test').add('a', lambda x: x, inputs=('x',))
+
+        with pytest.raises(ValueError, match="unknown input 'x'"):
+            graph.run()
+
+    def test_cycle(self):
+        graph = FetchGraph('test')
+        graph.add('a', lambda b: b, inputs=('b',))
+        graph.add('b', lambda a: a, inputs=('a',))
+
+        with pytest.raises(ValueError, match='cycle'):
+            graph.run()
+
+    def test_duplicate_name(self):
+        graph = FetchGraph('test').add('a', lambda: 1)
+
+        with pytest.raises(ValueError):
+            graph.add('a', lambda: 2)
+
+
+class TestRun:
+    """Test suite for execution"""
+
+    def test_independent_fetches_overlap(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch(game_date):
+            barrier.wait()  # deadlocks unless all three run at once
+            return game_date
+
+        graph = FetchGraph('test', max_workers=4)
+        for name in ('a', 'b', 'c'):
+            graph.add(name, fetch, inputs=('game_date',))
+
+        assert graph.run(game_date='d') == {'a': 'd', 'b': 'd', 'c': 'd'}
+        assert set(graph.timings) == {'a', 'b', 'c'}
+
+    def test_dependent_fetch_sees_result(self):
+        graph = FetchGraph('test')
+        graph.add('lineups', lambda game_date: [game_date, 'x'], inputs=('game_date',))
+        graph.add('count', lambda lineups, game_date: (len(lineups), game_date),
+                  inputs=('lineups', 'game_date'))
+
+        assert graph.run(game_date='d')['count'] == (2, 'd')
+
+    def test_static_fetch_cached_across_runs(self):
+        cache = StaticFetchCache()
+        calls = []
+
+        def build():
+            graph = FetchGraph('test', static_cache=cache)
+            graph.add('factors', lambda: calls.append(1) or {'NYY': 1.02}, static=True)
+            graph.add('daily', lambda game_date: game_date, inputs=('game_date',))
+            return graph
+
+        first = build()
+        first.run(game_date='d1')
+        second = build()
+        result = second.run(game_date='d2')
+
+        assert result == {'factors': {'NYY': 1.02}, 'daily': 'd2'}
+        assert len(calls) == 1
+        assert second.cached == ['factors']
+
+    def test_empty_static_result_not_cached(self):
+        cache = StaticFetchCache()
+        responses = [{}, {'NYY': 1.02}]  # transient error degraded to {}, then recovered
+
+        def build():
+            graph = FetchGraph('test', static_cache=cache)
+            graph.add('factors', lambda: responses.pop(0), static=True)
+            return graph
+
+        assert build().run() == {'factors': {}}
+        assert 'factors' not in cache
+        assert build().run() == {'factors': {'NYY': 1.02}}
+        assert 'factors' in cache
+
+    def test_failure_raised_and_dependents_skipped(self):
+        ran = []
+
+        def boom(game_date):
+            raise RuntimeError('query failed')
+
+        graph = FetchGraph('test', max_workers=2)
+        graph.add('bad', boom, inputs=('game_date',))
+        graph.add('after', lambda bad: ran.append(bad), inputs=('bad',))
+
+        with pytest.raises(RuntimeError, match='query failed'):
+            graph.run(game_date='d')
+        assert ran == []
+
+    def test_serial_mode_matches(self, monkeypatch):
+        order = []
+
+        def fetch(name):
+            def fn(game_date):
+                order.append(name)
+                time.sleep(0.001)
+                return name
+            return fn
+
+        monkeypatch.setenv('FETCH_GRAPH_MODE', 'serial')
+        graph = FetchGraph('test')
+        for name in ('a', 'b', 'c'):
+            graph.add(name, fetch(name), inputs=('game_date',))
+
+        assert graph.run(game_date='d') == {'a': 'a', 'b': 'b', 'c': 'c'}
+        assert order == ['a', 'b', 'c']
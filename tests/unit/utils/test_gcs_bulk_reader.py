@@ -0,0 +1,165 @@
+"""
+Unit Tests for GCSBulkReader
+
+Tests cover:
+1. Listing order, filtering and JSON decoding
+2. Bounded concurrent downloads
+3. Failed downloads/decodes surfaced per object
+4. Generation ledger: skip after commit, re-read when rewritten
+5. BR roster batch processor loads through the reader
+"""
+
+import json
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from shared.utils.gcs_bulk_reader import (
+    GCSBulkReader,
+    GenerationLedger,
+    LocalDirectoryClient,
+)
+
+BUCKET = 'nba-scraped-data'
+
+
+def _write(root, name, payload):
+    path = os.path.join(root, BUCKET, *name.split('/'))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(payload if isinstance(payload, str) else json.dumps(payload))
+    return path
+
+
+@pytest.fixture
+def bucket(tmp_path):
+    return LocalDirectoryClient(str(tmp_path)).bucket(BUCKET)
+
+
+class TestReadJson:
+    """Test suite for ordered concurrent reads"""
+
+    def test_listing_order_and_filter(self, tmp_path, bucket):
+        for i in (3, 1, 2, 10):
+            _write(str(tmp_path), f'odds-api/player-props/2026-01-05/event_{i:02d}.json', {'i': i})
+        _write(str(tmp_path), 'odds-api/player-props/2026-01-05/notes.txt', 'skip me')
+        _write(str(tmp_path), 'odds-api/player-props/2026-01-06/event_99.json', {'i': 99})
+
+        reader = GCSBulkReader(bucket, max_workers=2)
+        items = list(reader.read_json('odds-api/player-props/2026-01-05/'))
+
+        assert [item.data['i'] for item in items] == [1, 2, 3, 10]
+        assert all(item.error is None for item in items)
+        assert reader.stats.listed == 4
+        assert reader.stats.downloaded == 4
+
+    def test_downloads_overlap(self, tmp_path, bucket):
+        for i in range(8):
+            _write(str(tmp_path), f'p/{i}.json', {'i': i})
+
+        active, peak = [0], [0]
+        lock = threading.Lock()
+        original = bucket.blob('p/0.json').__class__.download_as_bytes
+
+        def slow_download(blob):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return original(blob)
+
+        with patch('shared.utils.gcs_bulk_reader.LocalDirectoryBlob.download_as_bytes', slow_download):
+            items = list(GCSBulkReader(bucket, max_workers=4).read_json('p/'))
+
+        assert [item.data['i'] for item in items] == list(range(8))
+        assert 1 < peak[0] <= 4
+
+    def test_decode_error_is_per_object(self, tmp_path, bucket):
+        _write(str(tmp_path), 'p/a.json', {'ok': True})
+        _write(str(tmp_path), 'p/b.json', '{not json')
+        _write(str(tmp_path), 'p/c.json', {'ok': True})
+
+        reader = GCSBulkReader(bucket, max_workers=2)
+        items = list(reader.read_json('p/'))
+
+        assert [item.error is None for item in items] == [True, False, True]
+        assert isinstance(items[1].error, ValueError)
+        assert (reader.stats.downloaded, reader.stats.failed) == (2, 1)
+
+
+class TestGenerationLedger:
+    """Test suite for generation skipping"""
+
+    def test_skip_after_commit_and_reread_when_rewritten(self, tmp_path, bucket):
+        ledger_path = str(tmp_path / 'state' / 'ledger.json')
+        _write(str(tmp_path), 'p/a.json', {'v': 1})
+        b_path = _write(str(tmp_path), 'p/b.json', {'v': 1})
+
+        first = GCSBulkReader(bucket, ledger=GenerationLedger(ledger_path))
+        for item in first.read_json('p/'):
+            first.mark_processed(item)
+        assert first.commit() == 2
+
+        rerun = GCSBulkReader(bucket, ledger=GenerationLedger(ledger_path))
+        assert list(rerun.read_json('p/')) == []
+        assert rerun.stats.skipped == 2
+
+        _write(str(tmp_path), 'p/b.json', {'v': 2})
+        stat = os.stat(b_path)
+        os.utime(b_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = GCSBulkReader(bucket, ledger=GenerationLedger(ledger_path))
+        items = list(second.read_json('p/'))
+        assert [(item.name, item.data) for item in items] == [('p/b.json', {'v': 2})]
+        assert second.stats.skipped == 1
+
+    def test_unmarked_objects_are_not_committed(self, tmp_path, bucket):
+        ledger = GenerationLedger(str(tmp_path / 'ledger.json'))
+        _write(str(tmp_path), 'p/a.json', {'v': 1})
+
+        reader = GCSBulkReader(bucket, ledger=ledger)
+        list(reader.read_json('p/'))
+        assert reader.commit() == 0
+        assert len(ledger) == 0
+
+    def test_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.delenv('GCS_GENERATION_LEDGER_PATH', raising=False)
+        assert GenerationLedger.from_env() is None
+
+        monkeypatch.setenv('GCS_GENERATION_LEDGER_PATH', str(tmp_path / 'ledger.json'))
+        assert GenerationLedger.from_env().path == str(tmp_path / 'ledger.json')
+
+
+class TestRosterBatchProcessor:
+    """BR roster batch load through the reader"""
+
+    def test_load_data(self, tmp_path):
+        from data_processors.raw.basketball_ref.br_roster_batch_processor import (
+            BasketballRefRosterBatchProcessor
+        )
+
+        prefix = 'basketball-ref/season-rosters/2025-26/'
+        for team, names in (('BOS', ['Jayson Tatum']), ('LAL', ['LeBron James', 'Austin Reaves'])):
+            _write(str(tmp_path), f'{prefix}{team}.json', {
+                'players': [{'full_name': n, 'normalized': n.lower().replace(' ', '')} for n in names],
+            })
+        _write(str(tmp_path), f'{prefix}BATCH_COMPLETE.json', {'teams_scraped': 2})
+        _write(str(tmp_path), f'{prefix}PHX.json', '{truncated')
+
+        with patch('data_processors.raw.basketball_ref.br_roster_batch_processor.storage.Client'), \
+                patch('data_processors.raw.basketball_ref.br_roster_batch_processor.get_bigquery_client'):
+            processor = BasketballRefRosterBatchProcessor()
+        processor.gcs_client = LocalDirectoryClient(str(tmp_path))
+        processor.opts = {'metadata': {'season': '2025-26'}}
+
+        processor.load_data()
+
+        assert processor.stats['teams_loaded'] == 2
+        assert [(r['team_abbrev'], r['player_lookup']) for r in processor.raw_data] == [
+            ('BOS', 'jaysontatum'), ('LAL', 'lebronjames'), ('LAL', 'austinreaves'),
+        ]
@@ -0,0 +1,125 @@
+"""
+Unit Tests for the compiled, column-wise PreWriteValidator
+
+Tests cover:
+1. Column predicates called on a record behave like the lambdas they replace,
+   including the TypeError raised for a string in a chained comparison
+2. validate() returns the same valid / invalid records and violations as
+   PRE_WRITE_VALIDATION_MODE=rowwise, including undecided rows (None where
+   Python raises, short or non-numeric feature arrays)
+3. validate_batch() accepts a pandas DataFrame and a pyarrow Table
+4. Custom lambda rules and add_rule() still apply
+"""
+
+import math
+
+import pytest
+
+from shared.validation.column_rules import ColumnBatch, col, null_or_between
+from shared.validation.pre_write_validator import PreWriteValidator, ValidationRule
+
+
+def _features(**overrides):
+    features = [20.0] * 34
+    for index, value in overrides.items():
+        features[int(index.lstrip('f'))] = value
+    return features
+
+
+PGS_RECORDS = [
+    {'player_lookup': 'a', 'game_date': '2026-02-13', 'game_id': 'g1', 'points': 24, 'minutes': 33.5},
+    {'player_lookup': 'b', 'game_date': '2026-02-13', 'game_id': 'g1', 'is_dnp': True, 'points': 0},
+    {'player_lookup': None, 'game_date': '2026-02-13', 'game_id': 'g1', 'points': -2},
+    {'player_lookup': 'c', 'game_date': '2026-02-13', 'game_id': 'g1', 'points': '12', 'usage_rate': 180.0},
+    {'player_lookup': 'd', 'game_date': '2026-02-13', 'game_id': 'g1', 'minutes': 75, 'usage_rate': None},
+]
+
+FEATURE_RECORDS = [
+    {'player_lookup': 'a', 'game_date': '2026-02-13', 'features': _features(), 'feature_count': 34},
+    {'player_lookup': 'b', 'game_date': '2026-02-13', 'features': _features(f5=150.0)},
+    {'player_lookup': 'c', 'game_date': '2026-02-13', 'features': _features(f3=math.nan)},
+    {'player_lookup': 'd', 'game_date': '2026-02-13', 'features': [1.0, 2.0]},
+    {'player_lookup': 'e', 'game_date': '2026-02-13', 'features': _features(f0=None, f5='x')},
+    {'player_lookup': 'f', 'game_date': '2026-02-13', 'features': None},
+]
+
+
+def _strip_timestamps(result):
+    valid, invalid = result
+    return valid, [{k: v for k, v in r.items() if k != '_validation_timestamp'} for r in invalid]
+
+
+@pytest.fixture(autouse=True)
+def compiled_mode(monkeypatch):
+    monkeypatch.delenv('PRE_WRITE_VALIDATION_MODE', raising=False)
+
+
+class TestPredicates:
+
+    def test_row_semantics_match_lambdas(self):
+        rule = null_or_between('points', 0, 100)
+        assert rule({'points': None}) and rule({}) and rule({'points': 100})
+        assert not rule({'points': 101})
+        with pytest.raises(TypeError, match="'<=' not supported between instances of 'int' and 'str'"):
+            rule({'points': '12'})
+
+        made_vs_attempts = col('fg_made', default=0) <= col('fg_attempts', default=999)
+        assert made_vs_attempts({}) and not made_vs_attempts({'fg_made': 5, 'fg_attempts': 4})
+
+    def test_batch_masks_and_undecided_rows(self):
+        rule = null_or_between('points', 0, 100)
+        valid, undecided = rule.evaluate(ColumnBatch.of([{'points': 5}, {'points': 500}, {}, {'points': 'x'}]))
+        assert valid.tolist() == [True, False, True, False]
+        assert undecided.tolist() == [False, False, False, True]
+
+
+class TestCompiledMatchesRowwise:
+
+    @pytest.mark.parametrize('table,records', [
+        ('player_game_summary', PGS_RECORDS),
+        ('ml_feature_store_v2', FEATURE_RECORDS),
+    ])
+    def test_same_results(self, monkeypatch, table, records):
+        compiled = _strip_timestamps(PreWriteValidator(table).validate([dict(r) for r in records]))
+        monkeypatch.setenv('PRE_WRITE_VALIDATION_MODE', 'rowwise')
+        rowwise = _strip_timestamps(PreWriteValidator(table).validate([dict(r) for r in records]))
+
+        assert repr(compiled) == repr(rowwise)  # repr: NaN-bearing records compare by value
+
+    def test_undecided_rows_keep_row_path_messages(self):
+        _, invalid = PreWriteValidator('player_game_summary').validate([dict(r) for r in PGS_RECORDS])
+        messages = {r['player_lookup']: [v['error_message'] for v in r['_validation_violations']] for r in invalid}
+
+        assert messages['b'] == ['dnp_null_points: DNP players must have NULL points, not 0 or any value']
+        assert any("Validation error - '>=' not supported" in m for m in messages['c'])
+
+
+class TestBatchInputs:
+
+    def test_dataframe_and_arrow(self):
+        pd = pytest.importorskip('pandas')
+        pa = pytest.importorskip('pyarrow')
+        records = [{k: r.get(k) for k in ('player_lookup', 'game_date', 'game_id', 'minutes')} for r in PGS_RECORDS]
+        expected = PreWriteValidator('player_game_summary').validate_batch(records)
+
+        for data in (pd.DataFrame(records), pa.Table.from_pylist(records)):
+            result = PreWriteValidator('player_game_summary').validate_batch(data)
+            assert result.invalid_indices == expected.invalid_indices == [2]
+            assert result.warning_count == expected.warning_count == 1
+
+
+def test_custom_rules_still_apply():
+    validator = PreWriteValidator('player_game_summary')
+    validator.add_rule(ValidationRule(
+        name='no_test_players',
+        condition=lambda r: not str(r.get('player_lookup')).startswith('test'),
+        error_message='test players must not be written',
+    ))
+
+    valid, invalid = validator.validate([
+        {'player_lookup': 'testplayer', 'game_date': '2026-02-13', 'game_id': 'g1'},
+        {'player_lookup': 'a', 'game_date': '2026-02-13', 'game_id': 'g1'},
+    ])
+
+    assert [r['player_lookup'] for r in valid] == ['a']
+    assert invalid[0]['_validation_violations'][0]['rule_name'] == 'no_test_players'